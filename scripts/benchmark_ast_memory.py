@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""Benchmark AST memory use and parse+visit throughput.
+
+Parses the tests/ml_integration corpus, then compares the ``__slots__`` AST
+nodes against the same trees rebuilt as plain objects with a ``__dict__``
+(the layout AST nodes had before they declared slots):
+
+- bytes per node, counting each node and its ``__dict__`` if it has one
+- memory retained by the parsed corpus, measured with tracemalloc
+- parse throughput, and visit throughput over both layouts
+"""
+
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+from mlpy.ml.grammar.ast_nodes import ASTNode  # noqa: E402
+from mlpy.ml.grammar.parser import MLParser  # noqa: E402
+
+CORPUS = ROOT / "tests" / "ml_integration"
+VISIT_ROUNDS = 5
+
+
+class DictNode:
+    """Node with a per-instance ``__dict__``, as AST nodes used to be."""
+
+    _fields: tuple[str, ...] = ()
+
+    def __init__(self, values: dict):
+        self.__dict__.update(values)
+
+
+_dict_classes: dict[type, type] = {}
+
+
+def dict_class(cls: type) -> type:
+    """``DictNode`` counterpart of an AST node class."""
+    if cls not in _dict_classes:
+        _dict_classes[cls] = type(cls.__name__, (DictNode,), {"_fields": cls._fields})
+    return _dict_classes[cls]
+
+
+def load_corpus() -> list[str]:
+    """Sources of every .ml file in the corpus that parses."""
+    parser = MLParser(use_cache=False)
+    sources = []
+    for path in sorted(CORPUS.rglob("*.ml")):
+        source = path.read_text(encoding="utf-8")
+        try:
+            parser.parse(source)
+        except Exception:
+            continue
+        sources.append(source)
+    return sources
+
+
+def children(value):
+    """AST nodes directly below a field value."""
+    if isinstance(value, (ASTNode, DictNode)):
+        yield value
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from children(item)
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from children(item)
+
+
+def visit(node) -> int:
+    """Count nodes by reading every field through attribute access."""
+    count = 1
+    for name in node._fields:
+        for child in children(getattr(node, name, None)):
+            count += visit(child)
+    return count
+
+
+def node_size(node) -> int:
+    """Shallow size of a node, including its ``__dict__``."""
+    size = sys.getsizeof(node)
+    if hasattr(node, "__dict__"):
+        size += sys.getsizeof(node.__dict__)
+    return size
+
+
+def all_nodes(node):
+    """Every node in a tree."""
+    yield node
+    for name in node._fields:
+        for child in children(getattr(node, name, None)):
+            yield from all_nodes(child)
+
+
+def to_dict_nodes(value):
+    """Rebuild a tree with ``DictNode`` objects, sharing leaf values."""
+    if isinstance(value, ASTNode):
+        values = {name: to_dict_nodes(v) for name, v in value.iter_fields()}
+        return dict_class(type(value))(values)
+    if isinstance(value, list):
+        return [to_dict_nodes(item) for item in value]
+    if isinstance(value, dict):
+        return {key: to_dict_nodes(item) for key, item in value.items()}
+    return value
+
+
+def parse_corpus(sources: list[str]) -> tuple[list, float, int]:
+    """Parse every source; returns the ASTs, elapsed time and retained bytes."""
+    parser = MLParser(use_cache=False)
+    parser.parse(sources[0])  # Load the grammar outside the measurement
+
+    start = time.perf_counter()
+    for source in sources:
+        parser.parse(source)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    trees = [parser.parse(source) for source in sources]
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return trees, elapsed, retained
+
+
+def build_dict_trees(trees: list) -> tuple[list, int]:
+    """Rebuild the trees as ``DictNode`` objects; returns them and the bytes they retain."""
+    tracemalloc.start()
+    dict_trees = [to_dict_nodes(tree) for tree in trees]
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return dict_trees, retained
+
+
+def time_visits(trees: list) -> float:
+    """Best time to visit every tree."""
+    best = float("inf")
+    for _ in range(VISIT_ROUNDS):
+        start = time.perf_counter()
+        for tree in trees:
+            visit(tree)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    """Run the benchmark."""
+    print("=" * 60)
+    print("AST Memory and Throughput Benchmark")
+    print("=" * 60)
+    print()
+
+    sources = load_corpus()
+    if not sources:
+        print(f"[-] No parseable .ml files found under {CORPUS}")
+        return 1
+
+    trees, parse_time, slots_retained = parse_corpus(sources)
+    dict_trees, dict_retained = build_dict_trees(trees)
+
+    nodes = [node for tree in trees for node in all_nodes(tree)]
+    dict_nodes = [node for tree in dict_trees for node in all_nodes(tree)]
+    node_count = len(nodes)
+    source_bytes = sum(len(source) for source in sources)
+
+    slots_bytes = sum(node_size(node) for node in nodes) / node_count
+    dict_bytes = sum(node_size(node) for node in dict_nodes) / node_count
+
+    slots_visit = time_visits(trees)
+    dict_visit = time_visits(dict_trees)
+
+    print(f"Corpus: {len(sources)} files, {source_bytes / 1024:.0f} KB, {node_count} AST nodes")
+    print()
+    print(f"{'':28}{'__slots__':>14}{'__dict__':>14}")
+    print(f"{'Bytes per node (shallow)':28}{slots_bytes:>14.1f}{dict_bytes:>14.1f}")
+    print(
+        f"{'Retained bytes per node':28}"
+        f"{slots_retained / node_count:>14.1f}{dict_retained / node_count:>14.1f}"
+    )
+    print(f"{'Visit time (ms)':28}{slots_visit * 1000:>14.1f}{dict_visit * 1000:>14.1f}")
+    print(
+        f"{'Visit throughput (nodes/s)':28}"
+        f"{node_count / slots_visit:>14,.0f}{node_count / dict_visit:>14,.0f}"
+    )
+    print()
+    print(f"Parse time:           {parse_time * 1000:>9.1f} ms")
+    print(f"Parse throughput:     {node_count / parse_time:>9,.0f} nodes/s")
+    print(f"                      {source_bytes / 1024 / parse_time:>9,.0f} KB/s")
+    print()
+    print(f"Node memory saved:    {(1 - slots_bytes / dict_bytes) * 100:>9.1f}%")
+    print()
+    print("Note: retained bytes for the __slots__ trees include everything the")
+    print("      parser keeps (strings, lists, numbers); the __dict__ trees share")
+    print("      those leaf values, so their figure counts nodes and lists only.")
+
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -32,7 +32,7 @@ from mlpy.runtime.capabilities.manager import (
 )
 from mlpy.runtime.profiling.decorators import profiler
 from mlpy.runtime.profiler import MLProfiler
-from mlpy.runtime.sandbox import SandboxConfig
+from mlpy.runtime.sandbox import OutputChunk, SandboxConfig
 from mlpy.version import __version__
 
 # Global console for Rich formatting
@@ -94,10 +94,12 @@ def suggest_similar_commands(command_name: str) -> list[str]:
 
     available_commands = [
         "transpile",
+        "build",
         "audit",
         "run",
         "parse",
         "cache",
+        "daemon",
         "security-analyze",
         "profile-report",
         "profiling",
@@ -468,6 +470,7 @@ def cli(
     Basic workflow:
       mlpy audit code.ml                    # Security analysis
       mlpy transpile code.ml -o output.py   # Transpile to Python
+      mlpy build src/ -j 8                  # Transpile every module in parallel
       mlpy run code.ml                      # Execute in sandbox
 
     Development workflow:
@@ -475,6 +478,7 @@ def cli(
       mlpy --lsp                          # Start language server
       mlpy parse code.ml                  # Show AST structure
       mlpy cache --clear-cache            # Clear execution cache
+      mlpy daemon start                   # Keep a warm compiler for mlpyc
 
     Advanced features:
       mlpy security-analyze file.ml --deep-analysis
@@ -747,6 +751,102 @@ def transpile(
             profiler.disable()
 
 
+@cli.command()
+@click.argument(
+    "source_dir", required=False, type=click.Path(exists=True, file_okay=False, path_type=Path)
+)
+@click.option("--jobs", "-j", type=click.IntRange(min=1), help="Worker processes (default: CPUs)")
+@click.option(
+    "--strict/--no-strict", default=True, help="Strict security mode (fail on security issues)"
+)
+@click.option("--timings", is_flag=True, help="Show per-module timings")
+@click.option("--force", is_flag=True, help="Rebuild every module, even if up to date")
+def build(
+    source_dir: Path | None, jobs: int | None, strict: bool, timings: bool, force: bool
+) -> None:
+    """Transpile every module in a project, independent modules in parallel.
+
+    SOURCE_DIR defaults to the project's source directory (from mlpy.json),
+    or the current directory outside a project. Each module is written next
+    to its .ml file. A build manifest in the project cache directory records
+    each module's inputs, so later builds only redo modules that changed or
+    import a module that changed.
+    """
+    from mlpy.cli.project_manager import MLProjectManager
+    from mlpy.ml.project_build import BuildManifest, ProjectBuilder
+
+    project_manager = MLProjectManager()
+    in_project = project_manager.discover_and_load_config()
+    if source_dir is None:
+        if in_project:
+            source_dir = project_manager.project_root / project_manager.config.source_dir
+        else:
+            source_dir = Path(".")
+
+    builder = ProjectBuilder(
+        source_dir,
+        jobs=jobs,
+        strict_security=strict,
+        manifest_path=BuildManifest.default_path(project_manager.get_cache_dir(), source_dir),
+        force=force,
+    )
+    console.print(f"[cyan]Building {builder.source_dir} with {builder.jobs} worker(s)...[/cyan]")
+    report = builder.build()
+
+    if not report.modules:
+        console.print("[yellow]No .ml files found[/yellow]")
+        return
+
+    if timings:
+        table = Table(title="Module Timings", box=box.ROUNDED)
+        table.add_column("Module", style="bold cyan")
+        table.add_column("Wave", justify="right")
+        for column in ("Parse", "Analysis", "Codegen", "Total"):
+            table.add_column(f"{column} (ms)", justify="right")
+        table.add_column("Status")
+
+        for result in sorted(report.modules.values(), key=lambda r: -r.total_time):
+            if result.up_to_date:
+                status = "[dim]up to date[/dim]"
+            elif result.success:
+                status = "[green]built[/green]"
+            else:
+                status = "[red]failed[/red]"
+            table.add_row(
+                result.module_path,
+                "-" if result.wave is None else str(result.wave),
+                *(
+                    f"{seconds * 1000:.1f}"
+                    for seconds in (
+                        result.parse_time,
+                        result.analysis_time,
+                        result.codegen_time,
+                        result.total_time,
+                    )
+                ),
+                status,
+            )
+        console.print(table)
+
+    for result in report.failed:
+        console.print(f"[red]{result.module_path}:[/red] {'; '.join(result.errors)}")
+
+    console.print(
+        f"Built {len(report.rebuilt)}/{len(report.modules)} modules "
+        f"({len(report.up_to_date)} up to date) in {len(report.waves)} wave(s): "
+        f"{report.wall_time:.2f}s wall, {report.module_time:.2f}s module time "
+        f"(import scan {report.scan_time:.2f}s)"
+    )
+    if report.critical_path:
+        console.print(
+            f"Critical path: {report.critical_path_time:.2f}s "
+            f"({' -> '.join(report.critical_path)})"
+        )
+
+    if not report.success:
+        sys.exit(1)
+
+
 @cli.command()
 @click.argument("source_file", callback=validate_ml_file)
 @click.option("--format", "-f", type=click.Choice(["text", "json"]), default="text")
@@ -1041,6 +1141,18 @@ def audit(source_file: Path, format: str, deep_analysis: bool, threat_level: str
 @click.option(
     "--force-transpile", is_flag=True, help="Force re-transpilation (bypass cache)"
 )
+@click.option("--stream", is_flag=True, help="Print program output live as it is produced")
+@click.option(
+    "--output-limit",
+    default="0",
+    help="Cap captured stdout/stderr per stream (e.g., 1MB; 0 = unlimited)",
+)
+@click.option(
+    "--output-overflow",
+    type=click.Choice(["truncate", "spill"]),
+    default="truncate",
+    help="What to do with output past --output-limit: drop it or spill it to a file",
+)
 @click.option(
     "--report",
     type=click.Choice(["ml-summary", "ml-details", "dev-summary", "dev-details", "raw", "all"]),
@@ -1052,6 +1164,12 @@ def audit(source_file: Path, format: str, deep_analysis: bool, threat_level: str
     type=click.Path(),
     help="Save profiling report to file (default: print to console)"
 )
+@click.option(
+    "--trace",
+    "trace_output",
+    type=click.Path(),
+    help="Write a Chrome trace of the pipeline stages to file (open in Perfetto)",
+)
 @click.option(
     "--extension-path",
     "-E",
@@ -1080,8 +1198,12 @@ def run(
     stdlib_mode: str,
     allow_python_modules: str | None,
     force_transpile: bool,
+    stream: bool,
+    output_limit: str,
+    output_overflow: str,
     report: tuple,
     profile_output: str | None,
+    trace_output: str | None,
     extension_path: tuple[str, ...],
     ml_module_path: tuple[str, ...],
 ) -> None:
@@ -1131,8 +1253,18 @@ def run(
             allowed_ports=list(allow_ports),
             file_access_patterns=list(file_patterns),
             strict_mode=strict,
+            output_limit=output_limit,
+            output_overflow=output_overflow,
         )
 
+        # Live output goes straight to the terminal; JSON mode keeps stdout clean
+        def print_chunk(chunk: OutputChunk) -> None:
+            target = sys.stdout if chunk.stream == "stdout" else sys.stderr
+            target.write(chunk.text)
+            target.flush()
+
+        on_output = print_chunk if stream and not output_json else None
+
         # Set up capabilities
         capabilities = []
 
@@ -1156,6 +1288,11 @@ def run(
             if not output_json:
                 console.print("[cyan]Profiling enabled[/cyan]")
 
+        if trace_output:
+            from mlpy.runtime.profiling.tracing import tracer
+
+            tracer.enable()
+
         # Execute in sandbox
         if not output_json:
             console.print(f"[blue]Executing {source_file} in sandbox...[/blue]")
@@ -1177,6 +1314,7 @@ def run(
                 sandbox_config=config,
                 strict_security=strict,
                 force_transpile=force_transpile,
+                on_output=on_output,
             )
         else:
             # Use global transpiler for backward compatibility
@@ -1187,12 +1325,18 @@ def run(
                 sandbox_config=config,
                 strict_security=strict,
                 force_transpile=force_transpile,
+                on_output=on_output,
             )
 
         # Stop profiler if enabled
         if ml_profiler:
             ml_profiler.stop()
 
+        if trace_output:
+            tracer.export_chrome_trace(trace_output)
+            if not output_json:
+                console.print(f"[green]Trace saved to {trace_output}[/green]")
+
         if output_json:
             # JSON output
             result_data = {
@@ -1200,6 +1344,8 @@ def run(
                 "return_value": result.return_value if result else None,
                 "stdout": result.stdout if result else "",
                 "stderr": result.stderr if result else "",
+                "output_truncated": result.output_truncated if result else False,
+                "output_spill_files": result.output_spill_files if result else {},
                 "execution_time": result.execution_time if result else 0.0,
                 "memory_usage": result.memory_usage if result else 0,
                 "cpu_usage": result.cpu_usage if result else 0.0,
@@ -1241,17 +1387,26 @@ def run(
             console.print(result_table)
             console.print()
 
-            # Show output
-            if result.stdout:
+            if on_output:
+                console.print()
+
+            # Show output (already printed live when streaming)
+            if result.stdout and not on_output:
                 console.print("[bold cyan]Standard Output:[/bold cyan]")
                 console.print(Panel(result.stdout, box=box.ROUNDED, border_style="green"))
                 console.print()
 
-            if result.stderr:
+            if result.stderr and not on_output:
                 console.print("[bold red]Standard Error:[/bold red]")
                 console.print(Panel(result.stderr, box=box.ROUNDED, border_style="red"))
                 console.print()
 
+            if result.output_truncated:
+                console.print(f"[yellow]Output exceeded {output_limit} per stream[/yellow]")
+                for stream_name, path in result.output_spill_files.items():
+                    console.print(f"  • Full {stream_name} saved to {path}")
+                console.print()
+
             # Show security issues if any
             if issues:
                 console.print("[yellow]Security Issues:[/yellow]")
@@ -1325,10 +1480,15 @@ def run(
 @click.command()
 @click.option("--show-compilation-cache", is_flag=True, help="Show compilation cache statistics")
 @click.option("--show-execution-cache", is_flag=True, help="Show execution cache statistics")
+@click.option("--show-parse-cache", is_flag=True, help="Show parse cache statistics")
 @click.option("--clear-cache", is_flag=True, help="Clear all sandbox caches")
 @click.option("--json", "output_json", is_flag=True, help="Output statistics in JSON format")
 def cache(
-    show_compilation_cache: bool, show_execution_cache: bool, clear_cache: bool, output_json: bool
+    show_compilation_cache: bool,
+    show_execution_cache: bool,
+    show_parse_cache: bool,
+    clear_cache: bool,
+    output_json: bool,
 ) -> None:
     """Manage sandbox execution caches."""
     from mlpy.runtime.sandbox.cache import clear_all_caches, get_cache_stats
@@ -1343,10 +1503,12 @@ def cache(
         # Get cache statistics
         stats = get_cache_stats()
 
+        show_all = not (show_compilation_cache or show_execution_cache or show_parse_cache)
+
         if output_json:
             console.print(json.dumps(stats, indent=2))
         else:
-            if show_compilation_cache or not (show_execution_cache):
+            if show_compilation_cache or show_all:
                 # Show compilation cache stats
                 comp_stats = stats["compilation_cache"]
                 comp_table = Table(title="Compilation Cache Statistics", box=box.ROUNDED)
@@ -1363,7 +1525,23 @@ def cache(
                 console.print(comp_table)
                 console.print()
 
-            if show_execution_cache or not (show_compilation_cache):
+                store_stats = comp_stats.get("artifact_store")
+                if store_stats:
+                    store_table = Table(title="Artifact Store Statistics", box=box.ROUNDED)
+                    store_table.add_column("Metric", style="bold cyan")
+                    store_table.add_column("Value")
+
+                    store_table.add_row("Location", store_stats["root"])
+                    store_table.add_row("Artifacts", str(store_stats["entries"]))
+                    store_table.add_row(
+                        "Total Size",
+                        f"{store_stats['total_size_bytes']}/{store_stats['max_size_bytes']} bytes",
+                    )
+
+                    console.print(store_table)
+                    console.print()
+
+            if show_execution_cache or show_all:
                 # Show execution cache stats
                 exec_stats = stats["execution_cache"]
                 exec_table = Table(title="Execution Cache Statistics", box=box.ROUNDED)
@@ -1378,6 +1556,26 @@ def cache(
                 exec_table.add_row("TTL", f"{exec_stats['default_ttl']} seconds")
 
                 console.print(exec_table)
+                console.print()
+
+            if show_parse_cache or show_all:
+                # Show parse cache stats
+                parse_stats = stats["parse_cache"]
+                parse_table = Table(title="Parse Cache Statistics", box=box.ROUNDED)
+                parse_table.add_column("Metric", style="bold cyan")
+                parse_table.add_column("Value")
+
+                parse_table.add_row("Entries", str(parse_stats["entries"]))
+                parse_table.add_row("Hit Rate", f"{parse_stats['hit_rate']:.1%}")
+                parse_table.add_row("Hits", str(parse_stats["hits"]))
+                parse_table.add_row("Misses", str(parse_stats["misses"]))
+                parse_table.add_row(
+                    "Total Size",
+                    f"{parse_stats['total_size_bytes']}/{parse_stats['max_size_bytes']} bytes",
+                )
+                parse_table.add_row("Evicted", str(parse_stats["evicted"]))
+
+                console.print(parse_table)
 
     except Exception as e:
         if output_json:
@@ -1393,6 +1591,76 @@ cli.add_command(run)
 cli.add_command(cache)
 
 
+@cli.group()
+def daemon() -> None:
+    """Manage the compile daemon used by the ``mlpyc`` client."""
+
+
+@daemon.command("start")
+@click.option("--socket", "socket_path", type=click.Path(path_type=Path), help="Socket path")
+@click.option(
+    "--watch-interval",
+    type=float,
+    default=1.0,
+    show_default=True,
+    help="Seconds between checks for changed files (0 disables watching)",
+)
+def daemon_start(socket_path: Path | None, watch_interval: float) -> None:
+    """Run the compile daemon in the foreground."""
+    from mlpy.daemon.server import CompileDaemon, DaemonError
+
+    server = CompileDaemon(socket_path, watch_interval=watch_interval)
+    try:
+        server.start()
+    except DaemonError as e:
+        console.print(f"[red]{e}[/red]")
+        sys.exit(1)
+
+    console.print(f"[green]Compile daemon listening on {server.socket_path}[/green]")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.close()
+    console.print("[cyan]Compile daemon stopped[/cyan]")
+
+
+@daemon.command("stop")
+@click.option("--socket", "socket_path", type=click.Path(path_type=Path), help="Socket path")
+def daemon_stop(socket_path: Path | None) -> None:
+    """Stop a running compile daemon."""
+    from mlpy.daemon import DaemonClient
+
+    if not DaemonClient(socket_path).shutdown():
+        console.print("[yellow]No compile daemon running[/yellow]")
+        sys.exit(1)
+    console.print("[green]Compile daemon stopped[/green]")
+
+
+@daemon.command("status")
+@click.option("--socket", "socket_path", type=click.Path(path_type=Path), help="Socket path")
+def daemon_status(socket_path: Path | None) -> None:
+    """Show whether a compile daemon is running and its cache statistics."""
+    from mlpy.daemon import DaemonClient, DaemonUnavailable
+
+    client = DaemonClient(socket_path)
+    try:
+        stats = client.request("stats")
+    except DaemonUnavailable:
+        console.print("[yellow]No compile daemon running[/yellow]")
+        sys.exit(1)
+
+    table = Table(title="Compile Daemon", box=box.ROUNDED)
+    table.add_column("Metric", style="bold cyan")
+    table.add_column("Value")
+    table.add_row("Socket", str(client.socket_path))
+    table.add_row("Uptime", f"{stats['uptime']:.0f} seconds")
+    table.add_row("Requests", str(stats["requests"]))
+    table.add_row("Watched Sources", str(stats["watched_sources"]))
+    table.add_row("Compilation Cache Hit Rate", f"{stats['compilation_cache']['hit_rate']:.1%}")
+    table.add_row("Parse Cache Entries", str(stats["parse_cache"]["entries"]))
+    console.print(table)
+
+
 @cli.command()
 @click.argument("source_file", type=click.Path(exists=True, path_type=Path))
 @click.option("--output", "-o", type=click.Path(path_type=Path), help="Save report to file")
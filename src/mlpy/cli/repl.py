@@ -7,6 +7,8 @@ Performance Optimization:
 - Uses incremental compilation (caches transpiled Python per statement)
 - Maintains symbol tracking separately from transpilation
 - O(1) performance regardless of session length (vs O(n²) cumulative)
+- Compiles each statement from the transpiler's Python AST, so generated
+  source is never re-tokenized and re-parsed before execution
 """
 
 import ast
@@ -258,7 +260,8 @@ class MLREPLSession:
             # This is the key performance optimization: O(1) vs O(n)
             # REPL mode in transpiler assumes variables from previous statements exist
             # Pass known_imports so transpiler knows about modules imported in previous lines
-            python_code, issues, source_map = self.transpiler.transpile_to_python(
+            # The AST backend returns a Python tree that is compiled directly
+            module, issues = self.transpiler.transpile_to_module(
                 ml_code,  # Just this statement!
                 source_file=f"<repl:{len(self.statements)}>",
                 import_paths=self.ml_module_paths,  # Pass import paths for ML module resolution
@@ -266,7 +269,7 @@ class MLREPLSession:
             )
 
             # Handle transpilation failure
-            if python_code is None:
+            if module is None:
                 # Track failed command for .retry
                 self.last_failed_code = ml_code
 
@@ -338,69 +341,13 @@ class MLREPLSession:
                     self.last_error = error_msg
 
                     return REPLResult(
-                        success=False, error=error_msg, transpiled_python=python_code or ""
+                        success=False, error=error_msg, transpiled_python=module.source
                     )
 
-            # Extract the actual code (skip header, but keep ML stdlib imports)
-            # The transpiler adds a standard header and boilerplate imports
-            lines = python_code.split("\n")
-            code_lines = []
-
-            for line in lines:
-                # Skip docstring
-                if line.startswith('"""'):
-                    continue
-                # Skip comments
-                if line.strip().startswith("#"):
-                    continue
-
-                # Handle imports: ALWAYS keep essential imports
-                if line.strip().startswith("from ") or line.strip().startswith("import "):
-                    # Keep whitelist validator import (_safe_call)
-                    if "whitelist_validator" in line or "_safe_call" in line:
-                        code_lines.append(line)
-                        continue
-                    # Keep builtin module import (auto-generated for builtin functions)
-                    if "from mlpy.stdlib.builtin import builtin" in line:
-                        code_lines.append(line)
-                        continue
-                    # Keep ALL ML stdlib imports (unified module system)
-                    # Matches both: "from mlpy.stdlib import math" and "from mlpy.stdlib.math_bridge import ..."
-                    if "from mlpy.stdlib import" in line:
-                        code_lines.append(line)
-                        continue
-                    # Keep runtime helper imports (needed for _safe_attr_access, etc.)
-                    if "runtime_helpers" in line:
-                        code_lines.append(line)
-                        continue
-                    # Keep capability imports (needed for capability declarations)
-                    if "mlpy.runtime.capabilities" in line:
-                        code_lines.append(line)
-                        continue
-                    # Keep contextlib imports (needed for capability context managers)
-                    if "import contextlib" in line:
-                        code_lines.append(line)
-                        continue
-                    # Keep sys and Path imports (needed for ML module path setup)
-                    if "import sys" in line or "from pathlib import Path" in line:
-                        code_lines.append(line)
-                        continue
-                    # Keep user module imports (plain import statements without 'from')
-                    # These are generated by _generate_user_module_import for ML source modules
-                    if line.strip().startswith("import ") and "from " not in line and "mlpy" not in line:
-                        code_lines.append(line)
-                        continue
-                    # Skip other boilerplate imports
-                    continue
-
-                # Skip empty lines
-                if not line.strip():
-                    continue
-
-                # Everything else is actual code
-                code_lines.append(line)
-
-            actual_code = "\n".join(code_lines).strip()
+            # Drop the module docstring; the header imports bind the stdlib
+            # modules and runtime helpers the statement uses
+            body = module.tree.body[1:]
+            statements = ast.Module(body=body, type_ignores=[])
 
             # === EXECUTE CODE ===
             # Execute only the NEW Python code in persistent namespace
@@ -408,38 +355,23 @@ class MLREPLSession:
             result = None
 
             try:
-                # Check if the last line is an expression that should be captured
-                code_lines_stripped = [line for line in code_lines if line.strip()]
-                if code_lines_stripped:
-                    last_line = code_lines_stripped[-1].strip()
-                    # Check if last line is indented (part of a block)
-                    last_line_original = code_lines[-1]
-                    is_indented = last_line_original.startswith((' ', '\t'))
-
-                    # Check if last line looks like an expression (not a statement)
-                    # Expressions: variable access, function calls, operations, literals
-                    # Statements: assignments, function defs, class defs, control flow, imports
-                    is_expression = (
-                        not last_line.startswith(('def ', 'class ', 'if ', 'for ', 'while ', 'try:', 'with ', 'import ', 'from ', 'yield')) and
-                        '=' not in last_line.split('#')[0] or  # Assignment (but not in comments)
-                        last_line.startswith('return ')
+                # A trailing expression statement is assigned to a temporary
+                # instead, so its value can be read back after execution
+                is_expression = bool(body) and isinstance(body[-1], ast.Expr)
+                if is_expression:
+                    capture = ast.Assign(
+                        targets=[ast.Name(id="__repl_last_value__", ctx=ast.Store())],
+                        value=body[-1].value,
                     )
+                    ast.fix_missing_locations(ast.copy_location(capture, body[-1]))
+                    statements = ast.Module(body=[*body[:-1], capture], type_ignores=[])
 
-                    # For expressions that are NOT part of a block (not indented), capture the value
-                    # If the last line is indented, it's part of a control structure and shouldn't be captured
-                    if is_expression and not last_line.startswith('return ') and not is_indented:
-                        # Modify code to capture last expression's value
-                        code_without_last = "\n".join(code_lines[:-1])
-                        modified_code = f"{code_without_last}\n__repl_last_value__ = {last_line}" if code_without_last else f"__repl_last_value__ = {last_line}"
+                code = compile(statements, module.filename, "exec", dont_inherit=True)
+                exec(code, self.python_namespace)
 
-                        # Execute modified code
-                        exec(modified_code, self.python_namespace)
-
-                        # Get the captured value
-                        result = self.python_namespace.pop('__repl_last_value__', None)
-                    else:
-                        # For statements, just execute normally
-                        exec(actual_code, self.python_namespace)
+                if is_expression:
+                    # Get the captured value
+                    result = self.python_namespace.pop('__repl_last_value__', None)
 
             except Exception as runtime_error:
                 # Track failed command for .retry
@@ -454,15 +386,16 @@ class MLREPLSession:
             # === IMPORT TRACKING ===
             # Track imported modules for REPL context preservation
             # Check if this execution imported any modules
-            self._track_imports(actual_code)
+            self._track_imports(body)
 
             # === SYMBOL TRACKING ===
             # Extract symbols from the executed Python code for auto-completion
-            new_symbols = self._extract_symbols(actual_code)
+            new_symbols = self._extract_symbols(body)
             self.symbol_tracker.update(new_symbols)
 
             # === CACHE STATEMENT ===
             # Store the transpiled statement for future reference
+            python_code = module.source
             stmt = REPLStatement(
                 ml_source=ml_code,
                 python_code=python_code,
@@ -493,10 +426,10 @@ class MLREPLSession:
             # Unexpected error - format nicely
             return self._format_unexpected_error(e, ml_code)
 
-    def _track_imports(self, python_code: str) -> None:
+    def _track_imports(self, statements: list[ast.stmt]) -> None:
         """Track imported modules for REPL context preservation.
 
-        Detects import statements in the executed Python code and adds
+        Detects import statements in the executed Python statements and adds
         module names to self.imported_modules. This allows subsequent
         transpilations to know which modules are available.
 
@@ -506,79 +439,63 @@ class MLREPLSession:
         - import user.nested.module → tracks 'user', 'user.nested', 'user.nested.module'
 
         Args:
-            python_code: Python source code that was executed
+            statements: Python AST statements that were executed
         """
-        try:
-            # Parse Python code into AST
-            tree = ast.parse(python_code)
-
-            # Walk the AST to find import statements
-            for node in ast.walk(tree):
-                if isinstance(node, ast.ImportFrom):
-                    # from mlpy.stdlib import math
-                    if node.module and node.module.startswith('mlpy.stdlib'):
-                        for alias in node.names:
-                            module_name = alias.asname if alias.asname else alias.name
-                            self.imported_modules.add(module_name)
-                elif isinstance(node, ast.Import):
-                    # import user_module or import user.nested.module
+        # Walk the AST to find import statements
+        for node in ast.walk(ast.Module(body=statements, type_ignores=[])):
+            if isinstance(node, ast.ImportFrom):
+                # from mlpy.stdlib import math
+                if node.module and node.module.startswith('mlpy.stdlib'):
                     for alias in node.names:
                         module_name = alias.asname if alias.asname else alias.name
-                        # Add all parts of nested imports
-                        parts = module_name.split('.')
-                        for i in range(len(parts)):
-                            self.imported_modules.add('.'.join(parts[:i+1]))
-
-        except SyntaxError:
-            # If parsing fails, imports won't be tracked (non-critical)
-            pass
-
-    def _extract_symbols(self, python_code: str) -> dict[str, str]:
-        """Extract variable and function names defined in Python code.
-
-        Uses AST parsing to find:
+                        self.imported_modules.add(module_name)
+            elif isinstance(node, ast.Import):
+                # import user_module or import user.nested.module
+                for alias in node.names:
+                    module_name = alias.asname if alias.asname else alias.name
+                    # Add all parts of nested imports
+                    parts = module_name.split('.')
+                    for i in range(len(parts)):
+                        self.imported_modules.add('.'.join(parts[:i+1]))
+
+    def _extract_symbols(self, statements: list[ast.stmt]) -> dict[str, str]:
+        """Extract variable and function names defined in Python statements.
+
+        Walks the AST to find:
         - Function definitions (def name(...))
         - Variable assignments (name = ...)
         - Class definitions (class Name(...))
 
         Args:
-            python_code: Python source code to analyze
+            statements: Python AST statements to analyze
 
         Returns:
             Dictionary mapping symbol names to types ('function', 'variable', 'class')
         """
         symbols = {}
 
-        try:
-            # Parse Python code into AST
-            tree = ast.parse(python_code)
-
-            # Walk the AST to find definitions
-            for node in ast.walk(tree):
-                if isinstance(node, ast.FunctionDef):
-                    # Function definition: def name(...)
-                    symbols[node.name] = "function"
-                elif isinstance(node, ast.ClassDef):
-                    # Class definition: class Name(...)
-                    symbols[node.name] = "class"
-                elif isinstance(node, ast.Assign):
-                    # Variable assignment: name = ...
-                    for target in node.targets:
-                        if isinstance(target, ast.Name):
-                            symbols[target.id] = "variable"
-                        elif isinstance(target, ast.Tuple):
-                            # Tuple unpacking: a, b = ...
-                            for elt in target.elts:
-                                if isinstance(elt, ast.Name):
-                                    symbols[elt.id] = "variable"
-                elif isinstance(node, ast.AnnAssign):
-                    # Annotated assignment: name: type = ...
-                    if isinstance(node.target, ast.Name):
-                        symbols[node.target.id] = "variable"
-
-        except SyntaxError:
-            # If parsing fails, return empty dict (will retry next time)
-            pass
+        # Walk the AST to find definitions
+        for node in ast.walk(ast.Module(body=statements, type_ignores=[])):
+            if isinstance(node, ast.FunctionDef):
+                # Function definition: def name(...)
+                symbols[node.name] = "function"
+            elif isinstance(node, ast.ClassDef):
+                # Class definition: class Name(...)
+                symbols[node.name] = "class"
+            elif isinstance(node, ast.Assign):
+                # Variable assignment: name = ...
+                for target in node.targets:
+                    if isinstance(target, ast.Name):
+                        symbols[target.id] = "variable"
+                    elif isinstance(target, ast.Tuple):
+                        # Tuple unpacking: a, b = ...
+                        for elt in target.elts:
+                            if isinstance(elt, ast.Name):
+                                symbols[elt.id] = "variable"
+            elif isinstance(node, ast.AnnAssign):
+                # Annotated assignment: name: type = ...
+                if isinstance(node.target, ast.Name):
+                    symbols[node.target.id] = "variable"
 
         return symbols
 
@@ -0,0 +1,18 @@
+"""Opt-in compile daemon that keeps transpiler state warm between CLI calls.
+
+Only the client side is exported here so that ``mlpyc`` starts without
+importing the transpiler; the server lives in ``mlpy.daemon.server``.
+"""
+
+from mlpy.daemon.client import DaemonClient, DaemonRequestError, DaemonUnavailable, run_request
+from mlpy.daemon.protocol import DaemonProtocolError, UnsafeSocketError, default_socket_path
+
+__all__ = [
+    "DaemonClient",
+    "DaemonProtocolError",
+    "DaemonRequestError",
+    "DaemonUnavailable",
+    "UnsafeSocketError",
+    "default_socket_path",
+    "run_request",
+]
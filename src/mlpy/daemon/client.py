@@ -0,0 +1,244 @@
+"""Thin client for the compile daemon (the ``mlpyc`` command).
+
+``mlpyc`` forwards transpile and audit requests to a running daemon, so a
+warm transpiler answers instead of a fresh interpreter importing the CLI,
+loading the grammar and registering the standard library. Without a daemon
+it does the same work in-process.
+
+Importing this module only pulls in the standard library; the transpiler is
+imported when the in-process fallback needs it.
+"""
+
+import argparse
+import json
+import socket
+import sys
+from pathlib import Path
+from typing import Any
+
+from mlpy.daemon.protocol import (
+    UnsafeSocketError,
+    check_peer,
+    check_socket_dir,
+    default_socket_path,
+    recv_message,
+    send_message,
+)
+
+
+class DaemonUnavailable(Exception):
+    """No daemon is listening on the socket."""
+
+
+class DaemonRequestError(Exception):
+    """The daemon answered with an error."""
+
+
+class DaemonClient:
+    """Send requests to the compile daemon."""
+
+    def __init__(self, socket_path: Path | None = None, timeout: float | None = 300.0) -> None:
+        """Initialize the client for the daemon at ``socket_path``."""
+        self.socket_path = Path(socket_path or default_socket_path())
+        self.timeout = timeout
+
+    def request(self, command: str, **args: Any) -> dict[str, Any]:
+        """Send one request and return its result."""
+        response = self.send({"command": command, "args": args})
+        if not response.get("ok"):
+            raise DaemonRequestError(response.get("error", "Unknown daemon error"))
+        return response.get("result", {})
+
+    def send(self, message: dict[str, Any]) -> dict[str, Any]:
+        """Send one raw message and return the raw response.
+
+        Raises:
+            DaemonUnavailable: Nothing listens on the socket
+            UnsafeSocketError: The socket directory or the daemon is not private
+                to this user; no data is sent
+        """
+        check_socket_dir(self.socket_path)
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            try:
+                sock.connect(str(self.socket_path))
+            except (FileNotFoundError, ConnectionRefusedError) as e:
+                raise DaemonUnavailable(f"No daemon listening on {self.socket_path}") from e
+            check_peer(sock)
+            send_message(sock, message)
+            return recv_message(sock)
+        finally:
+            sock.close()
+
+    def is_running(self) -> bool:
+        """Whether a daemon answers on the socket."""
+        try:
+            return self.send({"command": "ping"}).get("ok", False)
+        except (DaemonUnavailable, OSError):
+            return False
+
+    def shutdown(self) -> bool:
+        """Ask the daemon to exit; False if none was running."""
+        try:
+            self.send({"command": "shutdown"})
+        except DaemonUnavailable:
+            return False
+        return True
+
+
+def run_request(
+    command: str, args: dict[str, Any], socket_path: Path | None = None, use_daemon: bool = True
+) -> tuple[dict[str, Any], bool]:
+    """Run a request on the daemon, or in-process if none is running.
+
+    Returns the response and whether the daemon answered it.
+    """
+    if use_daemon:
+        try:
+            return DaemonClient(socket_path).send({"command": command, "args": args}), True
+        except DaemonUnavailable:
+            pass
+
+    from mlpy.daemon.service import CompileService
+
+    return CompileService().handle({"command": command, "args": args}), False
+
+
+def _print_issues(issues: list[dict[str, Any]]) -> None:
+    for issue in issues:
+        location = f"{issue.get('source_file') or ''}:{issue.get('line_number') or '?'}"
+        severity = issue.get("severity", "error").upper()
+        print(f"{location}: {severity}: {issue.get('message')}", file=sys.stderr)
+
+
+def _transpile(options: argparse.Namespace) -> int:
+    source_file = Path(options.source_file).resolve()
+    args = {
+        "source_file": str(source_file),
+        "strict_security": options.strict,
+        "generate_source_maps": options.sourcemap,
+        "import_paths": [str(Path(p).resolve()) for p in options.import_paths.split(":")]
+        if options.import_paths
+        else None,
+        "allow_current_dir": options.allow_current_dir,
+        "extension_paths": [str(Path(p).resolve()) for p in options.extension_path],
+    }
+    response, _ = run_request("transpile", args, options.socket, not options.no_daemon)
+    if not response["ok"]:
+        print(f"mlpyc: {response['error']}", file=sys.stderr)
+        return 1
+
+    result = response["result"]
+    _print_issues(result["issues"])
+    if not result["python_code"]:
+        print(f"mlpyc: transpilation of {options.source_file} failed", file=sys.stderr)
+        return 1
+
+    output_file = Path(options.output) if options.output else source_file.with_suffix(".py")
+    output_file.write_text(result["python_code"], encoding="utf-8")
+    if options.sourcemap and result["source_map"]:
+        output_file.with_suffix(".py.map").write_text(
+            json.dumps(result["source_map"], indent=2), encoding="utf-8"
+        )
+    print(f"Transpiled {options.source_file} -> {output_file}")
+    return 0
+
+
+def _audit(options: argparse.Namespace) -> int:
+    args = {"source_file": str(Path(options.source_file).resolve())}
+    response, _ = run_request("audit", args, options.socket, not options.no_daemon)
+    if not response["ok"]:
+        print(f"mlpyc: {response['error']}", file=sys.stderr)
+        return 1
+
+    issues = response["result"]["issues"]
+    _print_issues(issues)
+    print(f"{len(issues)} security issue(s) in {options.source_file}")
+    return 1 if any(issue.get("severity") in ("critical", "high") for issue in issues) else 0
+
+
+def _invalidate(options: argparse.Namespace) -> int:
+    paths = [str(Path(p).resolve()) for p in options.paths] or None
+    try:
+        result = DaemonClient(options.socket).request("invalidate", paths=paths)
+    except DaemonUnavailable:
+        print("No daemon running", file=sys.stderr)
+        return 1
+    print(f"Evicted {result['evicted']} cached module(s)")
+    return 0
+
+
+def _status(options: argparse.Namespace) -> int:
+    try:
+        stats = DaemonClient(options.socket).request("stats")
+    except DaemonUnavailable:
+        print("No daemon running")
+        return 1
+    print(f"Daemon on {DaemonClient(options.socket).socket_path}")
+    print(f"  uptime:   {stats['uptime']:.0f}s")
+    print(f"  requests: {stats['requests']}")
+    print(f"  sources:  {stats['watched_sources']}")
+    return 0
+
+
+def _stop(options: argparse.Namespace) -> int:
+    if not DaemonClient(options.socket).shutdown():
+        print("No daemon running")
+        return 1
+    print("Daemon stopped")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Argument parser for ``mlpyc``."""
+    parser = argparse.ArgumentParser(
+        prog="mlpyc", description="Fast ML transpiler client for the mlpy compile daemon."
+    )
+    parser.add_argument("--socket", type=Path, help="Daemon socket (default: MLPY_DAEMON_SOCKET)")
+    parser.add_argument(
+        "--no-daemon", action="store_true", help="Work in-process even if a daemon is running"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    transpile = commands.add_parser("transpile", help="Transpile an ML file to Python")
+    transpile.add_argument("source_file")
+    transpile.add_argument("--output", "-o", help="Output file")
+    transpile.add_argument("--sourcemap", action="store_true", help="Generate source maps")
+    transpile.add_argument(
+        "--no-strict", dest="strict", action="store_false", help="Do not fail on security issues"
+    )
+    transpile.add_argument("--import-paths", help="Colon-separated import paths for user modules")
+    transpile.add_argument(
+        "--allow-current-dir", action="store_true", help="Allow imports from current directory"
+    )
+    transpile.add_argument(
+        "--extension-path", "-E", action="append", default=[], help="Python extension directory"
+    )
+    transpile.set_defaults(handler=_transpile)
+
+    audit = commands.add_parser("audit", help="Run security analysis on an ML file")
+    audit.add_argument("source_file")
+    audit.set_defaults(handler=_audit)
+
+    invalidate = commands.add_parser("invalidate", help="Drop daemon caches for changed files")
+    invalidate.add_argument("paths", nargs="*", help="Changed files (default: everything)")
+    invalidate.set_defaults(handler=_invalidate)
+
+    commands.add_parser("status", help="Show daemon status").set_defaults(handler=_status)
+    commands.add_parser("stop", help="Stop the daemon").set_defaults(handler=_stop)
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Entry point for ``mlpyc``."""
+    options = build_parser().parse_args(argv)
+    try:
+        return options.handler(options)
+    except (OSError, UnsafeSocketError) as e:
+        print(f"mlpyc: {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,124 @@
+"""Wire protocol between the compile daemon and its clients.
+
+Each connection carries one request and one response. A message is a JSON
+object preceded by its length as a 4-byte big-endian integer.
+
+Requests are ``{"command": <name>, "args": {...}}``; responses are
+``{"ok": true, "result": {...}}`` or ``{"ok": false, "error": <message>}``.
+Paths in requests are absolute, since the daemon's working directory is not
+the client's.
+
+The default socket lives in ``$XDG_RUNTIME_DIR``, which only the user can
+access. Without it, the socket goes in a per-user directory in the shared
+temp dir. Both the daemon and its clients refuse that directory unless it
+is a real directory owned by the user with mode 0700, because otherwise
+another local user could create it first and plant their own daemon there.
+Clients also check that the process answering on the socket runs as the
+same user.
+
+This module only uses the standard library so that the client stays cheap
+to import.
+"""
+
+import json
+import os
+import socket
+import stat
+import struct
+import tempfile
+from pathlib import Path
+from typing import Any
+
+_HEADER = struct.Struct(">I")
+MAX_MESSAGE_SIZE = 256 * 1024 * 1024
+
+
+class DaemonProtocolError(Exception):
+    """Malformed or truncated message."""
+
+
+class UnsafeSocketError(Exception):
+    """The socket's directory or peer is not private to the current user."""
+
+
+def default_socket_path() -> Path:
+    """Socket the daemon listens on.
+
+    ``MLPY_DAEMON_SOCKET`` if set, else ``$XDG_RUNTIME_DIR/mlpy/compile.sock``,
+    else a per-user directory in the temp dir.
+    """
+    configured = os.environ.get("MLPY_DAEMON_SOCKET")
+    if configured:
+        return Path(configured)
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir and os.path.isabs(runtime_dir):
+        return Path(runtime_dir) / "mlpy" / "compile.sock"
+    return shared_socket_dir() / "compile.sock"
+
+
+def shared_socket_dir() -> Path:
+    """Per-user socket directory in the shared temp dir."""
+    user = os.getuid() if hasattr(os, "getuid") else os.getlogin()
+    return Path(tempfile.gettempdir()) / f"mlpy-{user}"
+
+
+def check_socket_dir(socket_path: Path) -> None:
+    """Refuse a socket in the shared temp dir unless its directory is private.
+
+    The directory must be a real directory (not a symlink), owned by the
+    current user, with mode 0700. Sockets elsewhere are left to the user.
+    """
+    directory = Path(socket_path).parent
+    if not hasattr(os, "getuid") or directory != shared_socket_dir():
+        return
+    try:
+        info = os.lstat(directory)
+    except FileNotFoundError:
+        return  # Nothing listening; the daemon creates it
+    if not stat.S_ISDIR(info.st_mode):
+        raise UnsafeSocketError(f"{directory} is not a directory")
+    if info.st_uid != os.getuid():
+        raise UnsafeSocketError(f"{directory} is owned by uid {info.st_uid}, not by this user")
+    if stat.S_IMODE(info.st_mode) != 0o700:
+        raise UnsafeSocketError(
+            f"{directory} has mode {stat.S_IMODE(info.st_mode):o}; expected 700"
+        )
+
+
+def check_peer(sock: socket.socket) -> None:
+    """Refuse a connected Unix socket whose peer runs as another user."""
+    if not hasattr(socket, "SO_PEERCRED"):
+        return  # Not Linux; the private directory is the only check
+    credentials = sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i"))
+    _, uid, _ = struct.unpack("3i", credentials)
+    if uid != os.getuid():
+        raise UnsafeSocketError(f"Daemon socket is served by uid {uid}, not by this user")
+
+
+def send_message(sock: socket.socket, message: dict[str, Any]) -> None:
+    """Send one framed JSON message."""
+    data = json.dumps(message, default=str).encode("utf-8")
+    sock.sendall(_HEADER.pack(len(data)) + data)
+
+
+def recv_message(sock: socket.socket) -> dict[str, Any]:
+    """Receive one framed JSON message."""
+    (size,) = _HEADER.unpack(_recv_exactly(sock, _HEADER.size))
+    if size > MAX_MESSAGE_SIZE:
+        raise DaemonProtocolError(f"Message of {size} bytes exceeds the limit")
+    message = json.loads(_recv_exactly(sock, size).decode("utf-8"))
+    if not isinstance(message, dict):
+        raise DaemonProtocolError("Message is not a JSON object")
+    return message
+
+
+def _recv_exactly(sock: socket.socket, size: int) -> bytes:
+    """Read exactly ``size`` bytes."""
+    chunks = []
+    while size:
+        chunk = sock.recv(min(size, 1024 * 1024))
+        if not chunk:
+            raise DaemonProtocolError("Connection closed mid-message")
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
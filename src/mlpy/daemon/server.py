@@ -0,0 +1,152 @@
+"""Compile daemon: a ``CompileService`` behind a local Unix socket.
+
+The daemon is opt-in (``mlpy daemon start``). It runs in the foreground,
+answers one request per connection, and polls the files behind its warm
+state so that edits to ML sources or stdlib bridge modules invalidate the
+affected caches without a restart.
+"""
+
+import os
+import socketserver
+import threading
+from pathlib import Path
+
+from mlpy.daemon.protocol import (
+    DaemonProtocolError,
+    UnsafeSocketError,
+    check_socket_dir,
+    default_socket_path,
+    recv_message,
+    send_message,
+)
+from mlpy.daemon.service import CompileService
+
+
+class DaemonError(Exception):
+    """The daemon could not be started."""
+
+
+class FileWatcher(threading.Thread):
+    """Poll file modification times and report the paths that changed."""
+
+    def __init__(self, service: CompileService, interval: float = 1.0) -> None:
+        """Initialize the watcher for the files ``service`` depends on."""
+        super().__init__(name="mlpy-daemon-watcher", daemon=True)
+        self.service = service
+        self.interval = interval
+        self._stamps: dict[Path, tuple[int, int] | None] = {}
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        """Poll until stopped."""
+        while not self._stop_event.wait(self.interval):
+            self.poll()
+
+    def stop(self) -> None:
+        """Stop polling."""
+        self._stop_event.set()
+
+    def poll(self) -> list[str]:
+        """Check every watched file once; invalidates and returns the changed paths."""
+        changed = []
+        for path in self.service.watched_files():
+            stamp = _stamp(path)
+            if path in self._stamps and self._stamps[path] != stamp:
+                changed.append(str(path))
+            self._stamps[path] = stamp
+
+        if changed:
+            self.service.invalidate(changed)
+        return changed
+
+
+class _RequestHandler(socketserver.BaseRequestHandler):
+    """Read one request, answer it, close the connection."""
+
+    server: "_UnixServer"
+
+    def handle(self) -> None:
+        try:
+            request = recv_message(self.request)
+        except (DaemonProtocolError, ValueError) as e:
+            send_message(self.request, {"ok": False, "error": f"Bad request: {e}"})
+            return
+
+        if request.get("command") == "shutdown":
+            send_message(self.request, {"ok": True, "result": {}})
+            threading.Thread(target=self.server.shutdown, daemon=True).start()
+            return
+
+        send_message(self.request, self.server.service.handle(request))
+
+
+class _UnixServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path: str, service: CompileService) -> None:
+        self.service = service
+        super().__init__(path, _RequestHandler)
+
+
+class CompileDaemon:
+    """Serve compile requests on a Unix socket until shut down."""
+
+    def __init__(self, socket_path: Path | None = None, watch_interval: float = 1.0) -> None:
+        """Initialize the daemon; nothing is bound until ``start``."""
+        self.socket_path = Path(socket_path or default_socket_path())
+        self.service = CompileService()
+        self.watcher = FileWatcher(self.service, watch_interval) if watch_interval > 0 else None
+        self._server: _UnixServer | None = None
+
+    def start(self) -> None:
+        """Bind the socket and start the file watcher."""
+        from mlpy.daemon.client import DaemonClient
+
+        self.socket_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        try:
+            # An existing directory keeps its owner and mode; mkdir does not check them
+            check_socket_dir(self.socket_path)
+            running = DaemonClient(self.socket_path).is_running()
+        except UnsafeSocketError as e:
+            raise DaemonError(f"Refusing to listen on {self.socket_path}: {e}") from e
+        if running:
+            raise DaemonError(f"A daemon is already listening on {self.socket_path}")
+
+        self.socket_path.unlink(missing_ok=True)  # Left behind by a daemon that died
+        self._server = _UnixServer(str(self.socket_path), self.service)
+        os.chmod(self.socket_path, 0o600)
+
+        if self.watcher is not None:
+            self.watcher.start()
+
+    def serve_forever(self) -> None:
+        """Handle requests until a ``shutdown`` request or ``stop``."""
+        if self._server is None:
+            self.start()
+        try:
+            self._server.serve_forever()
+        finally:
+            self.close()
+
+    def stop(self) -> None:
+        """Ask ``serve_forever`` to return."""
+        if self._server is not None:
+            self._server.shutdown()
+
+    def close(self) -> None:
+        """Release the socket and stop the watcher."""
+        if self.watcher is not None:
+            self.watcher.stop()
+        if self._server is not None:
+            self._server.server_close()
+            self._server = None
+            self.socket_path.unlink(missing_ok=True)
+
+
+def _stamp(path: Path) -> tuple[int, int] | None:
+    """Modification time and size of a file, or None if it is gone."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
@@ -0,0 +1,161 @@
+"""Request handlers shared by the compile daemon and its in-process fallback.
+
+``CompileService`` keeps the expensive state warm between requests: the
+transpilers (grammar loaded, extension modules registered), the
+compilation and parse caches, the module registry and the resolved-module
+cache. ``invalidate`` drops whatever depends on changed files; the daemon's
+file watcher calls it, and clients can too.
+"""
+
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from mlpy.ml.errors.context import ErrorContext
+from mlpy.ml.transpiler import MLTranspiler
+
+
+class CompileService:
+    """Transpile and audit requests against warm transpiler state."""
+
+    def __init__(self) -> None:
+        """Initialize the service; transpilers are created on first use."""
+        self.started = time.time()
+        self.requests = 0
+        self._transpilers: dict[tuple[str, ...], MLTranspiler] = {}
+        self._sources: set[Path] = set()
+        self._lock = threading.RLock()  # Transpilation and registry state are not thread-safe
+        self._handlers = {
+            "ping": self._ping,
+            "transpile": self._transpile,
+            "audit": self._audit,
+            "invalidate": self._invalidate,
+            "stats": self._stats,
+        }
+
+    def handle(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Run one request; returns the response message."""
+        handler = self._handlers.get(request.get("command"))
+        if handler is None:
+            return {"ok": False, "error": f"Unknown command: {request.get('command')}"}
+
+        try:
+            with self._lock:
+                self.requests += 1
+                result = handler(**request.get("args", {}))
+        except Exception as e:
+            return {"ok": False, "error": f"{type(e).__name__}: {e}"}
+        return {"ok": True, "result": result}
+
+    def watched_files(self) -> set[Path]:
+        """Files whose changes invalidate state: compiled sources and registry modules."""
+        from mlpy.stdlib.module_registry import get_registry
+
+        with self._lock:
+            files = set(self._sources)
+            if self._transpilers:
+                for metadata in get_registry().get_all_modules().values():
+                    files.add(Path(metadata.file_path))
+                    files.add(Path(metadata.file_path).parent)  # New modules change the directory
+        return files
+
+    def invalidate(self, paths: list[str] | None = None) -> int:
+        """Drop cached state derived from the given files, or everything.
+
+        Returns the number of resolved modules evicted.
+        """
+        from mlpy.ml.resolution.cache import get_module_cache
+        from mlpy.stdlib.module_registry import get_registry
+
+        with self._lock:
+            module_cache = get_module_cache()
+            if paths is None:
+                from mlpy.ml.grammar.parse_cache import get_parse_cache
+                from mlpy.runtime.sandbox.cache import get_compilation_cache
+
+                evicted = module_cache.get_stats()["size"]
+                module_cache.clear()
+                get_compilation_cache().clear()
+                get_parse_cache().clear()
+                get_registry().invalidate_cache()
+                return evicted
+
+            evicted = 0
+            for path in paths:
+                evicted += module_cache.invalidate_file(path)
+
+            registry = get_registry()
+            changed = {Path(path).resolve() for path in paths}
+            for name, metadata in registry.get_all_modules().items():
+                module_file = Path(metadata.file_path).resolve()
+                if module_file in changed or module_file.parent in changed:
+                    registry.invalidate_cache()
+                    if metadata.instance is not None:
+                        registry.reload_module(name)
+            return evicted
+
+    def _transpiler(self, extension_paths: list[str]) -> MLTranspiler:
+        """Transpiler with the given extension paths registered, created once."""
+        key = tuple(extension_paths)
+        if key not in self._transpilers:
+            self._transpilers[key] = MLTranspiler(python_extension_paths=list(extension_paths))
+        return self._transpilers[key]
+
+    def _ping(self) -> dict[str, Any]:
+        return {"pid": os.getpid()}
+
+    def _transpile(
+        self,
+        source_file: str,
+        strict_security: bool = True,
+        generate_source_maps: bool = False,
+        import_paths: list[str] | None = None,
+        allow_current_dir: bool = True,
+        extension_paths: list[str] | None = None,
+    ) -> dict[str, Any]:
+        transpiler = self._transpiler(extension_paths or [])
+        path = Path(source_file)
+        self._sources.add(path)
+
+        python_code, issues, source_map = transpiler.transpile_to_python(
+            path.read_text(encoding="utf-8"),
+            source_file=source_file,
+            strict_security=strict_security,
+            generate_source_maps=generate_source_maps,
+            import_paths=import_paths,
+            allow_current_dir=allow_current_dir,
+        )
+        return {
+            "python_code": python_code,
+            "source_map": source_map,
+            "issues": [_issue(issue) for issue in issues],
+        }
+
+    def _audit(self, source_file: str) -> dict[str, Any]:
+        path = Path(source_file)
+        self._sources.add(path)
+        issues = self._transpiler([]).validate_security_only(
+            path.read_text(encoding="utf-8"), source_file
+        )
+        return {"issues": [_issue(issue) for issue in issues]}
+
+    def _invalidate(self, paths: list[str] | None = None) -> dict[str, Any]:
+        return {"evicted": self.invalidate(paths)}
+
+    def _stats(self) -> dict[str, Any]:
+        from mlpy.runtime.sandbox.cache import get_cache_stats
+
+        return {
+            "uptime": time.time() - self.started,
+            "requests": self.requests,
+            "transpilers": len(self._transpilers),
+            "watched_sources": len(self._sources),
+            **get_cache_stats(),
+        }
+
+
+def _issue(issue: ErrorContext) -> dict[str, Any]:
+    """JSON-serializable form of a reported issue."""
+    return issue.error.to_dict()
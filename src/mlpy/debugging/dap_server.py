@@ -286,27 +286,6 @@ class MLDebugAdapter:
             from mlpy.debugging.debugger import MLDebugger
             from mlpy.debugging.source_map_index import SourceMapIndex
 
-            # Delete cached files to force fresh transpilation with source maps
-            # This ensures we always get the latest source maps
-            from pathlib import Path
-            ml_path = Path(self.ml_file)
-            cached_py = ml_path.with_suffix('.py')
-            cached_map = ml_path.with_suffix('.py.map')
-
-            if cached_py.exists():
-                try:
-                    cached_py.unlink()
-                    self.log(f"Deleted cached .py file: {cached_py}")
-                except Exception as e:
-                    self.log(f"Warning: Could not delete cached .py file: {e}")
-
-            if cached_map.exists():
-                try:
-                    cached_map.unlink()
-                    self.log(f"Deleted cached .py.map file: {cached_map}")
-                except Exception as e:
-                    self.log(f"Warning: Could not delete cached .py.map file: {e}")
-
             # Transpile ML file to Python
             # transpile_ml_file returns tuple: (python_code, issues, source_map)
             self.log(f"Transpiling ML file: {self.ml_file}")
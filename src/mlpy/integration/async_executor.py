@@ -6,15 +6,80 @@ applications without blocking the main thread.
 """
 
 import asyncio
+import io
+import sys
+import threading
+from collections.abc import Callable
 from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
+from contextlib import contextmanager
 from typing import Any, Optional, Dict
 from dataclasses import dataclass
 import time
 import logging
 
+from mlpy.runtime.profiling.tracing import tracer
+from mlpy.runtime.sandbox.output_stream import OutputChunk
+
 logger = logging.getLogger(__name__)
 
 
+class _ThreadOutputRouter(io.TextIOBase):
+    """Stand-in for sys.stdout/sys.stderr that routes writes per thread.
+
+    Writes from threads with a registered sink become OutputChunks; all other
+    threads write through to the original stream.
+    """
+
+    def __init__(self, stream_name: str, original):
+        self.stream_name = stream_name
+        self.original = original
+        self.sinks: Dict[int, Callable[[OutputChunk], None]] = {}
+
+    def write(self, text: str) -> int:
+        sink = self.sinks.get(threading.get_ident())
+        if sink is None:
+            return self.original.write(text)
+        if text:
+            sink(OutputChunk(self.stream_name, text))
+        return len(text)
+
+    def flush(self) -> None:
+        self.original.flush()
+
+    def __getattr__(self, name):
+        return getattr(self.original, name)
+
+
+_router_lock = threading.Lock()
+_routers: Dict[str, _ThreadOutputRouter] = {}
+
+
+@contextmanager
+def _route_thread_output(sink: Callable[[OutputChunk], None]):
+    """Send this thread's stdout/stderr writes to ``sink`` for the duration."""
+    thread_id = threading.get_ident()
+
+    with _router_lock:
+        for name in ("stdout", "stderr"):
+            router = _routers.get(name)
+            if router is None or getattr(sys, name) is not router:
+                router = _ThreadOutputRouter(name, getattr(sys, name))
+                _routers[name] = router
+                setattr(sys, name, router)
+            router.sinks[thread_id] = sink
+
+    try:
+        yield
+    finally:
+        with _router_lock:
+            for name, router in list(_routers.items()):
+                router.sinks.pop(thread_id, None)
+                if not router.sinks and getattr(sys, name) is router:
+                    # Last routed thread finished; put the real stream back
+                    setattr(sys, name, router.original)
+                    del _routers[name]
+
+
 @dataclass
 class AsyncMLResult:
     """Result from async ML execution.
@@ -54,6 +119,12 @@ class AsyncMLExecutor:
             timeout=5.0
         )
 
+        # With live output
+        result = await executor.execute(
+            'print("working...");',
+            on_output=lambda chunk: print(chunk.text, end='')
+        )
+
         # Cleanup
         executor.shutdown()
         ```
@@ -97,7 +168,8 @@ class AsyncMLExecutor:
         self,
         ml_code: str,
         timeout: Optional[float] = None,
-        context: Optional[Dict[str, Any]] = None
+        context: Optional[Dict[str, Any]] = None,
+        on_output: Optional[Callable[[OutputChunk], None]] = None
     ) -> AsyncMLResult:
         """Execute ML code asynchronously.
 
@@ -108,6 +180,8 @@ class AsyncMLExecutor:
             ml_code: ML source code to execute
             timeout: Timeout in seconds (None = no timeout)
             context: Additional context variables for ML namespace
+            on_output: Called on the event loop with each chunk the code
+                prints, instead of writing it to the process's stdout/stderr
 
         Returns:
             AsyncMLResult with execution results
@@ -123,12 +197,20 @@ class AsyncMLExecutor:
         """
         loop = asyncio.get_event_loop()
 
+        # Output is produced on the worker thread; deliver it on the loop
+        emit = None
+        if on_output is not None:
+            def emit(chunk: OutputChunk) -> None:
+                loop.call_soon_threadsafe(on_output, chunk)
+
         # Submit to thread pool
         future = loop.run_in_executor(
             self._executor,
             self._execute_sync,
             ml_code,
-            context
+            context,
+            emit,
+            time.perf_counter_ns()
         )
 
         try:
@@ -156,7 +238,9 @@ class AsyncMLExecutor:
     def _execute_sync(
         self,
         ml_code: str,
-        context: Optional[Dict[str, Any]] = None
+        context: Optional[Dict[str, Any]] = None,
+        on_output: Optional[Callable[[OutputChunk], None]] = None,
+        submitted_ns: Optional[int] = None
     ) -> AsyncMLResult:
         """Synchronous execution in background thread.
 
@@ -166,11 +250,16 @@ class AsyncMLExecutor:
         Args:
             ml_code: ML source code to execute
             context: Additional context variables for ML namespace
+            on_output: Receives this thread's stdout/stderr writes
+            submitted_ns: ``perf_counter_ns()`` when the job was submitted,
+                traced as the time it spent queued
 
         Returns:
             AsyncMLResult with execution results
         """
         start_time = time.perf_counter()
+        if submitted_ns is not None:
+            tracer.record("queued", submitted_ns, time.perf_counter_ns() - submitted_ns, "async")
 
         try:
             # Transpile ML code
@@ -206,7 +295,12 @@ class AsyncMLExecutor:
 
             # Execute in isolated namespace
             namespace = context.copy() if context else {}
-            exec(python_code, namespace)
+            with tracer.span("execute", "async"):
+                if on_output is not None:
+                    with _route_thread_output(on_output):
+                        exec(python_code, namespace)
+                else:
+                    exec(python_code, namespace)
 
             execution_time = time.perf_counter() - start_time
 
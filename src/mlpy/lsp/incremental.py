@@ -0,0 +1,212 @@
+"""
+Incremental re-parsing of edited documents for the language server.
+
+A document is split into regions: runs of top-level items (statements,
+functions, imports...) together with the source lines they span, each region
+starting on the line of its first item. Every region parses on its own, so a
+ranged edit only re-parses the regions overlapping the edited lines and
+splices the resulting items into the program. Regions after the edit keep
+their items, shifted by the number of lines the edit added or removed.
+
+Diagnostics and semantic tokens are cached per region, relative to the
+region's first line, so only re-parsed regions need them recomputed.
+
+If the edited regions no longer parse on their own (an unclosed brace, an
+``else`` typed after an ``if``), the whole document is parsed again.
+"""
+
+import logging
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from itertools import pairwise
+from typing import Any
+
+from ..ml.grammar.ast_nodes import ASTNode, Program
+from ..ml.grammar.lark_runtime import Tree
+from ..ml.grammar.parser import MLParser
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class DocumentRegion:
+    """A run of top-level items and the source lines they span."""
+
+    start_line: int  # 0-based
+    line_count: int
+    items: list[ASTNode] = field(default_factory=list)
+    position: tuple[int, int] | None = None  # Parser (line, column) of the first token
+    diagnostics: list[Any] | None = None  # Relative to start_line; None until computed
+    tokens: list[Any] | None = None  # Relative to start_line; None until computed
+
+    @property
+    def end_line(self) -> int:
+        """First line after the region."""
+        return self.start_line + self.line_count
+
+
+class IncrementalDocument:
+    """Document text and AST kept up to date by re-parsing edited regions."""
+
+    def __init__(self, text: str, parser: MLParser | None = None):
+        """Initialize the document; it is parsed on the first ``update``."""
+        self.parser = parser or MLParser()
+        self.lines = text.split("\n")
+        self.regions: list[DocumentRegion] | None = None
+        self.full_parses = 0
+        self.partial_parses = 0
+        self._text: str | None = text
+
+    @property
+    def text(self) -> str:
+        """Current document text."""
+        if self._text is None:
+            self._text = "\n".join(self.lines)
+        return self._text
+
+    def set_text(self, text: str) -> None:
+        """Replace the whole document; it is fully re-parsed on the next ``update``."""
+        self.lines = text.split("\n")
+        self.regions = None
+        self._text = text
+
+    def apply_change(self, change_range: Any, text: str) -> None:
+        """Apply a ranged edit and re-parse the regions it touches.
+
+        Args:
+            change_range: LSP range with ``start``/``end`` positions (line, character)
+            text: Replacement text
+        """
+        start_line, start_char = self._clamp(change_range.start)
+        end_line, end_char = self._clamp(change_range.end)
+        if (end_line, end_char) < (start_line, start_char):
+            start_line, start_char, end_line, end_char = end_line, end_char, start_line, start_char
+
+        lines = self.lines
+        inserted = (lines[start_line][:start_char] + text + lines[end_line][end_char:]).split("\n")
+        lines[start_line : end_line + 1] = inserted
+        self._text = None
+
+        if self.regions is None:
+            return  # Already waiting for a full parse
+
+        delta = len(inserted) - (end_line - start_line + 1)
+        regions = self.regions
+        starts = [region.start_line for region in regions]
+        first = bisect_right(starts, start_line) - 1
+        last = bisect_right(starts, end_line) - 1
+
+        segment_start = regions[first].start_line
+        segment_end = regions[last].end_line + delta
+
+        try:
+            new_regions = self._parse_regions(segment_start, segment_end)
+        except Exception as e:
+            logger.debug(f"Edited region does not parse on its own, reparsing document: {e}")
+            self.regions = None
+            return
+
+        if delta:
+            for region in regions[last + 1 :]:
+                region.start_line += delta
+                if region.position is not None:
+                    region.position = (region.position[0] + delta, region.position[1])
+                _shift_lines(region.items, delta)
+
+        regions[first : last + 1] = new_regions
+        self.partial_parses += 1
+
+    def update(self) -> Program:
+        """Parse the document if needed and return its AST.
+
+        Raises the parser's error if the document does not parse.
+        """
+        if self.regions is None:
+            self.regions = self._parse_regions(0, len(self.lines))
+            self.full_parses += 1
+
+        items = [item for region in self.regions for item in region.items]
+        if not items:
+            return Program(items=[])
+
+        line, column = next(region.position for region in self.regions if region.items)
+        return Program(items=items, line=line, column=column)
+
+    def region_text(self, region: DocumentRegion) -> str:
+        """Source text of one region."""
+        return "\n".join(self.lines[region.start_line : region.end_line])
+
+    def _clamp(self, position: Any) -> tuple[int, int]:
+        """(line, index) of an LSP position, clamped to the document.
+
+        LSP characters count UTF-16 code units; the index counts code points.
+        """
+        if position.line >= len(self.lines):
+            return len(self.lines) - 1, len(self.lines[-1])
+        return position.line, _utf16_to_index(self.lines[position.line], position.character)
+
+    def _parse_regions(self, start: int, end: int) -> list[DocumentRegion]:
+        """Parse lines [start, end) and split the items into regions."""
+        # Leading newlines make the parser report document line numbers
+        source = "\n" * start + "\n".join(self.lines[start:end])
+        program = self.parser.parse(source)
+
+        regions = [DocumentRegion(start_line=start, line_count=0)]
+        if program.items:
+            regions[0].position = (program.line, program.column)
+
+        for item in program.items:
+            line = item.line - 1 if item.line is not None else None
+            if line is not None and line > regions[-1].start_line and self._starts_line(item):
+                if not regions[-1].items:
+                    # Only comments before the first item
+                    regions[-1].position = None
+                regions.append(
+                    DocumentRegion(start_line=line, line_count=0, position=(item.line, item.column))
+                )
+            regions[-1].items.append(item)
+
+        for region, next_region in pairwise(regions):
+            region.line_count = next_region.start_line - region.start_line
+        regions[-1].line_count = end - regions[-1].start_line
+
+        return regions
+
+    def _starts_line(self, item: ASTNode) -> bool:
+        """Whether only whitespace precedes the item on its first line."""
+        if item.column is None:
+            return False
+        return not self.lines[item.line - 1][: item.column - 1].strip()
+
+
+def _utf16_to_index(line: str, units: int) -> int:
+    """String index of the character ``units`` UTF-16 code units into ``line``."""
+    if line.isascii():
+        return min(units, len(line))
+    for index, char in enumerate(line):
+        if units <= 0:
+            return index
+        units -= 2 if ord(char) > 0xFFFF else 1
+    return len(line)
+
+
+def _shift_lines(nodes: list[ASTNode], delta: int) -> None:
+    """Move every node in the given subtrees ``delta`` lines down."""
+    stack: list[Any] = list(nodes)
+    seen: set[int] = set()
+
+    while stack:
+        value = stack.pop()
+        if isinstance(value, ASTNode):
+            if id(value) in seen:
+                continue
+            seen.add(id(value))
+            if value.line is not None:
+                value.line += delta
+            stack.extend(field for _, field in value.iter_fields())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+        elif isinstance(value, Tree):  # Rules the transformer leaves as trees
+            stack.extend(value.children)
+        elif isinstance(value, dict):
+            stack.extend(value.values())
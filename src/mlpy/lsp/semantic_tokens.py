@@ -154,11 +154,18 @@ class MLSemanticTokenMapper:
             "??",
         }
 
-    def map_ast_to_tokens(self, ast: ASTNode, source_text: str) -> list[SemanticToken]:
-        """Convert an ML AST to semantic tokens."""
+    def map_ast_to_tokens(
+        self, ast: ASTNode, source_text: str, first_line: int = 0
+    ) -> list[SemanticToken]:
+        """Convert an ML AST to semantic tokens.
+
+        ``first_line`` is the document line ``source_text`` starts on, when
+        mapping one region of a document whose AST carries document positions.
+        """
         self.tokens = []
         self.source_lines = source_text.split("\n")
         self.source_text = source_text
+        self.first_line = first_line
 
         # First pass: keyword and literal detection from source text
         self._extract_keywords_and_literals()
@@ -172,7 +179,7 @@ class MLSemanticTokenMapper:
         """Extract keywords, strings, and numbers from source text."""
         import re
 
-        for line_idx, line in enumerate(self.source_lines):
+        for line_idx, line in enumerate(self.source_lines, self.first_line):
             # Find keywords
             for keyword in self.ml_keywords:
                 # Use word boundaries to match whole words only
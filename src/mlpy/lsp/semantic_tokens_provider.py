@@ -7,7 +7,9 @@ import logging
 from dataclasses import dataclass
 from typing import Any
 
+from ..ml.grammar.ast_nodes import Program
 from ..ml.grammar.parser import MLParser
+from .incremental import IncrementalDocument
 from .semantic_tokens import MLSemanticTokenMapper, SemanticToken, SemanticTokensEncoder
 
 logger = logging.getLogger(__name__)
@@ -43,9 +45,13 @@ class MLSemanticTokensProvider:
         self._next_result_id = 1
 
     def get_semantic_tokens_full(
-        self, uri: str, text: str, version: int = 0
+        self, uri: str, text: str, version: int = 0, document: IncrementalDocument | None = None
     ) -> SemanticTokensResult:
-        """Get full semantic tokens for a document."""
+        """Get full semantic tokens for a document.
+
+        With an incrementally parsed ``document``, only regions re-parsed
+        since the last request are mapped again.
+        """
         try:
             # Check cache first
             if uri in self.document_cache:
@@ -56,12 +62,15 @@ class MLSemanticTokensProvider:
                         tokens=cached_info.encoded_tokens, result_id=cached_info.result_id
                     )
 
-            # Parse the document
-            logger.debug(f"Parsing document for semantic tokens: {uri}")
-            ast = self.parser.parse(text)
+            if document is not None:
+                tokens = self._document_tokens(document)
+            else:
+                # Parse the document
+                logger.debug(f"Parsing document for semantic tokens: {uri}")
+                ast = self.parser.parse(text)
 
-            # Generate semantic tokens
-            tokens = self.mapper.map_ast_to_tokens(ast, text)
+                # Generate semantic tokens
+                tokens = self.mapper.map_ast_to_tokens(ast, text)
 
             # Encode tokens
             encoded_tokens = self.encoder.encode_tokens(tokens)
@@ -83,12 +92,18 @@ class MLSemanticTokensProvider:
             return SemanticTokensResult(tokens=[])
 
     def get_semantic_tokens_range(
-        self, uri: str, text: str, start_line: int, end_line: int, version: int = 0
+        self,
+        uri: str,
+        text: str,
+        start_line: int,
+        end_line: int,
+        version: int = 0,
+        document: IncrementalDocument | None = None,
     ) -> SemanticTokensResult:
         """Get semantic tokens for a specific range in a document."""
         try:
             # For simplicity, get full tokens and filter
-            full_result = self.get_semantic_tokens_full(uri, text, version)
+            full_result = self.get_semantic_tokens_full(uri, text, version, document)
 
             if uri not in self.document_cache:
                 return SemanticTokensResult(tokens=[])
@@ -113,19 +128,53 @@ class MLSemanticTokensProvider:
             return SemanticTokensResult(tokens=[])
 
     def get_semantic_tokens_delta(
-        self, uri: str, text: str, previous_result_id: str, version: int = 0
+        self,
+        uri: str,
+        text: str,
+        previous_result_id: str,
+        version: int = 0,
+        document: IncrementalDocument | None = None,
     ) -> SemanticTokensResult:
         """Get semantic tokens delta from a previous result."""
         try:
             # For now, implement as full refresh
             # A proper delta implementation would calculate differences
             logger.debug(f"Delta tokens requested for {uri}, returning full tokens")
-            return self.get_semantic_tokens_full(uri, text, version)
+            return self.get_semantic_tokens_full(uri, text, version, document)
 
         except Exception as e:
             logger.error(f"Failed to generate delta semantic tokens for {uri}: {e}")
             return SemanticTokensResult(tokens=[])
 
+    def _document_tokens(self, document: IncrementalDocument) -> list[SemanticToken]:
+        """Tokens of an incrementally parsed document, mapping only regions without cached tokens."""
+        document.update()
+        tokens = []
+
+        for region in document.regions:
+            start = region.start_line
+            if region.tokens is None:
+                region_tokens = self.mapper.map_ast_to_tokens(
+                    Program(items=region.items), document.region_text(region), first_line=start
+                )
+                for token in region_tokens:
+                    token.line -= start
+                region.tokens = region_tokens
+
+            tokens.extend(
+                SemanticToken(
+                    token.line + start,
+                    token.column,
+                    token.length,
+                    token.token_type,
+                    token.token_modifiers,
+                )
+                for token in region.tokens
+            )
+
+        # The mapper puts AST tokens on 1-based lines, so regions' tokens can interleave
+        return sorted(tokens, key=lambda t: (t.line, t.column))
+
     def invalidate_cache(self, uri: str) -> None:
         """Invalidate cached tokens for a document."""
         if uri in self.document_cache:
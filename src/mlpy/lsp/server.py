@@ -3,7 +3,9 @@ ML Language Server Protocol Server Implementation
 Main LSP server class that handles client communication and coordination.
 """
 
+import copy
 import logging
+from bisect import bisect_right
 from dataclasses import dataclass
 from typing import Any
 
@@ -67,6 +69,7 @@ except ImportError:
 from ..ml.analysis.parallel_analyzer import ParallelSecurityAnalyzer
 from ..ml.grammar.ast_nodes import ASTNode
 from ..ml.grammar.parser import MLParser
+from .incremental import IncrementalDocument
 from .semantic_tokens_provider import MLSemanticTokensProvider
 
 logger = logging.getLogger(__name__)
@@ -81,6 +84,7 @@ class DocumentInfo:
     version: int
     ast: ASTNode | None = None
     diagnostics: list[Any] = None
+    document: IncrementalDocument | None = None
 
 
 class MLLanguageServer:
@@ -156,7 +160,7 @@ class MLLanguageServer:
             return None
 
         return ServerCapabilities(
-            text_document_sync=TextDocumentSyncKind.Full,
+            text_document_sync=TextDocumentSyncKind.Incremental,
             completion_provider=CompletionOptions(
                 trigger_characters=[".", ":", "(", "[", "{"], resolve_provider=True
             ),
@@ -182,7 +186,12 @@ class MLLanguageServer:
         content = params.text_document.text
         version = params.text_document.version
 
-        doc_info = DocumentInfo(uri=uri, content=content, version=version)
+        doc_info = DocumentInfo(
+            uri=uri,
+            content=content,
+            version=version,
+            document=IncrementalDocument(content, self.parser),
+        )
 
         self.documents[uri] = doc_info
         await self._analyze_document(doc_info)
@@ -197,16 +206,16 @@ class MLLanguageServer:
 
         if uri in self.documents:
             doc_info = self.documents[uri]
+            document = self._get_document(doc_info)
 
-            # Apply changes
+            # Apply changes; ranged edits re-parse only the regions they touch
             for change in params.content_changes:
-                if hasattr(change, "range") and change.range:
-                    # Incremental change (not implemented for simplicity)
-                    doc_info.content = change.text
+                if getattr(change, "range", None):
+                    document.apply_change(change.range, change.text)
                 else:
-                    # Full document change
-                    doc_info.content = change.text
+                    document.set_text(change.text)
 
+            doc_info.content = document.text
             doc_info.version = version
 
             # Invalidate semantic tokens cache for changed document
@@ -231,40 +240,18 @@ class MLLanguageServer:
             return
 
         try:
-            # Parse ML code
-            ast = self.parser.parse(doc_info.content)
-            doc_info.ast = ast
-
-            # Run security analysis
-            analysis_results = self.analyzer.analyze_batch([(doc_info.content, doc_info.uri)])
-            issues = []
-            if analysis_results:
-                result = analysis_results[0]
-                # Combine different types of issues
-                issues.extend(result.ast_violations if result.ast_violations else [])
-                issues.extend(result.pattern_matches if result.pattern_matches else [])
-
-            # Convert to LSP diagnostics
+            # Parse ML code; after ranged edits only the edited regions were re-parsed
+            document = self._get_document(doc_info)
+            doc_info.ast = document.update()
+
+            # Run security analysis on regions without cached diagnostics
+            self._analyze_regions(document, doc_info.uri)
             diagnostics = []
-            for issue in issues:
-                severity = self._convert_severity(issue.severity)
-
-                diagnostic = Diagnostic(
-                    range=Range(
-                        start=Position(
-                            line=max(0, issue.line_number - 1), character=issue.column or 0
-                        ),
-                        end=Position(
-                            line=max(0, issue.line_number - 1), character=(issue.column or 0) + 10
-                        ),
-                    ),
-                    message=issue.message,
-                    severity=severity,
-                    code=issue.issue_type,
-                    source="mlpy",
-                    tags=[DiagnosticTag.Security] if issue.cwe_id else None,
+            for region in document.regions:
+                diagnostics.extend(
+                    self._shift_diagnostic(diagnostic, region.start_line)
+                    for diagnostic in region.diagnostics
                 )
-                diagnostics.append(diagnostic)
 
             doc_info.diagnostics = diagnostics
 
@@ -291,6 +278,91 @@ class MLLanguageServer:
                     uri=doc_info.uri, diagnostics=[error_diagnostic]
                 )
 
+    def _get_document(self, doc_info: DocumentInfo) -> IncrementalDocument:
+        """Incremental document for ``doc_info``, recreated if its content was replaced."""
+        document = doc_info.document
+        if document is None or document.text != doc_info.content:
+            document = IncrementalDocument(doc_info.content, self.parser)
+            doc_info.document = document
+        return document
+
+    def _analyze_regions(self, document: IncrementalDocument, uri: str) -> None:
+        """Fill in diagnostics for every region that has none, in one analysis call.
+
+        The dirty regions are analyzed as one span of the document, with the
+        lines of clean regions in between left blank, and the diagnostics are
+        then split back into the regions by line.
+        """
+        dirty = [region for region in document.regions if region.diagnostics is None]
+        if not dirty:
+            return
+
+        span_start, span_end = dirty[0].start_line, dirty[-1].end_line
+        lines = [""] * (span_end - span_start)
+        for region in dirty:
+            region.diagnostics = []
+            offset = region.start_line - span_start
+            lines[offset : offset + region.line_count] = document.lines[
+                region.start_line : region.end_line
+            ]
+
+        starts = [region.start_line for region in dirty]
+        for diagnostic in self._analyze_source("\n".join(lines), uri):
+            line = diagnostic.range.start.line + span_start
+            region = dirty[max(0, bisect_right(starts, line) - 1)]
+            region.diagnostics.append(
+                self._shift_diagnostic(diagnostic, span_start - region.start_line)
+            )
+
+    def _analyze_source(self, source: str, uri: str) -> list[Any]:
+        """Security diagnostics for a piece of source, with lines relative to its start."""
+        try:
+            result = self.analyzer.analyze_parallel(source, uri)
+        except Exception as e:
+            logger.error(f"Security analysis failed for {uri}: {e}")
+            return []
+
+        # Combine different types of issues
+        issues = []
+        issues.extend(result.ast_violations if result.ast_violations else [])
+        issues.extend(result.pattern_matches if result.pattern_matches else [])
+
+        # Convert to LSP diagnostics
+        diagnostics = []
+        for issue in issues:
+            severity = self._convert_severity(issue.severity)
+
+            diagnostic = Diagnostic(
+                range=Range(
+                    start=Position(line=max(0, issue.line_number - 1), character=issue.column or 0),
+                    end=Position(
+                        line=max(0, issue.line_number - 1), character=(issue.column or 0) + 10
+                    ),
+                ),
+                message=issue.message,
+                severity=severity,
+                code=issue.issue_type,
+                source="mlpy",
+                tags=[DiagnosticTag.Security] if issue.cwe_id else None,
+            )
+            diagnostics.append(diagnostic)
+
+        return diagnostics
+
+    @staticmethod
+    def _shift_diagnostic(diagnostic: Any, lines: int) -> Any:
+        """Copy of a diagnostic moved ``lines`` lines down."""
+        if not lines:
+            return diagnostic
+
+        shifted = copy.copy(diagnostic)
+        start, end = diagnostic.range.start, diagnostic.range.end
+        shifted.range = Range(
+            start=Position(line=start.line + lines, character=start.character),
+            end=Position(line=end.line + lines, character=end.character),
+        )
+        return shifted
+
     def _convert_severity(self, severity) -> Any:
         """Convert ML severity to LSP severity."""
         if not LSP_AVAILABLE:
@@ -469,7 +541,7 @@ class MLLanguageServer:
 
             doc_info = self.documents[uri]
             result = self.semantic_tokens_provider.get_semantic_tokens_full(
-                uri, doc_info.content, doc_info.version
+                uri, doc_info.content, doc_info.version, self._get_document(doc_info)
             )
 
             return SemanticTokens(data=result.tokens, result_id=result.result_id)
@@ -496,7 +568,12 @@ class MLLanguageServer:
             end_line = params.range.end.line
 
             result = self.semantic_tokens_provider.get_semantic_tokens_range(
-                uri, doc_info.content, start_line, end_line, doc_info.version
+                uri,
+                doc_info.content,
+                start_line,
+                end_line,
+                doc_info.version,
+                self._get_document(doc_info),
             )
 
             return SemanticTokens(data=result.tokens)
@@ -522,7 +599,11 @@ class MLLanguageServer:
             previous_result_id = params.previous_result_id
 
             result = self.semantic_tokens_provider.get_semantic_tokens_delta(
-                uri, doc_info.content, previous_result_id, doc_info.version
+                uri,
+                doc_info.content,
+                previous_result_id,
+                doc_info.version,
+                self._get_document(doc_info),
             )
 
             return SemanticTokens(data=result.tokens, result_id=result.result_id)
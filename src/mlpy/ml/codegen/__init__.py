@@ -1,5 +1,12 @@
 """Python code generation from ML AST."""
 
+from .ast_generator import GeneratedModule, PythonAstGenerator, generate_python_ast
 from .python_generator import PythonCodeGenerator, generate_python_code
 
-__all__ = ["PythonCodeGenerator", "generate_python_code"]
+__all__ = [
+    "GeneratedModule",
+    "PythonAstGenerator",
+    "PythonCodeGenerator",
+    "generate_python_ast",
+    "generate_python_code",
+]
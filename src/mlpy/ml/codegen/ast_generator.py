@@ -0,0 +1,970 @@
+"""Python AST backend for the ML code generator.
+
+``PythonAstGenerator`` produces the same program as ``PythonCodeGenerator``,
+but builds ``ast`` nodes instead of indented text lines. Callers that execute
+the result can ``compile()`` the tree directly instead of having Python
+tokenize and parse generated source. Nodes carry the line and column of the
+ML statement they were generated from, so tracebacks and line events from the
+code object point into the ML source. Source text is rendered with
+``ast.unparse`` only when ``GeneratedModule.source`` is read.
+
+The symbol table, whitelist registry, identifier validation and call wrapping
+are shared with the text generator; only the emission differs. Constructs the
+AST backend does not build (inline-mode user modules, and anything the text
+generator would turn into a comment or a syntax error) raise
+``UnsupportedConstruct``, and ``generate_python_ast`` then falls back to the
+text generator and parses its output.
+"""
+
+import ast
+import keyword
+import math
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
+from types import CodeType
+from typing import Any
+
+from mlpy.ml.grammar.ast_nodes import (
+    ArrayAccess,
+    ArrayDestructuring,
+    ArrayLiteral,
+    ArrowFunction,
+    AssignmentStatement,
+    ASTNode,
+    BinaryExpression,
+    BooleanLiteral,
+    FunctionCall,
+    FunctionDefinition,
+    Identifier,
+    MemberAccess,
+    NumberLiteral,
+    ObjectDestructuring,
+    ObjectLiteral,
+    Program,
+    ReturnStatement,
+    SliceExpression,
+    StringLiteral,
+    TernaryExpression,
+    UnaryExpression,
+)
+from mlpy.runtime.profiling.decorators import profile_parser
+
+from .allowed_functions_registry import AllowedFunctionsRegistry
+from .core.context import CodeGenerationContext
+from .python_generator import PythonCodeGenerator
+
+MODULE_DOCSTRING = "Generated Python code from mlpy ML transpiler."
+
+_RUNTIME_HELPERS_IMPORT = (
+    "from mlpy.stdlib.runtime_helpers import safe_attr_access as _safe_attr_access, "
+    "safe_method_call as _safe_method_call, get_safe_length"
+)
+
+# Contexts and operators carry no location and can be shared between nodes
+_LOAD = ast.Load()
+_STORE = ast.Store()
+_BOOL_OPS = {"&&": ast.And(), "||": ast.Or()}
+_COMPARE_OPS = {
+    "==": ast.Eq(),
+    "!=": ast.NotEq(),
+    "<": ast.Lt(),
+    "<=": ast.LtE(),
+    ">": ast.Gt(),
+    ">=": ast.GtE(),
+}
+_BIN_OPS = {
+    "+": ast.Add(),
+    "-": ast.Sub(),
+    "*": ast.Mult(),
+    "/": ast.Div(),
+    "//": ast.FloorDiv(),
+    "%": ast.Mod(),
+}
+_UNARY_OPS = {"!": ast.Not(), "-": ast.USub(), "+": ast.UAdd()}
+_CONSTANT_NAMES = {"None": None, "True": True, "False": False}
+
+
+class UnsupportedConstruct(Exception):
+    """The AST backend does not generate this program; use the text backend."""
+
+
+@dataclass
+class GeneratedModule:
+    """A generated Python module, compiled and rendered on demand.
+
+    Attributes:
+        tree: The module's Python AST
+        filename: Filename compiled into the code object
+        backend: "ast", or "text" if the program went through the text generator
+    """
+
+    tree: ast.Module
+    filename: str = "<ml>"
+    backend: str = "ast"
+
+    @cached_property
+    def code(self) -> CodeType:
+        """The compiled code object."""
+        return compile(self.tree, self.filename, "exec", dont_inherit=True)
+
+    @cached_property
+    def source(self) -> str:
+        """The module rendered as Python source."""
+        return ast.unparse(self.tree) + "\n"
+
+
+@lru_cache(maxsize=4096)
+def _identifier(name: Any) -> str:
+    """``name`` if it can be a Python identifier in generated code."""
+    if not isinstance(name, str) or not name.isidentifier() or keyword.iskeyword(name):
+        raise UnsupportedConstruct(f"Not a Python identifier: {name!r}")
+    return name
+
+
+class PythonAstGenerator(PythonCodeGenerator):
+    """Generates a Python ``ast.Module`` from ML AST.
+
+    Every node is created at the location of the ML statement being visited
+    (``self._at``), so the tree needs no ``ast.fix_missing_locations`` pass.
+    Source maps are not generated: the code object's line numbers are the
+    ML line numbers themselves.
+    """
+
+    def __init__(
+        self,
+        source_file: str | None = None,
+        import_paths: list[str] | None = None,
+        allow_current_dir: bool = False,
+        module_output_mode: str = "separate",
+        repl_mode: bool = False,
+        known_imports: list[str] | None = None,
+    ):
+        """Initialize the generator; arguments are as for ``PythonCodeGenerator``."""
+        super().__init__(
+            source_file,
+            False,
+            import_paths,
+            allow_current_dir,
+            module_output_mode,
+            repl_mode,
+            known_imports,
+        )
+        self._body: list[ast.stmt] = []
+        self._at: dict[str, int] = {"lineno": 1, "col_offset": 0}
+
+    @profile_parser
+    def generate_module(self, ast_root: Program) -> ast.Module:
+        """Generate a Python module from ML AST.
+
+        Raises:
+            UnsupportedConstruct: If the program needs the text generator
+        """
+        if self.module_output_mode != "separate":
+            raise UnsupportedConstruct("Inline user modules are generated as text")
+
+        self.context = CodeGenerationContext()
+        self.function_registry = AllowedFunctionsRegistry()
+        initial_imports = {"builtin", *self.known_imports}
+        ml_builtins = self.symbol_table["ml_builtins"]
+        self.symbol_table = {
+            "variables": set(),
+            "functions": set(),
+            "parameters": [],
+            "imports": set(initial_imports),
+            "ml_builtins": ml_builtins,
+        }
+
+        # First pass discovers imports, variables and functions, as in the text generator
+        self._body = []
+        self._at = {"lineno": 1, "col_offset": 0}
+        ast_root.accept(self)
+
+        self.symbol_table = {
+            "variables": self.symbol_table["variables"].copy(),
+            "functions": self.symbol_table["functions"].copy(),
+            "parameters": [],
+            "imports": self.symbol_table["imports"].copy(),
+            "ml_builtins": ml_builtins,
+        }
+        self._body = []
+        ast_root.accept(self)
+        main = self._body
+
+        self._at = {"lineno": 1, "col_offset": 0}
+        header: list[ast.stmt] = [ast.Expr(self._const(MODULE_DOCSTRING), **self._at)]
+        if "contextlib" in self.context.imports_needed:
+            header.append(self._import("import contextlib"))
+        header.append(
+            self._import("from mlpy.runtime.whitelist_validator import safe_call as _safe_call")
+        )
+        if self.context.builtin_functions_used:
+            header.append(self._import("from mlpy.stdlib.builtin import builtin"))
+        for import_name in sorted(self.context.imports_needed - {"contextlib"}):
+            header.append(self._import(import_name))
+        if self.module_py_files:
+            header.extend(self._module_path_setup())
+
+        return ast.Module(body=header + main, type_ignores=[])
+
+    def generate(self, ast_root: Program) -> tuple[str, dict[str, Any] | None]:
+        """Generate Python source from ML AST (rendered from the module AST)."""
+        return ast.unparse(self.generate_module(ast_root)) + "\n", None
+
+    def _module_path_setup(self) -> list[ast.stmt]:
+        """Statements putting user module directories on ``sys.path``."""
+        statements = [self._import("import sys"), self._import("from pathlib import Path")]
+        for import_path in dict.fromkeys(self.import_paths):
+            statements.append(
+                self._path_insert(
+                    lambda import_path=import_path: self._call(
+                        self._attr(
+                            self._call(self._load("Path"), [self._const(import_path)]), "resolve"
+                        ),
+                        [],
+                    )
+                )
+            )
+
+        if self.allow_current_dir and self.source_file and not self.repl_mode:
+            source_dir = self._attr(
+                self._call(self._load("Path"), [self._load("__file__")]), "parent"
+            )
+            statements.append(
+                ast.Assign(targets=[self._store("_source_dir")], value=source_dir, **self._at)
+            )
+            statements.append(self._path_insert(lambda: self._load("_source_dir")))
+        return statements
+
+    def _path_insert(self, path: Callable[[], ast.expr]) -> ast.If:
+        """``if str(<path>) not in sys.path: sys.path.insert(0, str(<path>))``."""
+        sys_path = self._attr(self._load("sys"), "path")
+        insert = self._call(
+            self._attr(self._attr(self._load("sys"), "path"), "insert"),
+            [self._const(0), self._call(self._load("str"), [path()])],
+        )
+        return ast.If(
+            test=ast.Compare(
+                left=self._call(self._load("str"), [path()]),
+                ops=[ast.NotIn()],
+                comparators=[sys_path],
+                **self._at,
+            ),
+            body=[ast.Expr(insert, **self._at)],
+            orelse=[],
+            **self._at,
+        )
+
+    # ========================================================================
+    # Node Construction
+    # ========================================================================
+
+    def _location(self, node: ASTNode) -> dict[str, int]:
+        """Location of an ML node, or the enclosing one if it has none."""
+        line = getattr(node, "line", None)
+        if not line:
+            return self._at
+        return {"lineno": line, "col_offset": max((getattr(node, "column", None) or 1) - 1, 0)}
+
+    def _const(self, value: Any) -> ast.Constant:
+        return ast.Constant(value, **self._at)
+
+    def _load(self, name: str) -> ast.Name:
+        return ast.Name(_identifier(name), _LOAD, **self._at)
+
+    def _store(self, name: str) -> ast.Name:
+        return ast.Name(_identifier(name), _STORE, **self._at)
+
+    def _attr(self, value: ast.expr, attr: str) -> ast.Attribute:
+        return ast.Attribute(value, _identifier(attr), _LOAD, **self._at)
+
+    def _call(self, func: ast.expr, args: list[ast.expr]) -> ast.Call:
+        return ast.Call(func, args, [], **self._at)
+
+    def _code(self, code: str) -> ast.expr:
+        """Node for a name, dotted name or constant as the text generator writes it."""
+        if code in _CONSTANT_NAMES:
+            return self._const(_CONSTANT_NAMES[code])
+        if "." not in code:
+            return self._load(code)
+        first, *rest = code.split(".")
+        node: ast.expr = self._load(first)
+        for attr in rest:
+            node = self._attr(node, attr)
+        return node
+
+    def _import(self, statement: str) -> ast.stmt:
+        """Node for an ``import`` line from ``imports_needed``, or a bare module name."""
+        if statement == "mlpy.stdlib.runtime_helpers":
+            statement = _RUNTIME_HELPERS_IMPORT
+        if statement.startswith("from "):
+            module, _, names = statement[len("from ") :].partition(" import ")
+            return ast.ImportFrom(module=module, names=self._aliases(names), level=0, **self._at)
+        if statement.startswith("import "):
+            statement = statement[len("import ") :]
+        return ast.Import(names=self._aliases(statement), **self._at)
+
+    def _aliases(self, names: str) -> list[ast.alias]:
+        aliases = []
+        for item in names.split(","):
+            name, _, asname = item.strip().partition(" as ")
+            aliases.append(ast.alias(name.strip(), asname.strip() or None, **self._at))
+        return aliases
+
+    def _function(
+        self,
+        name: str,
+        params: list[tuple[str, ast.expr | None]],
+        body: list[ast.stmt],
+        decorators: list[ast.expr] | None = None,
+    ) -> ast.FunctionDef:
+        return ast.FunctionDef(
+            name=_identifier(name),
+            args=ast.arguments(
+                posonlyargs=[],
+                args=[ast.arg(_identifier(p), a, **self._at) for p, a in params],
+                kwonlyargs=[],
+                kw_defaults=[],
+                defaults=[],
+            ),
+            body=body,
+            decorator_list=decorators or [],
+            returns=None,
+            type_params=[],
+            **self._at,
+        )
+
+    def _lambda(self, params: list[str], body: ast.expr) -> ast.Lambda:
+        return ast.Lambda(
+            args=ast.arguments(
+                posonlyargs=[],
+                args=[ast.arg(_identifier(p), **self._at) for p in params],
+                kwonlyargs=[],
+                kw_defaults=[],
+                defaults=[],
+            ),
+            body=body,
+            **self._at,
+        )
+
+    # ========================================================================
+    # Statement Emission
+    # ========================================================================
+
+    def _visit(self, node: ASTNode) -> None:
+        """Visit an ML statement with its location as the current one."""
+        outer = self._at
+        self._at = self._location(node)
+        try:
+            node.accept(self)
+        finally:
+            self._at = outer
+
+    def _emit(self, stmt: ast.stmt) -> None:
+        self._body.append(stmt)
+
+    def _block(self, statements) -> list[ast.stmt]:
+        """Statements generated by visiting ``statements``, or ``pass``."""
+        outer, self._body = self._body, []
+        try:
+            for stmt in statements:
+                if stmt:
+                    self._visit(stmt)
+            if not self._body:
+                self._emit(ast.Pass(**self._at))
+            return self._body
+        finally:
+            self._body = outer
+
+    def _emit_line(self, line: str, original_node: ASTNode | None = None):
+        raise UnsupportedConstruct(f"Text emitted by the AST backend: {line.strip()!r}")
+
+    def _emit_raw_line(self, line: str):
+        if line:
+            raise UnsupportedConstruct(f"Text emitted by the AST backend: {line.strip()!r}")
+
+    # ========================================================================
+    # Statement Visitors
+    # ========================================================================
+
+    def visit_program(self, node):
+        for item in node.items:
+            if item:
+                self._visit(item)
+
+    def visit_capability_declaration(self, node):
+        self.context.imports_needed.add("contextlib")
+        capability_name = _identifier(self._safe_identifier(node.name))
+
+        resource_patterns = []
+        permissions = set()
+        for item in node.items:
+            if hasattr(item, "pattern"):
+                resource_patterns.append(item.pattern.strip("\"'"))
+            elif hasattr(item, "permission_type"):
+                permissions.add(item.permission_type)
+
+        keywords = [("capability_type", self._const(node.name))]
+        if resource_patterns:
+            patterns = [self._const(p) for p in resource_patterns]
+            keywords.append(("resource_patterns", ast.List(patterns, _LOAD, **self._at)))
+        if permissions:
+            operations = [self._const(p) for p in permissions]
+            keywords.append(("allowed_operations", ast.Set(operations, **self._at)))
+        keywords.append(("description", self._const(f"Generated capability for {node.name}")))
+
+        create = f"_create_{capability_name}_capability"
+        create_token = ast.Call(
+            self._load("create_capability_token"),
+            [],
+            [ast.keyword(arg, value, **self._at) for arg, value in keywords],
+            **self._at,
+        )
+        self._emit(
+            self._function(
+                create,
+                [],
+                [
+                    ast.Expr(self._const(f"Create capability token for {node.name}."), **self._at),
+                    self._import("from mlpy.runtime.capabilities import create_capability_token"),
+                    ast.Return(create_token, **self._at),
+                ],
+            )
+        )
+
+        context = self._call(
+            self._attr(self._load("manager"), "capability_context"),
+            [
+                self._const(f"{node.name}_context"),
+                ast.List([self._load("token")], _LOAD, **self._at),
+            ],
+        )
+        self._emit(
+            self._function(
+                f"{capability_name}_context",
+                [],
+                [
+                    ast.Expr(
+                        self._const(f"Capability context manager for {node.name}."), **self._at
+                    ),
+                    self._import("from mlpy.runtime.capabilities import get_capability_manager"),
+                    ast.Assign(
+                        targets=[self._store("manager")],
+                        value=self._call(self._load("get_capability_manager"), []),
+                        **self._at,
+                    ),
+                    ast.Assign(
+                        targets=[self._store("token")],
+                        value=self._call(self._load(create), []),
+                        **self._at,
+                    ),
+                    ast.With(
+                        items=[ast.withitem(context_expr=context)],
+                        body=[ast.Expr(ast.Yield(**self._at), **self._at)],
+                        **self._at,
+                    ),
+                ],
+                decorators=[self._code("contextlib.contextmanager")],
+            )
+        )
+
+    def visit_resource_pattern(self, node):
+        pass
+
+    def visit_permission_grant(self, node):
+        pass
+
+    def visit_import_statement(self, node):
+        module_path = ".".join(node.target)
+
+        from mlpy.stdlib.module_registry import ModuleType, get_registry
+
+        registry = get_registry()
+
+        if registry.is_available(module_path):
+            metadata = registry._discovered.get(module_path)
+
+            if metadata and metadata.module_type == ModuleType.PYTHON_BRIDGE:
+                self.function_registry.register_import(module_path, node.alias or None)
+                name = node.alias and self._safe_identifier(node.alias)
+                alias = ast.alias(_identifier(module_path), name or None, **self._at)
+                self._emit(ast.ImportFrom(module="mlpy.stdlib", names=[alias], level=0, **self._at))
+                self.context.imported_modules.add(name or module_path)
+                self.symbol_table["imports"].add(name or module_path)
+            elif metadata and metadata.module_type == ModuleType.ML_SOURCE:
+                module_info = self._get_ml_module_info(module_path, metadata)
+                self._generate_user_module_import(module_info, node.alias)
+            return
+
+        try:
+            module_info = self._resolve_user_module(node.target)
+            if module_info:
+                self._generate_user_module_import(module_info, node.alias)
+        except UnsupportedConstruct:
+            raise
+        except Exception:
+            # The text generator leaves a comment; there is nothing to import
+            pass
+
+    def _generate_user_module_import(self, module_info: dict, alias: str | None = None) -> None:
+        module_path = module_info["module_path"]
+        self.user_module_files[module_path] = module_info["file_path"]
+        self._compile_module_to_file(module_info)
+
+        if alias:
+            names = [ast.alias(module_path, _identifier(alias), **self._at)]
+            self.symbol_table["imports"].add(alias)
+        else:
+            parts = module_path.split(".")
+            for i in range(len(parts)):
+                self.symbol_table["imports"].add(".".join(parts[: i + 1]))
+            names = [ast.alias(module_path, **self._at)]
+        self._emit(ast.Import(names=names, **self._at))
+
+    def visit_function_definition(self, node):
+        func_name = self._safe_identifier(
+            node.name.name if hasattr(node.name, "name") else str(node.name)
+        )
+        self.function_registry.register_user_function(func_name)
+        self.symbol_table["functions"].add(func_name)
+
+        params = []
+        param_names = set()
+        for param in node.parameters:
+            if hasattr(param, "name"):
+                param_name = self._safe_identifier(param.name)
+                param_names.add(param_name)
+                annotation = getattr(param, "type_annotation", None)
+                params.append((param_name, self._code(annotation) if annotation else None))
+            else:
+                params.append(("param", None))
+
+        self.symbol_table["parameters"].append(param_names)
+        body = self._block(node.body or [])
+        self.symbol_table["parameters"].pop()
+
+        self._emit(self._function(func_name, params, body))
+
+    def visit_parameter(self, node):
+        pass
+
+    def visit_expression_statement(self, node):
+        if node.expression:
+            self._emit(ast.Expr(self._expr(node.expression), **self._at))
+
+    def visit_assignment_statement(self, node):
+        if isinstance(node.target, str):
+            target = self._store(self._safe_identifier(node.target))
+            self.symbol_table["variables"].add(node.target)
+        elif hasattr(node.target, "name"):
+            target = self._store(self._safe_identifier(node.target.name))
+            self.symbol_table["variables"].add(node.target.name)
+        else:
+            target = self._assignment_target(node.target)
+
+        self._emit(ast.Assign(targets=[target], value=self._expr(node.value), **self._at))
+
+    def _assignment_target(self, expr) -> ast.expr:
+        if isinstance(expr, ArrayAccess):
+            return ast.Subscript(
+                self._expr(expr.array), self._index(expr.index), _STORE, **self._at
+            )
+        if isinstance(expr, MemberAccess):
+            obj = self._expr(expr.object)
+            if isinstance(expr.member, str):
+                key = self._const(expr.member)
+            else:
+                key = self._expr(expr.member)
+            return ast.Subscript(obj, key, _STORE, **self._at)
+        raise UnsupportedConstruct(f"Assignment to {type(expr).__name__}")
+
+    def visit_return_statement(self, node):
+        self._emit(ast.Return(self._expr(node.value) if node.value else None, **self._at))
+
+    def visit_block_statement(self, node):
+        if not node.statements:
+            self._emit(ast.Pass(**self._at))
+        else:
+            for stmt in node.statements:
+                if stmt:
+                    self._visit(stmt)
+
+    def visit_if_statement(self, node):
+        branches = [(self._expr(node.condition), self._block([node.then_statement]), self._at)]
+        outer = self._at
+        for clause in getattr(node, "elif_clauses", None) or []:
+            self._at = self._location(clause)
+            branches.append(
+                (self._expr(clause.condition), self._block([clause.statement]), self._at)
+            )
+        self._at = outer
+        orelse = self._block([node.else_statement]) if node.else_statement else []
+
+        for condition, body, location in reversed(branches):
+            orelse = [ast.If(test=condition, body=body, orelse=orelse, **location)]
+        self._emit(orelse[0])
+
+    def visit_elif_clause(self, node):
+        pass  # Handled by visit_if_statement
+
+    def visit_while_statement(self, node):
+        condition = self._expr(node.condition)
+        body = self._block([node.body])
+        self._emit(ast.While(test=condition, body=body, orelse=[], **self._at))
+
+    def visit_for_statement(self, node):
+        if isinstance(node.variable, str):
+            var_name = self._safe_identifier(node.variable)
+        elif hasattr(node.variable, "name"):
+            var_name = self._safe_identifier(node.variable.name)
+        else:
+            var_name = self._safe_identifier(str(node.variable))
+        self.symbol_table["variables"].add(var_name)
+
+        target = self._store(var_name)
+        iterable = self._expr(node.iterable)
+        body = self._block([node.body])
+        self._emit(ast.For(target=target, iter=iterable, body=body, orelse=[], **self._at))
+
+    def visit_try_statement(self, node):
+        body = self._block(node.try_body or [])
+        handlers = []
+        outer = self._at
+        for clause in node.except_clauses:
+            self._at = self._location(clause)
+            if clause.exception_variable:
+                self.symbol_table["variables"].add(clause.exception_variable)
+                exception_type = self._load("Exception")
+                name = _identifier(clause.exception_variable)
+            else:
+                exception_type = name = None
+            handler_body = self._block(clause.body or [])
+            handlers.append(ast.ExceptHandler(exception_type, name, handler_body, **self._at))
+        self._at = outer
+
+        finalbody = []
+        if node.finally_body is not None:
+            finalbody = self._block(node.finally_body)
+        if not handlers and not finalbody:
+            raise UnsupportedConstruct("try without except or finally")
+
+        self._emit(
+            ast.Try(body=body, handlers=handlers, orelse=[], finalbody=finalbody, **self._at)
+        )
+
+    def visit_except_clause(self, node):
+        pass  # Handled by visit_try_statement
+
+    def visit_break_statement(self, node):
+        self._emit(ast.Break(**self._at))
+
+    def visit_continue_statement(self, node):
+        self._emit(ast.Continue(**self._at))
+
+    def visit_nonlocal_statement(self, node):
+        names = [_identifier(name) for name in node.variables]
+        if self.repl_mode and len(self.symbol_table["parameters"]) == 1:
+            self._emit(ast.Global(names=names, **self._at))
+        else:
+            self._emit(ast.Nonlocal(names=names, **self._at))
+
+    def visit_throw_statement(self, node):
+        self.context.imports_needed.add("from mlpy.ml.errors.exceptions import MLUserException")
+        error = self._call(self._load("MLUserException"), [self._expr(node.error_data)])
+        self._emit(ast.Raise(exc=error, cause=None, **self._at))
+
+    def visit_destructuring_assignment(self, node):
+        if isinstance(node.pattern, ArrayDestructuring):
+            for element in node.pattern.elements:
+                self.symbol_table["variables"].add(element)
+            targets = [self._store(element) for element in node.pattern.elements]
+            self._emit(
+                ast.Assign(
+                    targets=[ast.Tuple(targets, _STORE, **self._at)],
+                    value=self._expr(node.value),
+                    **self._at,
+                )
+            )
+        elif isinstance(node.pattern, ObjectDestructuring):
+            # The value is evaluated once per property, as in the text generator
+            for key, var_name in node.pattern.properties.items():
+                self.symbol_table["variables"].add(var_name)
+                value = ast.Subscript(self._expr(node.value), self._const(key), _LOAD, **self._at)
+                self._emit(ast.Assign(targets=[self._store(var_name)], value=value, **self._at))
+        else:
+            raise UnsupportedConstruct("Unknown destructuring pattern")
+
+    # ========================================================================
+    # Expressions
+    # ========================================================================
+
+    def _expr(self, expr) -> ast.expr:
+        """Python expression node for an ML expression."""
+        if expr is None:
+            return self._const(None)
+        # Exact-type dispatch: isinstance against the ABC-based ML nodes is slow
+        builder = _EXPRESSION_BUILDERS.get(type(expr))
+        if builder is None:
+            raise UnsupportedConstruct(f"Expression {type(expr).__name__}")
+        return builder(self, expr)
+
+    def _binary(self, expr: BinaryExpression) -> ast.expr:
+        left = self._expr(expr.left)
+        right = self._expr(expr.right)
+        op = expr.operator
+
+        if op == "+" and (
+            self._could_be_string_expression(expr.left)
+            or self._could_be_string_expression(expr.right)
+        ):
+            left = self._call(self._load("str"), [left])
+            right = self._call(self._load("str"), [right])
+            return ast.BinOp(left, _BIN_OPS["+"], right, **self._at)
+        if op in _BOOL_OPS:
+            return ast.BoolOp(_BOOL_OPS[op], [left, right], **self._at)
+        if op in _COMPARE_OPS:
+            return ast.Compare(left, [_COMPARE_OPS[op]], [right], **self._at)
+        if op in _BIN_OPS:
+            return ast.BinOp(left, _BIN_OPS[op], right, **self._at)
+        raise UnsupportedConstruct(f"Binary operator {op!r}")
+
+    def _unary(self, expr: UnaryExpression) -> ast.expr:
+        operand = self._expr(expr.operand)
+        if expr.operator not in _UNARY_OPS:
+            raise UnsupportedConstruct(f"Unary operator {expr.operator!r}")
+        return ast.UnaryOp(_UNARY_OPS[expr.operator], operand, **self._at)
+
+    def _ternary(self, expr: TernaryExpression) -> ast.expr:
+        condition = self._expr(expr.condition)
+        true_value = self._expr(expr.true_value)
+        return ast.IfExp(condition, true_value, self._expr(expr.false_value), **self._at)
+
+    def _name_reference(self, expr: Identifier) -> ast.expr:
+        return self._code(self._resolve_identifier(expr))
+
+    def _number(self, expr: NumberLiteral) -> ast.expr:
+        if not math.isfinite(expr.value):
+            raise UnsupportedConstruct(f"Number literal {expr.value!r}")
+        if expr.value < 0:
+            return ast.UnaryOp(_UNARY_OPS["-"], self._const(-expr.value), **self._at)
+        return self._const(expr.value)
+
+    def _string(self, expr: StringLiteral) -> ast.expr:
+        return self._const(expr.value)
+
+    def _boolean(self, expr: BooleanLiteral) -> ast.expr:
+        return self._const(bool(expr.value))
+
+    def _array(self, expr: ArrayLiteral) -> ast.expr:
+        return ast.List([self._expr(e) for e in expr.elements], _LOAD, **self._at)
+
+    def _object(self, expr: ObjectLiteral) -> ast.expr:
+        keys: list[ast.expr | None] = []
+        values = []
+        for key, value in expr.properties.items():
+            if isinstance(key, str):
+                keys.append(self._const(key))
+            elif hasattr(key, "name"):
+                keys.append(self._const(key.name))
+            else:
+                keys.append(self._const(str(key)))
+            values.append(self._expr(value))
+        self._ensure_ml_object_imported()
+        args = [ast.Dict(keys, values, **self._at)] if keys else []
+        return self._call(self._load("_MLObject"), args)
+
+    def _array_access(self, expr: ArrayAccess) -> ast.expr:
+        return ast.Subscript(self._expr(expr.array), self._index(expr.index), _LOAD, **self._at)
+
+    def _index(self, index) -> ast.expr:
+        if isinstance(index, SliceExpression):
+            return ast.Slice(
+                self._expr(index.start) if index.start else None,
+                self._expr(index.end) if index.end else None,
+                self._expr(index.step) if index.step else None,
+                **self._at,
+            )
+        return self._expr(index)
+
+    def _member_access(self, expr: MemberAccess) -> ast.expr:
+        obj = self._expr(expr.object)
+        if not isinstance(expr.member, str):
+            return ast.Subscript(obj, self._expr(expr.member), _LOAD, **self._at)
+
+        is_imported_module = False
+        if isinstance(expr.object, Identifier):
+            name = expr.object.name
+            if name == "builtin":
+                self.context.builtin_functions_used.add(expr.member)
+                is_imported_module = True
+            if name in self.context.imported_modules or name in self.symbol_table.get(
+                "imports", set()
+            ):
+                is_imported_module = True
+                if name in self.context.variable_mappings:
+                    obj = self._code(self.context.variable_mappings[name])
+
+        if is_imported_module:
+            return self._attr(obj, expr.member)
+
+        obj_type = self._detect_object_type(expr.object)
+        if obj_type and self._is_safe_builtin_access(obj_type, expr.member):
+            return self._attr(obj, expr.member)
+        if obj_type is dict or self._is_ml_object_pattern(expr.object):
+            return ast.Subscript(obj, self._const(expr.member), _LOAD, **self._at)
+
+        self._ensure_runtime_helpers_imported()
+        return self._call(self._load("_safe_attr_access"), [obj, self._const(expr.member)])
+
+    def _function_call(self, node: FunctionCall) -> ast.expr:
+        if not self._should_wrap_call(node.function):
+            func = self._code(self._safe_identifier(str(node.function)))
+            return self._call(func, [self._expr(arg) for arg in node.arguments])
+
+        if isinstance(node.function, MemberAccess):
+            target = node.function.object
+            if isinstance(target, Identifier) and (
+                target.name in self.context.imported_modules or target.name == "builtin"
+            ):
+                func = self._expr(node.function)
+                args = [self._expr(arg) for arg in node.arguments]
+                return self._call(self._load("_safe_call"), [func, *args])
+
+            obj = self._expr(target)
+            member = node.function.member
+            args = [self._expr(arg) for arg in node.arguments]
+            self._ensure_runtime_helpers_imported()
+            method = self._const(member if isinstance(member, str) else str(member))
+            return self._call(self._load("_safe_method_call"), [obj, method, *args])
+
+        if isinstance(node.function, str):
+            if self.function_registry.is_allowed_builtin(node.function):
+                self.context.builtin_functions_used.add(node.function)
+                func = self._code(f"builtin.{node.function}")
+            else:
+                func = self._code(self._safe_identifier(node.function))
+        else:
+            func = self._expr(node.function)
+
+        args = [self._expr(arg) for arg in node.arguments]
+        return self._call(self._load("_safe_call"), [func, *args])
+
+    def _arrow_function(self, node: ArrowFunction) -> ast.Lambda:
+        params = []
+        for param in node.parameters:
+            if hasattr(param, "name"):
+                params.append(param.name)
+            elif hasattr(param, "value"):
+                params.append(param.value)
+            else:
+                params.append(str(param))
+
+        self.symbol_table["parameters"].append(set(params))
+        body = self._expr(node.body)
+        self.symbol_table["parameters"].pop()
+        return self._lambda(params, body)
+
+    def _lambda_from_function_def(self, func_def: FunctionDefinition) -> ast.Lambda:
+        params = []
+        for param in func_def.parameters:
+            params.append(
+                self._safe_identifier(param.name if hasattr(param, "name") else str(param))
+            )
+
+        self.symbol_table["parameters"].append(set(params))
+        try:
+            body = func_def.body
+            if len(body) == 1 and isinstance(body[0], ReturnStatement):
+                return self._lambda(params, self._expr(body[0].value))
+
+            last_return = next(
+                (stmt for stmt in reversed(body) if isinstance(stmt, ReturnStatement)), None
+            )
+            if not (last_return and last_return.value):
+                return self._lambda(params, self._const(None))
+
+            assignments = {
+                stmt.target.name: stmt.value
+                for stmt in body
+                if isinstance(stmt, AssignmentStatement) and hasattr(stmt.target, "name")
+            }
+            try:
+                substituted = self._substitute_expression(
+                    last_return.value, assignments, set(params), depth=0
+                )
+                if substituted:
+                    return self._lambda(params, self._expr(substituted))
+            except UnsupportedConstruct:
+                raise
+            except Exception:
+                pass
+            return self._lambda(params, self._expr(last_return.value))
+        finally:
+            self.symbol_table["parameters"].pop()
+
+
+_EXPRESSION_BUILDERS = {
+    BinaryExpression: PythonAstGenerator._binary,
+    UnaryExpression: PythonAstGenerator._unary,
+    TernaryExpression: PythonAstGenerator._ternary,
+    Identifier: PythonAstGenerator._name_reference,
+    NumberLiteral: PythonAstGenerator._number,
+    StringLiteral: PythonAstGenerator._string,
+    BooleanLiteral: PythonAstGenerator._boolean,
+    ArrayLiteral: PythonAstGenerator._array,
+    ObjectLiteral: PythonAstGenerator._object,
+    ArrayAccess: PythonAstGenerator._array_access,
+    MemberAccess: PythonAstGenerator._member_access,
+    FunctionCall: PythonAstGenerator._function_call,
+    ArrowFunction: PythonAstGenerator._arrow_function,
+    FunctionDefinition: PythonAstGenerator._lambda_from_function_def,
+}
+
+
+def generate_python_ast(
+    ast_root: Program,
+    source_file: str | None = None,
+    import_paths: list[str] | None = None,
+    allow_current_dir: bool = True,
+    module_output_mode: str = "separate",
+    repl_mode: bool = False,
+    known_imports: list[str] | None = None,
+    dependencies: list[str] | None = None,
+) -> GeneratedModule:
+    """Generate a Python module AST from ML AST.
+
+    Arguments are as for ``generate_python_code``. Programs the AST backend
+    does not handle go through the text generator, and its output is parsed
+    (``GeneratedModule.backend`` is then "text").
+    """
+    filename = source_file or "<ml>"
+    generator = PythonAstGenerator(
+        source_file, import_paths, allow_current_dir, module_output_mode, repl_mode, known_imports
+    )
+    try:
+        result = GeneratedModule(generator.generate_module(ast_root), filename)
+    except UnsupportedConstruct:
+        generator = PythonCodeGenerator(
+            source_file,
+            False,
+            import_paths,
+            allow_current_dir,
+            module_output_mode,
+            repl_mode,
+            known_imports,
+        )
+        python_code, _ = generator.generate(ast_root)
+        result = GeneratedModule(ast.parse(python_code, filename), filename, backend="text")
+
+    if dependencies is not None:
+        dependencies.extend(generator.user_module_files.values())
+        dependencies.extend(generator.module_py_files.values())
+    return result
+
+
+__all__ = [
+    "GeneratedModule",
+    "PythonAstGenerator",
+    "UnsupportedConstruct",
+    "generate_python_ast",
+]
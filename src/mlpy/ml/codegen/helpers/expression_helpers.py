@@ -6,7 +6,7 @@ This mixin provides helper methods for generating Python code from ML expression
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from mlpy.ml.grammar.ast_nodes import Expression, SliceExpression
+    from mlpy.ml.grammar.ast_nodes import Expression, Identifier, SliceExpression
 
 
 class ExpressionHelpersMixin:
@@ -142,6 +142,103 @@ class ExpressionHelpersMixin:
             self.context.runtime_helpers_imported = True
             self.context.imports_needed.add("mlpy.stdlib.runtime_helpers")
 
+    def _ensure_ml_object_imported(self) -> None:
+        """Ensure MLObject is imported for object literals."""
+        self.context.imports_needed.add("from mlpy.stdlib.runtime_helpers import MLObject as _MLObject")
+
+    # ========================================================================
+    # Identifier Resolution
+    # ========================================================================
+
+    def _resolve_identifier(self, expr: 'Identifier') -> str:
+        """Python code for an identifier reference, validated against the symbol table.
+
+        Raises:
+            ValueError: If the identifier is unknown (or a blocked Python
+                builtin in REPL mode)
+        """
+        # Validate identifier and route appropriately
+        name = expr.name
+
+        # Check if identifier is known in current scope
+        # 1. User-defined variables
+        if name in self.symbol_table['variables']:
+            return self._safe_identifier(name)
+
+        # 2. User-defined functions
+        if name in self.symbol_table['functions']:
+            return self._safe_identifier(name)
+
+        # 3. Function parameters (check all scopes in stack)
+        for param_scope in self.symbol_table['parameters']:
+            if name in param_scope:
+                return self._safe_identifier(name)
+
+        # 4. Imported modules
+        if name in self.symbol_table['imports']:
+            return self._safe_identifier(name)
+
+        # 5. ML builtin functions - route to builtin module
+        if name in self.symbol_table['ml_builtins']:
+            self.context.builtin_functions_used.add(name)
+            return f"builtin.{name}"
+
+        # 5.5. ML language literals (null, undefined, etc.)
+        if name == "null":
+            return "None"
+        if name == "undefined":
+            return "None"
+
+        # 6. REPL mode - allow undefined identifiers (will be checked at runtime)
+        if self.repl_mode:
+            # Extra security: block dangerous Python built-ins even in REPL mode
+            dangerous_identifiers = {
+                # Code execution
+                'eval', 'exec', 'compile', '__import__', 'vars', 'globals', 'locals',
+                'dir', 'getattr', 'setattr', 'delattr', 'hasattr',
+                # Reflection abuse
+                '__dict__', '__bases__', '__subclasses__', '__mro__', '__class__', '__builtins__',
+                # Code object access
+                '__code__', '__globals__', '__closure__',
+                # Module internals
+                '__name__', '__file__', '__package__', '__path__',
+                # Dangerous builtins (open can be dangerous, __input__ is Python internal)
+                # Note: 'input' and 'help' are excluded - they're safe ML builtin wrappers
+                'open', '__input__',
+                # System access
+                'exit', 'quit', 'copyright', 'credits', 'license'
+            }
+
+            if name in dangerous_identifiers:
+                raise ValueError(
+                    f"Security: Direct access to '{name}' is not allowed.\n"
+                    f"This identifier provides access to Python internals and bypasses ML security.\n"
+                    f"Suggestions:\n"
+                    f"  - Use ML standard library functions instead\n"
+                    f"  - Request appropriate capabilities for system access\n"
+                    f"  - Avoid direct Python namespace manipulation"
+                )
+
+            # In REPL mode, assume unknown identifiers are variables from previous statements
+            # Python's runtime will raise NameError if the variable truly doesn't exist
+            return self._safe_identifier(name)
+
+        # 7. Unknown identifier - SECURITY: Block at compile time
+        # This prevents access to Python builtins like eval, exec, open, __import__
+        raise ValueError(
+            f"Unknown identifier '{name}' at line {expr.line if hasattr(expr, 'line') else '?'}. "
+            f"Not a variable, function, parameter, import, or ML builtin. "
+            f"\n\nPossible causes:"
+            f"\n  - Typo in identifier name"
+            f"\n  - Python builtin (use ML stdlib instead: e.g., builtin.len())"
+            f"\n  - Undefined variable (ensure it's assigned before use)"
+            f"\n\nKnown identifiers:"
+            f"\n  Variables: {sorted(list(self.symbol_table['variables']))[:5]}"
+            f"\n  Functions: {sorted(list(self.symbol_table['functions']))[:5]}"
+            f"\n  Imports: {sorted(list(self.symbol_table['imports']))[:5]}"
+            f"\n  ML builtins: abs, len, max, min, sum, ... (use via calls: abs(-5))"
+        )
+
     # ========================================================================
     # Main Expression Generation
     # ========================================================================
@@ -218,87 +315,7 @@ class ExpressionHelpersMixin:
                 return f"({python_op} {operand})"
 
         elif isinstance(expr, Identifier):
-            # Validate identifier and route appropriately
-            name = expr.name
-
-            # Check if identifier is known in current scope
-            # 1. User-defined variables
-            if name in self.symbol_table['variables']:
-                return self._safe_identifier(name)
-
-            # 2. User-defined functions
-            if name in self.symbol_table['functions']:
-                return self._safe_identifier(name)
-
-            # 3. Function parameters (check all scopes in stack)
-            for param_scope in self.symbol_table['parameters']:
-                if name in param_scope:
-                    return self._safe_identifier(name)
-
-            # 4. Imported modules
-            if name in self.symbol_table['imports']:
-                return self._safe_identifier(name)
-
-            # 5. ML builtin functions - route to builtin module
-            if name in self.symbol_table['ml_builtins']:
-                self.context.builtin_functions_used.add(name)
-                return f"builtin.{name}"
-
-            # 5.5. ML language literals (null, undefined, etc.)
-            if name == "null":
-                return "None"
-            if name == "undefined":
-                return "None"
-
-            # 6. REPL mode - allow undefined identifiers (will be checked at runtime)
-            if self.repl_mode:
-                # Extra security: block dangerous Python built-ins even in REPL mode
-                dangerous_identifiers = {
-                    # Code execution
-                    'eval', 'exec', 'compile', '__import__', 'vars', 'globals', 'locals',
-                    'dir', 'getattr', 'setattr', 'delattr', 'hasattr',
-                    # Reflection abuse
-                    '__dict__', '__bases__', '__subclasses__', '__mro__', '__class__', '__builtins__',
-                    # Code object access
-                    '__code__', '__globals__', '__closure__',
-                    # Module internals
-                    '__name__', '__file__', '__package__', '__path__',
-                    # Dangerous builtins (open can be dangerous, __input__ is Python internal)
-                    # Note: 'input' and 'help' are excluded - they're safe ML builtin wrappers
-                    'open', '__input__',
-                    # System access
-                    'exit', 'quit', 'copyright', 'credits', 'license'
-                }
-
-                if name in dangerous_identifiers:
-                    raise ValueError(
-                        f"Security: Direct access to '{name}' is not allowed.\n"
-                        f"This identifier provides access to Python internals and bypasses ML security.\n"
-                        f"Suggestions:\n"
-                        f"  - Use ML standard library functions instead\n"
-                        f"  - Request appropriate capabilities for system access\n"
-                        f"  - Avoid direct Python namespace manipulation"
-                    )
-
-                # In REPL mode, assume unknown identifiers are variables from previous statements
-                # Python's runtime will raise NameError if the variable truly doesn't exist
-                return self._safe_identifier(name)
-
-            # 7. Unknown identifier - SECURITY: Block at compile time
-            # This prevents access to Python builtins like eval, exec, open, __import__
-            raise ValueError(
-                f"Unknown identifier '{name}' at line {expr.line if hasattr(expr, 'line') else '?'}. "
-                f"Not a variable, function, parameter, import, or ML builtin. "
-                f"\n\nPossible causes:"
-                f"\n  - Typo in identifier name"
-                f"\n  - Python builtin (use ML stdlib instead: e.g., builtin.len())"
-                f"\n  - Undefined variable (ensure it's assigned before use)"
-                f"\n\nKnown identifiers:"
-                f"\n  Variables: {sorted(list(self.symbol_table['variables']))[:5]}"
-                f"\n  Functions: {sorted(list(self.symbol_table['functions']))[:5]}"
-                f"\n  Imports: {sorted(list(self.symbol_table['imports']))[:5]}"
-                f"\n  ML builtins: abs, len, max, min, sum, ... (use via calls: abs(-5))"
-            )
+            return self._resolve_identifier(expr)
 
         elif isinstance(expr, FunctionCall):
             # Delegate to function call generation (remains in main class)
@@ -394,7 +411,11 @@ class ExpressionHelpersMixin:
                     key_str = repr(str(key))
                 value_str = self._generate_expression(value)
                 properties.append(f"{key_str}: {value_str}")
-            return f"{{{', '.join(properties)}}}"
+            # MLObject lets the runtime helpers recognize the object in O(1)
+            self._ensure_ml_object_imported()
+            if not properties:
+                return "_MLObject()"
+            return f"_MLObject({{{', '.join(properties)}}})"
 
         elif isinstance(expr, ArrowFunction):
             # Handle arrow functions by calling the visitor method (remains in main class)
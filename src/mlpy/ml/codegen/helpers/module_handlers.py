@@ -194,6 +194,7 @@ class ModuleHandlersMixin:
 
         Side Effects:
             - Updates self.symbol_table['imports'] with imported module names
+            - Records the module's .ml file in self.user_module_files
             - In 'separate' mode: Calls _compile_module_to_file()
             - In 'inline' mode: Calls _transpile_user_module() if not cached
             - Emits import statement or alias assignment to output
@@ -204,6 +205,7 @@ class ModuleHandlersMixin:
             Inline mode: `sort = user_modules_sorting` (after embedding module code)
         """
         module_path = module_info['module_path']
+        self.user_module_files[module_path] = module_info['file_path']
 
         if self.module_output_mode == 'separate':
             # Separate file mode: compile to .py file and use normal Python import
@@ -414,6 +416,7 @@ class ModuleHandlersMixin:
 
         # Generate Python code from module AST
         python_code, _ = module_generator.generate(module_info['ast'])
+        self.user_module_files.update(module_generator.user_module_files)
 
         # Extract just the function definitions from the generated code
         # (skip header, imports, footer)
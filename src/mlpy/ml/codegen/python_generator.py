@@ -69,6 +69,7 @@ class PythonCodeGenerator(
         self.module_output_mode = module_output_mode
         self.compiled_modules: dict[str, str] = {}  # Cache of transpiled user modules (for inline mode)
         self.module_py_files: dict[str, str] = {}  # Map of module_path -> .py file path (for separate mode)
+        self.user_module_files: dict[str, str] = {}  # Map of module_path -> .ml file the output depends on
         self.repl_mode = repl_mode  # REPL mode flag
         self.known_imports = known_imports or []  # Pre-imported modules (REPL)
 
@@ -429,7 +430,8 @@ def generate_python_code(
     allow_current_dir: bool = True,
     module_output_mode: str = 'separate',
     repl_mode: bool = False,
-    known_imports: list[str] | None = None
+    known_imports: list[str] | None = None,
+    dependencies: list[str] | None = None
 ) -> tuple[str, dict[str, Any] | None]:
     """Generate Python code from ML AST.
 
@@ -442,6 +444,8 @@ def generate_python_code(
         module_output_mode: 'separate' (create .py files) or 'inline' (embed in main file)
         repl_mode: Enable REPL mode (skip undefined variable validation)
         known_imports: List of module names already imported (for REPL mode)
+        dependencies: If given, extended with the user module files (.ml, and
+            generated .py in 'separate' mode) that the output depends on
 
     Returns:
         Tuple of (Python code string, source map data)
@@ -457,6 +461,10 @@ def generate_python_code(
     )
     python_code, source_map = generator.generate(ast)
 
+    if dependencies is not None:
+        dependencies.extend(generator.user_module_files.values())
+        dependencies.extend(generator.module_py_files.values())
+
     # The generator.generate() method creates the enhanced source map with
     # proper line tracking from EnhancedSourceMapGenerator.track_node()
     # which uses actual AST node line/column info (now extracted from Lark metadata)
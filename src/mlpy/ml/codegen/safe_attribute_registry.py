@@ -5,9 +5,13 @@ can be safely accessed from ML code, preventing dangerous introspection and
 maintaining security while enabling natural object-oriented syntax.
 """
 
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from enum import Enum
 
+# Callbacks run whenever registrations change, e.g. to clear runtime caches
+_change_listeners: list[Callable[[], None]] = []
+
 
 class AttributeAccessType(Enum):
     """Types of attribute access allowed."""
@@ -46,10 +50,12 @@ class SafeAttributeRegistry:
     def register_builtin_type(self, python_type: type, attributes: dict[str, SafeAttribute]):
         """Register safe attributes for Python built-in type."""
         self._safe_attributes[python_type] = attributes.copy()
+        _notify_change()
 
     def register_custom_class(self, class_name: str, attributes: dict[str, SafeAttribute]):
         """Allow stdlib modules to register custom classes."""
         self._custom_classes[class_name] = attributes.copy()
+        _notify_change()
 
     def is_safe_access(self, obj_type: type, attr_name: str) -> bool:
         """Check if attribute access is safe for given type."""
@@ -640,4 +646,16 @@ def get_safe_registry() -> SafeAttributeRegistry:
     global _safe_registry
     if _safe_registry is None:
         _safe_registry = SafeAttributeRegistry()
+        _notify_change()
     return _safe_registry
+
+
+def add_change_listener(callback: Callable[[], None]) -> None:
+    """Call ``callback`` whenever safe attribute registrations change."""
+    _change_listeners.append(callback)
+
+
+def _notify_change() -> None:
+    """Run the change listeners."""
+    for callback in list(_change_listeners):
+        callback()
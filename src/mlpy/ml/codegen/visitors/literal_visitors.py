@@ -161,7 +161,7 @@ class LiteralVisitorsMixin:
     def visit_object_literal(self, node: "ObjectLiteral"):
         """Visit an object literal node.
 
-        Object literals create Python dictionaries:
+        Object literals create MLObject dictionaries:
         - Empty objects: {}
         - String keys: {name: "Alice", age: 30}
         - Computed keys: {[key]: value}
@@ -173,17 +173,18 @@ class LiteralVisitorsMixin:
 
         Example:
             ML: {name: "Alice", age: 30}
-            Python: {"name": "Alice", "age": 30}
+            Python: _MLObject({"name": "Alice", "age": 30})
 
             ML: {x: 1, y: x + 1}
-            Python: {"x": 1, "y": x + 1}
+            Python: _MLObject({"x": 1, "y": x + 1})
 
             ML: {}
-            Python: {}
+            Python: _MLObject()
 
         Note:
             Actual code generation is handled by _generate_expression() in
             ExpressionHelpersMixin. All keys are converted to strings, values
-            are recursively processed.
+            are recursively processed. MLObject is the dict subclass the
+            runtime helpers recognize as an ML object with one type check.
         """
         pass  # Handled by _generate_expression
@@ -10,7 +10,7 @@ from .ast_nodes import ASTNode, Expression, Statement
 
 
 # Pattern Matching System
-@dataclass
+@dataclass(slots=True)
 class MatchExpression(Expression):
     """Match expression with pattern arms."""
 
@@ -21,7 +21,7 @@ class MatchExpression(Expression):
         return visitor.visit_match_expression(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchArm(ASTNode):
     """Single arm of a match expression."""
 
@@ -33,7 +33,7 @@ class MatchArm(ASTNode):
         return visitor.visit_match_arm(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class Pattern(ASTNode):
     """Base class for all patterns."""
 
@@ -41,7 +41,7 @@ class Pattern(ASTNode):
         return visitor.visit_pattern(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class LiteralPattern(Pattern):
     """Pattern that matches a literal value."""
 
@@ -51,7 +51,7 @@ class LiteralPattern(Pattern):
         return visitor.visit_literal_pattern(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class IdentifierPattern(Pattern):
     """Pattern that binds to an identifier."""
 
@@ -61,7 +61,7 @@ class IdentifierPattern(Pattern):
         return visitor.visit_identifier_pattern(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class ArrayPattern(Pattern):
     """Pattern that matches array structure."""
 
@@ -72,7 +72,7 @@ class ArrayPattern(Pattern):
         return visitor.visit_array_pattern(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class ObjectPattern(Pattern):
     """Pattern that matches object structure."""
 
@@ -82,7 +82,7 @@ class ObjectPattern(Pattern):
         return visitor.visit_object_pattern(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class ObjectPatternField(ASTNode):
     """Field in object pattern."""
 
@@ -93,7 +93,7 @@ class ObjectPatternField(ASTNode):
         return visitor.visit_object_pattern_field(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class ConstructorPattern(Pattern):
     """Pattern that matches constructor calls."""
 
@@ -104,7 +104,7 @@ class ConstructorPattern(Pattern):
         return visitor.visit_constructor_pattern(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class RangePattern(Pattern):
     """Pattern that matches numeric ranges."""
 
@@ -115,7 +115,7 @@ class RangePattern(Pattern):
         return visitor.visit_range_pattern(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class TypePattern(Pattern):
     """Pattern that matches based on type."""
 
@@ -127,7 +127,7 @@ class TypePattern(Pattern):
 
 
 # Enhanced Type System
-@dataclass
+@dataclass(slots=True)
 class TypeExpression(ASTNode):
     """Base class for type expressions."""
 
@@ -135,7 +135,7 @@ class TypeExpression(ASTNode):
         return visitor.visit_type_expression(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class PrimitiveType(TypeExpression):
     """Primitive type like number, string, boolean."""
 
@@ -145,7 +145,7 @@ class PrimitiveType(TypeExpression):
         return visitor.visit_primitive_type(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class GenericType(TypeExpression):
     """Generic type with type parameters."""
 
@@ -156,7 +156,7 @@ class GenericType(TypeExpression):
         return visitor.visit_generic_type(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class FunctionType(TypeExpression):
     """Function type signature."""
 
@@ -167,7 +167,7 @@ class FunctionType(TypeExpression):
         return visitor.visit_function_type(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class UnionType(TypeExpression):
     """Union of multiple types."""
 
@@ -177,7 +177,7 @@ class UnionType(TypeExpression):
         return visitor.visit_union_type(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class OptionalType(TypeExpression):
     """Optional/nullable type."""
 
@@ -187,7 +187,7 @@ class OptionalType(TypeExpression):
         return visitor.visit_optional_type(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class ArrayType(TypeExpression):
     """Array type with element type."""
 
@@ -198,7 +198,7 @@ class ArrayType(TypeExpression):
 
 
 # Advanced Function Constructs
-@dataclass
+@dataclass(slots=True)
 class GenericFunction(Statement):
     """Function with generic type parameters."""
 
@@ -212,7 +212,7 @@ class GenericFunction(Statement):
         return visitor.visit_generic_function(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class TypeParameter(ASTNode):
     """Generic type parameter."""
 
@@ -223,7 +223,7 @@ class TypeParameter(ASTNode):
         return visitor.visit_type_parameter(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class PartialApplication(Expression):
     """Partial function application."""
 
@@ -234,7 +234,7 @@ class PartialApplication(Expression):
         return visitor.visit_partial_application(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class PipelineExpression(Expression):
     """Pipeline operator expression."""
 
@@ -245,7 +245,7 @@ class PipelineExpression(Expression):
         return visitor.visit_pipeline_expression(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class CompositionExpression(Expression):
     """Function composition expression."""
 
@@ -257,7 +257,7 @@ class CompositionExpression(Expression):
 
 
 # Async/Await
-@dataclass
+@dataclass(slots=True)
 class AsyncFunction(Statement):
     """Async function definition."""
 
@@ -270,7 +270,7 @@ class AsyncFunction(Statement):
         return visitor.visit_async_function(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class AwaitExpression(Expression):
     """Await expression."""
 
@@ -281,7 +281,7 @@ class AwaitExpression(Expression):
 
 
 # Advanced Literals
-@dataclass
+@dataclass(slots=True)
 class TupleLiteral(Expression):
     """Tuple literal."""
 
@@ -291,7 +291,7 @@ class TupleLiteral(Expression):
         return visitor.visit_tuple_literal(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class SetLiteral(Expression):
     """Set literal."""
 
@@ -301,7 +301,7 @@ class SetLiteral(Expression):
         return visitor.visit_set_literal(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class MapLiteral(Expression):
     """Map literal."""
 
@@ -311,7 +311,7 @@ class MapLiteral(Expression):
         return visitor.visit_map_literal(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class MapEntry(ASTNode):
     """Map entry (key-value pair)."""
 
@@ -323,7 +323,7 @@ class MapEntry(ASTNode):
 
 
 # Comprehensions
-@dataclass
+@dataclass(slots=True)
 class ArrayComprehension(Expression):
     """Array comprehension."""
 
@@ -336,7 +336,7 @@ class ArrayComprehension(Expression):
         return visitor.visit_array_comprehension(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class ObjectComprehension(Expression):
     """Object comprehension."""
 
@@ -351,7 +351,7 @@ class ObjectComprehension(Expression):
 
 
 # Module System Enhancements
-@dataclass
+@dataclass(slots=True)
 class ExportStatement(Statement):
     """Export statement."""
 
@@ -361,7 +361,7 @@ class ExportStatement(Statement):
         return visitor.visit_export_statement(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class TypeDefinition(Statement):
     """Type alias definition."""
 
@@ -373,7 +373,7 @@ class TypeDefinition(Statement):
         return visitor.visit_type_definition(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class TypeProperty(ASTNode):
     """Property in type definition."""
 
@@ -384,7 +384,7 @@ class TypeProperty(ASTNode):
         return visitor.visit_type_property(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class InterfaceDefinition(Statement):
     """Interface definition."""
 
@@ -395,7 +395,7 @@ class InterfaceDefinition(Statement):
         return visitor.visit_interface_definition(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class InterfaceMember(ASTNode):
     """Member of interface."""
 
@@ -408,7 +408,7 @@ class InterfaceMember(ASTNode):
 
 
 # Error Handling Enhancements
-@dataclass
+@dataclass(slots=True)
 class ResultType(TypeExpression):
     """Result<T, E> type."""
 
@@ -419,7 +419,7 @@ class ResultType(TypeExpression):
         return visitor.visit_result_type(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class OptionType(TypeExpression):
     """Option<T> type."""
 
@@ -429,7 +429,7 @@ class OptionType(TypeExpression):
         return visitor.visit_option_type(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class ErrorPropagation(Expression):
     """Error propagation operator (?)."""
 
@@ -440,7 +440,7 @@ class ErrorPropagation(Expression):
 
 
 # Capability-Based Features
-@dataclass
+@dataclass(slots=True)
 class CapabilityFunction(Statement):
     """Function with capability requirements."""
 
@@ -451,7 +451,7 @@ class CapabilityFunction(Statement):
         return visitor.visit_capability_function(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class SecureImport(Statement):
     """Secure import with capability checking."""
 
@@ -461,7 +461,7 @@ class SecureImport(Statement):
         return visitor.visit_secure_import(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class SandboxBlock(Statement):
     """Sandboxed execution block."""
 
@@ -472,7 +472,7 @@ class SandboxBlock(Statement):
 
 
 # Metaprogramming (Limited)
-@dataclass
+@dataclass(slots=True)
 class MacroDefinition(Statement):
     """Macro definition (limited for security)."""
 
@@ -484,7 +484,7 @@ class MacroDefinition(Statement):
         return visitor.visit_macro_definition(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class MacroCall(Expression):
     """Macro invocation."""
 
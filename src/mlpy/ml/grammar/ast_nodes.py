@@ -1,16 +1,41 @@
 """AST node definitions for the mlpy ML language."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 from typing import Any, Optional, Union
 
 
 class ASTNode(ABC):
-    """Base class for all AST nodes."""
+    """Base class for all AST nodes.
+
+    Nodes declare their attributes in ``__slots__``, so they carry no
+    per-instance ``__dict__``; ``iter_fields`` lists a node's attributes.
+    """
+
+    __slots__ = ("line", "column")
+
+    # Slot names of the class and its bases, like ``ast.AST._fields``
+    _fields: tuple[str, ...] = ("line", "column")
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        slots = cls.__dict__.get("__slots__", ())
+        cls._fields = cls._fields + ((slots,) if isinstance(slots, str) else tuple(slots))
 
     def __init__(self, line: int | None = None, column: int | None = None):
         self.line = line
         self.column = column
 
+    def iter_fields(self) -> Iterator[tuple[str, Any]]:
+        """Yield ``(name, value)`` for each attribute set on the node."""
+        for name in self._fields:
+            try:
+                yield name, getattr(self, name)
+            except AttributeError:
+                pass
+        # Subclasses that do not declare __slots__
+        yield from getattr(self, "__dict__", {}).items()
+
     @abstractmethod
     def accept(self, visitor):
         """Accept a visitor for the visitor pattern."""
@@ -20,6 +45,8 @@ class ASTNode(ABC):
 class Program(ASTNode):
     """Root node representing the entire program."""
 
+    __slots__ = ("items",)
+
     def __init__(self, items: list[ASTNode], line: int | None = None, column: int | None = None):
         super().__init__(line, column)
         self.items = items
@@ -32,6 +59,8 @@ class Program(ASTNode):
 class CapabilityDeclaration(ASTNode):
     """Capability declaration for security control."""
 
+    __slots__ = ("name", "items")
+
     def __init__(
         self,
         name: str,
@@ -50,12 +79,14 @@ class CapabilityDeclaration(ASTNode):
 class CapabilityItem(ASTNode):
     """Base class for capability items."""
 
-    pass
+    __slots__ = ()
 
 
 class ResourcePattern(CapabilityItem):
     """Resource pattern in capability declaration."""
 
+    __slots__ = ("pattern",)
+
     def __init__(self, pattern: str, line: int | None = None, column: int | None = None):
         super().__init__(line, column)
         self.pattern = pattern
@@ -67,6 +98,8 @@ class ResourcePattern(CapabilityItem):
 class PermissionGrant(CapabilityItem):
     """Permission grant in capability declaration."""
 
+    __slots__ = ("permission_type", "target")
+
     def __init__(
         self,
         permission_type: str,
@@ -86,6 +119,8 @@ class PermissionGrant(CapabilityItem):
 class ImportStatement(ASTNode):
     """Import statement with security analysis."""
 
+    __slots__ = ("target", "alias")
+
     def __init__(
         self,
         target: list[str],
@@ -105,6 +140,8 @@ class ImportStatement(ASTNode):
 class FunctionDefinition(ASTNode):
     """Function definition."""
 
+    __slots__ = ("name", "parameters", "body")
+
     def __init__(
         self,
         name: str,
@@ -125,6 +162,8 @@ class FunctionDefinition(ASTNode):
 class Parameter(ASTNode):
     """Function parameter."""
 
+    __slots__ = ("name", "type_annotation")
+
     def __init__(
         self,
         name: str,
@@ -144,12 +183,14 @@ class Parameter(ASTNode):
 class Statement(ASTNode):
     """Base class for statements."""
 
-    pass
+    __slots__ = ()
 
 
 class ExpressionStatement(Statement):
     """Expression used as statement."""
 
+    __slots__ = ("expression",)
+
     def __init__(
         self, expression: "Expression", line: int | None = None, column: int | None = None
     ):
@@ -163,6 +204,8 @@ class ExpressionStatement(Statement):
 class AssignmentStatement(Statement):
     """Variable, array element, or object property assignment."""
 
+    __slots__ = ("target", "value")
+
     def __init__(
         self,
         target: Union[str, "Expression"],
@@ -181,6 +224,8 @@ class AssignmentStatement(Statement):
 class ReturnStatement(Statement):
     """Return statement."""
 
+    __slots__ = ("value",)
+
     def __init__(
         self,
         value: Optional["Expression"] = None,
@@ -197,6 +242,8 @@ class ReturnStatement(Statement):
 class BlockStatement(Statement):
     """Block of statements."""
 
+    __slots__ = ("statements",)
+
     def __init__(
         self, statements: list[Statement], line: int | None = None, column: int | None = None
     ):
@@ -210,6 +257,8 @@ class BlockStatement(Statement):
 class ElifClause(ASTNode):
     """Elif clause for if statements."""
 
+    __slots__ = ("condition", "statement")
+
     def __init__(
         self,
         condition: "Expression",
@@ -228,6 +277,8 @@ class ElifClause(ASTNode):
 class IfStatement(Statement):
     """If conditional statement with optional elif clauses."""
 
+    __slots__ = ("condition", "then_statement", "elif_clauses", "else_statement")
+
     def __init__(
         self,
         condition: "Expression",
@@ -250,6 +301,8 @@ class IfStatement(Statement):
 class WhileStatement(Statement):
     """While loop statement."""
 
+    __slots__ = ("condition", "body")
+
     def __init__(
         self,
         condition: "Expression",
@@ -268,6 +321,8 @@ class WhileStatement(Statement):
 class ForStatement(Statement):
     """For loop statement."""
 
+    __slots__ = ("variable", "iterable", "body")
+
     def __init__(
         self,
         variable: "Identifier",
@@ -288,6 +343,8 @@ class ForStatement(Statement):
 class TryStatement(Statement):
     """Try/except/finally statement."""
 
+    __slots__ = ("try_body", "except_clauses", "finally_body")
+
     def __init__(
         self,
         try_body: list[Statement],
@@ -308,6 +365,8 @@ class TryStatement(Statement):
 class ExceptClause(ASTNode):
     """Except clause in try statement."""
 
+    __slots__ = ("exception_type", "exception_variable", "body")
+
     def __init__(
         self,
         exception_type: str | None = None,
@@ -328,6 +387,8 @@ class ExceptClause(ASTNode):
 class BreakStatement(Statement):
     """Break statement for loop control."""
 
+    __slots__ = ()
+
     def __init__(self, line: int | None = None, column: int | None = None):
         super().__init__(line, column)
 
@@ -338,6 +399,8 @@ class BreakStatement(Statement):
 class ContinueStatement(Statement):
     """Continue statement for loop control."""
 
+    __slots__ = ()
+
     def __init__(self, line: int | None = None, column: int | None = None):
         super().__init__(line, column)
 
@@ -348,6 +411,8 @@ class ContinueStatement(Statement):
 class NonlocalStatement(Statement):
     """Nonlocal statement for closure variable access."""
 
+    __slots__ = ("variables",)
+
     def __init__(self, variables: list[str], line: int | None = None, column: int | None = None):
         super().__init__(line, column)
         self.variables = variables
@@ -359,6 +424,8 @@ class NonlocalStatement(Statement):
 class ThrowStatement(Statement):
     """Throw statement for raising user exceptions with dictionary data."""
 
+    __slots__ = ("error_data",)
+
     def __init__(
         self,
         error_data: "ObjectLiteral",
@@ -376,12 +443,14 @@ class ThrowStatement(Statement):
 class Expression(ASTNode):
     """Base class for expressions."""
 
-    pass
+    __slots__ = ()
 
 
 class BinaryExpression(Expression):
     """Binary operation expression."""
 
+    __slots__ = ("left", "operator", "right")
+
     def __init__(
         self,
         left: Expression,
@@ -402,6 +471,8 @@ class BinaryExpression(Expression):
 class UnaryExpression(Expression):
     """Unary operation expression."""
 
+    __slots__ = ("operator", "operand")
+
     def __init__(
         self,
         operator: str,
@@ -420,6 +491,8 @@ class UnaryExpression(Expression):
 class TernaryExpression(Expression):
     """Ternary conditional expression (condition ? true_value : false_value)."""
 
+    __slots__ = ("condition", "true_value", "false_value")
+
     def __init__(
         self,
         condition: Expression,
@@ -440,6 +513,8 @@ class TernaryExpression(Expression):
 class Identifier(Expression):
     """Variable or function identifier."""
 
+    __slots__ = ("name",)
+
     def __init__(self, name: str, line: int | None = None, column: int | None = None):
         super().__init__(line, column)
         self.name = name
@@ -451,6 +526,8 @@ class Identifier(Expression):
 class FunctionCall(Expression):
     """Function call expression - Security Critical."""
 
+    __slots__ = ("function", "arguments")
+
     def __init__(
         self,
         function: str,
@@ -469,6 +546,8 @@ class FunctionCall(Expression):
 class ArrayAccess(Expression):
     """Array access expression."""
 
+    __slots__ = ("array", "index")
+
     def __init__(
         self,
         array: Expression,
@@ -487,6 +566,8 @@ class ArrayAccess(Expression):
 class SliceExpression(Expression):
     """Slice expression for array/string slicing (Python-style)."""
 
+    __slots__ = ("start", "end", "step")
+
     def __init__(
         self,
         start: Expression | None = None,
@@ -507,6 +588,8 @@ class SliceExpression(Expression):
 class MemberAccess(Expression):
     """Member access expression - Security Critical."""
 
+    __slots__ = ("object", "member")
+
     def __init__(
         self,
         object: Expression,
@@ -526,6 +609,8 @@ class MemberAccess(Expression):
 class Literal(Expression):
     """Base class for literal values."""
 
+    __slots__ = ("value",)
+
     def __init__(self, value: Any, line: int | None = None, column: int | None = None):
         super().__init__(line, column)
         self.value = value
@@ -537,6 +622,8 @@ class Literal(Expression):
 class NumberLiteral(Literal):
     """Numeric literal."""
 
+    __slots__ = ()
+
     def accept(self, visitor):
         return visitor.visit_number_literal(self)
 
@@ -544,6 +631,8 @@ class NumberLiteral(Literal):
 class StringLiteral(Literal):
     """String literal."""
 
+    __slots__ = ()
+
     def accept(self, visitor):
         return visitor.visit_string_literal(self)
 
@@ -551,6 +640,8 @@ class StringLiteral(Literal):
 class BooleanLiteral(Literal):
     """Boolean literal."""
 
+    __slots__ = ()
+
     def accept(self, visitor):
         return visitor.visit_boolean_literal(self)
 
@@ -558,6 +649,8 @@ class BooleanLiteral(Literal):
 class ArrayLiteral(Literal):
     """Array literal."""
 
+    __slots__ = ("elements",)
+
     def __init__(
         self, elements: list[Expression], line: int | None = None, column: int | None = None
     ):
@@ -571,6 +664,8 @@ class ArrayLiteral(Literal):
 class ObjectLiteral(Literal):
     """Object literal."""
 
+    __slots__ = ("properties",)
+
     def __init__(
         self,
         properties: dict[str, Expression],
@@ -590,12 +685,14 @@ class ObjectLiteral(Literal):
 class DestructuringPattern(ASTNode):
     """Base class for destructuring patterns."""
 
-    pass
+    __slots__ = ()
 
 
 class ArrayDestructuring(DestructuringPattern):
     """Array destructuring pattern like [a, b, ...rest]."""
 
+    __slots__ = ("elements", "rest_element")
+
     def __init__(
         self,
         elements: list[str],
@@ -614,6 +711,8 @@ class ArrayDestructuring(DestructuringPattern):
 class ObjectDestructuring(DestructuringPattern):
     """Object destructuring pattern like {a, b: newName, ...rest}."""
 
+    __slots__ = ("properties", "rest_element")
+
     def __init__(
         self,
         properties: dict[str, str],  # {original_key: new_variable_name}
@@ -632,6 +731,8 @@ class ObjectDestructuring(DestructuringPattern):
 class DestructuringAssignment(Statement):
     """Destructuring assignment statement."""
 
+    __slots__ = ("pattern", "value")
+
     def __init__(
         self,
         pattern: DestructuringPattern,
@@ -650,6 +751,8 @@ class DestructuringAssignment(Statement):
 class SpreadElement(Expression):
     """Spread element like ...array or ...object."""
 
+    __slots__ = ("argument",)
+
     def __init__(
         self,
         argument: Expression,
@@ -666,6 +769,8 @@ class SpreadElement(Expression):
 class ArrowFunction(Expression):
     """Arrow function expression like (a, b) => a + b."""
 
+    __slots__ = ("parameters", "body", "is_async")
+
     def __init__(
         self,
         parameters: list["Parameter"],
@@ -686,6 +791,8 @@ class ArrowFunction(Expression):
 class MatchExpression(Expression):
     """Pattern matching expression."""
 
+    __slots__ = ("value", "cases")
+
     def __init__(
         self,
         value: Expression,
@@ -704,6 +811,8 @@ class MatchExpression(Expression):
 class MatchCase(ASTNode):
     """Single case in a match expression."""
 
+    __slots__ = ("pattern", "guard", "body")
+
     def __init__(
         self,
         pattern: Expression,
@@ -724,6 +833,8 @@ class MatchCase(ASTNode):
 class PipelineExpression(Expression):
     """Pipeline expression like value |> func1 |> func2."""
 
+    __slots__ = ("value", "operations")
+
     def __init__(
         self,
         value: Expression,
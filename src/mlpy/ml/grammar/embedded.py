@@ -0,0 +1,188 @@
+"""Run the AST transformer inside the LALR parser.
+
+Building a full parse tree with ``propagate_positions=True`` and then walking
+it again with ``MLTransformer.transform`` allocates a ``Tree`` and a ``Meta``
+per rule and visits every node twice. ``EmbeddedTransformer`` is passed to
+Lark as its ``transformer``, so ``MLTransformer`` callbacks run as rules
+reduce and AST nodes are built directly on the parser's value stack.
+
+Lark does not support ``@v_args(meta=True)`` or position propagation for
+embedded transformers, so positions are tracked here: each reduction records
+the span of its result, taken from its first and last positioned children
+before Lark filters out punctuation. This reproduces the line and column that
+``propagate_positions`` would have given the rule.
+"""
+
+from collections.abc import Callable
+from operator import itemgetter
+from typing import Any
+
+from .lark_runtime import GrammarError, Lark, Meta, Rule, Token, Tree, VisitError
+from .transformer import MLTransformer
+
+# (result, line, column, end_line, end_column); the result is kept alive so its id stays unique
+_Span = tuple[Any, int, int, int, int]
+
+
+_first_child = itemgetter(0)
+
+
+def _passes_child_through(rule: Rule, keep_all_tokens: bool) -> bool:
+    """Whether a rule is an inlined ``?rule`` step that always returns its only child."""
+    if not rule.options.expand1 or rule.alias or len(rule.expansion) != 1:
+        return False
+
+    symbol = rule.expansion[0]
+    if symbol.is_term:
+        return keep_all_tokens or not symbol.filter_out
+    return not symbol.name.startswith("_")  # ``_rule`` children are spliced in
+
+
+class EmbeddedTransformer:
+    """Adapter exposing ``MLTransformer`` rule callbacks to an LALR parser.
+
+    Not thread-safe: a parser built with it must not parse concurrently.
+    """
+
+    def __init__(self, transformer: MLTransformer | None = None):
+        """Initialize the adapter around a transformer instance."""
+        self.transformer = transformer or MLTransformer()
+        self._spans: dict[int, _Span] = {}
+        self._children: list = []
+        self._token_callbacks: dict[str, Callable[[Token], Any] | None] = {}
+
+    def __getattr__(self, name: str) -> Callable[[list], Any]:
+        """Rule callback for Lark; terminals are converted inside rule callbacks."""
+        # Lark also looks up terminal names (upper case) as lexer callbacks,
+        # which must return tokens, so only rule names are exposed
+        if not name[:1].islower() or not hasattr(self.transformer, name):
+            raise AttributeError(name)
+
+        method = getattr(self.transformer, name)
+        wrapper = getattr(method, "visit_wrapper", None)
+
+        def callback(children: list) -> Any:
+            children = self._convert_tokens(children)
+            try:
+                if wrapper is not None:
+                    return wrapper(method, name, children, self._meta())
+                return method(children)
+            except GrammarError:
+                raise
+            except Exception as e:
+                raise VisitError(name, Tree(name, children), e) from e
+
+        callback.__name__ = name
+        return callback
+
+    def __default__(self, data: str, children: list, meta: Any) -> Tree:
+        """Rules without a transformer method stay trees, as with ``transform``."""
+        return Tree(data, self._convert_tokens(children))
+
+    def install(self, parser: Lark) -> None:
+        """Wrap the parser's rule callbacks with span tracking."""
+        keep_all_tokens = parser.options.keep_all_tokens
+        callbacks = parser._callbacks
+
+        for rule, callback in list(callbacks.items()):
+            if not isinstance(rule, Rule):
+                continue
+
+            # The parser looks up goto states by this name after every reduction;
+            # a Token key makes each lookup call Token.__eq__ in Python
+            rule.origin.name = str(rule.origin.name)
+
+            if _passes_child_through(rule, keep_all_tokens):
+                # Most reductions are these precedence-chain steps; skip the Python frames
+                callbacks[rule] = _first_child
+            else:
+                callbacks[rule] = self._track_span(callback)
+
+    def reset(self) -> None:
+        """Drop the spans recorded by the last parse."""
+        self._spans.clear()
+        self._children = []
+
+    def _track_span(self, callback: Callable[[list], Any]) -> Callable[[list], Any]:
+        """Wrap one Lark rule callback, which receives the unfiltered children."""
+        spans = self._spans
+        span_of = self._span_of
+
+        def reduce(children: list) -> Any:
+            self._children = children
+            result = callback(children)
+
+            # Single-child chains (``?rule``) pass their child through unchanged
+            if result is None or (len(children) == 1 and result is children[0]):
+                return result
+
+            span = span_of(children)
+            if span is not None:
+                spans[id(result)] = (result, *span)
+            return result
+
+        return reduce
+
+    def _span_of(self, children: list) -> tuple[int, int, int, int] | None:
+        """(line, column, end_line, end_column) covered by a rule's children."""
+        spans = self._spans
+        start = end = None
+
+        for child in children:
+            if isinstance(child, Token):
+                if child.line is not None:
+                    start = (child.line, child.column)
+                    break
+            elif id(child) in spans:
+                start = spans[id(child)][1:3]
+                break
+        else:
+            return None
+
+        for child in reversed(children):
+            if isinstance(child, Token):
+                if child.line is not None:
+                    end = (child.end_line, child.end_column)
+                    break
+            elif id(child) in spans:
+                end = spans[id(child)][3:5]
+                break
+
+        return (*start, *end)
+
+    def _meta(self) -> Meta:
+        """Meta for the rule being reduced, as ``propagate_positions`` would set it."""
+        meta = Meta()
+        span = self._span_of(self._children)
+        if span is not None:
+            meta.line, meta.column, meta.end_line, meta.end_column = span
+            meta.empty = False
+        return meta
+
+    def _convert_tokens(self, children: list) -> list:
+        """Apply the transformer's terminal callbacks (``IDENTIFIER``, ``NUMBER``...)."""
+        converted = None
+
+        for i, child in enumerate(children):
+            if not isinstance(child, Token):
+                continue
+
+            token_type = child.type
+            try:
+                convert = self._token_callbacks[token_type]
+            except KeyError:
+                convert = getattr(self.transformer, token_type, None)
+                self._token_callbacks[token_type] = convert
+            if convert is None:
+                continue
+
+            if converted is None:
+                converted = list(children)
+            try:
+                converted[i] = convert(child)
+            except GrammarError:
+                raise
+            except Exception as e:
+                raise VisitError(token_type, child, e) from e
+
+        return children if converted is None else converted
@@ -0,0 +1,108 @@
+"""Lark runtime classes shared by the parser and the AST transformer.
+
+``scripts/compile_grammar.py`` generates ``ml_parser_standalone.py``: Lark's
+LALR runtime with the ML parse tables embedded as Python literals, stamped
+with the hash of the grammar files it was generated from. When that hash
+matches ``ml.lark`` and ``advanced_constructs.lark`` on disk, the parser is
+built from the standalone module and the ``lark`` package is never imported.
+Otherwise (the grammar was edited, the module was not generated, or
+``MLPY_STANDALONE_PARSER=0``) everything comes from ``lark`` as before.
+
+The standalone module defines its own ``Token``, ``Tree``, ``Transformer``
+and exception classes, so the transformer, parser and language server import
+them from here rather than from ``lark`` to keep isinstance checks and
+``except`` clauses matching whichever runtime is in use.
+"""
+
+import hashlib
+import os
+import re
+from pathlib import Path
+
+GRAMMAR_DIR = Path(__file__).parent
+GRAMMAR_FILES = ("ml.lark", "advanced_constructs.lark")
+STANDALONE_PATH = GRAMMAR_DIR / "ml_parser_standalone.py"
+
+_HASH_LINE = re.compile(r'^GRAMMAR_HASH = "([0-9a-f]{64})"$', re.MULTILINE)
+
+
+def grammar_source_hash() -> str:
+    """SHA-256 of the grammar files the parse tables are generated from."""
+    digest = hashlib.sha256()
+    for name in GRAMMAR_FILES:
+        path = GRAMMAR_DIR / name
+        if path.exists():
+            digest.update(name.encode())
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def standalone_hash(path: Path = STANDALONE_PATH) -> str | None:
+    """Grammar hash a standalone module was generated from, read without importing it."""
+    try:
+        with path.open(encoding="utf-8") as f:
+            header = f.read(2048)
+    except OSError:
+        return None
+    match = _HASH_LINE.search(header)
+    return match.group(1) if match else None
+
+
+def standalone_is_current() -> bool:
+    """Whether the standalone parser module exists and matches the grammar files."""
+    if os.environ.get("MLPY_STANDALONE_PARSER", "1").lower() in ("0", "false", "no", "off"):
+        return False
+    return standalone_hash() == grammar_source_hash()
+
+
+STANDALONE = standalone_is_current()
+
+if STANDALONE:
+    from .ml_parser_standalone import (
+        GrammarError,
+        Lark,
+        Lark_StandAlone,
+        LarkError,
+        Meta,
+        Rule,
+        Token,
+        Transformer,
+        Tree,
+        UnexpectedInput,
+        UnexpectedToken,
+        VisitError,
+        v_args,
+    )
+else:
+    from lark import Lark, Token, Transformer, Tree, v_args
+    from lark.exceptions import (
+        GrammarError,
+        LarkError,
+        UnexpectedInput,
+        UnexpectedToken,
+        VisitError,
+    )
+    from lark.grammar import Rule
+    from lark.tree import Meta
+
+    Lark_StandAlone = None
+
+__all__ = [
+    "STANDALONE",
+    "GrammarError",
+    "Lark",
+    "Lark_StandAlone",
+    "LarkError",
+    "Meta",
+    "Rule",
+    "Token",
+    "Transformer",
+    "Tree",
+    "UnexpectedInput",
+    "UnexpectedToken",
+    "VisitError",
+    "grammar_source_hash",
+    "standalone_hash",
+    "standalone_is_current",
+    "v_args",
+]
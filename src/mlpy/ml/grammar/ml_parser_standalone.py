@@ -0,0 +1,3583 @@
+"""Standalone LALR parser for the ML grammar.
+
+Generated by scripts/compile_grammar.py from ml.lark; do not edit. Used by
+mlpy.ml.grammar.lark_runtime while GRAMMAR_HASH matches the grammar files.
+"""
+# fmt: off
+# ruff: noqa
+# mypy: ignore-errors
+
+GRAMMAR_HASH = "f25f61933a7f0165f80e2eba3d5fe5391553de4fda2f4dca8b3e8d6034a7bec1"
+
+# The file was automatically generated by Lark v1.3.1
+__version__ = "1.3.1"
+
+#
+#
+#   Lark Stand-alone Generator Tool
+# ----------------------------------
+# Generates a stand-alone LALR(1) parser
+#
+# Git:    https://github.com/erezsh/lark
+# Author: Erez Shinan (erezshin@gmail.com)
+#
+#
+#    >>> LICENSE
+#
+#    This tool and its generated code use a separate license from Lark,
+#    and are subject to the terms of the Mozilla Public License, v. 2.0.
+#    If a copy of the MPL was not distributed with this
+#    file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+#    If you wish to purchase a commercial license for this tool and its
+#    generated code, you may contact me via email or otherwise.
+#
+#    If MPL2 is incompatible with your free or open-source project,
+#    contact me and we'll work it out.
+#
+#
+
+from copy import deepcopy
+from abc import ABC, abstractmethod
+from types import ModuleType
+from typing import (
+    TypeVar, Generic, Type, Tuple, List, Dict, Iterator, Collection, Callable, Optional, FrozenSet, Any,
+    Union, Iterable, IO, TYPE_CHECKING, overload, Sequence,
+    Pattern as REPattern, ClassVar, Set, Mapping
+)
+
+
+class LarkError(Exception):
+    pass
+
+
+class ConfigurationError(LarkError, ValueError):
+    pass
+
+
+def assert_config(value, options: Collection, msg='Got %r, expected one of %s'):
+    if value not in options:
+        raise ConfigurationError(msg % (value, options))
+
+
+class GrammarError(LarkError):
+    pass
+
+
+class ParseError(LarkError):
+    pass
+
+
+class LexError(LarkError):
+    pass
+
+T = TypeVar('T')
+
+class UnexpectedInput(LarkError):
+    #--
+    line: int
+    column: int
+    pos_in_stream = None
+    state: Any
+    _terminals_by_name = None
+    interactive_parser: 'InteractiveParser'
+
+    def get_context(self, text: str, span: int=40) -> str:
+        #--
+        pos = self.pos_in_stream or 0
+        start = max(pos - span, 0)
+        end = pos + span
+        if not isinstance(text, bytes):
+            before = text[start:pos].rsplit('\n', 1)[-1]
+            after = text[pos:end].split('\n', 1)[0]
+            return before + after + '\n' + ' ' * len(before.expandtabs()) + '^\n'
+        else:
+            before = text[start:pos].rsplit(b'\n', 1)[-1]
+            after = text[pos:end].split(b'\n', 1)[0]
+            return (before + after + b'\n' + b' ' * len(before.expandtabs()) + b'^\n').decode("ascii", "backslashreplace")
+
+    def match_examples(self, parse_fn: 'Callable[[str], Tree]',
+                             examples: Union[Mapping[T, Iterable[str]], Iterable[Tuple[T, Iterable[str]]]],
+                             token_type_match_fallback: bool=False,
+                             use_accepts: bool=True
+                         ) -> Optional[T]:
+        #--
+        assert self.state is not None, "Not supported for this exception"
+
+        if isinstance(examples, Mapping):
+            examples = examples.items()
+
+        candidate = (None, False)
+        for i, (label, example) in enumerate(examples):
+            assert not isinstance(example, str), "Expecting a list"
+
+            for j, malformed in enumerate(example):
+                try:
+                    parse_fn(malformed)
+                except UnexpectedInput as ut:
+                    if ut.state == self.state:
+                        if (
+                            use_accepts
+                            and isinstance(self, UnexpectedToken)
+                            and isinstance(ut, UnexpectedToken)
+                            and ut.accepts != self.accepts
+                        ):
+                            logger.debug("Different accepts with same state[%d]: %s != %s at example [%s][%s]" %
+                                         (self.state, self.accepts, ut.accepts, i, j))
+                            continue
+                        if (
+                            isinstance(self, (UnexpectedToken, UnexpectedEOF))
+                            and isinstance(ut, (UnexpectedToken, UnexpectedEOF))
+                        ):
+                            if ut.token == self.token:  ##
+
+                                logger.debug("Exact Match at example [%s][%s]" % (i, j))
+                                return label
+
+                            if token_type_match_fallback:
+                                ##
+
+                                if (ut.token.type == self.token.type) and not candidate[-1]:
+                                    logger.debug("Token Type Fallback at example [%s][%s]" % (i, j))
+                                    candidate = label, True
+
+                        if candidate[0] is None:
+                            logger.debug("Same State match at example [%s][%s]" % (i, j))
+                            candidate = label, False
+
+        return candidate[0]
+
+    def _format_expected(self, expected):
+        if self._terminals_by_name:
+            d = self._terminals_by_name
+            expected = [d[t_name].user_repr() if t_name in d else t_name for t_name in expected]
+        return "Expected one of: \n\t* %s\n" % '\n\t* '.join(expected)
+
+
+class UnexpectedEOF(ParseError, UnexpectedInput):
+    #--
+    expected: 'List[Token]'
+
+    def __init__(self, expected, state=None, terminals_by_name=None):
+        super(UnexpectedEOF, self).__init__()
+
+        self.expected = expected
+        self.state = state
+        from .lexer import Token
+        self.token = Token("<EOF>", "")  ##
+
+        self.pos_in_stream = -1
+        self.line = -1
+        self.column = -1
+        self._terminals_by_name = terminals_by_name
+
+
+    def __str__(self):
+        message = "Unexpected end-of-input. "
+        message += self._format_expected(self.expected)
+        return message
+
+
+class UnexpectedCharacters(LexError, UnexpectedInput):
+    #--
+
+    allowed: Set[str]
+    considered_tokens: Set[Any]
+
+    def __init__(self, seq, lex_pos, line, column, allowed=None, considered_tokens=None, state=None, token_history=None,
+                 terminals_by_name=None, considered_rules=None):
+        super(UnexpectedCharacters, self).__init__()
+
+        ##
+
+        self.line = line
+        self.column = column
+        self.pos_in_stream = lex_pos
+        self.state = state
+        self._terminals_by_name = terminals_by_name
+
+        self.allowed = allowed
+        self.considered_tokens = considered_tokens
+        self.considered_rules = considered_rules
+        self.token_history = token_history
+
+        if isinstance(seq, bytes):
+            self.char = seq[lex_pos:lex_pos + 1].decode("ascii", "backslashreplace")
+        else:
+            self.char = seq[lex_pos]
+        self._context = self.get_context(seq)
+
+
+    def __str__(self):
+        message = "No terminal matches '%s' in the current parser context, at line %d col %d" % (self.char, self.line, self.column)
+        message += '\n\n' + self._context
+        if self.allowed:
+            message += self._format_expected(self.allowed)
+        if self.token_history:
+            message += '\nPrevious tokens: %s\n' % ', '.join(repr(t) for t in self.token_history)
+        return message
+
+
+class UnexpectedToken(ParseError, UnexpectedInput):
+    #--
+
+    expected: Set[str]
+    considered_rules: Set[str]
+
+    def __init__(self, token, expected, considered_rules=None, state=None, interactive_parser=None, terminals_by_name=None, token_history=None):
+        super(UnexpectedToken, self).__init__()
+
+        ##
+
+        self.line = getattr(token, 'line', '?')
+        self.column = getattr(token, 'column', '?')
+        self.pos_in_stream = getattr(token, 'start_pos', None)
+        self.state = state
+
+        self.token = token
+        self.expected = expected  ##
+
+        self._accepts = NO_VALUE
+        self.considered_rules = considered_rules
+        self.interactive_parser = interactive_parser
+        self._terminals_by_name = terminals_by_name
+        self.token_history = token_history
+
+
+    @property
+    def accepts(self) -> Set[str]:
+        if self._accepts is NO_VALUE:
+            self._accepts = self.interactive_parser and self.interactive_parser.accepts()
+        return self._accepts
+
+    def __str__(self):
+        message = ("Unexpected token %r at line %s, column %s.\n%s"
+                   % (self.token, self.line, self.column, self._format_expected(self.accepts or self.expected)))
+        if self.token_history:
+            message += "Previous tokens: %r\n" % self.token_history
+
+        return message
+
+
+
+class VisitError(LarkError):
+    #--
+
+    obj: 'Union[Tree, Token]'
+    orig_exc: Exception
+
+    def __init__(self, rule, obj, orig_exc):
+        message = 'Error trying to process rule "%s":\n\n%s' % (rule, orig_exc)
+        super(VisitError, self).__init__(message)
+
+        self.rule = rule
+        self.obj = obj
+        self.orig_exc = orig_exc
+
+
+class MissingVariableError(LarkError):
+    pass
+
+
+import sys, re
+import logging
+from dataclasses import dataclass
+from typing import Generic, AnyStr
+
+logger: logging.Logger = logging.getLogger("lark")
+logger.addHandler(logging.StreamHandler())
+##
+
+##
+
+logger.setLevel(logging.CRITICAL)
+
+
+NO_VALUE = object()
+
+T = TypeVar("T")
+
+
+def classify(seq: Iterable, key: Optional[Callable] = None, value: Optional[Callable] = None) -> Dict:
+    d: Dict[Any, Any] = {}
+    for item in seq:
+        k = key(item) if (key is not None) else item
+        v = value(item) if (value is not None) else item
+        try:
+            d[k].append(v)
+        except KeyError:
+            d[k] = [v]
+    return d
+
+
+def _deserialize(data: Any, namespace: Dict[str, Any], memo: Dict) -> Any:
+    if isinstance(data, dict):
+        if '__type__' in data:  ##
+
+            class_ = namespace[data['__type__']]
+            return class_.deserialize(data, memo)
+        elif '@' in data:
+            return memo[data['@']]
+        return {key:_deserialize(value, namespace, memo) for key, value in data.items()}
+    elif isinstance(data, list):
+        return [_deserialize(value, namespace, memo) for value in data]
+    return data
+
+
+_T = TypeVar("_T", bound="Serialize")
+
+class Serialize:
+    #--
+
+    def memo_serialize(self, types_to_memoize: List) -> Any:
+        memo = SerializeMemoizer(types_to_memoize)
+        return self.serialize(memo), memo.serialize()
+
+    def serialize(self, memo = None) -> Dict[str, Any]:
+        if memo and memo.in_types(self):
+            return {'@': memo.memoized.get(self)}
+
+        fields = getattr(self, '__serialize_fields__')
+        res = {f: _serialize(getattr(self, f), memo) for f in fields}
+        res['__type__'] = type(self).__name__
+        if hasattr(self, '_serialize'):
+            self._serialize(res, memo)
+        return res
+
+    @classmethod
+    def deserialize(cls: Type[_T], data: Dict[str, Any], memo: Dict[int, Any]) -> _T:
+        namespace = getattr(cls, '__serialize_namespace__', [])
+        namespace = {c.__name__:c for c in namespace}
+
+        fields = getattr(cls, '__serialize_fields__')
+
+        if '@' in data:
+            return memo[data['@']]
+
+        inst = cls.__new__(cls)
+        for f in fields:
+            try:
+                setattr(inst, f, _deserialize(data[f], namespace, memo))
+            except KeyError as e:
+                raise KeyError("Cannot find key for class", cls, e)
+
+        if hasattr(inst, '_deserialize'):
+            inst._deserialize()
+
+        return inst
+
+
+class SerializeMemoizer(Serialize):
+    #--
+
+    __serialize_fields__ = 'memoized',
+
+    def __init__(self, types_to_memoize: List) -> None:
+        self.types_to_memoize = tuple(types_to_memoize)
+        self.memoized = Enumerator()
+
+    def in_types(self, value: Serialize) -> bool:
+        return isinstance(value, self.types_to_memoize)
+
+    def serialize(self) -> Dict[int, Any]:  ##
+
+        return _serialize(self.memoized.reversed(), None)
+
+    @classmethod
+    def deserialize(cls, data: Dict[int, Any], namespace: Dict[str, Any], memo: Dict[Any, Any]) -> Dict[int, Any]:  ##
+
+        return _deserialize(data, namespace, memo)
+
+
+try:
+    import regex
+    _has_regex = True
+except ImportError:
+    _has_regex = False
+
+if sys.version_info >= (3, 11):
+    import re._parser as sre_parse
+    import re._constants as sre_constants
+else:
+    import sre_parse
+    import sre_constants
+
+categ_pattern = re.compile(r'\\p{[A-Za-z_]+}')
+
+def get_regexp_width(expr: str) -> Union[Tuple[int, int], List[int]]:
+    if _has_regex:
+        ##
+
+        ##
+
+        ##
+
+        regexp_final = re.sub(categ_pattern, 'A', expr)
+    else:
+        if re.search(categ_pattern, expr):
+            raise ImportError('`regex` module must be installed in order to use Unicode categories.', expr)
+        regexp_final = expr
+    try:
+        ##
+
+        return [int(x) for x in sre_parse.parse(regexp_final).getwidth()]
+    except sre_constants.error:
+        if not _has_regex:
+            raise ValueError(expr)
+        else:
+            ##
+
+            ##
+
+            c = regex.compile(regexp_final)
+            ##
+
+            ##
+
+            MAXWIDTH = getattr(sre_parse, "MAXWIDTH", sre_constants.MAXREPEAT)
+            if c.match('') is None:
+                ##
+
+                return 1, int(MAXWIDTH)
+            else:
+                return 0, int(MAXWIDTH)
+
+
+@dataclass(frozen=True)
+class TextSlice(Generic[AnyStr]):
+    #--
+    text: AnyStr
+    start: int
+    end: int
+
+    def __post_init__(self):
+        if not isinstance(self.text, (str, bytes)):
+            raise TypeError("text must be str or bytes")
+
+        if self.start < 0:
+            object.__setattr__(self, 'start', self.start + len(self.text))
+            assert self.start >=0
+
+        if self.end is None:
+            object.__setattr__(self, 'end', len(self.text))
+        elif self.end < 0:
+            object.__setattr__(self, 'end', self.end + len(self.text))
+            assert self.end <= len(self.text)
+
+    @classmethod
+    def cast_from(cls, text: 'TextOrSlice') -> 'TextSlice[AnyStr]':
+        if isinstance(text, TextSlice):
+            return text
+
+        return cls(text, 0, len(text))
+
+    def is_complete_text(self):
+        return self.start == 0 and self.end == len(self.text)
+
+    def __len__(self):
+        return self.end - self.start
+
+    def count(self, substr: AnyStr):
+        return self.text.count(substr, self.start, self.end)
+
+    def rindex(self, substr: AnyStr):
+        return self.text.rindex(substr, self.start, self.end)
+
+
+TextOrSlice = Union[AnyStr, 'TextSlice[AnyStr]']
+LarkInput = Union[AnyStr, TextSlice[AnyStr], Any]
+
+
+
+class Meta:
+
+    empty: bool
+    line: int
+    column: int
+    start_pos: int
+    end_line: int
+    end_column: int
+    end_pos: int
+    orig_expansion: 'List[TerminalDef]'
+    match_tree: bool
+
+    def __init__(self):
+        self.empty = True
+
+
+_Leaf_T = TypeVar("_Leaf_T")
+Branch = Union[_Leaf_T, 'Tree[_Leaf_T]']
+
+
+class Tree(Generic[_Leaf_T]):
+    #--
+
+    data: str
+    children: 'List[Branch[_Leaf_T]]'
+
+    def __init__(self, data: str, children: 'List[Branch[_Leaf_T]]', meta: Optional[Meta]=None) -> None:
+        self.data = data
+        self.children = children
+        self._meta = meta
+
+    @property
+    def meta(self) -> Meta:
+        if self._meta is None:
+            self._meta = Meta()
+        return self._meta
+
+    def __repr__(self):
+        return 'Tree(%r, %r)' % (self.data, self.children)
+
+    __match_args__ = ("data", "children")
+
+    def _pretty_label(self):
+        return self.data
+
+    def _pretty(self, level, indent_str):
+        yield f'{indent_str*level}{self._pretty_label()}'
+        if len(self.children) == 1 and not isinstance(self.children[0], Tree):
+            yield f'\t{self.children[0]}\n'
+        else:
+            yield '\n'
+            for n in self.children:
+                if isinstance(n, Tree):
+                    yield from n._pretty(level+1, indent_str)
+                else:
+                    yield f'{indent_str*(level+1)}{n}\n'
+
+    def pretty(self, indent_str: str='  ') -> str:
+        #--
+        return ''.join(self._pretty(0, indent_str))
+
+    def __rich__(self, parent:Optional['rich.tree.Tree']=None) -> 'rich.tree.Tree':
+        #--
+        return self._rich(parent)
+
+    def _rich(self, parent):
+        if parent:
+            tree = parent.add(f'[bold]{self.data}[/bold]')
+        else:
+            import rich.tree
+            tree = rich.tree.Tree(self.data)
+
+        for c in self.children:
+            if isinstance(c, Tree):
+                c._rich(tree)
+            else:
+                tree.add(f'[green]{c}[/green]')
+
+        return tree
+
+    def __eq__(self, other):
+        try:
+            return self.data == other.data and self.children == other.children
+        except AttributeError:
+            return False
+
+    def __ne__(self, other):
+        return not (self == other)
+
+    def __hash__(self) -> int:
+        return hash((self.data, tuple(self.children)))
+
+    def iter_subtrees(self) -> 'Iterator[Tree[_Leaf_T]]':
+        #--
+        queue = [self]
+        subtrees = dict()
+        for subtree in queue:
+            subtrees[id(subtree)] = subtree
+            queue += [c for c in reversed(subtree.children)
+                      if isinstance(c, Tree) and id(c) not in subtrees]
+
+        del queue
+        return reversed(list(subtrees.values()))
+
+    def iter_subtrees_topdown(self):
+        #--
+        stack = [self]
+        stack_append = stack.append
+        stack_pop = stack.pop
+        while stack:
+            node = stack_pop()
+            if not isinstance(node, Tree):
+                continue
+            yield node
+            for child in reversed(node.children):
+                stack_append(child)
+
+    def find_pred(self, pred: 'Callable[[Tree[_Leaf_T]], bool]') -> 'Iterator[Tree[_Leaf_T]]':
+        #--
+        return filter(pred, self.iter_subtrees())
+
+    def find_data(self, data: str) -> 'Iterator[Tree[_Leaf_T]]':
+        #--
+        return self.find_pred(lambda t: t.data == data)
+
+
+from functools import wraps, update_wrapper
+from inspect import getmembers, getmro
+
+_Return_T = TypeVar('_Return_T')
+_Return_V = TypeVar('_Return_V')
+_Leaf_T = TypeVar('_Leaf_T')
+_Leaf_U = TypeVar('_Leaf_U')
+_R = TypeVar('_R')
+_FUNC = Callable[..., _Return_T]
+_DECORATED = Union[_FUNC, type]
+
+class _DiscardType:
+    #--
+
+    def __repr__(self):
+        return "lark.visitors.Discard"
+
+Discard = _DiscardType()
+
+##
+
+
+class _Decoratable:
+    #--
+
+    @classmethod
+    def _apply_v_args(cls, visit_wrapper):
+        mro = getmro(cls)
+        assert mro[0] is cls
+        libmembers = {name for _cls in mro[1:] for name, _ in getmembers(_cls)}
+        for name, value in getmembers(cls):
+
+            ##
+
+            if name.startswith('_') or (name in libmembers and name not in cls.__dict__):
+                continue
+            if not callable(value):
+                continue
+
+            ##
+
+            if isinstance(cls.__dict__[name], _VArgsWrapper):
+                continue
+
+            setattr(cls, name, _VArgsWrapper(cls.__dict__[name], visit_wrapper))
+        return cls
+
+    def __class_getitem__(cls, _):
+        return cls
+
+
+class Transformer(_Decoratable, ABC, Generic[_Leaf_T, _Return_T]):
+    #--
+    __visit_tokens__ = True   ##
+
+
+    def __init__(self,  visit_tokens: bool=True) -> None:
+        self.__visit_tokens__ = visit_tokens
+
+    def _call_userfunc(self, tree, new_children=None):
+        ##
+
+        children = new_children if new_children is not None else tree.children
+        try:
+            f = getattr(self, tree.data)
+        except AttributeError:
+            return self.__default__(tree.data, children, tree.meta)
+        else:
+            try:
+                wrapper = getattr(f, 'visit_wrapper', None)
+                if wrapper is not None:
+                    return f.visit_wrapper(f, tree.data, children, tree.meta)
+                else:
+                    return f(children)
+            except GrammarError:
+                raise
+            except Exception as e:
+                raise VisitError(tree.data, tree, e)
+
+    def _call_userfunc_token(self, token):
+        try:
+            f = getattr(self, token.type)
+        except AttributeError:
+            return self.__default_token__(token)
+        else:
+            try:
+                return f(token)
+            except GrammarError:
+                raise
+            except Exception as e:
+                raise VisitError(token.type, token, e)
+
+    def _transform_children(self, children):
+        for c in children:
+            if isinstance(c, Tree):
+                res = self._transform_tree(c)
+            elif self.__visit_tokens__ and isinstance(c, Token):
+                res = self._call_userfunc_token(c)
+            else:
+                res = c
+
+            if res is not Discard:
+                yield res
+
+    def _transform_tree(self, tree):
+        children = list(self._transform_children(tree.children))
+        return self._call_userfunc(tree, children)
+
+    def transform(self, tree: Tree[_Leaf_T]) -> _Return_T:
+        #--
+        res = list(self._transform_children([tree]))
+        if not res:
+            return None     ##
+
+        assert len(res) == 1
+        return res[0]
+
+    def __mul__(
+            self: 'Transformer[_Leaf_T, Tree[_Leaf_U]]',
+            other: 'Union[Transformer[_Leaf_U, _Return_V], TransformerChain[_Leaf_U, _Return_V,]]'
+    ) -> 'TransformerChain[_Leaf_T, _Return_V]':
+        #--
+        return TransformerChain(self, other)
+
+    def __default__(self, data, children, meta):
+        #--
+        return Tree(data, children, meta)
+
+    def __default_token__(self, token):
+        #--
+        return token
+
+
+def merge_transformers(base_transformer=None, **transformers_to_merge):
+    #--
+    if base_transformer is None:
+        base_transformer = Transformer()
+    for prefix, transformer in transformers_to_merge.items():
+        for method_name in dir(transformer):
+            method = getattr(transformer, method_name)
+            if not callable(method):
+                continue
+            if method_name.startswith("_") or method_name == "transform":
+                continue
+            prefixed_method = prefix + "__" + method_name
+            if hasattr(base_transformer, prefixed_method):
+                raise AttributeError("Cannot merge: method '%s' appears more than once" % prefixed_method)
+
+            setattr(base_transformer, prefixed_method, method)
+
+    return base_transformer
+
+
+class InlineTransformer(Transformer):   ##
+
+    def _call_userfunc(self, tree, new_children=None):
+        ##
+
+        children = new_children if new_children is not None else tree.children
+        try:
+            f = getattr(self, tree.data)
+        except AttributeError:
+            return self.__default__(tree.data, children, tree.meta)
+        else:
+            return f(*children)
+
+
+class TransformerChain(Generic[_Leaf_T, _Return_T]):
+
+    transformers: 'Tuple[Union[Transformer, TransformerChain], ...]'
+
+    def __init__(self, *transformers: 'Union[Transformer, TransformerChain]') -> None:
+        self.transformers = transformers
+
+    def transform(self, tree: Tree[_Leaf_T]) -> _Return_T:
+        for t in self.transformers:
+            tree = t.transform(tree)
+        return cast(_Return_T, tree)
+
+    def __mul__(
+            self: 'TransformerChain[_Leaf_T, Tree[_Leaf_U]]',
+            other: 'Union[Transformer[_Leaf_U, _Return_V], TransformerChain[_Leaf_U, _Return_V]]'
+    ) -> 'TransformerChain[_Leaf_T, _Return_V]':
+        return TransformerChain(*self.transformers + (other,))
+
+
+class Transformer_InPlace(Transformer[_Leaf_T, _Return_T]):
+    #--
+    def _transform_tree(self, tree):           ##
+
+        return self._call_userfunc(tree)
+
+    def transform(self, tree: Tree[_Leaf_T]) -> _Return_T:
+        for subtree in tree.iter_subtrees():
+            subtree.children = list(self._transform_children(subtree.children))
+
+        return self._transform_tree(tree)
+
+
+class Transformer_NonRecursive(Transformer[_Leaf_T, _Return_T]):
+    #--
+
+    def transform(self, tree: Tree[_Leaf_T]) -> _Return_T:
+        ##
+
+        rev_postfix = []
+        q: List[Branch[_Leaf_T]] = [tree]
+        while q:
+            t = q.pop()
+            rev_postfix.append(t)
+            if isinstance(t, Tree):
+                q += t.children
+
+        ##
+
+        stack: List = []
+        for x in reversed(rev_postfix):
+            if isinstance(x, Tree):
+                size = len(x.children)
+                if size:
+                    args = stack[-size:]
+                    del stack[-size:]
+                else:
+                    args = []
+
+                res = self._call_userfunc(x, args)
+                if res is not Discard:
+                    stack.append(res)
+
+            elif self.__visit_tokens__ and isinstance(x, Token):
+                res = self._call_userfunc_token(x)
+                if res is not Discard:
+                    stack.append(res)
+            else:
+                stack.append(x)
+
+        result, = stack  ##
+
+        ##
+
+        ##
+
+        ##
+
+        return cast(_Return_T, result)
+
+
+class Transformer_InPlaceRecursive(Transformer[_Leaf_T, _Return_T]):
+    #--
+    def _transform_tree(self, tree):
+        tree.children = list(self._transform_children(tree.children))
+        return self._call_userfunc(tree)
+
+
+##
+
+
+class VisitorBase:
+    def _call_userfunc(self, tree):
+        return getattr(self, tree.data, self.__default__)(tree)
+
+    def __default__(self, tree):
+        #--
+        return tree
+
+    def __class_getitem__(cls, _):
+        return cls
+
+
+class Visitor(VisitorBase, ABC, Generic[_Leaf_T]):
+    #--
+
+    def visit(self, tree: Tree[_Leaf_T]) -> Tree[_Leaf_T]:
+        #--
+        for subtree in tree.iter_subtrees():
+            self._call_userfunc(subtree)
+        return tree
+
+    def visit_topdown(self, tree: Tree[_Leaf_T]) -> Tree[_Leaf_T]:
+        #--
+        for subtree in tree.iter_subtrees_topdown():
+            self._call_userfunc(subtree)
+        return tree
+
+
+class Visitor_Recursive(VisitorBase, Generic[_Leaf_T]):
+    #--
+
+    def visit(self, tree: Tree[_Leaf_T]) -> Tree[_Leaf_T]:
+        #--
+        for child in tree.children:
+            if isinstance(child, Tree):
+                self.visit(child)
+
+        self._call_userfunc(tree)
+        return tree
+
+    def visit_topdown(self,tree: Tree[_Leaf_T]) -> Tree[_Leaf_T]:
+        #--
+        self._call_userfunc(tree)
+
+        for child in tree.children:
+            if isinstance(child, Tree):
+                self.visit_topdown(child)
+
+        return tree
+
+
+class Interpreter(_Decoratable, ABC, Generic[_Leaf_T, _Return_T]):
+    #--
+
+    def visit(self, tree: Tree[_Leaf_T]) -> _Return_T:
+        ##
+
+        ##
+
+        ##
+
+        return self._visit_tree(tree)
+
+    def _visit_tree(self, tree: Tree[_Leaf_T]):
+        f = getattr(self, tree.data)
+        wrapper = getattr(f, 'visit_wrapper', None)
+        if wrapper is not None:
+            return f.visit_wrapper(f, tree.data, tree.children, tree.meta)
+        else:
+            return f(tree)
+
+    def visit_children(self, tree: Tree[_Leaf_T]) -> List:
+        return [self._visit_tree(child) if isinstance(child, Tree) else child
+                for child in tree.children]
+
+    def __getattr__(self, name):
+        return self.__default__
+
+    def __default__(self, tree):
+        return self.visit_children(tree)
+
+
+_InterMethod = Callable[[Type[Interpreter], _Return_T], _R]
+
+def visit_children_decor(func: _InterMethod) -> _InterMethod:
+    #--
+    @wraps(func)
+    def inner(cls, tree):
+        values = cls.visit_children(tree)
+        return func(cls, values)
+    return inner
+
+##
+
+
+def _apply_v_args(obj, visit_wrapper):
+    try:
+        _apply = obj._apply_v_args
+    except AttributeError:
+        return _VArgsWrapper(obj, visit_wrapper)
+    else:
+        return _apply(visit_wrapper)
+
+
+class _VArgsWrapper:
+    #--
+    base_func: Callable
+
+    def __init__(self, func: Callable, visit_wrapper: Callable[[Callable, str, list, Any], Any]):
+        if isinstance(func, _VArgsWrapper):
+            func = func.base_func
+        self.base_func = func
+        self.visit_wrapper = visit_wrapper
+        update_wrapper(self, func)
+
+    def __call__(self, *args, **kwargs):
+        return self.base_func(*args, **kwargs)
+
+    def __get__(self, instance, owner=None):
+        try:
+            ##
+
+            ##
+
+            g = type(self.base_func).__get__
+        except AttributeError:
+            return self
+        else:
+            return _VArgsWrapper(g(self.base_func, instance, owner), self.visit_wrapper)
+
+    def __set_name__(self, owner, name):
+        try:
+            f = type(self.base_func).__set_name__
+        except AttributeError:
+            return
+        else:
+            f(self.base_func, owner, name)
+
+
+def _vargs_inline(f, _data, children, _meta):
+    return f(*children)
+def _vargs_meta_inline(f, _data, children, meta):
+    return f(meta, *children)
+def _vargs_meta(f, _data, children, meta):
+    return f(meta, children)
+def _vargs_tree(f, data, children, meta):
+    return f(Tree(data, children, meta))
+
+
+def v_args(inline: bool = False, meta: bool = False, tree: bool = False, wrapper: Optional[Callable] = None) -> Callable[[_DECORATED], _DECORATED]:
+    #--
+    if tree and (meta or inline):
+        raise ValueError("Visitor functions cannot combine 'tree' with 'meta' or 'inline'.")
+
+    func = None
+    if meta:
+        if inline:
+            func = _vargs_meta_inline
+        else:
+            func = _vargs_meta
+    elif inline:
+        func = _vargs_inline
+    elif tree:
+        func = _vargs_tree
+
+    if wrapper is not None:
+        if func is not None:
+            raise ValueError("Cannot use 'wrapper' along with 'tree', 'meta' or 'inline'.")
+        func = wrapper
+
+    def _visitor_args_dec(obj):
+        return _apply_v_args(obj, func)
+    return _visitor_args_dec
+
+
+
+TOKEN_DEFAULT_PRIORITY = 0
+
+
+class Symbol(Serialize):
+    __slots__ = ('name',)
+
+    name: str
+    is_term: ClassVar[bool] = NotImplemented
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __eq__(self, other):
+        if not isinstance(other, Symbol):
+            return NotImplemented
+        return self.is_term == other.is_term and self.name == other.name
+
+    def __ne__(self, other):
+        return not (self == other)
+
+    def __hash__(self):
+        return hash(self.name)
+
+    def __repr__(self):
+        return '%s(%r)' % (type(self).__name__, self.name)
+
+    fullrepr = property(__repr__)
+
+    def renamed(self, f):
+        return type(self)(f(self.name))
+
+
+class Terminal(Symbol):
+    __serialize_fields__ = 'name', 'filter_out'
+
+    is_term: ClassVar[bool] = True
+
+    def __init__(self, name: str, filter_out: bool = False) -> None:
+        self.name = name
+        self.filter_out = filter_out
+
+    @property
+    def fullrepr(self):
+        return '%s(%r, %r)' % (type(self).__name__, self.name, self.filter_out)
+
+    def renamed(self, f):
+        return type(self)(f(self.name), self.filter_out)
+
+
+class NonTerminal(Symbol):
+    __serialize_fields__ = 'name',
+
+    is_term: ClassVar[bool] = False
+
+    def serialize(self, memo=None) -> Dict[str, Any]:
+        ##
+
+        ##
+
+        return {'name': str(self.name), '__type__': 'NonTerminal'}
+
+
+class RuleOptions(Serialize):
+    __serialize_fields__ = 'keep_all_tokens', 'expand1', 'priority', 'template_source', 'empty_indices'
+
+    keep_all_tokens: bool
+    expand1: bool
+    priority: Optional[int]
+    template_source: Optional[str]
+    empty_indices: Tuple[bool, ...]
+
+    def __init__(self, keep_all_tokens: bool=False, expand1: bool=False, priority: Optional[int]=None, template_source: Optional[str]=None, empty_indices: Tuple[bool, ...]=()) -> None:
+        self.keep_all_tokens = keep_all_tokens
+        self.expand1 = expand1
+        self.priority = priority
+        self.template_source = template_source
+        self.empty_indices = empty_indices
+
+    def __repr__(self):
+        return 'RuleOptions(%r, %r, %r, %r)' % (
+            self.keep_all_tokens,
+            self.expand1,
+            self.priority,
+            self.template_source
+        )
+
+
+class Rule(Serialize):
+    #--
+    __slots__ = ('origin', 'expansion', 'alias', 'options', 'order', '_hash')
+
+    __serialize_fields__ = 'origin', 'expansion', 'order', 'alias', 'options'
+    __serialize_namespace__ = Terminal, NonTerminal, RuleOptions
+
+    origin: NonTerminal
+    expansion: Sequence[Symbol]
+    order: int
+    alias: Optional[str]
+    options: RuleOptions
+    _hash: int
+
+    def __init__(self, origin: NonTerminal, expansion: Sequence[Symbol],
+                 order: int=0, alias: Optional[str]=None, options: Optional[RuleOptions]=None):
+        self.origin = origin
+        self.expansion = expansion
+        self.alias = alias
+        self.order = order
+        self.options = options or RuleOptions()
+        self._hash = hash((self.origin, tuple(self.expansion)))
+
+    def _deserialize(self):
+        self._hash = hash((self.origin, tuple(self.expansion)))
+
+    def __str__(self):
+        return '<%s : %s>' % (self.origin.name, ' '.join(x.name for x in self.expansion))
+
+    def __repr__(self):
+        return 'Rule(%r, %r, %r, %r)' % (self.origin, self.expansion, self.alias, self.options)
+
+    def __hash__(self):
+        return self._hash
+
+    def __eq__(self, other):
+        if not isinstance(other, Rule):
+            return False
+        return self.origin == other.origin and self.expansion == other.expansion
+
+
+
+from contextlib import suppress
+from copy import copy
+
+try:  ##
+
+    has_interegular = bool(interegular)
+except NameError:
+    has_interegular = False
+
+class Pattern(Serialize, ABC):
+    #--
+
+    value: str
+    flags: Collection[str]
+    raw: Optional[str]
+    type: ClassVar[str]
+
+    def __init__(self, value: str, flags: Collection[str] = (), raw: Optional[str] = None) -> None:
+        self.value = value
+        self.flags = frozenset(flags)
+        self.raw = raw
+
+    def __repr__(self):
+        return repr(self.to_regexp())
+
+    ##
+
+    def __hash__(self):
+        return hash((type(self), self.value, self.flags))
+
+    def __eq__(self, other):
+        return type(self) == type(other) and self.value == other.value and self.flags == other.flags
+
+    @abstractmethod
+    def to_regexp(self) -> str:
+        raise NotImplementedError()
+
+    @property
+    @abstractmethod
+    def min_width(self) -> int:
+        raise NotImplementedError()
+
+    @property
+    @abstractmethod
+    def max_width(self) -> int:
+        raise NotImplementedError()
+
+    def _get_flags(self, value):
+        for f in self.flags:
+            value = ('(?%s:%s)' % (f, value))
+        return value
+
+
+class PatternStr(Pattern):
+    __serialize_fields__ = 'value', 'flags', 'raw'
+
+    type: ClassVar[str] = "str"
+
+    def to_regexp(self) -> str:
+        return self._get_flags(re.escape(self.value))
+
+    @property
+    def min_width(self) -> int:
+        return len(self.value)
+
+    @property
+    def max_width(self) -> int:
+        return len(self.value)
+
+
+class PatternRE(Pattern):
+    __serialize_fields__ = 'value', 'flags', 'raw', '_width'
+
+    type: ClassVar[str] = "re"
+
+    def to_regexp(self) -> str:
+        return self._get_flags(self.value)
+
+    _width = None
+    def _get_width(self):
+        if self._width is None:
+            self._width = get_regexp_width(self.to_regexp())
+        return self._width
+
+    @property
+    def min_width(self) -> int:
+        return self._get_width()[0]
+
+    @property
+    def max_width(self) -> int:
+        return self._get_width()[1]
+
+
+class TerminalDef(Serialize):
+    #--
+    __serialize_fields__ = 'name', 'pattern', 'priority'
+    __serialize_namespace__ = PatternStr, PatternRE
+
+    name: str
+    pattern: Pattern
+    priority: int
+
+    def __init__(self, name: str, pattern: Pattern, priority: int = TOKEN_DEFAULT_PRIORITY) -> None:
+        assert isinstance(pattern, Pattern), pattern
+        self.name = name
+        self.pattern = pattern
+        self.priority = priority
+
+    def __repr__(self):
+        return '%s(%r, %r)' % (type(self).__name__, self.name, self.pattern)
+
+    def user_repr(self) -> str:
+        if self.name.startswith('__'):  ##
+
+            return self.pattern.raw or self.name
+        else:
+            return self.name
+
+_T = TypeVar('_T', bound="Token")
+
+class Token(str):
+    #--
+    __slots__ = ('type', 'start_pos', 'value', 'line', 'column', 'end_line', 'end_column', 'end_pos')
+
+    __match_args__ = ('type', 'value')
+
+    type: str
+    start_pos: Optional[int]
+    value: Any
+    line: Optional[int]
+    column: Optional[int]
+    end_line: Optional[int]
+    end_column: Optional[int]
+    end_pos: Optional[int]
+
+
+    @overload
+    def __new__(
+            cls,
+            type: str,
+            value: Any,
+            start_pos: Optional[int] = None,
+            line: Optional[int] = None,
+            column: Optional[int] = None,
+            end_line: Optional[int] = None,
+            end_column: Optional[int] = None,
+            end_pos: Optional[int] = None
+    ) -> 'Token':
+        ...
+
+    @overload
+    def __new__(
+            cls,
+            type_: str,
+            value: Any,
+            start_pos: Optional[int] = None,
+            line: Optional[int] = None,
+            column: Optional[int] = None,
+            end_line: Optional[int] = None,
+            end_column: Optional[int] = None,
+            end_pos: Optional[int] = None
+    ) -> 'Token':        ...
+
+    def __new__(cls, *args, **kwargs):
+        if "type_" in kwargs:
+            warnings.warn("`type_` is deprecated use `type` instead", DeprecationWarning)
+
+            if "type" in kwargs:
+                raise TypeError("Error: using both 'type' and the deprecated 'type_' as arguments.")
+            kwargs["type"] = kwargs.pop("type_")
+
+        return cls._future_new(*args, **kwargs)
+
+
+    @classmethod
+    def _future_new(cls, type, value, start_pos=None, line=None, column=None, end_line=None, end_column=None, end_pos=None):
+        inst = super(Token, cls).__new__(cls, value)
+
+        inst.type = type
+        inst.start_pos = start_pos
+        inst.value = value
+        inst.line = line
+        inst.column = column
+        inst.end_line = end_line
+        inst.end_column = end_column
+        inst.end_pos = end_pos
+        return inst
+
+    @overload
+    def update(self, type: Optional[str] = None, value: Optional[Any] = None) -> 'Token':
+        ...
+
+    @overload
+    def update(self, type_: Optional[str] = None, value: Optional[Any] = None) -> 'Token':
+        ...
+
+    def update(self, *args, **kwargs):
+        if "type_" in kwargs:
+            warnings.warn("`type_` is deprecated use `type` instead", DeprecationWarning)
+
+            if "type" in kwargs:
+                raise TypeError("Error: using both 'type' and the deprecated 'type_' as arguments.")
+            kwargs["type"] = kwargs.pop("type_")
+
+        return self._future_update(*args, **kwargs)
+
+    def _future_update(self, type: Optional[str] = None, value: Optional[Any] = None) -> 'Token':
+        return Token.new_borrow_pos(
+            type if type is not None else self.type,
+            value if value is not None else self.value,
+            self
+        )
+
+    @classmethod
+    def new_borrow_pos(cls: Type[_T], type_: str, value: Any, borrow_t: 'Token') -> _T:
+        return cls(type_, value, borrow_t.start_pos, borrow_t.line, borrow_t.column, borrow_t.end_line, borrow_t.end_column, borrow_t.end_pos)
+
+    def __reduce__(self):
+        return (self.__class__, (self.type, self.value, self.start_pos, self.line, self.column))
+
+    def __repr__(self):
+        return 'Token(%r, %r)' % (self.type, self.value)
+
+    def __deepcopy__(self, memo):
+        return Token(self.type, self.value, self.start_pos, self.line, self.column)
+
+    def __eq__(self, other):
+        if isinstance(other, Token) and self.type != other.type:
+            return False
+
+        return str.__eq__(self, other)
+
+    __hash__ = str.__hash__
+
+
+class LineCounter:
+    #--
+
+    __slots__ = 'char_pos', 'line', 'column', 'line_start_pos', 'newline_char'
+
+    def __init__(self, newline_char):
+        self.newline_char = newline_char
+        self.char_pos = 0
+        self.line = 1
+        self.column = 1
+        self.line_start_pos = 0
+
+    def __eq__(self, other):
+        if not isinstance(other, LineCounter):
+            return NotImplemented
+
+        return self.char_pos == other.char_pos and self.newline_char == other.newline_char
+
+    def feed(self, token: TextOrSlice, test_newline=True):
+        #--
+        if test_newline:
+            newlines = token.count(self.newline_char)
+            if newlines:
+                self.line += newlines
+                self.line_start_pos = self.char_pos + token.rindex(self.newline_char) + 1
+
+        self.char_pos += len(token)
+        self.column = self.char_pos - self.line_start_pos + 1
+
+
+class UnlessCallback:
+    def __init__(self, scanner: 'Scanner'):
+        self.scanner = scanner
+
+    def __call__(self, t: Token):
+        res = self.scanner.fullmatch(t.value)
+        if res is not None:
+            t.type = res
+        return t
+
+
+class CallChain:
+    def __init__(self, callback1, callback2, cond):
+        self.callback1 = callback1
+        self.callback2 = callback2
+        self.cond = cond
+
+    def __call__(self, t):
+        t2 = self.callback1(t)
+        return self.callback2(t) if self.cond(t2) else t2
+
+
+def _get_match(re_, regexp, s, flags):
+    m = re_.match(regexp, s, flags)
+    if m:
+        return m.group(0)
+
+def _create_unless(terminals, g_regex_flags, re_, use_bytes):
+    tokens_by_type = classify(terminals, lambda t: type(t.pattern))
+    assert len(tokens_by_type) <= 2, tokens_by_type.keys()
+    embedded_strs = set()
+    callback = {}
+    for retok in tokens_by_type.get(PatternRE, []):
+        unless = []
+        for strtok in tokens_by_type.get(PatternStr, []):
+            if strtok.priority != retok.priority:
+                continue
+            s = strtok.pattern.value
+            if s == _get_match(re_, retok.pattern.to_regexp(), s, g_regex_flags):
+                unless.append(strtok)
+                if strtok.pattern.flags <= retok.pattern.flags:
+                    embedded_strs.add(strtok)
+        if unless:
+            callback[retok.name] = UnlessCallback(Scanner(unless, g_regex_flags, re_, use_bytes=use_bytes))
+
+    new_terminals = [t for t in terminals if t not in embedded_strs]
+    return new_terminals, callback
+
+
+class Scanner:
+    def __init__(self, terminals, g_regex_flags, re_, use_bytes):
+        self.terminals = terminals
+        self.g_regex_flags = g_regex_flags
+        self.re_ = re_
+        self.use_bytes = use_bytes
+
+        self.allowed_types = {t.name for t in self.terminals}
+
+        self._mres = self._build_mres(terminals, len(terminals))
+
+    def _build_mres(self, terminals, max_size):
+        ##
+
+        ##
+
+        ##
+
+        mres = []
+        while terminals:
+            pattern = u'|'.join(u'(?P<%s>%s)' % (t.name, t.pattern.to_regexp()) for t in terminals[:max_size])
+            if self.use_bytes:
+                pattern = pattern.encode('latin-1')
+            try:
+                mre = self.re_.compile(pattern, self.g_regex_flags)
+            except AssertionError:  ##
+
+                return self._build_mres(terminals, max_size // 2)
+
+            mres.append(mre)
+            terminals = terminals[max_size:]
+        return mres
+
+    def match(self, text: TextSlice, pos):
+        for mre in self._mres:
+            m = mre.match(text.text, pos, text.end)
+            if m:
+                return m.group(0), m.lastgroup
+
+
+    def fullmatch(self, text: str) -> Optional[str]:
+        for mre in self._mres:
+            m = mre.fullmatch(text)
+            if m:
+                return m.lastgroup
+        return None
+
+def _regexp_has_newline(r: str):
+    #--
+    return '\n' in r or '\\n' in r or '\\s' in r or '[^' in r or ('(?s' in r and '.' in r)
+
+
+class LexerState:
+    #--
+
+    __slots__ = 'text', 'line_ctr', 'last_token'
+
+    text: TextSlice
+    line_ctr: LineCounter
+    last_token: Optional[Token]
+
+    def __init__(self, text: TextSlice, line_ctr: Optional[LineCounter] = None, last_token: Optional[Token]=None):
+        if isinstance(text, TextSlice):
+            if line_ctr is None:
+                line_ctr = LineCounter(b'\n' if isinstance(text.text, bytes) else '\n')
+
+                if text.start > 0:
+                    ##
+
+                    line_ctr.feed(TextSlice(text.text, 0, text.start))
+
+            if not (text.start <= line_ctr.char_pos <= text.end):
+                raise ValueError("LineCounter.char_pos is out of bounds")
+
+        self.text = text
+        self.line_ctr = line_ctr
+        self.last_token = last_token
+
+
+    def __eq__(self, other):
+        if not isinstance(other, LexerState):
+            return NotImplemented
+
+        return self.text == other.text and self.line_ctr == other.line_ctr and self.last_token == other.last_token
+
+    def __copy__(self):
+        return type(self)(self.text, copy(self.line_ctr), self.last_token)
+
+
+class LexerThread:
+    #--
+
+    def __init__(self, lexer: 'Lexer', lexer_state: Optional[LexerState]):
+        self.lexer = lexer
+        self.state = lexer_state
+
+    @classmethod
+    def from_text(cls, lexer: 'Lexer', text_or_slice: TextOrSlice) -> 'LexerThread':
+        text = TextSlice.cast_from(text_or_slice)
+        return cls(lexer, LexerState(text))
+
+    @classmethod
+    def from_custom_input(cls, lexer: 'Lexer', text: Any) -> 'LexerThread':
+        return cls(lexer, LexerState(text))
+
+    def lex(self, parser_state):
+        if self.state is None:
+            raise TypeError("Cannot lex: No text assigned to lexer state")
+        return self.lexer.lex(self.state, parser_state)
+
+    def __copy__(self):
+        return type(self)(self.lexer, copy(self.state))
+
+    _Token = Token
+
+
+_Callback = Callable[[Token], Token]
+
+class Lexer(ABC):
+    #--
+    @abstractmethod
+    def lex(self, lexer_state: LexerState, parser_state: Any) -> Iterator[Token]:
+        return NotImplemented
+
+    def make_lexer_state(self, text: str):
+        #--
+        return LexerState(TextSlice.cast_from(text))
+
+
+def _check_regex_collisions(terminal_to_regexp: Dict[TerminalDef, str], comparator, strict_mode, max_collisions_to_show=8):
+    if not comparator:
+        comparator = interegular.Comparator.from_regexes(terminal_to_regexp)
+
+    ##
+
+    ##
+
+    max_time = 2 if strict_mode else 0.2
+
+    ##
+
+    if comparator.count_marked_pairs() >= max_collisions_to_show:
+        return
+    for group in classify(terminal_to_regexp, lambda t: t.priority).values():
+        for a, b in comparator.check(group, skip_marked=True):
+            assert a.priority == b.priority
+            ##
+
+            comparator.mark(a, b)
+
+            ##
+
+            message = f"Collision between Terminals {a.name} and {b.name}. "
+            try:
+                example = comparator.get_example_overlap(a, b, max_time).format_multiline()
+            except ValueError:
+                ##
+
+                example = "No example could be found fast enough. However, the collision does still exists"
+            if strict_mode:
+                raise LexError(f"{message}\n{example}")
+            logger.warning("%s The lexer will choose between them arbitrarily.\n%s", message, example)
+            if comparator.count_marked_pairs() >= max_collisions_to_show:
+                logger.warning("Found 8 regex collisions, will not check for more.")
+                return
+
+
+class AbstractBasicLexer(Lexer):
+    terminals_by_name: Dict[str, TerminalDef]
+
+    @abstractmethod
+    def __init__(self, conf: 'LexerConf', comparator=None) -> None:
+        ...
+
+    @abstractmethod
+    def next_token(self, lex_state: LexerState, parser_state: Any = None) -> Token:
+        ...
+
+    def lex(self, state: LexerState, parser_state: Any) -> Iterator[Token]:
+        with suppress(EOFError):
+            while True:
+                yield self.next_token(state, parser_state)
+
+
+class BasicLexer(AbstractBasicLexer):
+    terminals: Collection[TerminalDef]
+    ignore_types: FrozenSet[str]
+    newline_types: FrozenSet[str]
+    user_callbacks: Dict[str, _Callback]
+    callback: Dict[str, _Callback]
+    re: ModuleType
+
+    def __init__(self, conf: 'LexerConf', comparator=None) -> None:
+        terminals = list(conf.terminals)
+        assert all(isinstance(t, TerminalDef) for t in terminals), terminals
+
+        self.re = conf.re_module
+
+        if not conf.skip_validation:
+            ##
+
+            terminal_to_regexp = {}
+            for t in terminals:
+                regexp = t.pattern.to_regexp()
+                try:
+                    self.re.compile(regexp, conf.g_regex_flags)
+                except self.re.error:
+                    raise LexError("Cannot compile token %s: %s" % (t.name, t.pattern))
+
+                if t.pattern.min_width == 0:
+                    raise LexError("Lexer does not allow zero-width terminals. (%s: %s)" % (t.name, t.pattern))
+                if t.pattern.type == "re":
+                    terminal_to_regexp[t] = regexp
+
+            if not (set(conf.ignore) <= {t.name for t in terminals}):
+                raise LexError("Ignore terminals are not defined: %s" % (set(conf.ignore) - {t.name for t in terminals}))
+
+            if has_interegular:
+                _check_regex_collisions(terminal_to_regexp, comparator, conf.strict)
+            elif conf.strict:
+                raise LexError("interegular must be installed for strict mode. Use `pip install 'lark[interegular]'`.")
+
+        ##
+
+        self.newline_types = frozenset(t.name for t in terminals if _regexp_has_newline(t.pattern.to_regexp()))
+        self.ignore_types = frozenset(conf.ignore)
+
+        terminals.sort(key=lambda x: (-x.priority, -x.pattern.max_width, -len(x.pattern.value), x.name))
+        self.terminals = terminals
+        self.user_callbacks = conf.callbacks
+        self.g_regex_flags = conf.g_regex_flags
+        self.use_bytes = conf.use_bytes
+        self.terminals_by_name = conf.terminals_by_name
+
+        self._scanner: Optional[Scanner] = None
+
+    def _build_scanner(self) -> Scanner:
+        terminals, self.callback = _create_unless(self.terminals, self.g_regex_flags, self.re, self.use_bytes)
+        assert all(self.callback.values())
+
+        for type_, f in self.user_callbacks.items():
+            if type_ in self.callback:
+                ##
+
+                self.callback[type_] = CallChain(self.callback[type_], f, lambda t: t.type == type_)
+            else:
+                self.callback[type_] = f
+
+        return Scanner(terminals, self.g_regex_flags, self.re, self.use_bytes)
+
+    @property
+    def scanner(self) -> Scanner:
+        if self._scanner is None:
+            self._scanner = self._build_scanner()
+        return self._scanner
+
+    def match(self, text, pos):
+        return self.scanner.match(text, pos)
+
+    def next_token(self, lex_state: LexerState, parser_state: Any = None) -> Token:
+        line_ctr = lex_state.line_ctr
+        while line_ctr.char_pos < lex_state.text.end:
+            res = self.match(lex_state.text, line_ctr.char_pos)
+            if not res:
+                allowed = self.scanner.allowed_types - self.ignore_types
+                if not allowed:
+                    allowed = {"<END-OF-FILE>"}
+                raise UnexpectedCharacters(lex_state.text.text, line_ctr.char_pos, line_ctr.line, line_ctr.column,
+                                           allowed=allowed, token_history=lex_state.last_token and [lex_state.last_token],
+                                           state=parser_state, terminals_by_name=self.terminals_by_name)
+
+            value, type_ = res
+
+            ignored = type_ in self.ignore_types
+            t = None
+            if not ignored or type_ in self.callback:
+                t = Token(type_, value, line_ctr.char_pos, line_ctr.line, line_ctr.column)
+            line_ctr.feed(value, type_ in self.newline_types)
+            if t is not None:
+                t.end_line = line_ctr.line
+                t.end_column = line_ctr.column
+                t.end_pos = line_ctr.char_pos
+                if t.type in self.callback:
+                    t = self.callback[t.type](t)
+                if not ignored:
+                    if not isinstance(t, Token):
+                        raise LexError("Callbacks must return a token (returned %r)" % t)
+                    lex_state.last_token = t
+                    return t
+
+        ##
+
+        raise EOFError(self)
+
+
+class ContextualLexer(Lexer):
+    lexers: Dict[int, AbstractBasicLexer]
+    root_lexer: AbstractBasicLexer
+
+    BasicLexer: Type[AbstractBasicLexer] = BasicLexer
+
+    def __init__(self, conf: 'LexerConf', states: Dict[int, Collection[str]], always_accept: Collection[str]=()) -> None:
+        terminals = list(conf.terminals)
+        terminals_by_name = conf.terminals_by_name
+
+        trad_conf = copy(conf)
+        trad_conf.terminals = terminals
+
+        if has_interegular and not conf.skip_validation:
+            comparator = interegular.Comparator.from_regexes({t: t.pattern.to_regexp() for t in terminals})
+        else:
+            comparator = None
+        lexer_by_tokens: Dict[FrozenSet[str], AbstractBasicLexer] = {}
+        self.lexers = {}
+        for state, accepts in states.items():
+            key = frozenset(accepts)
+            try:
+                lexer = lexer_by_tokens[key]
+            except KeyError:
+                accepts = set(accepts) | set(conf.ignore) | set(always_accept)
+                lexer_conf = copy(trad_conf)
+                lexer_conf.terminals = [terminals_by_name[n] for n in accepts if n in terminals_by_name]
+                lexer = self.BasicLexer(lexer_conf, comparator)
+                lexer_by_tokens[key] = lexer
+
+            self.lexers[state] = lexer
+
+        assert trad_conf.terminals is terminals
+        trad_conf.skip_validation = True  ##
+
+        self.root_lexer = self.BasicLexer(trad_conf, comparator)
+
+    def lex(self, lexer_state: LexerState, parser_state: 'ParserState') -> Iterator[Token]:
+        try:
+            while True:
+                lexer = self.lexers[parser_state.position]
+                yield lexer.next_token(lexer_state, parser_state)
+        except EOFError:
+            pass
+        except UnexpectedCharacters as e:
+            ##
+
+            ##
+
+            try:
+                last_token = lexer_state.last_token  ##
+
+                token = self.root_lexer.next_token(lexer_state, parser_state)
+                raise UnexpectedToken(token, e.allowed, state=parser_state, token_history=[last_token], terminals_by_name=self.root_lexer.terminals_by_name)
+            except UnexpectedCharacters:
+                raise e  ##
+
+
+
+
+_ParserArgType: 'TypeAlias' = 'Literal["earley", "lalr", "cyk", "auto"]'
+_LexerArgType: 'TypeAlias' = 'Union[Literal["auto", "basic", "contextual", "dynamic", "dynamic_complete"], Type[Lexer]]'
+_LexerCallback = Callable[[Token], Token]
+ParserCallbacks = Dict[str, Callable]
+
+class LexerConf(Serialize):
+    __serialize_fields__ = 'terminals', 'ignore', 'g_regex_flags', 'use_bytes', 'lexer_type'
+    __serialize_namespace__ = TerminalDef,
+
+    terminals: Collection[TerminalDef]
+    re_module: ModuleType
+    ignore: Collection[str]
+    postlex: 'Optional[PostLex]'
+    callbacks: Dict[str, _LexerCallback]
+    g_regex_flags: int
+    skip_validation: bool
+    use_bytes: bool
+    lexer_type: Optional[_LexerArgType]
+    strict: bool
+
+    def __init__(self, terminals: Collection[TerminalDef], re_module: ModuleType, ignore: Collection[str]=(), postlex: 'Optional[PostLex]'=None,
+                 callbacks: Optional[Dict[str, _LexerCallback]]=None, g_regex_flags: int=0, skip_validation: bool=False, use_bytes: bool=False, strict: bool=False):
+        self.terminals = terminals
+        self.terminals_by_name = {t.name: t for t in self.terminals}
+        assert len(self.terminals) == len(self.terminals_by_name)
+        self.ignore = ignore
+        self.postlex = postlex
+        self.callbacks = callbacks or {}
+        self.g_regex_flags = g_regex_flags
+        self.re_module = re_module
+        self.skip_validation = skip_validation
+        self.use_bytes = use_bytes
+        self.strict = strict
+        self.lexer_type = None
+
+    def _deserialize(self):
+        self.terminals_by_name = {t.name: t for t in self.terminals}
+
+    def __deepcopy__(self, memo=None):
+        return type(self)(
+            deepcopy(self.terminals, memo),
+            self.re_module,
+            deepcopy(self.ignore, memo),
+            deepcopy(self.postlex, memo),
+            deepcopy(self.callbacks, memo),
+            deepcopy(self.g_regex_flags, memo),
+            deepcopy(self.skip_validation, memo),
+            deepcopy(self.use_bytes, memo),
+        )
+
+class ParserConf(Serialize):
+    __serialize_fields__ = 'rules', 'start', 'parser_type'
+
+    rules: List['Rule']
+    callbacks: ParserCallbacks
+    start: List[str]
+    parser_type: _ParserArgType
+
+    def __init__(self, rules: List['Rule'], callbacks: ParserCallbacks, start: List[str]):
+        assert isinstance(start, list)
+        self.rules = rules
+        self.callbacks = callbacks
+        self.start = start
+
+
+from functools import partial, wraps
+from itertools import product
+
+
+class ExpandSingleChild:
+    def __init__(self, node_builder):
+        self.node_builder = node_builder
+
+    def __call__(self, children):
+        if len(children) == 1:
+            return children[0]
+        else:
+            return self.node_builder(children)
+
+
+
+class PropagatePositions:
+    def __init__(self, node_builder, node_filter=None):
+        self.node_builder = node_builder
+        self.node_filter = node_filter
+
+    def __call__(self, children):
+        res = self.node_builder(children)
+
+        if isinstance(res, Tree):
+            ##
+
+            ##
+
+            ##
+
+            ##
+
+
+            res_meta = res.meta
+
+            first_meta = self._pp_get_meta(children)
+            if first_meta is not None:
+                if not hasattr(res_meta, 'line'):
+                    ##
+
+                    res_meta.line = getattr(first_meta, 'container_line', first_meta.line)
+                    res_meta.column = getattr(first_meta, 'container_column', first_meta.column)
+                    res_meta.start_pos = getattr(first_meta, 'container_start_pos', first_meta.start_pos)
+                    res_meta.empty = False
+
+                res_meta.container_line = getattr(first_meta, 'container_line', first_meta.line)
+                res_meta.container_column = getattr(first_meta, 'container_column', first_meta.column)
+                res_meta.container_start_pos = getattr(first_meta, 'container_start_pos', first_meta.start_pos)
+
+            last_meta = self._pp_get_meta(reversed(children))
+            if last_meta is not None:
+                if not hasattr(res_meta, 'end_line'):
+                    res_meta.end_line = getattr(last_meta, 'container_end_line', last_meta.end_line)
+                    res_meta.end_column = getattr(last_meta, 'container_end_column', last_meta.end_column)
+                    res_meta.end_pos = getattr(last_meta, 'container_end_pos', last_meta.end_pos)
+                    res_meta.empty = False
+
+                res_meta.container_end_line = getattr(last_meta, 'container_end_line', last_meta.end_line)
+                res_meta.container_end_column = getattr(last_meta, 'container_end_column', last_meta.end_column)
+                res_meta.container_end_pos = getattr(last_meta, 'container_end_pos', last_meta.end_pos)
+
+        return res
+
+    def _pp_get_meta(self, children):
+        for c in children:
+            if self.node_filter is not None and not self.node_filter(c):
+                continue
+            if isinstance(c, Tree):
+                if not c.meta.empty:
+                    return c.meta
+            elif isinstance(c, Token):
+                return c
+            elif hasattr(c, '__lark_meta__'):
+                return c.__lark_meta__()
+
+def make_propagate_positions(option):
+    if callable(option):
+        return partial(PropagatePositions, node_filter=option)
+    elif option is True:
+        return PropagatePositions
+    elif option is False:
+        return None
+
+    raise ConfigurationError('Invalid option for propagate_positions: %r' % option)
+
+
+class ChildFilter:
+    def __init__(self, to_include, append_none, node_builder):
+        self.node_builder = node_builder
+        self.to_include = to_include
+        self.append_none = append_none
+
+    def __call__(self, children):
+        filtered = []
+
+        for i, to_expand, add_none in self.to_include:
+            if add_none:
+                filtered += [None] * add_none
+            if to_expand:
+                filtered += children[i].children
+            else:
+                filtered.append(children[i])
+
+        if self.append_none:
+            filtered += [None] * self.append_none
+
+        return self.node_builder(filtered)
+
+
+class ChildFilterLALR(ChildFilter):
+    #--
+
+    def __call__(self, children):
+        filtered = []
+        for i, to_expand, add_none in self.to_include:
+            if add_none:
+                filtered += [None] * add_none
+            if to_expand:
+                if filtered:
+                    filtered += children[i].children
+                else:   ##
+
+                    filtered = children[i].children
+            else:
+                filtered.append(children[i])
+
+        if self.append_none:
+            filtered += [None] * self.append_none
+
+        return self.node_builder(filtered)
+
+
+class ChildFilterLALR_NoPlaceholders(ChildFilter):
+    #--
+    def __init__(self, to_include, node_builder):
+        self.node_builder = node_builder
+        self.to_include = to_include
+
+    def __call__(self, children):
+        filtered = []
+        for i, to_expand in self.to_include:
+            if to_expand:
+                if filtered:
+                    filtered += children[i].children
+                else:   ##
+
+                    filtered = children[i].children
+            else:
+                filtered.append(children[i])
+        return self.node_builder(filtered)
+
+
+def _should_expand(sym):
+    return not sym.is_term and sym.name.startswith('_')
+
+
+def maybe_create_child_filter(expansion, keep_all_tokens, ambiguous, _empty_indices: List[bool]):
+    ##
+
+    if _empty_indices:
+        assert _empty_indices.count(False) == len(expansion)
+        s = ''.join(str(int(b)) for b in _empty_indices)
+        empty_indices = [len(ones) for ones in s.split('0')]
+        assert len(empty_indices) == len(expansion)+1, (empty_indices, len(expansion))
+    else:
+        empty_indices = [0] * (len(expansion)+1)
+
+    to_include = []
+    nones_to_add = 0
+    for i, sym in enumerate(expansion):
+        nones_to_add += empty_indices[i]
+        if keep_all_tokens or not (sym.is_term and sym.filter_out):
+            to_include.append((i, _should_expand(sym), nones_to_add))
+            nones_to_add = 0
+
+    nones_to_add += empty_indices[len(expansion)]
+
+    if _empty_indices or len(to_include) < len(expansion) or any(to_expand for i, to_expand,_ in to_include):
+        if _empty_indices or ambiguous:
+            return partial(ChildFilter if ambiguous else ChildFilterLALR, to_include, nones_to_add)
+        else:
+            ##
+
+            return partial(ChildFilterLALR_NoPlaceholders, [(i, x) for i,x,_ in to_include])
+
+
+class AmbiguousExpander:
+    #--
+    def __init__(self, to_expand, tree_class, node_builder):
+        self.node_builder = node_builder
+        self.tree_class = tree_class
+        self.to_expand = to_expand
+
+    def __call__(self, children):
+        def _is_ambig_tree(t):
+            return hasattr(t, 'data') and t.data == '_ambig'
+
+        ##
+
+        ##
+
+        ##
+
+        ##
+
+        ambiguous = []
+        for i, child in enumerate(children):
+            if _is_ambig_tree(child):
+                if i in self.to_expand:
+                    ambiguous.append(i)
+
+                child.expand_kids_by_data('_ambig')
+
+        if not ambiguous:
+            return self.node_builder(children)
+
+        expand = [child.children if i in ambiguous else (child,) for i, child in enumerate(children)]
+        return self.tree_class('_ambig', [self.node_builder(list(f)) for f in product(*expand)])
+
+
+def maybe_create_ambiguous_expander(tree_class, expansion, keep_all_tokens):
+    to_expand = [i for i, sym in enumerate(expansion)
+                 if keep_all_tokens or ((not (sym.is_term and sym.filter_out)) and _should_expand(sym))]
+    if to_expand:
+        return partial(AmbiguousExpander, to_expand, tree_class)
+
+
+class AmbiguousIntermediateExpander:
+    #--
+
+    def __init__(self, tree_class, node_builder):
+        self.node_builder = node_builder
+        self.tree_class = tree_class
+
+    def __call__(self, children):
+        def _is_iambig_tree(child):
+            return hasattr(child, 'data') and child.data == '_iambig'
+
+        def _collapse_iambig(children):
+            #--
+
+            ##
+
+            ##
+
+            if children and _is_iambig_tree(children[0]):
+                iambig_node = children[0]
+                result = []
+                for grandchild in iambig_node.children:
+                    collapsed = _collapse_iambig(grandchild.children)
+                    if collapsed:
+                        for child in collapsed:
+                            child.children += children[1:]
+                        result += collapsed
+                    else:
+                        new_tree = self.tree_class('_inter', grandchild.children + children[1:])
+                        result.append(new_tree)
+                return result
+
+        collapsed = _collapse_iambig(children)
+        if collapsed:
+            processed_nodes = [self.node_builder(c.children) for c in collapsed]
+            return self.tree_class('_ambig', processed_nodes)
+
+        return self.node_builder(children)
+
+
+
+def inplace_transformer(func):
+    @wraps(func)
+    def f(children):
+        ##
+
+        tree = Tree(func.__name__, children)
+        return func(tree)
+    return f
+
+
+def apply_visit_wrapper(func, name, wrapper):
+    if wrapper is _vargs_meta or wrapper is _vargs_meta_inline:
+        raise NotImplementedError("Meta args not supported for internal transformer; use YourTransformer().transform(parser.parse()) instead")
+
+    @wraps(func)
+    def f(children):
+        return wrapper(func, name, children, None)
+    return f
+
+
+class ParseTreeBuilder:
+    def __init__(self, rules, tree_class, propagate_positions=False, ambiguous=False, maybe_placeholders=False):
+        self.tree_class = tree_class
+        self.propagate_positions = propagate_positions
+        self.ambiguous = ambiguous
+        self.maybe_placeholders = maybe_placeholders
+
+        self.rule_builders = list(self._init_builders(rules))
+
+    def _init_builders(self, rules):
+        propagate_positions = make_propagate_positions(self.propagate_positions)
+
+        for rule in rules:
+            options = rule.options
+            keep_all_tokens = options.keep_all_tokens
+            expand_single_child = options.expand1
+
+            wrapper_chain = list(filter(None, [
+                (expand_single_child and not rule.alias) and ExpandSingleChild,
+                maybe_create_child_filter(rule.expansion, keep_all_tokens, self.ambiguous, options.empty_indices if self.maybe_placeholders else None),
+                propagate_positions,
+                self.ambiguous and maybe_create_ambiguous_expander(self.tree_class, rule.expansion, keep_all_tokens),
+                self.ambiguous and partial(AmbiguousIntermediateExpander, self.tree_class)
+            ]))
+
+            yield rule, wrapper_chain
+
+    def create_callback(self, transformer=None):
+        callbacks = {}
+
+        default_handler = getattr(transformer, '__default__', None)
+        if default_handler:
+            def default_callback(data, children):
+                return default_handler(data, children, None)
+        else:
+            default_callback = self.tree_class
+
+        for rule, wrapper_chain in self.rule_builders:
+
+            user_callback_name = rule.alias or rule.options.template_source or rule.origin.name
+            try:
+                f = getattr(transformer, user_callback_name)
+                wrapper = getattr(f, 'visit_wrapper', None)
+                if wrapper is not None:
+                    f = apply_visit_wrapper(f, user_callback_name, wrapper)
+                elif isinstance(transformer, Transformer_InPlace):
+                    f = inplace_transformer(f)
+            except AttributeError:
+                f = partial(default_callback, user_callback_name)
+
+            for w in wrapper_chain:
+                f = w(f)
+
+            if rule in callbacks:
+                raise GrammarError("Rule '%s' already exists" % (rule,))
+
+            callbacks[rule] = f
+
+        return callbacks
+
+
+
+class Action:
+    def __init__(self, name):
+        self.name = name
+    def __str__(self):
+        return self.name
+    def __repr__(self):
+        return str(self)
+
+Shift = Action('Shift')
+Reduce = Action('Reduce')
+
+StateT = TypeVar("StateT")
+
+class ParseTableBase(Generic[StateT]):
+    states: Dict[StateT, Dict[str, Tuple]]
+    start_states: Dict[str, StateT]
+    end_states: Dict[str, StateT]
+
+    def __init__(self, states, start_states, end_states):
+        self.states = states
+        self.start_states = start_states
+        self.end_states = end_states
+
+    def serialize(self, memo):
+        tokens = Enumerator()
+
+        states = {
+            state: {tokens.get(token): ((1, arg.serialize(memo)) if action is Reduce else (0, arg))
+                    for token, (action, arg) in actions.items()}
+            for state, actions in self.states.items()
+        }
+
+        return {
+            'tokens': tokens.reversed(),
+            'states': states,
+            'start_states': self.start_states,
+            'end_states': self.end_states,
+        }
+
+    @classmethod
+    def deserialize(cls, data, memo):
+        tokens = data['tokens']
+        states = {
+            state: {tokens[token]: ((Reduce, Rule.deserialize(arg, memo)) if action==1 else (Shift, arg))
+                    for token, (action, arg) in actions.items()}
+            for state, actions in data['states'].items()
+        }
+        return cls(states, data['start_states'], data['end_states'])
+
+class ParseTable(ParseTableBase['State']):
+    #--
+    pass
+
+
+class IntParseTable(ParseTableBase[int]):
+    #--
+
+    @classmethod
+    def from_ParseTable(cls, parse_table: ParseTable):
+        enum = list(parse_table.states)
+        state_to_idx: Dict['State', int] = {s:i for i,s in enumerate(enum)}
+        int_states = {}
+
+        for s, la in parse_table.states.items():
+            la = {k:(v[0], state_to_idx[v[1]]) if v[0] is Shift else v
+                  for k,v in la.items()}
+            int_states[ state_to_idx[s] ] = la
+
+
+        start_states = {start:state_to_idx[s] for start, s in parse_table.start_states.items()}
+        end_states = {start:state_to_idx[s] for start, s in parse_table.end_states.items()}
+        return cls(int_states, start_states, end_states)
+
+
+
+class ParseConf(Generic[StateT]):
+    __slots__ = 'parse_table', 'callbacks', 'start', 'start_state', 'end_state', 'states'
+
+    parse_table: ParseTableBase[StateT]
+    callbacks: ParserCallbacks
+    start: str
+
+    start_state: StateT
+    end_state: StateT
+    states: Dict[StateT, Dict[str, tuple]]
+
+    def __init__(self, parse_table: ParseTableBase[StateT], callbacks: ParserCallbacks, start: str):
+        self.parse_table = parse_table
+
+        self.start_state = self.parse_table.start_states[start]
+        self.end_state = self.parse_table.end_states[start]
+        self.states = self.parse_table.states
+
+        self.callbacks = callbacks
+        self.start = start
+
+class ParserState(Generic[StateT]):
+    __slots__ = 'parse_conf', 'lexer', 'state_stack', 'value_stack'
+
+    parse_conf: ParseConf[StateT]
+    lexer: LexerThread
+    state_stack: List[StateT]
+    value_stack: list
+
+    def __init__(self, parse_conf: ParseConf[StateT], lexer: LexerThread, state_stack=None, value_stack=None):
+        self.parse_conf = parse_conf
+        self.lexer = lexer
+        self.state_stack = state_stack or [self.parse_conf.start_state]
+        self.value_stack = value_stack or []
+
+    @property
+    def position(self) -> StateT:
+        return self.state_stack[-1]
+
+    ##
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, ParserState):
+            return NotImplemented
+        return len(self.state_stack) == len(other.state_stack) and self.position == other.position
+
+    def __copy__(self):
+        return self.copy()
+
+    def copy(self, deepcopy_values=True) -> 'ParserState[StateT]':
+        return type(self)(
+            self.parse_conf,
+            self.lexer, ##
+
+            copy(self.state_stack),
+            deepcopy(self.value_stack) if deepcopy_values else copy(self.value_stack),
+        )
+
+    def feed_token(self, token: Token, is_end=False) -> Any:
+        state_stack = self.state_stack
+        value_stack = self.value_stack
+        states = self.parse_conf.states
+        end_state = self.parse_conf.end_state
+        callbacks = self.parse_conf.callbacks
+
+        while True:
+            state = state_stack[-1]
+            try:
+                action, arg = states[state][token.type]
+            except KeyError:
+                expected = {s for s in states[state].keys() if s.isupper()}
+                raise UnexpectedToken(token, expected, state=self, interactive_parser=None)
+
+            assert arg != end_state
+
+            if action is Shift:
+                ##
+
+                assert not is_end
+                state_stack.append(arg)
+                value_stack.append(token if token.type not in callbacks else callbacks[token.type](token))
+                return
+            else:
+                ##
+
+                rule = arg
+                size = len(rule.expansion)
+                if size:
+                    s = value_stack[-size:]
+                    del state_stack[-size:]
+                    del value_stack[-size:]
+                else:
+                    s = []
+
+                value = callbacks[rule](s) if callbacks else s
+
+                _action, new_state = states[state_stack[-1]][rule.origin.name]
+                assert _action is Shift
+                state_stack.append(new_state)
+                value_stack.append(value)
+
+                if is_end and state_stack[-1] == end_state:
+                    return value_stack[-1]
+
+
+class LALR_Parser(Serialize):
+    def __init__(self, parser_conf: ParserConf, debug: bool=False, strict: bool=False):
+        analysis = LALR_Analyzer(parser_conf, debug=debug, strict=strict)
+        analysis.compute_lalr()
+        callbacks = parser_conf.callbacks
+
+        self._parse_table = analysis.parse_table
+        self.parser_conf = parser_conf
+        self.parser = _Parser(analysis.parse_table, callbacks, debug)
+
+    @classmethod
+    def deserialize(cls, data, memo, callbacks, debug=False):
+        inst = cls.__new__(cls)
+        inst._parse_table = IntParseTable.deserialize(data, memo)
+        inst.parser = _Parser(inst._parse_table, callbacks, debug)
+        return inst
+
+    def serialize(self, memo: Any = None) -> Dict[str, Any]:
+        return self._parse_table.serialize(memo)
+
+    def parse_interactive(self, lexer: LexerThread, start: str):
+        return self.parser.parse(lexer, start, start_interactive=True)
+
+    def parse(self, lexer, start, on_error=None):
+        try:
+            return self.parser.parse(lexer, start)
+        except UnexpectedInput as e:
+            if on_error is None:
+                raise
+
+            while True:
+                if isinstance(e, UnexpectedCharacters):
+                    s = e.interactive_parser.lexer_thread.state
+                    p = s.line_ctr.char_pos
+
+                if not on_error(e):
+                    raise e
+
+                if isinstance(e, UnexpectedCharacters):
+                    ##
+
+                    if p == s.line_ctr.char_pos:
+                        s.line_ctr.feed(s.text.text[p:p+1])
+
+                try:
+                    return e.interactive_parser.resume_parse()
+                except UnexpectedToken as e2:
+                    if (isinstance(e, UnexpectedToken)
+                        and e.token.type == e2.token.type == '$END'
+                        and e.interactive_parser == e2.interactive_parser):
+                        ##
+
+                        raise e2
+                    e = e2
+                except UnexpectedCharacters as e2:
+                    e = e2
+
+
+class _Parser:
+    parse_table: ParseTableBase
+    callbacks: ParserCallbacks
+    debug: bool
+
+    def __init__(self, parse_table: ParseTableBase, callbacks: ParserCallbacks, debug: bool=False):
+        self.parse_table = parse_table
+        self.callbacks = callbacks
+        self.debug = debug
+
+    def parse(self, lexer: LexerThread, start: str, value_stack=None, state_stack=None, start_interactive=False):
+        parse_conf = ParseConf(self.parse_table, self.callbacks, start)
+        parser_state = ParserState(parse_conf, lexer, state_stack, value_stack)
+        if start_interactive:
+            return InteractiveParser(self, parser_state, parser_state.lexer)
+        return self.parse_from_state(parser_state)
+
+
+    def parse_from_state(self, state: ParserState, last_token: Optional[Token]=None):
+        #--
+        try:
+            token = last_token
+            for token in state.lexer.lex(state):
+                assert token is not None
+                state.feed_token(token)
+
+            end_token = Token.new_borrow_pos('$END', '', token) if token else Token('$END', '', 0, 1, 1)
+            return state.feed_token(end_token, True)
+        except UnexpectedInput as e:
+            try:
+                e.interactive_parser = InteractiveParser(self, state, state.lexer)
+            except NameError:
+                pass
+            raise e
+        except Exception as e:
+            if self.debug:
+                print("")
+                print("STATE STACK DUMP")
+                print("----------------")
+                for i, s in enumerate(state.state_stack):
+                    print('%d)' % i , s)
+                print("")
+
+            raise
+
+
+class InteractiveParser:
+    #--
+    def __init__(self, parser, parser_state: ParserState, lexer_thread: LexerThread):
+        self.parser = parser
+        self.parser_state = parser_state
+        self.lexer_thread = lexer_thread
+        self.result = None
+
+    @property
+    def lexer_state(self) -> LexerThread:
+        warnings.warn("lexer_state will be removed in subsequent releases. Use lexer_thread instead.", DeprecationWarning)
+        return self.lexer_thread
+
+    def feed_token(self, token: Token):
+        #--
+        return self.parser_state.feed_token(token, token.type == '$END')
+
+    def iter_parse(self) -> Iterator[Token]:
+        #--
+        for token in self.lexer_thread.lex(self.parser_state):
+            yield token
+            self.result = self.feed_token(token)
+
+    def exhaust_lexer(self) -> List[Token]:
+        #--
+        return list(self.iter_parse())
+
+
+    def feed_eof(self, last_token=None):
+        #--
+        eof = Token.new_borrow_pos('$END', '', last_token) if last_token is not None else self.lexer_thread._Token('$END', '', 0, 1, 1)
+        return self.feed_token(eof)
+
+
+    def __copy__(self):
+        #--
+        return self.copy()
+
+    def copy(self, deepcopy_values=True):
+        return type(self)(
+            self.parser,
+            self.parser_state.copy(deepcopy_values=deepcopy_values),
+            copy(self.lexer_thread),
+        )
+
+    def __eq__(self, other):
+        if not isinstance(other, InteractiveParser):
+            return False
+
+        return self.parser_state == other.parser_state and self.lexer_thread == other.lexer_thread
+
+    def as_immutable(self):
+        #--
+        p = copy(self)
+        return ImmutableInteractiveParser(p.parser, p.parser_state, p.lexer_thread)
+
+    def pretty(self):
+        #--
+        out = ["Parser choices:"]
+        for k, v in self.choices().items():
+            out.append('\t- %s -> %r' % (k, v))
+        out.append('stack size: %s' % len(self.parser_state.state_stack))
+        return '\n'.join(out)
+
+    def choices(self):
+        #--
+        return self.parser_state.parse_conf.parse_table.states[self.parser_state.position]
+
+    def accepts(self):
+        #--
+        accepts = set()
+        conf_no_callbacks = copy(self.parser_state.parse_conf)
+        ##
+
+        ##
+
+        conf_no_callbacks.callbacks = {}
+        for t in self.choices():
+            if t.isupper(): ##
+
+                new_cursor = self.copy(deepcopy_values=False)
+                new_cursor.parser_state.parse_conf = conf_no_callbacks
+                try:
+                    new_cursor.feed_token(self.lexer_thread._Token(t, ''))
+                except UnexpectedToken:
+                    pass
+                else:
+                    accepts.add(t)
+        return accepts
+
+    def resume_parse(self):
+        #--
+        return self.parser.parse_from_state(self.parser_state, last_token=self.lexer_thread.state.last_token)
+
+
+
+class ImmutableInteractiveParser(InteractiveParser):
+    #--
+
+    result = None
+
+    def __hash__(self):
+        return hash((self.parser_state, self.lexer_thread))
+
+    def feed_token(self, token):
+        c = copy(self)
+        c.result = InteractiveParser.feed_token(c, token)
+        return c
+
+    def exhaust_lexer(self):
+        #--
+        cursor = self.as_mutable()
+        cursor.exhaust_lexer()
+        return cursor.as_immutable()
+
+    def as_mutable(self):
+        #--
+        p = copy(self)
+        return InteractiveParser(p.parser, p.parser_state, p.lexer_thread)
+
+
+
+def _wrap_lexer(lexer_class):
+    future_interface = getattr(lexer_class, '__future_interface__', 0)
+    if future_interface == 2:
+        return lexer_class
+    elif future_interface == 1:
+        class CustomLexerWrapper1(Lexer):
+            def __init__(self, lexer_conf):
+                self.lexer = lexer_class(lexer_conf)
+            def lex(self, lexer_state, parser_state):
+                if isinstance(lexer_state.text, TextSlice) and not lexer_state.text.is_complete_text():
+                    raise TypeError("Interface=1 Custom Lexer don't support TextSlice")
+                lexer_state.text = lexer_state.text
+                return self.lexer.lex(lexer_state, parser_state)
+        return CustomLexerWrapper1
+    elif future_interface == 0:
+        class CustomLexerWrapper0(Lexer):
+            def __init__(self, lexer_conf):
+                self.lexer = lexer_class(lexer_conf)
+
+            def lex(self, lexer_state, parser_state):
+                if isinstance(lexer_state.text, TextSlice):
+                    if not lexer_state.text.is_complete_text():
+                        raise TypeError("Interface=0 Custom Lexer don't support TextSlice")
+                    return self.lexer.lex(lexer_state.text.text)
+                return self.lexer.lex(lexer_state.text)
+        return CustomLexerWrapper0
+    else:
+        raise ValueError(f"Unknown __future_interface__ value {future_interface}, integer 0-2 expected")
+
+
+def _deserialize_parsing_frontend(data, memo, lexer_conf, callbacks, options):
+    parser_conf = ParserConf.deserialize(data['parser_conf'], memo)
+    cls = (options and options._plugins.get('LALR_Parser')) or LALR_Parser
+    parser = cls.deserialize(data['parser'], memo, callbacks, options.debug)
+    parser_conf.callbacks = callbacks
+    return ParsingFrontend(lexer_conf, parser_conf, options, parser=parser)
+
+
+_parser_creators: 'Dict[str, Callable[[LexerConf, Any, Any], Any]]' = {}
+
+
+class ParsingFrontend(Serialize):
+    __serialize_fields__ = 'lexer_conf', 'parser_conf', 'parser'
+
+    lexer_conf: LexerConf
+    parser_conf: ParserConf
+    options: Any
+
+    def __init__(self, lexer_conf: LexerConf, parser_conf: ParserConf, options, parser=None):
+        self.parser_conf = parser_conf
+        self.lexer_conf = lexer_conf
+        self.options = options
+
+        ##
+
+        if parser:  ##
+
+            self.parser = parser
+        else:
+            create_parser = _parser_creators.get(parser_conf.parser_type)
+            assert create_parser is not None, "{} is not supported in standalone mode".format(
+                    parser_conf.parser_type
+                )
+            self.parser = create_parser(lexer_conf, parser_conf, options)
+
+        ##
+
+        lexer_type = lexer_conf.lexer_type
+        self.skip_lexer = False
+        if lexer_type in ('dynamic', 'dynamic_complete'):
+            assert lexer_conf.postlex is None
+            self.skip_lexer = True
+            return
+
+        if isinstance(lexer_type, type):
+            assert issubclass(lexer_type, Lexer)
+            self.lexer = _wrap_lexer(lexer_type)(lexer_conf)
+        elif isinstance(lexer_type, str):
+            create_lexer = {
+                'basic': create_basic_lexer,
+                'contextual': create_contextual_lexer,
+            }[lexer_type]
+            self.lexer = create_lexer(lexer_conf, self.parser, lexer_conf.postlex, options)
+        else:
+            raise TypeError("Bad value for lexer_type: {lexer_type}")
+
+        if lexer_conf.postlex:
+            self.lexer = PostLexConnector(self.lexer, lexer_conf.postlex)
+
+    def _verify_start(self, start=None):
+        if start is None:
+            start_decls = self.parser_conf.start
+            if len(start_decls) > 1:
+                raise ConfigurationError("Lark initialized with more than 1 possible start rule. Must specify which start rule to parse", start_decls)
+            start ,= start_decls
+        elif start not in self.parser_conf.start:
+            raise ConfigurationError("Unknown start rule %s. Must be one of %r" % (start, self.parser_conf.start))
+        return start
+
+    def _make_lexer_thread(self, text: Optional[LarkInput]) -> Union[LarkInput, LexerThread, None]:
+        cls = (self.options and self.options._plugins.get('LexerThread')) or LexerThread
+        if self.skip_lexer:
+            return text
+        if text is None:
+            return cls(self.lexer, None)
+        if isinstance(text, (str, bytes, TextSlice)):
+            return cls.from_text(self.lexer, text)
+        return cls.from_custom_input(self.lexer, text)
+
+    def parse(self, text: Optional[LarkInput], start=None, on_error=None):
+        if self.lexer_conf.lexer_type in ("dynamic", "dynamic_complete"):
+            if isinstance(text, TextSlice) and not text.is_complete_text():
+                raise TypeError(f"Lexer {self.lexer_conf.lexer_type} does not support text slices.")
+
+        chosen_start = self._verify_start(start)
+        kw = {} if on_error is None else {'on_error': on_error}
+        stream = self._make_lexer_thread(text)
+        return self.parser.parse(stream, chosen_start, **kw)
+
+    def parse_interactive(self, text: Optional[TextOrSlice]=None, start=None):
+        ##
+
+        ##
+
+        chosen_start = self._verify_start(start)
+        if self.parser_conf.parser_type != 'lalr':
+            raise ConfigurationError("parse_interactive() currently only works with parser='lalr' ")
+        stream = self._make_lexer_thread(text)
+        return self.parser.parse_interactive(stream, chosen_start)
+
+
+def _validate_frontend_args(parser, lexer) -> None:
+    assert_config(parser, ('lalr', 'earley', 'cyk'))
+    if not isinstance(lexer, type):     ##
+
+        expected = {
+            'lalr': ('basic', 'contextual'),
+            'earley': ('basic', 'dynamic', 'dynamic_complete'),
+            'cyk': ('basic', ),
+         }[parser]
+        assert_config(lexer, expected, 'Parser %r does not support lexer %%r, expected one of %%s' % parser)
+
+
+def _get_lexer_callbacks(transformer, terminals):
+    result = {}
+    for terminal in terminals:
+        callback = getattr(transformer, terminal.name, None)
+        if callback is not None:
+            result[terminal.name] = callback
+    return result
+
+class PostLexConnector:
+    def __init__(self, lexer, postlexer):
+        self.lexer = lexer
+        self.postlexer = postlexer
+
+    def lex(self, lexer_state, parser_state):
+        i = self.lexer.lex(lexer_state, parser_state)
+        return self.postlexer.process(i)
+
+
+
+def create_basic_lexer(lexer_conf, parser, postlex, options) -> BasicLexer:
+    cls = (options and options._plugins.get('BasicLexer')) or BasicLexer
+    return cls(lexer_conf)
+
+def create_contextual_lexer(lexer_conf: LexerConf, parser, postlex, options) -> ContextualLexer:
+    cls = (options and options._plugins.get('ContextualLexer')) or ContextualLexer
+    parse_table: ParseTableBase[int] = parser._parse_table
+    states: Dict[int, Collection[str]] = {idx:list(t.keys()) for idx, t in parse_table.states.items()}
+    always_accept: Collection[str] = postlex.always_accept if postlex else ()
+    return cls(lexer_conf, states, always_accept=always_accept)
+
+def create_lalr_parser(lexer_conf: LexerConf, parser_conf: ParserConf, options=None) -> LALR_Parser:
+    debug = options.debug if options else False
+    strict = options.strict if options else False
+    cls = (options and options._plugins.get('LALR_Parser')) or LALR_Parser
+    return cls(parser_conf, debug=debug, strict=strict)
+
+_parser_creators['lalr'] = create_lalr_parser
+
+
+
+
+class PostLex(ABC):
+    @abstractmethod
+    def process(self, stream: Iterator[Token]) -> Iterator[Token]:
+        return stream
+
+    always_accept: Iterable[str] = ()
+
+class LarkOptions(Serialize):
+    #--
+
+    start: List[str]
+    debug: bool
+    strict: bool
+    transformer: 'Optional[Transformer]'
+    propagate_positions: Union[bool, str]
+    maybe_placeholders: bool
+    cache: Union[bool, str]
+    cache_grammar: bool
+    regex: bool
+    g_regex_flags: int
+    keep_all_tokens: bool
+    tree_class: Optional[Callable[[str, List], Any]]
+    parser: _ParserArgType
+    lexer: _LexerArgType
+    ambiguity: 'Literal["auto", "resolve", "explicit", "forest"]'
+    postlex: Optional[PostLex]
+    priority: 'Optional[Literal["auto", "normal", "invert"]]'
+    lexer_callbacks: Dict[str, Callable[[Token], Token]]
+    use_bytes: bool
+    ordered_sets: bool
+    edit_terminals: Optional[Callable[[TerminalDef], TerminalDef]]
+    import_paths: 'List[Union[str, Callable[[Union[None, str, PackageResource], str], Tuple[str, str]]]]'
+    source_path: Optional[str]
+
+    OPTIONS_DOC = r"""
+    **===  General Options  ===**
+
+    start
+            The start symbol. Either a string, or a list of strings for multiple possible starts (Default: "start")
+    debug
+            Display debug information and extra warnings. Use only when debugging (Default: ``False``)
+            When used with Earley, it generates a forest graph as "sppf.png", if 'dot' is installed.
+    strict
+            Throw an exception on any potential ambiguity, including shift/reduce conflicts, and regex collisions.
+    transformer
+            Applies the transformer to every parse tree (equivalent to applying it after the parse, but faster)
+    propagate_positions
+            Propagates positional attributes into the 'meta' attribute of all tree branches.
+            Sets attributes: (line, column, end_line, end_column, start_pos, end_pos,
+                              container_line, container_column, container_end_line, container_end_column)
+            Accepts ``False``, ``True``, or a callable, which will filter which nodes to ignore when propagating.
+    maybe_placeholders
+            When ``True``, the ``[]`` operator returns ``None`` when not matched.
+            When ``False``,  ``[]`` behaves like the ``?`` operator, and returns no value at all.
+            (default= ``True``)
+    cache
+            Cache the results of the Lark grammar analysis, for x2 to x3 faster loading. LALR only for now.
+
+            - When ``False``, does nothing (default)
+            - When ``True``, caches to a temporary file in the local directory
+            - When given a string, caches to the path pointed by the string
+    cache_grammar
+            For use with ``cache`` option. When ``True``, the unanalyzed grammar is also included in the cache.
+            Useful for classes that require the ``Lark.grammar`` to be present (e.g. Reconstructor).
+            (default= ``False``)
+    regex
+            When True, uses the ``regex`` module instead of the stdlib ``re``.
+    g_regex_flags
+            Flags that are applied to all terminals (both regex and strings)
+    keep_all_tokens
+            Prevent the tree builder from automagically removing "punctuation" tokens (Default: ``False``)
+    tree_class
+            Lark will produce trees comprised of instances of this class instead of the default ``lark.Tree``.
+
+    **=== Algorithm Options ===**
+
+    parser
+            Decides which parser engine to use. Accepts "earley" or "lalr". (Default: "earley").
+            (there is also a "cyk" option for legacy)
+    lexer
+            Decides whether or not to use a lexer stage
+
+            - "auto" (default): Choose for me based on the parser
+            - "basic": Use a basic lexer
+            - "contextual": Stronger lexer (only works with parser="lalr")
+            - "dynamic": Flexible and powerful (only with parser="earley")
+            - "dynamic_complete": Same as dynamic, but tries *every* variation of tokenizing possible.
+    ambiguity
+            Decides how to handle ambiguity in the parse. Only relevant if parser="earley"
+
+            - "resolve": The parser will automatically choose the simplest derivation
+              (it chooses consistently: greedy for tokens, non-greedy for rules)
+            - "explicit": The parser will return all derivations wrapped in "_ambig" tree nodes (i.e. a forest).
+            - "forest": The parser will return the root of the shared packed parse forest.
+
+    **=== Misc. / Domain Specific Options ===**
+
+    postlex
+            Lexer post-processing (Default: ``None``) Only works with the basic and contextual lexers.
+    priority
+            How priorities should be evaluated - "auto", ``None``, "normal", "invert" (Default: "auto")
+    lexer_callbacks
+            Dictionary of callbacks for the lexer. May alter tokens during lexing. Use with caution.
+    use_bytes
+            Accept an input of type ``bytes`` instead of ``str``.
+    ordered_sets
+            Should Earley use ordered-sets to achieve stable output (~10% slower than regular sets. Default: True)
+    edit_terminals
+            A callback for editing the terminals before parse.
+    import_paths
+            A List of either paths or loader functions to specify from where grammars are imported
+    source_path
+            Override the source of from where the grammar was loaded. Useful for relative imports and unconventional grammar loading
+    **=== End of Options ===**
+    """
+    if __doc__:
+        __doc__ += OPTIONS_DOC
+
+
+    ##
+
+    ##
+
+    ##
+
+    ##
+
+    ##
+
+    ##
+
+    _defaults: Dict[str, Any] = {
+        'debug': False,
+        'strict': False,
+        'keep_all_tokens': False,
+        'tree_class': None,
+        'cache': False,
+        'cache_grammar': False,
+        'postlex': None,
+        'parser': 'earley',
+        'lexer': 'auto',
+        'transformer': None,
+        'start': 'start',
+        'priority': 'auto',
+        'ambiguity': 'auto',
+        'regex': False,
+        'propagate_positions': False,
+        'lexer_callbacks': {},
+        'maybe_placeholders': True,
+        'edit_terminals': None,
+        'g_regex_flags': 0,
+        'use_bytes': False,
+        'ordered_sets': True,
+        'import_paths': [],
+        'source_path': None,
+        '_plugins': {},
+    }
+
+    def __init__(self, options_dict: Dict[str, Any]) -> None:
+        o = dict(options_dict)
+
+        options = {}
+        for name, default in self._defaults.items():
+            if name in o:
+                value = o.pop(name)
+                if isinstance(default, bool) and name not in ('cache', 'use_bytes', 'propagate_positions'):
+                    value = bool(value)
+            else:
+                value = default
+
+            options[name] = value
+
+        if isinstance(options['start'], str):
+            options['start'] = [options['start']]
+
+        self.__dict__['options'] = options
+
+
+        assert_config(self.parser, ('earley', 'lalr', 'cyk', None))
+
+        if self.parser == 'earley' and self.transformer:
+            raise ConfigurationError('Cannot specify an embedded transformer when using the Earley algorithm. '
+                             'Please use your transformer on the resulting parse tree, or use a different algorithm (i.e. LALR)')
+
+        if self.cache_grammar and not self.cache:
+            raise ConfigurationError('cache_grammar cannot be set when cache is disabled')
+
+        if o:
+            raise ConfigurationError("Unknown options: %s" % o.keys())
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self.__dict__['options'][name]
+        except KeyError as e:
+            raise AttributeError(e)
+
+    def __setattr__(self, name: str, value: str) -> None:
+        assert_config(name, self.options.keys(), "%r isn't a valid option. Expected one of: %s")
+        self.options[name] = value
+
+    def serialize(self, memo = None) -> Dict[str, Any]:
+        return self.options
+
+    @classmethod
+    def deserialize(cls, data: Dict[str, Any], memo: Dict[int, Union[TerminalDef, Rule]]) -> "LarkOptions":
+        return cls(data)
+
+
+##
+
+##
+
+_LOAD_ALLOWED_OPTIONS = {'postlex', 'transformer', 'lexer_callbacks', 'use_bytes', 'debug', 'g_regex_flags', 'regex', 'propagate_positions', 'tree_class', '_plugins'}
+
+_VALID_PRIORITY_OPTIONS = ('auto', 'normal', 'invert', None)
+_VALID_AMBIGUITY_OPTIONS = ('auto', 'resolve', 'explicit', 'forest')
+
+
+_T = TypeVar('_T', bound="Lark")
+
+class Lark(Serialize):
+    #--
+
+    source_path: str
+    source_grammar: str
+    grammar: 'Grammar'
+    options: LarkOptions
+    lexer: Lexer
+    parser: 'ParsingFrontend'
+    terminals: Collection[TerminalDef]
+
+    __serialize_fields__ = ['parser', 'rules', 'options']
+
+    def __init__(self, grammar: 'Union[Grammar, str, IO[str]]', **options) -> None:
+        self.options = LarkOptions(options)
+        re_module: types.ModuleType
+
+        ##
+
+        if self.options.cache_grammar:
+            self.__serialize_fields__ = self.__serialize_fields__ + ['grammar']
+
+        ##
+
+        use_regex = self.options.regex
+        if use_regex:
+            if _has_regex:
+                re_module = regex
+            else:
+                raise ImportError('`regex` module must be installed if calling `Lark(regex=True)`.')
+        else:
+            re_module = re
+
+        ##
+
+        if self.options.source_path is None:
+            try:
+                self.source_path = grammar.name  ##
+
+            except AttributeError:
+                self.source_path = '<string>'
+        else:
+            self.source_path = self.options.source_path
+
+        ##
+
+        try:
+            read = grammar.read  ##
+
+        except AttributeError:
+            pass
+        else:
+            grammar = read()
+
+        cache_fn = None
+        cache_sha256 = None
+        if isinstance(grammar, str):
+            self.source_grammar = grammar
+            if self.options.use_bytes:
+                if not grammar.isascii():
+                    raise ConfigurationError("Grammar must be ascii only, when use_bytes=True")
+
+            if self.options.cache:
+                if self.options.parser != 'lalr':
+                    raise ConfigurationError("cache only works with parser='lalr' for now")
+
+                unhashable = ('transformer', 'postlex', 'lexer_callbacks', 'edit_terminals', '_plugins')
+                options_str = ''.join(k+str(v) for k, v in options.items() if k not in unhashable)
+                from . import __version__
+                s = grammar + options_str + __version__ + str(sys.version_info[:2])
+                cache_sha256 = sha256_digest(s)
+
+                if isinstance(self.options.cache, str):
+                    cache_fn = self.options.cache
+                else:
+                    if self.options.cache is not True:
+                        raise ConfigurationError("cache argument must be bool or str")
+
+                    try:
+                        username = getpass.getuser()
+                    except Exception:
+                        ##
+
+                        ##
+
+                        ##
+
+                        username = "unknown"
+
+
+                    cache_fn = tempfile.gettempdir() + "/.lark_%s_%s_%s_%s_%s.tmp" % (
+                        "cache_grammar" if self.options.cache_grammar else "cache", username, cache_sha256, *sys.version_info[:2])
+
+                old_options = self.options
+                try:
+                    with FS.open(cache_fn, 'rb') as f:
+                        logger.debug('Loading grammar from cache: %s', cache_fn)
+                        ##
+
+                        for name in (set(options) - _LOAD_ALLOWED_OPTIONS):
+                            del options[name]
+                        file_sha256 = f.readline().rstrip(b'\n')
+                        cached_used_files = pickle.load(f)
+                        if file_sha256 == cache_sha256.encode('utf8') and verify_used_files(cached_used_files):
+                            cached_parser_data = pickle.load(f)
+                            self._load(cached_parser_data, **options)
+                            return
+                except FileNotFoundError:
+                    ##
+
+                    pass
+                except Exception: ##
+
+                    logger.exception("Failed to load Lark from cache: %r. We will try to carry on.", cache_fn)
+
+                    ##
+
+                    ##
+
+                    self.options = old_options
+
+
+            ##
+
+            self.grammar, used_files = load_grammar(grammar, self.source_path, self.options.import_paths, self.options.keep_all_tokens)
+        else:
+            assert isinstance(grammar, Grammar)
+            self.grammar = grammar
+
+
+        if self.options.lexer == 'auto':
+            if self.options.parser == 'lalr':
+                self.options.lexer = 'contextual'
+            elif self.options.parser == 'earley':
+                if self.options.postlex is not None:
+                    logger.info("postlex can't be used with the dynamic lexer, so we use 'basic' instead. "
+                                "Consider using lalr with contextual instead of earley")
+                    self.options.lexer = 'basic'
+                else:
+                    self.options.lexer = 'dynamic'
+            elif self.options.parser == 'cyk':
+                self.options.lexer = 'basic'
+            else:
+                assert False, self.options.parser
+        lexer = self.options.lexer
+        if isinstance(lexer, type):
+            assert issubclass(lexer, Lexer)     ##
+
+        else:
+            assert_config(lexer, ('basic', 'contextual', 'dynamic', 'dynamic_complete'))
+            if self.options.postlex is not None and 'dynamic' in lexer:
+                raise ConfigurationError("Can't use postlex with a dynamic lexer. Use basic or contextual instead")
+
+        if self.options.ambiguity == 'auto':
+            if self.options.parser == 'earley':
+                self.options.ambiguity = 'resolve'
+        else:
+            assert_config(self.options.parser, ('earley', 'cyk'), "%r doesn't support disambiguation. Use one of these parsers instead: %s")
+
+        if self.options.priority == 'auto':
+            self.options.priority = 'normal'
+
+        if self.options.priority not in _VALID_PRIORITY_OPTIONS:
+            raise ConfigurationError("invalid priority option: %r. Must be one of %r" % (self.options.priority, _VALID_PRIORITY_OPTIONS))
+        if self.options.ambiguity not in _VALID_AMBIGUITY_OPTIONS:
+            raise ConfigurationError("invalid ambiguity option: %r. Must be one of %r" % (self.options.ambiguity, _VALID_AMBIGUITY_OPTIONS))
+
+        if self.options.parser is None:
+            terminals_to_keep = '*'     ##
+
+        elif self.options.postlex is not None:
+            terminals_to_keep = set(self.options.postlex.always_accept)
+        else:
+            terminals_to_keep = set()
+
+        ##
+
+        self.terminals, self.rules, self.ignore_tokens = self.grammar.compile(self.options.start, terminals_to_keep)
+
+        if self.options.edit_terminals:
+            for t in self.terminals:
+                self.options.edit_terminals(t)
+
+        self._terminals_dict = {t.name: t for t in self.terminals}
+
+        ##
+
+        if self.options.priority == 'invert':
+            for rule in self.rules:
+                if rule.options.priority is not None:
+                    rule.options.priority = -rule.options.priority
+            for term in self.terminals:
+                term.priority = -term.priority
+        ##
+
+        ##
+
+        ##
+
+        elif self.options.priority is None:
+            for rule in self.rules:
+                if rule.options.priority is not None:
+                    rule.options.priority = None
+            for term in self.terminals:
+                term.priority = 0
+
+        ##
+
+        self.lexer_conf = LexerConf(
+                self.terminals, re_module, self.ignore_tokens, self.options.postlex,
+                self.options.lexer_callbacks, self.options.g_regex_flags, use_bytes=self.options.use_bytes, strict=self.options.strict
+            )
+
+        if self.options.parser:
+            self.parser = self._build_parser()
+        elif lexer:
+            self.lexer = self._build_lexer()
+
+        if cache_fn:
+            logger.debug('Saving grammar to cache: %s', cache_fn)
+            try:
+                with FS.open(cache_fn, 'wb') as f:
+                    assert cache_sha256 is not None
+                    f.write(cache_sha256.encode('utf8') + b'\n')
+                    pickle.dump(used_files, f)
+                    self.save(f, _LOAD_ALLOWED_OPTIONS)
+            except IOError as e:
+                logger.exception("Failed to save Lark to cache: %r.", cache_fn, e)
+
+    if __doc__:
+        __doc__ += "\n\n" + LarkOptions.OPTIONS_DOC
+
+    def _build_lexer(self, dont_ignore: bool=False) -> BasicLexer:
+        lexer_conf = self.lexer_conf
+        if dont_ignore:
+            from copy import copy
+            lexer_conf = copy(lexer_conf)
+            lexer_conf.ignore = ()
+        return BasicLexer(lexer_conf)
+
+    def _prepare_callbacks(self) -> None:
+        self._callbacks = {}
+        ##
+
+        if self.options.ambiguity != 'forest':
+            self._parse_tree_builder = ParseTreeBuilder(
+                    self.rules,
+                    self.options.tree_class or Tree,
+                    self.options.propagate_positions,
+                    self.options.parser != 'lalr' and self.options.ambiguity == 'explicit',
+                    self.options.maybe_placeholders
+                )
+            self._callbacks = self._parse_tree_builder.create_callback(self.options.transformer)
+        self._callbacks.update(_get_lexer_callbacks(self.options.transformer, self.terminals))
+
+    def _build_parser(self) -> "ParsingFrontend":
+        self._prepare_callbacks()
+        _validate_frontend_args(self.options.parser, self.options.lexer)
+        parser_conf = ParserConf(self.rules, self._callbacks, self.options.start)
+        return _construct_parsing_frontend(
+            self.options.parser,
+            self.options.lexer,
+            self.lexer_conf,
+            parser_conf,
+            options=self.options
+        )
+
+    def save(self, f, exclude_options: Collection[str] = ()) -> None:
+        #--
+        if self.options.parser != 'lalr':
+            raise NotImplementedError("Lark.save() is only implemented for the LALR(1) parser.")
+        data, m = self.memo_serialize([TerminalDef, Rule])
+        if exclude_options:
+            data["options"] = {n: v for n, v in data["options"].items() if n not in exclude_options}
+        pickle.dump({'data': data, 'memo': m}, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls: Type[_T], f) -> _T:
+        #--
+        inst = cls.__new__(cls)
+        return inst._load(f)
+
+    def _deserialize_lexer_conf(self, data: Dict[str, Any], memo: Dict[int, Union[TerminalDef, Rule]], options: LarkOptions) -> LexerConf:
+        lexer_conf = LexerConf.deserialize(data['lexer_conf'], memo)
+        lexer_conf.callbacks = options.lexer_callbacks or {}
+        lexer_conf.re_module = regex if options.regex else re
+        lexer_conf.use_bytes = options.use_bytes
+        lexer_conf.g_regex_flags = options.g_regex_flags
+        lexer_conf.skip_validation = True
+        lexer_conf.postlex = options.postlex
+        return lexer_conf
+
+    def _load(self: _T, f: Any, **kwargs) -> _T:
+        if isinstance(f, dict):
+            d = f
+        else:
+            d = pickle.load(f)
+        memo_json = d['memo']
+        data = d['data']
+
+        assert memo_json
+        memo = SerializeMemoizer.deserialize(memo_json, {'Rule': Rule, 'TerminalDef': TerminalDef}, {})
+        if 'grammar' in data:
+            self.grammar = Grammar.deserialize(data['grammar'], memo)
+        options = dict(data['options'])
+        if (set(kwargs) - _LOAD_ALLOWED_OPTIONS) & set(LarkOptions._defaults):
+            raise ConfigurationError("Some options are not allowed when loading a Parser: {}"
+                             .format(set(kwargs) - _LOAD_ALLOWED_OPTIONS))
+        options.update(kwargs)
+        self.options = LarkOptions.deserialize(options, memo)
+        self.rules = [Rule.deserialize(r, memo) for r in data['rules']]
+        self.source_path = '<deserialized>'
+        _validate_frontend_args(self.options.parser, self.options.lexer)
+        self.lexer_conf = self._deserialize_lexer_conf(data['parser'], memo, self.options)
+        self.terminals = self.lexer_conf.terminals
+        self._prepare_callbacks()
+        self._terminals_dict = {t.name: t for t in self.terminals}
+        self.parser = _deserialize_parsing_frontend(
+            data['parser'],
+            memo,
+            self.lexer_conf,
+            self._callbacks,
+            self.options,  ##
+
+        )
+        return self
+
+    @classmethod
+    def _load_from_dict(cls, data, memo, **kwargs):
+        inst = cls.__new__(cls)
+        return inst._load({'data': data, 'memo': memo}, **kwargs)
+
+    @classmethod
+    def open(cls: Type[_T], grammar_filename: str, rel_to: Optional[str]=None, **options) -> _T:
+        #--
+        if rel_to:
+            basepath = os.path.dirname(rel_to)
+            grammar_filename = os.path.join(basepath, grammar_filename)
+        with open(grammar_filename, encoding='utf8') as f:
+            return cls(f, **options)
+
+    @classmethod
+    def open_from_package(cls: Type[_T], package: str, grammar_path: str, search_paths: 'Sequence[str]'=[""], **options) -> _T:
+        #--
+        package_loader = FromPackageLoader(package, search_paths)
+        full_path, text = package_loader(None, grammar_path)
+        options.setdefault('source_path', full_path)
+        options.setdefault('import_paths', [])
+        options['import_paths'].append(package_loader)
+        return cls(text, **options)
+
+    def __repr__(self):
+        return 'Lark(open(%r), parser=%r, lexer=%r, ...)' % (self.source_path, self.options.parser, self.options.lexer)
+
+
+    def lex(self, text: TextOrSlice, dont_ignore: bool=False) -> Iterator[Token]:
+        #--
+        lexer: Lexer
+        if not hasattr(self, 'lexer') or dont_ignore:
+            lexer = self._build_lexer(dont_ignore)
+        else:
+            lexer = self.lexer
+        lexer_thread = LexerThread.from_text(lexer, text)
+        stream = lexer_thread.lex(None)
+        if self.options.postlex:
+            return self.options.postlex.process(stream)
+        return stream
+
+    def get_terminal(self, name: str) -> TerminalDef:
+        #--
+        return self._terminals_dict[name]
+
+    def parse_interactive(self, text: Optional[LarkInput]=None, start: Optional[str]=None) -> 'InteractiveParser':
+        #--
+        return self.parser.parse_interactive(text, start=start)
+
+    def parse(self, text: LarkInput, start: Optional[str]=None, on_error: 'Optional[Callable[[UnexpectedInput], bool]]'=None) -> 'ParseTree':
+        #--
+        if on_error is not None and self.options.parser != 'lalr':
+            raise NotImplementedError("The on_error option is only implemented for the LALR(1) parser.")
+        return self.parser.parse(text, start=start, on_error=on_error)
+
+
+
+
+class DedentError(LarkError):
+    pass
+
+class Indenter(PostLex, ABC):
+    #--
+    paren_level: int
+    indent_level: List[int]
+
+    def __init__(self) -> None:
+        self.paren_level = 0
+        self.indent_level = [0]
+        assert self.tab_len > 0
+
+    def handle_NL(self, token: Token) -> Iterator[Token]:
+        if self.paren_level > 0:
+            return
+
+        yield token
+
+        indent_str = token.rsplit('\n', 1)[1] ##
+
+        indent = indent_str.count(' ') + indent_str.count('\t') * self.tab_len
+
+        if indent > self.indent_level[-1]:
+            self.indent_level.append(indent)
+            yield Token.new_borrow_pos(self.INDENT_type, indent_str, token)
+        else:
+            while indent < self.indent_level[-1]:
+                self.indent_level.pop()
+                yield Token.new_borrow_pos(self.DEDENT_type, indent_str, token)
+
+            if indent != self.indent_level[-1]:
+                raise DedentError('Unexpected dedent to column %s. Expected dedent to %s' % (indent, self.indent_level[-1]))
+
+    def _process(self, stream):
+        token = None
+        for token in stream:
+            if token.type == self.NL_type:
+                yield from self.handle_NL(token)
+            else:
+                yield token
+
+            if token.type in self.OPEN_PAREN_types:
+                self.paren_level += 1
+            elif token.type in self.CLOSE_PAREN_types:
+                self.paren_level -= 1
+                assert self.paren_level >= 0
+
+        while len(self.indent_level) > 1:
+            self.indent_level.pop()
+            yield Token.new_borrow_pos(self.DEDENT_type, '', token) if token else Token(self.DEDENT_type, '', 0, 0, 0, 0, 0, 0)
+
+        assert self.indent_level == [0], self.indent_level
+
+    def process(self, stream):
+        self.paren_level = 0
+        self.indent_level = [0]
+        return self._process(stream)
+
+    ##
+
+    @property
+    def always_accept(self):
+        return (self.NL_type,)
+
+    @property
+    @abstractmethod
+    def NL_type(self) -> str:
+        #--
+        raise NotImplementedError()
+
+    @property
+    @abstractmethod
+    def OPEN_PAREN_types(self) -> List[str]:
+        #--
+        raise NotImplementedError()
+
+    @property
+    @abstractmethod
+    def CLOSE_PAREN_types(self) -> List[str]:
+        #--
+        raise NotImplementedError()
+
+    @property
+    @abstractmethod
+    def INDENT_type(self) -> str:
+        #--
+        raise NotImplementedError()
+
+    @property
+    @abstractmethod
+    def DEDENT_type(self) -> str:
+        #--
+        raise NotImplementedError()
+
+    @property
+    @abstractmethod
+    def tab_len(self) -> int:
+        #--
+        raise NotImplementedError()
+
+
+class PythonIndenter(Indenter):
+    #--
+
+    NL_type = '_NEWLINE'
+    OPEN_PAREN_types = ['LPAR', 'LSQB', 'LBRACE']
+    CLOSE_PAREN_types = ['RPAR', 'RSQB', 'RBRACE']
+    INDENT_type = '_INDENT'
+    DEDENT_type = '_DEDENT'
+    tab_len = 8
+
+
+import pickle, zlib, base64
+DATA = (
+{'parser': {'lexer_conf': {'terminals': [{'@': 0}, {'@': 1}, {'@': 2}, {'@': 3}, {'@': 4}, {'@': 5}, {'@': 6}, {'@': 7}, {'@': 8}, {'@': 9}, {'@': 10}, {'@': 11}, {'@': 12}, {'@': 13}, {'@': 14}, {'@': 15}, {'@': 16}, {'@': 17}, {'@': 18}, {'@': 19}, {'@': 20}, {'@': 21}, {'@': 22}, {'@': 23}, {'@': 24}, {'@': 25}, {'@': 26}, {'@': 27}, {'@': 28}, {'@': 29}, {'@': 30}, {'@': 31}, {'@': 32}, {'@': 33}, {'@': 34}, {'@': 35}, {'@': 36}, {'@': 37}, {'@': 38}, {'@': 39}, {'@': 40}, {'@': 41}, {'@': 42}, {'@': 43}, {'@': 44}, {'@': 45}, {'@': 46}, {'@': 47}, {'@': 48}, {'@': 49}, {'@': 50}, {'@': 51}, {'@': 52}, {'@': 53}, {'@': 54}, {'@': 55}, {'@': 56}, {'@': 57}, {'@': 58}, {'@': 59}], 'ignore': ['WS', 'COMMENT'], 'g_regex_flags': 0, 'use_bytes': False, 'lexer_type': 'contextual', '__type__': 'LexerConf'}, 'parser_conf': {'rules': [{'@': 60}, {'@': 61}, {'@': 62}, {'@': 63}, {'@': 64}, {'@': 65}, {'@': 66}, {'@': 67}, {'@': 68}, {'@': 69}, {'@': 70}, {'@': 71}, {'@': 72}, {'@': 73}, {'@': 74}, {'@': 75}, {'@': 76}, {'@': 77}, {'@': 78}, {'@': 79}, {'@': 80}, {'@': 81}, {'@': 82}, {'@': 83}, {'@': 84}, {'@': 85}, {'@': 86}, {'@': 87}, {'@': 88}, {'@': 89}, {'@': 90}, {'@': 91}, {'@': 92}, {'@': 93}, {'@': 94}, {'@': 95}, {'@': 96}, {'@': 97}, {'@': 98}, {'@': 99}, {'@': 100}, {'@': 101}, {'@': 102}, {'@': 103}, {'@': 104}, {'@': 105}, {'@': 106}, {'@': 107}, {'@': 108}, {'@': 109}, {'@': 110}, {'@': 111}, {'@': 112}, {'@': 113}, {'@': 114}, {'@': 115}, {'@': 116}, {'@': 117}, {'@': 118}, {'@': 119}, {'@': 120}, {'@': 121}, {'@': 122}, {'@': 123}, {'@': 124}, {'@': 125}, {'@': 126}, {'@': 127}, {'@': 128}, {'@': 129}, {'@': 130}, {'@': 131}, {'@': 132}, {'@': 133}, {'@': 134}, {'@': 135}, {'@': 136}, {'@': 137}, {'@': 138}, {'@': 139}, {'@': 140}, {'@': 141}, {'@': 142}, {'@': 143}, {'@': 144}, {'@': 145}, {'@': 146}, {'@': 147}, {'@': 148}, {'@': 149}, {'@': 150}, {'@': 151}, {'@': 152}, {'@': 153}, {'@': 154}, {'@': 155}, {'@': 156}, {'@': 157}, {'@': 158}, {'@': 159}, {'@': 160}, {'@': 161}, {'@': 162}, {'@': 163}, {'@': 164}, {'@': 165}, {'@': 166}, {'@': 167}, {'@': 168}, {'@': 169}, {'@': 170}, {'@': 171}, {'@': 172}, {'@': 173}, {'@': 174}, {'@': 175}, {'@': 176}, {'@': 177}, {'@': 178}, {'@': 179}, {'@': 180}, {'@': 181}, {'@': 182}, {'@': 183}, {'@': 184}, {'@': 185}, {'@': 186}, {'@': 187}, {'@': 188}, {'@': 189}, {'@': 190}, {'@': 191}, {'@': 192}, {'@': 193}, {'@': 194}, {'@': 195}, {'@': 196}, {'@': 197}, {'@': 198}, {'@': 199}, {'@': 200}, {'@': 201}, {'@': 202}, {'@': 203}, {'@': 204}, {'@': 205}, {'@': 206}, {'@': 207}, {'@': 208}, {'@': 209}, {'@': 210}, {'@': 211}, {'@': 212}, {'@': 213}, {'@': 214}, {'@': 215}, {'@': 216}, {'@': 217}, {'@': 218}, {'@': 219}, {'@': 220}, {'@': 221}, {'@': 222}, {'@': 223}, {'@': 224}, {'@': 225}, {'@': 226}, {'@': 227}, {'@': 228}, {'@': 229}, {'@': 230}, {'@': 231}, {'@': 232}, {'@': 233}, {'@': 234}, {'@': 235}, {'@': 236}, {'@': 237}, {'@': 238}, {'@': 239}, {'@': 240}, {'@': 241}, {'@': 242}, {'@': 243}, {'@': 244}, {'@': 245}], 'start': ['start'], 'parser_type': 'lalr', '__type__': 'ParserConf'}, 'parser': {'tokens': {0: 'LPAR', 1: 'multiplication', 2: 'NUMBER', 3: 'STRING', 4: 'comparison', 5: 'LBRACE', 6: 'unary', 7: 'addition', 8: 'equality', 9: 'member_access', 10: 'object_literal', 11: 'MINUS', 12: 'primary', 13: 'LSQB', 14: 'BANG', 15: 'IDENTIFIER', 16: 'array_access', 17: 'arrow_function', 18: 'BOOLEAN', 19: 'FN', 20: 'logical_and', 21: 'literal', 22: 'array_literal', 23: 'function_call', 24: 'PLUS', 25: '__ANON_2', 26: 'DOT', 27: '__ANON_3', 28: 'LESSTHAN', 29: 'SEMICOLON', 30: 'RBRACE', 31: 'MORETHAN', 32: 'SLASH', 33: '__ANON_5', 34: 'RPAR', 35: 'QMARK', 36: 'STAR', 37: '__ANON_4', 38: 'COMMA', 39: 'RSQB', 40: 'FLOORDIV', 41: 'PERCENT', 42: 'COLON', 43: '__ANON_0', 44: '__ANON_1', 45: '$END', 46: 'WHILE', 47: 'IF', 48: 'FOR', 49: 'FUNCTION', 50: 'CAPABILITY', 51: 'NONLOCAL', 52: 'IMPORT', 53: 'BREAK', 54: 'CONTINUE', 55: 'RETURN', 56: 'TRY', 57: 'THROW', 58: 'ternary', 59: 'logical_or', 60: 'expression', 61: 'return_statement', 62: 'throw_statement', 63: '__program_star_0', 64: 'assignment_target', 65: 'object_destructuring', 66: 'while_statement', 67: 'capability_declaration', 68: 'array_destructuring', 69: 'nonlocal_statement', 70: 'function_definition', 71: 'if_statement', 72: 'statement', 73: 'try_statement', 74: 'destructuring_pattern', 75: 'expression_statement', 76: 'destructuring_statement', 77: 'import_statement', 78: 'break_statement', 79: 'start', 80: 'for_statement', 81: 'assignment_statement', 82: 'continue_statement', 83: 'program', 84: 'object_property', 85: 'EQUAL', 86: 'capability_name', 87: 'statement_block', 88: '__nonlocal_statement_star_7', 89: 'argument_list', 90: 'arrow_body', 91: 'arrow_block', 92: 'RESOURCE', 93: '__capability_declaration_star_1', 94: 'resource_pattern', 95: 'ALLOW', 96: 'capability_item', 97: 'permission_grant', 98: 'import_target', 99: '__function_definition_star_3', 100: 'FINALLY', 101: 'EXCEPT', 102: 'permission_target', 103: 'parameter_list', 104: 'parameter', 105: '__if_statement_star_5', 106: 'elif_clause', 107: 'ELIF', 108: 'ELSE', 109: '__argument_list_star_8', 110: 'slice_end', 111: 'slice_step', 112: 'IN', 113: 'AS', 114: '__ANON_6', 115: '__try_statement_star_6', 116: 'except_clause', 117: 'finally_clause', 118: '__parameter_list_star_4', 119: 'slice_start', 120: 'slice_expression', 121: '__object_literal_star_9', 122: 'SYSTEM', 123: 'READ', 124: 'permission_type', 125: 'WRITE', 126: 'EXECUTE', 127: 'NETWORK', 128: '__import_target_star_2', 129: 'type_annotation'}, 'states': {0: {0: (0, 327)}, 1: {1: (0, 44), 2: (0, 29), 3: (0, 81), 4: (0, 75), 5: (0, 68), 6: (0, 12), 7: (0, 2), 8: (0, 43), 9: (0, 288), 10: (0, 31), 11: (0, 70), 12: (0, 34), 13: (0, 290), 14: (0, 10), 15: (0, 322), 16: (0, 296), 17: (0, 72), 18: (0, 76), 19: (0, 25), 20: (0, 189), 0: (0, 97), 21: (0, 27), 22: (0, 98), 23: (0, 20)}, 2: {24: (0, 22), 11: (0, 21), 25: (1, {'@': 151}), 26: (1, {'@': 151}), 27: (1, {'@': 151}), 28: (1, {'@': 151}), 29: (1, {'@': 151}), 30: (1, {'@': 151}), 31: (1, {'@': 151}), 32: (1, {'@': 151}), 33: (1, {'@': 151}), 34: (1, {'@': 151}), 35: (1, {'@': 151}), 36: (1, {'@': 151}), 37: (1, {'@': 151}), 38: (1, {'@': 151}), 39: (1, {'@': 151}), 40: (1, {'@': 151}), 41: (1, {'@': 151}), 42: (1, {'@': 151}), 43: (1, {'@': 151}), 13: (1, {'@': 151}), 44: (1, {'@': 151})}, 3: {45: (1, {'@': 138}), 19: (1, {'@': 138}), 15: (1, {'@': 138}), 46: (1, {'@': 138}), 14: (1, {'@': 138}), 47: (1, {'@': 138}), 48: (1, {'@': 138}), 49: (1, {'@': 138}), 11: (1, {'@': 138}), 50: (1, {'@': 138}), 51: (1, {'@': 138}), 2: (1, {'@': 138}), 52: (1, {'@': 138}), 5: (1, {'@': 138}), 53: (1, {'@': 138}), 3: (1, {'@': 138}), 54: (1, {'@': 138}), 55: (1, {'@': 138}), 0: (1, {'@': 138}), 13: (1, {'@': 138}), 18: (1, {'@': 138}), 56: (1, {'@': 138}), 57: (1, {'@': 138}), 30: (1, {'@': 138})}, 4: {1: (0, 44), 2: (0, 29), 3: (0, 81), 4: (0, 131), 5: (0, 68), 6: (0, 12), 7: (0, 2), 9: (0, 288), 10: (0, 31), 11: (0, 70), 12: (0, 34), 13: (0, 290), 14: (0, 10), 15: (0, 322), 16: (0, 296), 17: (0, 72), 18: (0, 76), 19: (0, 25), 0: (0, 97), 21: (0, 27), 22: (0, 98), 23: (0, 20)}, 5: {1: (0, 44), 2: (0, 29), 3: (0, 81), 4: (0, 75), 5: (0, 68), 6: (0, 12), 7: (0, 2), 8: (0, 43), 20: (0, 93), 9: (0, 288), 10: (0, 31), 11: (0, 70), 12: (0, 34), 13: (0, 290), 58: (0, 15), 14: (0, 10), 15: (0, 322), 16: (0, 296), 17: (0, 72), 59: (0, 96), 18: (0, 76), 60: (0, 150), 19: (0, 25), 0: (0, 97), 21: (0, 27), 22: (0, 98), 23: (0, 20)}, 6: {61: (0, 41), 3: (0, 81), 6: (0, 12), 9: (0, 69), 62: (0, 55), 63: (0, 83), 57: (0, 42), 8: (0, 43), 1: (0, 44), 64: (0, 38), 12: (0, 34), 65: (0, 33), 13: (0, 30), 58: (0, 15), 16: (0, 19), 60: (0, 74), 48: (0, 56), 66: (0, 89), 5: (0, 39), 7: (0, 2), 52: (0, 94), 18: (0, 76), 67: (0, 60), 22: (0, 98), 56: (0, 79), 68: (0, 92), 69: (0, 91), 4: (0, 75), 50: (0, 48), 10: (0, 31), 14: (0, 10), 15: (0, 24), 59: (0, 96), 54: (0, 95), 20: (0, 93), 0: (0, 97), 70: (0, 13), 71: (0, 53), 72: (0, 8), 49: (0, 18), 73: (0, 62), 17: (0, 72), 53: (0, 46), 55: (0, 67), 51: (0, 7), 46: (0, 17), 21: (0, 27), 23: (0, 20), 47: (0, 0), 74: (0, 28), 19: (0, 25), 75: (0, 37), 76: (0, 26), 2: (0, 29), 77: (0, 50), 78: (0, 36), 11: (0, 70), 79: (0, 122), 80: (0, 125), 81: (0, 130), 82: (0, 136), 83: (0, 139), 45: (1, {'@': 62})}, 7: {15: (0, 105)}, 8: {45: (1, {'@': 224}), 19: (1, {'@': 224}), 15: (1, {'@': 224}), 46: (1, {'@': 224}), 14: (1, {'@': 224}), 47: (1, {'@': 224}), 48: (1, {'@': 224}), 11: (1, {'@': 224}), 50: (1, {'@': 224}), 2: (1, {'@': 224}), 52: (1, {'@': 224}), 13: (1, {'@': 224}), 49: (1, {'@': 224}), 51: (1, {'@': 224}), 5: (1, {'@': 224}), 53: (1, {'@': 224}), 3: (1, {'@': 224}), 54: (1, {'@': 224}), 55: (1, {'@': 224}), 0: (1, {'@': 224}), 18: (1, {'@': 224}), 56: (1, {'@': 224}), 57: (1, {'@': 224})}, 9: {29: (1, {'@': 68})}, 10: {2: (0, 29), 3: (0, 81), 5: (0, 68), 6: (0, 321), 9: (0, 288), 10: (0, 31), 11: (0, 70), 12: (0, 34), 13: (0, 290), 14: (0, 10), 15: (0, 322), 16: (0, 296), 17: (0, 72), 18: (0, 76), 19: (0, 25), 0: (0, 97), 21: (0, 27), 22: (0, 98), 23: (0, 20)}, 11: {1: (0, 44), 2: (0, 29), 3: (0, 81), 4: (0, 75), 5: (0, 68), 6: (0, 12), 7: (0, 2), 8: (0, 43), 20: (0, 93), 9: (0, 288), 10: (0, 31), 11: (0, 70), 60: (0, 219), 12: (0, 34), 13: (0, 290), 58: (0, 15), 14: (0, 10), 15: (0, 322), 16: (0, 296), 17: (0, 72), 59: (0, 96), 18: (0, 76), 19: (0, 25), 0: (0, 97), 21: (0, 27), 22: (0, 98), 23: (0, 20)}, 12: {24: (1, {'@': 159}), 25: (1, {'@': 159}), 26: (1, {'@': 159}), 27: (1, {'@': 159}), 28: (1, {'@': 159}), 29: (1, {'@': 159}), 30: (1, {'@': 159}), 31: (1, {'@': 159}), 32: (1, {'@': 159}), 11: (1, {'@': 159}), 33: (1, {'@': 159}), 34: (1, {'@': 159}), 35: (1, {'@': 159}), 36: (1, {'@': 159}), 37: (1, {'@': 159}), 38: (1, {'@': 159}), 39: (1, {'@': 159}), 40: (1, {'@': 159}), 41: (1, {'@': 159}), 42: (1, {'@': 159}), 43: (1, {'@': 159}), 13: (1, {'@': 159}), 44: (1, {'@': 159})}, 13: {45: (1, {'@': 93}), 19: (1, {'@': 93}), 15: (1, {'@': 93}), 46: (1, {'@': 93}), 14: (1, {'@': 93}), 47: (1, {'@': 93}), 48: (1, {'@': 93}), 49: (1, {'@': 93}), 11: (1, {'@': 93}), 50: (1, {'@': 93}), 51: (1, {'@': 93}), 2: (1, {'@': 93}), 52: (1, {'@': 93}), 5: (1, {'@': 93}), 53: (1, {'@': 93}), 3: (1, {'@': 93}), 54: (1, {'@': 93}), 55: (1, {'@': 93}), 0: (1, {'@': 93}), 13: (1, {'@': 93}), 18: (1, {'@': 93}), 56: (1, {'@': 93}), 57: (1, {'@': 93}), 30: (1, {'@': 93})}, 14: {15: (0, 134), 84: (0, 40), 3: (0, 279)}, 15: {29: (1, {'@': 141}), 39: (1, {'@': 141}), 38: (1, {'@': 141}), 24: (1, {'@': 141}), 25: (1, {'@': 141}), 26: (1, {'@': 141}), 27: (1, {'@': 141}), 28: (1, {'@': 141}), 30: (1, {'@': 141}), 31: (1, {'@': 141}), 32: (1, {'@': 141}), 11: (1, {'@': 141}), 33: (1, {'@': 141}), 34: (1, {'@': 141}), 35: (1, {'@': 141}), 36: (1, {'@': 141}), 37: (1, {'@': 141}), 40: (1, {'@': 141}), 41: (1, {'@': 141}), 42: (1, {'@': 141}), 43: (1, {'@': 141}), 13: (1, {'@': 141}), 44: (1, {'@': 141})}, 16: {1: (0, 44), 2: (0, 29), 3: (0, 81), 5: (0, 68), 6: (0, 12), 7: (0, 192), 9: (0, 288), 10: (0, 31), 11: (0, 70), 12: (0, 34), 13: (0, 290), 14: (0, 10), 15: (0, 322), 16: (0, 296), 17: (0, 72), 18: (0, 76), 19: (0, 25), 0: (0, 97), 21: (0, 27), 22: (0, 98), 23: (0, 20)}, 17: {0: (0, 110)}, 18: {15: (0, 66)}, 19: {85: (1, {'@': 107}), 24: (1, {'@': 170}), 25: (1, {'@': 170}), 26: (1, {'@': 170}), 27: (1, {'@': 170}), 28: (1, {'@': 170}), 29: (1, {'@': 170}), 31: (1, {'@': 170}), 32: (1, {'@': 170}), 11: (1, {'@': 170}), 33: (1, {'@': 170}), 35: (1, {'@': 170}), 36: (1, {'@': 170}), 37: (1, {'@': 170}), 40: (1, {'@': 170}), 41: (1, {'@': 170}), 43: (1, {'@': 170}), 13: (1, {'@': 170}), 44: (1, {'@': 170})}, 20: {24: (1, {'@': 169}), 25: (1, {'@': 169}), 26: (1, {'@': 169}), 27: (1, {'@': 169}), 28: (1, {'@': 169}), 29: (1, {'@': 169}), 30: (1, {'@': 169}), 31: (1, {'@': 169}), 32: (1, {'@': 169}), 11: (1, {'@': 169}), 33: (1, {'@': 169}), 34: (1, {'@': 169}), 35: (1, {'@': 169}), 36: (1, {'@': 169}), 37: (1, {'@': 169}), 38: (1, {'@': 169}), 39: (1, {'@': 169}), 40: (1, {'@': 169}), 41: (1, {'@': 169}), 42: (1, {'@': 169}), 43: (1, {'@': 169}), 13: (1, {'@': 169}), 44: (1, {'@': 169})}, 21: {1: (0, 184), 2: (0, 29), 3: (0, 81), 5: (0, 68), 6: (0, 12), 9: (0, 288), 10: (0, 31), 11: (0, 70), 12: (0, 34), 13: (0, 290), 14: (0, 10), 15: (0, 322), 16: (0, 296), 17: (0, 72), 18: (0, 76), 19: (0, 25), 0: (0, 97), 21: (0, 27), 22: (0, 98), 23: (0, 20)}, 22: {1: (0, 183), 2: (0, 29), 3: (0, 81), 5: (0, 68), 6: (0, 12), 9: (0, 288), 10: (0, 31), 11: (0, 70), 12: (0, 34), 13: (0, 290), 14: (0, 10), 15: (0, 322), 16: (0, 296), 17: (0, 72), 18: (0, 76), 19: (0, 25), 0: (0, 97), 21: (0, 27), 22: (0, 98), 23: (0, 20)}, 23: {45: (1, {'@': 139}), 19: (1, {'@': 139}), 15: (1, {'@': 139}), 46: (1, {'@': 139}), 14: (1, {'@': 139}), 47: (1, {'@': 139}), 48: (1, {'@': 139}), 49: (1, {'@': 139}), 11: (1, {'@': 139}), 50: (1, {'@': 139}), 51: (1, {'@': 139}), 2: (1, {'@': 139}), 52: (1, {'@': 139}), 5: (1, {'@': 139}), 53: (1, {'@': 139}), 3: (1, {'@': 139}), 54: (1, {'@': 139}), 55: (1, {'@': 139}), 0: (1, {'@': 139}), 13: (1, {'@': 139}), 18: (1, {'@': 139}), 56: (1, {'@': 139}), 57: (1, {'@': 139}), 30: (1, {'@': 139})}, 24: {0: (0, 318), 85: (1, {'@': 106}), 24: (1, {'@': 168}), 25: (1, {'@': 168}), 26: (1, {'@': 168}), 27: (1, {'@': 168}), 28: (1, {'@': 168}), 29: (1, {'@': 168}), 31: (1, {'@': 168}), 32: (1, {'@': 168}), 11: (1, {'@': 168}), 33: (1, {'@': 168}), 35: (1, {'@': 168}), 36: (1, {'@': 168}), 37: (1, {'@': 168}), 40: (1, {'@': 168}), 41: (1, {'@': 168}), 43: (1, {'@': 168}), 13: (1, {'@': 168}), 44: (1, {'@': 168})}, 25: {0: (0, 118)}, 26: {45: (1, {'@': 92}), 19: (1, {'@': 92}), 15: (1, {'@': 92}), 46: (1, {'@': 92}), 14: (1, {'@': 92}), 47: (1, {'@': 92}), 48: (1, {'@': 92}), 49: (1, {'@': 92}), 11: (1, {'@': 92}), 50: (1, {'@': 92}), 51: (1, {'@': 92}), 2: (1, {'@': 92}), 52: (1, {'@': 92}), 5: (1, {'@': 92}), 53: (1, {'@': 92}), 3: (1, {'@': 92}), 54: (1, {'@': 92}), 55: (1, {'@': 92}), 0: (1, {'@': 92}), 13: (1, {'@': 92}), 18: (1, {'@': 92}), 56: (1, {'@': 92}), 57: (1, {'@': 92}), 30: (1, {'@': 92})}, 27: {24: (1, {'@': 167}), 25: (1, {'@': 167}), 26: (1, {'@': 167}), 27: (1, {'@': 167}), 28: (1, {'@': 167}), 29: (1, {'@': 167}), 30: (1, {'@': 167}), 31: (1, {'@': 167}), 32: (1, {'@': 167}), 11: (1, {'@': 167}), 33: (1, {'@': 167}), 34: (1, {'@': 167}), 35: (1, {'@': 167}), 36: (1, {'@': 167}), 37: (1, {'@': 167}), 38: (1, {'@': 167}), 39: (1, {'@': 167}), 40: (1, {'@': 167}), 41: (1, {'@': 167}), 42: (1, {'@': 167}), 43: (1, {'@': 167}), 13: (1, {'@': 167}), 44: (1, {'@': 167})}, 28: {85: (0, 11)}, 29: {24: (1, {'@': 198}), 25: (1, {'@': 198}), 26: (1, {'@': 198}), 27: (1, {'@': 198}), 28: (1, {'@': 198}), 29: (1, {'@': 198}), 30: (1, {'@': 198}), 31: (1, {'@': 198}), 32: (1, {'@': 198}), 11: (1, {'@': 198}), 33: (1, {'@': 198}), 34: (1, {'@': 198}), 35: (1, {'@': 198}), 36: (1, {'@': 198}), 37: (1, {'@': 198}), 38: (1, {'@': 198}), 39: (1, {'@': 198}), 40: (1, {'@': 198}), 41: (1, {'@': 198}), 42: (1, {'@': 198}), 43: (1, {'@': 198}), 13: (1, {'@': 198}), 44: (1, {'@': 198})}, 30: {1: (0, 44), 15: (0, 282), 2: (0, 29), 3: (0, 81), 39: (0, 284), 4: (0, 75), 5: (0, 68), 6: (0, 12), 60: (0, 285), 7: (0, 2), 8: (0, 43), 20: (0, 93), 9: (0, 288), 10: (0, 31), 11: (0, 70), 12: (0, 34), 13: (0, 290), 58: (0, 15), 14: (0, 10), 16: (0, 296), 17: (0, 72), 59: (0, 96), 18: (0, 76), 19: (0, 25), 0: (0, 97), 21: (0, 27), 22: (0, 98), 23: (0, 20)}, 31: {24: (1, {'@': 202}), 25: (1, {'@': 202}), 26: (1, {'@': 202}), 27: (1, {'@': 202}), 28: (1, {'@': 202}), 29: (1, {'@': 202}), 30: (1, {'@': 202}), 31: (1, {'@': 202}), 32: (1, {'@': 202}), 11: (1, {'@': 202}), 33: (1, {'@': 202}), 34: (1, {'@': 202}), 35: (1, {'@': 202}), 36: (1, {'@': 202}), 37: (1, {'@': 202}), 38: (1, {'@': 202}), 39: (1, {'@': 202}), 40: (1, {'@': 202}), 41: (1, {'@': 202}), 42: (1, {'@': 202}), 43: (1, {'@': 202}), 13: (1, {'@': 202}), 44: (1, {'@': 202})}, 32: {85: (1, {'@': 215})}, 33: {85: (1, {'@': 212})}, 34: {26: (0, 214), 13: (0, 229), 24: (1, {'@': 164}), 25: (1, {'@': 164}), 27: (1, {'@': 164}), 28: (1, {'@': 164}), 29: (1, {'@': 164}), 30: (1, {'@': 164}), 31: (1, {'@': 164}), 32: (1, {'@': 164}), 11: (1, {'@': 164}), 33: (1, {'@': 164}), 34: (1, {'@': 164}), 35: (1, {'@': 164}), 36: (1, {'@': 164}), 37: (1, {'@': 164}), 38: (1, {'@': 164}), 39: (1, {'@': 164}), 40: (1, {'@': 164}), 41: (1, {'@': 164}), 42: (1, {'@': 164}), 43: (1, {'@': 164}), 44: (1, {'@': 164})}, 35: {1: (0, 44), 2: (0, 29), 3: (0, 81), 4: (0, 75), 5: (0, 68), 6: (0, 12), 7: (0, 2), 60: (0, 135), 8: (0, 43), 20: (0, 93), 9: (0, 288), 10: (0, 31), 11: (0, 70), 12: (0, 34), 13: (0, 290), 58: (0, 15), 14: (0, 10), 15: (0, 322), 16: (0, 296), 17: (0, 72), 59: (0, 96), 18: (0, 76), 19: (0, 25), 0: (0, 97), 21: (0, 27), 22: (0, 98), 23: (0, 20)}, 36: {45: (1, {'@': 100}), 19: (1, {'@': 100}), 15: (1, {'@': 100}), 46: (1, {'@': 100}), 14: (1, {'@': 100}), 47: (1, {'@': 100}), 48: (1, {'@': 100}), 49: (1, {'@': 100}), 11: (1, {'@': 100}), 50: (1, {'@': 100}), 51: (1, {'@': 100}), 2: (1, {'@': 100}), 52: (1, {'@': 100}), 5: (1, {'@': 100}), 53: (1, {'@': 100}), 3: (1, {'@': 100}), 54: (1, {'@': 100}), 55: (1, {'@': 100}), 0: (1, {'@': 100}), 13: (1, {'@': 100}), 18: (1, {'@': 100}), 56: (1, {'@': 100}), 57: (1, {'@': 100}), 30: (1, {'@': 100})}, 37: {45: (1, {'@': 90}), 19: (1, {'@': 90}), 15: (1, {'@': 90}), 46: (1, {'@': 90}), 14: (1, {'@': 90}), 47: (1, {'@': 90}), 48: (1, {'@': 90}), 49: (1, {'@': 90}), 11: (1, {'@': 90}), 50: (1, {'@': 90}), 51: (1, {'@': 90}), 2: (1, {'@': 90}), 52: (1, {'@': 90}), 5: (1, {'@': 90}), 53: (1, {'@': 90}), 3: (1, {'@': 90}), 54: (1, {'@': 90}), 55: (1, {'@': 90}), 0: (1, {'@': 90}), 13: (1, {'@': 90}), 18: (1, {'@': 90}), 56: (1, {'@': 90}), 57: (1, {'@': 90}), 30: (1, {'@': 90})}, 38: {85: (0, 5)}, 39: {15: (0, 58), 84: (0, 273), 30: (0, 274), 3: (0, 279)}, 40: {30: (1, {'@': 244}), 38: (1, {'@': 244})}, 41: {45: (1, {'@': 97}), 19: (1, {'@': 97}), 15: (1, {'@': 97}), 46: (1, {'@': 97}), 14: (1, {'@': 97}), 47: (1, {'@': 97}), 48: (1, {'@': 97}), 49: (1, {'@': 97}), 11: (1, {'@': 97}), 50: (1, {'@': 97}), 51: (1, {'@': 97}), 2: (1, {'@': 97}), 52: (1, {'@': 97}), 5: (1, {'@': 97}), 53: (1, {'@': 97}), 3: (1, {'@': 97}), 54: (1, {'@': 97}), 55: (1, {'@': 97}), 0: (1, {'@': 97}), 13: (1, {'@': 97}), 18: (1, {'@': 97}), 56: (1, {'@': 97}), 57: (1, {'@': 97}), 30: (1, {'@': 97})}, 42: {10: (0, 88), 5: (0, 68)}, 43: {25: (0, 4), 27: (0, 87), 24: (1, {'@': 146}), 26: (1, {'@': 146}), 28: (1, {'@': 146}), 29: (1, {'@': 146}), 30: (1, {'@': 146}), 31: (1, {'@': 146}), 32: (1, {'@': 146}), 11: (1, {'@': 146}), 33: (1, {'@': 146}), 34: (1, {'@': 146}), 35: (1, {'@': 146}), 36: (1, {'@': 146}), 37: (1, {'@': 146}), 38: (1, {'@': 146}), 39: (1, {'@': 146}), 40: (1, {'@': 146}), 41: (1, {'@': 146}), 42: (1, {'@': 146}), 43: (1, {'@': 146}), 13: (1, {'@': 146}), 44: (1, {'@': 146})}, 44: {40: (0, 45), 41: (0, 146), 36: (0, 162), 32: (0, 178), 24: (1, {'@': 156}), 25: (1, {'@': 156}), 26: (1, {'@': 156}), 27: (1, {'@': 156}), 28: (1, {'@': 156}), 29: (1, {'@': 156}), 30: (1, {'@': 156}), 31: (1, {'@': 156}), 11: (1, {'@': 156}), 33: (1, {'@': 156}), 34: (1, {'@': 156}), 35: (1, {'@': 156}), 37: (1, {'@': 156}), 38: (1, {'@': 156}), 39: (1, {'@': 156}), 42: (1, {'@': 156}), 43: (1, {'@': 156}), 13: (1, {'@': 156}), 44: (1, {'@': 156})}, 45: {2: (0, 29), 3: (0, 81), 5: (0, 68), 9: (0, 288), 10: (0, 31), 11: (0, 70), 12: (0, 34), 13: (0, 290), 14: (0, 10), 15: (0, 322), 16: (0, 296), 17: (0, 72), 6: (0, 121), 18: (0, 76), 19: (0, 25), 0: (0, 97), 21: (0, 27), 22: (0, 98), 23: (0, 20)}, 46: {29: (0, 331)}, 47: {15: (0, 319)}, 48: {86: (0, 299), 15: (0, 302)}, 49: {34: (1, {'@': 89}), 38: (1, {'@': 89})}, 50: {45: (1, {'@': 223}), 19: (1, {'@': 223}), 15: (1, {'@': 223}), 46: (1, {'@': 223}), 14: (1, {'@': 223}), 47: (1, {'@': 223}), 48: (1, {'@': 223}), 11: (1, {'@': 223}), 50: (1, {'@': 223}), 2: (1, {'@': 223}), 52: (1, {'@': 223}), 13: (1, {'@': 223}), 49: (1, {'@': 223}), 51: (1, {'@': 223}), 5: (1, {'@': 223}), 53: (1, {'@': 223}), 3: (1, {'@': 223}), 54: (1, {'@': 223}), 55: (1, {'@': 223}), 0: (1, {'@': 223}), 18: (1, {'@': 223}), 56: (1, {'@': 223}), 57: (1, {'@': 223})}, 51: {24: (1, {'@': 206}), 25: (1, {'@': 206}), 26: (1, {'@': 206}), 27: (1, {'@': 206}), 28: (1, {'@': 206}), 29: (1, {'@': 206}), 30: (1, {'@': 206}), 31: (1, {'@': 206}), 32: (1, {'@': 206}), 11: (1, {'@': 206}), 33: (1, {'@': 206}), 34: (1, {'@': 206}), 35: (1, {'@': 206}), 36: (1, {'@': 206}), 37: (1, {'@': 206}), 38: (1, {'@': 206}), 39: (1, {'@': 206}), 40: (1, {'@': 206}), 41: (1, {'@': 206}), 42: (1, {'@': 206}), 43: (1, {'@': 206}), 13: (1, {'@': 206}), 44: (1, {'@': 206})}, 52: {24: (1, {'@': 173}), 25: (1, {'@': 173}), 26: (1, {'@': 173}), 27: (1, {'@': 173}), 28: (1, {'@': 173}), 29: (1, {'@': 173}), 30: (1, {'@': 173}), 31: (1, {'@': 173}), 32: (1, {'@': 173}), 11: (1, {'@': 173}), 33: (1, {'@': 173}), 34: (1, {'@': 173}), 35: (1, {'@': 173}), 36: (1, {'@': 173}), 37: (1, {'@': 173}), 38: (1, {'@': 173}), 39: (1, {'@': 173}), 40: (1, {'@': 173}), 41: (1, {'@': 173}), 42: (1, {'@': 173}), 43: (1, {'@': 173}), 13: (1, {'@': 173}), 44: (1, {'@': 173})}, 53: {45: (1, {'@': 94}), 19: (1, {'@': 94}), 15: (1, {'@': 94}), 46: (1, {'@': 94}), 14: (1, {'@': 94}), 47: (1, {'@': 94}), 48: (1, {'@': 94}), 49: (1, {'@': 94}), 11: (1, {'@': 94}), 50: (1, {'@': 94}), 51: (1, {'@': 94}), 2: (1, {'@': 94}), 52: (1, {'@': 94}), 5: (1, {'@': 94}), 53: (1, {'@': 94}), 3: (1, {'@': 94}), 54: (1, {'@': 94}), 55: (1, {'@': 94}), 0: (1, {'@': 94}), 13: (1, {'@': 94}), 18: (1, {'@': 94}), 56: (1, {'@': 94}), 57: (1, {'@': 94}), 30: (1, {'@': 94})}, 54: {5: (0, 144), 87: (0, 270)}, 55: {45: (1, {'@': 98}), 19: (1, {'@': 98}), 15: (1, {'@': 98}), 46: (1, {'@': 98}), 14: (1, {'@': 98}), 47: (1, {'@': 98}), 48: (1, {'@': 98}), 49: (1, {'@': 98}), 11: (1, {'@': 98}), 50: (1, {'@': 98}), 51: (1, {'@': 98}), 2: (1, {'@': 98}), 52: (1, {'@': 98}), 5: (1, {'@': 98}), 53: (1, {'@': 98}), 3: (1, {'@': 98}), 54: (1, {'@': 98}), 55: (1, {'@': 98}), 0: (1, {'@': 98}), 13: (1, {'@': 98}), 18: (1, {'@': 98}), 56: (1, {'@': 98}), 57: (1, {'@': 98}), 30: (1, {'@': 98})}, 56: {0: (0, 85)}, 57: {24: (1, {'@': 180}), 25: (1, {'@': 180}), 26: (1, {'@': 180}), 27: (1, {'@': 180}), 28: (1, {'@': 180}), 29: (1, {'@': 180}), 30: (1, {'@': 180}), 31: (1, {'@': 180}), 32: (1, {'@': 180}), 11: (1, {'@': 180}), 33: (1, {'@': 180}), 34: (1, {'@': 180}), 35: (1, {'@': 180}), 36: (1, {'@': 180}), 37: (1, {'@': 180}), 38: (1, {'@': 180}), 39: (1, {'@': 180}), 40: (1, {'@': 180}), 41: (1, {'@': 180}), 42: (1, {'@': 180}), 43: (1, {'@': 180}), 13: (1, {'@': 180}), 44: (1, {'@': 180}), 85: (1, {'@': 180})}, 58: {42: (0, 151), 88: (0, 142), 30: (0, 167), 38: (0, 152)}, 59: {1: (0, 44), 2: (0, 29), 3: (0, 81), 4: (0, 75), 5: (0, 68), 6: (0, 12), 34: (0, 137), 7: (0, 2), 8: (0, 43), 20: (0, 93), 9: (0, 288), 10: (0, 31), 11: (0, 70), 12: (0, 34), 19: (0, 25), 13: (0, 290), 58: (0, 15), 14: (0, 10), 15: (0, 322), 16: (0, 296), 17: (0, 72), 59: (0, 96), 18: (0, 76), 60: (0, 140), 0: (0, 97), 21: (0, 27), 22: (0, 98), 23: (0, 20), 89: (0, 141)}, 60: {45: (1, {'@': 222}), 19: (1, {'@': 222}), 15: (1, {'@': 222}), 46: (1, {'@': 222}), 14: (1, {'@': 222}), 47: (1, {'@': 222}), 48: (1, {'@': 222}), 11: (1, {'@': 222}), 50: (1, {'@': 222}), 2: (1, {'@': 222}), 52: (1, {'@': 222}), 13: (1, {'@': 222}), 49: (1, {'@': 222}), 51: (1, {'@': 222}), 5: (1, {'@': 222}), 53: (1, {'@': 222}), 3: (1, {'@': 222}), 54: (1, {'@': 222}), 55: (1, {'@': 222}), 0: (1, {'@': 222}), 18: (1, {'@': 222}), 56: (1, {'@': 222}), 57: (1, {'@': 222})}, 61: {45: (1, {'@': 103}), 19: (1, {'@': 103}), 15: (1, {'@': 103}), 46: (1, {'@': 103}), 14: (1, {'@': 103}), 47: (1, {'@': 103}), 48: (1, {'@': 103}), 49: (1, {'@': 103}), 11: (1, {'@': 103}), 50: (1, {'@': 103}), 51: (1, {'@': 103}), 2: (1, {'@': 103}), 52: (1, {'@': 103}), 5: (1, {'@': 103}), 53: (1, {'@': 103}), 3: (1, {'@': 103}), 54: (1, {'@': 103}), 55: (1, {'@': 103}), 0: (1, {'@': 103}), 13: (1, {'@': 103}), 18: (1, {'@': 103}), 56: (1, {'@': 103}), 57: (1, {'@': 103}), 30: (1, {'@': 103})}, 62: {45: (1, {'@': 99}), 19: (1, {'@': 99}), 15: (1, {'@': 99}), 46: (1, {'@': 99}), 14: (1, {'@': 99}), 47: (1, {'@': 99}), 48: (1, {'@': 99}), 49: (1, {'@': 99}), 11: (1, {'@': 99}), 50: (1, {'@': 99}), 51: (1, {'@': 99}), 2: (1, {'@': 99}), 52: (1, {'@': 99}), 5: (1, {'@': 99}), 53: (1, {'@': 99}), 3: (1, {'@': 99}), 54: (1, {'@': 99}), 55: (1, {'@': 99}), 0: (1, {'@': 99}), 13: (1, {'@': 99}), 18: (1, {'@': 99}), 56: (1, {'@': 99}), 57: (1, {'@': 99}), 30: (1, {'@': 99})}, 63: {1: (0, 44), 2: (0, 29), 3: (0, 81), 4: (0, 75), 5: (0, 68), 6: (0, 12), 7: (0, 2), 8: (0, 43), 20: (0, 93), 9: (0, 288), 10: (0, 31), 11: (0, 70), 12: (0, 34), 13: (0, 290), 58: (0, 15), 14: (0, 10), 15: (0, 322), 16: (0, 296), 17: (0, 72), 60: (0, 246), 59: (0, 96), 18: (0, 76), 19: (0, 25), 0: (0, 97), 21: (0, 27), 22: (0, 98), 23: (0, 20)}, 64: {45: (1, {'@': 109}), 19: (1, {'@': 109}), 15: (1, {'@': 109}), 46: (1, {'@': 109}), 14: (1, {'@': 109}), 47: (1, {'@': 109}), 48: (1, {'@': 109}), 49: (1, {'@': 109}), 11: (1, {'@': 109}), 50: (1, {'@': 109}), 51: (1, {'@': 109}), 2: (1, {'@': 109}), 52: (1, {'@': 109}), 5: (1, {'@': 109}), 53: (1, {'@': 109}), 3: (1, {'@': 109}), 54: (1, {'@': 109}), 55: (1, {'@': 109}), 0: (1, {'@': 109}), 13: (1, {'@': 109}), 18: (1, {'@': 109}), 56: (1, {'@': 109}), 57: (1, {'@': 109}), 30: (1, {'@': 109})}, 65: {1: (0, 44), 2: (0, 29), 3: (0, 81), 90: (0, 149), 4: (0, 75), 5: (0, 160), 6: (0, 12), 7: (0, 2), 8: (0, 43), 20: (0, 93), 60: (0, 166), 9: (0, 288), 10: (0, 31), 11: (0, 70), 12: (0, 34), 13: (0, 290), 58: (0, 15), 14: (0, 10), 15: (0, 322), 16: (0, 296), 17: (0, 72), 59: (0, 96), 18: (0, 76), 19: (0, 25), 0: (0, 97), 21: (0, 27), 91: (0, 169), 22: (0, 98), 23: (0, 20)}, 66: {0: (0, 204)}, 67: {1: (0, 44), 60: (0, 111), 2: (0, 29), 3: (0, 81), 4: (0, 75), 5: (0, 68), 6: (0, 12), 7: (0, 2), 8: (0, 43), 20: (0, 93), 9: (0, 288), 10: (0, 31), 11: (0, 70), 29: (0, 113), 12: (0, 34), 13: (0, 290), 58: (0, 15), 14: (0, 10), 15: (0, 322), 16: (0, 296), 17: (0, 72), 59: (0, 96), 18: (0, 76), 19: (0, 25), 0: (0, 97), 21: (0, 27), 22: (0, 98), 23: (0, 20)}, 68: {84: (0, 273), 30: (0, 274), 15: (0, 134), 3: (0, 279)}, 69: {0: (0, 59), 85: (1, {'@': 108}), 24: (1, {'@': 171}), 25: (1, {'@': 171}), 26: (1, {'@': 171}), 27: (1, {'@': 171}), 28: (1, {'@': 171}), 29: (1, {'@': 171}), 31: (1, {'@': 171}), 32: (1, {'@': 171}), 11: (1, {'@': 171}), 33: (1, {'@': 171}), 35: (1, {'@': 171}), 36: (1, {'@': 171}), 37: (1, {'@': 171}), 40: (1, {'@': 171}), 41: (1, {'@': 171}), 43: (1, {'@': 171}), 13: (1, {'@': 171}), 44: (1, {'@': 171})}, 70: {2: (0, 29), 3: (0, 81), 5: (0, 68), 9: (0, 288), 10: (0, 31), 11: (0, 70), 12: (0, 34), 13: (0, 290), 14: (0, 10), 15: (0, 322), 16: (0, 296), 17: (0, 72), 18: (0, 76), 19: (0, 25), 0: (0, 97), 21: (0, 27), 22: (0, 98), 23: (0, 20), 6: (0, 128)}, 71: {45: (1, {'@': 140}), 19: (1, {'@': 140}), 15: (1, {'@': 140}), 46: (1, {'@': 140}), 14: (1, {'@': 140}), 47: (1, {'@': 140}), 48: (1, {'@': 140}), 49: (1, {'@': 140}), 11: (1, {'@': 140}), 50: (1, {'@': 140}), 51: (1, {'@': 140}), 2: (1, {'@': 140}), 52: (1, {'@': 140}), 5: (1, {'@': 140}), 53: (1, {'@': 140}), 3: (1, {'@': 140}), 54: (1, {'@': 140}), 55: (1, {'@': 140}), 0: (1, {'@': 140}), 13: (1, {'@': 140}), 18: (1, {'@': 140}), 56: (1, {'@': 140}), 57: (1, {'@': 140}), 30: (1, {'@': 140})}, 72: {24: (1, {'@': 172}), 25: (1, {'@': 172}), 26: (1, {'@': 172}), 27: (1, {'@': 172}), 28: (1, {'@': 172}), 29: (1, {'@': 172}), 30: (1, {'@': 172}), 31: (1, {'@': 172}), 32: (1, {'@': 172}), 11: (1, {'@': 172}), 33: (1, {'@': 172}), 34: (1, {'@': 172}), 35: (1, {'@': 172}), 36: (1, {'@': 172}), 37: (1, {'@': 172}), 38: (1, {'@': 172}), 39: (1, {'@': 172}), 40: (1, {'@': 172}), 41: (1, {'@': 172}), 42: (1, {'@': 172}), 43: (1, {'@': 172}), 13: (1, {'@': 172}), 44: (1, {'@': 172})}, 73: {24: (1, {'@': 181}), 25: (1, {'@': 181}), 26: (1, {'@': 181}), 27: (1, {'@': 181}), 28: (1, {'@': 181}), 29: (1, {'@': 181}), 30: (1, {'@': 181}), 31: (1, {'@': 181}), 32: (1, {'@': 181}), 11: (1, {'@': 181}), 33: (1, {'@': 181}), 34: (1, {'@': 181}), 35: (1, {'@': 181}), 36: (1, {'@': 181}), 37: (1, {'@': 181}), 38: (1, {'@': 181}), 39: (1, {'@': 181}), 40: (1, {'@': 181}), 41: (1, {'@': 181}), 42: (1, {'@': 181}), 43: (1, {'@': 181}), 13: (1, {'@': 181}), 44: (1, {'@': 181}), 85: (1, {'@': 181})}, 74: {29: (0, 61)}, 75: {31: (0, 86), 37: (0, 16), 28: (0, 310), 33: (0, 314), 24: (1, {'@': 148}), 25: (1, {'@': 148}), 26: (1, {'@': 148}), 27: (1, {'@': 148}), 29: (1, {'@': 148}), 30: (1, {'@': 148}), 32: (1, {'@': 148}), 11: (1, {'@': 148}), 34: (1, {'@': 148}), 35: (1, {'@': 148}), 36: (1, {'@': 148}), 38: (1, {'@': 148}), 39: (1, {'@': 148}), 40: (1, {'@': 148}), 41: (1, {'@': 148}), 42: (1, {'@': 148}), 43: (1, {'@': 148}), 13: (1, {'@': 148}), 44: (1, {'@': 148})}, 76: {24: (1, {'@': 200}), 25: (1, {'@': 200}), 26: (1, {'@': 200}), 27: (1, {'@': 200}), 28: (1, {'@': 200}), 29: (1, {'@': 200}), 30: (1, {'@': 200}), 31: (1, {'@': 200}), 32: (1, {'@': 200}), 11: (1, {'@': 200}), 33: (1, {'@': 200}), 34: (1, {'@': 200}), 35: (1, {'@': 200}), 36: (1, {'@': 200}), 37: (1, {'@': 200}), 38: (1, {'@': 200}), 39: (1, {'@': 200}), 40: (1, {'@': 200}), 41: (1, {'@': 200}), 42: (1, {'@': 200}), 43: (1, {'@': 200}), 13: (1, {'@': 200}), 44: (1, {'@': 200})}, 77: {92: (0, 132), 93: (0, 215), 94: (0, 266), 95: (0, 276), 30: (0, 287), 96: (0, 289), 97: (0, 291)}, 78: {1: (0, 44), 2: (0, 29), 3: (0, 81), 4: (0, 75), 5: (0, 68), 6: (0, 12), 7: (0, 2), 8: (0, 43), 20: (0, 93), 9: (0, 288), 10: (0, 31), 11: (0, 70), 60: (0, 265), 12: (0, 34), 13: (0, 290), 58: (0, 15), 14: (0, 10), 15: (0, 322), 16: (0, 296), 17: (0, 72), 59: (0, 96), 18: (0, 76), 19: (0, 25), 0: (0, 97), 21: (0, 27), 22: (0, 98), 23: (0, 20)}, 79: {5: (0, 181)}, 80: {24: (1, {'@': 176}), 25: (1, {'@': 176}), 26: (1, {'@': 176}), 27: (1, {'@': 176}), 28: (1, {'@': 176}), 29: (1, {'@': 176}), 30: (1, {'@': 176}), 31: (1, {'@': 176}), 32: (1, {'@': 176}), 11: (1, {'@': 176}), 33: (1, {'@': 176}), 34: (1, {'@': 176}), 35: (1, {'@': 176}), 36: (1, {'@': 176}), 37: (1, {'@': 176}), 38: (1, {'@': 176}), 39: (1, {'@': 176}), 40: (1, {'@': 176}), 41: (1, {'@': 176}), 42: (1, {'@': 176}), 43: (1, {'@': 176}), 13: (1, {'@': 176}), 44: (1, {'@': 176})}, 81: {24: (1, {'@': 199}), 25: (1, {'@': 199}), 26: (1, {'@': 199}), 27: (1, {'@': 199}), 28: (1, {'@': 199}), 29: (1, {'@': 199}), 30: (1, {'@': 199}), 31: (1, {'@': 199}), 32: (1, {'@': 199}), 11: (1, {'@': 199}), 33: (1, {'@': 199}), 34: (1, {'@': 199}), 35: (1, {'@': 199}), 36: (1, {'@': 199}), 37: (1, {'@': 199}), 38: (1, {'@': 199}), 39: (1, {'@': 199}), 40: (1, {'@': 199}), 41: (1, {'@': 199}), 42: (1, {'@': 199}), 43: (1, {'@': 199}), 13: (1, {'@': 199}), 44: (1, {'@': 199})}, 82: {38: (0, 247), 34: (1, {'@': 178})}, 83: {61: (0, 41), 3: (0, 81), 6: (0, 12), 9: (0, 69), 62: (0, 55), 57: (0, 42), 8: (0, 43), 1: (0, 44), 64: (0, 38), 12: (0, 34), 65: (0, 33), 13: (0, 30), 58: (0, 15), 16: (0, 19), 60: (0, 74), 48: (0, 56), 66: (0, 89), 5: (0, 39), 7: (0, 2), 52: (0, 94), 18: (0, 76), 67: (0, 155), 22: (0, 98), 56: (0, 79), 68: (0, 92), 69: (0, 91), 4: (0, 75), 50: (0, 48), 10: (0, 31), 14: (0, 10), 15: (0, 24), 59: (0, 96), 54: (0, 95), 20: (0, 93), 0: (0, 97), 70: (0, 13), 71: (0, 53), 49: (0, 18), 73: (0, 62), 17: (0, 72), 72: (0, 153), 53: (0, 46), 55: (0, 67), 51: (0, 7), 77: (0, 161), 46: (0, 17), 21: (0, 27), 23: (0, 20), 47: (0, 0), 74: (0, 28), 19: (0, 25), 75: (0, 37), 76: (0, 26), 2: (0, 29), 78: (0, 36), 11: (0, 70), 80: (0, 125), 81: (0, 130), 82: (0, 136), 45: (1, {'@': 61})}, 84: {85: (1, {'@': 213})}, 85: {15: (0, 174)}, 86: {1: (0, 44), 2: (0, 29), 3: (0, 81), 5: (0, 68), 6: (0, 12), 7: (0, 202), 9: (0, 288), 10: (0, 31), 11: (0, 70), 12: (0, 34), 13: (0, 290), 14: (0, 10), 15: (0, 322), 16: (0, 296), 17: (0, 72), 18: (0, 76), 19: (0, 25), 0: (0, 97), 21: (0, 27), 22: (0, 98), 23: (0, 20)}, 87: {1: (0, 44), 2: (0, 29), 3: (0, 81), 4: (0, 126), 5: (0, 68), 6: (0, 12), 7: (0, 2), 9: (0, 288), 10: (0, 31), 11: (0, 70), 12: (0, 34), 13: (0, 290), 14: (0, 10), 15: (0, 322), 16: (0, 296), 17: (0, 72), 18: (0, 76), 19: (0, 25), 0: (0, 97), 21: (0, 27), 22: (0, 98), 23: (0, 20)}, 88: {29: (0, 283)}, 89: {45: (1, {'@': 95}), 19: (1, {'@': 95}), 15: (1, {'@': 95}), 46: (1, {'@': 95}), 14: (1, {'@': 95}), 47: (1, {'@': 95}), 48: (1, {'@': 95}), 49: (1, {'@': 95}), 11: (1, {'@': 95}), 50: (1, {'@': 95}), 51: (1, {'@': 95}), 2: (1, {'@': 95}), 52: (1, {'@': 95}), 5: (1, {'@': 95}), 53: (1, {'@': 95}), 3: (1, {'@': 95}), 54: (1, {'@': 95}), 55: (1, {'@': 95}), 0: (1, {'@': 95}), 13: (1, {'@': 95}), 18: (1, {'@': 95}), 56: (1, {'@': 95}), 57: (1, {'@': 95}), 30: (1, {'@': 95})}, 90: {24: (1, {'@': 174}), 25: (1, {'@': 174}), 26: (1, {'@': 174}), 27: (1, {'@': 174}), 28: (1, {'@': 174}), 29: (1, {'@': 174}), 30: (1, {'@': 174}), 31: (1, {'@': 174}), 32: (1, {'@': 174}), 11: (1, {'@': 174}), 33: (1, {'@': 174}), 34: (1, {'@': 174}), 35: (1, {'@': 174}), 36: (1, {'@': 174}), 37: (1, {'@': 174}), 38: (1, {'@': 174}), 39: (1, {'@': 174}), 40: (1, {'@': 174}), 41: (1, {'@': 174}), 42: (1, {'@': 174}), 43: (1, {'@': 174}), 13: (1, {'@': 174}), 44: (1, {'@': 174})}, 91: {45: (1, {'@': 102}), 19: (1, {'@': 102}), 15: (1, {'@': 102}), 46: (1, {'@': 102}), 14: (1, {'@': 102}), 47: (1, {'@': 102}), 48: (1, {'@': 102}), 49: (1, {'@': 102}), 11: (1, {'@': 102}), 50: (1, {'@': 102}), 51: (1, {'@': 102}), 2: (1, {'@': 102}), 52: (1, {'@': 102}), 5: (1, {'@': 102}), 53: (1, {'@': 102}), 3: (1, {'@': 102}), 54: (1, {'@': 102}), 55: (1, {'@': 102}), 0: (1, {'@': 102}), 13: (1, {'@': 102}), 18: (1, {'@': 102}), 56: (1, {'@': 102}), 57: (1, {'@': 102}), 30: (1, {'@': 102})}, 92: {85: (1, {'@': 211})}, 93: {44: (0, 280), 43: (1, {'@': 144}), 29: (1, {'@': 144}), 35: (1, {'@': 144}), 38: (1, {'@': 144}), 39: (1, {'@': 144}), 24: (1, {'@': 144}), 25: (1, {'@': 144}), 26: (1, {'@': 144}), 27: (1, {'@': 144}), 28: (1, {'@': 144}), 30: (1, {'@': 144}), 31: (1, {'@': 144}), 32: (1, {'@': 144}), 11: (1, {'@': 144}), 33: (1, {'@': 144}), 34: (1, {'@': 144}), 36: (1, {'@': 144}), 37: (1, {'@': 144}), 40: (1, {'@': 144}), 41: (1, {'@': 144}), 42: (1, {'@': 144}), 13: (1, {'@': 144})}, 94: {15: (0, 297), 98: (0, 301)}, 95: {29: (0, 3)}, 96: {43: (0, 1), 35: (0, 325), 29: (1, {'@': 142}), 39: (1, {'@': 142}), 38: (1, {'@': 142}), 24: (1, {'@': 142}), 25: (1, {'@': 142}), 26: (1, {'@': 142}), 27: (1, {'@': 142}), 28: (1, {'@': 142}), 30: (1, {'@': 142}), 31: (1, {'@': 142}), 32: (1, {'@': 142}), 11: (1, {'@': 142}), 33: (1, {'@': 142}), 34: (1, {'@': 142}), 36: (1, {'@': 142}), 37: (1, {'@': 142}), 40: (1, {'@': 142}), 41: (1, {'@': 142}), 42: (1, {'@': 142}), 13: (1, {'@': 142}), 44: (1, {'@': 142})}, 97: {1: (0, 44), 2: (0, 29), 3: (0, 81), 4: (0, 75), 5: (0, 68), 6: (0, 12), 7: (0, 2), 8: (0, 43), 20: (0, 93), 9: (0, 288), 10: (0, 31), 11: (0, 70), 12: (0, 34), 13: (0, 290), 58: (0, 15), 14: (0, 10), 15: (0, 322), 16: (0, 296), 17: (0, 72), 60: (0, 108), 59: (0, 96), 18: (0, 76), 19: (0, 25), 0: (0, 97), 21: (0, 27), 22: (0, 98), 23: (0, 20)}, 98: {24: (1, {'@': 201}), 25: (1, {'@': 201}), 26: (1, {'@': 201}), 27: (1, {'@': 201}), 28: (1, {'@': 201}), 29: (1, {'@': 201}), 30: (1, {'@': 201}), 31: (1, {'@': 201}), 32: (1, {'@': 201}), 11: (1, {'@': 201}), 33: (1, {'@': 201}), 34: (1, {'@': 201}), 35: (1, {'@': 201}), 36: (1, {'@': 201}), 37: (1, {'@': 201}), 38: (1, {'@': 201}), 39: (1, {'@': 201}), 40: (1, {'@': 201}), 41: (1, {'@': 201}), 42: (1, {'@': 201}), 43: (1, {'@': 201}), 13: (1, {'@': 201}), 44: (1, {'@': 201})}, 99: {34: (0, 263)}, 100: {45: (1, {'@': 125}), 19: (1, {'@': 125}), 15: (1, {'@': 125}), 46: (1, {'@': 125}), 14: (1, {'@': 125}), 47: (1, {'@': 125}), 48: (1, {'@': 125}), 49: (1, {'@': 125}), 11: (1, {'@': 125}), 50: (1, {'@': 125}), 51: (1, {'@': 125}), 2: (1, {'@': 125}), 52: (1, {'@': 125}), 5: (1, {'@': 125}), 53: (1, {'@': 125}), 3: (1, {'@': 125}), 54: (1, {'@': 125}), 55: (1, {'@': 125}), 0: (1, {'@': 125}), 13: (1, {'@': 125}), 18: (1, {'@': 125}), 56: (1, {'@': 125}), 57: (1, {'@': 125}), 30: (1, {'@': 125})}, 101: {15: (0, 317)}, 102: {61: (0, 41), 3: (0, 81), 30: (0, 201), 6: (0, 12), 9: (0, 69), 62: (0, 55), 57: (0, 42), 8: (0, 43), 1: (0, 44), 64: (0, 38), 12: (0, 34), 65: (0, 33), 13: (0, 30), 58: (0, 15), 16: (0, 19), 60: (0, 74), 48: (0, 56), 66: (0, 89), 5: (0, 39), 7: (0, 2), 18: (0, 76), 22: (0, 98), 56: (0, 79), 68: (0, 92), 69: (0, 91), 4: (0, 75), 10: (0, 31), 14: (0, 10), 15: (0, 24), 59: (0, 96), 54: (0, 95), 20: (0, 93), 0: (0, 97), 99: (0, 203), 70: (0, 13), 71: (0, 53), 49: (0, 18), 73: (0, 62), 17: (0, 72), 53: (0, 46), 55: (0, 67), 51: (0, 7), 46: (0, 17), 21: (0, 27), 23: (0, 20), 47: (0, 0), 74: (0, 28), 19: (0, 25), 75: (0, 37), 76: (0, 26), 2: (0, 29), 78: (0, 36), 11: (0, 70), 80: (0, 125), 81: (0, 130), 82: (0, 136), 72: (0, 217)}, 103: {24: (1, {'@': 160}), 25: (1, {'@': 160}), 26: (1, {'@': 160}), 27: (1, {'@': 160}), 28: (1, {'@': 160}), 29: (1, {'@': 160}), 30: (1, {'@': 160}), 31: (1, {'@': 160}), 32: (1, {'@': 160}), 11: (1, {'@': 160}), 33: (1, {'@': 160}), 34: (1, {'@': 160}), 35: (1, {'@': 160}), 36: (1, {'@': 160}), 37: (1, {'@': 160}), 38: (1, {'@': 160}), 39: (1, {'@': 160}), 40: (1, {'@': 160}), 41: (1, {'@': 160}), 42: (1, {'@': 160}), 43: (1, {'@': 160}), 13: (1, {'@': 160}), 44: (1, {'@': 160})}, 104: {45: (1, {'@': 239}), 19: (1, {'@': 239}), 15: (1, {'@': 239}), 46: (1, {'@': 239}), 14: (1, {'@': 239}), 47: (1, {'@': 239}), 48: (1, {'@': 239}), 11: (1, {'@': 239}), 50: (1, {'@': 239}), 100: (1, {'@': 239}), 2: (1, {'@': 239}), 52: (1, {'@': 239}), 13: (1, {'@': 239}), 101: (1, {'@': 239}), 30: (1, {'@': 239}), 49: (1, {'@': 239}), 51: (1, {'@': 239}), 5: (1, {'@': 239}), 53: (1, {'@': 239}), 3: (1, {'@': 239}), 54: (1, {'@': 239}), 55: (1, {'@': 239}), 0: (1, {'@': 239}), 18: (1, {'@': 239}), 56: (1, {'@': 239}), 57: (1, {'@': 239})}, 105: {29: (0, 71), 88: (0, 200), 38: (0, 152)}, 106: {45: (1, {'@': 127}), 19: (1, {'@': 127}), 15: (1, {'@': 127}), 46: (1, {'@': 127}), 14: (1, {'@': 127}), 47: (1, {'@': 127}), 48: (1, {'@': 127}), 49: (1, {'@': 127}), 11: (1, {'@': 127}), 50: (1, {'@': 127}), 51: (1, {'@': 127}), 2: (1, {'@': 127}), 52: (1, {'@': 127}), 5: (1, {'@': 127}), 53: (1, {'@': 127}), 3: (1, {'@': 127}), 54: (1, {'@': 127}), 55: (1, {'@': 127}), 0: (1, {'@': 127}), 13: (1, {'@': 127}), 18: (1, {'@': 127}), 56: (1, {'@': 127}), 57: (1, {'@': 127}), 30: (1, {'@': 127})}, 107: {92: (1, {'@': 229}), 95: (1, {'@': 229}), 30: (1, {'@': 229})}, 108: {34: (0, 52)}, 109: {45: (1, {'@': 63}), 19: (1, {'@': 63}), 15: (1, {'@': 63}), 46: (1, {'@': 63}), 14: (1, {'@': 63}), 47: (1, {'@': 63}), 48: (1, {'@': 63}), 49: (1, {'@': 63}), 11: (1, {'@': 63}), 50: (1, {'@': 63}), 51: (1, {'@': 63}), 2: (1, {'@': 63}), 52: (1, {'@': 63}), 5: (1, {'@': 63}), 53: (1, {'@': 63}), 3: (1, {'@': 63}), 54: (1, {'@': 63}), 55: (1, {'@': 63}), 0: (1, {'@': 63}), 13: (1, {'@': 63}), 18: (1, {'@': 63}), 56: (1, {'@': 63}), 57: (1, {'@': 63})}, 110: {1: (0, 44), 2: (0, 29), 3: (0, 81), 4: (0, 75), 5: (0, 68), 6: (0, 12), 7: (0, 2), 60: (0, 225), 8: (0, 43), 20: (0, 93), 9: (0, 288), 10: (0, 31), 11: (0, 70), 12: (0, 34), 13: (0, 290), 58: (0, 15), 14: (0, 10), 15: (0, 322), 16: (0, 296), 17: (0, 72), 59: (0, 96), 18: (0, 76), 19: (0, 25), 0: (0, 97), 21: (0, 27), 22: (0, 98), 23: (0, 20)}, 111: {29: (0, 64)}, 112: {29: (1, {'@': 75}), 3: (1, {'@': 75})}, 113: {45: (1, {'@': 110}), 19: (1, {'@': 110}), 15: (1, {'@': 110}), 46: (1, {'@': 110}), 14: (1, {'@': 110}), 47: (1, {'@': 110}), 48: (1, {'@': 110}), 49: (1, {'@': 110}), 11: (1, {'@': 110}), 50: (1, {'@': 110}), 51: (1, {'@': 110}), 2: (1, {'@': 110}), 52: (1, {'@': 110}), 5: (1, {'@': 110}), 53: (1, {'@': 110}), 3: (1, {'@': 110}), 54: (1, {'@': 110}), 55: (1, {'@': 110}), 0: (1, {'@': 110}), 13: (1, {'@': 110}), 18: (1, {'@': 110}), 56: (1, {'@': 110}), 57: (1, {'@': 110}), 30: (1, {'@': 110})}, 114: {29: (1, {'@': 71}), 3: (1, {'@': 71})}, 115: {24: (1, {'@': 161}), 25: (1, {'@': 161}), 26: (1, {'@': 161}), 27: (1, {'@': 161}), 28: (1, {'@': 161}), 29: (1, {'@': 161}), 30: (1, {'@': 161}), 31: (1, {'@': 161}), 32: (1, {'@': 161}), 11: (1, {'@': 161}), 33: (1, {'@': 161}), 34: (1, {'@': 161}), 35: (1, {'@': 161}), 36: (1, {'@': 161}), 37: (1, {'@': 161}), 38: (1, {'@': 161}), 39: (1, {'@': 161}), 40: (1, {'@': 161}), 41: (1, {'@': 161}), 42: (1, {'@': 161}), 43: (1, {'@': 161}), 13: (1, {'@': 161}), 44: (1, {'@': 161})}, 116: {102: (0, 208), 3: (0, 281), 29: (1, {'@': 70})}, 117: {29: (1, {'@': 72}), 3: (1, {'@': 72})}, 118: {103: (0, 222), 34: (0, 188), 15: (0, 221), 104: (0, 218)}, 119: {29: (1, {'@': 73}), 3: (1, {'@': 73})}, 120: {29: (1, {'@': 74}), 3: (1, {'@': 74})}, 121: {24: (1, {'@': 162}), 25: (1, {'@': 162}), 26: (1, {'@': 162}), 27: (1, {'@': 162}), 28: (1, {'@': 162}), 29: (1, {'@': 162}), 30: (1, {'@': 162}), 31: (1, {'@': 162}), 32: (1, {'@': 162}), 11: (1, {'@': 162}), 33: (1, {'@': 162}), 34: (1, {'@': 162}), 35: (1, {'@': 162}), 36: (1, {'@': 162}), 37: (1, {'@': 162}), 38: (1, {'@': 162}), 39: (1, {'@': 162}), 40: (1, {'@': 162}), 41: (1, {'@': 162}), 42: (1, {'@': 162}), 43: (1, {'@': 162}), 13: (1, {'@': 162}), 44: (1, {'@': 162})}, 122: {}, 123: {24: (1, {'@': 163}), 25: (1, {'@': 163}), 26: (1, {'@': 163}), 27: (1, {'@': 163}), 28: (1, {'@': 163}), 29: (1, {'@': 163}), 30: (1, {'@': 163}), 31: (1, {'@': 163}), 32: (1, {'@': 163}), 11: (1, {'@': 163}), 33: (1, {'@': 163}), 34: (1, {'@': 163}), 35: (1, {'@': 163}), 36: (1, {'@': 163}), 37: (1, {'@': 163}), 38: (1, {'@': 163}), 39: (1, {'@': 163}), 40: (1, {'@': 163}), 41: (1, {'@': 163}), 42: (1, {'@': 163}), 43: (1, {'@': 163}), 13: (1, {'@': 163}), 44: (1, {'@': 163})}, 124: {61: (0, 41), 3: (0, 81), 6: (0, 12), 9: (0, 69), 62: (0, 55), 57: (0, 42), 8: (0, 43), 1: (0, 44), 64: (0, 38), 12: (0, 34), 65: (0, 33), 13: (0, 30), 58: (0, 15), 16: (0, 19), 60: (0, 74), 48: (0, 56), 66: (0, 89), 5: (0, 39), 7: (0, 2), 18: (0, 76), 22: (0, 98), 30: (0, 211), 56: (0, 79), 68: (0, 92), 69: (0, 91), 4: (0, 75), 10: (0, 31), 14: (0, 10), 15: (0, 24), 59: (0, 96), 99: (0, 212), 54: (0, 95), 20: (0, 93), 0: (0, 97), 70: (0, 13), 71: (0, 53), 49: (0, 18), 73: (0, 62), 17: (0, 72), 53: (0, 46), 55: (0, 67), 51: (0, 7), 46: (0, 17), 21: (0, 27), 23: (0, 20), 47: (0, 0), 74: (0, 28), 19: (0, 25), 75: (0, 37), 76: (0, 26), 2: (0, 29), 78: (0, 36), 11: (0, 70), 80: (0, 125), 81: (0, 130), 82: (0, 136), 72: (0, 217)}, 125: {45: (1, {'@': 96}), 19: (1, {'@': 96}), 15: (1, {'@': 96}), 46: (1, {'@': 96}), 14: (1, {'@': 96}), 47: (1, {'@': 96}), 48: (1, {'@': 96}), 49: (1, {'@': 96}), 11: (1, {'@': 96}), 50: (1, {'@': 96}), 51: (1, {'@': 96}), 2: (1, {'@': 96}), 52: (1, {'@': 96}), 5: (1, {'@': 96}), 53: (1, {'@': 96}), 3: (1, {'@': 96}), 54: (1, {'@': 96}), 55: (1, {'@': 96}), 0: (1, {'@': 96}), 13: (1, {'@': 96}), 18: (1, {'@': 96}), 56: (1, {'@': 96}), 57: (1, {'@': 96}), 30: (1, {'@': 96})}, 126: {37: (0, 16), 31: (0, 86), 28: (0, 310), 33: (0, 314), 24: (1, {'@': 150}), 25: (1, {'@': 150}), 26: (1, {'@': 150}), 27: (1, {'@': 150}), 29: (1, {'@': 150}), 30: (1, {'@': 150}), 32: (1, {'@': 150}), 11: (1, {'@': 150}), 34: (1, {'@': 150}), 35: (1, {'@': 150}), 36: (1, {'@': 150}), 38: (1, {'@': 150}), 39: (1, {'@': 150}), 40: (1, {'@': 150}), 41: (1, {'@': 150}), 42: (1, {'@': 150}), 43: (1, {'@': 150}), 13: (1, {'@': 150}), 44: (1, {'@': 150})}, 127: {5: (0, 190)}, 128: {24: (1, {'@': 166}), 25: (1, {'@': 166}), 26: (1, {'@': 166}), 27: (1, {'@': 166}), 28: (1, {'@': 166}), 29: (1, {'@': 166}), 30: (1, {'@': 166}), 31: (1, {'@': 166}), 32: (1, {'@': 166}), 11: (1, {'@': 166}), 33: (1, {'@': 166}), 34: (1, {'@': 166}), 35: (1, {'@': 166}), 36: (1, {'@': 166}), 37: (1, {'@': 166}), 38: (1, {'@': 166}), 39: (1, {'@': 166}), 40: (1, {'@': 166}), 41: (1, {'@': 166}), 42: (1, {'@': 166}), 43: (1, {'@': 166}), 13: (1, {'@': 166}), 44: (1, {'@': 166})}, 129: {24: (1, {'@': 204}), 25: (1, {'@': 204}), 26: (1, {'@': 204}), 27: (1, {'@': 204}), 28: (1, {'@': 204}), 29: (1, {'@': 204}), 30: (1, {'@': 204}), 31: (1, {'@': 204}), 32: (1, {'@': 204}), 11: (1, {'@': 204}), 33: (1, {'@': 204}), 34: (1, {'@': 204}), 35: (1, {'@': 204}), 36: (1, {'@': 204}), 37: (1, {'@': 204}), 38: (1, {'@': 204}), 39: (1, {'@': 204}), 40: (1, {'@': 204}), 41: (1, {'@': 204}), 42: (1, {'@': 204}), 43: (1, {'@': 204}), 13: (1, {'@': 204}), 44: (1, {'@': 204})}, 130: {45: (1, {'@': 91}), 19: (1, {'@': 91}), 15: (1, {'@': 91}), 46: (1, {'@': 91}), 14: (1, {'@': 91}), 47: (1, {'@': 91}), 48: (1, {'@': 91}), 49: (1, {'@': 91}), 11: (1, {'@': 91}), 50: (1, {'@': 91}), 51: (1, {'@': 91}), 2: (1, {'@': 91}), 52: (1, {'@': 91}), 5: (1, {'@': 91}), 53: (1, {'@': 91}), 3: (1, {'@': 91}), 54: (1, {'@': 91}), 55: (1, {'@': 91}), 0: (1, {'@': 91}), 13: (1, {'@': 91}), 18: (1, {'@': 91}), 56: (1, {'@': 91}), 57: (1, {'@': 91}), 30: (1, {'@': 91})}, 131: {37: (0, 16), 31: (0, 86), 28: (0, 310), 33: (0, 314), 24: (1, {'@': 149}), 25: (1, {'@': 149}), 26: (1, {'@': 149}), 27: (1, {'@': 149}), 29: (1, {'@': 149}), 30: (1, {'@': 149}), 32: (1, {'@': 149}), 11: (1, {'@': 149}), 34: (1, {'@': 149}), 35: (1, {'@': 149}), 36: (1, {'@': 149}), 38: (1, {'@': 149}), 39: (1, {'@': 149}), 40: (1, {'@': 149}), 41: (1, {'@': 149}), 42: (1, {'@': 149}), 43: (1, {'@': 149}), 13: (1, {'@': 149}), 44: (1, {'@': 149})}, 132: {3: (0, 9)}, 133: {61: (0, 41), 3: (0, 81), 6: (0, 12), 9: (0, 69), 62: (0, 55), 57: (0, 42), 8: (0, 43), 1: (0, 44), 64: (0, 38), 12: (0, 34), 65: (0, 33), 13: (0, 30), 58: (0, 15), 16: (0, 19), 60: (0, 74), 48: (0, 56), 66: (0, 89), 5: (0, 39), 7: (0, 2), 18: (0, 76), 22: (0, 98), 56: (0, 79), 68: (0, 92), 69: (0, 91), 4: (0, 75), 10: (0, 31), 14: (0, 10), 15: (0, 24), 59: (0, 96), 54: (0, 95), 20: (0, 93), 0: (0, 97), 99: (0, 187), 70: (0, 13), 71: (0, 53), 49: (0, 18), 73: (0, 62), 17: (0, 72), 53: (0, 46), 55: (0, 67), 51: (0, 7), 46: (0, 17), 30: (0, 216), 21: (0, 27), 23: (0, 20), 47: (0, 0), 74: (0, 28), 19: (0, 25), 75: (0, 37), 76: (0, 26), 2: (0, 29), 78: (0, 36), 11: (0, 70), 80: (0, 125), 81: (0, 130), 82: (0, 136), 72: (0, 217)}, 134: {42: (0, 151)}, 135: {29: (1, {'@': 143}), 39: (1, {'@': 143}), 38: (1, {'@': 143}), 24: (1, {'@': 143}), 25: (1, {'@': 143}), 26: (1, {'@': 143}), 27: (1, {'@': 143}), 28: (1, {'@': 143}), 30: (1, {'@': 143}), 31: (1, {'@': 143}), 32: (1, {'@': 143}), 11: (1, {'@': 143}), 33: (1, {'@': 143}), 34: (1, {'@': 143}), 35: (1, {'@': 143}), 36: (1, {'@': 143}), 37: (1, {'@': 143}), 40: (1, {'@': 143}), 41: (1, {'@': 143}), 42: (1, {'@': 143}), 43: (1, {'@': 143}), 13: (1, {'@': 143}), 44: (1, {'@': 143})}, 136: {45: (1, {'@': 101}), 19: (1, {'@': 101}), 15: (1, {'@': 101}), 46: (1, {'@': 101}), 14: (1, {'@': 101}), 47: (1, {'@': 101}), 48: (1, {'@': 101}), 49: (1, {'@': 101}), 11: (1, {'@': 101}), 50: (1, {'@': 101}), 51: (1, {'@': 101}), 2: (1, {'@': 101}), 52: (1, {'@': 101}), 5: (1, {'@': 101}), 53: (1, {'@': 101}), 3: (1, {'@': 101}), 54: (1, {'@': 101}), 55: (1, {'@': 101}), 0: (1, {'@': 101}), 13: (1, {'@': 101}), 18: (1, {'@': 101}), 56: (1, {'@': 101}), 57: (1, {'@': 101}), 30: (1, {'@': 101})}, 137: {24: (1, {'@': 177}), 25: (1, {'@': 177}), 26: (1, {'@': 177}), 27: (1, {'@': 177}), 28: (1, {'@': 177}), 29: (1, {'@': 177}), 30: (1, {'@': 177}), 31: (1, {'@': 177}), 32: (1, {'@': 177}), 11: (1, {'@': 177}), 33: (1, {'@': 177}), 34: (1, {'@': 177}), 35: (1, {'@': 177}), 36: (1, {'@': 177}), 37: (1, {'@': 177}), 38: (1, {'@': 177}), 39: (1, {'@': 177}), 40: (1, {'@': 177}), 41: (1, {'@': 177}), 42: (1, {'@': 177}), 43: (1, {'@': 177}), 13: (1, {'@': 177}), 44: (1, {'@': 177})}, 138: {105: (0, 157), 106: (0, 209), 107: (0, 185), 108: (0, 186), 45: (1, {'@': 115}), 19: (1, {'@': 115}), 15: (1, {'@': 115}), 46: (1, {'@': 115}), 14: (1, {'@': 115}), 47: (1, {'@': 115}), 48: (1, {'@': 115}), 49: (1, {'@': 115}), 11: (1, {'@': 115}), 50: (1, {'@': 115}), 51: (1, {'@': 115}), 2: (1, {'@': 115}), 52: (1, {'@': 115}), 5: (1, {'@': 115}), 53: (1, {'@': 115}), 3: (1, {'@': 115}), 54: (1, {'@': 115}), 55: (1, {'@': 115}), 0: (1, {'@': 115}), 13: (1, {'@': 115}), 18: (1, {'@': 115}), 56: (1, {'@': 115}), 57: (1, {'@': 115}), 30: (1, {'@': 115})}, 139: {45: (1, {'@': 60})}, 140: {38: (0, 307), 109: (0, 82), 34: (1, {'@': 179})}, 141: {34: (0, 80)}, 142: {30: (0, 32), 38: (0, 234)}, 143: {85: (1, {'@': 214})}, 144: {61: (0, 41), 3: (0, 81), 6: (0, 12), 9: (0, 69), 62: (0, 55), 57: (0, 42), 8: (0, 43), 1: (0, 44), 64: (0, 38), 12: (0, 34), 65: (0, 33), 13: (0, 30), 58: (0, 15), 16: (0, 19), 60: (0, 74), 48: (0, 56), 66: (0, 89), 5: (0, 39), 7: (0, 2), 18: (0, 76), 22: (0, 98), 56: (0, 79), 68: (0, 92), 69: (0, 91), 4: (0, 75), 10: (0, 31), 14: (0, 10), 15: (0, 24), 59: (0, 96), 54: (0, 95), 20: (0, 93), 0: (0, 97), 99: (0, 223), 70: (0, 13), 71: (0, 53), 30: (0, 227), 49: (0, 18), 73: (0, 62), 17: (0, 72), 53: (0, 46), 55: (0, 67), 51: (0, 7), 46: (0, 17), 21: (0, 27), 23: (0, 20), 47: (0, 0), 74: (0, 28), 19: (0, 25), 75: (0, 37), 76: (0, 26), 2: (0, 29), 78: (0, 36), 11: (0, 70), 80: (0, 125), 81: (0, 130), 82: (0, 136), 72: (0, 217)}, 145: {30: (0, 51), 38: (0, 256)}, 146: {2: (0, 29), 3: (0, 81), 5: (0, 68), 9: (0, 288), 10: (0, 31), 6: (0, 123), 11: (0, 70), 12: (0, 34), 13: (0, 290), 14: (0, 10), 15: (0, 322), 16: (0, 296), 17: (0, 72), 18: (0, 76), 19: (0, 25), 0: (0, 97), 21: (0, 27), 22: (0, 98), 23: (0, 20)}, 147: {24: (1, {'@': 207}), 25: (1, {'@': 207}), 26: (1, {'@': 207}), 27: (1, {'@': 207}), 28: (1, {'@': 207}), 29: (1, {'@': 207}), 30: (1, {'@': 207}), 31: (1, {'@': 207}), 32: (1, {'@': 207}), 11: (1, {'@': 207}), 33: (1, {'@': 207}), 34: (1, {'@': 207}), 35: (1, {'@': 207}), 36: (1, {'@': 207}), 37: (1, {'@': 207}), 38: (1, {'@': 207}), 39: (1, {'@': 207}), 40: (1, {'@': 207}), 41: (1, {'@': 207}), 42: (1, {'@': 207}), 43: (1, {'@': 207}), 13: (1, {'@': 207}), 44: (1, {'@': 207})}, 148: {24: (1, {'@': 182}), 25: (1, {'@': 182}), 26: (1, {'@': 182}), 27: (1, {'@': 182}), 28: (1, {'@': 182}), 29: (1, {'@': 182}), 30: (1, {'@': 182}), 31: (1, {'@': 182}), 32: (1, {'@': 182}), 11: (1, {'@': 182}), 33: (1, {'@': 182}), 34: (1, {'@': 182}), 35: (1, {'@': 182}), 36: (1, {'@': 182}), 37: (1, {'@': 182}), 38: (1, {'@': 182}), 39: (1, {'@': 182}), 40: (1, {'@': 182}), 0: (1, {'@': 182}), 41: (1, {'@': 182}), 42: (1, {'@': 182}), 43: (1, {'@': 182}), 13: (1, {'@': 182}), 44: (1, {'@': 182}), 85: (1, {'@': 182})}, 149: {24: (1, {'@': 217}), 25: (1, {'@': 217}), 26: (1, {'@': 217}), 27: (1, {'@': 217}), 28: (1, {'@': 217}), 29: (1, {'@': 217}), 30: (1, {'@': 217}), 31: (1, {'@': 217}), 32: (1, {'@': 217}), 11: (1, {'@': 217}), 33: (1, {'@': 217}), 34: (1, {'@': 217}), 35: (1, {'@': 217}), 36: (1, {'@': 217}), 37: (1, {'@': 217}), 38: (1, {'@': 217}), 39: (1, {'@': 217}), 40: (1, {'@': 217}), 41: (1, {'@': 217}), 42: (1, {'@': 217}), 43: (1, {'@': 217}), 13: (1, {'@': 217}), 44: (1, {'@': 217})}, 150: {29: (0, 224)}, 151: {1: (0, 44), 2: (0, 29), 3: (0, 81), 4: (0, 75), 5: (0, 68), 6: (0, 12), 7: (0, 2), 8: (0, 43), 20: (0, 93), 9: (0, 288), 10: (0, 31), 11: (0, 70), 12: (0, 34), 13: (0, 290), 58: (0, 15), 14: (0, 10), 15: (0, 322), 16: (0, 296), 17: (0, 72), 59: (0, 96), 18: (0, 76), 19: (0, 25), 60: (0, 257), 0: (0, 97), 21: (0, 27), 22: (0, 98), 23: (0, 20)}, 152: {15: (0, 194)}, 153: {45: (1, {'@': 227}), 19: (1, {'@': 227}), 15: (1, {'@': 227}), 46: (1, {'@': 227}), 14: (1, {'@': 227}), 47: (1, {'@': 227}), 48: (1, {'@': 227}), 11: (1, {'@': 227}), 50: (1, {'@': 227}), 2: (1, {'@': 227}), 52: (1, {'@': 227}), 13: (1, {'@': 227}), 49: (1, {'@': 227}), 51: (1, {'@': 227}), 5: (1, {'@': 227}), 53: (1, {'@': 227}), 3: (1, {'@': 227}), 54: (1, {'@': 227}), 55: (1, {'@': 227}), 0: (1, {'@': 227}), 18: (1, {'@': 227}), 56: (1, {'@': 227}), 57: (1, {'@': 227})}, 154: {38: (0, 247), 39: (0, 244)}, 155: {45: (1, {'@': 225}), 19: (1, {'@': 225}), 15: (1, {'@': 225}), 46: (1, {'@': 225}), 14: (1, {'@': 225}), 47: (1, {'@': 225}), 48: (1, {'@': 225}), 11: (1, {'@': 225}), 50: (1, {'@': 225}), 2: (1, {'@': 225}), 52: (1, {'@': 225}), 13: (1, {'@': 225}), 49: (1, {'@': 225}), 51: (1, {'@': 225}), 5: (1, {'@': 225}), 53: (1, {'@': 225}), 3: (1, {'@': 225}), 54: (1, {'@': 225}), 55: (1, {'@': 225}), 0: (1, {'@': 225}), 18: (1, {'@': 225}), 56: (1, {'@': 225}), 57: (1, {'@': 225})}, 156: {39: (0, 84), 38: (0, 234)}, 157: {106: (0, 304), 107: (0, 185), 108: (0, 238), 45: (1, {'@': 113}), 19: (1, {'@': 113}), 15: (1, {'@': 113}), 46: (1, {'@': 113}), 14: (1, {'@': 113}), 47: (1, {'@': 113}), 48: (1, {'@': 113}), 49: (1, {'@': 113}), 11: (1, {'@': 113}), 50: (1, {'@': 113}), 51: (1, {'@': 113}), 2: (1, {'@': 113}), 52: (1, {'@': 113}), 5: (1, {'@': 113}), 53: (1, {'@': 113}), 3: (1, {'@': 113}), 54: (1, {'@': 113}), 55: (1, {'@': 113}), 0: (1, {'@': 113}), 13: (1, {'@': 113}), 18: (1, {'@': 113}), 56: (1, {'@': 113}), 57: (1, {'@': 113}), 30: (1, {'@': 113})}, 158: {1: (0, 44), 2: (0, 29), 3: (0, 81), 60: (0, 236), 4: (0, 75), 5: (0, 68), 6: (0, 12), 110: (0, 239), 7: (0, 2), 8: (0, 43), 20: (0, 93), 9: (0, 288), 10: (0, 31), 42: (0, 241), 11: (0, 70), 12: (0, 34), 13: (0, 290), 58: (0, 15), 14: (0, 10), 15: (0, 322), 16: (0, 296), 17: (0, 72), 59: (0, 96), 18: (0, 76), 19: (0, 25), 0: (0, 97), 21: (0, 27), 22: (0, 98), 23: (0, 20), 39: (1, {'@': 194})}, 159: {34: (1, {'@': 234}), 38: (1, {'@': 234})}, 160: {61: (0, 41), 3: (0, 228), 6: (0, 12), 9: (0, 69), 62: (0, 55), 57: (0, 42), 8: (0, 43), 1: (0, 44), 64: (0, 38), 12: (0, 34), 65: (0, 33), 13: (0, 30), 58: (0, 15), 16: (0, 19), 60: (0, 74), 48: (0, 56), 66: (0, 89), 5: (0, 39), 7: (0, 2), 18: (0, 76), 84: (0, 273), 99: (0, 230), 22: (0, 98), 56: (0, 79), 68: (0, 92), 69: (0, 91), 4: (0, 75), 10: (0, 31), 15: (0, 232), 14: (0, 10), 59: (0, 96), 54: (0, 95), 20: (0, 93), 0: (0, 97), 70: (0, 13), 71: (0, 53), 49: (0, 18), 73: (0, 62), 17: (0, 72), 53: (0, 46), 55: (0, 67), 51: (0, 7), 46: (0, 17), 21: (0, 27), 23: (0, 20), 47: (0, 0), 74: (0, 28), 19: (0, 25), 75: (0, 37), 76: (0, 26), 2: (0, 29), 78: (0, 36), 11: (0, 70), 30: (0, 274), 80: (0, 125), 81: (0, 130), 82: (0, 136), 72: (0, 217)}, 161: {45: (1, {'@': 226}), 19: (1, {'@': 226}), 15: (1, {'@': 226}), 46: (1, {'@': 226}), 14: (1, {'@': 226}), 47: (1, {'@': 226}), 48: (1, {'@': 226}), 11: (1, {'@': 226}), 50: (1, {'@': 226}), 2: (1, {'@': 226}), 52: (1, {'@': 226}), 13: (1, {'@': 226}), 49: (1, {'@': 226}), 51: (1, {'@': 226}), 5: (1, {'@': 226}), 53: (1, {'@': 226}), 3: (1, {'@': 226}), 54: (1, {'@': 226}), 55: (1, {'@': 226}), 0: (1, {'@': 226}), 18: (1, {'@': 226}), 56: (1, {'@': 226}), 57: (1, {'@': 226})}, 162: {2: (0, 29), 3: (0, 81), 5: (0, 68), 6: (0, 103), 9: (0, 288), 10: (0, 31), 11: (0, 70), 12: (0, 34), 13: (0, 290), 14: (0, 10), 15: (0, 322), 16: (0, 296), 17: (0, 72), 18: (0, 76), 19: (0, 25), 0: (0, 97), 21: (0, 27), 22: (0, 98), 23: (0, 20)}, 163: {39: (0, 73), 42: (1, {'@': 195})}, 164: {42: (0, 231)}, 165: {39: (0, 57)}, 166: {24: (1, {'@': 219}), 25: (1, {'@': 219}), 26: (1, {'@': 219}), 27: (1, {'@': 219}), 28: (1, {'@': 219}), 29: (1, {'@': 219}), 30: (1, {'@': 219}), 31: (1, {'@': 219}), 32: (1, {'@': 219}), 11: (1, {'@': 219}), 33: (1, {'@': 219}), 34: (1, {'@': 219}), 35: (1, {'@': 219}), 36: (1, {'@': 219}), 37: (1, {'@': 219}), 38: (1, {'@': 219}), 39: (1, {'@': 219}), 40: (1, {'@': 219}), 41: (1, {'@': 219}), 42: (1, {'@': 219}), 43: (1, {'@': 219}), 13: (1, {'@': 219}), 44: (1, {'@': 219})}, 167: {85: (1, {'@': 216})}, 168: {24: (1, {'@': 218}), 25: (1, {'@': 218}), 26: (1, {'@': 218}), 27: (1, {'@': 218}), 28: (1, {'@': 218}), 29: (1, {'@': 218}), 30: (1, {'@': 218}), 31: (1, {'@': 218}), 32: (1, {'@': 218}), 11: (1, {'@': 218}), 33: (1, {'@': 218}), 34: (1, {'@': 218}), 35: (1, {'@': 218}), 36: (1, {'@': 218}), 37: (1, {'@': 218}), 38: (1, {'@': 218}), 39: (1, {'@': 218}), 40: (1, {'@': 218}), 41: (1, {'@': 218}), 42: (1, {'@': 218}), 43: (1, {'@': 218}), 13: (1, {'@': 218}), 44: (1, {'@': 218})}, 169: {24: (1, {'@': 220}), 25: (1, {'@': 220}), 26: (1, {'@': 220}), 27: (1, {'@': 220}), 28: (1, {'@': 220}), 29: (1, {'@': 220}), 30: (1, {'@': 220}), 31: (1, {'@': 220}), 32: (1, {'@': 220}), 11: (1, {'@': 220}), 33: (1, {'@': 220}), 34: (1, {'@': 220}), 35: (1, {'@': 220}), 36: (1, {'@': 220}), 37: (1, {'@': 220}), 38: (1, {'@': 220}), 39: (1, {'@': 220}), 40: (1, {'@': 220}), 41: (1, {'@': 220}), 42: (1, {'@': 220}), 43: (1, {'@': 220}), 13: (1, {'@': 220}), 44: (1, {'@': 220})}, 170: {61: (0, 41), 3: (0, 81), 6: (0, 12), 9: (0, 69), 62: (0, 55), 57: (0, 42), 8: (0, 43), 1: (0, 44), 64: (0, 38), 12: (0, 34), 65: (0, 33), 13: (0, 30), 58: (0, 15), 99: (0, 193), 16: (0, 19), 60: (0, 74), 48: (0, 56), 66: (0, 89), 5: (0, 39), 7: (0, 2), 18: (0, 76), 22: (0, 98), 56: (0, 79), 68: (0, 92), 69: (0, 91), 4: (0, 75), 10: (0, 31), 30: (0, 199), 14: (0, 10), 15: (0, 24), 59: (0, 96), 54: (0, 95), 20: (0, 93), 0: (0, 97), 70: (0, 13), 71: (0, 53), 49: (0, 18), 73: (0, 62), 17: (0, 72), 53: (0, 46), 55: (0, 67), 51: (0, 7), 46: (0, 17), 21: (0, 27), 23: (0, 20), 47: (0, 0), 74: (0, 28), 19: (0, 25), 75: (0, 37), 76: (0, 26), 2: (0, 29), 78: (0, 36), 11: (0, 70), 80: (0, 125), 81: (0, 130), 82: (0, 136), 72: (0, 217)}, 171: {45: (1, {'@': 83}), 19: (1, {'@': 83}), 15: (1, {'@': 83}), 46: (1, {'@': 83}), 14: (1, {'@': 83}), 47: (1, {'@': 83}), 48: (1, {'@': 83}), 49: (1, {'@': 83}), 11: (1, {'@': 83}), 50: (1, {'@': 83}), 51: (1, {'@': 83}), 2: (1, {'@': 83}), 52: (1, {'@': 83}), 5: (1, {'@': 83}), 53: (1, {'@': 83}), 3: (1, {'@': 83}), 54: (1, {'@': 83}), 55: (1, {'@': 83}), 0: (1, {'@': 83}), 13: (1, {'@': 83}), 18: (1, {'@': 83}), 56: (1, {'@': 83}), 57: (1, {'@': 83}), 30: (1, {'@': 83})}, 172: {24: (1, {'@': 175}), 25: (1, {'@': 175}), 26: (1, {'@': 175}), 27: (1, {'@': 175}), 28: (1, {'@': 175}), 29: (1, {'@': 175}), 30: (1, {'@': 175}), 31: (1, {'@': 175}), 32: (1, {'@': 175}), 11: (1, {'@': 175}), 33: (1, {'@': 175}), 34: (1, {'@': 175}), 35: (1, {'@': 175}), 36: (1, {'@': 175}), 37: (1, {'@': 175}), 38: (1, {'@': 175}), 39: (1, {'@': 175}), 40: (1, {'@': 175}), 41: (1, {'@': 175}), 42: (1, {'@': 175}), 43: (1, {'@': 175}), 13: (1, {'@': 175}), 44: (1, {'@': 175})}, 173: {1: (0, 44), 2: (0, 29), 3: (0, 81), 4: (0, 75), 5: (0, 68), 6: (0, 12), 7: (0, 2), 8: (0, 43), 20: (0, 93), 9: (0, 288), 10: (0, 31), 11: (0, 70), 60: (0, 324), 12: (0, 34), 13: (0, 290), 58: (0, 15), 14: (0, 10), 15: (0, 322), 16: (0, 296), 17: (0, 72), 59: (0, 96), 18: (0, 76), 19: (0, 25), 0: (0, 97), 21: (0, 27), 111: (0, 196), 22: (0, 98), 23: (0, 20), 39: (1, {'@': 184})}, 174: {112: (0, 245)}, 175: {39: (1, {'@': 189})}, 176: {26: (0, 47), 113: (1, {'@': 79}), 29: (1, {'@': 79})}, 177: {45: (1, {'@': 123}), 19: (1, {'@': 123}), 15: (1, {'@': 123}), 46: (1, {'@': 123}), 14: (1, {'@': 123}), 47: (1, {'@': 123}), 48: (1, {'@': 123}), 49: (1, {'@': 123}), 11: (1, {'@': 123}), 50: (1, {'@': 123}), 51: (1, {'@': 123}), 2: (1, {'@': 123}), 52: (1, {'@': 123}), 5: (1, {'@': 123}), 53: (1, {'@': 123}), 3: (1, {'@': 123}), 54: (1, {'@': 123}), 55: (1, {'@': 123}), 0: (1, {'@': 123}), 13: (1, {'@': 123}), 18: (1, {'@': 123}), 56: (1, {'@': 123}), 57: (1, {'@': 123}), 30: (1, {'@': 123})}, 178: {2: (0, 29), 3: (0, 81), 5: (0, 68), 9: (0, 288), 10: (0, 31), 11: (0, 70), 12: (0, 34), 6: (0, 115), 13: (0, 290), 14: (0, 10), 15: (0, 322), 16: (0, 296), 17: (0, 72), 18: (0, 76), 19: (0, 25), 0: (0, 97), 21: (0, 27), 22: (0, 98), 23: (0, 20)}, 179: {15: (0, 262)}, 180: {15: (0, 259)}, 181: {61: (0, 41), 3: (0, 81), 6: (0, 12), 9: (0, 69), 62: (0, 55), 57: (0, 42), 8: (0, 43), 1: (0, 44), 64: (0, 38), 12: (0, 34), 65: (0, 33), 13: (0, 30), 58: (0, 15), 16: (0, 19), 60: (0, 74), 48: (0, 56), 66: (0, 89), 5: (0, 39), 7: (0, 2), 18: (0, 76), 22: (0, 98), 56: (0, 79), 68: (0, 92), 69: (0, 91), 4: (0, 75), 10: (0, 31), 99: (0, 206), 14: (0, 10), 15: (0, 24), 59: (0, 96), 30: (0, 210), 54: (0, 95), 20: (0, 93), 0: (0, 97), 70: (0, 13), 71: (0, 53), 49: (0, 18), 73: (0, 62), 17: (0, 72), 53: (0, 46), 55: (0, 67), 51: (0, 7), 46: (0, 17), 21: (0, 27), 23: (0, 20), 47: (0, 0), 74: (0, 28), 19: (0, 25), 75: (0, 37), 76: (0, 26), 2: (0, 29), 78: (0, 36), 11: (0, 70), 80: (0, 125), 81: (0, 130), 82: (0, 136), 72: (0, 217)}, 182: {39: (1, {'@': 186})}, 183: {40: (0, 45), 41: (0, 146), 36: (0, 162), 32: (0, 178), 24: (1, {'@': 157}), 25: (1, {'@': 157}), 26: (1, {'@': 157}), 27: (1, {'@': 157}), 28: (1, {'@': 157}), 29: (1, {'@': 157}), 30: (1, {'@': 157}), 31: (1, {'@': 157}), 11: (1, {'@': 157}), 33: (1, {'@': 157}), 34: (1, {'@': 157}), 35: (1, {'@': 157}), 37: (1, {'@': 157}), 38: (1, {'@': 157}), 39: (1, {'@': 157}), 42: (1, {'@': 157}), 43: (1, {'@': 157}), 13: (1, {'@': 157}), 44: (1, {'@': 157})}, 184: {40: (0, 45), 41: (0, 146), 36: (0, 162), 32: (0, 178), 24: (1, {'@': 158}), 25: (1, {'@': 158}), 26: (1, {'@': 158}), 27: (1, {'@': 158}), 28: (1, {'@': 158}), 29: (1, {'@': 158}), 30: (1, {'@': 158}), 31: (1, {'@': 158}), 11: (1, {'@': 158}), 33: (1, {'@': 158}), 34: (1, {'@': 158}), 35: (1, {'@': 158}), 37: (1, {'@': 158}), 38: (1, {'@': 158}), 39: (1, {'@': 158}), 42: (1, {'@': 158}), 43: (1, {'@': 158}), 13: (1, {'@': 158}), 44: (1, {'@': 158})}, 185: {0: (0, 63)}, 186: {5: (0, 144), 87: (0, 220)}, 187: {61: (0, 41), 3: (0, 81), 6: (0, 12), 9: (0, 69), 62: (0, 55), 57: (0, 42), 8: (0, 43), 1: (0, 44), 64: (0, 38), 12: (0, 34), 65: (0, 33), 13: (0, 30), 58: (0, 15), 16: (0, 19), 60: (0, 74), 48: (0, 56), 66: (0, 89), 5: (0, 39), 7: (0, 2), 72: (0, 286), 18: (0, 76), 22: (0, 98), 56: (0, 79), 68: (0, 92), 69: (0, 91), 4: (0, 75), 10: (0, 31), 14: (0, 10), 15: (0, 24), 59: (0, 96), 54: (0, 95), 20: (0, 93), 0: (0, 97), 70: (0, 13), 71: (0, 53), 49: (0, 18), 73: (0, 62), 17: (0, 72), 53: (0, 46), 55: (0, 67), 51: (0, 7), 46: (0, 17), 21: (0, 27), 23: (0, 20), 47: (0, 0), 74: (0, 28), 19: (0, 25), 75: (0, 37), 76: (0, 26), 2: (0, 29), 78: (0, 36), 11: (0, 70), 80: (0, 125), 81: (0, 130), 82: (0, 136), 30: (0, 207)}, 188: {114: (0, 312)}, 189: {44: (0, 280), 43: (1, {'@': 145}), 29: (1, {'@': 145}), 35: (1, {'@': 145}), 38: (1, {'@': 145}), 39: (1, {'@': 145}), 24: (1, {'@': 145}), 25: (1, {'@': 145}), 26: (1, {'@': 145}), 27: (1, {'@': 145}), 28: (1, {'@': 145}), 30: (1, {'@': 145}), 31: (1, {'@': 145}), 32: (1, {'@': 145}), 11: (1, {'@': 145}), 33: (1, {'@': 145}), 34: (1, {'@': 145}), 36: (1, {'@': 145}), 37: (1, {'@': 145}), 40: (1, {'@': 145}), 41: (1, {'@': 145}), 42: (1, {'@': 145}), 13: (1, {'@': 145})}, 190: {61: (0, 41), 3: (0, 81), 6: (0, 12), 9: (0, 69), 62: (0, 55), 57: (0, 42), 8: (0, 43), 1: (0, 44), 64: (0, 38), 12: (0, 34), 65: (0, 33), 13: (0, 30), 58: (0, 15), 16: (0, 19), 60: (0, 74), 48: (0, 56), 66: (0, 89), 5: (0, 39), 7: (0, 2), 99: (0, 242), 18: (0, 76), 30: (0, 243), 22: (0, 98), 56: (0, 79), 68: (0, 92), 69: (0, 91), 4: (0, 75), 10: (0, 31), 14: (0, 10), 15: (0, 24), 59: (0, 96), 54: (0, 95), 20: (0, 93), 0: (0, 97), 70: (0, 13), 71: (0, 53), 49: (0, 18), 73: (0, 62), 17: (0, 72), 53: (0, 46), 55: (0, 67), 51: (0, 7), 46: (0, 17), 21: (0, 27), 23: (0, 20), 47: (0, 0), 74: (0, 28), 19: (0, 25), 75: (0, 37), 76: (0, 26), 2: (0, 29), 78: (0, 36), 11: (0, 70), 80: (0, 125), 81: (0, 130), 82: (0, 136), 72: (0, 217)}, 191: {11: (0, 21), 24: (0, 22), 25: (1, {'@': 155}), 26: (1, {'@': 155}), 27: (1, {'@': 155}), 28: (1, {'@': 155}), 29: (1, {'@': 155}), 30: (1, {'@': 155}), 31: (1, {'@': 155}), 32: (1, {'@': 155}), 33: (1, {'@': 155}), 34: (1, {'@': 155}), 35: (1, {'@': 155}), 36: (1, {'@': 155}), 37: (1, {'@': 155}), 38: (1, {'@': 155}), 39: (1, {'@': 155}), 40: (1, {'@': 155}), 41: (1, {'@': 155}), 42: (1, {'@': 155}), 43: (1, {'@': 155}), 13: (1, {'@': 155}), 44: (1, {'@': 155})}, 192: {11: (0, 21), 24: (0, 22), 25: (1, {'@': 154}), 26: (1, {'@': 154}), 27: (1, {'@': 154}), 28: (1, {'@': 154}), 29: (1, {'@': 154}), 30: (1, {'@': 154}), 31: (1, {'@': 154}), 32: (1, {'@': 154}), 33: (1, {'@': 154}), 34: (1, {'@': 154}), 35: (1, {'@': 154}), 36: (1, {'@': 154}), 37: (1, {'@': 154}), 38: (1, {'@': 154}), 39: (1, {'@': 154}), 40: (1, {'@': 154}), 41: (1, {'@': 154}), 42: (1, {'@': 154}), 43: (1, {'@': 154}), 13: (1, {'@': 154}), 44: (1, {'@': 154})}, 193: {61: (0, 41), 3: (0, 81), 6: (0, 12), 9: (0, 69), 62: (0, 55), 57: (0, 42), 8: (0, 43), 1: (0, 44), 64: (0, 38), 12: (0, 34), 65: (0, 33), 13: (0, 30), 58: (0, 15), 16: (0, 19), 60: (0, 74), 48: (0, 56), 66: (0, 89), 5: (0, 39), 7: (0, 2), 72: (0, 286), 18: (0, 76), 22: (0, 98), 56: (0, 79), 68: (0, 92), 69: (0, 91), 4: (0, 75), 10: (0, 31), 14: (0, 10), 15: (0, 24), 59: (0, 96), 54: (0, 95), 20: (0, 93), 0: (0, 97), 70: (0, 13), 71: (0, 53), 49: (0, 18), 73: (0, 62), 17: (0, 72), 53: (0, 46), 55: (0, 67), 51: (0, 7), 46: (0, 17), 21: (0, 27), 23: (0, 20), 47: (0, 0), 74: (0, 28), 19: (0, 25), 75: (0, 37), 76: (0, 26), 2: (0, 29), 30: (0, 237), 78: (0, 36), 11: (0, 70), 80: (0, 125), 81: (0, 130), 82: (0, 136)}, 194: {30: (1, {'@': 240}), 38: (1, {'@': 240}), 29: (1, {'@': 240}), 39: (1, {'@': 240})}, 195: {42: (0, 35)}, 196: {39: (1, {'@': 183})}, 197: {25: (0, 4), 27: (0, 87), 24: (1, {'@': 147}), 26: (1, {'@': 147}), 28: (1, {'@': 147}), 29: (1, {'@': 147}), 30: (1, {'@': 147}), 31: (1, {'@': 147}), 32: (1, {'@': 147}), 11: (1, {'@': 147}), 33: (1, {'@': 147}), 34: (1, {'@': 147}), 35: (1, {'@': 147}), 36: (1, {'@': 147}), 37: (1, {'@': 147}), 38: (1, {'@': 147}), 39: (1, {'@': 147}), 40: (1, {'@': 147}), 41: (1, {'@': 147}), 42: (1, {'@': 147}), 43: (1, {'@': 147}), 13: (1, {'@': 147}), 44: (1, {'@': 147})}, 198: {11: (0, 21), 24: (0, 22), 25: (1, {'@': 152}), 26: (1, {'@': 152}), 27: (1, {'@': 152}), 28: (1, {'@': 152}), 29: (1, {'@': 152}), 30: (1, {'@': 152}), 31: (1, {'@': 152}), 32: (1, {'@': 152}), 33: (1, {'@': 152}), 34: (1, {'@': 152}), 35: (1, {'@': 152}), 36: (1, {'@': 152}), 37: (1, {'@': 152}), 38: (1, {'@': 152}), 39: (1, {'@': 152}), 40: (1, {'@': 152}), 41: (1, {'@': 152}), 42: (1, {'@': 152}), 43: (1, {'@': 152}), 13: (1, {'@': 152}), 44: (1, {'@': 152})}, 199: {45: (1, {'@': 136}), 19: (1, {'@': 136}), 15: (1, {'@': 136}), 46: (1, {'@': 136}), 14: (1, {'@': 136}), 47: (1, {'@': 136}), 48: (1, {'@': 136}), 11: (1, {'@': 136}), 50: (1, {'@': 136}), 2: (1, {'@': 136}), 52: (1, {'@': 136}), 13: (1, {'@': 136}), 30: (1, {'@': 136}), 49: (1, {'@': 136}), 51: (1, {'@': 136}), 5: (1, {'@': 136}), 53: (1, {'@': 136}), 3: (1, {'@': 136}), 54: (1, {'@': 136}), 55: (1, {'@': 136}), 0: (1, {'@': 136}), 18: (1, {'@': 136}), 56: (1, {'@': 136}), 57: (1, {'@': 136})}, 200: {29: (0, 23), 38: (0, 234)}, 201: {45: (1, {'@': 134}), 19: (1, {'@': 134}), 101: (1, {'@': 134}), 15: (1, {'@': 134}), 46: (1, {'@': 134}), 14: (1, {'@': 134}), 47: (1, {'@': 134}), 30: (1, {'@': 134}), 48: (1, {'@': 134}), 49: (1, {'@': 134}), 11: (1, {'@': 134}), 50: (1, {'@': 134}), 51: (1, {'@': 134}), 100: (1, {'@': 134}), 2: (1, {'@': 134}), 52: (1, {'@': 134}), 5: (1, {'@': 134}), 53: (1, {'@': 134}), 3: (1, {'@': 134}), 54: (1, {'@': 134}), 55: (1, {'@': 134}), 0: (1, {'@': 134}), 13: (1, {'@': 134}), 18: (1, {'@': 134}), 56: (1, {'@': 134}), 57: (1, {'@': 134})}, 202: {11: (0, 21), 24: (0, 22), 25: (1, {'@': 153}), 26: (1, {'@': 153}), 27: (1, {'@': 153}), 28: (1, {'@': 153}), 29: (1, {'@': 153}), 30: (1, {'@': 153}), 31: (1, {'@': 153}), 32: (1, {'@': 153}), 33: (1, {'@': 153}), 34: (1, {'@': 153}), 35: (1, {'@': 153}), 36: (1, {'@': 153}), 37: (1, {'@': 153}), 38: (1, {'@': 153}), 39: (1, {'@': 153}), 40: (1, {'@': 153}), 41: (1, {'@': 153}), 42: (1, {'@': 153}), 43: (1, {'@': 153}), 13: (1, {'@': 153}), 44: (1, {'@': 153})}, 203: {61: (0, 41), 3: (0, 81), 6: (0, 12), 9: (0, 69), 62: (0, 55), 57: (0, 42), 8: (0, 43), 1: (0, 44), 64: (0, 38), 12: (0, 34), 65: (0, 33), 13: (0, 30), 58: (0, 15), 16: (0, 19), 60: (0, 74), 48: (0, 56), 66: (0, 89), 5: (0, 39), 7: (0, 2), 72: (0, 286), 18: (0, 76), 22: (0, 98), 56: (0, 79), 68: (0, 92), 69: (0, 91), 4: (0, 75), 10: (0, 31), 14: (0, 10), 15: (0, 24), 59: (0, 96), 54: (0, 95), 20: (0, 93), 0: (0, 97), 70: (0, 13), 71: (0, 53), 49: (0, 18), 30: (0, 240), 73: (0, 62), 17: (0, 72), 53: (0, 46), 55: (0, 67), 51: (0, 7), 46: (0, 17), 21: (0, 27), 23: (0, 20), 47: (0, 0), 74: (0, 28), 19: (0, 25), 75: (0, 37), 76: (0, 26), 2: (0, 29), 78: (0, 36), 11: (0, 70), 80: (0, 125), 81: (0, 130), 82: (0, 136)}, 204: {103: (0, 294), 15: (0, 221), 104: (0, 218), 34: (0, 295)}, 205: {34: (0, 90)}, 206: {61: (0, 41), 3: (0, 81), 6: (0, 12), 9: (0, 69), 62: (0, 55), 30: (0, 278), 57: (0, 42), 8: (0, 43), 1: (0, 44), 64: (0, 38), 12: (0, 34), 65: (0, 33), 13: (0, 30), 58: (0, 15), 16: (0, 19), 60: (0, 74), 48: (0, 56), 66: (0, 89), 5: (0, 39), 7: (0, 2), 72: (0, 286), 18: (0, 76), 22: (0, 98), 56: (0, 79), 68: (0, 92), 69: (0, 91), 4: (0, 75), 10: (0, 31), 14: (0, 10), 15: (0, 24), 59: (0, 96), 54: (0, 95), 20: (0, 93), 0: (0, 97), 70: (0, 13), 71: (0, 53), 49: (0, 18), 73: (0, 62), 17: (0, 72), 53: (0, 46), 55: (0, 67), 51: (0, 7), 46: (0, 17), 21: (0, 27), 23: (0, 20), 47: (0, 0), 74: (0, 28), 19: (0, 25), 75: (0, 37), 76: (0, 26), 2: (0, 29), 78: (0, 36), 11: (0, 70), 80: (0, 125), 81: (0, 130), 82: (0, 136)}, 207: {45: (1, {'@': 119}), 19: (1, {'@': 119}), 15: (1, {'@': 119}), 46: (1, {'@': 119}), 14: (1, {'@': 119}), 47: (1, {'@': 119}), 48: (1, {'@': 119}), 49: (1, {'@': 119}), 11: (1, {'@': 119}), 50: (1, {'@': 119}), 51: (1, {'@': 119}), 2: (1, {'@': 119}), 52: (1, {'@': 119}), 5: (1, {'@': 119}), 53: (1, {'@': 119}), 3: (1, {'@': 119}), 54: (1, {'@': 119}), 55: (1, {'@': 119}), 0: (1, {'@': 119}), 13: (1, {'@': 119}), 18: (1, {'@': 119}), 56: (1, {'@': 119}), 57: (1, {'@': 119}), 30: (1, {'@': 119})}, 208: {29: (1, {'@': 69})}, 209: {45: (1, {'@': 236}), 19: (1, {'@': 236}), 107: (1, {'@': 236}), 15: (1, {'@': 236}), 108: (1, {'@': 236}), 46: (1, {'@': 236}), 14: (1, {'@': 236}), 47: (1, {'@': 236}), 48: (1, {'@': 236}), 11: (1, {'@': 236}), 50: (1, {'@': 236}), 2: (1, {'@': 236}), 52: (1, {'@': 236}), 13: (1, {'@': 236}), 30: (1, {'@': 236}), 49: (1, {'@': 236}), 51: (1, {'@': 236}), 5: (1, {'@': 236}), 53: (1, {'@': 236}), 3: (1, {'@': 236}), 54: (1, {'@': 236}), 55: (1, {'@': 236}), 0: (1, {'@': 236}), 18: (1, {'@': 236}), 56: (1, {'@': 236}), 57: (1, {'@': 236})}, 210: {100: (0, 277), 101: (0, 271), 115: (0, 275), 116: (0, 260), 117: (0, 253), 45: (1, {'@': 130}), 19: (1, {'@': 130}), 15: (1, {'@': 130}), 46: (1, {'@': 130}), 14: (1, {'@': 130}), 47: (1, {'@': 130}), 48: (1, {'@': 130}), 49: (1, {'@': 130}), 11: (1, {'@': 130}), 50: (1, {'@': 130}), 51: (1, {'@': 130}), 2: (1, {'@': 130}), 52: (1, {'@': 130}), 5: (1, {'@': 130}), 53: (1, {'@': 130}), 3: (1, {'@': 130}), 54: (1, {'@': 130}), 55: (1, {'@': 130}), 0: (1, {'@': 130}), 13: (1, {'@': 130}), 18: (1, {'@': 130}), 56: (1, {'@': 130}), 57: (1, {'@': 130}), 30: (1, {'@': 130})}, 211: {45: (1, {'@': 84}), 19: (1, {'@': 84}), 15: (1, {'@': 84}), 46: (1, {'@': 84}), 14: (1, {'@': 84}), 47: (1, {'@': 84}), 48: (1, {'@': 84}), 49: (1, {'@': 84}), 11: (1, {'@': 84}), 50: (1, {'@': 84}), 51: (1, {'@': 84}), 2: (1, {'@': 84}), 52: (1, {'@': 84}), 5: (1, {'@': 84}), 53: (1, {'@': 84}), 3: (1, {'@': 84}), 54: (1, {'@': 84}), 55: (1, {'@': 84}), 0: (1, {'@': 84}), 13: (1, {'@': 84}), 18: (1, {'@': 84}), 56: (1, {'@': 84}), 57: (1, {'@': 84}), 30: (1, {'@': 84})}, 212: {61: (0, 41), 3: (0, 81), 6: (0, 12), 9: (0, 69), 62: (0, 55), 57: (0, 42), 8: (0, 43), 1: (0, 44), 64: (0, 38), 12: (0, 34), 65: (0, 33), 13: (0, 30), 30: (0, 171), 58: (0, 15), 16: (0, 19), 60: (0, 74), 48: (0, 56), 66: (0, 89), 5: (0, 39), 7: (0, 2), 72: (0, 286), 18: (0, 76), 22: (0, 98), 56: (0, 79), 68: (0, 92), 69: (0, 91), 4: (0, 75), 10: (0, 31), 14: (0, 10), 15: (0, 24), 59: (0, 96), 54: (0, 95), 20: (0, 93), 0: (0, 97), 70: (0, 13), 71: (0, 53), 49: (0, 18), 73: (0, 62), 17: (0, 72), 53: (0, 46), 55: (0, 67), 51: (0, 7), 46: (0, 17), 21: (0, 27), 23: (0, 20), 47: (0, 0), 74: (0, 28), 19: (0, 25), 75: (0, 37), 76: (0, 26), 2: (0, 29), 78: (0, 36), 11: (0, 70), 80: (0, 125), 81: (0, 130), 82: (0, 136)}, 213: {45: (1, {'@': 112}), 19: (1, {'@': 112}), 15: (1, {'@': 112}), 46: (1, {'@': 112}), 14: (1, {'@': 112}), 47: (1, {'@': 112}), 48: (1, {'@': 112}), 49: (1, {'@': 112}), 11: (1, {'@': 112}), 50: (1, {'@': 112}), 51: (1, {'@': 112}), 2: (1, {'@': 112}), 52: (1, {'@': 112}), 5: (1, {'@': 112}), 53: (1, {'@': 112}), 3: (1, {'@': 112}), 54: (1, {'@': 112}), 55: (1, {'@': 112}), 0: (1, {'@': 112}), 13: (1, {'@': 112}), 18: (1, {'@': 112}), 56: (1, {'@': 112}), 57: (1, {'@': 112}), 30: (1, {'@': 112})}, 214: {15: (0, 148)}, 215: {92: (0, 132), 94: (0, 266), 96: (0, 107), 30: (0, 109), 95: (0, 276), 97: (0, 291)}, 216: {45: (1, {'@': 120}), 19: (1, {'@': 120}), 15: (1, {'@': 120}), 46: (1, {'@': 120}), 14: (1, {'@': 120}), 47: (1, {'@': 120}), 48: (1, {'@': 120}), 49: (1, {'@': 120}), 11: (1, {'@': 120}), 50: (1, {'@': 120}), 51: (1, {'@': 120}), 2: (1, {'@': 120}), 52: (1, {'@': 120}), 5: (1, {'@': 120}), 53: (1, {'@': 120}), 3: (1, {'@': 120}), 54: (1, {'@': 120}), 55: (1, {'@': 120}), 0: (1, {'@': 120}), 13: (1, {'@': 120}), 18: (1, {'@': 120}), 56: (1, {'@': 120}), 57: (1, {'@': 120}), 30: (1, {'@': 120})}, 217: {19: (1, {'@': 232}), 15: (1, {'@': 232}), 46: (1, {'@': 232}), 14: (1, {'@': 232}), 47: (1, {'@': 232}), 48: (1, {'@': 232}), 11: (1, {'@': 232}), 2: (1, {'@': 232}), 13: (1, {'@': 232}), 30: (1, {'@': 232}), 49: (1, {'@': 232}), 51: (1, {'@': 232}), 5: (1, {'@': 232}), 53: (1, {'@': 232}), 3: (1, {'@': 232}), 54: (1, {'@': 232}), 55: (1, {'@': 232}), 0: (1, {'@': 232}), 18: (1, {'@': 232}), 56: (1, {'@': 232}), 57: (1, {'@': 232})}, 218: {38: (0, 308), 118: (0, 311), 34: (1, {'@': 86})}, 219: {29: (0, 316)}, 220: {45: (1, {'@': 114}), 19: (1, {'@': 114}), 15: (1, {'@': 114}), 46: (1, {'@': 114}), 14: (1, {'@': 114}), 47: (1, {'@': 114}), 48: (1, {'@': 114}), 49: (1, {'@': 114}), 11: (1, {'@': 114}), 50: (1, {'@': 114}), 51: (1, {'@': 114}), 2: (1, {'@': 114}), 52: (1, {'@': 114}), 5: (1, {'@': 114}), 53: (1, {'@': 114}), 3: (1, {'@': 114}), 54: (1, {'@': 114}), 55: (1, {'@': 114}), 0: (1, {'@': 114}), 13: (1, {'@': 114}), 18: (1, {'@': 114}), 56: (1, {'@': 114}), 57: (1, {'@': 114}), 30: (1, {'@': 114})}, 221: {42: (0, 303), 34: (1, {'@': 88}), 38: (1, {'@': 88})}, 222: {34: (0, 305)}, 223: {61: (0, 41), 3: (0, 81), 6: (0, 12), 9: (0, 69), 62: (0, 55), 57: (0, 42), 8: (0, 43), 1: (0, 44), 64: (0, 38), 12: (0, 34), 65: (0, 33), 13: (0, 30), 58: (0, 15), 16: (0, 19), 60: (0, 74), 48: (0, 56), 66: (0, 89), 5: (0, 39), 7: (0, 2), 72: (0, 286), 18: (0, 76), 22: (0, 98), 56: (0, 79), 68: (0, 92), 69: (0, 91), 4: (0, 75), 10: (0, 31), 30: (0, 250), 14: (0, 10), 15: (0, 24), 59: (0, 96), 54: (0, 95), 20: (0, 93), 0: (0, 97), 70: (0, 13), 71: (0, 53), 49: (0, 18), 73: (0, 62), 17: (0, 72), 53: (0, 46), 55: (0, 67), 51: (0, 7), 46: (0, 17), 21: (0, 27), 23: (0, 20), 47: (0, 0), 74: (0, 28), 19: (0, 25), 75: (0, 37), 76: (0, 26), 2: (0, 29), 78: (0, 36), 11: (0, 70), 80: (0, 125), 81: (0, 130), 82: (0, 136)}, 224: {45: (1, {'@': 104}), 19: (1, {'@': 104}), 15: (1, {'@': 104}), 46: (1, {'@': 104}), 14: (1, {'@': 104}), 47: (1, {'@': 104}), 48: (1, {'@': 104}), 49: (1, {'@': 104}), 11: (1, {'@': 104}), 50: (1, {'@': 104}), 51: (1, {'@': 104}), 2: (1, {'@': 104}), 52: (1, {'@': 104}), 5: (1, {'@': 104}), 53: (1, {'@': 104}), 3: (1, {'@': 104}), 54: (1, {'@': 104}), 55: (1, {'@': 104}), 0: (1, {'@': 104}), 13: (1, {'@': 104}), 18: (1, {'@': 104}), 56: (1, {'@': 104}), 57: (1, {'@': 104}), 30: (1, {'@': 104})}, 225: {34: (0, 293)}, 226: {34: (0, 292)}, 227: {45: (1, {'@': 118}), 19: (1, {'@': 118}), 107: (1, {'@': 118}), 15: (1, {'@': 118}), 108: (1, {'@': 118}), 46: (1, {'@': 118}), 14: (1, {'@': 118}), 47: (1, {'@': 118}), 48: (1, {'@': 118}), 11: (1, {'@': 118}), 50: (1, {'@': 118}), 2: (1, {'@': 118}), 52: (1, {'@': 118}), 13: (1, {'@': 118}), 30: (1, {'@': 118}), 49: (1, {'@': 118}), 51: (1, {'@': 118}), 5: (1, {'@': 118}), 53: (1, {'@': 118}), 3: (1, {'@': 118}), 54: (1, {'@': 118}), 55: (1, {'@': 118}), 0: (1, {'@': 118}), 18: (1, {'@': 118}), 56: (1, {'@': 118}), 57: (1, {'@': 118})}, 228: {42: (0, 78), 24: (1, {'@': 199}), 25: (1, {'@': 199}), 26: (1, {'@': 199}), 27: (1, {'@': 199}), 28: (1, {'@': 199}), 29: (1, {'@': 199}), 31: (1, {'@': 199}), 32: (1, {'@': 199}), 11: (1, {'@': 199}), 33: (1, {'@': 199}), 35: (1, {'@': 199}), 36: (1, {'@': 199}), 37: (1, {'@': 199}), 40: (1, {'@': 199}), 41: (1, {'@': 199}), 43: (1, {'@': 199}), 13: (1, {'@': 199}), 44: (1, {'@': 199})}, 229: {42: (0, 158), 1: (0, 44), 2: (0, 29), 3: (0, 81), 60: (0, 163), 4: (0, 75), 5: (0, 68), 6: (0, 12), 7: (0, 2), 119: (0, 164), 8: (0, 43), 20: (0, 93), 9: (0, 288), 10: (0, 31), 11: (0, 70), 12: (0, 34), 13: (0, 290), 58: (0, 15), 14: (0, 10), 15: (0, 322), 16: (0, 296), 17: (0, 72), 59: (0, 96), 18: (0, 76), 19: (0, 25), 120: (0, 165), 0: (0, 97), 21: (0, 27), 22: (0, 98), 23: (0, 20)}, 230: {61: (0, 41), 3: (0, 81), 6: (0, 12), 9: (0, 69), 62: (0, 55), 57: (0, 42), 8: (0, 43), 1: (0, 44), 64: (0, 38), 12: (0, 34), 65: (0, 33), 13: (0, 30), 58: (0, 15), 16: (0, 19), 60: (0, 74), 48: (0, 56), 66: (0, 89), 5: (0, 39), 7: (0, 2), 72: (0, 286), 18: (0, 76), 22: (0, 98), 56: (0, 79), 68: (0, 92), 69: (0, 91), 4: (0, 75), 10: (0, 31), 14: (0, 10), 15: (0, 24), 59: (0, 96), 54: (0, 95), 20: (0, 93), 0: (0, 97), 70: (0, 13), 71: (0, 53), 49: (0, 18), 73: (0, 62), 17: (0, 72), 30: (0, 251), 53: (0, 46), 55: (0, 67), 51: (0, 7), 46: (0, 17), 21: (0, 27), 23: (0, 20), 47: (0, 0), 74: (0, 28), 19: (0, 25), 75: (0, 37), 76: (0, 26), 2: (0, 29), 78: (0, 36), 11: (0, 70), 80: (0, 125), 81: (0, 130), 82: (0, 136)}, 231: {1: (0, 44), 110: (0, 329), 2: (0, 29), 3: (0, 81), 60: (0, 236), 42: (0, 330), 4: (0, 75), 5: (0, 68), 6: (0, 12), 7: (0, 2), 8: (0, 43), 20: (0, 93), 9: (0, 288), 10: (0, 31), 11: (0, 70), 12: (0, 34), 13: (0, 290), 58: (0, 15), 14: (0, 10), 15: (0, 322), 16: (0, 296), 17: (0, 72), 59: (0, 96), 18: (0, 76), 19: (0, 25), 0: (0, 97), 21: (0, 27), 22: (0, 98), 23: (0, 20), 39: (1, {'@': 188})}, 232: {0: (0, 318), 42: (0, 151), 85: (1, {'@': 106}), 24: (1, {'@': 168}), 25: (1, {'@': 168}), 26: (1, {'@': 168}), 27: (1, {'@': 168}), 28: (1, {'@': 168}), 29: (1, {'@': 168}), 31: (1, {'@': 168}), 32: (1, {'@': 168}), 11: (1, {'@': 168}), 33: (1, {'@': 168}), 35: (1, {'@': 168}), 36: (1, {'@': 168}), 37: (1, {'@': 168}), 40: (1, {'@': 168}), 41: (1, {'@': 168}), 43: (1, {'@': 168}), 13: (1, {'@': 168}), 44: (1, {'@': 168})}, 233: {34: (1, {'@': 87}), 38: (1, {'@': 87})}, 234: {15: (0, 249)}, 235: {5: (0, 252)}, 236: {39: (1, {'@': 196}), 42: (1, {'@': 196})}, 237: {45: (1, {'@': 135}), 19: (1, {'@': 135}), 15: (1, {'@': 135}), 46: (1, {'@': 135}), 14: (1, {'@': 135}), 47: (1, {'@': 135}), 48: (1, {'@': 135}), 11: (1, {'@': 135}), 50: (1, {'@': 135}), 2: (1, {'@': 135}), 52: (1, {'@': 135}), 13: (1, {'@': 135}), 30: (1, {'@': 135}), 49: (1, {'@': 135}), 51: (1, {'@': 135}), 5: (1, {'@': 135}), 53: (1, {'@': 135}), 3: (1, {'@': 135}), 54: (1, {'@': 135}), 55: (1, {'@': 135}), 0: (1, {'@': 135}), 18: (1, {'@': 135}), 56: (1, {'@': 135}), 57: (1, {'@': 135})}, 238: {5: (0, 144), 87: (0, 213)}, 239: {42: (0, 298), 39: (1, {'@': 191})}, 240: {45: (1, {'@': 133}), 19: (1, {'@': 133}), 101: (1, {'@': 133}), 15: (1, {'@': 133}), 46: (1, {'@': 133}), 14: (1, {'@': 133}), 47: (1, {'@': 133}), 30: (1, {'@': 133}), 48: (1, {'@': 133}), 49: (1, {'@': 133}), 11: (1, {'@': 133}), 50: (1, {'@': 133}), 51: (1, {'@': 133}), 100: (1, {'@': 133}), 2: (1, {'@': 133}), 52: (1, {'@': 133}), 5: (1, {'@': 133}), 53: (1, {'@': 133}), 3: (1, {'@': 133}), 54: (1, {'@': 133}), 55: (1, {'@': 133}), 0: (1, {'@': 133}), 13: (1, {'@': 133}), 18: (1, {'@': 133}), 56: (1, {'@': 133}), 57: (1, {'@': 133})}, 241: {1: (0, 44), 2: (0, 29), 3: (0, 81), 4: (0, 75), 5: (0, 68), 6: (0, 12), 7: (0, 2), 8: (0, 43), 20: (0, 93), 9: (0, 288), 10: (0, 31), 11: (0, 70), 60: (0, 324), 12: (0, 34), 13: (0, 290), 111: (0, 326), 58: (0, 15), 14: (0, 10), 15: (0, 322), 16: (0, 296), 17: (0, 72), 59: (0, 96), 18: (0, 76), 19: (0, 25), 0: (0, 97), 21: (0, 27), 22: (0, 98), 23: (0, 20), 39: (1, {'@': 193})}, 242: {61: (0, 41), 3: (0, 81), 6: (0, 12), 9: (0, 69), 62: (0, 55), 57: (0, 42), 8: (0, 43), 1: (0, 44), 64: (0, 38), 12: (0, 34), 65: (0, 33), 13: (0, 30), 58: (0, 15), 16: (0, 19), 60: (0, 74), 48: (0, 56), 66: (0, 89), 5: (0, 39), 7: (0, 2), 72: (0, 286), 18: (0, 76), 22: (0, 98), 56: (0, 79), 68: (0, 92), 69: (0, 91), 4: (0, 75), 10: (0, 31), 14: (0, 10), 15: (0, 24), 59: (0, 96), 54: (0, 95), 20: (0, 93), 0: (0, 97), 70: (0, 13), 71: (0, 53), 30: (0, 261), 49: (0, 18), 73: (0, 62), 17: (0, 72), 53: (0, 46), 55: (0, 67), 51: (0, 7), 46: (0, 17), 21: (0, 27), 23: (0, 20), 47: (0, 0), 74: (0, 28), 19: (0, 25), 75: (0, 37), 76: (0, 26), 2: (0, 29), 78: (0, 36), 11: (0, 70), 80: (0, 125), 81: (0, 130), 82: (0, 136)}, 243: {45: (1, {'@': 82}), 19: (1, {'@': 82}), 15: (1, {'@': 82}), 46: (1, {'@': 82}), 14: (1, {'@': 82}), 47: (1, {'@': 82}), 48: (1, {'@': 82}), 49: (1, {'@': 82}), 11: (1, {'@': 82}), 50: (1, {'@': 82}), 51: (1, {'@': 82}), 2: (1, {'@': 82}), 52: (1, {'@': 82}), 5: (1, {'@': 82}), 53: (1, {'@': 82}), 3: (1, {'@': 82}), 54: (1, {'@': 82}), 55: (1, {'@': 82}), 0: (1, {'@': 82}), 13: (1, {'@': 82}), 18: (1, {'@': 82}), 56: (1, {'@': 82}), 57: (1, {'@': 82}), 30: (1, {'@': 82})}, 244: {24: (1, {'@': 203}), 25: (1, {'@': 203}), 26: (1, {'@': 203}), 27: (1, {'@': 203}), 28: (1, {'@': 203}), 29: (1, {'@': 203}), 30: (1, {'@': 203}), 31: (1, {'@': 203}), 32: (1, {'@': 203}), 11: (1, {'@': 203}), 33: (1, {'@': 203}), 34: (1, {'@': 203}), 35: (1, {'@': 203}), 36: (1, {'@': 203}), 37: (1, {'@': 203}), 38: (1, {'@': 203}), 39: (1, {'@': 203}), 40: (1, {'@': 203}), 41: (1, {'@': 203}), 42: (1, {'@': 203}), 43: (1, {'@': 203}), 13: (1, {'@': 203}), 44: (1, {'@': 203})}, 245: {1: (0, 44), 2: (0, 29), 3: (0, 81), 4: (0, 75), 5: (0, 68), 6: (0, 12), 7: (0, 2), 60: (0, 99), 8: (0, 43), 20: (0, 93), 9: (0, 288), 10: (0, 31), 11: (0, 70), 12: (0, 34), 13: (0, 290), 58: (0, 15), 14: (0, 10), 15: (0, 322), 16: (0, 296), 17: (0, 72), 59: (0, 96), 18: (0, 76), 19: (0, 25), 0: (0, 97), 21: (0, 27), 22: (0, 98), 23: (0, 20)}, 246: {34: (0, 54)}, 247: {1: (0, 44), 2: (0, 29), 3: (0, 81), 4: (0, 75), 5: (0, 68), 6: (0, 12), 7: (0, 2), 8: (0, 43), 20: (0, 93), 9: (0, 288), 10: (0, 31), 11: (0, 70), 12: (0, 34), 13: (0, 290), 58: (0, 15), 14: (0, 10), 15: (0, 322), 16: (0, 296), 17: (0, 72), 59: (0, 96), 18: (0, 76), 60: (0, 306), 19: (0, 25), 0: (0, 97), 21: (0, 27), 22: (0, 98), 23: (0, 20)}, 248: {34: (1, {'@': 242}), 38: (1, {'@': 242}), 39: (1, {'@': 242})}, 249: {30: (1, {'@': 241}), 38: (1, {'@': 241}), 29: (1, {'@': 241}), 39: (1, {'@': 241})}, 250: {45: (1, {'@': 117}), 19: (1, {'@': 117}), 107: (1, {'@': 117}), 15: (1, {'@': 117}), 108: (1, {'@': 117}), 46: (1, {'@': 117}), 14: (1, {'@': 117}), 47: (1, {'@': 117}), 48: (1, {'@': 117}), 11: (1, {'@': 117}), 50: (1, {'@': 117}), 2: (1, {'@': 117}), 52: (1, {'@': 117}), 13: (1, {'@': 117}), 30: (1, {'@': 117}), 49: (1, {'@': 117}), 51: (1, {'@': 117}), 5: (1, {'@': 117}), 53: (1, {'@': 117}), 3: (1, {'@': 117}), 54: (1, {'@': 117}), 55: (1, {'@': 117}), 0: (1, {'@': 117}), 18: (1, {'@': 117}), 56: (1, {'@': 117}), 57: (1, {'@': 117})}, 251: {24: (1, {'@': 221}), 25: (1, {'@': 221}), 26: (1, {'@': 221}), 27: (1, {'@': 221}), 28: (1, {'@': 221}), 29: (1, {'@': 221}), 30: (1, {'@': 221}), 31: (1, {'@': 221}), 32: (1, {'@': 221}), 11: (1, {'@': 221}), 33: (1, {'@': 221}), 34: (1, {'@': 221}), 35: (1, {'@': 221}), 36: (1, {'@': 221}), 37: (1, {'@': 221}), 38: (1, {'@': 221}), 39: (1, {'@': 221}), 40: (1, {'@': 221}), 41: (1, {'@': 221}), 42: (1, {'@': 221}), 43: (1, {'@': 221}), 13: (1, {'@': 221}), 44: (1, {'@': 221})}, 252: {61: (0, 41), 3: (0, 81), 6: (0, 12), 9: (0, 69), 62: (0, 55), 57: (0, 42), 8: (0, 43), 1: (0, 44), 64: (0, 38), 12: (0, 34), 65: (0, 33), 13: (0, 30), 58: (0, 15), 16: (0, 19), 60: (0, 74), 48: (0, 56), 66: (0, 89), 5: (0, 39), 7: (0, 2), 18: (0, 76), 22: (0, 98), 56: (0, 79), 68: (0, 92), 69: (0, 91), 4: (0, 75), 10: (0, 31), 14: (0, 10), 15: (0, 24), 59: (0, 96), 54: (0, 95), 20: (0, 93), 0: (0, 97), 99: (0, 267), 70: (0, 13), 71: (0, 53), 49: (0, 18), 73: (0, 62), 17: (0, 72), 53: (0, 46), 55: (0, 67), 51: (0, 7), 46: (0, 17), 21: (0, 27), 30: (0, 269), 23: (0, 20), 47: (0, 0), 74: (0, 28), 19: (0, 25), 75: (0, 37), 76: (0, 26), 2: (0, 29), 78: (0, 36), 11: (0, 70), 80: (0, 125), 81: (0, 130), 82: (0, 136), 72: (0, 217)}, 253: {45: (1, {'@': 129}), 19: (1, {'@': 129}), 15: (1, {'@': 129}), 46: (1, {'@': 129}), 14: (1, {'@': 129}), 47: (1, {'@': 129}), 48: (1, {'@': 129}), 49: (1, {'@': 129}), 11: (1, {'@': 129}), 50: (1, {'@': 129}), 51: (1, {'@': 129}), 2: (1, {'@': 129}), 52: (1, {'@': 129}), 5: (1, {'@': 129}), 53: (1, {'@': 129}), 3: (1, {'@': 129}), 54: (1, {'@': 129}), 55: (1, {'@': 129}), 0: (1, {'@': 129}), 13: (1, {'@': 129}), 18: (1, {'@': 129}), 56: (1, {'@': 129}), 57: (1, {'@': 129}), 30: (1, {'@': 129})}, 254: {45: (1, {'@': 122}), 19: (1, {'@': 122}), 15: (1, {'@': 122}), 46: (1, {'@': 122}), 14: (1, {'@': 122}), 47: (1, {'@': 122}), 48: (1, {'@': 122}), 49: (1, {'@': 122}), 11: (1, {'@': 122}), 50: (1, {'@': 122}), 51: (1, {'@': 122}), 2: (1, {'@': 122}), 52: (1, {'@': 122}), 5: (1, {'@': 122}), 53: (1, {'@': 122}), 3: (1, {'@': 122}), 54: (1, {'@': 122}), 55: (1, {'@': 122}), 0: (1, {'@': 122}), 13: (1, {'@': 122}), 18: (1, {'@': 122}), 56: (1, {'@': 122}), 57: (1, {'@': 122}), 30: (1, {'@': 122})}, 255: {61: (0, 41), 3: (0, 81), 6: (0, 12), 9: (0, 69), 62: (0, 55), 30: (0, 264), 57: (0, 42), 8: (0, 43), 1: (0, 44), 64: (0, 38), 12: (0, 34), 65: (0, 33), 13: (0, 30), 58: (0, 15), 16: (0, 19), 60: (0, 74), 48: (0, 56), 66: (0, 89), 5: (0, 39), 7: (0, 2), 72: (0, 286), 18: (0, 76), 22: (0, 98), 56: (0, 79), 68: (0, 92), 69: (0, 91), 4: (0, 75), 10: (0, 31), 14: (0, 10), 15: (0, 24), 59: (0, 96), 54: (0, 95), 20: (0, 93), 0: (0, 97), 70: (0, 13), 71: (0, 53), 49: (0, 18), 73: (0, 62), 17: (0, 72), 53: (0, 46), 55: (0, 67), 51: (0, 7), 46: (0, 17), 21: (0, 27), 23: (0, 20), 47: (0, 0), 74: (0, 28), 19: (0, 25), 75: (0, 37), 76: (0, 26), 2: (0, 29), 78: (0, 36), 11: (0, 70), 80: (0, 125), 81: (0, 130), 82: (0, 136)}, 256: {15: (0, 134), 3: (0, 279), 84: (0, 320)}, 257: {30: (1, {'@': 209}), 38: (1, {'@': 209})}, 258: {92: (1, {'@': 67}), 95: (1, {'@': 67}), 30: (1, {'@': 67})}, 259: {29: (0, 328)}, 260: {45: (1, {'@': 238}), 19: (1, {'@': 238}), 15: (1, {'@': 238}), 46: (1, {'@': 238}), 14: (1, {'@': 238}), 47: (1, {'@': 238}), 48: (1, {'@': 238}), 11: (1, {'@': 238}), 50: (1, {'@': 238}), 100: (1, {'@': 238}), 2: (1, {'@': 238}), 52: (1, {'@': 238}), 13: (1, {'@': 238}), 101: (1, {'@': 238}), 30: (1, {'@': 238}), 49: (1, {'@': 238}), 51: (1, {'@': 238}), 5: (1, {'@': 238}), 53: (1, {'@': 238}), 3: (1, {'@': 238}), 54: (1, {'@': 238}), 55: (1, {'@': 238}), 0: (1, {'@': 238}), 18: (1, {'@': 238}), 56: (1, {'@': 238}), 57: (1, {'@': 238})}, 261: {45: (1, {'@': 81}), 19: (1, {'@': 81}), 15: (1, {'@': 81}), 46: (1, {'@': 81}), 14: (1, {'@': 81}), 47: (1, {'@': 81}), 48: (1, {'@': 81}), 49: (1, {'@': 81}), 11: (1, {'@': 81}), 50: (1, {'@': 81}), 51: (1, {'@': 81}), 2: (1, {'@': 81}), 52: (1, {'@': 81}), 5: (1, {'@': 81}), 53: (1, {'@': 81}), 3: (1, {'@': 81}), 54: (1, {'@': 81}), 55: (1, {'@': 81}), 0: (1, {'@': 81}), 13: (1, {'@': 81}), 18: (1, {'@': 81}), 56: (1, {'@': 81}), 57: (1, {'@': 81}), 30: (1, {'@': 81})}, 262: {26: (1, {'@': 230}), 113: (1, {'@': 230}), 29: (1, {'@': 230})}, 263: {5: (0, 268)}, 264: {45: (1, {'@': 121}), 19: (1, {'@': 121}), 15: (1, {'@': 121}), 46: (1, {'@': 121}), 14: (1, {'@': 121}), 47: (1, {'@': 121}), 48: (1, {'@': 121}), 49: (1, {'@': 121}), 11: (1, {'@': 121}), 50: (1, {'@': 121}), 51: (1, {'@': 121}), 2: (1, {'@': 121}), 52: (1, {'@': 121}), 5: (1, {'@': 121}), 53: (1, {'@': 121}), 3: (1, {'@': 121}), 54: (1, {'@': 121}), 55: (1, {'@': 121}), 0: (1, {'@': 121}), 13: (1, {'@': 121}), 18: (1, {'@': 121}), 56: (1, {'@': 121}), 57: (1, {'@': 121}), 30: (1, {'@': 121})}, 265: {30: (1, {'@': 210}), 38: (1, {'@': 210})}, 266: {29: (0, 323)}, 267: {61: (0, 41), 3: (0, 81), 6: (0, 12), 9: (0, 69), 62: (0, 55), 57: (0, 42), 8: (0, 43), 1: (0, 44), 64: (0, 38), 12: (0, 34), 65: (0, 33), 13: (0, 30), 58: (0, 15), 16: (0, 19), 60: (0, 74), 48: (0, 56), 66: (0, 89), 5: (0, 39), 7: (0, 2), 72: (0, 286), 18: (0, 76), 22: (0, 98), 30: (0, 272), 56: (0, 79), 68: (0, 92), 69: (0, 91), 4: (0, 75), 10: (0, 31), 14: (0, 10), 15: (0, 24), 59: (0, 96), 54: (0, 95), 20: (0, 93), 0: (0, 97), 70: (0, 13), 71: (0, 53), 49: (0, 18), 73: (0, 62), 17: (0, 72), 53: (0, 46), 55: (0, 67), 51: (0, 7), 46: (0, 17), 21: (0, 27), 23: (0, 20), 47: (0, 0), 74: (0, 28), 19: (0, 25), 75: (0, 37), 76: (0, 26), 2: (0, 29), 78: (0, 36), 11: (0, 70), 80: (0, 125), 81: (0, 130), 82: (0, 136)}, 268: {61: (0, 41), 3: (0, 81), 6: (0, 12), 9: (0, 69), 62: (0, 55), 30: (0, 254), 57: (0, 42), 8: (0, 43), 1: (0, 44), 64: (0, 38), 12: (0, 34), 65: (0, 33), 13: (0, 30), 58: (0, 15), 16: (0, 19), 60: (0, 74), 48: (0, 56), 66: (0, 89), 5: (0, 39), 7: (0, 2), 18: (0, 76), 22: (0, 98), 56: (0, 79), 68: (0, 92), 69: (0, 91), 4: (0, 75), 10: (0, 31), 14: (0, 10), 15: (0, 24), 99: (0, 255), 59: (0, 96), 54: (0, 95), 20: (0, 93), 0: (0, 97), 70: (0, 13), 71: (0, 53), 49: (0, 18), 73: (0, 62), 17: (0, 72), 53: (0, 46), 55: (0, 67), 51: (0, 7), 46: (0, 17), 21: (0, 27), 23: (0, 20), 47: (0, 0), 74: (0, 28), 19: (0, 25), 75: (0, 37), 76: (0, 26), 2: (0, 29), 78: (0, 36), 11: (0, 70), 80: (0, 125), 81: (0, 130), 82: (0, 136), 72: (0, 217)}, 269: {45: (1, {'@': 132}), 19: (1, {'@': 132}), 101: (1, {'@': 132}), 15: (1, {'@': 132}), 46: (1, {'@': 132}), 14: (1, {'@': 132}), 47: (1, {'@': 132}), 30: (1, {'@': 132}), 48: (1, {'@': 132}), 49: (1, {'@': 132}), 11: (1, {'@': 132}), 50: (1, {'@': 132}), 51: (1, {'@': 132}), 100: (1, {'@': 132}), 2: (1, {'@': 132}), 52: (1, {'@': 132}), 5: (1, {'@': 132}), 53: (1, {'@': 132}), 3: (1, {'@': 132}), 54: (1, {'@': 132}), 55: (1, {'@': 132}), 0: (1, {'@': 132}), 13: (1, {'@': 132}), 18: (1, {'@': 132}), 56: (1, {'@': 132}), 57: (1, {'@': 132})}, 270: {45: (1, {'@': 116}), 19: (1, {'@': 116}), 107: (1, {'@': 116}), 15: (1, {'@': 116}), 108: (1, {'@': 116}), 46: (1, {'@': 116}), 14: (1, {'@': 116}), 47: (1, {'@': 116}), 30: (1, {'@': 116}), 48: (1, {'@': 116}), 49: (1, {'@': 116}), 11: (1, {'@': 116}), 50: (1, {'@': 116}), 51: (1, {'@': 116}), 2: (1, {'@': 116}), 52: (1, {'@': 116}), 5: (1, {'@': 116}), 53: (1, {'@': 116}), 3: (1, {'@': 116}), 54: (1, {'@': 116}), 55: (1, {'@': 116}), 0: (1, {'@': 116}), 13: (1, {'@': 116}), 18: (1, {'@': 116}), 56: (1, {'@': 116}), 57: (1, {'@': 116})}, 271: {0: (0, 101), 5: (0, 102)}, 272: {45: (1, {'@': 131}), 19: (1, {'@': 131}), 101: (1, {'@': 131}), 15: (1, {'@': 131}), 46: (1, {'@': 131}), 14: (1, {'@': 131}), 47: (1, {'@': 131}), 30: (1, {'@': 131}), 48: (1, {'@': 131}), 49: (1, {'@': 131}), 11: (1, {'@': 131}), 50: (1, {'@': 131}), 51: (1, {'@': 131}), 100: (1, {'@': 131}), 2: (1, {'@': 131}), 52: (1, {'@': 131}), 5: (1, {'@': 131}), 53: (1, {'@': 131}), 3: (1, {'@': 131}), 54: (1, {'@': 131}), 55: (1, {'@': 131}), 0: (1, {'@': 131}), 13: (1, {'@': 131}), 18: (1, {'@': 131}), 56: (1, {'@': 131}), 57: (1, {'@': 131})}, 273: {38: (0, 14), 121: (0, 145), 30: (0, 147)}, 274: {24: (1, {'@': 208}), 25: (1, {'@': 208}), 26: (1, {'@': 208}), 27: (1, {'@': 208}), 28: (1, {'@': 208}), 29: (1, {'@': 208}), 30: (1, {'@': 208}), 31: (1, {'@': 208}), 32: (1, {'@': 208}), 11: (1, {'@': 208}), 33: (1, {'@': 208}), 34: (1, {'@': 208}), 35: (1, {'@': 208}), 36: (1, {'@': 208}), 37: (1, {'@': 208}), 38: (1, {'@': 208}), 39: (1, {'@': 208}), 40: (1, {'@': 208}), 41: (1, {'@': 208}), 42: (1, {'@': 208}), 43: (1, {'@': 208}), 13: (1, {'@': 208}), 44: (1, {'@': 208})}, 275: {100: (0, 277), 101: (0, 271), 116: (0, 104), 117: (0, 106), 45: (1, {'@': 128}), 19: (1, {'@': 128}), 15: (1, {'@': 128}), 46: (1, {'@': 128}), 14: (1, {'@': 128}), 47: (1, {'@': 128}), 48: (1, {'@': 128}), 49: (1, {'@': 128}), 11: (1, {'@': 128}), 50: (1, {'@': 128}), 51: (1, {'@': 128}), 2: (1, {'@': 128}), 52: (1, {'@': 128}), 5: (1, {'@': 128}), 53: (1, {'@': 128}), 3: (1, {'@': 128}), 54: (1, {'@': 128}), 55: (1, {'@': 128}), 0: (1, {'@': 128}), 13: (1, {'@': 128}), 18: (1, {'@': 128}), 56: (1, {'@': 128}), 57: (1, {'@': 128}), 30: (1, {'@': 128})}, 276: {122: (0, 112), 123: (0, 114), 124: (0, 116), 125: (0, 117), 126: (0, 119), 127: (0, 120)}, 277: {5: (0, 170)}, 278: {100: (0, 277), 101: (0, 271), 115: (0, 315), 116: (0, 260), 117: (0, 100), 45: (1, {'@': 126}), 19: (1, {'@': 126}), 15: (1, {'@': 126}), 46: (1, {'@': 126}), 14: (1, {'@': 126}), 47: (1, {'@': 126}), 48: (1, {'@': 126}), 49: (1, {'@': 126}), 11: (1, {'@': 126}), 50: (1, {'@': 126}), 51: (1, {'@': 126}), 2: (1, {'@': 126}), 52: (1, {'@': 126}), 5: (1, {'@': 126}), 53: (1, {'@': 126}), 3: (1, {'@': 126}), 54: (1, {'@': 126}), 55: (1, {'@': 126}), 0: (1, {'@': 126}), 13: (1, {'@': 126}), 18: (1, {'@': 126}), 56: (1, {'@': 126}), 57: (1, {'@': 126}), 30: (1, {'@': 126})}, 279: {42: (0, 78)}, 280: {1: (0, 44), 2: (0, 29), 3: (0, 81), 4: (0, 75), 5: (0, 68), 6: (0, 12), 8: (0, 197), 7: (0, 2), 9: (0, 288), 10: (0, 31), 11: (0, 70), 12: (0, 34), 13: (0, 290), 14: (0, 10), 15: (0, 322), 16: (0, 296), 17: (0, 72), 18: (0, 76), 19: (0, 25), 0: (0, 97), 21: (0, 27), 22: (0, 98), 23: (0, 20)}, 281: {29: (1, {'@': 76})}, 282: {88: (0, 156), 0: (0, 318), 39: (0, 143), 38: (0, 152), 24: (1, {'@': 168}), 25: (1, {'@': 168}), 26: (1, {'@': 168}), 27: (1, {'@': 168}), 28: (1, {'@': 168}), 31: (1, {'@': 168}), 32: (1, {'@': 168}), 11: (1, {'@': 168}), 33: (1, {'@': 168}), 35: (1, {'@': 168}), 36: (1, {'@': 168}), 37: (1, {'@': 168}), 40: (1, {'@': 168}), 41: (1, {'@': 168}), 43: (1, {'@': 168}), 13: (1, {'@': 168}), 44: (1, {'@': 168})}, 283: {45: (1, {'@': 111}), 19: (1, {'@': 111}), 15: (1, {'@': 111}), 46: (1, {'@': 111}), 14: (1, {'@': 111}), 47: (1, {'@': 111}), 48: (1, {'@': 111}), 49: (1, {'@': 111}), 11: (1, {'@': 111}), 50: (1, {'@': 111}), 51: (1, {'@': 111}), 2: (1, {'@': 111}), 52: (1, {'@': 111}), 5: (1, {'@': 111}), 53: (1, {'@': 111}), 3: (1, {'@': 111}), 54: (1, {'@': 111}), 55: (1, {'@': 111}), 0: (1, {'@': 111}), 13: (1, {'@': 111}), 18: (1, {'@': 111}), 56: (1, {'@': 111}), 57: (1, {'@': 111}), 30: (1, {'@': 111})}, 284: {24: (1, {'@': 205}), 25: (1, {'@': 205}), 26: (1, {'@': 205}), 27: (1, {'@': 205}), 28: (1, {'@': 205}), 29: (1, {'@': 205}), 30: (1, {'@': 205}), 31: (1, {'@': 205}), 32: (1, {'@': 205}), 11: (1, {'@': 205}), 33: (1, {'@': 205}), 34: (1, {'@': 205}), 35: (1, {'@': 205}), 36: (1, {'@': 205}), 37: (1, {'@': 205}), 38: (1, {'@': 205}), 39: (1, {'@': 205}), 40: (1, {'@': 205}), 41: (1, {'@': 205}), 42: (1, {'@': 205}), 43: (1, {'@': 205}), 13: (1, {'@': 205}), 44: (1, {'@': 205})}, 285: {38: (0, 307), 39: (0, 129), 109: (0, 154)}, 286: {19: (1, {'@': 233}), 15: (1, {'@': 233}), 46: (1, {'@': 233}), 14: (1, {'@': 233}), 47: (1, {'@': 233}), 48: (1, {'@': 233}), 11: (1, {'@': 233}), 2: (1, {'@': 233}), 13: (1, {'@': 233}), 30: (1, {'@': 233}), 49: (1, {'@': 233}), 51: (1, {'@': 233}), 5: (1, {'@': 233}), 53: (1, {'@': 233}), 3: (1, {'@': 233}), 54: (1, {'@': 233}), 55: (1, {'@': 233}), 0: (1, {'@': 233}), 18: (1, {'@': 233}), 56: (1, {'@': 233}), 57: (1, {'@': 233})}, 287: {45: (1, {'@': 64}), 19: (1, {'@': 64}), 15: (1, {'@': 64}), 46: (1, {'@': 64}), 14: (1, {'@': 64}), 47: (1, {'@': 64}), 48: (1, {'@': 64}), 49: (1, {'@': 64}), 11: (1, {'@': 64}), 50: (1, {'@': 64}), 51: (1, {'@': 64}), 2: (1, {'@': 64}), 52: (1, {'@': 64}), 5: (1, {'@': 64}), 53: (1, {'@': 64}), 3: (1, {'@': 64}), 54: (1, {'@': 64}), 55: (1, {'@': 64}), 0: (1, {'@': 64}), 13: (1, {'@': 64}), 18: (1, {'@': 64}), 56: (1, {'@': 64}), 57: (1, {'@': 64})}, 288: {0: (0, 59), 24: (1, {'@': 171}), 25: (1, {'@': 171}), 26: (1, {'@': 171}), 27: (1, {'@': 171}), 28: (1, {'@': 171}), 29: (1, {'@': 171}), 30: (1, {'@': 171}), 31: (1, {'@': 171}), 32: (1, {'@': 171}), 11: (1, {'@': 171}), 33: (1, {'@': 171}), 34: (1, {'@': 171}), 35: (1, {'@': 171}), 36: (1, {'@': 171}), 37: (1, {'@': 171}), 38: (1, {'@': 171}), 39: (1, {'@': 171}), 40: (1, {'@': 171}), 41: (1, {'@': 171}), 42: (1, {'@': 171}), 43: (1, {'@': 171}), 13: (1, {'@': 171}), 44: (1, {'@': 171})}, 289: {92: (1, {'@': 228}), 95: (1, {'@': 228}), 30: (1, {'@': 228})}, 290: {1: (0, 44), 39: (0, 284), 2: (0, 29), 3: (0, 81), 4: (0, 75), 5: (0, 68), 6: (0, 12), 60: (0, 285), 7: (0, 2), 8: (0, 43), 20: (0, 93), 9: (0, 288), 10: (0, 31), 11: (0, 70), 12: (0, 34), 13: (0, 290), 58: (0, 15), 14: (0, 10), 15: (0, 322), 16: (0, 296), 17: (0, 72), 59: (0, 96), 18: (0, 76), 19: (0, 25), 0: (0, 97), 21: (0, 27), 22: (0, 98), 23: (0, 20)}, 291: {29: (0, 258)}, 292: {87: (0, 138), 5: (0, 144)}, 293: {5: (0, 133)}, 294: {34: (0, 127)}, 295: {5: (0, 124)}, 296: {24: (1, {'@': 170}), 25: (1, {'@': 170}), 26: (1, {'@': 170}), 27: (1, {'@': 170}), 28: (1, {'@': 170}), 29: (1, {'@': 170}), 30: (1, {'@': 170}), 31: (1, {'@': 170}), 32: (1, {'@': 170}), 11: (1, {'@': 170}), 33: (1, {'@': 170}), 34: (1, {'@': 170}), 35: (1, {'@': 170}), 36: (1, {'@': 170}), 37: (1, {'@': 170}), 38: (1, {'@': 170}), 39: (1, {'@': 170}), 40: (1, {'@': 170}), 41: (1, {'@': 170}), 42: (1, {'@': 170}), 43: (1, {'@': 170}), 13: (1, {'@': 170}), 44: (1, {'@': 170})}, 297: {128: (0, 176), 26: (0, 179), 113: (1, {'@': 80}), 29: (1, {'@': 80})}, 298: {1: (0, 44), 2: (0, 29), 3: (0, 81), 4: (0, 75), 5: (0, 68), 6: (0, 12), 7: (0, 2), 8: (0, 43), 20: (0, 93), 9: (0, 288), 10: (0, 31), 11: (0, 70), 60: (0, 324), 12: (0, 34), 13: (0, 290), 58: (0, 15), 14: (0, 10), 111: (0, 175), 15: (0, 322), 16: (0, 296), 17: (0, 72), 59: (0, 96), 18: (0, 76), 19: (0, 25), 0: (0, 97), 21: (0, 27), 22: (0, 98), 23: (0, 20), 39: (1, {'@': 190})}, 299: {5: (0, 77)}, 300: {15: (0, 221), 104: (0, 313)}, 301: {29: (0, 309), 113: (0, 180)}, 302: {5: (1, {'@': 65})}, 303: {15: (0, 49), 129: (0, 233)}, 304: {45: (1, {'@': 237}), 19: (1, {'@': 237}), 107: (1, {'@': 237}), 15: (1, {'@': 237}), 108: (1, {'@': 237}), 46: (1, {'@': 237}), 14: (1, {'@': 237}), 47: (1, {'@': 237}), 48: (1, {'@': 237}), 11: (1, {'@': 237}), 50: (1, {'@': 237}), 2: (1, {'@': 237}), 52: (1, {'@': 237}), 13: (1, {'@': 237}), 30: (1, {'@': 237}), 49: (1, {'@': 237}), 51: (1, {'@': 237}), 5: (1, {'@': 237}), 53: (1, {'@': 237}), 3: (1, {'@': 237}), 54: (1, {'@': 237}), 55: (1, {'@': 237}), 0: (1, {'@': 237}), 18: (1, {'@': 237}), 56: (1, {'@': 237}), 57: (1, {'@': 237})}, 305: {114: (0, 65)}, 306: {34: (1, {'@': 243}), 38: (1, {'@': 243}), 39: (1, {'@': 243})}, 307: {1: (0, 44), 2: (0, 29), 3: (0, 81), 4: (0, 75), 5: (0, 68), 6: (0, 12), 7: (0, 2), 8: (0, 43), 20: (0, 93), 9: (0, 288), 10: (0, 31), 60: (0, 248), 11: (0, 70), 12: (0, 34), 13: (0, 290), 58: (0, 15), 14: (0, 10), 15: (0, 322), 16: (0, 296), 17: (0, 72), 59: (0, 96), 18: (0, 76), 19: (0, 25), 0: (0, 97), 21: (0, 27), 22: (0, 98), 23: (0, 20)}, 308: {15: (0, 221), 104: (0, 159)}, 309: {45: (1, {'@': 78}), 19: (1, {'@': 78}), 15: (1, {'@': 78}), 46: (1, {'@': 78}), 14: (1, {'@': 78}), 47: (1, {'@': 78}), 48: (1, {'@': 78}), 49: (1, {'@': 78}), 11: (1, {'@': 78}), 50: (1, {'@': 78}), 51: (1, {'@': 78}), 2: (1, {'@': 78}), 52: (1, {'@': 78}), 5: (1, {'@': 78}), 53: (1, {'@': 78}), 3: (1, {'@': 78}), 54: (1, {'@': 78}), 55: (1, {'@': 78}), 0: (1, {'@': 78}), 13: (1, {'@': 78}), 18: (1, {'@': 78}), 56: (1, {'@': 78}), 57: (1, {'@': 78})}, 310: {1: (0, 44), 2: (0, 29), 3: (0, 81), 5: (0, 68), 6: (0, 12), 7: (0, 198), 9: (0, 288), 10: (0, 31), 11: (0, 70), 12: (0, 34), 13: (0, 290), 14: (0, 10), 15: (0, 322), 16: (0, 296), 17: (0, 72), 18: (0, 76), 19: (0, 25), 0: (0, 97), 21: (0, 27), 22: (0, 98), 23: (0, 20)}, 311: {38: (0, 300), 34: (1, {'@': 85})}, 312: {1: (0, 44), 2: (0, 29), 3: (0, 81), 4: (0, 75), 5: (0, 160), 6: (0, 12), 7: (0, 2), 8: (0, 43), 20: (0, 93), 60: (0, 166), 9: (0, 288), 10: (0, 31), 11: (0, 70), 12: (0, 34), 13: (0, 290), 58: (0, 15), 14: (0, 10), 15: (0, 322), 16: (0, 296), 17: (0, 72), 59: (0, 96), 18: (0, 76), 90: (0, 168), 19: (0, 25), 0: (0, 97), 21: (0, 27), 91: (0, 169), 22: (0, 98), 23: (0, 20)}, 313: {34: (1, {'@': 235}), 38: (1, {'@': 235})}, 314: {1: (0, 44), 2: (0, 29), 3: (0, 81), 5: (0, 68), 6: (0, 12), 7: (0, 191), 9: (0, 288), 10: (0, 31), 11: (0, 70), 12: (0, 34), 13: (0, 290), 14: (0, 10), 15: (0, 322), 16: (0, 296), 17: (0, 72), 18: (0, 76), 19: (0, 25), 0: (0, 97), 21: (0, 27), 22: (0, 98), 23: (0, 20)}, 315: {100: (0, 277), 101: (0, 271), 117: (0, 177), 116: (0, 104), 45: (1, {'@': 124}), 19: (1, {'@': 124}), 15: (1, {'@': 124}), 46: (1, {'@': 124}), 14: (1, {'@': 124}), 47: (1, {'@': 124}), 48: (1, {'@': 124}), 49: (1, {'@': 124}), 11: (1, {'@': 124}), 50: (1, {'@': 124}), 51: (1, {'@': 124}), 2: (1, {'@': 124}), 52: (1, {'@': 124}), 5: (1, {'@': 124}), 53: (1, {'@': 124}), 3: (1, {'@': 124}), 54: (1, {'@': 124}), 55: (1, {'@': 124}), 0: (1, {'@': 124}), 13: (1, {'@': 124}), 18: (1, {'@': 124}), 56: (1, {'@': 124}), 57: (1, {'@': 124}), 30: (1, {'@': 124})}, 316: {45: (1, {'@': 105}), 19: (1, {'@': 105}), 15: (1, {'@': 105}), 46: (1, {'@': 105}), 14: (1, {'@': 105}), 47: (1, {'@': 105}), 48: (1, {'@': 105}), 49: (1, {'@': 105}), 11: (1, {'@': 105}), 50: (1, {'@': 105}), 51: (1, {'@': 105}), 2: (1, {'@': 105}), 52: (1, {'@': 105}), 5: (1, {'@': 105}), 53: (1, {'@': 105}), 3: (1, {'@': 105}), 54: (1, {'@': 105}), 55: (1, {'@': 105}), 0: (1, {'@': 105}), 13: (1, {'@': 105}), 18: (1, {'@': 105}), 56: (1, {'@': 105}), 57: (1, {'@': 105}), 30: (1, {'@': 105})}, 317: {34: (0, 235)}, 318: {1: (0, 44), 2: (0, 29), 3: (0, 81), 89: (0, 205), 4: (0, 75), 5: (0, 68), 6: (0, 12), 7: (0, 2), 8: (0, 43), 20: (0, 93), 9: (0, 288), 10: (0, 31), 11: (0, 70), 12: (0, 34), 34: (0, 172), 19: (0, 25), 13: (0, 290), 58: (0, 15), 14: (0, 10), 15: (0, 322), 16: (0, 296), 17: (0, 72), 59: (0, 96), 18: (0, 76), 60: (0, 140), 0: (0, 97), 21: (0, 27), 22: (0, 98), 23: (0, 20)}, 319: {26: (1, {'@': 231}), 113: (1, {'@': 231}), 29: (1, {'@': 231})}, 320: {30: (1, {'@': 245}), 38: (1, {'@': 245})}, 321: {24: (1, {'@': 165}), 25: (1, {'@': 165}), 26: (1, {'@': 165}), 27: (1, {'@': 165}), 28: (1, {'@': 165}), 29: (1, {'@': 165}), 30: (1, {'@': 165}), 31: (1, {'@': 165}), 32: (1, {'@': 165}), 11: (1, {'@': 165}), 33: (1, {'@': 165}), 34: (1, {'@': 165}), 35: (1, {'@': 165}), 36: (1, {'@': 165}), 37: (1, {'@': 165}), 38: (1, {'@': 165}), 39: (1, {'@': 165}), 40: (1, {'@': 165}), 41: (1, {'@': 165}), 42: (1, {'@': 165}), 43: (1, {'@': 165}), 13: (1, {'@': 165}), 44: (1, {'@': 165})}, 322: {0: (0, 318), 24: (1, {'@': 168}), 25: (1, {'@': 168}), 26: (1, {'@': 168}), 27: (1, {'@': 168}), 28: (1, {'@': 168}), 29: (1, {'@': 168}), 30: (1, {'@': 168}), 31: (1, {'@': 168}), 32: (1, {'@': 168}), 11: (1, {'@': 168}), 33: (1, {'@': 168}), 34: (1, {'@': 168}), 35: (1, {'@': 168}), 36: (1, {'@': 168}), 37: (1, {'@': 168}), 38: (1, {'@': 168}), 39: (1, {'@': 168}), 40: (1, {'@': 168}), 41: (1, {'@': 168}), 42: (1, {'@': 168}), 43: (1, {'@': 168}), 13: (1, {'@': 168}), 44: (1, {'@': 168})}, 323: {92: (1, {'@': 66}), 95: (1, {'@': 66}), 30: (1, {'@': 66})}, 324: {39: (1, {'@': 197})}, 325: {1: (0, 44), 2: (0, 29), 3: (0, 81), 4: (0, 75), 5: (0, 68), 6: (0, 12), 7: (0, 2), 8: (0, 43), 20: (0, 93), 9: (0, 288), 10: (0, 31), 11: (0, 70), 12: (0, 34), 13: (0, 290), 58: (0, 15), 14: (0, 10), 15: (0, 322), 16: (0, 296), 17: (0, 72), 59: (0, 96), 18: (0, 76), 19: (0, 25), 0: (0, 97), 60: (0, 195), 21: (0, 27), 22: (0, 98), 23: (0, 20)}, 326: {39: (1, {'@': 192})}, 327: {1: (0, 44), 2: (0, 29), 3: (0, 81), 4: (0, 75), 5: (0, 68), 6: (0, 12), 7: (0, 2), 60: (0, 226), 8: (0, 43), 20: (0, 93), 9: (0, 288), 10: (0, 31), 11: (0, 70), 12: (0, 34), 13: (0, 290), 58: (0, 15), 14: (0, 10), 15: (0, 322), 16: (0, 296), 17: (0, 72), 59: (0, 96), 18: (0, 76), 19: (0, 25), 0: (0, 97), 21: (0, 27), 22: (0, 98), 23: (0, 20)}, 328: {45: (1, {'@': 77}), 19: (1, {'@': 77}), 15: (1, {'@': 77}), 46: (1, {'@': 77}), 14: (1, {'@': 77}), 47: (1, {'@': 77}), 48: (1, {'@': 77}), 49: (1, {'@': 77}), 11: (1, {'@': 77}), 50: (1, {'@': 77}), 51: (1, {'@': 77}), 2: (1, {'@': 77}), 52: (1, {'@': 77}), 5: (1, {'@': 77}), 53: (1, {'@': 77}), 3: (1, {'@': 77}), 54: (1, {'@': 77}), 55: (1, {'@': 77}), 0: (1, {'@': 77}), 13: (1, {'@': 77}), 18: (1, {'@': 77}), 56: (1, {'@': 77}), 57: (1, {'@': 77})}, 329: {42: (0, 173), 39: (1, {'@': 185})}, 330: {1: (0, 44), 2: (0, 29), 3: (0, 81), 4: (0, 75), 5: (0, 68), 6: (0, 12), 7: (0, 2), 8: (0, 43), 111: (0, 182), 20: (0, 93), 9: (0, 288), 10: (0, 31), 11: (0, 70), 60: (0, 324), 12: (0, 34), 13: (0, 290), 58: (0, 15), 14: (0, 10), 15: (0, 322), 16: (0, 296), 17: (0, 72), 59: (0, 96), 18: (0, 76), 19: (0, 25), 0: (0, 97), 21: (0, 27), 22: (0, 98), 23: (0, 20), 39: (1, {'@': 187})}, 331: {45: (1, {'@': 137}), 19: (1, {'@': 137}), 15: (1, {'@': 137}), 46: (1, {'@': 137}), 14: (1, {'@': 137}), 47: (1, {'@': 137}), 48: (1, {'@': 137}), 49: (1, {'@': 137}), 11: (1, {'@': 137}), 50: (1, {'@': 137}), 51: (1, {'@': 137}), 2: (1, {'@': 137}), 52: (1, {'@': 137}), 5: (1, {'@': 137}), 53: (1, {'@': 137}), 3: (1, {'@': 137}), 54: (1, {'@': 137}), 55: (1, {'@': 137}), 0: (1, {'@': 137}), 13: (1, {'@': 137}), 18: (1, {'@': 137}), 56: (1, {'@': 137}), 57: (1, {'@': 137}), 30: (1, {'@': 137})}}, 'start_states': {'start': 6}, 'end_states': {'start': 122}}, '__type__': 'ParsingFrontend'}, 'rules': [{'@': 60}, {'@': 61}, {'@': 62}, {'@': 63}, {'@': 64}, {'@': 65}, {'@': 66}, {'@': 67}, {'@': 68}, {'@': 69}, {'@': 70}, {'@': 71}, {'@': 72}, {'@': 73}, {'@': 74}, {'@': 75}, {'@': 76}, {'@': 77}, {'@': 78}, {'@': 79}, {'@': 80}, {'@': 81}, {'@': 82}, {'@': 83}, {'@': 84}, {'@': 85}, {'@': 86}, {'@': 87}, {'@': 88}, {'@': 89}, {'@': 90}, {'@': 91}, {'@': 92}, {'@': 93}, {'@': 94}, {'@': 95}, {'@': 96}, {'@': 97}, {'@': 98}, {'@': 99}, {'@': 100}, {'@': 101}, {'@': 102}, {'@': 103}, {'@': 104}, {'@': 105}, {'@': 106}, {'@': 107}, {'@': 108}, {'@': 109}, {'@': 110}, {'@': 111}, {'@': 112}, {'@': 113}, {'@': 114}, {'@': 115}, {'@': 116}, {'@': 117}, {'@': 118}, {'@': 119}, {'@': 120}, {'@': 121}, {'@': 122}, {'@': 123}, {'@': 124}, {'@': 125}, {'@': 126}, {'@': 127}, {'@': 128}, {'@': 129}, {'@': 130}, {'@': 131}, {'@': 132}, {'@': 133}, {'@': 134}, {'@': 135}, {'@': 136}, {'@': 137}, {'@': 138}, {'@': 139}, {'@': 140}, {'@': 141}, {'@': 142}, {'@': 143}, {'@': 144}, {'@': 145}, {'@': 146}, {'@': 147}, {'@': 148}, {'@': 149}, {'@': 150}, {'@': 151}, {'@': 152}, {'@': 153}, {'@': 154}, {'@': 155}, {'@': 156}, {'@': 157}, {'@': 158}, {'@': 159}, {'@': 160}, {'@': 161}, {'@': 162}, {'@': 163}, {'@': 164}, {'@': 165}, {'@': 166}, {'@': 167}, {'@': 168}, {'@': 169}, {'@': 170}, {'@': 171}, {'@': 172}, {'@': 173}, {'@': 174}, {'@': 175}, {'@': 176}, {'@': 177}, {'@': 178}, {'@': 179}, {'@': 180}, {'@': 181}, {'@': 182}, {'@': 183}, {'@': 184}, {'@': 185}, {'@': 186}, {'@': 187}, {'@': 188}, {'@': 189}, {'@': 190}, {'@': 191}, {'@': 192}, {'@': 193}, {'@': 194}, {'@': 195}, {'@': 196}, {'@': 197}, {'@': 198}, {'@': 199}, {'@': 200}, {'@': 201}, {'@': 202}, {'@': 203}, {'@': 204}, {'@': 205}, {'@': 206}, {'@': 207}, {'@': 208}, {'@': 209}, {'@': 210}, {'@': 211}, {'@': 212}, {'@': 213}, {'@': 214}, {'@': 215}, {'@': 216}, {'@': 217}, {'@': 218}, {'@': 219}, {'@': 220}, {'@': 221}, {'@': 222}, {'@': 223}, {'@': 224}, {'@': 225}, {'@': 226}, {'@': 227}, {'@': 228}, {'@': 229}, {'@': 230}, {'@': 231}, {'@': 232}, {'@': 233}, {'@': 234}, {'@': 235}, {'@': 236}, {'@': 237}, {'@': 238}, {'@': 239}, {'@': 240}, {'@': 241}, {'@': 242}, {'@': 243}, {'@': 244}, {'@': 245}], 'options': {'debug': False, 'strict': False, 'keep_all_tokens': False, 'tree_class': None, 'cache': False, 'cache_grammar': False, 'postlex': None, 'parser': 'lalr', 'lexer': 'contextual', 'transformer': None, 'start': ['start'], 'priority': 'normal', 'ambiguity': 'auto', 'regex': False, 'propagate_positions': True, 'lexer_callbacks': {}, 'maybe_placeholders': False, 'edit_terminals': None, 'g_regex_flags': 0, 'use_bytes': False, 'ordered_sets': True, 'import_paths': [], 'source_path': None, '_plugins': {}}, '__type__': 'Lark'}
+)
+MEMO = (
+{0: {'name': 'NUMBER', 'pattern': {'value': '(?:(?:\\+|\\-))?(?:(?:(?:[0-9])+(?:e|E)(?:(?:\\+|\\-))?(?:[0-9])+|(?:(?:[0-9])+\\.(?:(?:[0-9])+)?|\\.(?:[0-9])+)(?:(?:e|E)(?:(?:\\+|\\-))?(?:[0-9])+)?)|(?:[0-9])+)', 'flags': [], 'raw': None, '_width': [1, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 1: {'name': 'WS', 'pattern': {'value': '(?:[ \t\x0c\r\n])+', 'flags': [], 'raw': None, '_width': [1, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 2: {'name': 'READ', 'pattern': {'value': 'read', 'flags': [], 'raw': '"read"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 3: {'name': 'WRITE', 'pattern': {'value': 'write', 'flags': [], 'raw': '"write"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 4: {'name': 'EXECUTE', 'pattern': {'value': 'execute', 'flags': [], 'raw': '"execute"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 5: {'name': 'NETWORK', 'pattern': {'value': 'network', 'flags': [], 'raw': '"network"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 6: {'name': 'SYSTEM', 'pattern': {'value': 'system', 'flags': [], 'raw': '"system"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 7: {'name': 'FN', 'pattern': {'value': 'fn', 'flags': [], 'raw': '"fn"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 8: {'name': 'BOOLEAN', 'pattern': {'value': '(?:false(?![a-zA-Z0-9_])|true(?![a-zA-Z0-9_]))', 'flags': [], 'raw': None, '_width': [4, 5], '__type__': 'PatternRE'}, 'priority': 2, '__type__': 'TerminalDef'}, 9: {'name': 'IDENTIFIER', 'pattern': {'value': '(?!fn\\b)[a-zA-Z_][a-zA-Z0-9_]*', 'flags': [], 'raw': '/(?!fn\\b)[a-zA-Z_][a-zA-Z0-9_]*/', '_width': [1, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 10: {'name': 'STRING', 'pattern': {'value': '(?:"([^"\\\\]|\\\\.)*"|\'([^\'\\\\]|\\\\.)*\')', 'flags': [], 'raw': None, '_width': [2, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 11: {'name': 'FLOORDIV', 'pattern': {'value': '//', 'flags': [], 'raw': '"//"', '__type__': 'PatternStr'}, 'priority': 3, '__type__': 'TerminalDef'}, 12: {'name': 'COMMENT', 'pattern': {'value': '//[^\n]*', 'flags': [], 'raw': None, '_width': [2, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 13: {'name': 'CAPABILITY', 'pattern': {'value': 'capability', 'flags': [], 'raw': '"capability"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 14: {'name': 'LBRACE', 'pattern': {'value': '{', 'flags': [], 'raw': '"{"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 15: {'name': 'RBRACE', 'pattern': {'value': '}', 'flags': [], 'raw': '"}"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 16: {'name': 'SEMICOLON', 'pattern': {'value': ';', 'flags': [], 'raw': '";"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 17: {'name': 'RESOURCE', 'pattern': {'value': 'resource', 'flags': [], 'raw': '"resource"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 18: {'name': 'ALLOW', 'pattern': {'value': 'allow', 'flags': [], 'raw': '"allow"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 19: {'name': 'AS', 'pattern': {'value': 'as', 'flags': [], 'raw': '"as"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 20: {'name': 'IMPORT', 'pattern': {'value': 'import', 'flags': [], 'raw': '"import"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 21: {'name': 'DOT', 'pattern': {'value': '.', 'flags': [], 'raw': '"."', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 22: {'name': 'FUNCTION', 'pattern': {'value': 'function', 'flags': [], 'raw': '"function"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 23: {'name': 'LPAR', 'pattern': {'value': '(', 'flags': [], 'raw': '"("', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 24: {'name': 'RPAR', 'pattern': {'value': ')', 'flags': [], 'raw': '")"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 25: {'name': 'COMMA', 'pattern': {'value': ',', 'flags': [], 'raw': '","', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 26: {'name': 'COLON', 'pattern': {'value': ':', 'flags': [], 'raw': '":"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 27: {'name': 'EQUAL', 'pattern': {'value': '=', 'flags': [], 'raw': '"="', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 28: {'name': 'RETURN', 'pattern': {'value': 'return', 'flags': [], 'raw': '"return"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 29: {'name': 'THROW', 'pattern': {'value': 'throw', 'flags': [], 'raw': '"throw"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 30: {'name': 'ELSE', 'pattern': {'value': 'else', 'flags': [], 'raw': '"else"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 31: {'name': 'IF', 'pattern': {'value': 'if', 'flags': [], 'raw': '"if"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 32: {'name': 'ELIF', 'pattern': {'value': 'elif', 'flags': [], 'raw': '"elif"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 33: {'name': 'WHILE', 'pattern': {'value': 'while', 'flags': [], 'raw': '"while"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 34: {'name': 'FOR', 'pattern': {'value': 'for', 'flags': [], 'raw': '"for"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 35: {'name': 'IN', 'pattern': {'value': 'in', 'flags': [], 'raw': '"in"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 36: {'name': 'TRY', 'pattern': {'value': 'try', 'flags': [], 'raw': '"try"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 37: {'name': 'EXCEPT', 'pattern': {'value': 'except', 'flags': [], 'raw': '"except"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 38: {'name': 'FINALLY', 'pattern': {'value': 'finally', 'flags': [], 'raw': '"finally"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 39: {'name': 'BREAK', 'pattern': {'value': 'break', 'flags': [], 'raw': '"break"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 40: {'name': 'CONTINUE', 'pattern': {'value': 'continue', 'flags': [], 'raw': '"continue"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 41: {'name': 'NONLOCAL', 'pattern': {'value': 'nonlocal', 'flags': [], 'raw': '"nonlocal"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 42: {'name': 'QMARK', 'pattern': {'value': '?', 'flags': [], 'raw': '"?"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 43: {'name': '__ANON_0', 'pattern': {'value': '||', 'flags': [], 'raw': '"||"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 44: {'name': '__ANON_1', 'pattern': {'value': '&&', 'flags': [], 'raw': '"&&"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 45: {'name': '__ANON_2', 'pattern': {'value': '==', 'flags': [], 'raw': '"=="', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 46: {'name': '__ANON_3', 'pattern': {'value': '!=', 'flags': [], 'raw': '"!="', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 47: {'name': 'LESSTHAN', 'pattern': {'value': '<', 'flags': [], 'raw': '"<"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 48: {'name': 'MORETHAN', 'pattern': {'value': '>', 'flags': [], 'raw': '">"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 49: {'name': '__ANON_4', 'pattern': {'value': '<=', 'flags': [], 'raw': '"<="', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 50: {'name': '__ANON_5', 'pattern': {'value': '>=', 'flags': [], 'raw': '">="', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 51: {'name': 'PLUS', 'pattern': {'value': '+', 'flags': [], 'raw': '"+"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 52: {'name': 'MINUS', 'pattern': {'value': '-', 'flags': [], 'raw': '"-"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 53: {'name': 'STAR', 'pattern': {'value': '*', 'flags': [], 'raw': '"*"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 54: {'name': 'SLASH', 'pattern': {'value': '/', 'flags': [], 'raw': '"/"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 55: {'name': 'PERCENT', 'pattern': {'value': '%', 'flags': [], 'raw': '"%"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 56: {'name': 'BANG', 'pattern': {'value': '!', 'flags': [], 'raw': '"!"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 57: {'name': 'LSQB', 'pattern': {'value': '[', 'flags': [], 'raw': '"["', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 58: {'name': 'RSQB', 'pattern': {'value': ']', 'flags': [], 'raw': '"]"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 59: {'name': '__ANON_6', 'pattern': {'value': '=>', 'flags': [], 'raw': '"=>"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 60: {'origin': {'name': 'start', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'program', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 61: {'origin': {'name': 'program', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__program_star_0', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 62: {'origin': {'name': 'program', '__type__': 'NonTerminal'}, 'expansion': [], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 63: {'origin': {'name': 'capability_declaration', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'CAPABILITY', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'capability_name', '__type__': 'NonTerminal'}, {'name': 'LBRACE', 'filter_out': True, '__type__': 'Terminal'}, {'name': '__capability_declaration_star_1', '__type__': 'NonTerminal'}, {'name': 'RBRACE', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 64: {'origin': {'name': 'capability_declaration', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'CAPABILITY', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'capability_name', '__type__': 'NonTerminal'}, {'name': 'LBRACE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'RBRACE', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 65: {'origin': {'name': 'capability_name', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 66: {'origin': {'name': 'capability_item', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'resource_pattern', '__type__': 'NonTerminal'}, {'name': 'SEMICOLON', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 67: {'origin': {'name': 'capability_item', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'permission_grant', '__type__': 'NonTerminal'}, {'name': 'SEMICOLON', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 68: {'origin': {'name': 'resource_pattern', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'RESOURCE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'STRING', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 69: {'origin': {'name': 'permission_grant', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'ALLOW', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'permission_type', '__type__': 'NonTerminal'}, {'name': 'permission_target', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 70: {'origin': {'name': 'permission_grant', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'ALLOW', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'permission_type', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 71: {'origin': {'name': 'permission_type', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'READ', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 72: {'origin': {'name': 'permission_type', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'WRITE', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 73: {'origin': {'name': 'permission_type', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'EXECUTE', 'filter_out': False, '__type__': 'Terminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 74: {'origin': {'name': 'permission_type', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'NETWORK', 'filter_out': False, '__type__': 'Terminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 75: {'origin': {'name': 'permission_type', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'SYSTEM', 'filter_out': False, '__type__': 'Terminal'}], 'order': 4, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 76: {'origin': {'name': 'permission_target', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'STRING', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 77: {'origin': {'name': 'import_statement', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'IMPORT', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'import_target', '__type__': 'NonTerminal'}, {'name': 'AS', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'SEMICOLON', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 78: {'origin': {'name': 'import_statement', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'IMPORT', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'import_target', '__type__': 'NonTerminal'}, {'name': 'SEMICOLON', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 79: {'origin': {'name': 'import_target', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}, {'name': '__import_target_star_2', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 80: {'origin': {'name': 'import_target', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 81: {'origin': {'name': 'function_definition', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'FUNCTION', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'parameter_list', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LBRACE', 'filter_out': True, '__type__': 'Terminal'}, {'name': '__function_definition_star_3', '__type__': 'NonTerminal'}, {'name': 'RBRACE', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 82: {'origin': {'name': 'function_definition', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'FUNCTION', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'parameter_list', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LBRACE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'RBRACE', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 83: {'origin': {'name': 'function_definition', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'FUNCTION', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LBRACE', 'filter_out': True, '__type__': 'Terminal'}, {'name': '__function_definition_star_3', '__type__': 'NonTerminal'}, {'name': 'RBRACE', 'filter_out': True, '__type__': 'Terminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 84: {'origin': {'name': 'function_definition', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'FUNCTION', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LBRACE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'RBRACE', 'filter_out': True, '__type__': 'Terminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 85: {'origin': {'name': 'parameter_list', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'parameter', '__type__': 'NonTerminal'}, {'name': '__parameter_list_star_4', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 86: {'origin': {'name': 'parameter_list', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'parameter', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 87: {'origin': {'name': 'parameter', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'COLON', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'type_annotation', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 88: {'origin': {'name': 'parameter', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 89: {'origin': {'name': 'type_annotation', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 90: {'origin': {'name': 'statement', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'expression_statement', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 91: {'origin': {'name': 'statement', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'assignment_statement', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 92: {'origin': {'name': 'statement', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'destructuring_statement', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 93: {'origin': {'name': 'statement', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'function_definition', '__type__': 'NonTerminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 94: {'origin': {'name': 'statement', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'if_statement', '__type__': 'NonTerminal'}], 'order': 4, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 95: {'origin': {'name': 'statement', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'while_statement', '__type__': 'NonTerminal'}], 'order': 5, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 96: {'origin': {'name': 'statement', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'for_statement', '__type__': 'NonTerminal'}], 'order': 6, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 97: {'origin': {'name': 'statement', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'return_statement', '__type__': 'NonTerminal'}], 'order': 7, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 98: {'origin': {'name': 'statement', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'throw_statement', '__type__': 'NonTerminal'}], 'order': 8, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 99: {'origin': {'name': 'statement', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'try_statement', '__type__': 'NonTerminal'}], 'order': 9, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 100: {'origin': {'name': 'statement', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'break_statement', '__type__': 'NonTerminal'}], 'order': 10, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 101: {'origin': {'name': 'statement', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'continue_statement', '__type__': 'NonTerminal'}], 'order': 11, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 102: {'origin': {'name': 'statement', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'nonlocal_statement', '__type__': 'NonTerminal'}], 'order': 12, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 103: {'origin': {'name': 'expression_statement', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'expression', '__type__': 'NonTerminal'}, {'name': 'SEMICOLON', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 104: {'origin': {'name': 'assignment_statement', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'assignment_target', '__type__': 'NonTerminal'}, {'name': 'EQUAL', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}, {'name': 'SEMICOLON', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 105: {'origin': {'name': 'destructuring_statement', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'destructuring_pattern', '__type__': 'NonTerminal'}, {'name': 'EQUAL', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}, {'name': 'SEMICOLON', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 106: {'origin': {'name': 'assignment_target', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 107: {'origin': {'name': 'assignment_target', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'array_access', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 108: {'origin': {'name': 'assignment_target', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'member_access', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 109: {'origin': {'name': 'return_statement', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'RETURN', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}, {'name': 'SEMICOLON', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 110: {'origin': {'name': 'return_statement', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'RETURN', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'SEMICOLON', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 111: {'origin': {'name': 'throw_statement', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'THROW', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'object_literal', '__type__': 'NonTerminal'}, {'name': 'SEMICOLON', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 112: {'origin': {'name': 'if_statement', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'IF', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'statement_block', '__type__': 'NonTerminal'}, {'name': '__if_statement_star_5', '__type__': 'NonTerminal'}, {'name': 'ELSE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'statement_block', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 113: {'origin': {'name': 'if_statement', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'IF', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'statement_block', '__type__': 'NonTerminal'}, {'name': '__if_statement_star_5', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 114: {'origin': {'name': 'if_statement', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'IF', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'statement_block', '__type__': 'NonTerminal'}, {'name': 'ELSE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'statement_block', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 115: {'origin': {'name': 'if_statement', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'IF', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'statement_block', '__type__': 'NonTerminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 116: {'origin': {'name': 'elif_clause', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'ELIF', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'statement_block', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 117: {'origin': {'name': 'statement_block', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LBRACE', 'filter_out': True, '__type__': 'Terminal'}, {'name': '__function_definition_star_3', '__type__': 'NonTerminal'}, {'name': 'RBRACE', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 118: {'origin': {'name': 'statement_block', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LBRACE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'RBRACE', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 119: {'origin': {'name': 'while_statement', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'WHILE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LBRACE', 'filter_out': True, '__type__': 'Terminal'}, {'name': '__function_definition_star_3', '__type__': 'NonTerminal'}, {'name': 'RBRACE', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 120: {'origin': {'name': 'while_statement', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'WHILE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LBRACE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'RBRACE', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 121: {'origin': {'name': 'for_statement', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'FOR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'IN', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LBRACE', 'filter_out': True, '__type__': 'Terminal'}, {'name': '__function_definition_star_3', '__type__': 'NonTerminal'}, {'name': 'RBRACE', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 122: {'origin': {'name': 'for_statement', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'FOR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'IN', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LBRACE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'RBRACE', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 123: {'origin': {'name': 'try_statement', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'TRY', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LBRACE', 'filter_out': True, '__type__': 'Terminal'}, {'name': '__function_definition_star_3', '__type__': 'NonTerminal'}, {'name': 'RBRACE', 'filter_out': True, '__type__': 'Terminal'}, {'name': '__try_statement_star_6', '__type__': 'NonTerminal'}, {'name': 'finally_clause', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 124: {'origin': {'name': 'try_statement', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'TRY', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LBRACE', 'filter_out': True, '__type__': 'Terminal'}, {'name': '__function_definition_star_3', '__type__': 'NonTerminal'}, {'name': 'RBRACE', 'filter_out': True, '__type__': 'Terminal'}, {'name': '__try_statement_star_6', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 125: {'origin': {'name': 'try_statement', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'TRY', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LBRACE', 'filter_out': True, '__type__': 'Terminal'}, {'name': '__function_definition_star_3', '__type__': 'NonTerminal'}, {'name': 'RBRACE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'finally_clause', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 126: {'origin': {'name': 'try_statement', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'TRY', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LBRACE', 'filter_out': True, '__type__': 'Terminal'}, {'name': '__function_definition_star_3', '__type__': 'NonTerminal'}, {'name': 'RBRACE', 'filter_out': True, '__type__': 'Terminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 127: {'origin': {'name': 'try_statement', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'TRY', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LBRACE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'RBRACE', 'filter_out': True, '__type__': 'Terminal'}, {'name': '__try_statement_star_6', '__type__': 'NonTerminal'}, {'name': 'finally_clause', '__type__': 'NonTerminal'}], 'order': 4, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 128: {'origin': {'name': 'try_statement', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'TRY', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LBRACE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'RBRACE', 'filter_out': True, '__type__': 'Terminal'}, {'name': '__try_statement_star_6', '__type__': 'NonTerminal'}], 'order': 5, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 129: {'origin': {'name': 'try_statement', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'TRY', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LBRACE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'RBRACE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'finally_clause', '__type__': 'NonTerminal'}], 'order': 6, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 130: {'origin': {'name': 'try_statement', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'TRY', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LBRACE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'RBRACE', 'filter_out': True, '__type__': 'Terminal'}], 'order': 7, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 131: {'origin': {'name': 'except_clause', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'EXCEPT', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LBRACE', 'filter_out': True, '__type__': 'Terminal'}, {'name': '__function_definition_star_3', '__type__': 'NonTerminal'}, {'name': 'RBRACE', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 132: {'origin': {'name': 'except_clause', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'EXCEPT', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LBRACE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'RBRACE', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 133: {'origin': {'name': 'except_clause', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'EXCEPT', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LBRACE', 'filter_out': True, '__type__': 'Terminal'}, {'name': '__function_definition_star_3', '__type__': 'NonTerminal'}, {'name': 'RBRACE', 'filter_out': True, '__type__': 'Terminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 134: {'origin': {'name': 'except_clause', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'EXCEPT', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LBRACE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'RBRACE', 'filter_out': True, '__type__': 'Terminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 135: {'origin': {'name': 'finally_clause', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'FINALLY', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LBRACE', 'filter_out': True, '__type__': 'Terminal'}, {'name': '__function_definition_star_3', '__type__': 'NonTerminal'}, {'name': 'RBRACE', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 136: {'origin': {'name': 'finally_clause', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'FINALLY', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'LBRACE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'RBRACE', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 137: {'origin': {'name': 'break_statement', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'BREAK', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'SEMICOLON', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 138: {'origin': {'name': 'continue_statement', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'CONTINUE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'SEMICOLON', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 139: {'origin': {'name': 'nonlocal_statement', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'NONLOCAL', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}, {'name': '__nonlocal_statement_star_7', '__type__': 'NonTerminal'}, {'name': 'SEMICOLON', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 140: {'origin': {'name': 'nonlocal_statement', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'NONLOCAL', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'SEMICOLON', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 141: {'origin': {'name': 'expression', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'ternary', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 142: {'origin': {'name': 'ternary', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'logical_or', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 143: {'origin': {'name': 'ternary', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'logical_or', '__type__': 'NonTerminal'}, {'name': 'QMARK', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}, {'name': 'COLON', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'ternary_op', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 144: {'origin': {'name': 'logical_or', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'logical_and', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 145: {'origin': {'name': 'logical_or', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'logical_or', '__type__': 'NonTerminal'}, {'name': '__ANON_0', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'logical_and', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'or_op', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 146: {'origin': {'name': 'logical_and', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'equality', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 147: {'origin': {'name': 'logical_and', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'logical_and', '__type__': 'NonTerminal'}, {'name': '__ANON_1', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'equality', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'and_op', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 148: {'origin': {'name': 'equality', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'comparison', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 149: {'origin': {'name': 'equality', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'equality', '__type__': 'NonTerminal'}, {'name': '__ANON_2', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'comparison', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'eq_op', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 150: {'origin': {'name': 'equality', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'equality', '__type__': 'NonTerminal'}, {'name': '__ANON_3', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'comparison', '__type__': 'NonTerminal'}], 'order': 2, 'alias': 'ne_op', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 151: {'origin': {'name': 'comparison', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'addition', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 152: {'origin': {'name': 'comparison', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'comparison', '__type__': 'NonTerminal'}, {'name': 'LESSTHAN', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'addition', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'lt_op', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 153: {'origin': {'name': 'comparison', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'comparison', '__type__': 'NonTerminal'}, {'name': 'MORETHAN', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'addition', '__type__': 'NonTerminal'}], 'order': 2, 'alias': 'gt_op', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 154: {'origin': {'name': 'comparison', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'comparison', '__type__': 'NonTerminal'}, {'name': '__ANON_4', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'addition', '__type__': 'NonTerminal'}], 'order': 3, 'alias': 'le_op', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 155: {'origin': {'name': 'comparison', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'comparison', '__type__': 'NonTerminal'}, {'name': '__ANON_5', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'addition', '__type__': 'NonTerminal'}], 'order': 4, 'alias': 'ge_op', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 156: {'origin': {'name': 'addition', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'multiplication', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 157: {'origin': {'name': 'addition', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'addition', '__type__': 'NonTerminal'}, {'name': 'PLUS', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'multiplication', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'add_op', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 158: {'origin': {'name': 'addition', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'addition', '__type__': 'NonTerminal'}, {'name': 'MINUS', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'multiplication', '__type__': 'NonTerminal'}], 'order': 2, 'alias': 'sub_op', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 159: {'origin': {'name': 'multiplication', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'unary', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 160: {'origin': {'name': 'multiplication', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'multiplication', '__type__': 'NonTerminal'}, {'name': 'STAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'unary', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'mul_op', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 161: {'origin': {'name': 'multiplication', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'multiplication', '__type__': 'NonTerminal'}, {'name': 'SLASH', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'unary', '__type__': 'NonTerminal'}], 'order': 2, 'alias': 'div_op', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 162: {'origin': {'name': 'multiplication', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'multiplication', '__type__': 'NonTerminal'}, {'name': 'FLOORDIV', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'unary', '__type__': 'NonTerminal'}], 'order': 3, 'alias': 'floordiv_op', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 163: {'origin': {'name': 'multiplication', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'multiplication', '__type__': 'NonTerminal'}, {'name': 'PERCENT', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'unary', '__type__': 'NonTerminal'}], 'order': 4, 'alias': 'mod_op', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 164: {'origin': {'name': 'unary', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'primary', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 165: {'origin': {'name': 'unary', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'BANG', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'unary', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'unary_not', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 166: {'origin': {'name': 'unary', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'MINUS', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'unary', '__type__': 'NonTerminal'}], 'order': 2, 'alias': 'unary_neg', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 167: {'origin': {'name': 'primary', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'literal', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 168: {'origin': {'name': 'primary', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 169: {'origin': {'name': 'primary', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'function_call', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 170: {'origin': {'name': 'primary', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'array_access', '__type__': 'NonTerminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 171: {'origin': {'name': 'primary', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'member_access', '__type__': 'NonTerminal'}], 'order': 4, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 172: {'origin': {'name': 'primary', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'arrow_function', '__type__': 'NonTerminal'}], 'order': 5, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 173: {'origin': {'name': 'primary', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 6, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 174: {'origin': {'name': 'function_call', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'argument_list', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 175: {'origin': {'name': 'function_call', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 176: {'origin': {'name': 'function_call', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'member_access', '__type__': 'NonTerminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'argument_list', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 177: {'origin': {'name': 'function_call', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'member_access', '__type__': 'NonTerminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 178: {'origin': {'name': 'argument_list', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'expression', '__type__': 'NonTerminal'}, {'name': '__argument_list_star_8', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 179: {'origin': {'name': 'argument_list', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'expression', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 180: {'origin': {'name': 'array_access', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'primary', '__type__': 'NonTerminal'}, {'name': 'LSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'slice_expression', '__type__': 'NonTerminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 181: {'origin': {'name': 'array_access', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'primary', '__type__': 'NonTerminal'}, {'name': 'LSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 182: {'origin': {'name': 'member_access', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'primary', '__type__': 'NonTerminal'}, {'name': 'DOT', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 183: {'origin': {'name': 'slice_expression', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'slice_start', '__type__': 'NonTerminal'}, {'name': 'COLON', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'slice_end', '__type__': 'NonTerminal'}, {'name': 'COLON', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'slice_step', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 184: {'origin': {'name': 'slice_expression', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'slice_start', '__type__': 'NonTerminal'}, {'name': 'COLON', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'slice_end', '__type__': 'NonTerminal'}, {'name': 'COLON', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 185: {'origin': {'name': 'slice_expression', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'slice_start', '__type__': 'NonTerminal'}, {'name': 'COLON', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'slice_end', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 186: {'origin': {'name': 'slice_expression', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'slice_start', '__type__': 'NonTerminal'}, {'name': 'COLON', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'COLON', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'slice_step', '__type__': 'NonTerminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 187: {'origin': {'name': 'slice_expression', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'slice_start', '__type__': 'NonTerminal'}, {'name': 'COLON', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'COLON', 'filter_out': True, '__type__': 'Terminal'}], 'order': 4, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 188: {'origin': {'name': 'slice_expression', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'slice_start', '__type__': 'NonTerminal'}, {'name': 'COLON', 'filter_out': True, '__type__': 'Terminal'}], 'order': 5, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 189: {'origin': {'name': 'slice_expression', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'COLON', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'slice_end', '__type__': 'NonTerminal'}, {'name': 'COLON', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'slice_step', '__type__': 'NonTerminal'}], 'order': 6, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 190: {'origin': {'name': 'slice_expression', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'COLON', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'slice_end', '__type__': 'NonTerminal'}, {'name': 'COLON', 'filter_out': True, '__type__': 'Terminal'}], 'order': 7, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 191: {'origin': {'name': 'slice_expression', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'COLON', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'slice_end', '__type__': 'NonTerminal'}], 'order': 8, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 192: {'origin': {'name': 'slice_expression', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'COLON', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'COLON', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'slice_step', '__type__': 'NonTerminal'}], 'order': 9, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 193: {'origin': {'name': 'slice_expression', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'COLON', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'COLON', 'filter_out': True, '__type__': 'Terminal'}], 'order': 10, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 194: {'origin': {'name': 'slice_expression', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'COLON', 'filter_out': True, '__type__': 'Terminal'}], 'order': 11, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 195: {'origin': {'name': 'slice_start', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'expression', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 196: {'origin': {'name': 'slice_end', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'expression', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 197: {'origin': {'name': 'slice_step', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'expression', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 198: {'origin': {'name': 'literal', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'NUMBER', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 199: {'origin': {'name': 'literal', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'STRING', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 200: {'origin': {'name': 'literal', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'BOOLEAN', 'filter_out': False, '__type__': 'Terminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 201: {'origin': {'name': 'literal', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'array_literal', '__type__': 'NonTerminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 202: {'origin': {'name': 'literal', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'object_literal', '__type__': 'NonTerminal'}], 'order': 4, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 203: {'origin': {'name': 'array_literal', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}, {'name': '__argument_list_star_8', '__type__': 'NonTerminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 204: {'origin': {'name': 'array_literal', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 205: {'origin': {'name': 'array_literal', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 206: {'origin': {'name': 'object_literal', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LBRACE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'object_property', '__type__': 'NonTerminal'}, {'name': '__object_literal_star_9', '__type__': 'NonTerminal'}, {'name': 'RBRACE', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 207: {'origin': {'name': 'object_literal', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LBRACE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'object_property', '__type__': 'NonTerminal'}, {'name': 'RBRACE', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 208: {'origin': {'name': 'object_literal', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LBRACE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'RBRACE', 'filter_out': True, '__type__': 'Terminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 209: {'origin': {'name': 'object_property', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'COLON', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 210: {'origin': {'name': 'object_property', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'STRING', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'COLON', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 211: {'origin': {'name': 'destructuring_pattern', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'array_destructuring', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 212: {'origin': {'name': 'destructuring_pattern', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'object_destructuring', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 213: {'origin': {'name': 'array_destructuring', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}, {'name': '__nonlocal_statement_star_7', '__type__': 'NonTerminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 214: {'origin': {'name': 'array_destructuring', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 215: {'origin': {'name': 'object_destructuring', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LBRACE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}, {'name': '__nonlocal_statement_star_7', '__type__': 'NonTerminal'}, {'name': 'RBRACE', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 216: {'origin': {'name': 'object_destructuring', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LBRACE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'RBRACE', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 217: {'origin': {'name': 'arrow_function', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'FN', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'parameter_list', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': '__ANON_6', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'arrow_body', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 218: {'origin': {'name': 'arrow_function', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'FN', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': '__ANON_6', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'arrow_body', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 219: {'origin': {'name': 'arrow_body', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'expression', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 220: {'origin': {'name': 'arrow_body', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'arrow_block', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 221: {'origin': {'name': 'arrow_block', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LBRACE', 'filter_out': True, '__type__': 'Terminal'}, {'name': '__function_definition_star_3', '__type__': 'NonTerminal'}, {'name': 'RBRACE', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 222: {'origin': {'name': '__program_star_0', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'capability_declaration', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 223: {'origin': {'name': '__program_star_0', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'import_statement', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 224: {'origin': {'name': '__program_star_0', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'statement', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 225: {'origin': {'name': '__program_star_0', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__program_star_0', '__type__': 'NonTerminal'}, {'name': 'capability_declaration', '__type__': 'NonTerminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 226: {'origin': {'name': '__program_star_0', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__program_star_0', '__type__': 'NonTerminal'}, {'name': 'import_statement', '__type__': 'NonTerminal'}], 'order': 4, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 227: {'origin': {'name': '__program_star_0', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__program_star_0', '__type__': 'NonTerminal'}, {'name': 'statement', '__type__': 'NonTerminal'}], 'order': 5, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 228: {'origin': {'name': '__capability_declaration_star_1', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'capability_item', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 229: {'origin': {'name': '__capability_declaration_star_1', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__capability_declaration_star_1', '__type__': 'NonTerminal'}, {'name': 'capability_item', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 230: {'origin': {'name': '__import_target_star_2', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'DOT', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 231: {'origin': {'name': '__import_target_star_2', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__import_target_star_2', '__type__': 'NonTerminal'}, {'name': 'DOT', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 232: {'origin': {'name': '__function_definition_star_3', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'statement', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 233: {'origin': {'name': '__function_definition_star_3', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__function_definition_star_3', '__type__': 'NonTerminal'}, {'name': 'statement', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 234: {'origin': {'name': '__parameter_list_star_4', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'parameter', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 235: {'origin': {'name': '__parameter_list_star_4', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__parameter_list_star_4', '__type__': 'NonTerminal'}, {'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'parameter', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 236: {'origin': {'name': '__if_statement_star_5', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'elif_clause', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 237: {'origin': {'name': '__if_statement_star_5', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__if_statement_star_5', '__type__': 'NonTerminal'}, {'name': 'elif_clause', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 238: {'origin': {'name': '__try_statement_star_6', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'except_clause', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 239: {'origin': {'name': '__try_statement_star_6', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__try_statement_star_6', '__type__': 'NonTerminal'}, {'name': 'except_clause', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 240: {'origin': {'name': '__nonlocal_statement_star_7', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 241: {'origin': {'name': '__nonlocal_statement_star_7', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__nonlocal_statement_star_7', '__type__': 'NonTerminal'}, {'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'IDENTIFIER', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 242: {'origin': {'name': '__argument_list_star_8', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 243: {'origin': {'name': '__argument_list_star_8', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__argument_list_star_8', '__type__': 'NonTerminal'}, {'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'expression', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 244: {'origin': {'name': '__object_literal_star_9', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'object_property', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 245: {'origin': {'name': '__object_literal_star_9', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__object_literal_star_9', '__type__': 'NonTerminal'}, {'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'object_property', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}}
+)
+Shift = 0
+Reduce = 1
+def Lark_StandAlone(**kwargs):
+  return Lark._load_from_dict(DATA, MEMO, **kwargs)
@@ -0,0 +1,132 @@
+"""Process-wide cache of parsed ML programs.
+
+The transpiler, LSP server, semantic token provider and module loaders all
+parse the same sources independently. ``MLParser.parse`` consults this cache
+first, keyed by the SHA-256 of the source and the grammar hash.
+
+Entries are pickled ``Program`` snapshots, so the cache is bounded by their
+exact size in bytes, and every hit returns a private copy that callers may
+annotate or rewrite without affecting other users. Unpickling is about an
+order of magnitude faster than parsing.
+"""
+
+import hashlib
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from typing import Any
+
+from .ast_nodes import Program
+
+DEFAULT_MAX_SIZE = 64 * 1024 * 1024  # bytes of pickled ASTs
+
+
+class ParseCache:
+    """Memory-bounded LRU of parsed programs keyed by source and grammar."""
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE):
+        """Initialize the cache with a size cap in bytes."""
+        self.max_size = max_size
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evicted = 0
+        self._uncacheable = 0
+
+    @staticmethod
+    def make_key(source_code: str) -> str:
+        """Cache key for a source text under the current grammar."""
+        from .parser import get_grammar_hash
+
+        digest = hashlib.sha256(source_code.encode("utf-8", "surrogatepass")).hexdigest()
+        return f"{get_grammar_hash()[:16]}_{digest}"
+
+    def get(self, source_code: str) -> Program | None:
+        """Return a private copy of the cached AST, or None on a miss."""
+        key = self.make_key(source_code)
+
+        with self._lock:
+            data = self._entries.get(key)
+            if data is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+
+        return pickle.loads(data)
+
+    def put(self, source_code: str, ast: Program) -> bool:
+        """Snapshot an AST. Returns False if it is too large or cannot be pickled."""
+        try:
+            data = pickle.dumps(ast, protocol=pickle.HIGHEST_PROTOCOL)
+        except (RecursionError, pickle.PicklingError, TypeError, AttributeError):
+            with self._lock:
+                self._uncacheable += 1
+            return False
+
+        if len(data) > self.max_size:
+            with self._lock:
+                self._uncacheable += 1
+            return False
+
+        key = self.make_key(source_code)
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous)
+
+            self._entries[key] = data
+            self._size += len(data)
+
+            while self._size > self.max_size:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+                self._evicted += 1
+
+        return True
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics."""
+        with self._lock:
+            total_requests = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "total_size_bytes": self._size,
+                "max_size_bytes": self.max_size,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / total_requests if total_requests > 0 else 0.0,
+                "evicted": self._evicted,
+                "uncacheable": self._uncacheable,
+            }
+
+
+_parse_cache: ParseCache | None = None
+_parse_cache_lock = threading.Lock()
+
+
+def get_parse_cache() -> ParseCache:
+    """Get the process-wide parse cache.
+
+    ``MLPY_PARSE_CACHE_SIZE`` (e.g. "128MB") sets the size cap; 0 disables caching.
+    """
+    global _parse_cache
+    if _parse_cache is None:
+        with _parse_cache_lock:
+            if _parse_cache is None:
+                from mlpy.runtime.sandbox.sandbox import parse_size
+
+                max_size_env = os.environ.get("MLPY_PARSE_CACHE_SIZE")
+                max_size = parse_size(max_size_env) if max_size_env else DEFAULT_MAX_SIZE
+                _parse_cache = ParseCache(max_size=max_size)
+    return _parse_cache
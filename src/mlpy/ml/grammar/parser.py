@@ -1,72 +1,152 @@
 """Main ML language parser using Lark with security-first design."""
 
+import hashlib
+import threading
 import time
 from pathlib import Path
 
-from lark import Lark, LarkError
-from lark.exceptions import UnexpectedInput, UnexpectedToken
-
 from mlpy.ml.errors.exceptions import MLParseError, MLSyntaxError
 from mlpy.runtime.profiling.decorators import profile_parser
+from mlpy.runtime.profiling.tracing import tracer
 
 from .ast_nodes import Program
+from .embedded import EmbeddedTransformer
+from .lark_runtime import (
+    STANDALONE,
+    Lark,
+    Lark_StandAlone,
+    LarkError,
+    UnexpectedInput,
+    UnexpectedToken,
+    grammar_source_hash,
+)
+from .parse_cache import get_parse_cache
 from .transformer import MLTransformer
 
+_grammar_hash: str | None = None
+
+
+def get_grammar_hash() -> str:
+    """Hash of the grammar and AST transformer, for keying transpilation caches."""
+    global _grammar_hash
+    if _grammar_hash is None:
+        grammar_dir = Path(__file__).parent
+        digest = hashlib.sha256()
+        digest.update(grammar_source_hash().encode())
+        for name in ("transformer.py", "embedded.py", "ast_nodes.py"):
+            digest.update((grammar_dir / name).read_bytes())
+        _grammar_hash = digest.hexdigest()
+    return _grammar_hash
+
 
 class MLParser:
     """Security-first ML language parser."""
 
-    def __init__(self) -> None:
-        """Initialize the parser with grammar and transformer."""
+    def __init__(self, single_pass: bool = True, use_cache: bool = True) -> None:
+        """Initialize the parser with grammar and transformer.
+
+        Args:
+            single_pass: Build AST nodes inside the LALR parser as rules reduce,
+                instead of building a parse tree and transforming it afterwards
+            use_cache: Serve repeated sources from the process-wide parse cache
+        """
+        self.single_pass = single_pass
+        self.use_cache = use_cache
         self._parser: Lark | None = None
+        self._single_pass_parser: Lark | None = None
         self._transformer = MLTransformer()
+        self._embedded = EmbeddedTransformer(self._transformer)
+        self._single_pass_lock = threading.Lock()
         self._grammar_path = Path(__file__).parent / "ml.lark"
 
     @property
     def parser(self) -> Lark:
-        """Lazy-loaded Lark parser instance.
+        """Lazy-loaded Lark parser instance producing parse trees.
 
         Uses pre-compiled grammar if available for 60-80% faster cold-start.
         Falls back to compiling from .lark file if compiled version not found.
         """
         if self._parser is None:
-            compiled_path = self._grammar_path.with_name('ml_parser.compiled')
+            self._parser = self._load_parser()
+        return self._parser
 
+    @property
+    def single_pass_parser(self) -> Lark:
+        """Lazy-loaded Lark parser that runs the transformer as rules reduce."""
+        if self._single_pass_parser is None:
+            parser = self._load_parser(transformer=self._embedded, propagate_positions=False)
+            self._embedded.install(parser)
+            self._single_pass_parser = parser
+        return self._single_pass_parser
+
+    def _load_parser(self, **options) -> Lark:
+        """Load the parser with extra Lark options.
+
+        Prefers the generated standalone module, then the compiled grammar,
+        then compiling ml.lark.
+        """
+        compiled_path = self._grammar_path.with_name('ml_parser.compiled')
+
+        try:
+            if STANDALONE:
+                # Parse tables are Python literals; no grammar processing at all
+                return Lark_StandAlone(**options)
+
+            # Try loading pre-compiled grammar (60-80% faster)
+            if compiled_path.exists():
+                try:
+                    with compiled_path.open('rb') as f:
+                        if not options:
+                            return Lark.load(f)
+                        # Lark.load() takes no options; _load() accepts the load-time ones
+                        parser = Lark.__new__(Lark)
+                        return parser._load(f, **options)
+                except Exception:
+                    # Compiled grammar failed, fall through to .lark compilation
+                    pass
+
+            # Fall back to compiling from .lark file
+            return Lark.open(
+                self._grammar_path,
+                **{
+                    "parser": "lalr",  # Fast LALR(1) parser
+                    "propagate_positions": True,  # For error reporting and source maps
+                    "maybe_placeholders": False,  # Strict parsing
+                    "debug": False,  # Production mode
+                    **options,
+                },
+            )
+        except Exception as e:
+            raise MLParseError(
+                f"Failed to initialize parser: {str(e)}",
+                suggestions=[
+                    "Check that ml.lark grammar file exists and is valid",
+                    "Verify Lark installation: pip install lark-parser",
+                    "Review grammar syntax for any errors",
+                    "Try running: python -m scripts.compile_grammar",
+                ],
+                context={
+                    "grammar_file": str(self._grammar_path),
+                    "compiled_file": str(compiled_path),
+                    "error_type": type(e).__name__,
+                },
+            )
+
+    def _parse_to_ast(self, source_code: str) -> object:
+        """Run the parser and transformer over the source."""
+        if not self.single_pass:
+            # Apply transformer manually to get AST with line/column info
+            with tracer.span("lark_parse", "parser"):
+                tree = self.parser.parse(source_code)
+            with tracer.span("transform", "parser"):
+                return self._transformer.transform(tree)
+
+        parser = self.single_pass_parser
+        with self._single_pass_lock, tracer.span("lark_parse", "parser", single_pass=True):
             try:
-                # Try loading pre-compiled grammar (60-80% faster)
-                if compiled_path.exists():
-                    try:
-                        with compiled_path.open('rb') as f:
-                            self._parser = Lark.load(f)
-                        return self._parser
-                    except Exception:
-                        # Compiled grammar failed, fall through to .lark compilation
-                        pass
-
-                # Fall back to compiling from .lark file
-                self._parser = Lark.open(
-                    self._grammar_path,
-                    parser="lalr",  # Fast LALR(1) parser
-                    propagate_positions=True,  # For error reporting and source maps
-                    maybe_placeholders=False,  # Strict parsing
-                    debug=False,  # Production mode
-                )
-            except Exception as e:
-                raise MLParseError(
-                    f"Failed to initialize parser: {str(e)}",
-                    suggestions=[
-                        "Check that ml.lark grammar file exists and is valid",
-                        "Verify Lark installation: pip install lark-parser",
-                        "Review grammar syntax for any errors",
-                        "Try running: python -m scripts.compile_grammar",
-                    ],
-                    context={
-                        "grammar_file": str(self._grammar_path),
-                        "compiled_file": str(compiled_path),
-                        "error_type": type(e).__name__,
-                    },
-                )
-        return self._parser
+                return parser.parse(source_code)
+            finally:
+                self._embedded.reset()
 
     @profile_parser
     def parse(self, source_code: str, source_file: str | None = None) -> Program:
@@ -86,12 +166,17 @@ class MLParser:
         if not source_code.strip():
             return Program(items=[])
 
+        cache = get_parse_cache() if self.use_cache else None
+        if cache is not None and cache.max_size > 0:
+            cached = cache.get(source_code)
+            if cached is not None:
+                return cached
+        else:
+            cache = None
+
         try:
             start_time = time.perf_counter()
-            tree = self.parser.parse(source_code)
-
-            # Apply transformer manually to get AST with line/column info
-            ast = self._transformer.transform(tree)
+            ast = self._parse_to_ast(source_code)
             parse_time = time.perf_counter() - start_time
 
             # Verify we got a Program node
@@ -109,6 +194,9 @@ class MLParser:
             if hasattr(ast, "parse_time"):
                 ast.parse_time = parse_time
 
+            if cache is not None:
+                cache.put(source_code, ast)
+
             return ast
 
         except UnexpectedToken as e:
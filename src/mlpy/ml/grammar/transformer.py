@@ -1,8 +1,9 @@
 """Lark transformer to convert parse trees to AST nodes."""
 
-from lark import Token, Transformer, v_args
+import sys
 
 from .ast_nodes import *
+from .lark_runtime import Token, Transformer, v_args
 
 
 class MLTransformer(Transformer):
@@ -594,24 +595,25 @@ class MLTransformer(Transformer):
 
         The items come from Lark's transformation of the grammar rules.
         Since slice_start, slice_end, and slice_step are all optional and transformed
-        separately, we need to identify which item is which based on the meta information.
+        separately, we need to identify which item is which from the tag each one carries.
         """
         start = None
         end = None
         step = None
 
-        # Items arrive in order, but only the ones that were present in the source
-        # We need to check the metadata to know which is which
+        # Items arrive in order, but only the ones that were present in the source,
+        # each tagged with its position by slice_start, slice_end or slice_step
         for item in items:
-            if hasattr(item, '_slice_position'):
-                if item._slice_position == 'start':
-                    start = item
-                elif item._slice_position == 'end':
-                    end = item
-                elif item._slice_position == 'step':
-                    step = item
+            if isinstance(item, tuple):
+                position, value = item
+                if position == "start":
+                    start = value
+                elif position == "end":
+                    end = value
+                elif position == "step":
+                    step = value
             else:
-                # Fallback: if no metadata, assume order is start, end, step
+                # Fallback: if untagged, assume order is start, end, step
                 if start is None:
                     start = item
                 elif end is None:
@@ -623,31 +625,22 @@ class MLTransformer(Transformer):
 
     def slice_start(self, items):
         """Transform slice start."""
-        result = items[0] if items else None
-        if result is not None:
-            result._slice_position = 'start'
-        return result
+        return ("start", items[0]) if items else None
 
     def slice_end(self, items):
         """Transform slice end."""
-        result = items[0] if items else None
-        if result is not None:
-            result._slice_position = 'end'
-        return result
+        return ("end", items[0]) if items else None
 
     def slice_step(self, items):
         """Transform slice step."""
-        result = items[0] if items else None
-        if result is not None:
-            result._slice_position = 'step'
-        return result
+        return ("step", items[0]) if items else None
 
     def member_access(self, items):
         """Transform member access - Security Critical."""
         obj = items[0]
         # Extract member name from Token, Identifier, or other types
         if isinstance(items[1], Token):
-            member = items[1].value
+            member = sys.intern(items[1].value)
         elif hasattr(items[1], "name"):
             member = items[1].name
         else:
@@ -685,7 +678,8 @@ class MLTransformer(Transformer):
     # Identifiers and Tokens
     def IDENTIFIER(self, token):
         """Transform identifier token."""
-        return Identifier(name=token.value)
+        # Names repeat throughout a program; interning stores each once
+        return Identifier(name=sys.intern(token.value))
 
     def NUMBER(self, token):
         """Transform number token with scientific notation support."""
@@ -0,0 +1,527 @@
+"""Parallel build of every ML module in a project.
+
+``mlpy transpile`` compiles one file, and the user modules it imports are
+compiled one after another as the code generator reaches them.
+``ProjectBuilder`` builds a whole source tree instead:
+
+1. Every ``.ml`` file under the source directory is resolved with
+   ``ModuleResolver`` to find its imports, giving the project's import DAG.
+2. Modules are compiled in topological waves. A wave holds every module whose
+   project imports are already built; its modules are parsed, analyzed and
+   generated in parallel worker processes.
+
+Each module is written next to its source as ``<name>.py``, which is where
+the code generator's ``separate`` module mode puts it, so generating an
+import of an already built module reuses its file instead of compiling it
+again.
+
+The report has per-module timings and the critical path: the most expensive
+chain of dependent modules, which bounds the build time however many workers
+are used.
+
+With a ``BuildManifest``, builds are incremental. The manifest records, per
+module, the hash of its source, its imports, the source hashes of every
+module it imports directly or transitively, and the hash of its output; and
+for the whole build, the transpiler version, toolchain hash and security mode.
+A module is rebuilt only if one of those changed, and only new or edited
+files are resolved (parsed) to find their imports; the others reuse the
+imports recorded in the manifest. File hashes are reused while a file's size
+and modification time are unchanged, so an unchanged project is checked with
+one ``stat`` per file.
+"""
+
+import hashlib
+import json
+import os
+import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from mlpy.ml.grammar.parser import MLParser
+from mlpy.version import __version__, get_toolchain_hash
+
+_CRITICAL_SEVERITIES = ("critical", "high")
+
+MANIFEST_VERSION = 1
+
+# (st_mtime_ns, st_size): a file whose stat matches is assumed unchanged
+_FileStat = tuple[int, int]
+
+
+@dataclass
+class ModuleBuildResult:
+    """Outcome and timings of building one module."""
+
+    module_path: str
+    file_path: str
+    output_path: str | None = None
+    wave: int | None = None
+    parse_time: float = 0.0
+    analysis_time: float = 0.0
+    codegen_time: float = 0.0
+    errors: list[str] = field(default_factory=list)
+    warnings: list[str] = field(default_factory=list)
+    up_to_date: bool = False  # Output reused from the previous build
+
+    @property
+    def success(self) -> bool:
+        """Whether the module was written."""
+        return self.output_path is not None and not self.errors
+
+    @property
+    def total_time(self) -> float:
+        """Time spent parsing, analyzing and generating the module."""
+        return self.parse_time + self.analysis_time + self.codegen_time
+
+
+@dataclass
+class BuildReport:
+    """Results of a project build."""
+
+    modules: dict[str, ModuleBuildResult]
+    dependencies: dict[str, list[str]]  # Project modules each module imports
+    waves: list[list[str]]
+    jobs: int
+    scan_time: float = 0.0
+    wall_time: float = 0.0
+    critical_path: list[str] = field(default_factory=list)
+
+    @property
+    def success(self) -> bool:
+        """Whether every module was built."""
+        return all(result.success for result in self.modules.values())
+
+    @property
+    def failed(self) -> list[ModuleBuildResult]:
+        """Modules that were not built."""
+        return [result for result in self.modules.values() if not result.success]
+
+    @property
+    def rebuilt(self) -> list[ModuleBuildResult]:
+        """Modules that were compiled by this build."""
+        return [
+            result
+            for result in self.modules.values()
+            if result.success and not result.up_to_date
+        ]
+
+    @property
+    def up_to_date(self) -> list[ModuleBuildResult]:
+        """Modules whose output from the previous build was reused."""
+        return [result for result in self.modules.values() if result.up_to_date]
+
+    @property
+    def module_time(self) -> float:
+        """Total time spent building modules, summed over all workers."""
+        return sum(result.total_time for result in self.modules.values())
+
+    @property
+    def critical_path_time(self) -> float:
+        """Build time of the critical path: the minimum with unlimited workers."""
+        return sum(self.modules[name].total_time for name in self.critical_path)
+
+
+@dataclass
+class ManifestEntry:
+    """Inputs and output of one module as of its last successful build."""
+
+    source_hash: str
+    source_stat: _FileStat
+    imports: list[str]  # Every module imported, as found by ModuleResolver
+    dependency_hashes: dict[str, str]  # Source hash of every module imported transitively
+    output_hash: str
+    output_stat: _FileStat
+    warnings: list[str] = field(default_factory=list)
+
+
+class BuildManifest:
+    """Record of the last build, stored as JSON (e.g. in the project cache dir)."""
+
+    def __init__(self, path: str | Path, settings: dict[str, Any]):
+        """Initialize an empty manifest.
+
+        Args:
+            path: JSON file the manifest is stored in
+            settings: Build-wide inputs; a change invalidates every entry
+        """
+        self.path = Path(path)
+        self.settings = settings
+        self.modules: dict[str, ManifestEntry] = {}
+
+    @classmethod
+    def load(cls, path: str | Path, settings: dict[str, Any]) -> "BuildManifest":
+        """Load a manifest, dropping its entries if it was written with other settings."""
+        manifest = cls(path, settings)
+        try:
+            data = json.loads(manifest.path.read_text(encoding="utf-8"))
+            if data.get("version") != MANIFEST_VERSION or data.get("settings") != settings:
+                return manifest
+            for name, entry in data["modules"].items():
+                entry["source_stat"] = tuple(entry["source_stat"])
+                entry["output_stat"] = tuple(entry["output_stat"])
+                manifest.modules[name] = ManifestEntry(**entry)
+        except (OSError, ValueError, KeyError, TypeError):
+            manifest.modules.clear()  # Missing or unreadable: rebuild everything
+        return manifest
+
+    def save(self) -> None:
+        """Write the manifest atomically."""
+        data = {
+            "version": MANIFEST_VERSION,
+            "settings": self.settings,
+            "modules": {name: vars(entry) for name, entry in sorted(self.modules.items())},
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        temp_path.write_text(json.dumps(data, indent=1), encoding="utf-8")
+        os.replace(temp_path, self.path)
+
+    @staticmethod
+    def default_path(cache_dir: str | Path, source_dir: str | Path) -> Path:
+        """Manifest file for a source directory under a cache directory."""
+        digest = hashlib.sha256(str(Path(source_dir).resolve()).encode()).hexdigest()
+        return Path(cache_dir) / f"build-{digest[:16]}.json"
+
+
+class ProjectBuilder:
+    """Build every module under a source directory in dependency order."""
+
+    def __init__(
+        self,
+        source_dir: str | Path,
+        jobs: int | None = None,
+        strict_security: bool = True,
+        manifest_path: str | Path | None = None,
+        force: bool = False,
+    ):
+        """Initialize the builder.
+
+        Args:
+            source_dir: Root of the project's ML modules; also the import path
+            jobs: Worker processes (default: CPU count); 1 builds in this process
+            strict_security: Fail modules with critical or high security issues
+            manifest_path: Build manifest to read and update; None rebuilds everything
+            force: Rebuild every module even if the manifest says it is up to date
+        """
+        self.source_dir = Path(source_dir).resolve()
+        self.jobs = jobs or os.cpu_count() or 1
+        self.strict_security = strict_security
+        self.manifest_path = Path(manifest_path) if manifest_path is not None else None
+        self.force = force
+
+    def build_settings(self) -> dict[str, Any]:
+        """Build-wide inputs recorded in the manifest."""
+        return {
+            "transpiler_version": __version__,
+            "toolchain_hash": get_toolchain_hash(),
+            "strict_security": self.strict_security,
+            "source_dir": str(self.source_dir),
+        }
+
+    def discover_modules(self) -> dict[str, Path]:
+        """Map dotted module paths to the .ml files under the source directory."""
+        modules = {}
+        for ml_file in sorted(self.source_dir.rglob("*.ml")):
+            parts = ml_file.relative_to(self.source_dir).with_suffix("").parts
+            if parts[-1] == "__init__":
+                parts = parts[:-1]  # Package module: utils/__init__.ml is "utils"
+            if parts:
+                modules[".".join(parts)] = ml_file
+        return modules
+
+    def build(self, on_module: Callable[[ModuleBuildResult], None] | None = None) -> BuildReport:
+        """Build the project, skipping modules the manifest shows are up to date.
+
+        Args:
+            on_module: Called in this process as each module finishes compiling
+        """
+        start = time.perf_counter()
+        import_paths = [str(self.source_dir)]
+        modules = self.discover_modules()
+        results = {
+            name: ModuleBuildResult(module_path=name, file_path=str(path))
+            for name, path in modules.items()
+        }
+
+        manifest = None
+        if self.manifest_path is not None:
+            manifest = BuildManifest.load(self.manifest_path, self.build_settings())
+        previous = manifest.modules if manifest is not None and not self.force else {}
+
+        sources = {}
+        for name, path in modules.items():
+            entry = previous.get(name)
+            known = (entry.source_hash, entry.source_stat) if entry else None
+            sources[name] = _hash_file(path, known)
+
+        with self._executor() as executor:
+            imports = {}
+            changed = []
+            for name in modules:
+                entry = previous.get(name)
+                if entry is not None and entry.source_hash == sources[name][0]:
+                    imports[name] = entry.imports
+                else:
+                    changed.append(name)
+
+            scans = executor.map(_scan_module, [import_paths] * len(changed), changed)
+            for name, (module_imports, error) in zip(changed, scans, strict=True):
+                imports[name] = module_imports
+                if error:
+                    results[name].errors.append(error)
+            scan_time = time.perf_counter() - start
+
+            dependencies = {
+                name: sorted(dep for dep in imports[name] if dep in modules and dep != name)
+                for name in modules
+            }
+
+            waves, cyclic = _topological_waves(dependencies)
+            for name in cyclic:
+                cycle = ", ".join(dep for dep in dependencies[name] if dep in cyclic)
+                results[name].errors.append(f"Circular import of {cycle}")
+
+            transitive: dict[str, set[str]] = {}
+            dependency_hashes = {}
+            for number, wave in enumerate(waves):
+                runnable = []
+                for name in wave:
+                    transitive[name] = set(dependencies[name]).union(
+                        *(transitive[dep] for dep in dependencies[name])
+                    )
+                    dependency_hashes[name] = {
+                        dep: sources[dep][0] for dep in sorted(transitive[name])
+                    }
+
+                    result = results[name]
+                    result.wave = number
+                    failed = [dep for dep in dependencies[name] if not results[dep].success]
+                    if failed:
+                        result.errors.append(f"Not built: imports failed {', '.join(failed)}")
+                    elif result.errors:
+                        continue
+                    elif self._is_up_to_date(
+                        previous.get(name), sources[name][0], dependency_hashes[name], modules[name]
+                    ):
+                        result.output_path = str(modules[name].with_suffix(".py"))
+                        result.warnings = list(previous[name].warnings)
+                        result.up_to_date = True
+                    else:
+                        runnable.append(name)
+
+                tasks = [
+                    (name, results[name].file_path, import_paths, self.strict_security)
+                    for name in runnable
+                ]
+                for result in executor.map(_compile_module, tasks):
+                    result.wave = number
+                    results[result.module_path] = result
+                    if on_module is not None:
+                        on_module(result)
+
+        if manifest is not None:
+            self._update_manifest(manifest, results, sources, imports, dependency_hashes)
+
+        report = BuildReport(
+            modules=results,
+            dependencies=dependencies,
+            waves=waves,
+            jobs=self.jobs,
+            scan_time=scan_time,
+            wall_time=time.perf_counter() - start,
+        )
+        report.critical_path = _critical_path(report, [name for wave in waves for name in wave])
+        return report
+
+    @staticmethod
+    def _is_up_to_date(
+        entry: ManifestEntry | None,
+        source_hash: str,
+        dependency_hashes: dict[str, str],
+        ml_file: Path,
+    ) -> bool:
+        """Whether a module's recorded inputs are unchanged and its output is intact."""
+        if entry is None or entry.source_hash != source_hash:
+            return False
+        if entry.dependency_hashes != dependency_hashes:
+            return False
+        output = _hash_file(ml_file.with_suffix(".py"), (entry.output_hash, entry.output_stat))
+        return output is not None and output[0] == entry.output_hash
+
+    @staticmethod
+    def _update_manifest(
+        manifest: BuildManifest,
+        results: dict[str, ModuleBuildResult],
+        sources: dict[str, tuple[str, _FileStat]],
+        imports: dict[str, list[str]],
+        dependency_hashes: dict[str, dict[str, str]],
+    ) -> None:
+        """Record every built or reused module; drop failed and deleted ones."""
+        entries = {}
+        for name, result in results.items():
+            if not result.success:
+                continue
+            previous = manifest.modules.get(name)
+            if result.up_to_date and previous is not None:
+                output_hash, output_stat = previous.output_hash, previous.output_stat
+            else:
+                output_hash, output_stat = _hash_file(Path(result.output_path))
+            entries[name] = ManifestEntry(
+                source_hash=sources[name][0],
+                source_stat=sources[name][1],
+                imports=imports[name],
+                dependency_hashes=dependency_hashes[name],
+                output_hash=output_hash,
+                output_stat=output_stat,
+                warnings=result.warnings,
+            )
+        manifest.modules = entries
+        manifest.save()
+
+    @contextmanager
+    def _executor(self) -> Iterator[Any]:
+        """Process pool for the workers, or an in-process stand-in for one job."""
+        if self.jobs == 1:
+            yield _SerialExecutor()
+            return
+        with ProcessPoolExecutor(max_workers=self.jobs) as executor:
+            yield executor
+
+
+class _SerialExecutor:
+    """Runs ``map`` in the calling process."""
+
+    @staticmethod
+    def map(fn: Callable, *iterables: Iterable) -> Iterator:
+        return map(fn, *iterables)
+
+
+def _hash_file(
+    path: Path, known: tuple[str, _FileStat] | None = None
+) -> tuple[str, _FileStat] | None:
+    """SHA-256 and stat of a file, reusing a known hash while the stat matches.
+
+    Returns None if the file does not exist.
+    """
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    file_stat = (stat.st_mtime_ns, stat.st_size)
+    if known is not None and known[1] == file_stat:
+        return known[0], file_stat
+    return hashlib.sha256(path.read_bytes()).hexdigest(), file_stat
+
+
+def _topological_waves(dependencies: dict[str, list[str]]) -> tuple[list[list[str]], list[str]]:
+    """Group modules into waves whose imports are all in earlier waves.
+
+    Returns the waves and the modules left over because they are on or
+    behind an import cycle.
+    """
+    remaining = {name: set(deps) for name, deps in dependencies.items()}
+    waves = []
+    while True:
+        wave = sorted(name for name, deps in remaining.items() if not deps)
+        if not wave:
+            break
+        waves.append(wave)
+        for name in wave:
+            del remaining[name]
+        for deps in remaining.values():
+            deps.difference_update(wave)
+    return waves, sorted(remaining)
+
+
+def _critical_path(report: BuildReport, order: list[str]) -> list[str]:
+    """Most expensive chain of dependent modules, given a topological order."""
+    finish: dict[str, float] = {}
+    previous: dict[str, str | None] = {}
+    for name in order:
+        slowest = max(report.dependencies[name], key=finish.__getitem__, default=None)
+        previous[name] = slowest
+        finish[name] = report.modules[name].total_time + (finish[slowest] if slowest else 0.0)
+
+    if not finish or max(finish.values()) == 0:
+        return []  # Nothing was compiled
+    path = []
+    name: str | None = max(finish, key=finish.__getitem__)
+    while name is not None:
+        path.append(name)
+        name = previous[name]
+    return path[::-1]
+
+
+_parser: MLParser | None = None
+
+
+def _worker_parser() -> MLParser:
+    """Parser shared by the builds run in one process."""
+    global _parser
+    if _parser is None:
+        _parser = MLParser()
+    return _parser
+
+
+def _scan_module(import_paths: list[str], module_path: str) -> tuple[list[str], str | None]:
+    """Imports of a module, resolved with ``ModuleResolver``; and an error, if any."""
+    from mlpy.ml.resolution.resolver import ModuleResolver
+
+    resolver = ModuleResolver(import_paths=import_paths)
+    try:
+        module_info = resolver.resolve_import(module_path.split("."))
+    except Exception as e:
+        return [], str(e)
+    return sorted(module_info.dependencies or []), None
+
+
+def _compile_module(task: tuple[str, str, list[str], bool]) -> ModuleBuildResult:
+    """Parse, analyze and generate one module, writing ``<name>.py`` beside it."""
+    from mlpy.ml.analysis.security_analyzer import SecurityAnalyzer
+    from mlpy.ml.codegen.python_generator import generate_python_code
+
+    module_path, file_path, import_paths, strict_security = task
+    result = ModuleBuildResult(module_path=module_path, file_path=file_path)
+    ml_file = Path(file_path)
+
+    try:
+        start = time.perf_counter()
+        source_code = ml_file.read_text(encoding="utf-8")
+        ast = _worker_parser().parse(source_code, file_path)
+        result.parse_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        issues = SecurityAnalyzer(file_path).analyze(ast)
+        result.analysis_time = time.perf_counter() - start
+
+        for issue in issues:
+            message = f"{issue.error.severity.value}: {issue.error.message}"
+            if strict_security and issue.error.severity.value in _CRITICAL_SEVERITIES:
+                result.errors.append(message)
+            else:
+                result.warnings.append(message)
+        if result.errors:
+            return result
+
+        start = time.perf_counter()
+        python_code, _ = generate_python_code(
+            ast,
+            source_file=file_path,
+            generate_source_maps=False,
+            import_paths=import_paths,
+            allow_current_dir=False,
+            module_output_mode="separate",
+        )
+        output_path = ml_file.with_suffix(".py")
+        output_path.write_text(python_code, encoding="utf-8")
+        result.codegen_time = time.perf_counter() - start
+        result.output_path = str(output_path)
+
+    except Exception as e:
+        result.errors.append(str(e))
+
+    return result
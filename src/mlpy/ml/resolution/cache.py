@@ -1,6 +1,7 @@
 """Module caching system for ML imports."""
 
 import hashlib
+import os
 import time
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Optional
@@ -151,6 +152,18 @@ class ModuleCache:
         for path in to_evict:
             self._evict(path)
 
+    def invalidate_file(self, file_path: str) -> int:
+        """Invalidate modules loaded from a file, and their dependents.
+
+        Returns the number of modules evicted.
+        """
+        target = os.path.abspath(file_path)
+        size = len(self._cache)
+        for module_path, entry in list(self._cache.items()):
+            if entry.file_path and os.path.abspath(entry.file_path) == target:
+                self.invalidate(module_path)
+        return size - len(self._cache)
+
     def clear(self) -> None:
         """Clear all cached modules."""
         self._cache.clear()
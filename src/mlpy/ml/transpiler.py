@@ -1,8 +1,11 @@
 """Main ML transpiler with integrated security analysis."""
 
+import os
 from pathlib import Path
+from typing import Any
 
 from mlpy.ml.analysis.security_analyzer import SecurityAnalyzer
+from mlpy.ml.codegen.ast_generator import GeneratedModule, generate_python_ast
 from mlpy.ml.codegen.python_generator import generate_python_code
 from mlpy.ml.errors.context import ErrorContext
 from mlpy.ml.grammar.ast_nodes import Program
@@ -10,7 +13,10 @@ from mlpy.ml.grammar.parser import MLParser
 from mlpy.runtime.capabilities.context import CapabilityContext
 from mlpy.runtime.capabilities.tokens import CapabilityToken
 from mlpy.runtime.profiling.decorators import profile_parser, profile_security
-from mlpy.runtime.sandbox import MLSandbox, SandboxConfig, SandboxResult
+from mlpy.runtime.profiling.tracing import traced, tracer
+from mlpy.runtime.sandbox import MLSandbox, OutputCallback, SandboxConfig, SandboxResult
+from mlpy.runtime.sandbox.cache import get_compilation_cache
+from mlpy.version import __version__, get_toolchain_hash
 
 
 class MLTranspiler:
@@ -64,10 +70,12 @@ class MLTranspiler:
         """
         try:
             # Parse the source code
-            ast = self.parser.parse(source_code, source_file)
+            with tracer.span("parse", "transpiler"):
+                ast = self.parser.parse(source_code, source_file)
 
             # Run security analysis
-            security_issues = self._analyze_security(ast, source_file)
+            with tracer.span("security", "transpiler"):
+                security_issues = self._analyze_security(ast, source_file)
 
             return ast, security_issues
 
@@ -100,6 +108,7 @@ class MLTranspiler:
         analyzer = SecurityAnalyzer(source_file)
         return analyzer.analyze(ast)
 
+    @traced("transpile", "transpiler")
     def transpile_to_python(
         self,
         source_code: str,
@@ -109,10 +118,14 @@ class MLTranspiler:
         import_paths: list[str] | None = None,
         allow_current_dir: bool = True,
         module_output_mode: str = 'separate',
-        known_imports: list[str] | None = None
+        known_imports: list[str] | None = None,
+        use_cache: bool = True,
     ) -> tuple[str | None, list[ErrorContext], dict | None]:
         """Transpile ML code to Python with security validation.
 
+        Successful results are cached in the global CompilationCache, keyed by
+        the source text and every option that affects the output.
+
         Args:
             source_code: The ML source code to transpile
             source_file: Optional source file path for error reporting
@@ -122,11 +135,34 @@ class MLTranspiler:
             allow_current_dir: Allow imports from current directory
             module_output_mode: 'separate' (create .py files) or 'inline' (embed in main file)
             known_imports: List of module names already imported (for REPL mode)
+            use_cache: If False, bypass the compilation cache
 
         Returns:
             Tuple of (Python code string, List of issues found, source map data)
             Python code will be None if transpilation fails.
         """
+        cache = get_compilation_cache() if use_cache else None
+        cache_key = None
+        if cache is not None:
+            cache_key = cache.get_transpilation_key(
+                source_code,
+                self._cache_options(
+                    source_file,
+                    strict_security,
+                    generate_source_maps,
+                    import_paths,
+                    allow_current_dir,
+                    module_output_mode,
+                    known_imports,
+                ),
+            )
+            with tracer.span("cache_lookup", "transpiler") as span:
+                cached = cache.get_transpilation(cache_key)
+                span.set(hit=cached is not None)
+            if cached is not None:
+                python_code, source_map, issues = cached
+                return python_code, issues, source_map
+
         # Parse and analyze
         ast, security_issues = self.parse_with_security_analysis(source_code, source_file)
 
@@ -145,16 +181,25 @@ class MLTranspiler:
 
         # Generate Python code
         try:
-            python_code, source_map = generate_python_code(
-                ast,
-                source_file=source_file,
-                generate_source_maps=generate_source_maps,
-                import_paths=import_paths,
-                allow_current_dir=allow_current_dir,
-                module_output_mode=module_output_mode,
-                repl_mode=self.repl_mode,  # Pass REPL mode to code generator
-                known_imports=known_imports  # Pass known imports for REPL
-            )
+            dependencies: list[str] = []
+            with tracer.span("codegen", "transpiler"):
+                python_code, source_map = generate_python_code(
+                    ast,
+                    source_file=source_file,
+                    generate_source_maps=generate_source_maps,
+                    import_paths=import_paths,
+                    allow_current_dir=allow_current_dir,
+                    module_output_mode=module_output_mode,
+                    repl_mode=self.repl_mode,  # Pass REPL mode to code generator
+                    known_imports=known_imports,  # Pass known imports for REPL
+                    dependencies=dependencies,
+                )
+
+            if cache is not None and python_code:
+                cache.cache_transpilation(
+                    cache_key, python_code, source_map, security_issues, dependencies
+                )
+
             return python_code, security_issues, source_map
 
         except Exception as e:
@@ -174,6 +219,96 @@ class MLTranspiler:
             error_context = create_error_context(error)
             return None, security_issues + [error_context], None
 
+    @traced("transpile_to_module", "transpiler")
+    def transpile_to_module(
+        self,
+        source_code: str,
+        source_file: str | None = None,
+        strict_security: bool = True,
+        import_paths: list[str] | None = None,
+        allow_current_dir: bool = True,
+        module_output_mode: str = 'separate',
+        known_imports: list[str] | None = None,
+    ) -> tuple[GeneratedModule | None, list[ErrorContext]]:
+        """Transpile ML code to a Python AST with security validation.
+
+        Uses the AST backend: the result compiles straight to a code object
+        whose line numbers are ML line numbers, and renders source only on
+        request. Arguments are as for ``transpile_to_python``; results are
+        not cached.
+
+        Returns:
+            Tuple of (generated module, List of issues found)
+            The module will be None if transpilation fails.
+        """
+        ast, security_issues = self.parse_with_security_analysis(source_code, source_file)
+        if ast is None:
+            return None, security_issues
+
+        critical_issues = [
+            issue for issue in security_issues if issue.error.severity.value in ["critical", "high"]
+        ]
+        if strict_security and critical_issues:
+            return None, security_issues
+
+        try:
+            with tracer.span("codegen", "transpiler", backend="ast"):
+                module = generate_python_ast(
+                    ast,
+                    source_file=source_file,
+                    import_paths=import_paths,
+                    allow_current_dir=allow_current_dir,
+                    module_output_mode=module_output_mode,
+                    repl_mode=self.repl_mode,
+                    known_imports=known_imports,
+                )
+            return module, security_issues
+
+        except Exception as e:
+            from mlpy.ml.errors.context import create_error_context
+            from mlpy.ml.errors.exceptions import MLError
+
+            error = MLError(
+                f"Code generation failed: {str(e)}",
+                suggestions=[
+                    "Check for unsupported ML language features",
+                    "Verify that the AST was parsed correctly",
+                    "Report this issue if it persists",
+                ],
+                context={"error_type": type(e).__name__, "source_file": source_file},
+            )
+            return None, security_issues + [create_error_context(error)]
+
+    def _cache_options(
+        self,
+        source_file: str | None,
+        strict_security: bool,
+        generate_source_maps: bool,
+        import_paths: list[str] | None,
+        allow_current_dir: bool,
+        module_output_mode: str,
+        known_imports: list[str] | None,
+    ) -> dict[str, Any]:
+        """Everything besides the source text that determines transpiler output."""
+        if source_file and not source_file.startswith("<"):
+            source_file = str(Path(source_file).resolve())
+
+        return {
+            "transpiler_version": __version__,
+            "toolchain_hash": get_toolchain_hash(),
+            "source_file": source_file,
+            # Module resolution falls back to the working directory without a file
+            "cwd": os.getcwd() if allow_current_dir and not source_file else None,
+            "strict_security": strict_security,
+            "generate_source_maps": generate_source_maps,
+            "import_paths": list(import_paths or []),
+            "allow_current_dir": allow_current_dir,
+            "module_output_mode": module_output_mode,
+            "known_imports": sorted(known_imports or []),
+            "repl_mode": self.repl_mode,
+            "python_extension_paths": self.python_extension_paths,
+        }
+
     def _generate_python_placeholder(self, ast: Program) -> str:
         """Generate placeholder Python code.
 
@@ -215,38 +350,9 @@ if __name__ == "__main__":
         """
         try:
             path = Path(file_path)
-
-            # Define transpiled Python file alongside source
-            cache_file = path.with_suffix('.py')
-            cache_map_file = path.with_suffix('.py.map')
-
-            # Cache validation: check if cache exists and is newer than source
-            if cache_file.exists():
-                try:
-                    source_mtime = path.stat().st_mtime
-                    cache_mtime = cache_file.stat().st_mtime
-
-                    # Cache is valid if it's newer than source file
-                    if cache_mtime >= source_mtime:
-                        # Load cached Python code
-                        python_code = cache_file.read_text(encoding="utf-8")
-
-                        # Load cached source map if it exists
-                        source_map = None
-                        if generate_source_maps and cache_map_file.exists():
-                            import json
-                            source_map = json.loads(cache_map_file.read_text(encoding="utf-8"))
-
-                        # Return cached result with empty issues list
-                        # (cache implies successful transpilation)
-                        return python_code, [], source_map
-                except (OSError, IOError):
-                    # Cache read failed - ignore and retranspile
-                    pass
-
-            # Cache miss or invalid - proceed with transpilation
             source_code = path.read_text(encoding="utf-8")
 
+            # Repeat transpilations of unchanged source are served by the compilation cache
             python_code, issues, source_map = self.transpile_to_python(
                 source_code,
                 source_file=file_path,
@@ -254,20 +360,6 @@ if __name__ == "__main__":
                 generate_source_maps=generate_source_maps,
             )
 
-            # Write to cache if transpilation succeeded (gracefully handle write failures)
-            if python_code:
-                try:
-                    cache_file.write_text(python_code, encoding="utf-8")
-
-                    # Write cached source map if generated
-                    if source_map and generate_source_maps:
-                        import json
-                        cache_map_file.write_text(json.dumps(source_map, indent=2), encoding="utf-8")
-                except (OSError, IOError, PermissionError):
-                    # Cache write failed - continue without caching
-                    # This is not a fatal error, just means no cache speedup
-                    pass
-
             # Write output file if specified and transpilation succeeded
             if output_path and python_code:
                 output_file = Path(output_path)
@@ -314,6 +406,7 @@ if __name__ == "__main__":
         sandbox_config: SandboxConfig | None = None,
         strict_security: bool = True,
         force_transpile: bool = False,
+        on_output: OutputCallback | None = None,
     ) -> tuple[SandboxResult | None, list[ErrorContext]]:
         """Execute ML code in sandbox environment.
 
@@ -325,67 +418,22 @@ if __name__ == "__main__":
             sandbox_config: Sandbox configuration
             strict_security: If True, fail on any security issues
             force_transpile: If True, bypass cache and force re-transpilation
+            on_output: Called with each stdout/stderr chunk while the program runs
 
         Returns:
             Tuple of (SandboxResult, List of issues found)
             SandboxResult will be None if execution setup fails.
         """
-        # Check for transpiled Python file if source_file is provided (unless force_transpile is True)
-        cached_python = None
-        if source_file and not force_transpile:
-            try:
-                source_path = Path(source_file)
-                py_file = source_path.with_suffix('.py')
-
-                if py_file.exists():
-                    source_mtime = source_path.stat().st_mtime
-                    py_mtime = py_file.stat().st_mtime
-
-                    # Use cached Python if it's newer than source file
-                    if py_mtime >= source_mtime:
-                        cached_python = py_file.read_text(encoding="utf-8")
-            except (OSError, IOError):
-                # Cache read failed - ignore and proceed with parsing
-                pass
-
-        # If we have valid cached Python, use it directly (skip parsing/transpilation)
-        python_code_to_execute = cached_python
-        security_issues_to_return = []
-
-        if not cached_python:
-            # Cache miss - parse and analyze
-            ast, security_issues = self.parse_with_security_analysis(source_code, source_file)
-
-            if ast is None:
-                return None, security_issues
-
-            # Check for critical security issues
-            critical_issues = [
-                issue for issue in security_issues if issue.error.severity.value in ["critical", "high"]
-            ]
-
-            if strict_security and critical_issues:
-                return None, security_issues
-
-            # Transpile to Python
-            from mlpy.ml.codegen.python_generator import generate_python_code
-
-            python_code_to_execute, _ = generate_python_code(
-                ast,
-                source_file=source_file,
-                generate_source_maps=False,
-            )
-            security_issues_to_return = security_issues
-
-            # Write transpiled Python file if source_file provided and transpilation succeeded
-            if source_file and python_code_to_execute:
-                try:
-                    source_path = Path(source_file)
-                    py_file = source_path.with_suffix('.py')
-                    py_file.write_text(python_code_to_execute, encoding="utf-8")
-                except (OSError, IOError, PermissionError):
-                    # Write failed - continue without caching
-                    pass
+        # Transpile (served from the compilation cache unless force_transpile is set)
+        python_code_to_execute, security_issues_to_return, _ = self.transpile_to_python(
+            source_code,
+            source_file=source_file,
+            strict_security=strict_security,
+            use_cache=not force_transpile,
+        )
+
+        if python_code_to_execute is None:
+            return None, security_issues_to_return
 
         # Execute Python code in sandbox
         try:
@@ -403,7 +451,7 @@ if __name__ == "__main__":
                         context.add_capability(token)
 
                 # Execute Python code directly (skip sandbox's internal transpilation)
-                result = sandbox._execute_python_code(python_code_to_execute, context)
+                result = sandbox._execute_python_code(python_code_to_execute, context, on_output)
 
                 return result, security_issues_to_return
 
@@ -422,7 +470,7 @@ if __name__ == "__main__":
             )
 
             error_context = create_error_context(error)
-            return None, security_issues + [error_context]
+            return None, security_issues_to_return + [error_context]
 
     def set_sandbox_config(self, config: SandboxConfig) -> None:
         """Set default sandbox configuration."""
@@ -517,6 +565,7 @@ def execute_ml_code_sandbox(
     sandbox_config: SandboxConfig | None = None,
     strict_security: bool = True,
     force_transpile: bool = False,
+    on_output: OutputCallback | None = None,
 ) -> tuple[SandboxResult | None, list[ErrorContext]]:
     """Execute ML code in sandbox using the global transpiler.
 
@@ -528,12 +577,20 @@ def execute_ml_code_sandbox(
         sandbox_config: Sandbox configuration
         strict_security: If True, fail on any security issues
         force_transpile: If True, bypass cache and force re-transpilation
+        on_output: Called with each stdout/stderr chunk while the program runs
 
     Returns:
         Tuple of (SandboxResult, List of issues found)
     """
     return ml_transpiler.execute_with_sandbox(
-        source_code, source_file, capabilities, context, sandbox_config, strict_security, force_transpile
+        source_code,
+        source_file,
+        capabilities,
+        context,
+        sandbox_config,
+        strict_security,
+        force_transpile,
+        on_output,
     )
 
 
@@ -0,0 +1,248 @@
+"""Nested-span tracing of the mlpy pipeline with Chrome Trace Event export.
+
+Unlike the aggregating ``@profile`` decorators, the tracer keeps every span
+with its thread and process, so one slow request can be followed through
+parse, security analysis, codegen and sandbox execution. Open the exported
+JSON in Perfetto, ``chrome://tracing`` or speedscope.
+
+Tracing is off unless ``MLPY_TRACE`` or ``MLPY_TRACE_FILE`` is set or
+:meth:`Tracer.enable` is called; a disabled :meth:`Tracer.span` returns a
+shared no-op context manager. With ``MLPY_TRACE_FILE`` the trace is written
+to that path at exit.
+"""
+
+import atexit
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_TRUTHY = ("1", "true", "yes", "on")
+
+
+@dataclass
+class TraceEvent:
+    """A completed span; times are ``perf_counter_ns`` values."""
+
+    name: str
+    category: str
+    start_ns: int
+    duration_ns: int
+    pid: int
+    tid: int
+    args: dict[str, Any] = field(default_factory=dict)
+
+    def to_chrome(self) -> dict[str, Any]:
+        """Convert to a Chrome "complete" event (microsecond timestamps)."""
+        event = {
+            "name": self.name,
+            "cat": self.category,
+            "ph": "X",
+            "ts": self.start_ns / 1000,
+            "dur": self.duration_ns / 1000,
+            "pid": self.pid,
+            "tid": self.tid,
+        }
+        if self.args:
+            event["args"] = self.args
+        return event
+
+
+class _NullSpan:
+    """Span returned while tracing is disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        return None
+
+    def set(self, **args: Any) -> None:
+        """Ignore span arguments."""
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Span:
+    """Context manager timing one span on the current thread."""
+
+    __slots__ = ("_tracer", "name", "category", "args", "_start")
+
+    def __init__(self, tracer: "Tracer", name: str, category: str, args: dict[str, Any]):
+        self._tracer = tracer
+        self.name = name
+        self.category = category
+        self.args = args
+        self._start = 0
+
+    def __enter__(self) -> "Span":
+        self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        end = time.perf_counter_ns()
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        self._tracer.record(self.name, self._start, end - self._start, self.category, **self.args)
+
+    def set(self, **args: Any) -> None:
+        """Attach arguments discovered while the span is open."""
+        self.args.update(args)
+
+
+class Tracer:
+    """Collects spans from every thread into a bounded buffer."""
+
+    def __init__(self, max_events: int = 100_000, enabled: bool | None = None) -> None:
+        """Initialize the tracer.
+
+        Args:
+            max_events: Oldest spans are dropped beyond this many
+            enabled: Defaults to the ``MLPY_TRACE`` and ``MLPY_TRACE_FILE``
+                environment variables
+        """
+        if enabled is None:
+            enabled = os.environ.get("MLPY_TRACE", "0").lower() in _TRUTHY or bool(
+                os.environ.get("MLPY_TRACE_FILE")
+            )
+        self._enabled = enabled
+        self._events: deque[TraceEvent] = deque(maxlen=max_events)
+        self._thread_names: dict[tuple[int, int], str] = {}
+        self._process_names: dict[int, str] = {}
+
+    def enable(self) -> None:
+        """Enable tracing."""
+        self._enabled = True
+
+    def disable(self) -> None:
+        """Disable tracing."""
+        self._enabled = False
+
+    def is_enabled(self) -> bool:
+        """Check if tracing is enabled."""
+        return self._enabled
+
+    def span(self, name: str, category: str = "mlpy", **args: Any) -> Span | _NullSpan:
+        """Time a block: ``with tracer.span("parse", "transpiler"): ...``."""
+        if not self._enabled:
+            return _NULL_SPAN
+        return Span(self, name, category, args)
+
+    def record(
+        self,
+        name: str,
+        start_ns: int,
+        duration_ns: int,
+        category: str = "mlpy",
+        pid: int | None = None,
+        tid: int | None = None,
+        **args: Any,
+    ) -> None:
+        """Record a span timed elsewhere, e.g. inside a sandbox child process.
+
+        ``start_ns`` must be on the ``perf_counter_ns`` clock, which is
+        shared by all processes on the host where it is CLOCK_MONOTONIC.
+        """
+        if not self._enabled:
+            return
+        if pid is None:
+            pid = os.getpid()
+        if tid is None:
+            thread = threading.current_thread()
+            tid = thread.native_id or thread.ident or 0
+            self._thread_names.setdefault((pid, tid), thread.name)
+        self._events.append(TraceEvent(name, category, start_ns, duration_ns, pid, tid, args))
+
+    def set_process_name(self, pid: int, name: str) -> None:
+        """Label a process, such as a sandbox child, in the exported trace."""
+        self._process_names[pid] = name
+
+    def events(self) -> list[TraceEvent]:
+        """Return recorded spans in completion order."""
+        return list(self._events)
+
+    def clear(self) -> None:
+        """Drop all recorded spans."""
+        self._events.clear()
+        self._thread_names.clear()
+        self._process_names.clear()
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        """Build a Chrome Trace Event Format document."""
+        events = self.events()
+        process_names = {os.getpid(): "mlpy", **self._process_names}
+        metadata = [
+            {"name": "process_name", "ph": "M", "pid": pid, "tid": 0, "args": {"name": name}}
+            for pid, name in process_names.items()
+            if any(event.pid == pid for event in events)
+        ]
+        metadata.extend(
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+            for (pid, tid), name in list(self._thread_names.items())
+        )
+        return {
+            "traceEvents": metadata + [event.to_chrome() for event in events],
+            "displayTimeUnit": "ms",
+        }
+
+    def export_chrome_trace(self, path: str | Path) -> Path:
+        """Write the trace as JSON for Perfetto, chrome://tracing or speedscope."""
+        path = Path(path)
+        path.write_text(json.dumps(self.to_chrome_trace(), default=str), encoding="utf-8")
+        return path
+
+
+# Global tracer instance
+tracer = Tracer()
+
+
+def trace_span(name: str, category: str = "mlpy", **args: Any) -> Span | _NullSpan:
+    """Time a block with the global tracer."""
+    return tracer.span(name, category, **args)
+
+
+def traced(name: str | None = None, category: str = "mlpy") -> Callable[[F], F]:
+    """Decorator recording each call as a span while tracing is enabled.
+
+    Args:
+        name: Span name, defaulting to the function's qualified name
+        category: Span category
+
+    Returns:
+        Decorated function
+    """
+
+    def decorator(func: F) -> F:
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not tracer._enabled:
+                return func(*args, **kwargs)
+            with Span(tracer, span_name, category, {}):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def _export_at_exit() -> None:
+    """Write the trace to ``MLPY_TRACE_FILE`` if spans were recorded."""
+    path = os.environ.get("MLPY_TRACE_FILE")
+    if path and tracer.events():
+        tracer.export_chrome_trace(path)
+
+
+atexit.register(_export_at_exit)
@@ -1,12 +1,19 @@
 """Subprocess-based sandbox execution for secure ML code running."""
 
+from .artifact_store import ArtifactStore
+from .async_sandbox import AsyncMLSandbox
 from .cache import CompilationCache, SandboxCache
 from .context_serializer import CapabilityContextSerializer
+from .fork_server import ForkServer, ForkServerError
+from .output_stream import OutputCallback, OutputChunk, OutputStream
+from .pool import PoolConfig, SandboxPool, SandboxPoolError, shutdown_sandbox_pools
 from .resource_monitor import ResourceLimits, ResourceMonitor
+from .result_channel import OpaqueValue, ResultChannel, ResultChannelError
 from .sandbox import MLSandbox, SandboxConfig, SandboxError, SandboxResult
 
 __all__ = [
     "MLSandbox",
+    "AsyncMLSandbox",
     "SandboxConfig",
     "SandboxResult",
     "SandboxError",
@@ -15,4 +22,17 @@ __all__ = [
     "CapabilityContextSerializer",
     "SandboxCache",
     "CompilationCache",
+    "ArtifactStore",
+    "SandboxPool",
+    "PoolConfig",
+    "SandboxPoolError",
+    "shutdown_sandbox_pools",
+    "ForkServer",
+    "ForkServerError",
+    "ResultChannel",
+    "ResultChannelError",
+    "OpaqueValue",
+    "OutputChunk",
+    "OutputStream",
+    "OutputCallback",
 ]
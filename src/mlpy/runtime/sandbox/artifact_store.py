@@ -0,0 +1,299 @@
+"""Persistent on-disk store for compiled artifacts shared across processes.
+
+Each artifact lives in its own file named after its content-addressed key, so
+concurrent ``mlpy`` processes share results without a lock or a shared index:
+
+* Writes go to a temp file in the same directory and are ``os.replace``-d
+  into place, so readers see either nothing or a complete artifact.
+* Reads touch the file's mtime, which doubles as the LRU timestamp.
+* When the store grows past its size cap, the least recently used files
+  are deleted. Two processes evicting at once only race on ``unlink``, and
+  a missing file is simply a cache miss.
+
+Each file starts with the format version and the toolchain hash of the
+mlpy build that wrote it; artifacts from any other build are cache misses.
+
+Artifacts are pickled, so anyone able to write to the store could run code
+in every process that reads it. The directory is created with mode 0700, and
+a store whose directory already exists is only used if it is a real
+directory owned by the current user with mode 0700; otherwise every lookup
+misses and nothing is written.
+"""
+
+import os
+import pickle
+import re
+import stat
+import tempfile
+import threading
+import warnings
+from pathlib import Path
+from typing import Any
+
+from mlpy.version import get_toolchain_hash
+
+DEFAULT_MAX_SIZE = 256 * 1024 * 1024  # bytes
+
+# Fraction of the cap written between eviction scans, and the level evicted down to
+_SCAN_INTERVAL = 0.05
+_LOW_WATERMARK = 0.9
+
+_KEY_PATTERN = re.compile(r"[A-Za-z0-9_.-]+")
+_FORMAT_VERSION = 2
+
+
+def default_store_dir() -> Path:
+    """Artifact directory: ``$MLPY_CACHE_DIR``, else ``$XDG_CACHE_HOME/mlpy``."""
+    override = os.environ.get("MLPY_CACHE_DIR")
+    if override:
+        return Path(override)
+
+    cache_home = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(cache_home) / "mlpy"
+
+
+def private_dir_problem(directory: Path) -> str | None:
+    """Why ``directory`` is not private to the current user, or None if it is.
+
+    Raises:
+        FileNotFoundError: If the directory does not exist
+    """
+    if not hasattr(os, "getuid"):
+        return None  # No POSIX ownership to check
+    info = os.lstat(directory)
+    if not stat.S_ISDIR(info.st_mode):
+        return f"{directory} is not a directory"
+    if info.st_uid != os.getuid():
+        return f"{directory} is owned by uid {info.st_uid}, not by this user"
+    if stat.S_IMODE(info.st_mode) != 0o700:
+        return f"{directory} has mode {stat.S_IMODE(info.st_mode):o}; expected 700"
+    return None
+
+
+class ArtifactStore:
+    """Content-addressed artifact files with a size-capped LRU."""
+
+    def __init__(
+        self,
+        root: str | Path | None = None,
+        max_size: int = DEFAULT_MAX_SIZE,
+        toolchain: str | None = None,
+    ):
+        """Initialize the store; the directory is created on first write.
+
+        Args:
+            root: Store directory (default: ``default_store_dir()``)
+            max_size: Size cap in bytes
+            toolchain: Build identifier written to and checked in every artifact
+                header (default: ``get_toolchain_hash()``)
+        """
+        self.root = Path(root) if root is not None else default_store_dir()
+        self.objects_dir = self.root / "artifacts"
+        self.max_size = max_size
+        self.toolchain = toolchain if toolchain is not None else get_toolchain_hash()
+        self.refused: str | None = None  # Why the directory is not trusted
+        self._root_private: bool | None = None
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._writes = 0
+        self._evicted = 0
+        self._written_since_scan: int | None = None  # None forces a scan on the first write
+
+    def _path_for(self, key: str) -> Path:
+        """File path for a key, sharded by its last two characters."""
+        if not _KEY_PATTERN.fullmatch(key):
+            raise ValueError(f"Invalid artifact key: {key!r}")
+        return self.objects_dir / key[-2:] / key
+
+    def _root_is_private(self) -> bool:
+        """Check once that the store directory is safe to unpickle from.
+
+        A missing directory is not remembered, so it is checked again once
+        ``put`` has created it.
+        """
+        if self._root_private is None:
+            try:
+                problem = private_dir_problem(self.root)
+            except FileNotFoundError:
+                return True  # Nothing stored yet
+            except OSError as e:
+                problem = str(e)
+            if problem is not None:
+                warnings.warn(
+                    f"Not using the mlpy artifact store: {problem}", RuntimeWarning, stacklevel=3
+                )
+            self.refused = problem
+            self._root_private = problem is None
+        return self._root_private
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Load an artifact, or return ``default`` if it is missing or unreadable."""
+        path = self._path_for(key)
+        if not self._root_is_private():
+            with self._lock:
+                self._misses += 1
+            return default
+
+        try:
+            with open(path, "rb") as f:
+                version, toolchain, value = pickle.load(f)
+            if version != _FORMAT_VERSION:
+                raise ValueError(f"Unsupported artifact format {version}")
+        except FileNotFoundError:
+            with self._lock:
+                self._misses += 1
+            return default
+        except (OSError, EOFError, ValueError, TypeError, pickle.UnpicklingError, AttributeError):
+            # Corrupt or written by an incompatible version
+            self._unlink(path)
+            with self._lock:
+                self._misses += 1
+            return default
+
+        if toolchain != self.toolchain:
+            # Written by another mlpy build sharing the directory; leave it to that build
+            with self._lock:
+                self._misses += 1
+            return default
+
+        try:
+            os.utime(path)  # Mark as recently used
+        except OSError:
+            pass
+
+        with self._lock:
+            self._hits += 1
+        return value
+
+    def put(self, key: str, value: Any) -> bool:
+        """Atomically write an artifact. Returns False if it could not be stored."""
+        path = self._path_for(key)
+
+        try:
+            data = pickle.dumps(
+                (_FORMAT_VERSION, self.toolchain, value), protocol=pickle.HIGHEST_PROTOCOL
+            )
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return False
+
+        if len(data) > self.max_size:
+            return False
+
+        try:
+            self.root.mkdir(mode=0o700, parents=True, exist_ok=True)
+            if not self._root_is_private():
+                return False
+            path.parent.mkdir(parents=True, exist_ok=True)
+
+            fd, tmp_path = tempfile.mkstemp(prefix=".tmp_", dir=path.parent)
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+            except BaseException:
+                self._unlink(Path(tmp_path))
+                raise
+        except OSError:
+            return False  # Read-only or full disk: run uncached
+
+        with self._lock:
+            self._writes += 1
+            if self._written_since_scan is not None:
+                self._written_since_scan += len(data)
+            needs_scan = (
+                self._written_since_scan is None
+                or self._written_since_scan >= self.max_size * _SCAN_INTERVAL
+            )
+            if needs_scan:
+                self._written_since_scan = 0
+
+        if needs_scan:
+            self.evict()
+
+        return True
+
+    def remove(self, key: str) -> bool:
+        """Delete one artifact."""
+        return self._unlink(self._path_for(key))
+
+    def _entries(self) -> list[tuple[str, os.stat_result]]:
+        """Stat every artifact file; returns (path, stat) pairs."""
+        entries = []
+
+        try:
+            shards = list(os.scandir(self.objects_dir))
+        except OSError:
+            return entries
+
+        for shard in shards:
+            try:
+                files = list(os.scandir(shard.path))
+            except OSError:
+                continue
+            for entry in files:
+                if entry.name.startswith(".tmp_"):
+                    continue
+                try:
+                    entries.append((entry.path, entry.stat()))
+                except OSError:
+                    continue  # Evicted by another process
+
+        return entries
+
+    def evict(self) -> int:
+        """Delete least recently used artifacts until the store is under its cap."""
+        entries = self._entries()
+        total = sum(stat.st_size for _, stat in entries)
+        if total <= self.max_size:
+            return 0
+
+        target = self.max_size * _LOW_WATERMARK
+        evicted = 0
+
+        for path, stat in sorted(entries, key=lambda item: item[1].st_mtime):
+            if total <= target:
+                break
+            if self._unlink(Path(path)):
+                evicted += 1
+            total -= stat.st_size
+
+        with self._lock:
+            self._evicted += evicted
+        return evicted
+
+    def clear(self) -> int:
+        """Delete every artifact."""
+        removed = 0
+        for path, _ in self._entries():
+            if self._unlink(Path(path)):
+                removed += 1
+        return removed
+
+    @staticmethod
+    def _unlink(path: Path) -> bool:
+        """Remove a file, ignoring races with other processes."""
+        try:
+            path.unlink()
+            return True
+        except OSError:
+            return False
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get store statistics (scans the directory)."""
+        entries = self._entries()
+
+        with self._lock:
+            total_requests = self._hits + self._misses
+            return {
+                "root": str(self.root),
+                "refused": self.refused,
+                "entries": len(entries),
+                "total_size_bytes": sum(stat.st_size for _, stat in entries),
+                "max_size_bytes": self.max_size,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / total_requests if total_requests > 0 else 0.0,
+                "writes": self._writes,
+                "evicted": self._evicted,
+            }
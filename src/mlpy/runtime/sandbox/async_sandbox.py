@@ -0,0 +1,249 @@
+"""asyncio-native sandbox execution.
+
+``MLSandbox`` blocks a thread per run on ``communicate()`` and starts a
+``ResourceMonitor`` polling thread per process, so concurrency is bounded by
+threads rather than CPU. ``AsyncMLSandbox`` runs the same sandboxed script
+with ``asyncio.create_subprocess_exec``: pipes are read by the event loop,
+timeouts are ``asyncio.wait_for`` deadlines, and resource usage is sampled
+by the process-wide ``ResourceSupervisor`` thread. One event loop can
+supervise thousands of concurrent runs.
+
+Transpilation is CPU-bound and usually served from the compilation cache, so
+it runs on one shared worker thread rather than a thread per run. The runner
+script is a small file write and is prepared on the loop itself.
+"""
+
+import asyncio
+import codecs
+import os
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from ..capabilities.context import CapabilityContext
+from ..capabilities.tokens import CapabilityToken
+from .output_stream import OutputCallback, OutputCapture, OutputChunk
+from .resource_monitor import ResourceMonitor, ResourceMonitorError
+from .result_channel import ResultChannel
+from .sandbox import MLSandbox, SandboxConfig, SandboxResult, SandboxTimeoutError
+
+_READ_SIZE = 65536
+
+_transpile_executor: ThreadPoolExecutor | None = None
+_transpile_executor_lock = threading.Lock()
+
+
+def _get_transpile_executor() -> ThreadPoolExecutor:
+    """Return the process-wide single-thread executor used for transpilation."""
+    global _transpile_executor
+    with _transpile_executor_lock:
+        if _transpile_executor is None:
+            _transpile_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="mlpy-transpile"
+            )
+        return _transpile_executor
+
+
+class AsyncMLSandbox:
+    """Sandbox whose runs are supervised by the event loop instead of threads.
+
+    Example:
+        sandbox = AsyncMLSandbox(SandboxConfig(cpu_timeout=5))
+        results = await asyncio.gather(*(sandbox.execute(code) for code in programs))
+    """
+
+    def __init__(self, config: SandboxConfig | None = None, max_concurrency: int = 0):
+        """Initialize the sandbox.
+
+        Args:
+            config: Sandbox configuration shared by every run
+            max_concurrency: Maximum simultaneous processes (0 for unlimited)
+        """
+        self.config = config or SandboxConfig()
+        self.max_concurrency = max_concurrency
+        self.active_runs = 0
+        self._sandbox = MLSandbox(self.config)
+        self._semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency > 0 else None
+
+    async def execute(
+        self,
+        ml_code: str,
+        capabilities: list[CapabilityToken] | None = None,
+        context: CapabilityContext | None = None,
+        on_output: OutputCallback | None = None,
+    ) -> SandboxResult:
+        """Execute ML code in a sandboxed subprocess without blocking the loop.
+
+        ``on_output`` is called from the event loop with each stdout/stderr
+        chunk while the program runs.
+        """
+        start_time = time.time()
+
+        try:
+            context = self._sandbox._prepare_context(capabilities, context)
+            python_code = await asyncio.get_running_loop().run_in_executor(
+                _get_transpile_executor(), self._sandbox._transpile_ml_code, ml_code
+            )
+
+            if self._semaphore is not None:
+                async with self._semaphore:
+                    result = await self._execute_python_code(python_code, context, on_output)
+            else:
+                result = await self._execute_python_code(python_code, context, on_output)
+
+            result.execution_time = time.time() - start_time
+            return result
+
+        except SandboxTimeoutError as e:
+            return SandboxResult(
+                success=False, error=e, execution_time=time.time() - start_time, stderr=str(e)
+            )
+
+        except Exception as e:
+            return SandboxResult(
+                success=False,
+                error=e,
+                execution_time=time.time() - start_time,
+                stderr=str(e),
+                error_traceback=self._sandbox._get_traceback(),
+            )
+
+    async def _execute_python_code(
+        self,
+        python_code: str,
+        context: CapabilityContext | None,
+        on_output: OutputCallback | None,
+    ) -> SandboxResult:
+        """Run transpiled Python in a fresh subprocess with its own temp dir."""
+        with tempfile.TemporaryDirectory(prefix="mlpy_async_") as temp_dir:
+            script_path = self._sandbox._create_execution_script(
+                python_code, context, Path(temp_dir)
+            )
+
+            env = self._sandbox._prepare_environment()
+            channel = ResultChannel(temp_dir) if os.name != "nt" else None
+            if channel:
+                env.update(channel.child_env())
+            if on_output is not None:
+                env["PYTHONUNBUFFERED"] = "1"
+
+            try:
+                return await self._run_process(script_path, env, channel, on_output)
+            finally:
+                if channel:
+                    channel.close()
+
+    async def _run_process(
+        self,
+        script_path: Path,
+        env: dict[str, str],
+        channel: ResultChannel | None,
+        on_output: OutputCallback | None,
+    ) -> SandboxResult:
+        """Spawn the runner script and supervise it until it exits."""
+        sandbox = self._sandbox
+        process = await asyncio.create_subprocess_exec(
+            self.config.python_executable or sys.executable,
+            str(script_path),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            env=env,
+            cwd=str(script_path.parent),
+            preexec_fn=sandbox._setup_subprocess_limits if os.name != "nt" else None,
+            pass_fds=(channel.fd,) if channel else (),
+        )
+
+        captures = sandbox._new_output_captures()
+        timeout = self.config.cpu_timeout
+        monitor = ResourceMonitor()
+        monitor.set_limits(sandbox._parse_resource_limits())
+        self.active_runs += 1
+
+        try:
+            monitor.start_monitoring(process.pid)
+        except ResourceMonitorError:
+            pass  # Already exited
+
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(
+                    self._pump(process.stdout, captures[0], on_output),
+                    self._pump(process.stderr, captures[1], on_output),
+                    process.wait(),
+                ),
+                timeout=timeout if timeout > 0 else None,
+            )
+
+        except TimeoutError:
+            for capture in captures:
+                capture.close()
+                if capture.spill_path:
+                    os.unlink(capture.spill_path)
+            raise SandboxTimeoutError(f"Execution timed out after {timeout} seconds") from None
+
+        finally:
+            self.active_runs -= 1
+            monitor.stop_monitoring()
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+
+        for capture in captures:
+            capture.close()
+        output = sandbox._output_fields(captures)
+        resource_usage = monitor.get_usage()
+
+        error = None
+        payload = channel.read_payload() if channel else None
+        if payload is not None:
+            return_value = sandbox._result_from_payload(payload)
+            # The event loop's child watcher reaps the process, so its wait4
+            # rusage is out of reach; the runner reports its own CPU time
+            metadata = payload.get("metadata") or {}
+            resource_usage["cpu_time"] = metadata.get("cpu_time", 0.0)
+        elif channel is None:
+            return_value = sandbox._parse_execution_result(output["stdout"])
+        else:
+            return_value = None
+            error = sandbox._missing_result_error(process.returncode)
+
+        return SandboxResult(
+            success=(process.returncode == 0 and error is None),
+            return_value=return_value,
+            error=error,
+            exit_code=process.returncode,
+            memory_usage=resource_usage.get("peak_memory", 0),
+            cpu_usage=resource_usage.get("average_cpu", 0.0),
+            cpu_time=resource_usage.get("cpu_time", 0.0),
+            **output,
+        )
+
+    @staticmethod
+    async def _pump(
+        stream: asyncio.StreamReader,
+        capture: OutputCapture,
+        on_output: OutputCallback | None,
+    ) -> None:
+        """Read one pipe until EOF into its capture, reporting decoded chunks."""
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+        while True:
+            data = await stream.read(_READ_SIZE)
+            text = decoder.decode(data, final=not data)
+            if data:
+                capture.write(data)
+            if text and on_output is not None:
+                on_output(OutputChunk(capture.name, text))
+            if not data:
+                break
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get sandbox statistics."""
+        return {
+            "active_runs": self.active_runs,
+            "max_concurrency": self.max_concurrency,
+        }
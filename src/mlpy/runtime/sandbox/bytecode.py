@@ -0,0 +1,50 @@
+"""Marshalled code objects for sandbox execution.
+
+The host compiles transpiled Python once and ships the ``marshal``-ed code
+object to sandbox processes, which ``exec`` it without compiling again.
+Marshal data is only valid for the interpreter version that wrote it, so the
+payload starts with ``importlib.util.MAGIC_NUMBER`` (as ``.pyc`` files do) and
+the loader refuses anything written by a different interpreter.
+"""
+
+import importlib.util
+import marshal
+import sys
+from types import CodeType
+
+# Filename compiled into sandbox code objects (shown in tracebacks)
+SANDBOX_FILENAME = "<sandbox>"
+
+# Distinguishes cache entries written by different interpreters
+BYTECODE_TAG = (
+    f"{sys.implementation.cache_tag or sys.implementation.name}"
+    f"_{importlib.util.MAGIC_NUMBER.hex()}"
+)
+
+
+def compile_to_bytecode(python_code: str, filename: str = SANDBOX_FILENAME) -> bytes:
+    """Compile source and return the magic-prefixed marshalled code object.
+
+    Raises:
+        SyntaxError: If the source does not compile
+        ValueError: If the source contains null bytes
+    """
+    code = compile(python_code, filename, "exec", dont_inherit=True)
+    return importlib.util.MAGIC_NUMBER + marshal.dumps(code)
+
+
+def load_bytecode(data: bytes) -> CodeType | None:
+    """Load a code object from ``compile_to_bytecode`` output.
+
+    Returns None if the data was written by a different interpreter version.
+    """
+    magic = importlib.util.MAGIC_NUMBER
+    if data[: len(magic)] != magic:
+        return None
+
+    try:
+        code = marshal.loads(memoryview(data)[len(magic) :])
+    except (EOFError, ValueError, TypeError):
+        return None
+
+    return code if isinstance(code, CodeType) else None
@@ -2,6 +2,7 @@
 
 import hashlib
 import json
+import os
 import pickle
 import threading
 import time
@@ -12,6 +13,8 @@ from typing import Any
 
 from ..capabilities.context import CapabilityContext
 from ..capabilities.tokens import CapabilityToken
+from .artifact_store import DEFAULT_MAX_SIZE, ArtifactStore
+from .bytecode import BYTECODE_TAG, compile_to_bytecode
 
 
 @dataclass
@@ -157,10 +160,20 @@ class SandboxCache:
 
 
 class CompilationCache(SandboxCache):
-    """Cache for ML compilation results."""
+    """Cache for ML compilation results.
 
-    def __init__(self, max_size: int = 500, default_ttl: float = 1800.0):  # 30 minutes
+    Transpilations are also written through to an optional on-disk
+    ``ArtifactStore`` so other processes can reuse them.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 500,
+        default_ttl: float = 1800.0,  # 30 minutes
+        store: ArtifactStore | None = None,
+    ):
         super().__init__(max_size, default_ttl)
+        self.store = store
 
     def get_compilation_key(
         self, ml_code: str, capabilities: list[CapabilityToken] | None = None
@@ -227,6 +240,128 @@ class CompilationCache(SandboxCache):
 
         return result["python_code"], result.get("source_map")
 
+    def get_transpilation_key(self, source_code: str, options: dict[str, Any]) -> str:
+        """Generate a content-addressed key for a transpilation.
+
+        ``options`` holds everything besides the source text that affects the
+        output (transpiler version, grammar hash, security mode, import paths).
+        """
+        digest = hashlib.sha256(source_code.encode("utf-8"))
+        digest.update(json.dumps(options, sort_keys=True, default=str).encode("utf-8"))
+        return f"transpile_{digest.hexdigest()}"
+
+    def cache_transpilation(
+        self,
+        key: str,
+        python_code: str,
+        source_map: dict[str, Any] | None,
+        issues: list[Any],
+        dependencies: list[str] | None = None,
+    ) -> None:
+        """Cache a transpilation result under a key from ``get_transpilation_key``.
+
+        ``dependencies`` are files the generated code was built from besides
+        the source itself (user modules); the entry is invalidated when any
+        of them changes.
+        """
+        value = {
+            "python_code": python_code,
+            "source_map": source_map,
+            "issues": list(issues),
+            "dependencies": {path: _hash_file(path) for path in dependencies or []},
+        }
+
+        metadata = {
+            "python_code_length": len(python_code),
+            "has_source_map": source_map is not None,
+            "issue_count": len(issues),
+        }
+
+        self.put(key, value, metadata=metadata)
+        if self.store is not None:
+            self.store.put(key, value)
+
+    def get_transpilation(
+        self, key: str
+    ) -> tuple[str, dict[str, Any] | None, list[Any]] | None:
+        """Get a cached transpilation as (python_code, source_map, issues)."""
+        with self._lock:
+            value = self.get(key)
+            from_memory = value is not None
+
+        if value is None and self.store is not None:
+            value = self.store.get(key)
+
+        if value is None:
+            return None
+
+        for path, digest in value["dependencies"].items():
+            if _hash_file(path) != digest:
+                # A user module changed since this entry was cached
+                with self._lock:
+                    self.remove(key)
+                    if from_memory:
+                        self._hits -= 1
+                        self._misses += 1
+                if self.store is not None:
+                    self.store.remove(key)
+                return None
+
+        if not from_memory:
+            self.put(key, value)
+
+        return value["python_code"], value["source_map"], list(value["issues"])
+
+    def get_bytecode(self, python_code: str) -> bytes | None:
+        """Get the marshalled code object for transpiled Python, compiling it once.
+
+        Entries are content-addressed on the Python source and tagged with
+        the interpreter's cache tag and magic number, so they sit next to the
+        transpilation artifact without clashing across Python versions.
+        Returns None if the code does not compile.
+        """
+        digest = hashlib.sha256(python_code.encode("utf-8")).hexdigest()
+        key = f"bytecode_{digest}_{BYTECODE_TAG}"
+
+        data = self.get(key)
+        if data is not None:
+            return data
+
+        if self.store is not None:
+            data = self.store.get(key)
+
+        if data is None:
+            try:
+                data = compile_to_bytecode(python_code)
+            except (SyntaxError, ValueError):
+                return None  # The sandbox reports the error when it compiles the source
+            if self.store is not None:
+                self.store.put(key, data)
+
+        self.put(key, data, metadata={"python_code_length": len(python_code)})
+        return data
+
+    def clear(self) -> None:
+        """Clear memory entries and the on-disk artifact store."""
+        super().clear()
+        if self.store is not None:
+            self.store.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics, including the artifact store's."""
+        stats = super().get_stats()
+        if self.store is not None:
+            stats["artifact_store"] = self.store.get_stats()
+        return stats
+
+
+def _hash_file(path: str) -> str | None:
+    """SHA-256 of a file's contents, or None if it cannot be read."""
+    try:
+        return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+    except OSError:
+        return None
+
 
 class ExecutionCache(SandboxCache):
     """Cache for sandbox execution results."""
@@ -400,13 +535,29 @@ _execution_cache: ExecutionCache | None = None
 _cache_lock = threading.Lock()
 
 
+def get_artifact_store() -> ArtifactStore | None:
+    """Create the shared on-disk artifact store from the environment.
+
+    ``MLPY_CACHE_DIR`` overrides the location and ``MLPY_CACHE_MAX_SIZE``
+    (e.g. "512MB") the size cap; a cap of 0 disables the store.
+    """
+    from .sandbox import parse_size
+
+    max_size_env = os.environ.get("MLPY_CACHE_MAX_SIZE")
+    max_size = parse_size(max_size_env) if max_size_env else DEFAULT_MAX_SIZE
+    if max_size <= 0:
+        return None
+
+    return ArtifactStore(max_size=max_size)
+
+
 def get_compilation_cache() -> CompilationCache:
     """Get global compilation cache."""
     global _compilation_cache
     if _compilation_cache is None:
         with _cache_lock:
             if _compilation_cache is None:
-                _compilation_cache = CompilationCache()
+                _compilation_cache = CompilationCache(store=get_artifact_store())
     return _compilation_cache
 
 
@@ -422,17 +573,23 @@ def get_execution_cache() -> ExecutionCache:
 
 def clear_all_caches() -> None:
     """Clear all global caches."""
+    from mlpy.ml.grammar.parse_cache import get_parse_cache
+
     global _compilation_cache, _execution_cache
     with _cache_lock:
         if _compilation_cache:
             _compilation_cache.clear()
         if _execution_cache:
             _execution_cache.clear()
+    get_parse_cache().clear()
 
 
 def get_cache_stats() -> dict[str, Any]:
     """Get statistics for all caches."""
+    from mlpy.ml.grammar.parse_cache import get_parse_cache
+
     return {
         "compilation_cache": get_compilation_cache().get_stats(),
         "execution_cache": get_execution_cache().get_stats(),
+        "parse_cache": get_parse_cache().get_stats(),
     }
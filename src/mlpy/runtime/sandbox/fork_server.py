@@ -0,0 +1,163 @@
+"""Fork-server sandbox execution for programs that run many times.
+
+A ``ForkServer`` owns one worker process per transpiled program. The worker
+runs the program's prelude (stdlib and user-module imports, top-level function
+definitions) once, then forks a fresh child from that snapshot for every
+invocation. Each child gets the sandbox rlimits and its own capability
+context, so per-invocation cost drops from "interpreter start + import +
+define" to "fork + call".
+
+Unix only: ``os.fork`` is not available on Windows.
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+from typing import Any
+
+from .resource_monitor import ResourceLimits
+from .worker import WorkerProtocolError, recv_message, send_message
+
+
+class ForkServerError(Exception):
+    """Exception raised when a fork server cannot start or has died."""
+
+    pass
+
+
+class ForkServer:
+    """Worker process holding a post-prelude snapshot of one program."""
+
+    def __init__(
+        self,
+        python_code: str,
+        limits: ResourceLimits,
+        env: dict[str, str],
+        python_executable: str | None = None,
+        startup_timeout: float = 30.0,
+    ):
+        """Start the server and run the program prelude.
+
+        Raises:
+            ForkServerError: If the platform lacks ``os.fork`` or the prelude failed
+        """
+        if not hasattr(os, "fork"):
+            raise ForkServerError("Fork-server mode requires os.fork (Unix only)")
+
+        self.limits = limits
+        self.invocations = 0
+        self._lock = threading.Lock()
+        self._temp_dir = tempfile.TemporaryDirectory(prefix="mlpy_forkserver_")
+
+        self.process = subprocess.Popen(
+            [
+                python_executable or sys.executable,
+                "-m",
+                "mlpy.runtime.sandbox.worker",
+                "--fork-server",
+            ],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            bufsize=0,
+            env=env,
+            cwd=self._temp_dir.name,
+        )
+
+        try:
+            send_message(
+                self.process.stdin,
+                {
+                    "code": python_code,
+                    "limits": {
+                        "memory_limit": limits.memory_limit,
+                        "cpu_timeout": limits.cpu_timeout,
+                        "file_size_limit": limits.file_size_limit,
+                    },
+                },
+            )
+            response = recv_message(self.process.stdout, timeout=startup_timeout)
+        except (TimeoutError, WorkerProtocolError, OSError) as e:
+            self.close()
+            raise ForkServerError(f"Fork server failed to start: {e}") from e
+
+        if not response.get("ready"):
+            self.close()
+            error = response.get("error", "Unknown error")
+            detail = response.get("traceback", "")
+            raise ForkServerError(f"Program prelude failed: {error}\n{detail}".rstrip())
+
+    @property
+    def pid(self) -> int:
+        """Process ID of the server."""
+        return self.process.pid
+
+    def is_alive(self) -> bool:
+        """Check whether the server process is still running."""
+        return self.process.poll() is None
+
+    def invoke(
+        self, inputs: dict[str, Any] | None = None, context_data: str | None = None
+    ) -> dict[str, Any]:
+        """Fork one invocation and return its response frame.
+
+        Args:
+            inputs: Variables bound as globals before the program body runs
+            context_data: Serialized capability context for the child
+
+        Raises:
+            ForkServerError: If the server itself is gone
+        """
+        # The server enforces the per-invocation timeout; allow it time to report
+        timeout = self.limits.cpu_timeout + 5.0 if self.limits.cpu_timeout > 0 else None
+
+        with self._lock:
+            self.invocations += 1
+            try:
+                send_message(self.process.stdin, {"inputs": inputs or {}, "context": context_data})
+                return recv_message(self.process.stdout, timeout=timeout)
+            except (TimeoutError, WorkerProtocolError, OSError) as e:
+                self.close()
+                raise ForkServerError(f"Fork server {self.pid} stopped responding: {e}") from e
+
+    def close(self, timeout: float = 2.0) -> None:
+        """Stop the server process."""
+        if self.is_alive():
+            try:
+                send_message(self.process.stdin, {"shutdown": True})
+                self.process.wait(timeout=timeout)
+            except (subprocess.TimeoutExpired, OSError):
+                try:
+                    self.process.kill()
+                    self.process.wait(timeout=timeout)
+                except (subprocess.TimeoutExpired, OSError):
+                    pass  # Process cleanup will be handled by OS
+
+        for stream in (self.process.stdin, self.process.stdout):
+            try:
+                stream.close()
+            except OSError:
+                pass
+
+        try:
+            self._temp_dir.cleanup()
+        except OSError:
+            pass
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit with cleanup."""
+        self.close()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get server statistics."""
+        return {
+            "pid": self.pid,
+            "alive": self.is_alive(),
+            "invocations": self.invocations,
+        }
@@ -0,0 +1,222 @@
+"""Streaming stdout/stderr capture for sandboxed processes.
+
+``Popen.communicate()`` holds all program output in memory until the process
+exits. ``OutputPump`` instead drains both pipes as data arrives, hands each
+decoded chunk to a callback, and stores it in an ``OutputCapture`` that keeps
+at most ``max_bytes`` in memory. Past the cap the capture either drops the
+rest ("truncate") or writes the full stream to a temp file ("spill").
+"""
+
+import asyncio
+import codecs
+import os
+import queue
+import subprocess
+import tempfile
+import threading
+import time
+from collections.abc import AsyncIterator, Callable, Iterator
+from dataclasses import dataclass
+from typing import Any
+
+OVERFLOW_TRUNCATE = "truncate"
+OVERFLOW_SPILL = "spill"
+
+_READ_SIZE = 65536
+
+
+@dataclass(frozen=True)
+class OutputChunk:
+    """A piece of program output as it was produced."""
+
+    stream: str  # "stdout" or "stderr"
+    text: str
+
+
+OutputCallback = Callable[[OutputChunk], None]
+
+
+class OutputCapture:
+    """Size-capped buffer for one output stream."""
+
+    def __init__(self, name: str, max_bytes: int = 0, overflow: str = OVERFLOW_TRUNCATE):
+        """Create a capture; ``max_bytes`` of 0 means unlimited."""
+        if overflow not in (OVERFLOW_TRUNCATE, OVERFLOW_SPILL):
+            raise ValueError(f"Unknown output overflow mode: {overflow}")
+
+        self.name = name
+        self.max_bytes = max_bytes
+        self.overflow = overflow
+        self.total_bytes = 0
+        self.spill_path: str | None = None
+        self._buffer = bytearray()
+        self._spill_file = None
+
+    @property
+    def truncated(self) -> bool:
+        """Whether the in-memory text is missing part of the stream."""
+        return self.total_bytes > len(self._buffer)
+
+    def write(self, data: bytes) -> None:
+        """Append raw bytes from the stream."""
+        self.total_bytes += len(data)
+
+        if self._spill_file is not None:
+            self._spill_file.write(data)
+            return
+
+        room = self.max_bytes - len(self._buffer) if self.max_bytes > 0 else len(data)
+        if len(data) <= room:
+            self._buffer += data
+            return
+
+        self._buffer += data[: max(room, 0)]
+        if self.overflow == OVERFLOW_SPILL:
+            # The spill file holds the complete stream, head included
+            fd, self.spill_path = tempfile.mkstemp(prefix=f"mlpy_{self.name}_", suffix=".log")
+            self._spill_file = os.fdopen(fd, "wb")
+            self._spill_file.write(self._buffer)
+            self._spill_file.write(data[room:])
+
+    def getvalue(self) -> str:
+        """Text kept in memory (the first ``max_bytes`` of the stream)."""
+        return self._buffer.decode("utf-8", errors="replace")
+
+    def close(self) -> None:
+        """Flush and close the spill file, if any."""
+        if self._spill_file is not None:
+            self._spill_file.close()
+            self._spill_file = None
+
+
+class OutputPump:
+    """Drain a process's stdout and stderr pipes without blocking either.
+
+    One reader thread per pipe pushes raw reads onto a queue; ``drain`` runs
+    in the caller's thread, so captures and the callback are only touched
+    from there.
+    """
+
+    def __init__(
+        self,
+        process: subprocess.Popen,
+        stdout: OutputCapture,
+        stderr: OutputCapture,
+        on_output: OutputCallback | None = None,
+    ):
+        """Start reader threads for the process's binary stdout and stderr pipes."""
+        self.process = process
+        self.on_output = on_output
+        self._captures = {"stdout": stdout, "stderr": stderr}
+        self._decoders = {
+            name: codecs.getincrementaldecoder("utf-8")(errors="replace")
+            for name in self._captures
+        }
+        self._queue: queue.Queue[tuple[str, bytes | None]] = queue.Queue()
+        self._open = set()
+
+        for name, pipe in (("stdout", process.stdout), ("stderr", process.stderr)):
+            if pipe is None:
+                continue
+            self._open.add(name)
+            threading.Thread(target=self._read_pipe, args=(name, pipe), daemon=True).start()
+
+    def _read_pipe(self, name: str, pipe) -> None:
+        """Reader thread: forward raw reads until EOF."""
+        try:
+            while True:
+                data = pipe.read1(_READ_SIZE) if hasattr(pipe, "read1") else pipe.read(_READ_SIZE)
+                if not data:
+                    break
+                self._queue.put((name, data))
+        except (OSError, ValueError):
+            pass  # Pipe closed underneath us
+        finally:
+            self._queue.put((name, None))
+
+    def drain(self, timeout: float | None = None) -> None:
+        """Consume output until both pipes reach EOF.
+
+        Raises:
+            subprocess.TimeoutExpired: If the pipes are still open after ``timeout`` seconds
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while self._open:
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                raise subprocess.TimeoutExpired(self.process.args, timeout)
+
+            try:
+                name, data = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                continue
+
+            decoder = self._decoders[name]
+            if data is None:
+                self._open.discard(name)
+                text = decoder.decode(b"", final=True)
+            else:
+                self._captures[name].write(data)
+                text = decoder.decode(data)
+
+            if text and self.on_output is not None:
+                self.on_output(OutputChunk(name, text))
+
+
+class OutputStream:
+    """Iterate over output chunks of an execution running in the background.
+
+    ``run`` is called in a worker thread with a callback to report chunks; its
+    return value becomes ``result`` once iteration finishes. Supports both
+    ``for`` and ``async for``.
+    """
+
+    _DONE = object()
+
+    def __init__(self, run: Callable[[OutputCallback], Any]):
+        """Start ``run`` in a background thread."""
+        self.result: Any = None
+        self._error: BaseException | None = None
+        self._queue: queue.Queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, args=(run,), daemon=True)
+        self._thread.start()
+
+    def _run(self, run: Callable[[OutputCallback], Any]) -> None:
+        """Worker thread body."""
+        try:
+            self.result = run(self._queue.put)
+        except BaseException as e:
+            self._error = e
+        finally:
+            self._queue.put(self._DONE)
+
+    def _finish(self) -> None:
+        """Join the worker and re-raise its exception, if any."""
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+
+    def __iter__(self) -> Iterator[OutputChunk]:
+        """Yield chunks until the execution finishes."""
+        while True:
+            item = self._queue.get()
+            if item is self._DONE:
+                break
+            yield item
+        self._finish()
+
+    async def __aiter__(self) -> AsyncIterator[OutputChunk]:
+        """Yield chunks without blocking the event loop."""
+        while True:
+            item = await asyncio.to_thread(self._queue.get)
+            if item is self._DONE:
+                break
+            yield item
+        self._finish()
+
+    def wait(self) -> Any:
+        """Discard remaining chunks and return the execution result."""
+        for _ in self:
+            pass
+        return self.result
@@ -0,0 +1,397 @@
+"""Pre-forked warm worker pool for sandbox execution.
+
+Spawning a fresh interpreter and re-importing the mlpy runtime dominates the
+wall time of short sandboxed programs. A ``SandboxPool`` keeps a set of
+``mlpy.runtime.sandbox.worker`` processes alive with the runtime already
+imported and hands them jobs over a pipe. Workers are recycled after a fixed
+number of jobs and reaped when idle.
+"""
+
+import atexit
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import deque
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import Any
+
+from .resource_monitor import ResourceLimits
+from .worker import WorkerProtocolError, recv_message, send_message
+
+
+class SandboxPoolError(Exception):
+    """Exception raised when a pooled worker cannot be used."""
+
+    pass
+
+
+@dataclass
+class PoolConfig:
+    """Configuration for a sandbox worker pool."""
+
+    size: int = 4
+    max_uses_per_worker: int = 100
+    idle_timeout: float = 60.0  # seconds; 0 disables reaping
+    startup_timeout: float = 30.0  # seconds to wait for a worker's ready frame
+
+
+class PooledWorker:
+    """Handle for a single long-lived worker process."""
+
+    def __init__(
+        self,
+        python_executable: str,
+        env: dict[str, str],
+        limits: ResourceLimits,
+        max_uses: int,
+    ):
+        """Spawn the worker process (does not wait for it to become ready)."""
+        self.limits = limits
+        self.uses = 0
+        self.max_uses = max_uses
+        self.last_used = time.time()
+        self.ready = False
+        self._temp_dir = tempfile.TemporaryDirectory(prefix="mlpy_pool_")
+
+        self.process = subprocess.Popen(
+            [python_executable, "-m", "mlpy.runtime.sandbox.worker"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            bufsize=0,
+            env=env,
+            cwd=self._temp_dir.name,
+            preexec_fn=self._setup_worker_limits if os.name != "nt" else None,
+        )
+
+    @property
+    def pid(self) -> int:
+        """Process ID of the worker."""
+        return self.process.pid
+
+    def _setup_worker_limits(self) -> None:
+        """Apply sandbox rlimits to the worker (runs in the child before exec).
+
+        Memory and file size limits match ``MLSandbox._setup_subprocess_limits``.
+        RLIMIT_CPU is cumulative over the worker's lifetime, so the hard limit
+        covers every job the worker may run; the worker lowers the soft limit
+        to a fresh per-job budget before each job.
+        """
+        import resource
+
+        if self.limits.memory_limit > 0:
+            resource.setrlimit(
+                resource.RLIMIT_AS, (self.limits.memory_limit, self.limits.memory_limit)
+            )
+
+        if self.limits.cpu_timeout > 0:
+            cpu_limit = (int(self.limits.cpu_timeout) + 5) * (self.max_uses + 1)
+            resource.setrlimit(resource.RLIMIT_CPU, (cpu_limit, cpu_limit))
+
+        if self.limits.file_size_limit > 0:
+            resource.setrlimit(
+                resource.RLIMIT_FSIZE, (self.limits.file_size_limit, self.limits.file_size_limit)
+            )
+
+    def is_alive(self) -> bool:
+        """Check whether the worker process is still running."""
+        return self.process.poll() is None
+
+    def is_exhausted(self) -> bool:
+        """Check whether the worker has reached its job limit."""
+        return self.uses >= self.max_uses
+
+    def wait_ready(self, timeout: float) -> None:
+        """Block until the worker reports that the runtime is imported."""
+        if self.ready:
+            return
+
+        message = self._receive(timeout)
+        if not message.get("ready"):
+            raise SandboxPoolError(f"Unexpected startup message from worker {self.pid}")
+        self.ready = True
+
+    def run(self, request: dict[str, Any], timeout: float) -> dict[str, Any]:
+        """Send a job to the worker and wait for its response.
+
+        Raises:
+            TimeoutError: If the worker does not answer within ``timeout`` seconds
+            SandboxPoolError: If the worker died or the pipe broke
+        """
+        self.uses += 1
+        self.last_used = time.time()
+
+        try:
+            send_message(self.process.stdin, request)
+        except (BrokenPipeError, OSError) as e:
+            raise SandboxPoolError(f"Worker {self.pid} is not accepting jobs: {e}") from e
+
+        response = self._receive(timeout)
+        self.last_used = time.time()
+        return response
+
+    def run_batch(
+        self, request: dict[str, Any], count: int, timeout: float | None
+    ) -> Iterator[dict[str, Any]]:
+        """Send a batch job and yield its ``count`` unit responses as they arrive.
+
+        Raises:
+            TimeoutError: If a unit does not answer within ``timeout`` seconds
+            SandboxPoolError: If the worker died or the pipe broke
+        """
+        self.uses += count
+        self.last_used = time.time()
+
+        try:
+            send_message(self.process.stdin, request)
+        except (BrokenPipeError, OSError) as e:
+            raise SandboxPoolError(f"Worker {self.pid} is not accepting jobs: {e}") from e
+
+        for _ in range(count):
+            response = self._receive(timeout)
+            self.last_used = time.time()
+            yield response
+
+    def _receive(self, timeout: float | None) -> dict[str, Any]:
+        """Wait up to ``timeout`` seconds for the next frame from the worker."""
+        try:
+            return recv_message(self.process.stdout, timeout=timeout)
+        except TimeoutError:
+            raise TimeoutError(f"Worker {self.pid} did not respond in {timeout} seconds") from None
+        except WorkerProtocolError as e:
+            returncode = self.process.poll()
+            raise SandboxPoolError(
+                f"Worker {self.pid} exited unexpectedly (code {returncode})"
+            ) from e
+
+    def shutdown(self, timeout: float = 2.0) -> None:
+        """Stop the worker, politely first and forcefully if needed."""
+        if self.is_alive():
+            try:
+                send_message(self.process.stdin, {"shutdown": True})
+                self.process.wait(timeout=timeout)
+            except (subprocess.TimeoutExpired, OSError):
+                self.kill()
+
+        for stream in (self.process.stdin, self.process.stdout):
+            try:
+                stream.close()
+            except OSError:
+                pass
+
+        try:
+            self._temp_dir.cleanup()
+        except OSError:
+            pass
+
+    def kill(self) -> None:
+        """Kill the worker immediately."""
+        try:
+            self.process.kill()
+            self.process.wait(timeout=2.0)
+        except (subprocess.TimeoutExpired, OSError):
+            pass  # Process cleanup will be handled by OS
+
+
+class SandboxPool:
+    """Pool of warm sandbox worker processes."""
+
+    def __init__(
+        self,
+        pool_config: PoolConfig,
+        limits: ResourceLimits,
+        env: dict[str, str],
+        python_executable: str | None = None,
+    ):
+        """Initialize the pool and pre-spawn its workers."""
+        self.pool_config = pool_config
+        self.limits = limits
+        self.python_executable = python_executable or sys.executable
+
+        self._env = dict(env)
+        self._env["MLPY_SANDBOX_CPU_LIMIT"] = str(limits.cpu_timeout)
+
+        self._idle: deque[PooledWorker] = deque()
+        self._busy: set[PooledWorker] = set()
+        self._condition = threading.Condition()
+        self._closed = False
+
+        # Statistics
+        self._spawned = 0
+        self._recycled = 0
+        self._reaped = 0
+        self._jobs = 0
+
+        with self._condition:
+            for _ in range(pool_config.size):
+                self._idle.append(self._spawn_worker())
+
+        self._reaper: threading.Thread | None = None
+        if pool_config.idle_timeout > 0:
+            self._reaper = threading.Thread(target=self._reap_loop, daemon=True)
+            self._reaper.start()
+
+    def _spawn_worker(self) -> PooledWorker:
+        """Start a new worker process (caller holds the condition lock)."""
+        self._spawned += 1
+        return PooledWorker(
+            self.python_executable,
+            self._env,
+            self.limits,
+            self.pool_config.max_uses_per_worker,
+        )
+
+    def acquire(self, timeout: float | None = None) -> PooledWorker:
+        """Take an idle worker, spawning one if the pool is below its size."""
+        deadline = None if timeout is None else time.time() + timeout
+
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise SandboxPoolError("Sandbox pool is shut down")
+
+                while self._idle:
+                    worker = self._idle.popleft()
+                    if worker.is_alive():
+                        self._busy.add(worker)
+                        break
+                    worker.shutdown()
+                else:
+                    worker = None
+
+                if worker is None and len(self._busy) < self.pool_config.size:
+                    worker = self._spawn_worker()
+                    self._busy.add(worker)
+
+                if worker is not None:
+                    self._jobs += 1
+                    break
+
+                remaining = None if deadline is None else deadline - time.time()
+                if remaining is not None and remaining <= 0:
+                    raise SandboxPoolError("Timed out waiting for a free sandbox worker")
+                self._condition.wait(remaining)
+
+        try:
+            worker.wait_ready(self.pool_config.startup_timeout)
+        except (TimeoutError, SandboxPoolError) as e:
+            self.release(worker, discard=True)
+            raise SandboxPoolError("Sandbox worker failed to start") from e
+
+        return worker
+
+    def release(self, worker: PooledWorker, discard: bool = False) -> None:
+        """Return a worker to the pool, recycling it if it is used up or broken."""
+        retired = None
+        with self._condition:
+            self._busy.discard(worker)
+
+            if discard or self._closed or not worker.is_alive() or worker.is_exhausted():
+                if worker.is_exhausted():
+                    self._recycled += 1
+                retired = worker
+                if not self._closed and len(self._idle) + len(self._busy) < self.pool_config.size:
+                    # Replace eagerly so the next job finds a warm worker
+                    self._idle.append(self._spawn_worker())
+            else:
+                self._idle.append(worker)
+
+            self._condition.notify()
+
+        # Stopping a worker can block for seconds; never do it under the lock
+        if retired is not None:
+            if discard:
+                retired.kill()
+            retired.shutdown()
+
+    def _reap_loop(self) -> None:
+        """Periodically terminate workers that have been idle too long."""
+        interval = max(self.pool_config.idle_timeout / 2, 0.05)
+
+        while not self._closed:
+            time.sleep(interval)
+            if not self._closed:
+                self.reap_idle()
+
+    def reap_idle(self) -> int:
+        """Shut down workers idle for longer than ``idle_timeout``."""
+        now = time.time()
+        expired: list[PooledWorker] = []
+
+        with self._condition:
+            keep: deque[PooledWorker] = deque()
+            for worker in self._idle:
+                if now - worker.last_used > self.pool_config.idle_timeout:
+                    expired.append(worker)
+                else:
+                    keep.append(worker)
+            self._idle = keep
+            self._reaped += len(expired)
+
+        for worker in expired:
+            worker.shutdown()
+
+        return len(expired)
+
+    def shutdown(self) -> None:
+        """Shut down every worker in the pool."""
+        with self._condition:
+            self._closed = True
+            workers = list(self._idle) + list(self._busy)
+            self._idle.clear()
+            self._busy.clear()
+            self._condition.notify_all()
+
+        for worker in workers:
+            worker.shutdown()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get pool statistics."""
+        with self._condition:
+            return {
+                "size": self.pool_config.size,
+                "idle": len(self._idle),
+                "busy": len(self._busy),
+                "spawned": self._spawned,
+                "recycled": self._recycled,
+                "reaped": self._reaped,
+                "jobs": self._jobs,
+            }
+
+
+# Global pools, one per distinct sandbox configuration
+_pools: dict[tuple, SandboxPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_sandbox_pool(
+    key: tuple,
+    pool_config: PoolConfig,
+    limits: ResourceLimits,
+    env: dict[str, str],
+    python_executable: str | None = None,
+) -> SandboxPool:
+    """Get the shared pool for a configuration key, creating it on first use."""
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = SandboxPool(pool_config, limits, env, python_executable)
+            _pools[key] = pool
+        return pool
+
+
+def shutdown_sandbox_pools() -> None:
+    """Shut down all global sandbox pools."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+
+    for pool in pools:
+        pool.shutdown()
+
+
+atexit.register(shutdown_sandbox_pools)
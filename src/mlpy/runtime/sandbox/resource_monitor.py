@@ -1,7 +1,11 @@
 """Resource monitoring and limits enforcement for sandbox execution."""
 
+import os
+import subprocess
+import sys
 import threading
 import time
+from collections import deque
 from dataclasses import dataclass
 from typing import Any
 
@@ -36,24 +40,249 @@ class ResourceLimitExceeded(ResourceMonitorError):
         super().__init__(f"{resource_type} limit exceeded: {current} > {limit}")
 
 
-class ResourceMonitor:
-    """Monitor resource usage for sandbox processes."""
+def apply_resource_limits(limits: ResourceLimits) -> None:
+    """Apply memory, CPU and file size rlimits to the current process (Unix only)."""
+    if os.name == "nt":
+        return  # Not supported on Windows
+
+    import resource
+
+    # Set memory limit
+    if limits.memory_limit > 0:
+        resource.setrlimit(resource.RLIMIT_AS, (limits.memory_limit, limits.memory_limit))
+
+    # Set CPU time limit
+    if limits.cpu_timeout > 0:
+        cpu_limit = int(limits.cpu_timeout) + 5  # Add buffer
+        resource.setrlimit(resource.RLIMIT_CPU, (cpu_limit, cpu_limit))
+
+    # Set file size limit
+    if limits.file_size_limit > 0:
+        resource.setrlimit(resource.RLIMIT_FSIZE, (limits.file_size_limit, limits.file_size_limit))
+
+
+@dataclass
+class SamplingRates:
+    """Seconds between samples of each metric; 0 disables that metric.
+
+    Counting open files walks ``/proc/<pid>/fd``, so it is sampled less often.
+    """
+
+    memory: float = 0.1
+    cpu: float = 0.1
+    threads: float = 0.5
+    file_handles: float = 2.0
+
+    def as_dict(self) -> dict[str, float]:
+        """Rates keyed by metric name, skipping disabled metrics."""
+        rates = {
+            "memory": self.memory,
+            "cpu": self.cpu,
+            "threads": self.threads,
+            "file_handles": self.file_handles,
+        }
+        return {metric: rate for metric, rate in rates.items() if rate > 0}
+
+
+DEFAULT_HISTORY_SIZE = 256  # samples kept per monitor
+
+
+class ResourceSupervisor:
+    """One thread that samples every monitored process in a single pass.
+
+    Replaces a polling thread per sandboxed process. Each pass only collects
+    the metrics that are due according to ``SamplingRates``.
+    """
+
+    def __init__(self, rates: SamplingRates | None = None):
+        """Initialize the supervisor; its thread starts with the first watch."""
+        self.rates = rates or SamplingRates()
+        self._watched: dict[int, ResourceMonitor] = {}
+        self._condition = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._last_sampled: dict[int, dict[str, float]] = {}
+        self.passes = 0
+
+    def watch(self, monitor: "ResourceMonitor") -> None:
+        """Start sampling a monitor's process."""
+        with self._condition:
+            self._watched[id(monitor)] = monitor
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="mlpy-resource-supervisor", daemon=True
+                )
+                self._thread.start()
+            self._condition.notify()
+
+    def unwatch(self, monitor: "ResourceMonitor") -> None:
+        """Stop sampling a monitor's process."""
+        with self._condition:
+            self._watched.pop(id(monitor), None)
+
+    def is_watching(self, monitor: "ResourceMonitor") -> bool:
+        """Check whether a monitor is currently being sampled."""
+        with self._condition:
+            return id(monitor) in self._watched
+
+    def _due_metrics(self, key: int, now: float) -> set[str]:
+        """Metrics due for one monitor; a newly watched monitor gets all of them."""
+        last_sampled = self._last_sampled.setdefault(key, {})
+        due = set()
+        for metric, rate in self.rates.as_dict().items():
+            if now - last_sampled.get(metric, float("-inf")) >= rate:
+                due.add(metric)
+                last_sampled[metric] = now
+        return due
+
+    def _run(self) -> None:
+        """Supervisor thread body."""
+        interval = min(self.rates.as_dict().values(), default=0.1)
+
+        while True:
+            with self._condition:
+                while not self._watched:
+                    self._last_sampled.clear()
+                    self._condition.wait()
+                watched = list(self._watched.items())
+                for key in self._last_sampled.keys() - self._watched.keys():
+                    del self._last_sampled[key]
+
+            self.passes += 1
+            now = time.monotonic()
+            for key, monitor in watched:
+                metrics = self._due_metrics(key, now)
+                if metrics:
+                    monitor._sample(metrics)
+
+            with self._condition:
+                self._condition.wait(interval)
+
+
+_supervisor: ResourceSupervisor | None = None
+_supervisor_lock = threading.Lock()
+
+
+def get_resource_supervisor() -> ResourceSupervisor:
+    """Get the process-wide resource supervisor."""
+    global _supervisor
+    if _supervisor is None:
+        with _supervisor_lock:
+            if _supervisor is None:
+                _supervisor = ResourceSupervisor()
+    return _supervisor
+
+
+class RusagePopen(subprocess.Popen):
+    """A Popen that reaps its child with ``wait4`` and keeps the rusage.
+
+    ``wait()``, ``communicate()`` and ``poll()`` all reap through ``wait4``.
+    Afterwards ``rusage`` holds the child's exact peak RSS and CPU time. It
+    stays None if the platform has no ``wait4`` or the child was reaped
+    elsewhere.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        """Start the child; arguments are as for ``subprocess.Popen``."""
+        self.rusage: Any = None
+        self._reap_lock = threading.Lock()
+        super().__init__(*args, **kwargs)
+
+    def wait(self, timeout: float | None = None) -> int:
+        """Wait for the child to exit, reaping it with ``wait4``."""
+        if self.returncode is None and hasattr(os, "wait4"):
+            if timeout is None:
+                self._reap(0)
+            else:
+                # Poll with backoff, like Popen.wait() does with a timeout
+                deadline = time.monotonic() + timeout
+                delay = 0.0005
+                while not self._reap(os.WNOHANG):
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise subprocess.TimeoutExpired(self.args, timeout)
+                    time.sleep(min(delay, remaining))
+                    delay = min(delay * 2, 0.05)
+        return super().wait(timeout)
+
+    def poll(self) -> int | None:
+        """Return the exit code if the child has exited, reaping it with ``wait4``."""
+        if self.returncode is None and hasattr(os, "wait4"):
+            if not self._reap(os.WNOHANG, blocking=False):
+                return None
+        return super().poll()
+
+    def _reap(self, flags: int, blocking: bool = True) -> bool:
+        """Reap the child if it has exited; True once it is reaped.
+
+        Returns False if the child is still running, or if ``blocking`` is
+        False and another thread is already waiting for it.
+        """
+        if not self._reap_lock.acquire(blocking):
+            return False
+        try:
+            if self.returncode is not None:
+                return True
+            try:
+                pid, status, rusage = os.wait4(self.pid, flags)
+            except ChildProcessError:
+                return True  # Reaped elsewhere; Popen reports it as it always has
+            if pid != self.pid:
+                return False
+            self.rusage = rusage
+            self.returncode = os.waitstatus_to_exitcode(status)
+            return True
+        finally:
+            self._reap_lock.release()
+
+
+def rusage_usage(rusage: Any, elapsed_time: float) -> dict[str, Any]:
+    """Exact usage figures from a child's ``struct rusage``."""
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    scale = 1 if sys.platform == "darwin" else 1024
+    cpu_time = rusage.ru_utime + rusage.ru_stime
+    return {
+        "peak_memory": rusage.ru_maxrss * scale,
+        "cpu_time": cpu_time,
+        "average_cpu": cpu_time / elapsed_time * 100 if elapsed_time > 0 else 0.0,
+    }
+
 
-    def __init__(self):
+class ResourceMonitor:
+    """Monitor resource usage for sandbox processes.
+
+    Sampling is done by the shared ``ResourceSupervisor`` thread; samples
+    are kept in a bounded ring buffer. Exact peak memory and CPU time are
+    taken from the child's rusage at exit when available.
+    """
+
+    def __init__(
+        self,
+        history_size: int = DEFAULT_HISTORY_SIZE,
+        supervisor: ResourceSupervisor | None = None,
+    ):
         """Initialize the resource monitor."""
         self.limits: ResourceLimits | None = None
         self.monitoring = False
         self.process: psutil.Process | None = None
-        self._monitor_thread: threading.Thread | None = None
-        self._stop_event = threading.Event()
+        self.limit_exceeded: ResourceLimitExceeded | None = None
+        self._supervisor = supervisor
         self._lock = threading.Lock()
 
         # Resource usage tracking
-        self._usage_history: list[dict[str, Any]] = []
+        self._usage_history: deque[dict[str, Any]] = deque(maxlen=history_size)
+        self._last_sample: dict[str, Any] = {}
+        self._exit_usage: dict[str, Any] = {}
         self._peak_memory = 0
         self._total_cpu_time = 0.0
         self._start_time = 0.0
 
+    @property
+    def supervisor(self) -> ResourceSupervisor:
+        """Supervisor that samples this monitor's process."""
+        if self._supervisor is None:
+            self._supervisor = get_resource_supervisor()
+        return self._supervisor
+
     def set_limits(self, limits: ResourceLimits) -> None:
         """Set resource limits for monitoring."""
         with self._lock:
@@ -67,17 +296,20 @@ class ResourceMonitor:
 
             try:
                 self.process = psutil.Process(pid)
-                self.monitoring = True
-                self._start_time = time.time()
-                self._stop_event.clear()
-
-                # Start monitoring thread
-                self._monitor_thread = threading.Thread(target=self._monitor_loop, daemon=True)
-                self._monitor_thread.start()
-
             except psutil.NoSuchProcess:
                 raise ResourceMonitorError(f"Process {pid} not found")
 
+            # Statistics describe the most recently monitored process
+            self.monitoring = True
+            self._start_time = time.time()
+            self._usage_history.clear()
+            self._last_sample = {}
+            self._exit_usage = {}
+            self._peak_memory = 0
+            self.limit_exceeded = None
+
+        self.supervisor.watch(self)
+
     def stop_monitoring(self) -> None:
         """Stop resource monitoring."""
         with self._lock:
@@ -85,93 +317,105 @@ class ResourceMonitor:
                 return
 
             self.monitoring = False
-            self._stop_event.set()
+            self.process = None
 
-            # Wait for monitor thread to finish
-            if self._monitor_thread and self._monitor_thread.is_alive():
-                self._monitor_thread.join(timeout=2.0)
+        self.supervisor.unwatch(self)
 
-            self.process = None
+    def record_exit(self, rusage: Any) -> None:
+        """Record the exact usage of the exited process from its rusage."""
+        if rusage is None:
+            return
 
-    def _monitor_loop(self) -> None:
-        """Main monitoring loop running in separate thread."""
-        check_interval = 0.1  # Check every 100ms
+        with self._lock:
+            elapsed = time.time() - self._start_time if self._start_time else 0.0
+            self._exit_usage = rusage_usage(rusage, elapsed)
+            self._peak_memory = max(self._peak_memory, self._exit_usage["peak_memory"])
+            self._total_cpu_time = self._exit_usage["cpu_time"]
+
+    def _sample(self, metrics: set[str]) -> None:
+        """Take one sample of ``metrics`` (called from the supervisor thread)."""
+        if not self.monitoring:
+            return
 
-        while not self._stop_event.is_set() and self.monitoring:
-            try:
-                self._check_resources()
-                time.sleep(check_interval)
+        try:
+            self._check_resources(metrics)
 
-            except psutil.NoSuchProcess:
-                # Process ended
-                break
+        except psutil.NoSuchProcess:
+            # Process ended
+            self.supervisor.unwatch(self)
 
-            except ResourceLimitExceeded as e:
-                # Resource limit exceeded - terminate process
-                self._terminate_process(e)
-                break
+        except ResourceLimitExceeded as e:
+            # Terminate off the supervisor thread so other processes keep being sampled
+            self.limit_exceeded = e
+            self.supervisor.unwatch(self)
+            threading.Thread(target=self._terminate_process, args=(e,), daemon=True).start()
 
-            except Exception:
-                # Other errors - continue monitoring
-                time.sleep(check_interval)
+        except Exception:
+            pass  # Other errors - sample again next pass
 
-    def _check_resources(self) -> None:
+    def _check_resources(self, metrics: set[str] | None = None) -> None:
         """Check resource usage against limits."""
         if not self.process or not self.limits:
             return
 
-        # Get current usage
-        usage = self._get_current_usage()
+        # Get current usage, carrying forward metrics not sampled this pass
+        usage = self._get_current_usage(metrics)
+        if not usage:
+            return
 
-        # Record usage history
         with self._lock:
-            self._usage_history.append({"timestamp": time.time(), **usage})
+            self._last_sample.update(usage)
+            sample = dict(self._last_sample)
+
+            # Record usage history
+            self._usage_history.append({"timestamp": time.time(), **sample})
 
             # Update peaks
-            self._peak_memory = max(self._peak_memory, usage["memory"])
+            self._peak_memory = max(self._peak_memory, sample.get("memory", 0))
 
         # Check limits
-        self._enforce_limits(usage)
+        self._enforce_limits(sample)
 
-    def _get_current_usage(self) -> dict[str, Any]:
-        """Get current resource usage."""
+    def _get_current_usage(self, metrics: set[str] | None = None) -> dict[str, Any]:
+        """Get current resource usage; ``metrics`` limits what is sampled."""
         if not self.process:
             return {}
 
+        def wanted(metric: str) -> bool:
+            return metrics is None or metric in metrics
+
+        usage: dict[str, Any] = {}
+
         try:
             # Memory usage
-            memory_info = self.process.memory_info()
-            memory_usage = memory_info.rss  # Resident Set Size
+            if wanted("memory"):
+                usage["memory"] = self.process.memory_info().rss  # Resident Set Size
 
             # CPU usage (percentage)
-            cpu_percent = self.process.cpu_percent()
+            if wanted("cpu"):
+                usage["cpu_percent"] = self.process.cpu_percent()
 
             # Number of open file handles
-            try:
-                file_handles = len(self.process.open_files())
-            except (psutil.AccessDenied, psutil.NoSuchProcess):
-                file_handles = 0
+            if wanted("file_handles"):
+                try:
+                    usage["file_handles"] = len(self.process.open_files())
+                except (psutil.AccessDenied, psutil.NoSuchProcess):
+                    usage["file_handles"] = 0
 
             # Number of threads
-            try:
-                num_threads = self.process.num_threads()
-            except (psutil.AccessDenied, psutil.NoSuchProcess):
-                num_threads = 0
-
-            # Execution time
-            elapsed_time = time.time() - self._start_time
-
-            return {
-                "memory": memory_usage,
-                "cpu_percent": cpu_percent,
-                "file_handles": file_handles,
-                "num_threads": num_threads,
-                "elapsed_time": elapsed_time,
-            }
+            if wanted("threads"):
+                try:
+                    usage["num_threads"] = self.process.num_threads()
+                except (psutil.AccessDenied, psutil.NoSuchProcess):
+                    usage["num_threads"] = 0
 
         except psutil.NoSuchProcess:
             return {}
 
+        # Execution time
+        usage["elapsed_time"] = time.time() - self._start_time
+        return usage
+
     def _enforce_limits(self, usage: dict[str, Any]) -> None:
         """Enforce resource limits."""
         if not self.limits:
@@ -235,10 +479,14 @@ class ResourceMonitor:
             )
 
     def get_usage(self) -> dict[str, Any]:
-        """Get current or final resource usage statistics."""
+        """Get current or final resource usage statistics.
+
+        After ``record_exit`` the peak memory, CPU time and average CPU are
+        the exact figures from the process's rusage rather than samples.
+        """
         with self._lock:
             if not self._usage_history:
-                return {}
+                return dict(self._exit_usage)
 
             # Get latest usage
             latest = self._usage_history[-1]
@@ -266,18 +514,21 @@ class ResourceMonitor:
                 "elapsed_time": latest.get("elapsed_time", 0.0),
                 "samples": len(self._usage_history),
                 "monitoring_active": self.monitoring,
+                **self._exit_usage,
             }
 
     def get_usage_history(self) -> list[dict[str, Any]]:
-        """Get full usage history for analysis."""
+        """Get the retained usage history (most recent samples) for analysis."""
         with self._lock:
-            return self._usage_history.copy()
+            return list(self._usage_history)
 
     def reset_monitoring(self) -> None:
         """Reset monitoring state and clear history."""
+        self.stop_monitoring()
         with self._lock:
-            self.stop_monitoring()
             self._usage_history.clear()
+            self._last_sample = {}
+            self._exit_usage = {}
             self._peak_memory = 0
             self._total_cpu_time = 0.0
             self._start_time = 0.0
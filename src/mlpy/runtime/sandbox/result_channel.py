@@ -0,0 +1,353 @@
+"""Binary out-of-band result channel for sandbox processes.
+
+Sandboxed code reports its return value, execution metadata and error
+traceback as length-prefixed binary frames on a dedicated file descriptor
+instead of a marker line on stdout. Values keep their types (None, bool, int,
+float, str, bytes, list, tuple, dict); anything else arrives as an
+``OpaqueValue`` rather than silently turning into a string.
+
+Frame layout::
+
+    kind: uint8 | length: uint64 (big endian) | payload: encoded value
+
+Decoding walks a single ``memoryview`` over the received buffer, so a large
+result is never split into lines, re-joined or copied as text first.
+"""
+
+import os
+import struct
+import tempfile
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import Any
+
+# Frame kinds
+FRAME_RESULT = 1
+FRAME_ERROR = 2
+FRAME_METADATA = 3
+
+# Environment variable telling the child which fd to write frames to
+RESULT_FD_ENV = "MLPY_RESULT_FD"
+
+_FRAME_HEADER = struct.Struct(">BQ")
+_LENGTH = struct.Struct(">I")
+_INT64 = struct.Struct(">q")
+_FLOAT64 = struct.Struct(">d")
+
+# Value tags
+_TAG_NONE = b"N"
+_TAG_TRUE = b"T"
+_TAG_FALSE = b"F"
+_TAG_INT = b"i"
+_TAG_BIGINT = b"I"
+_TAG_FLOAT = b"f"
+_TAG_STR = b"s"
+_TAG_BYTES = b"b"
+_TAG_LIST = b"l"
+_TAG_TUPLE = b"t"
+_TAG_DICT = b"d"
+_TAG_INT_ARRAY = b"q"
+_TAG_FLOAT_ARRAY = b"D"
+_TAG_OPAQUE = b"o"
+
+_INT64_MIN = -(2**63)
+_INT64_MAX = 2**63 - 1
+
+
+class ResultChannelError(Exception):
+    """Exception raised for malformed result frames."""
+
+    pass
+
+
+@dataclass(frozen=True)
+class OpaqueValue:
+    """Placeholder for a value the channel cannot represent natively."""
+
+    type_name: str
+    text: str
+
+    def __str__(self) -> str:
+        return self.text
+
+
+def encode_value(value: Any) -> bytes:
+    """Encode a value into the channel's tagged binary format."""
+    out = bytearray()
+    try:
+        _encode(value, out, set())
+    except RecursionError:
+        out = bytearray()
+        _encode_opaque(value, out, text="<nested too deeply>")
+    return bytes(out)
+
+
+def _encode(value: Any, out: bytearray, active: set[int]) -> None:
+    """Append the encoding of ``value`` to ``out``."""
+    value_type = type(value)
+
+    if value is None:
+        out += _TAG_NONE
+    elif value_type is bool:
+        out += _TAG_TRUE if value else _TAG_FALSE
+    elif value_type is int:
+        if _INT64_MIN <= value <= _INT64_MAX:
+            out += _TAG_INT
+            out += _INT64.pack(value)
+        else:
+            raw = value.to_bytes((value.bit_length() + 8) // 8, "big", signed=True)
+            out += _TAG_BIGINT
+            out += _LENGTH.pack(len(raw))
+            out += raw
+    elif value_type is float:
+        out += _TAG_FLOAT
+        out += _FLOAT64.pack(value)
+    elif value_type is str:
+        raw = value.encode("utf-8", "surrogatepass")
+        out += _TAG_STR
+        out += _LENGTH.pack(len(raw))
+        out += raw
+    elif value_type in (bytes, bytearray, memoryview):
+        raw = bytes(value)
+        out += _TAG_BYTES
+        out += _LENGTH.pack(len(raw))
+        out += raw
+    elif isinstance(value, (list, tuple, dict)):
+        if id(value) in active:
+            _encode_opaque(value, out, text="<recursive reference>")
+            return
+        active.add(id(value))
+        try:
+            _encode_container(value, out, active)
+        finally:
+            active.discard(id(value))
+    else:
+        _encode_opaque(value, out)
+
+
+def _encode_container(value: list | tuple | dict, out: bytearray, active: set[int]) -> None:
+    """Encode a list, tuple or dict (including subclasses)."""
+    if isinstance(value, dict):
+        out += _TAG_DICT
+        out += _LENGTH.pack(len(value))
+        for key, item in value.items():
+            _encode(key, out, active)
+            _encode(item, out, active)
+        return
+
+    if isinstance(value, list) and value:
+        # Homogeneous numeric lists pack into one struct call
+        first_type = type(value[0])
+        if first_type is float and all(type(v) is float for v in value):
+            out += _TAG_FLOAT_ARRAY
+            out += _LENGTH.pack(len(value))
+            out += struct.pack(f">{len(value)}d", *value)
+            return
+        if first_type is int and all(
+            type(v) is int and _INT64_MIN <= v <= _INT64_MAX for v in value
+        ):
+            out += _TAG_INT_ARRAY
+            out += _LENGTH.pack(len(value))
+            out += struct.pack(f">{len(value)}q", *value)
+            return
+
+    out += _TAG_LIST if isinstance(value, list) else _TAG_TUPLE
+    out += _LENGTH.pack(len(value))
+    for item in value:
+        _encode(item, out, active)
+
+
+def _encode_opaque(value: Any, out: bytearray, text: str | None = None) -> None:
+    """Encode an unsupported value as its type name and ``str()`` text."""
+    if text is None:
+        try:
+            text = str(value)
+        except Exception:
+            text = f"<unprintable {type(value).__name__}>"
+
+    out += _TAG_OPAQUE
+    for part in (type(value).__name__, text):
+        raw = part.encode("utf-8", "surrogatepass")
+        out += _LENGTH.pack(len(raw))
+        out += raw
+
+
+def decode_value(data: bytes | bytearray | memoryview) -> Any:
+    """Decode a value produced by ``encode_value``."""
+    view = memoryview(data)
+    try:
+        value, position = _decode(view, 0)
+    except (IndexError, TypeError, RecursionError, struct.error, UnicodeDecodeError) as e:
+        raise ResultChannelError(f"Malformed result value: {e}") from e
+
+    if position != len(view):
+        raise ResultChannelError("Trailing bytes after result value")
+    return value
+
+
+def _read_length(view: memoryview, position: int) -> tuple[int, int]:
+    """Read a uint32 length prefix."""
+    return _LENGTH.unpack_from(view, position)[0], position + _LENGTH.size
+
+
+def _decode(view: memoryview, position: int) -> tuple[Any, int]:
+    """Decode the value starting at ``position``; return it and the next position."""
+    tag = view[position : position + 1].tobytes()
+    position += 1
+
+    if tag == _TAG_NONE:
+        return None, position
+    if tag == _TAG_TRUE:
+        return True, position
+    if tag == _TAG_FALSE:
+        return False, position
+    if tag == _TAG_INT:
+        return _INT64.unpack_from(view, position)[0], position + _INT64.size
+    if tag == _TAG_FLOAT:
+        return _FLOAT64.unpack_from(view, position)[0], position + _FLOAT64.size
+
+    if tag in (_TAG_STR, _TAG_BYTES, _TAG_BIGINT):
+        length, position = _read_length(view, position)
+        end = position + length
+        if end > len(view):
+            raise IndexError("value extends past end of frame")
+        chunk = view[position:end]
+        if tag == _TAG_STR:
+            return str(chunk, "utf-8", "surrogatepass"), end
+        if tag == _TAG_BYTES:
+            return chunk.tobytes(), end
+        return int.from_bytes(chunk, "big", signed=True), end
+
+    if tag in (_TAG_INT_ARRAY, _TAG_FLOAT_ARRAY):
+        count, position = _read_length(view, position)
+        fmt = f">{count}{'q' if tag == _TAG_INT_ARRAY else 'd'}"
+        return list(struct.unpack_from(fmt, view, position)), position + struct.calcsize(fmt)
+
+    if tag in (_TAG_LIST, _TAG_TUPLE):
+        count, position = _read_length(view, position)
+        items = []
+        for _ in range(count):
+            item, position = _decode(view, position)
+            items.append(item)
+        return (items if tag == _TAG_LIST else tuple(items)), position
+
+    if tag == _TAG_DICT:
+        count, position = _read_length(view, position)
+        result = {}
+        for _ in range(count):
+            key, position = _decode(view, position)
+            result[key], position = _decode(view, position)
+        return result, position
+
+    if tag == _TAG_OPAQUE:
+        parts = []
+        for _ in range(2):
+            length, position = _read_length(view, position)
+            parts.append(str(view[position : position + length], "utf-8", "surrogatepass"))
+            position += length
+        return OpaqueValue(parts[0], parts[1]), position
+
+    raise ResultChannelError(f"Unknown value tag {tag!r}")
+
+
+def encode_frame(kind: int, value: Any) -> bytes:
+    """Encode one frame carrying ``value``."""
+    payload = encode_value(value)
+    return _FRAME_HEADER.pack(kind, len(payload)) + payload
+
+
+def iter_frames(data: bytes | bytearray | memoryview) -> Iterator[tuple[int, Any]]:
+    """Yield ``(kind, value)`` for every frame in a buffer."""
+    view = memoryview(data)
+    position = 0
+
+    while position < len(view):
+        if position + _FRAME_HEADER.size > len(view):
+            raise ResultChannelError("Truncated frame header")
+        kind, length = _FRAME_HEADER.unpack_from(view, position)
+        position += _FRAME_HEADER.size
+        if position + length > len(view):
+            raise ResultChannelError("Truncated frame payload")
+        yield kind, decode_value(view[position : position + length])
+        position += length
+
+
+def write_frame(fd: int, kind: int, value: Any) -> None:
+    """Write one frame to a raw file descriptor."""
+    data = memoryview(encode_frame(kind, value))
+    while data:
+        written = os.write(fd, data)
+        data = data[written:]
+
+
+def frames_to_payload(frames: Iterator[tuple[int, Any]]) -> dict[str, Any] | None:
+    """Combine result, error and metadata frames into one payload dict.
+
+    The payload has the same keys as the legacy ``__MLPY_RESULT__`` JSON
+    (``success``, ``result``, ``type`` or ``error``, ``error_type``,
+    ``traceback``) plus ``metadata``. Returns None if no result or error
+    frame was received.
+    """
+    payload: dict[str, Any] | None = None
+    metadata: dict[str, Any] = {}
+
+    for kind, value in frames:
+        if kind == FRAME_RESULT:
+            payload = {
+                "success": True,
+                "result": value,
+                "type": type(value).__name__ if value is not None else None,
+            }
+        elif kind == FRAME_ERROR:
+            payload = {"success": False, **value}
+        elif kind == FRAME_METADATA:
+            metadata.update(value)
+
+    if payload is not None:
+        payload["metadata"] = metadata
+    return payload
+
+
+class ResultChannel:
+    """Host side of a result channel backed by an inherited temp file.
+
+    A file rather than a pipe means the child never blocks on a large result
+    while the host is still draining stdout. The host reads the file once
+    after the child exits and decodes frames in place from that buffer.
+    """
+
+    def __init__(self, directory: str | None = None):
+        """Create the backing file; ``fd`` is inheritable by child processes."""
+        self.fd, self.path = tempfile.mkstemp(prefix="mlpy_result_", dir=directory)
+        os.set_inheritable(self.fd, True)
+
+    def child_env(self) -> dict[str, str]:
+        """Environment entries telling the child where to write frames."""
+        return {RESULT_FD_ENV: str(self.fd)}
+
+    def read_payload(self) -> dict[str, Any] | None:
+        """Decode everything the child wrote; None if it wrote nothing."""
+        size = os.fstat(self.fd).st_size
+        if size == 0:
+            return None
+
+        return frames_to_payload(iter_frames(os.pread(self.fd, size, 0)))
+
+    def close(self) -> None:
+        """Close and remove the backing file."""
+        try:
+            os.close(self.fd)
+        except OSError:
+            pass
+        try:
+            os.unlink(self.path)
+        except OSError:
+            pass
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit with cleanup."""
+        self.close()
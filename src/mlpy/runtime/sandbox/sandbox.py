@@ -1,6 +1,6 @@
 """Core MLSandbox class for secure subprocess-based ML code execution."""
 
-import base64
+import hashlib
 import json
 import os
 import subprocess
@@ -8,6 +8,7 @@ import sys
 import tempfile
 import threading
 import time
+from collections.abc import Sequence
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -15,8 +16,21 @@ from typing import Any
 
 from ..capabilities.context import CapabilityContext
 from ..capabilities.tokens import CapabilityToken
+from ..profiling.tracing import traced, tracer
+from .bytecode import SANDBOX_FILENAME
+from .cache import get_compilation_cache
 from .context_serializer import CapabilityContextSerializer
-from .resource_monitor import ResourceLimits, ResourceMonitor
+from .fork_server import ForkServer
+from .output_stream import OutputCallback, OutputCapture, OutputChunk, OutputPump, OutputStream
+from .pool import PoolConfig, PooledWorker, SandboxPool, SandboxPoolError, get_sandbox_pool
+from .resource_monitor import (
+    ResourceLimits,
+    ResourceMonitor,
+    ResourceMonitorError,
+    RusagePopen,
+    apply_resource_limits,
+)
+from .result_channel import ResultChannel
 
 
 @dataclass
@@ -48,6 +62,15 @@ class SandboxConfig:
     )
     strict_mode: bool = True
 
+    # Warm worker pool (0 spawns a fresh interpreter for every execution)
+    pool_size: int = 0
+    pool_max_uses: int = 100  # jobs per worker before it is recycled
+    pool_idle_timeout: float = 60.0  # seconds before an idle worker is reaped
+
+    # Output capture ("0" keeps all output in memory)
+    output_limit: str = "0"  # per stream, e.g., "1MB"
+    output_overflow: str = "truncate"  # "truncate" drops the rest, "spill" writes it to a file
+
 
 @dataclass
 class SandboxResult:
@@ -59,11 +82,14 @@ class SandboxResult:
     stdout: str = ""
     stderr: str = ""
     exit_code: int = 0
+    output_truncated: bool = False  # stdout/stderr hit output_limit
+    output_spill_files: dict[str, str] = field(default_factory=dict)  # stream -> full output
 
     # Resource usage
     execution_time: float = 0.0
     memory_usage: int = 0  # bytes
     cpu_usage: float = 0.0  # percentage
+    cpu_time: float = 0.0  # seconds of user + system CPU
 
     # Security info
     capability_violations: list[str] = field(default_factory=list)
@@ -74,6 +100,20 @@ class SandboxResult:
     error_traceback: str | None = None
 
 
+def parse_size(size_str: str) -> int:
+    """Parse size string like '100MB' to bytes."""
+    size_str = size_str.strip().upper()
+
+    if size_str.endswith("KB"):
+        return int(size_str[:-2]) * 1024
+    elif size_str.endswith("MB"):
+        return int(size_str[:-2]) * 1024 * 1024
+    elif size_str.endswith("GB"):
+        return int(size_str[:-2]) * 1024 * 1024 * 1024
+    else:
+        return int(size_str)  # Assume bytes
+
+
 class SandboxError(Exception):
     """Base exception for sandbox execution errors."""
 
@@ -104,6 +144,7 @@ class MLSandbox:
         self.context_serializer = CapabilityContextSerializer()
         self._process: subprocess.Popen | None = None
         self._temp_dir: tempfile.TemporaryDirectory | None = None
+        self._fork_servers: dict[str, ForkServer] = {}
         self._lock = threading.Lock()
 
     def __enter__(self):
@@ -117,8 +158,9 @@ class MLSandbox:
 
     def _setup_sandbox(self) -> None:
         """Set up the sandbox environment."""
-        # Create temporary directory for sandbox execution
-        self._temp_dir = tempfile.TemporaryDirectory(prefix="mlpy_sandbox_")
+        # Create temporary directory for sandbox execution (pooled workers own theirs)
+        if self.config.pool_size == 0:
+            self._temp_dir = tempfile.TemporaryDirectory(prefix="mlpy_sandbox_")
 
         # Set up resource monitoring
         limits = self._parse_resource_limits()
@@ -140,6 +182,11 @@ class MLSandbox:
                     except (subprocess.TimeoutExpired, OSError):
                         pass  # Process cleanup will be handled by OS
 
+            # Stop fork servers
+            for server in self._fork_servers.values():
+                server.close()
+            self._fork_servers.clear()
+
             # Clean up temporary directory
             if self._temp_dir:
                 try:
@@ -149,20 +196,6 @@ class MLSandbox:
 
     def _parse_resource_limits(self) -> ResourceLimits:
         """Parse resource limits from config."""
-
-        def parse_size(size_str: str) -> int:
-            """Parse size string like '100MB' to bytes."""
-            size_str = size_str.strip().upper()
-
-            if size_str.endswith("KB"):
-                return int(size_str[:-2]) * 1024
-            elif size_str.endswith("MB"):
-                return int(size_str[:-2]) * 1024 * 1024
-            elif size_str.endswith("GB"):
-                return int(size_str[:-2]) * 1024 * 1024 * 1024
-            else:
-                return int(size_str)  # Assume bytes
-
         return ResourceLimits(
             memory_limit=parse_size(self.config.memory_limit),
             cpu_timeout=self.config.cpu_timeout,
@@ -170,31 +203,30 @@ class MLSandbox:
             temp_dir_limit=parse_size(self.config.temp_dir_limit),
         )
 
+    @traced("sandbox.execute", "sandbox")
     def execute(
         self,
         ml_code: str,
         capabilities: list[CapabilityToken] | None = None,
         context: CapabilityContext | None = None,
+        on_output: OutputCallback | None = None,
     ) -> SandboxResult:
-        """Execute ML code in the sandbox with capabilities."""
+        """Execute ML code in the sandbox with capabilities.
+
+        ``on_output`` is called with each stdout/stderr chunk while the
+        program runs.
+        """
         start_time = time.time()
 
         try:
             # Prepare capability context
-            if context is None and capabilities:
-                from ..capabilities.manager import get_capability_manager
-
-                manager = get_capability_manager()
-                context = manager.create_context(name="sandbox_execution")
-
-                for token in capabilities:
-                    context.add_capability(token)
+            context = self._prepare_context(capabilities, context)
 
             # Transpile ML code to Python
             python_code = self._transpile_ml_code(ml_code)
 
             # Execute in subprocess
-            result = self._execute_python_code(python_code, context)
+            result = self._execute_python_code(python_code, context, on_output)
 
             # Update timing
             result.execution_time = time.time() - start_time
@@ -215,6 +247,327 @@ class MLSandbox:
                 error_traceback=self._get_traceback(),
             )
 
+    def execute_stream(
+        self,
+        ml_code: str,
+        capabilities: list[CapabilityToken] | None = None,
+        context: CapabilityContext | None = None,
+    ) -> OutputStream:
+        """Execute ML code in the background and iterate over its output.
+
+        Example:
+            stream = sandbox.execute_stream(code)
+            for chunk in stream:
+                print(chunk.text, end="")
+            result = stream.result
+        """
+        return OutputStream(
+            lambda emit: self.execute(ml_code, capabilities, context, on_output=emit)
+        )
+
+    def _prepare_context(
+        self,
+        capabilities: list[CapabilityToken] | None,
+        context: CapabilityContext | None,
+    ) -> CapabilityContext | None:
+        """Build a capability context from tokens unless one was given."""
+        if context is None and capabilities:
+            from ..capabilities.manager import get_capability_manager
+
+            manager = get_capability_manager()
+            context = manager.create_context(name="sandbox_execution")
+
+            for token in capabilities:
+                context.add_capability(token)
+
+        return context
+
+    def get_fork_server(self, ml_code: str) -> ForkServer:
+        """Get the fork server for an ML program, starting it on first use.
+
+        The program is transpiled once and its prelude (imports and top-level
+        definitions) runs once in the server; later calls reuse the snapshot.
+        """
+        key = hashlib.sha256(ml_code.encode("utf-8")).hexdigest()
+
+        with self._lock:
+            server = self._fork_servers.get(key)
+            if server is not None and server.is_alive():
+                return server
+
+            python_code = self._transpile_ml_code(ml_code)
+            server = ForkServer(
+                python_code,
+                self._parse_resource_limits(),
+                self._prepare_environment(),
+                self.config.python_executable,
+            )
+            self._fork_servers[key] = server
+            return server
+
+    def execute_forked(
+        self,
+        ml_code: str,
+        inputs: dict[str, Any] | None = None,
+        capabilities: list[CapabilityToken] | None = None,
+        context: CapabilityContext | None = None,
+        on_output: OutputCallback | None = None,
+    ) -> SandboxResult:
+        """Execute ML code in a child forked from the program's fork server.
+
+        Args:
+            ml_code: ML program; its prelude runs once per sandbox
+            inputs: JSON-serializable values bound as globals for this invocation
+            capabilities: Capability tokens for this invocation
+            context: Existing capability context to use
+            on_output: Called with the invocation's output once it finishes
+
+        Returns:
+            SandboxResult for this invocation
+        """
+        start_time = time.time()
+
+        try:
+            context = self._prepare_context(capabilities, context)
+            server = self.get_fork_server(ml_code)
+            response = server.invoke(inputs, self._serialize_context(context))
+
+            if response.get("timed_out"):
+                raise SandboxTimeoutError(
+                    f"Execution timed out after {self.config.cpu_timeout} seconds"
+                )
+
+            usage = response.get("usage", {})
+            usage_fields = {
+                "memory_usage": usage.get("peak_memory", 0),
+                "cpu_usage": usage.get("average_cpu", 0.0),
+                "cpu_time": usage.get("cpu_time", 0.0),
+            }
+
+            if response.get("crashed"):
+                return SandboxResult(
+                    success=False,
+                    exit_code=response.get("exit_code", -1),
+                    stderr=response.get("error", ""),
+                    execution_time=time.time() - start_time,
+                    **usage_fields,
+                )
+
+            return SandboxResult(
+                success=response.get("success", False),
+                return_value=self._result_from_payload(response),
+                execution_time=time.time() - start_time,
+                **usage_fields,
+                **self._capture_buffered_output(response, on_output),
+            )
+
+        except SandboxTimeoutError as e:
+            return SandboxResult(
+                success=False, error=e, execution_time=time.time() - start_time, stderr=str(e)
+            )
+
+        except Exception as e:
+            return SandboxResult(
+                success=False,
+                error=e,
+                execution_time=time.time() - start_time,
+                stderr=str(e),
+                error_traceback=self._get_traceback(),
+            )
+
+    def execute_batch(
+        self,
+        programs: str | Sequence[str],
+        inputs: Sequence[dict[str, Any] | None] | None = None,
+        capabilities: list[CapabilityToken] | None = None,
+        context: CapabilityContext | None = None,
+    ) -> list[SandboxResult]:
+        """Execute many independent ML units in one worker process.
+
+        Pass a single program with a list of ``inputs`` to run it once per
+        input, or a list of programs (with optional matching ``inputs``).
+        Every unit runs in fresh globals with a fresh copy of the capability
+        context and its own ``cpu_timeout``. A failing, timed out or crashing
+        unit only fails its own result; after a crash the remaining units
+        continue in a new worker.
+
+        ``cpu_time`` and ``cpu_usage`` are measured per unit. Units share one
+        process, so ``memory_usage`` is the worker's peak resident memory up
+        to the end of the unit, not the unit's own footprint.
+
+        Args:
+            programs: One ML program, or one program per unit
+            inputs: Values bound as globals for each unit
+            capabilities: Capability tokens for every unit
+            context: Existing capability context to use
+
+        Returns:
+            One SandboxResult per unit, in order
+
+        Raises:
+            ValueError: If ``programs`` and ``inputs`` have different lengths
+        """
+        if isinstance(programs, str):
+            programs = [programs] * (len(inputs) if inputs is not None else 1)
+        if inputs is None:
+            inputs = [None] * len(programs)
+        if len(inputs) != len(programs):
+            raise ValueError(
+                f"Got {len(programs)} programs but {len(inputs)} inputs for the batch"
+            )
+
+        results: list[SandboxResult | None] = [None] * len(programs)
+
+        try:
+            context = self._prepare_context(capabilities, context)
+        except Exception as e:
+            return [SandboxResult(success=False, error=e, stderr=str(e)) for _ in programs]
+
+        # Transpile each distinct program once
+        program_codes: dict[str, int] = {}
+        batch_programs: list[dict[str, Any]] = []
+        units: list[tuple[int, dict[str, Any]]] = []
+
+        for index, (ml_code, unit_inputs) in enumerate(zip(programs, inputs, strict=True)):
+            if ml_code not in program_codes:
+                try:
+                    python_code = self._transpile_ml_code(ml_code)
+                except Exception as e:
+                    results[index] = SandboxResult(
+                        success=False,
+                        error=e,
+                        stderr=str(e),
+                        error_traceback=self._get_traceback(),
+                    )
+                    continue
+
+                program = {"code": python_code}
+                bytecode = self._get_bytecode(python_code)
+                if bytecode is not None:
+                    program["bytecode"] = bytecode
+                program_codes[ml_code] = len(batch_programs)
+                batch_programs.append(program)
+
+            units.append((index, {"program": program_codes[ml_code], "inputs": unit_inputs}))
+
+        context_data = self._serialize_context(context)
+        while units:
+            units = self._run_batch(batch_programs, units, context_data, results)
+
+        return results
+
+    def _run_batch(
+        self,
+        programs: list[dict[str, Any]],
+        units: list[tuple[int, dict[str, Any]]],
+        context_data: str | None,
+        results: list[SandboxResult | None],
+    ) -> list[tuple[int, dict[str, Any]]]:
+        """Run units on a fresh worker, filling ``results``.
+
+        Returns the units left over if the worker crashed or hung part way.
+        """
+        timeout = self.config.cpu_timeout
+        limits = self._parse_resource_limits()
+        env = self._prepare_environment()
+        env["MLPY_SANDBOX_CPU_LIMIT"] = str(limits.cpu_timeout)
+
+        worker = PooledWorker(
+            self.config.python_executable or sys.executable, env, limits, len(units)
+        )
+        request = {
+            "programs": programs,
+            "batch": [unit for _, unit in units],
+            "context": context_data,
+            "timeout": timeout,
+        }
+        # The worker enforces the per-unit timeout; allow it time to report
+        unit_timeout = timeout + 5.0 if timeout > 0 else None
+        finished = 0
+
+        try:
+            worker.wait_ready(PoolConfig.startup_timeout)
+        except (TimeoutError, SandboxPoolError) as e:
+            worker.kill()
+            worker.shutdown()
+            error = SandboxPoolError(f"Batch worker failed to start: {e}")
+            for index, _ in units:
+                results[index] = SandboxResult(success=False, error=error, stderr=str(error))
+            return []
+
+        try:
+            try:
+                self.resource_monitor.start_monitoring(worker.pid)
+            except ResourceMonitorError:
+                pass  # Worker already gone; the first receive reports it
+
+            for response in worker.run_batch(request, len(units), unit_timeout):
+                index = units[finished][0]
+                results[index] = self._batch_result(response)
+                finished += 1
+
+        except TimeoutError:
+            # Stuck outside the reach of the worker's timer (e.g. in C code)
+            error = SandboxTimeoutError(f"Execution timed out after {timeout} seconds")
+            results[units[finished][0]] = SandboxResult(
+                success=False, error=error, stderr=str(error), execution_time=unit_timeout
+            )
+            finished += 1
+
+        except SandboxPoolError as e:
+            # Killed by an rlimit or the resource monitor while running this unit
+            results[units[finished][0]] = SandboxResult(
+                success=False,
+                stderr=str(e),
+                exit_code=worker.process.returncode or -1,
+                error=e,
+            )
+            finished += 1
+
+        finally:
+            self.resource_monitor.stop_monitoring()
+            if finished < len(units):
+                worker.kill()
+            worker.shutdown()
+
+        return units[finished:]
+
+    def _batch_result(self, response: dict[str, Any]) -> SandboxResult:
+        """Build the SandboxResult for one batch unit's response frame."""
+        execution_time = response.get("execution_time", 0.0)
+
+        if response.get("timed_out"):
+            error = SandboxTimeoutError(
+                f"Execution timed out after {self.config.cpu_timeout} seconds"
+            )
+            return SandboxResult(
+                success=False, error=error, stderr=str(error), execution_time=execution_time
+            )
+
+        output = self._capture_buffered_output(response, None)
+        try:
+            return_value = self._result_from_payload(response)
+        except SandboxError as e:
+            return SandboxResult(
+                success=False,
+                error=e,
+                execution_time=execution_time,
+                error_traceback=response.get("traceback"),
+                **output,
+            )
+
+        # CPU is the unit's own; memory is the shared worker's peak so far
+        cpu_time = response.get("cpu_time", 0.0)
+        return SandboxResult(
+            success=True,
+            return_value=return_value,
+            execution_time=execution_time,
+            memory_usage=self.resource_monitor.get_usage().get("peak_memory", 0),
+            cpu_usage=cpu_time / execution_time * 100 if execution_time > 0 else 0.0,
+            cpu_time=cpu_time,
+            **output,
+        )
+
     def _transpile_ml_code(self, ml_code: str) -> str:
         """Transpile ML code to Python using the transpiler."""
         from ...ml.transpiler import transpile_ml_code
@@ -233,80 +586,338 @@ class MLSandbox:
 
         return python_code
 
+    @traced("sandbox.run_python", "sandbox")
     def _execute_python_code(
-        self, python_code: str, context: CapabilityContext | None = None
+        self,
+        python_code: str,
+        context: CapabilityContext | None = None,
+        on_output: OutputCallback | None = None,
     ) -> SandboxResult:
         """Execute Python code in isolated subprocess."""
+        if self.config.pool_size > 0:
+            return self._execute_in_pool(python_code, context, on_output)
+
+        # Stream output through capped captures instead of communicate()
+        streaming = on_output is not None or parse_size(self.config.output_limit) > 0
 
         # Create execution script
-        script_path = self._create_execution_script(python_code, context)
+        with tracer.span("prepare_script", "sandbox"):
+            script_path = self._create_execution_script(python_code, context)
 
-        # Prepare subprocess environment
-        env = self._prepare_environment()
+            # Prepare subprocess environment
+            env = self._prepare_environment()
 
-        # Start resource monitoring
-        monitor_thread = threading.Thread(target=self._monitor_resources, daemon=True)
-        monitor_thread.start()
+        # Out-of-band result channel (inherited fd; unavailable on Windows)
+        channel = ResultChannel(self._temp_dir.name) if os.name != "nt" else None
+        if channel:
+            env.update(channel.child_env())
+        if on_output is not None:
+            env["PYTHONUNBUFFERED"] = "1"
 
         try:
             # Execute subprocess
-            with self._lock:
-                self._process = subprocess.Popen(
+            with self._lock, tracer.span("spawn", "sandbox"):
+                self._process = RusagePopen(
                     [self.config.python_executable or sys.executable, str(script_path)],
                     stdout=subprocess.PIPE,
                     stderr=subprocess.PIPE,
-                    text=True,
+                    text=not streaming,
                     env=env,
                     cwd=self._temp_dir.name,
                     preexec_fn=self._setup_subprocess_limits if os.name != "nt" else None,
+                    pass_fds=(channel.fd,) if channel else (),
                 )
 
-            # Wait for completion with timeout
+            # Sampled by the shared resource supervisor while it runs
             try:
-                stdout, stderr = self._process.communicate(timeout=self.config.cpu_timeout)
-                exit_code = self._process.returncode
+                self.resource_monitor.start_monitoring(self._process.pid)
+            except ResourceMonitorError:
+                pass  # Already exited; its rusage is still recorded below
 
-            except subprocess.TimeoutExpired:
-                self._process.kill()
-                stdout, stderr = self._process.communicate()
-                raise SandboxTimeoutError(
-                    f"Execution timed out after {self.config.cpu_timeout} seconds"
-                )
+            # Wait for completion with timeout
+            with tracer.span("wait", "sandbox", child_pid=self._process.pid):
+                if streaming:
+                    output = self._stream_output(on_output)
+                    stdout = output["stdout"]
+                    exit_code = self._process.returncode
+                else:
+                    try:
+                        stdout, stderr = self._process.communicate(
+                            timeout=self.config.cpu_timeout
+                        )
+                        exit_code = self._process.returncode
 
-            # Get resource usage
+                    except subprocess.TimeoutExpired:
+                        self._process.kill()
+                        stdout, stderr = self._process.communicate()
+                        raise SandboxTimeoutError(
+                            f"Execution timed out after {self.config.cpu_timeout} seconds"
+                        ) from None
+                    output = {"stdout": stdout, "stderr": stderr}
+
+            # Exact peak memory and CPU time from wait4, sampled figures otherwise
+            self.resource_monitor.record_exit(self._process.rusage)
             resource_usage = self.resource_monitor.get_usage()
 
-            # Parse result
-            return_value = self._parse_execution_result(stdout)
+            # Read the result channel; the stdout marker is only used without one
+            error = None
+            with tracer.span("decode", "sandbox"):
+                payload = channel.read_payload() if channel else None
+                if payload is not None:
+                    self._trace_child_execution(self._process.pid, payload)
+                    return_value = self._result_from_payload(payload)
+                elif channel is None:
+                    return_value = self._parse_execution_result(stdout)
+                else:
+                    return_value = None
+                    error = self._missing_result_error(exit_code)
 
             return SandboxResult(
-                success=(exit_code == 0),
+                success=(exit_code == 0 and error is None),
                 return_value=return_value,
-                stdout=stdout,
-                stderr=stderr,
+                error=error,
                 exit_code=exit_code,
-                memory_usage=resource_usage.get("memory", 0),
-                cpu_usage=resource_usage.get("cpu", 0.0),
+                memory_usage=resource_usage.get("peak_memory", 0),
+                cpu_usage=resource_usage.get("average_cpu", 0.0),
+                cpu_time=resource_usage.get("cpu_time", 0.0),
+                **output,
             )
 
         finally:
             # Stop resource monitoring
             self.resource_monitor.stop_monitoring()
 
+            if channel:
+                channel.close()
+
+    @staticmethod
+    def _trace_child_execution(pid: int, payload: dict[str, Any]) -> None:
+        """Record the child's own timing of the program as a span in its process."""
+        metadata = payload.get("metadata") or {}
+        started = metadata.get("started")
+        if not tracer.is_enabled() or started is None:
+            return
+        tracer.set_process_name(pid, f"sandbox child {pid}")
+        tracer.record(
+            "execute",
+            int(started * 1e9),
+            int(metadata.get("execution_time", 0.0) * 1e9),
+            "sandbox",
+            pid=pid,
+            tid=pid,
+            success=payload.get("success", False),
+        )
+
+    def _get_pool(self) -> SandboxPool:
+        """Get the shared worker pool matching this sandbox's configuration."""
+        config = self.config
+        key = (
+            config.python_executable,
+            config.memory_limit,
+            config.cpu_timeout,
+            config.file_size_limit,
+            config.strict_mode,
+            tuple(sorted(config.extra_env.items())),
+            config.pool_size,
+            config.pool_max_uses,
+            config.pool_idle_timeout,
+        )
+        pool_config = PoolConfig(
+            size=config.pool_size,
+            max_uses_per_worker=config.pool_max_uses,
+            idle_timeout=config.pool_idle_timeout,
+        )
+        return get_sandbox_pool(
+            key,
+            pool_config,
+            self._parse_resource_limits(),
+            self._prepare_environment(),
+            config.python_executable,
+        )
+
+    def _execute_in_pool(
+        self,
+        python_code: str,
+        context: CapabilityContext | None = None,
+        on_output: OutputCallback | None = None,
+    ) -> SandboxResult:
+        """Execute Python code on a warm pooled worker process.
+
+        Workers capture output in memory, so ``on_output`` receives it in one
+        chunk per stream when the job finishes.
+        """
+        context_data = self._serialize_context(context)
+        timeout = self.config.cpu_timeout
+
+        pool = self._get_pool()
+        with tracer.span("acquire", "sandbox"):
+            worker = pool.acquire(timeout=timeout if timeout > 0 else None)
+
+        try:
+            self.resource_monitor.start_monitoring(worker.pid)
+        except ResourceMonitorError:
+            pass  # Worker died before monitoring started; run() reports it
+
+        try:
+            request = {"code": python_code, "context": context_data}
+            bytecode = self._get_bytecode(python_code)
+            if bytecode is not None:
+                request["bytecode"] = bytecode
+            with tracer.span("run", "sandbox", worker_pid=worker.pid):
+                response = worker.run(request, timeout)
+
+        except TimeoutError:
+            pool.release(worker, discard=True)
+            raise SandboxTimeoutError(f"Execution timed out after {timeout} seconds") from None
+
+        except SandboxPoolError as e:
+            # Worker was killed, most likely by an rlimit or the resource monitor
+            pool.release(worker, discard=True)
+            exceeded = self.resource_monitor.limit_exceeded
+            if exceeded is not None and exceeded.resource_type == "cpu_timeout":
+                raise SandboxTimeoutError(f"Execution timed out after {timeout} seconds") from e
+            return SandboxResult(
+                success=False,
+                stderr=str(e),
+                exit_code=worker.process.returncode or -1,
+                error=e,
+            )
+
+        finally:
+            resource_usage = self.resource_monitor.get_usage()
+            self.resource_monitor.stop_monitoring()
+
+        pool.release(worker)
+
+        # The worker stays alive and reports the status the runner script
+        # would have exited with; a program that exited has no result
+        error = None
+        with tracer.span("decode", "sandbox"):
+            if response.get("exited"):
+                return_value = None
+                error = self._missing_result_error(response["exit_code"])
+            else:
+                return_value = self._result_from_payload(response)
+
+        return SandboxResult(
+            success=error is None and response.get("success", False),
+            return_value=return_value,
+            error=error,
+            exit_code=response.get("exit_code", 0),
+            **self._capture_buffered_output(response, on_output),
+            memory_usage=resource_usage.get("peak_memory", 0),
+            cpu_usage=resource_usage.get("average_cpu", 0.0),
+            cpu_time=response.get("cpu_time", 0.0),
+        )
+
+    def _new_output_captures(self) -> tuple[OutputCapture, OutputCapture]:
+        """Create stdout/stderr captures honouring the configured output cap."""
+        limit = parse_size(self.config.output_limit)
+        return tuple(
+            OutputCapture(name, limit, self.config.output_overflow) for name in ("stdout", "stderr")
+        )
+
+    @staticmethod
+    def _output_fields(captures: tuple[OutputCapture, ...]) -> dict[str, Any]:
+        """SandboxResult output fields for a set of finished captures."""
+        fields: dict[str, Any] = {capture.name: capture.getvalue() for capture in captures}
+        fields["output_truncated"] = any(capture.truncated for capture in captures)
+        fields["output_spill_files"] = {
+            capture.name: capture.spill_path for capture in captures if capture.spill_path
+        }
+        return fields
+
+    def _stream_output(self, on_output: OutputCallback | None) -> dict[str, Any]:
+        """Drain the running process's pipes chunk by chunk until it exits."""
+        captures = self._new_output_captures()
+        pump = OutputPump(self._process, *captures, on_output=on_output)
+        timeout = self.config.cpu_timeout
+        deadline = time.monotonic() + timeout
+
+        try:
+            pump.drain(timeout=timeout)
+            self._process.wait(timeout=max(deadline - time.monotonic(), 0.1))
+
+        except subprocess.TimeoutExpired:
+            self._process.kill()
+            pump.drain()
+            self._process.wait()
+            for capture in captures:
+                capture.close()
+                if capture.spill_path:
+                    os.unlink(capture.spill_path)
+            raise SandboxTimeoutError(f"Execution timed out after {timeout} seconds") from None
+
+        for capture in captures:
+            capture.close()
+
+        return self._output_fields(captures)
+
+    def _capture_buffered_output(
+        self, response: dict[str, Any], on_output: OutputCallback | None
+    ) -> dict[str, Any]:
+        """Apply output caps and the callback to output a worker buffered in memory."""
+        captures = self._new_output_captures()
+
+        for capture in captures:
+            text = response.get(capture.name, "")
+            if not text:
+                continue
+            capture.write(text.encode("utf-8", errors="replace"))
+            capture.close()
+            if on_output is not None:
+                on_output(OutputChunk(capture.name, text))
+
+        return self._output_fields(captures)
+
+    def _serialize_context(self, context: CapabilityContext | None) -> str | None:
+        """Serialize a capability context for a child process, or None."""
+        if not context:
+            return None
+
+        try:
+            return self.context_serializer.serialize_for_subprocess(context)
+        except Exception as e:
+            # Run without capabilities if serialization fails
+            print(f"Warning: Failed to serialize context: {e}", file=sys.stderr)
+            return None
+
+    def _bytecode_compatible(self) -> bool:
+        """Whether the sandbox interpreter can load code objects marshalled here."""
+        executable = self.config.python_executable
+        if not executable:
+            return True
+        return os.path.realpath(executable) == os.path.realpath(sys.executable)
+
+    def _get_bytecode(self, python_code: str) -> bytes | None:
+        """Cached marshalled code object for the program, or None to ship source only."""
+        if not self._bytecode_compatible():
+            return None
+        return get_compilation_cache().get_bytecode(python_code)
+
     def _create_execution_script(
-        self, python_code: str, context: CapabilityContext | None = None
+        self,
+        python_code: str,
+        context: CapabilityContext | None = None,
+        directory: Path | None = None,
     ) -> Path:
-        """Create the Python script to execute in subprocess."""
+        """Create the runner script and program files to execute in subprocess.
+
+        The program is written next to the script as source and, when the
+        sandbox interpreter matches this one, as a marshalled code object that
+        the runner executes without compiling. Files go to ``directory``,
+        defaulting to the sandbox's temp dir.
+        """
         script_template = '''#!/usr/bin/env python3
 """MLPy Sandbox Execution Script"""
 
+import os as _stdlib_os
 import sys
 import json as _stdlib_json
+import marshal as _stdlib_marshal
+import time as _stdlib_time
 import traceback
-import base64
-import pickle
-from pathlib import Path
-from typing import Any, Optional
+from importlib.util import MAGIC_NUMBER as _MLPY_MAGIC
 
 # Import mlpy runtime modules for safe execution (before any user code)
 # This must be at module level to avoid UnboundLocalError when user code
@@ -316,6 +927,14 @@ sys.path.insert(0, {runtime_path!r})
 # Capability context data (serialized)
 CAPABILITY_CONTEXT_DATA = {context_data}
 
+# Result channel file descriptor inherited from the host (-1 if unavailable)
+_MLPY_RESULT_FD = int(_stdlib_os.environ.get("MLPY_RESULT_FD", "-1"))
+
+# Program files written next to this script
+_MLPY_PROGRAM_DIR = _stdlib_os.path.dirname(_stdlib_os.path.abspath(__file__))
+_MLPY_PROGRAM_SOURCE = _stdlib_os.path.join(_MLPY_PROGRAM_DIR, {program_source!r})
+_MLPY_PROGRAM_BYTECODE = _stdlib_os.path.join(_MLPY_PROGRAM_DIR, {program_bytecode!r})
+
 def setup_capabilities():
     """Set up capability context in subprocess."""
     if CAPABILITY_CONTEXT_DATA and CAPABILITY_CONTEXT_DATA != "None":
@@ -334,40 +953,79 @@ def setup_capabilities():
         except Exception as e:
             print(f"Warning: Failed to set up capabilities: {{e}}", file=sys.stderr)
 
+def _mlpy_load_program():
+    """Load the marshalled program, compiling the source if none is usable."""
+    try:
+        with open(_MLPY_PROGRAM_BYTECODE, "rb") as f:
+            data = f.read()
+        if data[:len(_MLPY_MAGIC)] == _MLPY_MAGIC:
+            return _stdlib_marshal.loads(memoryview(data)[len(_MLPY_MAGIC):])
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+
+    with open(_MLPY_PROGRAM_SOURCE, encoding="utf-8") as f:
+        return compile(f.read(), {filename!r}, "exec")
+
+def _mlpy_report(success, payload, metadata):
+    """Report the outcome on the result channel, or as a stdout marker line."""
+    if _MLPY_RESULT_FD >= 0:
+        from mlpy.runtime.sandbox.result_channel import (
+            FRAME_ERROR,
+            FRAME_METADATA,
+            FRAME_RESULT,
+            write_frame,
+        )
+
+        write_frame(_MLPY_RESULT_FD, FRAME_METADATA, metadata)
+        write_frame(_MLPY_RESULT_FD, FRAME_RESULT if success else FRAME_ERROR, payload)
+        return
+
+    if success:
+        output = {{
+            "success": True,
+            "result": payload,
+            "type": str(type(payload).__name__) if payload is not None else None
+        }}
+    else:
+        output = {{"success": False, **payload}}
+
+    print("__MLPY_RESULT__", _stdlib_json.dumps(output, default=str))
+
 def main():
     """Main execution function."""
+    _mlpy_start = _stdlib_time.perf_counter()
+
     try:
         # Set up security context
         setup_capabilities()
 
-        # Execute the user code
-        result = None
+        # Execute the transpiled program in fresh globals
         exec_globals = {{
             "__name__": "__main__",
-            "__file__": "<sandbox>",
+            "__file__": {filename!r},
         }}
+        exec(_mlpy_load_program(), exec_globals)
+        result = exec_globals.get("result")
 
-        # Execute the transpiled Python code
-{code_block}
-
-        # Output result in JSON format
-        output = {{
-            "success": True,
-            "result": result,
-            "type": str(type(result).__name__) if result is not None else None
-        }}
-
-        print("__MLPY_RESULT__", _stdlib_json.dumps(output, default=str))
+        _mlpy_report(True, result, {{
+            "started": _mlpy_start,
+            "execution_time": _stdlib_time.perf_counter() - _mlpy_start,
+            "cpu_time": _stdlib_time.process_time(),
+            "result_type": type(result).__name__,
+        }})
 
     except Exception as e:
         error_output = {{
-            "success": False,
             "error": str(e),
             "error_type": type(e).__name__,
             "traceback": traceback.format_exc()
         }}
 
-        print("__MLPY_RESULT__", _stdlib_json.dumps(error_output, default=str))
+        _mlpy_report(False, error_output, {{
+            "started": _mlpy_start,
+            "execution_time": _stdlib_time.perf_counter() - _mlpy_start,
+            "cpu_time": _stdlib_time.process_time(),
+        }})
         sys.exit(1)
 
 if __name__ == "__main__":
@@ -375,31 +1033,35 @@ if __name__ == "__main__":
 '''
 
         # Serialize capability context for subprocess
-        context_data = "None"
-        if context:
-            try:
-                serialized = self.context_serializer.serialize_for_subprocess(context)
-                context_data = f'"{serialized}"'
-            except Exception as e:
-                # Use None if serialization fails
-                import sys
-                print(f"Warning: Failed to serialize context: {e}", file=sys.stderr)
-                pass
-
-        # Prepare code block (indented for exec)
-        code_lines = python_code.split("\n")
-        indented_code = "\n".join(f"        {line}" for line in code_lines)
+        serialized = self._serialize_context(context)
+        context_data = f'"{serialized}"' if serialized else "None"
+
+        # Write the program; drop bytecode left over from a previous execution
+        temp_dir = directory or Path(self._temp_dir.name)
+        source_path = temp_dir / "sandbox_program.py"
+        bytecode_path = temp_dir / "sandbox_program.bin"
+        source_path.write_text(python_code, encoding="utf-8")
+
+        bytecode = self._get_bytecode(python_code)
+        if bytecode is not None:
+            bytecode_path.write_bytes(bytecode)
+        else:
+            bytecode_path.unlink(missing_ok=True)
 
         # Get runtime path
         runtime_path = str(Path(__file__).parent.parent)
 
         # Format script
         script_content = script_template.format(
-            context_data=context_data, runtime_path=runtime_path, code_block=indented_code
+            context_data=context_data,
+            runtime_path=runtime_path,
+            program_source=source_path.name,
+            program_bytecode=bytecode_path.name,
+            filename=SANDBOX_FILENAME,
         )
 
         # Write script to temp file
-        script_path = Path(self._temp_dir.name) / "sandbox_execution.py"
+        script_path = temp_dir / "sandbox_execution.py"
         script_path.write_text(script_content, encoding="utf-8")
 
         return script_path
@@ -431,35 +1093,14 @@ if __name__ == "__main__":
 
     def _setup_subprocess_limits(self) -> None:
         """Set up resource limits for subprocess (Unix only)."""
-        if os.name == "nt":
-            return  # Not supported on Windows
-
-        import resource
-
-        limits = self._parse_resource_limits()
-
-        # Set memory limit
-        if limits.memory_limit > 0:
-            resource.setrlimit(resource.RLIMIT_AS, (limits.memory_limit, limits.memory_limit))
-
-        # Set CPU time limit
-        if limits.cpu_timeout > 0:
-            cpu_limit = int(limits.cpu_timeout) + 5  # Add buffer
-            resource.setrlimit(resource.RLIMIT_CPU, (cpu_limit, cpu_limit))
-
-        # Set file size limit
-        if limits.file_size_limit > 0:
-            resource.setrlimit(
-                resource.RLIMIT_FSIZE, (limits.file_size_limit, limits.file_size_limit)
-            )
-
-    def _monitor_resources(self) -> None:
-        """Monitor resource usage during execution."""
-        if self._process:
-            self.resource_monitor.start_monitoring(self._process.pid)
+        apply_resource_limits(self._parse_resource_limits())
 
     def _parse_execution_result(self, stdout: str) -> Any:
-        """Parse execution result from subprocess output."""
+        """Parse execution result from the legacy stdout marker line.
+
+        Only used when no result channel is available (Windows) or the child
+        died before writing to it.
+        """
         lines = stdout.split("\n")
 
         # Look for result marker
@@ -469,24 +1110,37 @@ if __name__ == "__main__":
                 try:
                     result_json = line[len("__MLPY_RESULT__") :].strip()
                     result_data = json.loads(result_json)
-
-                    if result_data.get("success", False):
-                        return result_data.get("result")
-                    else:
-                        # Execution failed
-                        error_msg = result_data.get("error", "Unknown error")
-                        traceback_msg = result_data.get("traceback", "")
-                        if traceback_msg:
-                            raise SandboxError(f"Code execution failed: {error_msg}\n\nTraceback:\n{traceback_msg}")
-                        else:
-                            raise SandboxError(f"Code execution failed: {error_msg}")
-
                 except json.JSONDecodeError:
-                    pass
+                    continue
+
+                return self._result_from_payload(result_data)
 
         # No result found, return None
         return None
 
+    @staticmethod
+    def _missing_result_error(exit_code: int | None) -> SandboxError:
+        """Error for a child that exited without writing its result frame.
+
+        Its stdout is not consulted: the program could print a forged marker.
+        """
+        return SandboxError(
+            f"Sandboxed process exited without reporting a result (exit code {exit_code})"
+        )
+
+    def _result_from_payload(self, result_data: dict[str, Any]) -> Any:
+        """Extract the return value from a result payload, raising on failure."""
+        if result_data.get("success", False):
+            return result_data.get("result")
+
+        # Execution failed
+        error_msg = result_data.get("error", "Unknown error")
+        traceback_msg = result_data.get("traceback", "")
+        if traceback_msg:
+            raise SandboxError(f"Code execution failed: {error_msg}\n\nTraceback:\n{traceback_msg}")
+        else:
+            raise SandboxError(f"Code execution failed: {error_msg}")
+
     def _get_traceback(self) -> str:
         """Get current exception traceback."""
         import traceback
@@ -0,0 +1,503 @@
+"""Long-lived sandbox worker process for pooled ML code execution.
+
+Run as ``python -m mlpy.runtime.sandbox.worker``. The worker imports the mlpy
+runtime once, then executes jobs received as length-prefixed frames on stdin
+and answers with frames on its original stdout. Frame payloads use the result
+channel's typed binary encoding (``encode_value``), so return values keep their
+types. User output is captured per job so it never mixes with the protocol
+stream.
+
+A batch request runs many independent units back to back, each in fresh
+globals with its own capability context and time budget, and answers with
+one frame per unit.
+
+With ``--fork-server`` the worker instead runs one program's prelude (imports
+and top-level definitions) once and ``os.fork()``s a child from that snapshot
+for every invocation.
+"""
+
+import ast
+import io
+import os
+import selectors
+import signal
+import struct
+import sys
+import time
+import traceback
+from contextlib import redirect_stderr, redirect_stdout
+from types import CodeType
+from typing import Any, BinaryIO
+
+from mlpy.runtime.sandbox.bytecode import SANDBOX_FILENAME, load_bytecode
+from mlpy.runtime.sandbox.result_channel import ResultChannelError, decode_value, encode_value
+
+_HEADER = struct.Struct(">I")
+
+# Modules every transpiled program imports; loaded once when the worker starts
+PRELOAD_MODULES = (
+    "mlpy.runtime.whitelist_validator",
+    "mlpy.runtime.capabilities.context",
+    "mlpy.runtime.sandbox.context_serializer",
+    "mlpy.stdlib.builtin",
+    "mlpy.stdlib.runtime_helpers",
+)
+
+
+class WorkerProtocolError(Exception):
+    """Exception raised when the worker pipe is closed or corrupted."""
+
+    pass
+
+
+def send_message(stream: BinaryIO, message: dict[str, Any]) -> None:
+    """Write one length-prefixed frame to a binary stream."""
+    payload = encode_value(message)
+    data = memoryview(_HEADER.pack(len(payload)) + payload)
+    # Unbuffered pipes may accept only part of a large frame per write
+    while data:
+        written = stream.write(data)
+        data = data[written:]
+    stream.flush()
+
+
+def recv_message(stream: BinaryIO, timeout: float | None = None) -> dict[str, Any]:
+    """Read one length-prefixed frame from a binary stream.
+
+    Raises:
+        TimeoutError: If ``timeout`` is given and no frame starts arriving in time
+        WorkerProtocolError: If the stream ends before a full frame is read
+    """
+    if timeout is not None and timeout > 0:
+        with selectors.DefaultSelector() as selector:
+            selector.register(stream, selectors.EVENT_READ)
+            if not selector.select(timeout):
+                raise TimeoutError(f"No response within {timeout} seconds")
+
+    header = _read_exact(stream, _HEADER.size)
+    (length,) = _HEADER.unpack(header)
+    try:
+        return decode_value(_read_exact(stream, length))
+    except ResultChannelError as e:
+        raise WorkerProtocolError(f"Corrupt worker frame: {e}") from e
+
+
+def _read_exact(stream: BinaryIO, size: int) -> bytes:
+    """Read exactly ``size`` bytes or raise if the stream ends early."""
+    chunks = []
+    remaining = size
+    while remaining:
+        chunk = stream.read(remaining)
+        if not chunk:
+            raise WorkerProtocolError("Worker pipe closed")
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b"".join(chunks)
+
+
+def _set_cpu_budget(cpu_limit: float) -> None:
+    """Give the next job a fresh RLIMIT_CPU budget on top of CPU already used."""
+    if os.name == "nt" or cpu_limit <= 0:
+        return
+
+    import resource
+
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    used = int(usage.ru_utime + usage.ru_stime)
+    _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+    soft = used + int(cpu_limit) + 5  # Same buffer as MLSandbox._setup_subprocess_limits
+    if hard != resource.RLIM_INFINITY:
+        soft = min(soft, hard)
+    resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+
+
+def _setup_capabilities(context_data: str | None) -> None:
+    """Install the job's capability context, replacing any previous one."""
+    from mlpy.runtime.capabilities.context import set_current_context
+
+    context = None
+    if context_data:
+        try:
+            from mlpy.runtime.sandbox.context_serializer import CapabilityContextSerializer
+
+            context = CapabilityContextSerializer().deserialize_from_subprocess(context_data)
+        except Exception as e:
+            print(f"Warning: Failed to set up capabilities: {e}", file=sys.stderr)
+
+    set_current_context(context)
+
+
+def execute_job(request: dict[str, Any]) -> dict[str, Any]:
+    """Execute one job in fresh globals and return the response frame.
+
+    Jobs carry the program's source and, when the host runs the same Python
+    version, its marshalled code object; the source is only compiled if the
+    bytecode is missing or unusable.
+    """
+    exec_globals: dict[str, Any] = {"__name__": "__main__", "__file__": SANDBOX_FILENAME}
+    code = load_bytecode(request["bytecode"]) if request.get("bytecode") else None
+    return run_code(code or request["code"], exec_globals, request.get("context"))
+
+
+class _UnitTimeout(BaseException):
+    """Raised inside a batch unit when its time budget runs out.
+
+    Derives from BaseException so ``except Exception`` in user code cannot
+    swallow it.
+    """
+
+    pass
+
+
+def _raise_unit_timeout(signum, frame) -> None:
+    """SIGALRM handler for batch units."""
+    raise _UnitTimeout()
+
+
+def _load_batch_programs(programs: list[dict[str, Any]]) -> list[CodeType | str]:
+    """Code objects for each batch program, falling back to source text."""
+    loaded = []
+    for program in programs:
+        code = load_bytecode(program["bytecode"]) if program.get("bytecode") else None
+        loaded.append(code or program["code"])
+    return loaded
+
+
+def execute_batch_unit(
+    code: CodeType | str,
+    inputs: dict[str, Any] | None,
+    context_data: str | None,
+    timeout: float,
+) -> dict[str, Any]:
+    """Run one batch unit in fresh globals under a wall-clock ``timeout``."""
+    exec_globals: dict[str, Any] = {"__name__": "__main__", "__file__": SANDBOX_FILENAME}
+    exec_globals.update(inputs or {})
+    use_timer = timeout > 0 and hasattr(signal, "setitimer")
+    start = time.perf_counter()
+
+    try:
+        try:
+            if use_timer:
+                signal.setitimer(signal.ITIMER_REAL, timeout)
+            response = run_code(code, exec_globals, context_data)
+        finally:
+            if use_timer:
+                signal.setitimer(signal.ITIMER_REAL, 0)
+    except _UnitTimeout:
+        _setup_capabilities(None)
+        response = {"success": False, "timed_out": True, "error": "Execution timed out"}
+
+    response["execution_time"] = time.perf_counter() - start
+    return response
+
+
+def run_code(
+    code: str | CodeType, exec_globals: dict[str, Any], context_data: str | None
+) -> dict[str, Any]:
+    """Run code under a capability context, capturing output and the result.
+
+    ``exit_code`` is the status the one-shot runner script would exit with. A
+    program that calls ``sys.exit()`` ends like it would there, without a
+    result, and is flagged ``exited``.
+    """
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+
+    with redirect_stdout(stdout), redirect_stderr(stderr):
+        try:
+            _setup_capabilities(context_data)
+
+            if isinstance(code, str):
+                code = compile(code, SANDBOX_FILENAME, "exec")
+            exec(code, exec_globals)
+
+            result = exec_globals.get("result")
+            output = {
+                "success": True,
+                "result": result,
+                "type": str(type(result).__name__) if result is not None else None,
+                "exit_code": 0,
+            }
+        except SystemExit as e:
+            exit_code = _exit_status(e.code)
+            output = {
+                "success": False,
+                "exited": True,
+                "exit_code": exit_code,
+                "error": f"Program exited with status {exit_code}",
+            }
+        except Exception as e:
+            output = {
+                "success": False,
+                "error": str(e),
+                "error_type": type(e).__name__,
+                "traceback": traceback.format_exc(),
+                "exit_code": 1,
+            }
+        finally:
+            _setup_capabilities(None)
+
+    output["stdout"] = stdout.getvalue()
+    output["stderr"] = stderr.getvalue()
+    return output
+
+
+def _exit_status(code: Any) -> int:
+    """The process exit status ``sys.exit(code)`` would produce."""
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    print(code, file=sys.stderr)
+    return 1
+
+
+def _purge_job_modules(baseline: set[str]) -> None:
+    """Drop user modules imported by the last job so the next job starts clean.
+
+    mlpy and Python standard library modules stay loaded; they are the warm
+    state the pool exists to keep.
+    """
+    for name in list(sys.modules):
+        if name in baseline:
+            continue
+        top_level = name.partition(".")[0]
+        if top_level == "mlpy" or top_level in sys.stdlib_module_names:
+            continue
+        del sys.modules[name]
+
+
+def _open_protocol_streams() -> tuple[BinaryIO, BinaryIO]:
+    """Take over stdin/stdout for the protocol.
+
+    The real stdout is kept for frames and fd 1 is pointed at devnull so stray
+    writes from user code can never corrupt a frame.
+    """
+    proto_out = os.fdopen(os.dup(sys.stdout.fileno()), "wb")
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, sys.stdout.fileno())
+    os.close(devnull)
+    return sys.stdin.buffer, proto_out
+
+
+def main() -> None:
+    """Worker main loop."""
+    proto_in, proto_out = _open_protocol_streams()
+
+    for module_name in PRELOAD_MODULES:
+        __import__(module_name)
+
+    baseline_modules = set(sys.modules)
+    baseline_path = list(sys.path)
+    cpu_limit = float(os.environ.get("MLPY_SANDBOX_CPU_LIMIT", "0"))
+    if hasattr(signal, "SIGALRM"):
+        signal.signal(signal.SIGALRM, _raise_unit_timeout)
+
+    send_message(proto_out, {"ready": True, "pid": os.getpid()})
+
+    while True:
+        try:
+            request = recv_message(proto_in)
+        except WorkerProtocolError:
+            break
+
+        if request.get("shutdown"):
+            break
+
+        if "batch" in request:
+            # One response frame per unit, so the host keeps finished units if we die
+            programs = _load_batch_programs(request["programs"])
+            for unit in request["batch"]:
+                _set_cpu_budget(cpu_limit)
+                cpu_start = time.process_time()
+                response = execute_batch_unit(
+                    programs[unit["program"]],
+                    unit.get("inputs"),
+                    request.get("context"),
+                    request.get("timeout", 0.0),
+                )
+                response["cpu_time"] = time.process_time() - cpu_start
+                _purge_job_modules(baseline_modules)
+                sys.path[:] = baseline_path
+                send_message(proto_out, response)
+            continue
+
+        _set_cpu_budget(cpu_limit)
+        cpu_start = time.process_time()
+        response = execute_job(request)
+        response["cpu_time"] = time.process_time() - cpu_start
+        _purge_job_modules(baseline_modules)
+        sys.path[:] = baseline_path
+        send_message(proto_out, response)
+
+
+_PRELUDE_NODES = (ast.Import, ast.ImportFrom, ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+
+
+def _is_path_setup(node: ast.stmt) -> bool:
+    """Check for the generated user-module ``sys.path`` setup statements."""
+    if isinstance(node, ast.Assign):
+        return any(isinstance(t, ast.Name) and t.id == "_source_dir" for t in node.targets)
+
+    if isinstance(node, ast.If):
+        return any(
+            isinstance(sub, ast.Attribute)
+            and sub.attr == "path"
+            and isinstance(sub.value, ast.Name)
+            and sub.value.id == "sys"
+            for sub in ast.walk(node.test)
+        )
+
+    return False
+
+
+def split_prelude(module: ast.Module) -> tuple[ast.Module, ast.Module]:
+    """Split a transpiled program into its prelude and per-invocation body.
+
+    The prelude holds top-level imports, function and class definitions and
+    the generated ``sys.path`` setup. A definition stays in the body if its
+    name is bound more than once at top level, since hoisting it could change
+    which binding earlier statements see. Line numbers are preserved.
+    """
+    bound_names: dict[str, int] = {}
+    for node in module.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            names = [node.name]
+        elif isinstance(node, (ast.Assign, ast.AugAssign, ast.AnnAssign)):
+            targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+            names = [
+                t.id for target in targets for t in ast.walk(target) if isinstance(t, ast.Name)
+            ]
+        else:
+            continue
+        for name in names:
+            bound_names[name] = bound_names.get(name, 0) + 1
+
+    prelude: list[ast.stmt] = []
+    body: list[ast.stmt] = []
+    for node in module.body:
+        if isinstance(node, (ast.Import, ast.ImportFrom)) or _is_path_setup(node):
+            prelude.append(node)
+        elif isinstance(node, _PRELUDE_NODES) and bound_names.get(node.name) == 1:
+            prelude.append(node)
+        else:
+            body.append(node)
+
+    return ast.Module(body=prelude, type_ignores=[]), ast.Module(body=body, type_ignores=[])
+
+
+def _apply_limits(limits: dict[str, Any], cpu: bool = True) -> None:
+    """Apply rlimits sent by the host using the sandbox's limit rules."""
+    from mlpy.runtime.sandbox.resource_monitor import ResourceLimits, apply_resource_limits
+
+    apply_resource_limits(
+        ResourceLimits(
+            memory_limit=limits.get("memory_limit", 0),
+            cpu_timeout=limits.get("cpu_timeout", 0.0) if cpu else 0.0,
+            file_size_limit=limits.get("file_size_limit", 0),
+        )
+    )
+
+
+def _fork_invocation(
+    body: CodeType,
+    prelude_globals: dict[str, Any],
+    request: dict[str, Any],
+    limits: dict[str, Any],
+) -> dict[str, Any]:
+    """Fork a child from the prelude snapshot and run one invocation in it."""
+    read_fd, write_fd = os.pipe()
+    start = time.perf_counter()
+    pid = os.fork()
+
+    if pid == 0:
+        # Child: the prelude globals are already a private copy-on-write snapshot
+        os.close(read_fd)
+        status = 0
+        try:
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            _apply_limits(limits)
+            prelude_globals.update(request.get("inputs") or {})
+            response = run_code(body, prelude_globals, request.get("context"))
+            with os.fdopen(write_fd, "wb") as result_stream:
+                send_message(result_stream, response)
+        except BaseException:
+            status = 1
+        finally:
+            os._exit(status)
+
+    os.close(write_fd)
+    timeout = limits.get("cpu_timeout", 0.0)
+
+    with os.fdopen(read_fd, "rb") as result_stream:
+        try:
+            response = recv_message(result_stream, timeout=timeout)
+        except TimeoutError:
+            os.kill(pid, signal.SIGKILL)
+            response = {"success": False, "timed_out": True, "error": "Execution timed out"}
+        except WorkerProtocolError:
+            response = None
+
+    _, wait_status, rusage = os.wait4(pid, 0)
+    if response is None:
+        exit_code = os.waitstatus_to_exitcode(wait_status)
+        response = {
+            "success": False,
+            "crashed": True,
+            "exit_code": exit_code,
+            "error": f"Invocation process exited unexpectedly (code {exit_code})",
+        }
+
+    # Exact figures for this invocation, taken when the child was reaped
+    from mlpy.runtime.sandbox.resource_monitor import rusage_usage
+
+    response["usage"] = rusage_usage(rusage, time.perf_counter() - start)
+    return response
+
+
+def fork_server_main() -> None:
+    """Fork-server main loop: run the prelude once, fork per invocation."""
+    proto_in, proto_out = _open_protocol_streams()
+
+    for module_name in PRELOAD_MODULES:
+        __import__(module_name)
+
+    setup = recv_message(proto_in)
+    limits = setup.get("limits", {})
+    prelude_globals: dict[str, Any] = {"__name__": "__main__", "__file__": SANDBOX_FILENAME}
+
+    try:
+        prelude, body = split_prelude(ast.parse(setup["code"], SANDBOX_FILENAME))
+        body_code = compile(body, SANDBOX_FILENAME, "exec")
+
+        # The prelude runs user-module top-level code, so it gets the same
+        # memory and file limits as an invocation; CPU is bounded by the host
+        # timeout since this process must outlive any single CPU budget.
+        _apply_limits(limits, cpu=False)
+        response = run_code(compile(prelude, SANDBOX_FILENAME, "exec"), prelude_globals, None)
+    except SyntaxError as e:
+        response = {"success": False, "error": str(e), "error_type": "SyntaxError"}
+
+    if not response["success"]:
+        send_message(proto_out, response)
+        return
+
+    send_message(proto_out, {"ready": True, "pid": os.getpid()})
+
+    while True:
+        try:
+            request = recv_message(proto_in)
+        except WorkerProtocolError:
+            break
+
+        if request.get("shutdown"):
+            break
+
+        send_message(proto_out, _fork_invocation(body_code, prelude_globals, request, limits))
+
+
+if __name__ == "__main__":
+    if "--fork-server" in sys.argv[1:]:
+        fork_server_main()
+    else:
+        main()
@@ -7,6 +7,7 @@ Key Features:
 - Whitelist enforcement via decorator checking
 - Runtime capability validation
 - Thread-safe capability context management
+- Per-function decision cache for repeat calls
 - Clear error messages for debugging
 
 Author: mlpy development team
@@ -16,6 +17,7 @@ License: MIT
 
 from typing import Any, Callable, List
 import threading
+import weakref
 
 
 class SecurityError(Exception):
@@ -45,6 +47,36 @@ _capability_context = threading.local()
 _SAFE_BUILTIN_TYPES = (str, list, dict, int, float, bool, tuple, set, frozenset)
 
 
+# Call decisions keyed by id() of the function, or of the underlying function
+# for bound methods. Each entry holds the required capabilities (an empty tuple
+# when none) or _BLOCKED, plus a weak reference whose callback drops the entry
+# when the function is collected, before its id can be reused.
+_call_decisions: dict[int, tuple[Any, weakref.ref]] = {}
+_BLOCKED = object()
+_CALL_DECISIONS_LIMIT = 8192
+
+
+def clear_call_decisions() -> None:
+    """Forget all cached safe_call decisions."""
+    _call_decisions.clear()
+
+
+def _remember_decision(func: Callable, decision: Any) -> None:
+    """Cache the decision for ``func`` if it holds for every later call."""
+    key = getattr(func, '__func__', func)
+    if key is func and hasattr(func, '__self__') and decision is not _BLOCKED:
+        # Bound built-in methods ("abc".upper) are created on every access
+        return
+    if len(_call_decisions) >= _CALL_DECISIONS_LIMIT:
+        _call_decisions.clear()
+    key_id = id(key)
+    try:
+        ref = weakref.ref(key, lambda _, key_id=key_id: _call_decisions.pop(key_id, None))
+    except TypeError:
+        return  # Not weak-referenceable; decide again on every call
+    _call_decisions[key_id] = (decision, ref)
+
+
 def get_current_capability_context():
     """Get the current capability context for this thread.
 
@@ -180,6 +212,23 @@ def safe_call(func: Callable, *args, **kwargs) -> Any:
         - Enforces capability requirements at runtime
         - Prevents sandbox escape via dynamic calls
     """
+    entry = _call_decisions.get(id(getattr(func, '__func__', func)))
+    if entry is not None:
+        required_caps = entry[0]
+        if required_caps:
+            if required_caps is _BLOCKED:
+                # A bound method may still be allowed through its receiver
+                if getattr(func, '__func__', func) is func:
+                    raise _blocked_error(func)
+                return _safe_call_uncached(func, args, kwargs)
+            check_capabilities(required_caps)
+        return func(*args, **kwargs)
+
+    return _safe_call_uncached(func, args, kwargs)
+
+
+def _safe_call_uncached(func: Callable, args: tuple, kwargs: dict) -> Any:
+    """Run the full validation chain for ``func`` and cache the outcome."""
     # Step 1: Type validation
     if not callable(func):
         func_type = type(func).__name__
@@ -197,6 +246,7 @@ def safe_call(func: Callable, *args, **kwargs) -> Any:
         required_caps = metadata.capabilities if hasattr(metadata, 'capabilities') else []
         if required_caps is None:
             required_caps = []
+        _remember_decision(func, tuple(required_caps))
 
         # Validate capabilities if any are required
         if required_caps:
@@ -211,6 +261,7 @@ def safe_call(func: Callable, *args, **kwargs) -> Any:
         # User-defined functions are trusted within the same file
         # They don't need decoration or capability checks
         # (Capability checks happen at @ml_function boundaries inside them)
+        _remember_decision(func, ())
         return func(*args, **kwargs)
 
     # Step 4: Check if method on safe built-in type
@@ -239,10 +290,17 @@ def safe_call(func: Callable, *args, **kwargs) -> Any:
             return func(*args, **kwargs)
 
     # Step 6: Not whitelisted → BLOCK
+    _remember_decision(func, _BLOCKED)
+    raise _blocked_error(func)
+
+
+def _blocked_error(func: Callable) -> SecurityError:
+    """Build the SecurityError for a call that is not whitelisted."""
     func_name = getattr(func, '__name__', '<unknown>')
+    func_module = getattr(func, '__module__', None)
     func_module_str = func_module if func_module else '<unknown>'
 
-    raise SecurityError(
+    return SecurityError(
         f"SecurityError: Cannot call '{func_name}' from module '{func_module_str}'\n"
         f"\n"
         f"This function is NOT decorated with @ml_function.\n"
@@ -273,4 +331,5 @@ __all__ = [
     'get_current_capability_context',
     'set_capability_context',
     'check_capabilities',
+    'clear_call_decisions',
 ]
@@ -24,6 +24,7 @@ import io
 from typing import Any, List, Dict, Optional, Union
 
 from mlpy.stdlib.decorators import ml_module, ml_function
+from mlpy.stdlib.runtime_helpers import MLObject
 
 
 @ml_module(
@@ -74,7 +75,7 @@ class CSV:
                 for row in reader:
                     if len(row) == 0:  # Skip empty rows
                         continue
-                    obj = {}
+                    obj = MLObject()
                     for i, value in enumerate(row):
                         if i < len(header_row):
                             obj[header_row[i]] = value
@@ -171,7 +172,7 @@ class CSV:
             for row in reader:
                 if len(row) == 0:
                     continue
-                obj = {}
+                obj = MLObject()
                 for i, value in enumerate(row):
                     if i < len(header_row):
                         obj[header_row[i]] = value
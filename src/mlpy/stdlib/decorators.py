@@ -23,6 +23,7 @@ Usage:
 
 from typing import Any, Callable, List, Optional, Type
 from functools import wraps
+import weakref
 
 
 # Global registry of all ML modules
@@ -31,6 +32,10 @@ _MODULE_REGISTRY = {}
 # Flag to enable/disable capability validation (for testing and migration)
 _CAPABILITY_VALIDATION_ENABLED = False
 
+# Classes decorated with @ml_module or @ml_class. Their @ml_function methods
+# are swapped for validating wrappers while capability validation is enabled.
+_ML_CLASSES: "weakref.WeakSet[Type]" = weakref.WeakSet()
+
 
 class ModuleMetadata:
     """Metadata for an ML module."""
@@ -160,6 +165,7 @@ def ml_module(
         # Attach metadata to class
         cls._ml_module_metadata = metadata
         cls._ml_module_name = name
+        _ML_CLASSES.add(cls)
 
         # Register in global registry
         _MODULE_REGISTRY[name] = cls
@@ -210,30 +216,70 @@ def ml_function(
         # Attach metadata to function
         func._ml_function_metadata = metadata
 
-        # Wrap function to preserve behavior
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            # Optional capability validation (disabled by default for backward compatibility)
-            if _CAPABILITY_VALIDATION_ENABLED and metadata.capabilities:
-                # Check if capability_context is provided in kwargs
-                capability_context = kwargs.pop('_capability_context', None)
+        # Methods of @ml_module/@ml_class classes are called directly and get
+        # the validating wrapper only while validation is enabled. Standalone
+        # functions have no class to swap it into, so they always keep the
+        # wrapper, which checks the flag on each call.
+        if _CAPABILITY_VALIDATION_ENABLED or not _defined_in_class(func):
+            return _validating_wrapper(func)
+        return func
+
+    return decorator
 
-                if capability_context is not None:
-                    # Validate all required capabilities
-                    for cap_type in metadata.capabilities:
-                        if not capability_context.has_capability(cap_type):
-                            raise PermissionError(
-                                f"Missing required capability '{cap_type}' for {func.__name__}()"
-                            )
 
-            return func(*args, **kwargs)
+def _defined_in_class(func: Callable) -> bool:
+    """Check whether ``func`` is being defined in a class body."""
+    scope, _, _ = getattr(func, "__qualname__", "").rpartition(".")
+    return bool(scope) and not scope.endswith("<locals>")
 
-        # Transfer metadata to wrapper
-        wrapper._ml_function_metadata = metadata
 
-        return wrapper
+def _validating_wrapper(func: Callable) -> Callable:
+    """Wrap an @ml_function to check the _capability_context kwarg.
 
-    return decorator
+    Functions without required capabilities are returned unchanged.
+    """
+    metadata = func._ml_function_metadata
+    if not metadata.capabilities:
+        return func
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        if _CAPABILITY_VALIDATION_ENABLED:
+            # Check if capability_context is provided in kwargs
+            capability_context = kwargs.pop('_capability_context', None)
+
+            if capability_context is not None:
+                # Validate all required capabilities
+                for cap_type in metadata.capabilities:
+                    if not capability_context.has_capability(cap_type):
+                        raise PermissionError(
+                            f"Missing required capability '{cap_type}' for {func.__name__}()"
+                        )
+
+        return func(*args, **kwargs)
+
+    # Transfer metadata to wrapper
+    wrapper._ml_function_metadata = metadata
+    wrapper._ml_validating_wrapper = True
+
+    return wrapper
+
+
+def _install_validating_wrappers(enabled: bool) -> None:
+    """Swap validating wrappers in or out of every registered ML class."""
+    for cls in list(_ML_CLASSES):
+        for attr_name, attr in list(vars(cls).items()):
+            if not hasattr(attr, "_ml_function_metadata"):
+                continue
+            is_wrapper = getattr(attr, "_ml_validating_wrapper", False)
+            if enabled and not is_wrapper:
+                replacement = _validating_wrapper(attr)
+            elif not enabled and is_wrapper:
+                replacement = attr.__wrapped__
+            else:
+                continue
+            if replacement is not attr:
+                setattr(cls, attr_name, replacement)
 
 
 def ml_class(
@@ -279,6 +325,7 @@ def ml_class(
 
         # Attach metadata to class
         cls._ml_class_metadata = metadata
+        _ML_CLASSES.add(cls)
 
         return cls
 
@@ -317,16 +364,19 @@ def enable_capability_validation() -> None:
     """Enable capability validation for all @ml_function decorated functions.
 
     When enabled, functions will check for required capabilities in the
-    _capability_context kwarg before execution.
+    _capability_context kwarg before execution. Takes effect immediately for
+    functions decorated earlier, without re-decorating them.
     """
     global _CAPABILITY_VALIDATION_ENABLED
     _CAPABILITY_VALIDATION_ENABLED = True
+    _install_validating_wrappers(True)
 
 
 def disable_capability_validation() -> None:
     """Disable capability validation (default state for backward compatibility)."""
     global _CAPABILITY_VALIDATION_ENABLED
     _CAPABILITY_VALIDATION_ENABLED = False
+    _install_validating_wrappers(False)
 
 
 def is_capability_validation_enabled() -> bool:
@@ -32,6 +32,7 @@ Usage in ML:
 import json as _json  # Use underscore to avoid naming collision with ML 'json' object
 from typing import Any
 from mlpy.stdlib.decorators import ml_module, ml_function
+from mlpy.stdlib.runtime_helpers import MLObject
 
 
 def _validate_depth(obj: Any, max_depth: int, current_depth: int = 0) -> None:
@@ -100,7 +101,7 @@ class JSON:
             num = json.parse('42')
         """
         try:
-            return _json.loads(json_string)
+            return _json.loads(json_string, object_hook=MLObject)
         except (_json.JSONDecodeError, TypeError) as e:
             raise ValueError(f"JSON parsing failed: {e}")
 
@@ -132,7 +133,7 @@ class JSON:
             max_depth = 100
 
         try:
-            result = _json.loads(json_string)
+            result = _json.loads(json_string, object_hook=MLObject)
             _validate_depth(result, max_depth)
             return result
         except (_json.JSONDecodeError, TypeError) as e:
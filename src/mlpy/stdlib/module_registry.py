@@ -137,18 +137,16 @@ class ModuleMetadata:
     def _load_ml_module(self) -> Optional[object]:
         """Load an ML source module by transpiling and importing."""
         import time
-        from mlpy.ml.transpiler import MLTranspiler
+        from mlpy.ml.transpiler import ml_transpiler
 
         start = time.perf_counter()
 
         try:
             # Check if recompilation needed
             if self.needs_recompilation():
-                # Transpile ML source to Python
-                transpiler = MLTranspiler()
-
+                # Transpile ML source to Python with the shared transpiler
                 source_code = self.file_path.read_text(encoding='utf-8')
-                python_code, issues, source_map = transpiler.transpile_to_python(
+                python_code, issues, source_map = ml_transpiler.transpile_to_python(
                     source_code,
                     source_file=str(self.file_path)
                 )
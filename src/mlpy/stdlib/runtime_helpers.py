@@ -4,10 +4,16 @@ Provides runtime functions that enable secure Python-style attribute access
 from transpiled ML code, with comprehensive type validation and security checks.
 """
 
+import inspect
 import types
+from collections.abc import Callable
 from typing import Any
 
-from ..ml.codegen.safe_attribute_registry import AttributeAccessType, get_safe_registry
+from ..ml.codegen.safe_attribute_registry import (
+    AttributeAccessType,
+    add_change_listener,
+    get_safe_registry,
+)
 
 
 class SecurityError(Exception):
@@ -16,6 +22,35 @@ class SecurityError(Exception):
     pass
 
 
+class MLObject(dict):
+    """Dictionary holding an ML object.
+
+    Object literals in generated code, and the objects returned by the JSON
+    and CSV bridges, are built as MLObject so the helpers below recognize
+    them with one type check. Plain dicts with string keys are still treated
+    as ML objects, at the cost of scanning their keys.
+    """
+
+    __slots__ = ()
+
+
+# Inline caches: (receiver type, name) -> handler(obj, *args, **kwargs).
+# Only decisions that depend on the receiver's type alone are cached; both
+# caches are cleared whenever SafeAttributeRegistry registrations change.
+_attr_access_cache: dict[tuple[type, str], Callable[..., Any]] = {}
+_method_call_cache: dict[tuple[type, str], Callable[..., Any]] = {}
+_INLINE_CACHE_LIMIT = 4096
+
+
+def clear_inline_caches() -> None:
+    """Forget all cached attribute access and method call decisions."""
+    _attr_access_cache.clear()
+    _method_call_cache.clear()
+
+
+add_change_listener(clear_inline_caches)
+
+
 def safe_attr_access(obj: Any, attr_name: str, *args, **kwargs) -> Any:
     """
     Runtime helper for safe attribute access with type checking.
@@ -33,53 +68,49 @@ def safe_attr_access(obj: Any, attr_name: str, *args, **kwargs) -> Any:
         SecurityError: If access to dangerous attribute is attempted
         AttributeError: If attribute is not accessible on this type
     """
-    registry = get_safe_registry()
     obj_type = type(obj)
-
-    # Special case: ML objects (dicts with string keys) use dictionary access
-    if is_ml_object(obj):
-        # For ML objects, use dictionary access
-        # Return None for missing keys (similar to JavaScript undefined)
+    if obj_type is MLObject:
+        # ML object properties; None for missing keys (like JavaScript undefined)
         return obj.get(attr_name, None)
 
-    # Special case: Allow attribute access on Python modules (for user-defined modules)
-    if isinstance(obj, types.ModuleType):
-        # Allow attribute access on modules - this enables user module imports
-        pass
-    # Special case: Allow attribute access on user module classes (inline mode)
-    elif hasattr(obj, '_ml_user_module') or hasattr(obj_type, '_ml_user_module'):
-        # This is a user module namespace class (created in inline mode)
-        pass
-    # Check if access is safe for built-in types or @ml_class decorated objects
-    elif hasattr(obj_type, '_ml_class_metadata'):
-        # Object is from @ml_class - allow attribute access
-        pass
-    elif not registry.is_safe_access(obj_type, attr_name):
+    handler = _attr_access_cache.get((obj_type, attr_name))
+    if handler is None:
+        handler = _resolve_attr_access(obj, attr_name)
+    return handler(obj, *args, **kwargs)
+
+
+def _resolve_attr_access(obj: Any, attr_name: str) -> Callable[..., Any]:
+    """Decide how ``obj.attr_name`` is read and cache the decision."""
+    obj_type = type(obj)
+
+    # Special case: ML objects (dicts with string keys) use dictionary access
+    if obj_type is MLObject or is_ml_object(obj):
+        handler = _ml_property_getter(attr_name)
+
+    # Modules, user module classes and @ml_class objects allow attribute access;
+    # built-in types must whitelist the attribute
+    elif not _is_open_receiver(obj, obj_type) and not get_safe_registry().is_safe_access(
+        obj_type, attr_name
+    ):
         if attr_name.startswith("__") and attr_name.endswith("__"):
-            raise SecurityError(f"Access to dangerous attribute '{attr_name}' is forbidden")
+            handler = _denied(
+                SecurityError, f"Access to dangerous attribute '{attr_name}' is forbidden"
+            )
         else:
-            raise AttributeError(
-                f"'{obj_type.__name__}' object has no accessible attribute '{attr_name}'"
+            handler = _denied(
+                AttributeError,
+                f"'{obj_type.__name__}' object has no accessible attribute '{attr_name}'",
             )
 
     # Special handling for length property - map to len() function
-    if attr_name == "length":
-        return get_safe_length(obj)
+    elif attr_name == "length":
+        handler = _length_handler
 
-    # Perform the actual access
-    try:
-        attr = getattr(obj, attr_name)
-        if callable(attr):
-            # If we have args/kwargs, call the method immediately
-            if args or kwargs:
-                return attr(*args, **kwargs)
-            else:
-                # Return a wrapper that will call the method when invoked
-                return lambda *a, **kw: attr(*a, **kw)
-        return attr
-    except AttributeError:
-        # This shouldn't happen if our whitelist is correct, but handle gracefully
-        raise AttributeError(f"'{obj_type.__name__}' object has no attribute '{attr_name}'")
+    else:
+        handler = _attribute_getter(obj_type, attr_name)
+
+    _cache_handler(_attr_access_cache, obj, obj_type, attr_name, handler)
+    return handler
 
 
 def safe_method_call(obj: Any, method_name: str, *args, **kwargs) -> Any:
@@ -95,62 +126,161 @@ def safe_method_call(obj: Any, method_name: str, *args, **kwargs) -> Any:
     Returns:
         Result of method call
     """
-    registry = get_safe_registry()
+    handler = _method_call_cache.get((type(obj), method_name))
+    if handler is None:
+        handler = _resolve_method_call(obj, method_name)
+    return handler(obj, *args, **kwargs)
+
+
+def _resolve_method_call(obj: Any, method_name: str) -> Callable[..., Any]:
+    """Decide how ``obj.method_name(...)`` is called and cache the decision."""
     obj_type = type(obj)
 
     # Special case: ML objects (dicts) with function properties
     # For ML objects, obj.method(args) means: get obj['method'] and call it
-    if is_ml_object(obj):
-        # Access the property from the dict
+    if obj_type is MLObject or is_ml_object(obj):
+        handler = _ml_property_caller(method_name)
+
+    # Modules, user module classes and @ml_class objects allow method calls
+    # (@ml_class methods carry @ml_function); built-in types must whitelist the method
+    elif not _is_open_receiver(obj, obj_type) and not _is_whitelisted_method(
+        obj_type, method_name
+    ):
+        handler = _denied(
+            AttributeError,
+            f"'{obj_type.__name__}' object has no accessible method '{method_name}'",
+        )
+
+    # Special handling for length
+    elif method_name == "length":
+        handler = _length_handler
+
+    else:
+        handler = _unbound_method(obj, obj_type, method_name) or _method_caller(
+            obj_type, method_name
+        )
+
+    _cache_handler(_method_call_cache, obj, obj_type, method_name, handler)
+    return handler
+
+
+def _is_open_receiver(obj: Any, obj_type: type) -> bool:
+    """Check for receivers whose attributes are not subject to the registry."""
+    return (
+        isinstance(obj, types.ModuleType)
+        or hasattr(obj, "_ml_user_module")
+        or hasattr(obj_type, "_ml_user_module")
+        or hasattr(obj_type, "_ml_class_metadata")
+    )
+
+
+def _is_whitelisted_method(obj_type: type, method_name: str) -> bool:
+    """Check the SafeAttributeRegistry for a method on a built-in type."""
+    attr_info = get_safe_registry().get_attribute_info(obj_type, method_name)
+    return attr_info is not None and attr_info.access_type == AttributeAccessType.METHOD
+
+
+def _cache_handler(
+    cache: dict[tuple[type, str], Callable[..., Any]],
+    obj: Any,
+    obj_type: type,
+    name: str,
+    handler: Callable[..., Any],
+) -> None:
+    """Remember a handler if the decision holds for every receiver of this type."""
+    # Plain dicts are ML objects depending on their keys, and classes (such as
+    # inline user module namespaces) differ from each other in their attributes
+    if isinstance(obj, (dict, type)) and obj_type is not MLObject:
+        return
+    if len(cache) >= _INLINE_CACHE_LIMIT:
+        cache.clear()
+    cache[(obj_type, name)] = handler
+
+
+def _denied(error_type: type[Exception], message: str) -> Callable[..., Any]:
+    """Handler raising a fresh ``error_type(message)`` on every access."""
+
+    def handler(obj: Any, *args, **kwargs) -> Any:
+        raise error_type(message)
+
+    return handler
+
+
+def _length_handler(obj: Any, *args, **kwargs) -> int:
+    """Handler mapping ``length`` to len()."""
+    return get_safe_length(obj)
+
+
+def _ml_property_getter(attr_name: str) -> Callable[..., Any]:
+    """Handler reading an ML object property, None when missing."""
+
+    def handler(obj: Any, *args, **kwargs) -> Any:
+        return obj.get(attr_name, None)
+
+    return handler
+
+
+def _ml_property_caller(method_name: str) -> Callable[..., Any]:
+    """Handler calling a function stored in an ML object property."""
+
+    def handler(obj: Any, *args, **kwargs) -> Any:
         if method_name not in obj:
-            raise AttributeError(
-                f"ML object has no property '{method_name}'"
-            )
+            raise AttributeError(f"ML object has no property '{method_name}'")
 
         func = obj[method_name]
-
-        # Check if it's callable
         if not callable(func):
             raise TypeError(
                 f"Property '{method_name}' is not callable (got {type(func).__name__})"
             )
-
-        # Call the function with the provided arguments
         return func(*args, **kwargs)
 
-    # Special case: Allow method calls on Python modules (for user-defined modules)
-    if isinstance(obj, types.ModuleType):
-        # Allow method/function access on modules
-        pass
-    # Special case: Allow method calls on user module classes (inline mode)
-    elif hasattr(obj, '_ml_user_module') or hasattr(obj_type, '_ml_user_module'):
-        # This is a user module namespace class (created in inline mode)
-        pass
-    # For Python objects, verify this is a safe method call
-    # First check if object is from an @ml_class decorated class
-    elif hasattr(obj_type, '_ml_class_metadata'):
-        # Object is from @ml_class - allow method access (methods should have @ml_function)
-        pass
-    else:
-        # Check SafeAttributeRegistry for built-in types
-        attr_info = registry.get_attribute_info(obj_type, method_name)
-        if not attr_info or attr_info.access_type != AttributeAccessType.METHOD:
-            raise AttributeError(
-                f"'{obj_type.__name__}' object has no accessible method '{method_name}'"
-            )
+    return handler
 
-    # Special handling for length
-    if method_name == "length":
-        return get_safe_length(obj)
 
-    # Call the method
-    try:
-        method = getattr(obj, method_name)
-    except AttributeError:
-        raise AttributeError(f"'{obj_type.__name__}' object has no method '{method_name}'")
+def _attribute_getter(obj_type: type, attr_name: str) -> Callable[..., Any]:
+    """Handler reading an attribute, calling it right away when given arguments."""
+
+    def handler(obj: Any, *args, **kwargs) -> Any:
+        try:
+            attr = getattr(obj, attr_name)
+        except AttributeError:
+            # This shouldn't happen if our whitelist is correct, but handle gracefully
+            raise AttributeError(f"'{obj_type.__name__}' object has no attribute '{attr_name}'")
+        # If we have args/kwargs, call the method immediately
+        if (args or kwargs) and callable(attr):
+            return attr(*args, **kwargs)
+        # Otherwise return the validated attribute itself; bound methods compare
+        # and hash equal across accesses, and _safe_call still checks them when called
+        return attr
 
-    # Call the method (don't catch AttributeError here - it might come from inside the method)
-    return method(*args, **kwargs)
+    return handler
+
+
+def _method_caller(obj_type: type, method_name: str) -> Callable[..., Any]:
+    """Handler looking a method up on the receiver and calling it."""
+
+    def handler(obj: Any, *args, **kwargs) -> Any:
+        try:
+            method = getattr(obj, method_name)
+        except AttributeError:
+            raise AttributeError(f"'{obj_type.__name__}' object has no method '{method_name}'")
+        # Don't catch AttributeError here - it might come from inside the method
+        return method(*args, **kwargs)
+
+    return handler
+
+
+def _unbound_method(obj: Any, obj_type: type, method_name: str) -> Callable[..., Any] | None:
+    """Return the C-level method descriptor to call with the receiver, if any.
+
+    Only used when instances have no ``__dict__`` to shadow the method.
+    """
+    if hasattr(obj, "__dict__"):
+        return None
+    method = inspect.getattr_static(obj_type, method_name, None)
+    if isinstance(method, (types.MethodDescriptorType, types.WrapperDescriptorType)):
+        return method
+    return None
 
 
 def get_safe_length(obj: Any) -> int:
@@ -174,7 +304,7 @@ def get_safe_length(obj: Any) -> int:
 
 def is_ml_object(obj: Any) -> bool:
     """
-    Detect if object is an ML object (dict with string keys).
+    Detect if object is an ML object (MLObject, or dict with string keys).
 
     Args:
         obj: Object to check
@@ -182,6 +312,9 @@ def is_ml_object(obj: Any) -> bool:
     Returns:
         True if object appears to be an ML object
     """
+    if type(obj) is MLObject:
+        return True
+    # Compatibility path for plain dicts built by Python code
     return isinstance(obj, dict) and all(isinstance(k, str) for k in obj.keys())
 
 
@@ -196,7 +329,7 @@ def get_object_type_name(obj: Any) -> str:
         Human-readable type name
     """
     obj_type = type(obj)
-    if obj_type == dict and is_ml_object(obj):
+    if obj_type is MLObject or (obj_type is dict and is_ml_object(obj)):
         return "ML object"
     return obj_type.__name__
 
@@ -207,5 +340,6 @@ __all__ = [
     "safe_method_call",
     "get_safe_length",
     "is_ml_object",
+    "MLObject",
     "SecurityError",
 ]
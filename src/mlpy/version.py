@@ -1,4 +1,29 @@
 """Version information for mlpy."""
 
+import hashlib
+from pathlib import Path
+
 __version__ = "2.0.0"
 __version_info__ = (2, 0, 0)
+
+_toolchain_hash: str | None = None
+
+
+def get_toolchain_hash() -> str:
+    """Hash of every source file in the installed mlpy package.
+
+    Keys caches of transpiled code, security verdicts and build outputs, so
+    any change to the grammar, code generators or analyzers invalidates them
+    even when ``__version__`` stays the same.
+    """
+    global _toolchain_hash
+    if _toolchain_hash is None:
+        package_dir = Path(__file__).parent
+        digest = hashlib.sha256(__version__.encode())
+        for path in sorted(package_dir.rglob("*")):
+            if path.suffix in (".py", ".lark") and path.is_file():
+                digest.update(path.relative_to(package_dir).as_posix().encode())
+                digest.update(b"\0")
+                digest.update(path.read_bytes())
+        _toolchain_hash = digest.hexdigest()
+    return _toolchain_hash
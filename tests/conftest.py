@@ -11,6 +11,14 @@ src_path = project_root / "src"
 sys.path.insert(0, str(src_path))
 
 
+@pytest.fixture(scope="session", autouse=True)
+def private_artifact_store(tmp_path_factory):
+    """Keep the on-disk artifact store out of the developer's ~/.cache/mlpy."""
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setenv("MLPY_CACHE_DIR", str(tmp_path_factory.mktemp("mlpy-cache")))
+        yield
+
+
 @pytest.fixture(scope="session")
 def project_root_path():
     """Provide path to project root directory."""
@@ -61,17 +61,18 @@ class DebugTestHandler:
         """Initialize the debug test handler."""
         from mlpy.debugging.debugger import MLDebugger
         from mlpy.debugging.source_map_index import SourceMapIndex
-        from mlpy.ml.transpiler import transpile_ml_file
+        from mlpy.ml.transpiler import ml_transpiler
 
         self.MLDebugger = MLDebugger
         self.SourceMapIndex = SourceMapIndex
-        self.transpile_ml_file = transpile_ml_file
+        self.transpiler = ml_transpiler
 
         self.debugger: Optional[MLDebugger] = None
         self.source_map_index: Optional[SourceMapIndex] = None
         self.ml_file: Optional[str] = None
         self.py_file: Optional[str] = None
         self.py_code: Optional[str] = None
+        self.source_map: Optional[Dict[str, Any]] = None
         self.breakpoints: Dict[int, BreakpointInfo] = {}
         self.state = DebugState()
         self.exec_globals: Dict[str, Any] = {}
@@ -86,7 +87,7 @@ class DebugTestHandler:
 
         Args:
             ml_file: Path to ML source file
-            force_retranspile: If True, delete cached files and force fresh transpilation
+            force_retranspile: If True, bypass the compilation cache and transpile afresh
 
         Returns:
             Tuple of (success, message)
@@ -96,24 +97,15 @@ class DebugTestHandler:
         if not os.path.exists(self.ml_file):
             return False, f"File not found: {ml_file}"
 
-        # Delete cached files if requested
-        if force_retranspile:
-            ml_path = Path(self.ml_file)
-            cached_py = ml_path.with_suffix('.py')
-            cached_map = ml_path.with_suffix('.py.map')
-
-            if cached_py.exists():
-                cached_py.unlink()
-            if cached_map.exists():
-                cached_map.unlink()
-
         try:
-            # Transpile ML file
-            py_code, issues, source_map = self.transpile_ml_file(
-                self.ml_file,
-                output_path=None,
+            # Transpile ML file; the code and source map are kept in memory
+            source = Path(self.ml_file).read_text(encoding='utf-8')
+            py_code, issues, source_map = self.transpiler.transpile_to_python(
+                source,
+                source_file=self.ml_file,
                 strict_security=False,
-                generate_source_maps=True
+                generate_source_maps=True,
+                use_cache=not force_retranspile,
             )
 
             if not py_code:
@@ -123,6 +115,7 @@ class DebugTestHandler:
             # Store transpiled code
             self.py_file = os.path.splitext(self.ml_file)[0] + '.py'
             self.py_code = py_code
+            self.source_map = source_map
 
             # Build source map index
             if isinstance(source_map, dict):
@@ -416,7 +409,10 @@ class DebugTestHandler:
 
     def verify_source_maps_exist(self) -> Tuple[bool, Dict[str, bool]]:
         """
-        Verify that source maps are generated and cached.
+        Verify that the transpiled code and its source map were generated.
+
+        Transpilation writes no files next to the source; the code and the
+        source map are held in memory (and in the compilation cache).
 
         Returns:
             Tuple of (all exist, detailed status dict)
@@ -424,14 +420,10 @@ class DebugTestHandler:
         if not self.ml_file:
             return False, {}
 
-        ml_path = Path(self.ml_file)
-        py_path = ml_path.with_suffix('.py')
-        map_path = ml_path.with_suffix('.py.map')
-
         status = {
-            'ml_file': ml_path.exists(),
-            'py_file': py_path.exists(),
-            'map_file': map_path.exists(),
+            'ml_file': Path(self.ml_file).exists(),
+            'py_code': self.py_code is not None,
+            'source_map': self.source_map is not None,
             'source_map_index': self.source_map_index is not None
         }
 
@@ -454,6 +446,7 @@ class DebugTestHandler:
         self.ml_file = None
         self.py_file = None
         self.py_code = None
+        self.source_map = None
         self.breakpoints.clear()
         self.state = DebugState()
         self.exec_globals.clear()
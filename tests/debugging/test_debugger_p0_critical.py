@@ -114,8 +114,8 @@ class TestSourceMaps:
 
         assert all_exist, f"Missing source maps: {status}"
         assert status['ml_file'] is True
-        assert status['py_file'] is True
-        assert status['map_file'] is True
+        assert status['py_code'] is True
+        assert status['source_map'] is True
         assert status['source_map_index'] is True
 
     def test_source_map_ml_to_python_mapping(self, loaded_handler):
@@ -136,53 +136,43 @@ class TestSourceMaps:
 
     def test_source_map_caching(self, handler, main_ml_file):
         """Test that source maps are cached and reused."""
-        from pathlib import Path
+        from unittest.mock import patch
 
         # First load
         success1, _ = handler.load_program(main_ml_file, force_retranspile=False)
         assert success1
 
-        ml_path = Path(main_ml_file)
-        map_path = ml_path.with_suffix('.py.map')
-
-        # Get modification time
-        mtime1 = map_path.stat().st_mtime if map_path.exists() else 0
-        assert mtime1 > 0, "Source map file not created"
-
-        # Second load (should use cache)
+        # Second load (should be served by the compilation cache)
         handler2 = DebugTestHandler()
-        success2, _ = handler2.load_program(main_ml_file, force_retranspile=False)
+        transpiler = handler2.transpiler
+        with patch.object(
+            transpiler, 'parse_with_security_analysis', wraps=transpiler.parse_with_security_analysis
+        ) as parse:
+            success2, _ = handler2.load_program(main_ml_file, force_retranspile=False)
         assert success2
 
-        # Modification time should be unchanged (cached)
-        mtime2 = map_path.stat().st_mtime
-        assert mtime1 == mtime2, "Source map was regenerated instead of using cache"
+        assert parse.call_count == 0, "Source map was regenerated instead of using cache"
+        assert handler2.source_map == handler.source_map
 
     def test_load_program_force_retranspile(self, handler, main_ml_file):
         """Test force retranspile option."""
-        from pathlib import Path
-        import time
+        from unittest.mock import patch
 
         # First load
         success1, _ = handler.load_program(main_ml_file, force_retranspile=True)
         assert success1
 
-        ml_path = Path(main_ml_file)
-        map_path = ml_path.with_suffix('.py.map')
-        mtime1 = map_path.stat().st_mtime
-
-        # Wait to ensure different timestamp
-        time.sleep(0.1)
-
         # Force retranspile
         handler2 = DebugTestHandler()
-        success2, _ = handler2.load_program(main_ml_file, force_retranspile=True)
+        transpiler = handler2.transpiler
+        with patch.object(
+            transpiler, 'parse_with_security_analysis', wraps=transpiler.parse_with_security_analysis
+        ) as parse:
+            success2, _ = handler2.load_program(main_ml_file, force_retranspile=True)
         assert success2
 
-        mtime2 = map_path.stat().st_mtime
-
-        # Modification time should be different (regenerated)
-        assert mtime2 > mtime1, "Source map was not regenerated"
+        assert parse.call_count == 1, "Source map was not regenerated"
+        assert handler2.py_code == handler.py_code
 
 
 # ============================================================================
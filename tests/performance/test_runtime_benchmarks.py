@@ -0,0 +1,220 @@
+"""
+Performance benchmarks for the runtime helpers called by transpiled ML code.
+
+Timings are printed (run with ``-s`` to see them) and asserted only with
+loose bounds, since tight wall-clock comparisons flake on loaded machines.
+"""
+
+import time
+
+from mlpy.stdlib.runtime_helpers import MLObject, safe_attr_access
+
+
+def best_time_us(func, calls: int = 2000, repeats: int = 5) -> float:
+    """Return the best per-call time of ``func()`` in microseconds."""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in range(calls):
+            func()
+        best = min(best, (time.perf_counter() - start) / calls)
+    return best * 1e6
+
+
+class TestMLObjectAccessBenchmarks:
+    """Member access cost on ML objects of increasing size."""
+
+    def test_attribute_access_independent_of_size(self):
+        """Access on an MLObject costs about the same at 10 and 100k entries."""
+        timings = {}
+        for size in (10, 1_000, 100_000):
+            table = MLObject((f"key{i}", i) for i in range(size))
+            plain = dict(table)
+            timings[size] = (
+                best_time_us(lambda table=table: safe_attr_access(table, "key5")),
+                best_time_us(lambda plain=plain: safe_attr_access(plain, "key5"), calls=20),
+            )
+            print(
+                f"{size} entries: MLObject {timings[size][0]:.3f}us, "
+                f"plain dict {timings[size][1]:.3f}us"
+            )
+            assert safe_attr_access(table, "key5") == safe_attr_access(plain, "key5") == 5
+
+        # MLObject is recognized by type; plain dicts still scan their keys
+        assert timings[100_000][0] < timings[10][0] * 5
+        assert timings[100_000][1] > timings[100_000][0] * 10
+
+
+class TestMethodCallBenchmarks:
+    """Method-call-heavy ML programs with and without the inline caches."""
+
+    METHOD_HEAVY_PROGRAM = """
+function work(words, n) {
+    total = 0;
+    for (i in range(n)) {
+        for (w in words) {
+            total = total + len(w.upper()) + w.find("a") + len(w.strip().split("a"));
+        }
+    }
+    return total;
+}
+result = work(["alpha", "beta", "gamma", "delta"], 3000);
+"""
+
+    def test_method_heavy_program(self, monkeypatch):
+        """Inline caches make a method-heavy program measurably faster."""
+        import statistics
+
+        from mlpy.ml.transpiler import MLTranspiler
+        from mlpy.stdlib import runtime_helpers
+
+        python_code, _, _ = MLTranspiler().transpile_to_python(self.METHOD_HEAVY_PROGRAM)
+        code = compile(python_code, "<ml>", "exec")
+
+        def run():
+            namespace = {}
+            start = time.perf_counter()
+            exec(code, namespace)
+            return time.perf_counter() - start, namespace["result"]
+
+        cached = [run() for _ in range(5)]
+        with monkeypatch.context() as patch:
+            patch.setattr(runtime_helpers, "_cache_handler", lambda *args: None)
+            runtime_helpers.clear_inline_caches()
+            uncached = [run() for _ in range(5)]
+
+        cached_ms = statistics.median(t for t, _ in cached) * 1000
+        uncached_ms = statistics.median(t for t, _ in uncached) * 1000
+        print(f"Method-heavy program: cached {cached_ms:.1f}ms, uncached {uncached_ms:.1f}ms")
+
+        assert cached[0][1] == uncached[0][1]
+        assert cached_ms < uncached_ms
+
+
+class TestSafeCallBenchmarks:
+    """Per-call cost of safe_call with and without the decision cache."""
+
+    def test_safe_call_decision_cache(self, monkeypatch):
+        """Cached decisions make repeat stdlib calls cheaper."""
+        from mlpy.runtime import whitelist_validator
+        from mlpy.runtime.whitelist_validator import clear_call_decisions, safe_call
+        from mlpy.stdlib.builtin import builtin
+
+        items = [1, 2, 3]
+        cached_us = best_time_us(lambda: safe_call(builtin.len, items), calls=20_000)
+        with monkeypatch.context() as patch:
+            patch.setattr(whitelist_validator, "_remember_decision", lambda *args: None)
+            clear_call_decisions()
+            uncached_us = best_time_us(lambda: safe_call(builtin.len, items), calls=20_000)
+        direct_us = best_time_us(lambda: builtin.len(items), calls=20_000)
+        print(
+            f"builtin.len: direct {direct_us:.3f}us, safe_call cached {cached_us:.3f}us, "
+            f"uncached {uncached_us:.3f}us"
+        )
+
+        # Timing-free: after the first call, repeat calls never revalidate
+        uncached_calls = []
+        full_check = whitelist_validator._safe_call_uncached
+        monkeypatch.setattr(
+            whitelist_validator,
+            "_safe_call_uncached",
+            lambda *args: uncached_calls.append(args) or full_check(*args),
+        )
+        clear_call_decisions()
+        assert [safe_call(builtin.len, items) for _ in range(100)] == [3] * 100
+        assert len(uncached_calls) == 1
+
+
+class TestStdlibCallBenchmarks:
+    """Per-call cost of @ml_function stdlib calls with validation off."""
+
+    def test_stdlib_call_overhead(self):
+        """Stdlib methods are called without a wrapper frame while validation is off."""
+        from functools import wraps
+
+        from mlpy.runtime.whitelist_validator import safe_call
+        from mlpy.stdlib import decorators
+        from mlpy.stdlib.builtin import Builtin, builtin
+        from mlpy.stdlib.math_bridge import Math, math
+
+        def always_wrapped(func):
+            """The wrapper @ml_function used to put around every function."""
+
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                metadata = func._ml_function_metadata
+                if decorators._CAPABILITY_VALIDATION_ENABLED and metadata.capabilities:
+                    kwargs.pop("_capability_context", None)
+                return func(*args, **kwargs)
+
+            return wrapper
+
+        from mlpy.stdlib.args_bridge import Args
+
+        # Structural, timing-free: with validation off, stdlib methods are the
+        # undecorated functions, and validation swaps the wrapper in and out
+        assert not decorators.is_capability_validation_enabled()
+        assert Builtin.__dict__["len"] is Builtin.len
+        assert not hasattr(Builtin.len, "__wrapped__")
+        plain_script = Args.__dict__["script"]
+        assert not hasattr(plain_script, "__wrapped__")
+        decorators.enable_capability_validation()
+        try:
+            assert Args.__dict__["script"].__wrapped__ is plain_script
+        finally:
+            decorators.disable_capability_validation()
+        assert Args.__dict__["script"] is plain_script
+
+        items = [1, 2, 3]
+        wrapped_len = always_wrapped(Builtin.len).__get__(builtin)
+        wrapped_sqrt = always_wrapped(Math.sqrt).__get__(math)
+
+        calls = [
+            ("builtin.len", lambda: builtin.len(items), lambda: wrapped_len(items)),
+            ("math.sqrt", lambda: math.sqrt(2.0), lambda: wrapped_sqrt(2.0)),
+            (
+                "safe_call(builtin.len)",
+                lambda: safe_call(builtin.len, items),
+                lambda: safe_call(wrapped_len, items),
+            ),
+        ]
+        timings = {}
+        for name, after, before in calls:
+            timings[name] = (best_time_us(after, calls=20_000), best_time_us(before, calls=20_000))
+            print(f"{name}: before {timings[name][1]:.3f}us, after {timings[name][0]:.3f}us")
+
+        assert timings["builtin.len"][0] < timings["builtin.len"][1]
+
+
+class TestMethodReferenceBenchmarks:
+    """Higher-order functional pipelines fed with method references."""
+
+    def test_functional_pipeline_with_method_references(self):
+        """Bound methods returned by safe_attr_access call faster than proxies."""
+        from mlpy.stdlib.functional_bridge import functional
+
+        text = "the quick brown fox jumps over the lazy dog" * 4
+        vowels = "aeiou"
+        letters = list("abcdefghijklmnopqrstuvwxyz") * 8
+
+        def pipeline(count, find):
+            counts = functional.map(count, letters)
+            found = functional.filter(find, letters)
+            return counts, found
+
+        def old_proxy(attr):
+            """The closure safe_attr_access used to return for method reads."""
+            return lambda *a, **kw: attr(*a, **kw)
+
+        count = safe_attr_access(text, "count")
+        find = safe_attr_access(vowels, "count")
+        assert count == safe_attr_access(text, "count")
+
+        after_us = best_time_us(lambda: pipeline(count, find), calls=200)
+        before_us = best_time_us(
+            lambda: pipeline(old_proxy(text.count), old_proxy(vowels.count)), calls=200
+        )
+        print(f"map+filter pipeline: before {before_us:.2f}us, after {after_us:.2f}us")
+
+        assert pipeline(count, find) == pipeline(old_proxy(text.count), old_proxy(vowels.count))
+        assert after_us < before_us
@@ -205,6 +205,57 @@ class TestScalabilityBenchmarks:
                 ), f"Small programs too slow: {result['mean_ms']:.3f}ms"
 
 
+class TestCodegenBackendBenchmarks:
+    """Compare codegen+compile time of the text and AST backends."""
+
+    def test_large_program_codegen_and_compile(self, benchmark_suite):
+        """Measure codegen+compile of a large program with both backends."""
+        from mlpy.ml.codegen.ast_generator import generate_python_ast
+        from mlpy.ml.codegen.python_generator import generate_python_code
+
+        functions = [
+            f"""
+function f{i}(a, b) {{
+    total = 0;
+    for (k in range(a)) {{
+        if (k % 2 == 0) {{ total = total + k * b; }} else {{ total = total - {i}; }}
+    }}
+    return total > 0 ? total : -total;
+}}
+x{i} = f{i}({i}, 3) + len([1, 2, 3]);"""
+            for i in range(300)
+        ]
+        program = benchmark_suite.transpiler.parser.parse("\n".join(functions))
+
+        def text_backend():
+            python_code, _ = generate_python_code(program, generate_source_maps=False)
+            return compile(python_code, "<ml>", "exec")
+
+        def ast_backend():
+            return generate_python_ast(program).code
+
+        text = benchmark_suite.benchmark_function(text_backend, "codegen_text", iterations=5)
+        direct = benchmark_suite.benchmark_function(ast_backend, "codegen_ast", iterations=5)
+
+        python_code, _ = generate_python_code(program, generate_source_maps=False)
+        tree = generate_python_ast(program).tree
+        compile_text = benchmark_suite.benchmark_function(
+            lambda: compile(python_code, "<ml>", "exec"), "compile_text", iterations=5
+        )
+        compile_tree = benchmark_suite.benchmark_function(
+            lambda: compile(tree, "<ml>", "exec"), "compile_ast", iterations=5
+        )
+
+        print(
+            f"{len(functions)} functions, codegen+compile: "
+            f"text {text['min_ms']:.1f}ms, ast {direct['min_ms']:.1f}ms; "
+            f"compile only: text {compile_text['min_ms']:.1f}ms, ast {compile_tree['min_ms']:.1f}ms"
+        )
+        # Compiling the tree skips tokenizing and parsing the generated source
+        assert direct["success"] and text["success"]
+        assert compile_tree["min_ms"] < compile_text["min_ms"] * 1.25
+
+
 class TestMemoryUsageBenchmarks:
     """Test memory usage patterns during transpilation."""
 
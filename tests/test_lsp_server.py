@@ -7,9 +7,12 @@ from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
+from mlpy.ml.errors.exceptions import MLSyntaxError
 from src.mlpy.lsp.capabilities import MLServerCapabilities
 from src.mlpy.lsp.handlers import MLRequestHandlers
+from src.mlpy.lsp.incremental import IncrementalDocument
 from src.mlpy.lsp.server import DocumentInfo, MLLanguageServer
+from src.mlpy.ml.grammar.ast_nodes import ASTNode
 
 # Mock LSP dependencies if not available
 LSP_AVAILABLE = True
@@ -354,6 +357,168 @@ class TestDocumentInfo:
         assert doc_info.ast is mock_ast
 
 
+def _edit(start_line, start_char, end_line, end_char):
+    """LSP range for a ranged content change."""
+    return Range(
+        start=Position(line=start_line, character=start_char),
+        end=Position(line=end_line, character=end_char),
+    )
+
+
+def _node_lines(node):
+    """Line numbers of every node in an AST, in a stable order."""
+    if isinstance(node, ASTNode):
+        return [node.line] + [_node_lines(value) for _, value in sorted(node.iter_fields())]
+    if isinstance(node, list):
+        return [_node_lines(item) for item in node]
+    return None
+
+
+class TestIncrementalDocument:
+    """Test re-parsing only the edited top-level items."""
+
+    SOURCE = """import math;
+
+function area(r) {
+    return math.pi * r * r;
+}
+
+x = area(2);
+y = x + 1;
+"""
+
+    def test_edit_reparses_one_region(self):
+        """Test that an edit inside a function keeps the other items."""
+        document = IncrementalDocument(self.SOURCE)
+        items = document.update().items
+
+        document.apply_change(_edit(3, 11, 3, 18), "3.14")
+        updated = document.update().items
+
+        assert document.full_parses == 1
+        assert document.partial_parses == 1
+        assert "return 3.14 * r * r;" in document.text
+        assert updated[0] is items[0]
+        assert updated[1] is not items[1]
+        assert updated[2:] == items[2:]
+
+    def test_inserted_lines_shift_later_items(self):
+        """Test that items after an edit keep correct line numbers."""
+        document = IncrementalDocument(self.SOURCE)
+        document.update()
+
+        document.apply_change(_edit(2, 0, 2, 0), "z = 0;\n\n")
+        ast = document.update()
+        expected = _node_lines(IncrementalDocument(document.text).update())
+
+        assert document.partial_parses == 1
+        assert _node_lines(ast) == expected
+        assert [item.line for item in ast.items[1:]] == [3, 5, 9, 10]
+
+    def test_unbalanced_edit_falls_back_to_full_parse(self):
+        """Test that an edit which spills into later items reparses the document."""
+        document = IncrementalDocument(self.SOURCE)
+        document.update()
+
+        document.apply_change(_edit(4, 0, 4, 1), "")
+        assert document.regions is None
+        with pytest.raises(MLSyntaxError):
+            document.update()
+
+        document.apply_change(_edit(4, 0, 4, 0), "}")
+        assert len(document.update().items) == 4
+        assert document.full_parses == 2
+
+    def test_positions_count_utf16_code_units(self):
+        """Test that characters beyond the BMP count as two LSP characters."""
+        document = IncrementalDocument('s = "😀"; x = 1;\n')
+        document.update()
+
+        # "😀" is one code point but two UTF-16 code units, so "1" is at 14
+        document.apply_change(_edit(0, 14, 0, 15), "5")
+
+        assert document.text == 's = "😀"; x = 5;\n'
+        assert document.partial_parses == 1
+
+    def test_semantic_tokens_match_full_mapping(self):
+        """Test that per-region tokens equal tokens mapped from the whole document."""
+        server = MLLanguageServer()
+        if not server.server:
+            pytest.skip("LSP server not available")
+
+        provider = server.semantic_tokens_provider
+        document = IncrementalDocument(self.SOURCE)
+        document.update()
+        document.apply_change(_edit(7, 0, 7, 0), 'w = "a";\n')
+
+        incremental = provider.get_semantic_tokens_full("file:///a.ml", "", 1, document)
+        full = provider.get_semantic_tokens_full("file:///b.ml", document.text, 1)
+
+        assert incremental.tokens == full.tokens
+
+    @pytest.mark.asyncio
+    async def test_ranged_change_reanalyzes_edited_region(self):
+        """Test that didChange applies ranged edits and analyzes only the edited item."""
+        server = MLLanguageServer()
+        if not server.server:
+            pytest.skip("LSP server not available")
+
+        uri = "file:///test.ml"
+        params = Mock()
+        params.text_document.uri = uri
+        params.text_document.text = self.SOURCE
+        params.text_document.version = 1
+        await server._did_open(params)
+
+        change = Mock()
+        change.range = _edit(7, 8, 7, 9)
+        change.text = "2"
+        params.text_document.version = 2
+        params.content_changes = [change]
+
+        with patch.object(
+            server.analyzer, "analyze_parallel", wraps=server.analyzer.analyze_parallel
+        ) as analyze:
+            await server._did_change(params)
+
+        doc_info = server.documents[uri]
+        assert doc_info.content == self.SOURCE.replace("x + 1", "x + 2")
+        assert doc_info.version == 2
+        analyze.assert_called_once_with("y = x + 2;\n", uri)
+
+    @pytest.mark.asyncio
+    async def test_full_parse_analyzes_document_once(self):
+        """Test that a full parse runs one analysis and splits diagnostics by region."""
+        server = MLLanguageServer()
+        if not server.server:
+            pytest.skip("LSP server not available")
+
+        def analyze_source(source, uri):
+            """One diagnostic on every line assigning y."""
+            return [
+                Diagnostic(range=_edit(line, 0, line, 1), message="y")
+                for line, text in enumerate(source.split("\n"))
+                if text.startswith("y =")
+            ]
+
+        uri = "file:///test.ml"
+        params = Mock()
+        params.text_document.uri = uri
+        params.text_document.text = self.SOURCE
+        params.text_document.version = 1
+
+        with patch.object(server, "_analyze_source", side_effect=analyze_source) as analyze:
+            await server._did_open(params)
+
+        doc_info = server.documents[uri]
+        analyze.assert_called_once_with(self.SOURCE, uri)
+        assert [d.range.start.line for d in doc_info.diagnostics] == [7]
+
+        regions = doc_info.document.regions
+        assert [len(region.diagnostics) for region in regions] == [0, 0, 0, 1]
+        assert regions[-1].diagnostics[0].range.start.line == 0
+
+
 @pytest.mark.integration
 class TestLSPIntegration:
     """Integration tests for LSP functionality."""
@@ -273,6 +273,16 @@ class TestTranspilation:
             # Variable should exist in namespace
             assert "count" in session.python_namespace
 
+    def test_statement_compiled_from_generated_ast(self, session):
+        """Test statements run from the transpiler's AST, header imports included."""
+        result = session.execute_ml_line(
+            'try { throw {message: "boom"}; } except (e) { caught = e; }'
+        )
+
+        assert result.success
+        assert "raise MLUserException" in result.transpiled_python
+        assert type(session.python_namespace["caught"]).__name__ == "MLUserException"
+
 
 class TestNamespaceManagement:
     """Test Python namespace management."""
@@ -0,0 +1,178 @@
+"""Unit tests for ast_generator.py - the Python AST code generation backend."""
+
+import ast
+import traceback
+
+import pytest
+
+from mlpy.ml.codegen.ast_generator import (
+    GeneratedModule,
+    PythonAstGenerator,
+    UnsupportedConstruct,
+    generate_python_ast,
+)
+from mlpy.ml.codegen.python_generator import PythonCodeGenerator
+from mlpy.ml.grammar.parser import MLParser
+from mlpy.ml.transpiler import MLTranspiler
+
+PROGRAMS = {
+    "arithmetic": "x = 1 + 2 * 3; y = x // 2 - -x % 4; z = !(x > y) && y != 0 || false;",
+    "strings": 'name = "ml"; greeting = "hello " + name; print(greeting);',
+    "functions": """
+        function fib(n) {
+            if (n < 2) { return n; }
+            elif (n < 3) { return 1; }
+            else { return fib(n - 1) + fib(n - 2); }
+        }
+        print(fib(10));
+    """,
+    "loops": """
+        total = 0;
+        for (i in range(10)) {
+            if (i == 3) { continue; }
+            if (i > 7) { break; }
+            total = total + i;
+        }
+        while (total > 0) { total = total - 5; }
+    """,
+    "collections": """
+        items = [3, 1, 2];
+        point = {x: 1, y: 2};
+        first = items[0];
+        tail = items[1:];
+        items[0] = point.x;
+        point.y = len(items);
+        [a, b, c] = items;
+        {x, y} = point;
+    """,
+    "lambdas": """
+        double = fn(n) => n * 2;
+        values = map(double, [1, 2, 3]);
+        label = values[0] > 2 ? "big" : "small";
+    """,
+    "exceptions": """
+        try {
+            throw {message: "boom"};
+        } except (e) {
+            print(e);
+        } finally {
+            done = true;
+        }
+    """,
+    "methods": 'text = "a,b"; parts = text.split(","); upper = text.upper();',
+    "imports": "import math; root = math.sqrt(16);",
+    "closures": """
+        function counter() {
+            count = 0;
+            function next() { nonlocal count; count = count + 1; return count; }
+            return next;
+        }
+    """,
+}
+
+
+@pytest.fixture(scope="module")
+def parser():
+    return MLParser()
+
+
+def _text_module(program) -> ast.Module:
+    python_code, _ = PythonCodeGenerator(generate_source_maps=False).generate(program)
+    return ast.parse(python_code)
+
+
+class TestParity:
+    """The AST backend generates the program the text backend does."""
+
+    @pytest.mark.parametrize("name", sorted(PROGRAMS))
+    def test_same_tree_as_text_backend(self, parser, name):
+        """Test that the generated tree matches the parsed text output."""
+        program = parser.parse(PROGRAMS[name])
+
+        module = PythonAstGenerator().generate_module(program)
+
+        assert ast.dump(module) == ast.dump(_text_module(program))
+
+    def test_same_output_when_run(self, parser, capsys):
+        """Test that both backends print the same thing."""
+        program = parser.parse(PROGRAMS["functions"] + PROGRAMS["strings"])
+
+        exec(generate_python_ast(program).code, {})
+        from_ast = capsys.readouterr().out
+        exec(compile(_text_module(program), "<ml>", "exec"), {})
+
+        assert from_ast == capsys.readouterr().out == "55\nhello ml\n"
+
+    def test_ternary_keeps_parentheses(self, parser):
+        """Test that a parenthesized ternary operand keeps its grouping."""
+        module = generate_python_ast(parser.parse("x = 3; y = (x > 5 ? 10 : 20) + 5;"))
+        namespace = {}
+        exec(module.code, namespace)
+
+        assert namespace["y"] == 25
+
+
+class TestGeneratedModule:
+    """Test compilation, rendering and locations."""
+
+    def test_source_is_rendered_on_request(self, parser):
+        """Test that source is rendered lazily and compiles to the same program."""
+        module = generate_python_ast(parser.parse(PROGRAMS["loops"]))
+
+        assert "source" not in module.__dict__
+        assert module.backend == "ast"
+        assert ast.dump(ast.parse(module.source)) == ast.dump(module.tree)
+
+    def test_line_numbers_are_ml_lines(self, parser):
+        """Test that tracebacks point at the ML line that failed."""
+        source = "x = 1;\n\nfunction f(a) {\n    y = a + 1;\n    return a / 0;\n}\nf(x);\n"
+        module = generate_python_ast(parser.parse(source), source_file="prog.ml")
+
+        with pytest.raises(ZeroDivisionError) as exc_info:
+            exec(module.code, {})
+
+        frames = [f for f in traceback.extract_tb(exc_info.tb) if f.filename == "prog.ml"]
+        assert [f.lineno for f in frames] == [7, 5]
+
+    def test_text_emission_is_rejected(self):
+        """Test that the inherited text emitters cannot leak into the tree."""
+        with pytest.raises(UnsupportedConstruct):
+            PythonAstGenerator()._emit_line("x = 1")
+
+
+class TestFallback:
+    """Programs the AST backend does not handle go through the text backend."""
+
+    def test_inline_modules_use_text_backend(self, parser):
+        """Test that inline module output falls back to parsing text."""
+        module = generate_python_ast(parser.parse("x = 1;"), module_output_mode="inline")
+
+        assert isinstance(module, GeneratedModule)
+        assert module.backend == "text"
+        exec(module.code, {})
+
+    def test_generate_module_raises(self, parser):
+        """Test that the generator itself reports unsupported programs."""
+        generator = PythonAstGenerator(module_output_mode="inline")
+
+        with pytest.raises(UnsupportedConstruct):
+            generator.generate_module(parser.parse("x = 1;"))
+
+
+class TestTranspileToModule:
+    """Test MLTranspiler.transpile_to_module."""
+
+    def test_transpiles(self):
+        """Test that clean code produces a runnable module."""
+        module, issues = MLTranspiler().transpile_to_module("x = 2 * 21;")
+        namespace = {}
+        exec(module.code, namespace)
+
+        assert namespace["x"] == 42
+
+    def test_security_issues_block_generation(self):
+        """Test that strict security refuses dangerous code."""
+        module, issues = MLTranspiler().transpile_to_module('x = eval("1");')
+
+        assert module is None
+        assert issues
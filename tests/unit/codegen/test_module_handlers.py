@@ -31,6 +31,7 @@ class TestModuleHandler(ModuleHandlersMixin):
         self.module_output_mode = kwargs.get('module_output_mode', 'separate')
         self.compiled_modules = {}
         self.module_py_files = {}
+        self.user_module_files = {}
         self.symbol_table = {
             'imports': set(),
             'variables': set(),
@@ -1034,7 +1034,7 @@ class TestObjectLiterals:
 
         code, _ = generator.generate(program)
 
-        assert "obj = {}" in code
+        assert "obj = _MLObject()" in code
 
     def test_object_with_multiple_properties(self, generator):
         """Test object with multiple properties."""
@@ -2235,7 +2235,7 @@ class TestExpressionEdgeCases:
 
         code, _ = generator.generate(program)
 
-        assert "{}" in code
+        assert "empty = _MLObject()" in code
 
 
 class TestControlFlowEdgeCases:
@@ -166,6 +166,29 @@ result = sum;
         assert result.transpile_time > 0
         assert result.transpile_time < result.execution_time
 
+    @pytest.mark.asyncio
+    async def test_live_output(self, executor):
+        """Test that printed output is delivered to on_output."""
+        chunks = []
+        result = await executor.execute(
+            'print("first"); print("second"); result = 1;',
+            on_output=chunks.append
+        )
+
+        assert result.success is True
+        assert "".join(chunk.text for chunk in chunks) == "first\nsecond\n"
+        assert all(chunk.stream == "stdout" for chunk in chunks)
+
+    @pytest.mark.asyncio
+    async def test_live_output_restores_stdout(self, executor):
+        """Test that routing is removed once execution finishes."""
+        import sys
+
+        original = sys.stdout
+        await executor.execute('print("x");', on_output=lambda chunk: None)
+
+        assert sys.stdout is original
+
 
 class TestAsyncMLExecutorWithExtensionPaths:
     """Test AsyncMLExecutor with custom extension paths."""
@@ -0,0 +1,119 @@
+"""Tests for pipeline-stage tracing and Chrome trace export."""
+
+import json
+import threading
+
+import pytest
+
+from mlpy.runtime.profiling import tracing
+from mlpy.runtime.profiling.tracing import Tracer, traced
+
+
+class TestTracer:
+    """Test span collection on a private tracer."""
+
+    def test_disabled_span_is_shared_noop(self):
+        """A disabled tracer records nothing and allocates no span."""
+        tracer = Tracer(enabled=False)
+        with tracer.span("parse") as span:
+            span.set(hit=True)
+        assert tracer.span("a") is tracer.span("b")
+        assert tracer.events() == []
+
+    def test_nested_spans(self):
+        """Inner spans complete first and lie within the outer span."""
+        tracer = Tracer(enabled=True)
+        with tracer.span("transpile", "transpiler"):
+            with tracer.span("parse", "transpiler") as span:
+                span.set(nodes=3)
+
+        inner, outer = tracer.events()
+        assert (inner.name, outer.name) == ("parse", "transpile")
+        assert inner.args == {"nodes": 3}
+        assert outer.start_ns <= inner.start_ns
+        assert inner.start_ns + inner.duration_ns <= outer.start_ns + outer.duration_ns
+        assert inner.pid == outer.pid
+        assert inner.tid == threading.current_thread().native_id
+
+    def test_exception_recorded(self):
+        """A span exited by an exception is kept and names the error."""
+        tracer = Tracer(enabled=True)
+        with pytest.raises(ValueError):
+            with tracer.span("codegen"):
+                raise ValueError("boom")
+
+        (event,) = tracer.events()
+        assert event.args["error"] == "ValueError"
+
+    def test_max_events(self):
+        """The oldest spans are dropped beyond the buffer size."""
+        tracer = Tracer(max_events=2, enabled=True)
+        for name in ("a", "b", "c"):
+            with tracer.span(name):
+                pass
+
+        assert [event.name for event in tracer.events()] == ["b", "c"]
+
+    def test_record_foreign_process(self):
+        """Spans timed in another process keep their pid and process name."""
+        tracer = Tracer(enabled=True)
+        tracer.set_process_name(4242, "sandbox child 4242")
+        tracer.record("execute", 1_000_000, 500_000, "sandbox", pid=4242, tid=4242)
+
+        trace = tracer.to_chrome_trace()
+        names = [e for e in trace["traceEvents"] if e["ph"] == "M" and e["pid"] == 4242]
+        assert names[0]["args"]["name"] == "sandbox child 4242"
+        (complete,) = [e for e in trace["traceEvents"] if e["ph"] == "X"]
+        assert complete["ts"] == 1000
+        assert complete["dur"] == 500
+
+    def test_export_chrome_trace(self, tmp_path):
+        """The exported file is Chrome Trace Event JSON."""
+        tracer = Tracer(enabled=True)
+        with tracer.span("parse", "transpiler", source="main.ml"):
+            pass
+
+        path = tracer.export_chrome_trace(tmp_path / "trace.json")
+        trace = json.loads(path.read_text())
+
+        (event,) = [e for e in trace["traceEvents"] if e["ph"] == "X"]
+        assert event["name"] == "parse"
+        assert event["cat"] == "transpiler"
+        assert event["args"] == {"source": "main.ml"}
+        assert any(e["name"] == "thread_name" for e in trace["traceEvents"])
+
+
+class TestTracedPipeline:
+    """Test the global tracer around the real pipeline."""
+
+    @pytest.fixture
+    def global_tracer(self):
+        """Enable the global tracer for one test."""
+        tracing.tracer.clear()
+        tracing.tracer.enable()
+        yield tracing.tracer
+        tracing.tracer.disable()
+        tracing.tracer.clear()
+
+    def test_traced_decorator(self, global_tracer):
+        """@traced records each call under the given name."""
+
+        @traced("work", "test")
+        def work(x):
+            return x * 2
+
+        assert work(2) == 4
+        (event,) = global_tracer.events()
+        assert (event.name, event.category) == ("work", "test")
+
+    def test_transpiler_stages(self, global_tracer):
+        """Transpiling records parse, security and codegen inside transpile."""
+        from mlpy.ml.transpiler import MLTranspiler
+
+        code, issues, _ = MLTranspiler().transpile_to_python("x = 1 + 2;", use_cache=False)
+        assert code is not None
+
+        names = [event.name for event in global_tracer.events()]
+        assert names[-1] == "transpile"
+        for stage in ("parse", "security", "codegen"):
+            assert stage in names
@@ -0,0 +1,81 @@
+"""Tests for the safe_call decision cache in the runtime whitelist validator."""
+
+import gc
+import json
+
+import pytest
+
+from mlpy.runtime.capabilities.context import CapabilityContext, capability_context
+from mlpy.runtime.capabilities.tokens import create_capability_token
+from mlpy.runtime.whitelist_validator import (
+    CapabilityError,
+    SecurityError,
+    _call_decisions,
+    clear_call_decisions,
+    safe_call,
+)
+from mlpy.stdlib.builtin import builtin
+from mlpy.stdlib.decorators import ml_function
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    """Start and end each test with no cached decisions."""
+    clear_call_decisions()
+    yield
+    clear_call_decisions()
+
+
+class TestCallDecisionCache:
+    """Test caching of allow/deny decisions per function."""
+
+    def test_bound_builtin_cached_by_underlying_function(self):
+        """Test that fresh bound methods share their function's decision."""
+        assert safe_call(builtin.len, [1, 2, 3]) == 3
+        assert _call_decisions[id(builtin.len.__func__)][0] == ()
+        assert safe_call(builtin.len, "ab") == 2
+
+    def test_capabilities_checked_on_every_call(self):
+        """Test that a cached decision still checks the current context."""
+
+        @ml_function(description="Read demo data", capabilities=["demo.read"])
+        def read():
+            return "data"
+
+        with pytest.raises(CapabilityError):
+            safe_call(read)
+        assert _call_decisions[id(read)][0] == ("demo.read",)
+
+        context = CapabilityContext(name="demo")
+        context.add_capability(create_capability_token("demo.read"))
+        with capability_context(context):
+            assert safe_call(read) == "data"
+
+        with pytest.raises(CapabilityError):
+            safe_call(read)
+
+    def test_blocked_decision_cached(self):
+        """Test that a blocked function keeps raising from the cache."""
+        for _ in range(2):
+            with pytest.raises(SecurityError, match="Cannot call 'dumps'"):
+                safe_call(json.dumps, {})
+        assert id(json.dumps) in _call_decisions
+
+    def test_bound_builtin_methods_not_cached(self):
+        """Test that per-access bound methods of built-in types are not cached."""
+        assert safe_call("abc".upper) == "ABC"
+        assert _call_decisions == {}
+
+    def test_entry_dropped_with_function(self):
+        """Test that collecting a function drops its entry."""
+        namespace = {}
+        exec("def double(x):\n    return x * 2", namespace)
+        double = namespace.pop("double")
+
+        assert safe_call(double, 21) == 42
+        key = id(double)
+        assert key in _call_decisions
+
+        del double
+        gc.collect()
+        assert key not in _call_decisions
@@ -0,0 +1,139 @@
+"""Unit tests for the on-disk artifact store."""
+
+import multiprocessing
+import os
+import time
+
+import pytest
+
+from mlpy.runtime.sandbox.artifact_store import ArtifactStore, default_store_dir
+
+
+def _write_many(root, worker):
+    """Child process body: write the same keys as every other child."""
+    store = ArtifactStore(root)
+    for i in range(20):
+        store.put(f"key_{i}", {"worker": worker, "payload": "x" * 1000})
+
+
+class TestArtifactStore:
+    """Test artifact persistence, eviction and concurrency."""
+
+    def test_roundtrip(self, tmp_path):
+        """Test that artifacts survive a new store instance."""
+        ArtifactStore(tmp_path).put("transpile_abc", {"python_code": "x = 1"})
+
+        assert ArtifactStore(tmp_path).get("transpile_abc") == {"python_code": "x = 1"}
+
+    def test_other_toolchain_is_a_miss(self, tmp_path):
+        """Test that artifacts written by another mlpy build are not served."""
+        ArtifactStore(tmp_path, toolchain="old").put("transpile_abc", "stale")
+
+        store = ArtifactStore(tmp_path, toolchain="new")
+        assert store.get("transpile_abc") is None
+        assert store.get_stats()["misses"] == 1
+        assert ArtifactStore(tmp_path, toolchain="old").get("transpile_abc") == "stale"
+
+    @pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX ownership only")
+    def test_shared_directory_is_refused(self, tmp_path):
+        """Test that a directory other users can write to is never unpickled from."""
+        ArtifactStore(tmp_path).put("transpile_abc", "value")
+        tmp_path.chmod(0o770)
+
+        with pytest.warns(RuntimeWarning, match="expected 700"):
+            store = ArtifactStore(tmp_path)
+            assert store.get("transpile_abc") is None
+        assert store.put("transpile_def", "value") is False
+        assert store.get_stats()["refused"] is not None
+
+    @pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX ownership only")
+    def test_symlinked_directory_is_refused(self, tmp_path):
+        """Test that the store directory must not be a symlink."""
+        target = tmp_path / "target"
+        ArtifactStore(target).put("transpile_abc", "value")
+        (tmp_path / "link").symlink_to(target)
+
+        with pytest.warns(RuntimeWarning, match="not a directory"):
+            assert ArtifactStore(tmp_path / "link").get("transpile_abc") is None
+
+    def test_missing_key(self, tmp_path):
+        """Test that unknown keys return the default."""
+        store = ArtifactStore(tmp_path)
+
+        assert store.get("transpile_missing", "default") == "default"
+        assert store.get_stats()["misses"] == 1
+
+    def test_invalid_key(self, tmp_path):
+        """Test that keys cannot escape the store directory."""
+        with pytest.raises(ValueError):
+            ArtifactStore(tmp_path).put("../escape", 1)
+
+    def test_corrupt_artifact_is_discarded(self, tmp_path):
+        """Test that a truncated file is treated as a miss and removed."""
+        store = ArtifactStore(tmp_path)
+        store.put("transpile_abc", "value")
+        path = store._path_for("transpile_abc")
+        path.write_bytes(path.read_bytes()[:5])
+
+        assert store.get("transpile_abc") is None
+        assert not path.exists()
+
+    def test_lru_eviction(self, tmp_path):
+        """Test that the least recently used artifacts are evicted first."""
+        store = ArtifactStore(tmp_path, max_size=10_000)
+        for name in ("a", "b", "c"):
+            store.put(f"key_{name}", "x" * 3000)
+        past = time.time() - 100
+        os.utime(store._path_for("key_a"), (past, past))
+        os.utime(store._path_for("key_b"), (past - 10, past - 10))
+        store.get("key_a")  # Touch: now most recently used
+
+        store.put("key_d", "x" * 3000)
+        store.evict()
+
+        assert store.get("key_b") is None
+        assert store.get("key_a") is not None
+        assert store.get_stats()["total_size_bytes"] <= 10_000
+
+    def test_clear(self, tmp_path):
+        """Test that clear removes every artifact."""
+        store = ArtifactStore(tmp_path)
+        store.put("key_1", 1)
+        store.put("key_2", 2)
+
+        assert store.clear() == 2
+        assert store.get_stats()["entries"] == 0
+
+    def test_unwritable_root(self, tmp_path):
+        """Test that a read-only location degrades to no caching."""
+        blocker = tmp_path / "file"
+        blocker.write_text("not a directory")
+
+        assert ArtifactStore(blocker / "store").put("key_1", 1) is False
+
+    def test_concurrent_processes(self, tmp_path):
+        """Test that processes writing the same keys leave complete artifacts."""
+        context = multiprocessing.get_context("spawn")
+        processes = [
+            context.Process(target=_write_many, args=(str(tmp_path), worker)) for worker in range(4)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join(timeout=60)
+            assert process.exitcode == 0
+
+        store = ArtifactStore(tmp_path)
+        for i in range(20):
+            assert store.get(f"key_{i}")["payload"] == "x" * 1000
+        leftovers = list((tmp_path / "artifacts").rglob(".tmp_*"))
+        assert leftovers == []
+
+    def test_default_dir_honours_environment(self, tmp_path, monkeypatch):
+        """Test MLPY_CACHE_DIR and XDG_CACHE_HOME resolution."""
+        monkeypatch.delenv("MLPY_CACHE_DIR", raising=False)
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        assert default_store_dir() == tmp_path / "mlpy"
+
+        monkeypatch.setenv("MLPY_CACHE_DIR", str(tmp_path / "custom"))
+        assert default_store_dir() == tmp_path / "custom"
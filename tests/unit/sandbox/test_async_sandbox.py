@@ -0,0 +1,110 @@
+"""Unit tests for the asyncio-native sandbox."""
+
+import asyncio
+import threading
+
+import pytest
+
+from mlpy.runtime.capabilities.context import CapabilityContext
+from mlpy.runtime.capabilities.tokens import create_capability_token
+from mlpy.runtime.sandbox.async_sandbox import AsyncMLSandbox
+from mlpy.runtime.sandbox.sandbox import SandboxConfig, SandboxError, SandboxTimeoutError
+
+
+class TestAsyncMLSandbox:
+    """Test event-loop supervised sandbox runs."""
+
+    @pytest.mark.asyncio
+    async def test_execute(self):
+        """Test that the result and output come back."""
+        sandbox = AsyncMLSandbox(SandboxConfig(cpu_timeout=30.0))
+
+        result = await sandbox.execute("print('hello'); result = 6 * 7;")
+
+        assert result.success is True
+        assert result.return_value == 42
+        assert result.stdout == "hello\n"
+        assert sandbox.active_runs == 0
+
+    @pytest.mark.asyncio
+    async def test_cpu_time(self):
+        """Test that the child's CPU time is reported."""
+        sandbox = AsyncMLSandbox(SandboxConfig(cpu_timeout=30.0))
+
+        result = await sandbox._execute_python_code("result = sum(range(3 * 10**6))", None, None)
+
+        assert result.success is True
+        assert result.cpu_time > 0
+
+    @pytest.mark.asyncio
+    async def test_concurrent_runs_without_threads(self):
+        """Test that concurrent runs do not each hold a thread."""
+        sandbox = AsyncMLSandbox(SandboxConfig(cpu_timeout=60.0), max_concurrency=4)
+        threads_before = threading.active_count()
+        peak_threads = threads_before
+
+        async def watch():
+            nonlocal peak_threads
+            while True:
+                peak_threads = max(peak_threads, threading.active_count())
+                await asyncio.sleep(0.05)
+
+        watcher = asyncio.create_task(watch())
+        results = await asyncio.gather(*(sandbox.execute(f"result = {i};") for i in range(8)))
+        watcher.cancel()
+
+        assert [r.return_value for r in results] == list(range(8))
+        # Only the shared transpile thread, plus the child watcher's per-process
+        # thread on Pythons without pidfd support
+        assert peak_threads - threads_before < 8
+
+    @pytest.mark.asyncio
+    async def test_streaming_output(self):
+        """Test that output chunks are delivered while the program runs."""
+        sandbox = AsyncMLSandbox(SandboxConfig(cpu_timeout=30.0))
+        chunks = []
+
+        result = await sandbox.execute("print('a'); print('b');", on_output=chunks.append)
+
+        assert result.success is True
+        assert "".join(chunk.text for chunk in chunks) == "a\nb\n"
+
+    @pytest.mark.asyncio
+    async def test_timeout(self):
+        """Test that a runaway program is killed at the deadline."""
+        sandbox = AsyncMLSandbox(SandboxConfig(cpu_timeout=1.0))
+
+        result = await sandbox.execute("while (true) { x = 1; }")
+
+        assert result.success is False
+        assert isinstance(result.error, SandboxTimeoutError)
+        assert sandbox.active_runs == 0
+
+    @pytest.mark.asyncio
+    async def test_user_error(self):
+        """Test that exceptions in the program surface like MLSandbox.execute."""
+        sandbox = AsyncMLSandbox(SandboxConfig(cpu_timeout=30.0))
+
+        result = await sandbox.execute("x = 1 / 0;")
+
+        assert result.success is False
+        assert isinstance(result.error, SandboxError)
+        assert "division by zero" in str(result.error)
+
+    @pytest.mark.asyncio
+    async def test_capability_context(self):
+        """Test that the capability context reaches the child process."""
+        sandbox = AsyncMLSandbox(SandboxConfig(cpu_timeout=30.0))
+        context = CapabilityContext(name="async_test")
+        context.add_capability(create_capability_token("math.compute"))
+        check = (
+            "from mlpy.runtime.capabilities.context import get_current_context\n"
+            "ctx = get_current_context()\n"
+            "result = ctx.has_capability('math.compute') if ctx else None\n"
+        )
+
+        with_caps = await sandbox._execute_python_code(check, context, None)
+        without_caps = await sandbox._execute_python_code(check, None, None)
+
+        assert with_caps.return_value is True
+        assert without_caps.return_value is None
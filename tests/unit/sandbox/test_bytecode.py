@@ -0,0 +1,61 @@
+"""Unit tests for marshalled sandbox bytecode."""
+
+import importlib.util
+
+import pytest
+
+from mlpy.runtime.sandbox.artifact_store import ArtifactStore
+from mlpy.runtime.sandbox.bytecode import compile_to_bytecode, load_bytecode
+from mlpy.runtime.sandbox.cache import CompilationCache
+from mlpy.runtime.sandbox.sandbox import MLSandbox, SandboxConfig, SandboxError
+
+
+class TestBytecode:
+    """Test compiling, caching and executing marshalled code objects."""
+
+    def test_roundtrip(self):
+        """Test that a code object survives marshalling."""
+        code = load_bytecode(compile_to_bytecode("result = 6 * 7"))
+
+        namespace = {}
+        exec(code, namespace)
+        assert namespace["result"] == 42
+
+    def test_rejects_other_interpreter(self):
+        """Test that bytecode with a foreign magic number is not loaded."""
+        data = compile_to_bytecode("result = 1")
+        foreign = b"\x00\x00\r\n" + data[len(importlib.util.MAGIC_NUMBER) :]
+
+        assert load_bytecode(foreign) is None
+        assert load_bytecode(b"") is None
+
+    def test_cache_compiles_once(self, tmp_path):
+        """Test that bytecode is reused from memory and from the artifact store."""
+        store = ArtifactStore(tmp_path)
+        cache = CompilationCache(store=store)
+
+        data = cache.get_bytecode("result = 1")
+        assert cache.get_bytecode("result = 1") is data
+        assert store.get_stats()["entries"] == 1
+
+        other_process = CompilationCache(store=ArtifactStore(tmp_path))
+        assert other_process.get_bytecode("result = 1") == data
+        assert other_process.store.get_stats()["hits"] == 1
+
+    def test_syntax_error_not_cached(self):
+        """Test that code which does not compile yields no bytecode."""
+        assert CompilationCache().get_bytecode("def (:") is None
+
+    def test_sandbox_executes_bytecode(self):
+        """Test that the sandbox runs the shipped code object."""
+        with MLSandbox(SandboxConfig(cpu_timeout=10.0)) as sandbox:
+            result = sandbox._execute_python_code("def f():\n    return 21\nresult = f() * 2")
+
+        assert result.success
+        assert result.return_value == 42
+
+    def test_sandbox_falls_back_to_source(self):
+        """Test that a syntax error in the program is reported by the sandbox."""
+        with MLSandbox(SandboxConfig(cpu_timeout=10.0)) as sandbox:
+            with pytest.raises(SandboxError, match="SyntaxError"):
+                sandbox._execute_python_code("def (:")
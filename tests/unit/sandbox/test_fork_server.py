@@ -0,0 +1,147 @@
+"""Unit tests for fork-server sandbox execution."""
+
+import ast
+import os
+
+import pytest
+
+from mlpy.runtime.sandbox.fork_server import ForkServer, ForkServerError
+from mlpy.runtime.sandbox.resource_monitor import ResourceLimits
+from mlpy.runtime.sandbox.sandbox import MLSandbox, SandboxConfig
+from mlpy.runtime.sandbox.worker import split_prelude
+
+requires_fork = pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+
+
+def _names(module: ast.Module) -> list[str]:
+    """Summarize top-level statements for assertions."""
+    return [ast.unparse(node).splitlines()[0] for node in module.body]
+
+
+class TestSplitPrelude:
+    """Test prelude/body splitting of transpiled programs."""
+
+    def test_imports_and_definitions_hoisted(self):
+        """Test that imports and defs go to the prelude, statements to the body."""
+        source = (
+            "from mlpy.stdlib import math\n"
+            "def square(x):\n"
+            "    return x * x\n"
+            "print(square(2))\n"
+            "result = square(n)\n"
+        )
+        prelude, body = split_prelude(ast.parse(source))
+
+        assert _names(prelude) == ["from mlpy.stdlib import math", "def square(x):"]
+        assert _names(body) == ["print(square(2))", "result = square(n)"]
+
+    def test_line_numbers_preserved(self):
+        """Test that body statements keep their original line numbers."""
+        source = "import math\n\n\nresult = 1\n"
+        _, body = split_prelude(ast.parse(source))
+
+        assert body.body[0].lineno == 4
+
+    def test_rebound_definition_stays_in_body(self):
+        """Test that a function rebound at top level is not hoisted."""
+        source = (
+            "def f():\n"
+            "    return 1\n"
+            "a = f()\n"
+            "def f():\n"
+            "    return 2\n"
+        )
+        prelude, body = split_prelude(ast.parse(source))
+
+        assert prelude.body == []
+        assert len(body.body) == 3
+
+    def test_user_module_path_setup_in_prelude(self):
+        """Test that generated sys.path setup runs before user-module imports."""
+        source = (
+            "import sys\n"
+            "_source_dir = Path(__file__).parent\n"
+            "if str(_source_dir) not in sys.path:\n"
+            "    sys.path.insert(0, str(_source_dir))\n"
+            "import user_module\n"
+        )
+        prelude, body = split_prelude(ast.parse(source))
+
+        assert len(prelude.body) == 4
+        assert body.body == []
+
+
+@requires_fork
+class TestForkServer:
+    """Test fork server processes."""
+
+    def _start(self, python_code: str, cpu_timeout: float = 5.0) -> ForkServer:
+        env = MLSandbox(SandboxConfig())._prepare_environment()
+        return ForkServer(python_code, ResourceLimits(cpu_timeout=cpu_timeout), env)
+
+    def test_prelude_runs_once(self):
+        """Test that the prelude is shared and each invocation gets its own inputs."""
+        code = "def double(x):\n    return x * 2\nresult = double(n)\n"
+
+        with self._start(code) as server:
+            first = server.invoke({"n": 2})
+            second = server.invoke({"n": 21})
+
+        assert first["result"] == 4
+        assert second["result"] == 42
+
+    def test_invocations_are_isolated(self):
+        """Test that state written by one child is not seen by the next."""
+        code = "counter = globals().get('counter', 0) + 1\nresult = counter\n"
+
+        with self._start(code) as server:
+            results = [server.invoke()["result"] for _ in range(3)]
+
+        assert results == [1, 1, 1]
+
+    def test_invocation_timeout(self):
+        """Test that a runaway child is killed while the server survives."""
+        code = "while spin:\n    pass\nresult = 'done'\n"
+
+        with self._start(code, cpu_timeout=0.5) as server:
+            timed_out = server.invoke({"spin": True})
+            finished = server.invoke({"spin": False})
+
+        assert timed_out["timed_out"] is True
+        assert finished["result"] == "done"
+
+    def test_prelude_failure(self):
+        """Test that a failing prelude is reported at startup."""
+        with pytest.raises(ForkServerError) as exc_info:
+            self._start("import module_that_does_not_exist\n")
+
+        assert "prelude failed" in str(exc_info.value)
+
+
+@requires_fork
+class TestExecuteForked:
+    """Test MLSandbox fork-server mode."""
+
+    def test_execute_forked_reuses_server(self):
+        """Test repeated execution of one ML program through a single server."""
+        ml_code = "function add(a, b) { return a + b; }\nresult = add(40, 2);"
+
+        with MLSandbox(SandboxConfig(cpu_timeout=5.0)) as sandbox:
+            first = sandbox.execute_forked(ml_code)
+            second = sandbox.execute_forked(ml_code)
+            server = sandbox.get_fork_server(ml_code)
+
+            assert first.success is True
+            assert first.return_value == 42
+            assert second.return_value == 42
+            assert server.invocations == 2
+
+    def test_execute_forked_user_error(self):
+        """Test that runtime errors come back as a failed SandboxResult."""
+        ml_code = "function boom() { return 1 / 0; }\nresult = boom();"
+
+        with MLSandbox(SandboxConfig(cpu_timeout=5.0)) as sandbox:
+            result = sandbox.execute_forked(ml_code)
+
+        assert result.success is False
+        assert "division" in str(result.error).lower()
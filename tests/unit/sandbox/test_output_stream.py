@@ -0,0 +1,154 @@
+"""Unit tests for streaming sandbox output capture."""
+
+import os
+
+import pytest
+
+from mlpy.runtime.sandbox.output_stream import OutputCapture, OutputChunk, OutputStream
+from mlpy.runtime.sandbox.sandbox import MLSandbox, SandboxConfig, SandboxTimeoutError
+
+
+class TestOutputCapture:
+    """Test size-capped output buffers."""
+
+    def test_unlimited(self):
+        """Test that a zero cap keeps everything."""
+        capture = OutputCapture("stdout")
+        capture.write(b"hello ")
+        capture.write(b"world")
+
+        assert capture.getvalue() == "hello world"
+        assert capture.truncated is False
+
+    def test_truncate(self):
+        """Test that output past the cap is dropped."""
+        capture = OutputCapture("stdout", max_bytes=4)
+        capture.write(b"abc")
+        capture.write(b"defgh")
+
+        assert capture.getvalue() == "abcd"
+        assert capture.truncated is True
+        assert capture.total_bytes == 8
+        assert capture.spill_path is None
+
+    def test_spill(self):
+        """Test that the full stream is spilled to a file past the cap."""
+        capture = OutputCapture("stderr", max_bytes=4, overflow="spill")
+        capture.write(b"abcdef")
+        capture.write(b"gh")
+        capture.close()
+
+        try:
+            assert capture.getvalue() == "abcd"
+            assert capture.truncated is True
+            with open(capture.spill_path, "rb") as f:
+                assert f.read() == b"abcdefgh"
+        finally:
+            os.unlink(capture.spill_path)
+
+    def test_invalid_overflow(self):
+        """Test that unknown overflow modes are rejected."""
+        with pytest.raises(ValueError):
+            OutputCapture("stdout", overflow="discard")
+
+
+class TestOutputStream:
+    """Test the background output iterator."""
+
+    def test_iterates_chunks_then_result(self):
+        """Test that chunks arrive in order and the result is kept."""
+
+        def run(emit):
+            emit(OutputChunk("stdout", "a"))
+            emit(OutputChunk("stderr", "b"))
+            return 42
+
+        stream = OutputStream(run)
+
+        assert [chunk.text for chunk in stream] == ["a", "b"]
+        assert stream.result == 42
+
+    def test_reraises_errors(self):
+        """Test that an exception in the run function surfaces on iteration."""
+
+        def run(emit):
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            OutputStream(run).wait()
+
+
+class TestSandboxStreaming:
+    """Test streaming through a real sandbox subprocess."""
+
+    def test_on_output_callback(self):
+        """Test that chunks are delivered and the result still has full output."""
+        chunks = []
+        code = "import sys\nprint('out')\nprint('err', file=sys.stderr)\nresult = 3"
+
+        with MLSandbox(SandboxConfig(cpu_timeout=10.0)) as sandbox:
+            result = sandbox._execute_python_code(code, on_output=chunks.append)
+
+        assert result.return_value == 3
+        assert result.stdout == "out\n"
+        assert result.stderr == "err\n"
+        assert "".join(c.text for c in chunks if c.stream == "stdout") == "out\n"
+        assert "".join(c.text for c in chunks if c.stream == "stderr") == "err\n"
+
+    def test_output_limit_truncates(self):
+        """Test that output past output_limit is dropped but the result survives."""
+        config = SandboxConfig(cpu_timeout=10.0, output_limit="1KB")
+
+        with MLSandbox(config) as sandbox:
+            result = sandbox._execute_python_code("print('x' * 100000)\nresult = 'done'")
+
+        assert result.return_value == "done"
+        assert len(result.stdout) == 1024
+        assert result.output_truncated is True
+        assert result.output_spill_files == {}
+
+    def test_output_limit_spills(self):
+        """Test that spill mode keeps the complete stream on disk."""
+        config = SandboxConfig(cpu_timeout=10.0, output_limit="10", output_overflow="spill")
+
+        with MLSandbox(config) as sandbox:
+            result = sandbox._execute_python_code("print('y' * 50)")
+
+        path = result.output_spill_files["stdout"]
+        try:
+            assert result.stdout == "y" * 10
+            with open(path) as f:
+                assert f.read() == "y" * 50 + "\n"
+        finally:
+            os.unlink(path)
+
+    def test_streaming_timeout(self):
+        """Test that a chatty program still times out."""
+        config = SandboxConfig(cpu_timeout=1.0, output_limit="1KB")
+
+        with MLSandbox(config) as sandbox:
+            with pytest.raises(SandboxTimeoutError):
+                sandbox._execute_python_code("while True: print('spam')")
+
+    def test_execute_stream(self):
+        """Test iterating over an ML program's output."""
+        with MLSandbox(SandboxConfig(cpu_timeout=10.0)) as sandbox:
+            stream = sandbox.execute_stream('print("streamed");')
+            text = "".join(chunk.text for chunk in stream)
+
+        assert text == "streamed\n"
+        assert stream.result.success is True
+
+    def test_pool_mode_output_limit(self):
+        """Test that pooled executions honour the same output cap."""
+        chunks = []
+        config = SandboxConfig(
+            cpu_timeout=10.0, output_limit="5", pool_size=1, pool_idle_timeout=0
+        )
+
+        with MLSandbox(config) as sandbox:
+            result = sandbox._execute_python_code("print('pooled output')", on_output=chunks.append)
+
+        assert result.stdout == "poole"
+        assert result.output_truncated is True
+        assert chunks == [OutputChunk("stdout", "pooled output\n")]
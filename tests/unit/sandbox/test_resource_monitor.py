@@ -1,5 +1,6 @@
 """Unit tests for sandbox resource monitoring."""
 
+import sys
 import threading
 import time
 from unittest.mock import Mock, patch
@@ -12,6 +13,9 @@ from mlpy.runtime.sandbox.resource_monitor import (
     ResourceLimits,
     ResourceMonitor,
     ResourceMonitorError,
+    ResourceSupervisor,
+    RusagePopen,
+    SamplingRates,
 )
 
 
@@ -70,8 +74,7 @@ class TestResourceMonitor:
         assert monitor.limits is None
         assert monitor.monitoring is False
         assert monitor.process is None
-        assert monitor._monitor_thread is None
-        assert monitor._usage_history == []
+        assert list(monitor._usage_history) == []
         assert monitor._peak_memory == 0
         assert monitor._total_cpu_time == 0.0
 
@@ -87,7 +90,7 @@ class TestResourceMonitor:
     @patch("psutil.Process")
     def test_start_monitoring_success(self, mock_process_class):
         """Test successful monitoring start."""
-        monitor = ResourceMonitor()
+        monitor = ResourceMonitor(supervisor=ResourceSupervisor())
         limits = ResourceLimits()
         monitor.set_limits(limits)
 
@@ -99,8 +102,7 @@ class TestResourceMonitor:
 
         assert monitor.monitoring is True
         assert monitor.process is mock_process
-        assert monitor._monitor_thread is not None
-        assert monitor._monitor_thread.is_alive()
+        assert monitor.supervisor.is_watching(monitor)
 
         # Clean up
         monitor.stop_monitoring()
@@ -130,18 +132,16 @@ class TestResourceMonitor:
 
     def test_stop_monitoring(self):
         """Test stopping monitoring."""
-        monitor = ResourceMonitor()
+        monitor = ResourceMonitor(supervisor=ResourceSupervisor())
 
         # Start with mock monitoring state
         monitor.monitoring = True
-        monitor._stop_event = threading.Event()
-        monitor._monitor_thread = Mock()
-        monitor._monitor_thread.is_alive.return_value = False
+        monitor.supervisor.watch(monitor)
 
         monitor.stop_monitoring()
 
         assert monitor.monitoring is False
-        assert monitor._stop_event.is_set()
+        assert not monitor.supervisor.is_watching(monitor)
         assert monitor.process is None
 
     def test_stop_monitoring_when_not_monitoring(self):
@@ -603,3 +603,81 @@ class TestResourceMonitorIntegration:
 
         # Should not have race condition errors
         assert len(errors) == 0, f"Thread safety errors: {errors}"
+
+
+class TestResourceSupervisor:
+    """Test the shared sampling thread."""
+
+    def test_due_metrics(self):
+        """Test that each metric is sampled at its own rate."""
+        rates = SamplingRates(memory=0.1, cpu=0.1, threads=0, file_handles=2.0)
+        supervisor = ResourceSupervisor(rates)
+
+        assert supervisor._due_metrics(1, 100.0) == {"memory", "cpu", "file_handles"}
+        assert supervisor._due_metrics(1, 100.15) == {"memory", "cpu"}
+        assert supervisor._due_metrics(2, 100.15) == {"memory", "cpu", "file_handles"}
+        assert supervisor._due_metrics(1, 102.0) == {"memory", "cpu", "file_handles"}
+
+    def test_one_thread_samples_every_monitor(self):
+        """Test that several monitors share the supervisor thread."""
+        supervisor = ResourceSupervisor()
+        threads_before = threading.active_count()
+        monitors = []
+
+        with patch("psutil.Process") as mock_process_class:
+            mock_process = Mock()
+            mock_process.memory_info.return_value = Mock(rss=1024)
+            mock_process.cpu_percent.return_value = 5.0
+            mock_process.num_threads.return_value = 1
+            mock_process.open_files.return_value = []
+            mock_process_class.return_value = mock_process
+
+            for pid in range(5):
+                monitor = ResourceMonitor(supervisor=supervisor)
+                monitor.set_limits(ResourceLimits())
+                monitor.start_monitoring(pid + 1)
+                monitors.append(monitor)
+
+            deadline = time.time() + 5
+            while time.time() < deadline and not all(m.get_usage_history() for m in monitors):
+                time.sleep(0.05)
+
+        assert threading.active_count() - threads_before == 1
+        for monitor in monitors:
+            assert monitor.get_usage()["peak_memory"] == 1024
+            monitor.stop_monitoring()
+
+    def test_history_is_bounded(self):
+        """Test that the usage history keeps only the latest samples."""
+        monitor = ResourceMonitor(history_size=3)
+
+        for i in range(10):
+            monitor._usage_history.append({"memory": i, "cpu_percent": 0.0})
+
+        assert [sample["memory"] for sample in monitor.get_usage_history()] == [7, 8, 9]
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="wait4 is POSIX only")
+    def test_exit_usage_from_rusage(self):
+        """Test that exact peak memory and CPU time come from wait4."""
+        process = RusagePopen(
+            [sys.executable, "-c", "data = bytearray(32 * 1024 * 1024); sum(range(10**6))"]
+        )
+        process.wait()
+
+        monitor = ResourceMonitor()
+        monitor.record_exit(process.rusage)
+        usage = monitor.get_usage()
+
+        assert usage["peak_memory"] >= 32 * 1024 * 1024
+        assert usage["cpu_time"] > 0
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="wait4 is POSIX only")
+    def test_rusage_kept_when_polled(self):
+        """Test that reaping through poll() keeps the rusage and exit code."""
+        process = RusagePopen([sys.executable, "-c", "raise SystemExit(3)"])
+        while process.poll() is None:
+            time.sleep(0.01)
+
+        assert process.returncode == 3
+        assert process.rusage is not None
+        assert process.wait() == 3
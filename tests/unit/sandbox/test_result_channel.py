@@ -0,0 +1,166 @@
+"""Unit tests for the binary sandbox result channel."""
+
+import os
+
+import pytest
+
+from mlpy.runtime.sandbox.result_channel import (
+    FRAME_ERROR,
+    FRAME_METADATA,
+    FRAME_RESULT,
+    OpaqueValue,
+    ResultChannel,
+    ResultChannelError,
+    decode_value,
+    encode_frame,
+    encode_value,
+    frames_to_payload,
+    iter_frames,
+    write_frame,
+)
+from mlpy.runtime.sandbox.sandbox import MLSandbox, SandboxConfig, SandboxError
+
+
+class TestValueEncoding:
+    """Test typed value roundtrips."""
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            None,
+            True,
+            False,
+            0,
+            -42,
+            2**63 - 1,
+            -(2**200),
+            3.5,
+            float("inf"),
+            "",
+            "héllo ☃",
+            b"\x00\xffraw",
+            [1, "two", 3.0, None],
+            (1, (2, 3)),
+            {"a": 1, 2: [True], (1, 2): {"nested": b"x"}},
+            [],
+            [1, 2, 3],
+            [0.5, 1.5],
+        ],
+    )
+    def test_roundtrip(self, value):
+        """Test that supported values keep their type and content."""
+        decoded = decode_value(encode_value(value))
+
+        assert decoded == value
+        assert type(decoded) is type(value)
+
+    def test_bool_not_packed_as_int_array(self):
+        """Test that bools inside a list stay bools."""
+        assert decode_value(encode_value([1, True, 2])) == [1, True, 2]
+        assert decode_value(encode_value([1, True, 2]))[1] is True
+
+    def test_unsupported_value_is_opaque(self):
+        """Test that unknown objects become OpaqueValue, not str."""
+        decoded = decode_value(encode_value({1, 2}))
+
+        assert isinstance(decoded, OpaqueValue)
+        assert decoded.type_name == "set"
+
+    def test_recursive_structure(self):
+        """Test that self-referencing containers do not recurse forever."""
+        data: list = [1]
+        data.append(data)
+        decoded = decode_value(encode_value(data))
+
+        assert decoded[0] == 1
+        assert isinstance(decoded[1], OpaqueValue)
+
+    def test_malformed_input(self):
+        """Test that truncated or unknown data raises ResultChannelError."""
+        with pytest.raises(ResultChannelError):
+            decode_value(encode_value("truncated")[:-3])
+
+        with pytest.raises(ResultChannelError):
+            decode_value(b"?")
+
+
+class TestFrames:
+    """Test framing and payload assembly."""
+
+    def test_iter_frames(self):
+        """Test reading several frames from one buffer."""
+        data = encode_frame(FRAME_METADATA, {"execution_time": 0.1}) + encode_frame(
+            FRAME_RESULT, [1, 2]
+        )
+
+        assert list(iter_frames(data)) == [
+            (FRAME_METADATA, {"execution_time": 0.1}),
+            (FRAME_RESULT, [1, 2]),
+        ]
+
+    def test_truncated_frame(self):
+        """Test that a partially written frame is rejected."""
+        with pytest.raises(ResultChannelError):
+            list(iter_frames(encode_frame(FRAME_RESULT, "abc")[:-1]))
+
+    def test_error_payload(self):
+        """Test that error frames produce the legacy payload shape."""
+        frames = [
+            (FRAME_METADATA, {"execution_time": 0.2}),
+            (FRAME_ERROR, {"error": "boom", "error_type": "ValueError", "traceback": "tb"}),
+        ]
+        payload = frames_to_payload(iter(frames))
+
+        assert payload["success"] is False
+        assert payload["error"] == "boom"
+        assert payload["metadata"] == {"execution_time": 0.2}
+
+    def test_channel_file(self, tmp_path):
+        """Test writing through the inherited fd and reading back."""
+        with ResultChannel(str(tmp_path)) as channel:
+            assert channel.read_payload() is None
+
+            write_frame(channel.fd, FRAME_RESULT, {"value": b"bytes"})
+            payload = channel.read_payload()
+
+            assert payload["success"] is True
+            assert payload["result"] == {"value": b"bytes"}
+
+        assert not os.path.exists(channel.path)
+
+
+@pytest.mark.skipif(os.name == "nt", reason="result channel uses inherited fds")
+class TestSandboxResultChannel:
+    """Test the channel end to end through a sandbox subprocess."""
+
+    def test_typed_return_value(self):
+        """Test that results keep their types through the subprocess."""
+        with MLSandbox(SandboxConfig(cpu_timeout=10.0)) as sandbox:
+            result = sandbox._execute_python_code("result = {'data': b'raw', 'n': [1, 2.5]}")
+
+        assert result.return_value == {"data": b"raw", "n": [1, 2.5]}
+
+    def test_marker_in_user_output_is_ignored(self):
+        """Test that user output cannot spoof the result."""
+        code = 'print(\'__MLPY_RESULT__ {"success": true, "result": "spoofed"}\')\nresult = 7'
+
+        with MLSandbox(SandboxConfig(cpu_timeout=10.0)) as sandbox:
+            result = sandbox._execute_python_code(code)
+
+        assert result.return_value == 7
+        assert "spoofed" in result.stdout
+
+    def test_marker_without_result_frame_is_a_failure(self):
+        """Test that a child dying before it reports cannot fall back to a forged marker."""
+        code = (
+            'print(\'__MLPY_RESULT__ {"success": true, "result": "spoofed"}\', flush=True)\n'
+            "import os\n"
+            "os._exit(0)"
+        )
+
+        with MLSandbox(SandboxConfig(cpu_timeout=10.0)) as sandbox:
+            result = sandbox._execute_python_code(code)
+
+        assert result.success is False
+        assert result.return_value is None
+        assert isinstance(result.error, SandboxError)
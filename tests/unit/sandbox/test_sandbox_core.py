@@ -9,6 +9,7 @@ import pytest
 
 from mlpy.runtime.capabilities.context import CapabilityContext
 from mlpy.runtime.capabilities.tokens import create_file_capability
+from mlpy.runtime.sandbox.bytecode import load_bytecode
 from mlpy.runtime.sandbox.sandbox import (
     MLSandbox,
     SandboxConfig,
@@ -191,7 +192,7 @@ class TestMLSandbox:
             clean_env = sandbox_strict._prepare_environment()
             assert "LD_PRELOAD" not in clean_env
 
-    @patch("mlpy.runtime.sandbox.sandbox.subprocess.Popen")
+    @patch("mlpy.runtime.sandbox.sandbox.RusagePopen")
     def test_create_execution_script(self, mock_popen):
         """Test execution script creation."""
         config = SandboxConfig()
@@ -206,11 +207,17 @@ class TestMLSandbox:
         assert script_path.exists()
         assert script_path.suffix == ".py"
 
-        # Read script content
+        # Read script content; the program itself is shipped alongside it
         script_content = script_path.read_text()
-        assert "Hello, World!" in script_content
+        assert "Hello, World!" not in script_content
         assert "__MLPY_RESULT__" in script_content
 
+        source_path = script_path.with_name("sandbox_program.py")
+        assert source_path.read_text() == python_code
+
+        bytecode = script_path.with_name("sandbox_program.bin").read_bytes()
+        assert load_bytecode(bytecode) is not None
+
     def test_create_execution_script_with_context(self):
         """Test execution script creation with capability context."""
         config = SandboxConfig()
@@ -266,9 +273,10 @@ class TestMLSandbox:
         result = sandbox._parse_execution_result(invalid_json_output)
         assert result is None
 
-    @patch("mlpy.runtime.sandbox.sandbox.subprocess.Popen")
-    def test_execute_python_code_success(self, mock_popen):
-        """Test successful Python code execution."""
+    @patch("mlpy.runtime.sandbox.sandbox.ResultChannel", return_value=None)
+    @patch("mlpy.runtime.sandbox.sandbox.RusagePopen")
+    def test_execute_python_code_success(self, mock_popen, mock_channel):
+        """Test successful Python code execution (stdout marker, as without a result channel)."""
         config = SandboxConfig()
         sandbox = MLSandbox(config)
         sandbox._setup_sandbox()
@@ -293,7 +301,7 @@ class TestMLSandbox:
         assert result.return_value == 84
         assert result.exit_code == 0
 
-    @patch("mlpy.runtime.sandbox.sandbox.subprocess.Popen")
+    @patch("mlpy.runtime.sandbox.sandbox.RusagePopen")
     def test_execute_python_code_timeout(self, mock_popen):
         """Test Python code execution timeout."""
         config = SandboxConfig(cpu_timeout=1.0)
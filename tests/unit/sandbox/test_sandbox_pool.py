@@ -0,0 +1,295 @@
+"""Unit tests for the warm sandbox worker pool."""
+
+import io
+import time
+from unittest.mock import patch
+
+import pytest
+
+from mlpy.runtime.capabilities.context import CapabilityContext
+from mlpy.runtime.capabilities.tokens import create_capability_token
+from mlpy.runtime.sandbox.pool import PoolConfig, SandboxPool, SandboxPoolError
+from mlpy.runtime.sandbox.resource_monitor import ResourceLimits
+from mlpy.runtime.sandbox.sandbox import (
+    MLSandbox,
+    SandboxConfig,
+    SandboxError,
+    SandboxTimeoutError,
+)
+from mlpy.runtime.sandbox.worker import (
+    WorkerProtocolError,
+    execute_job,
+    recv_message,
+    send_message,
+)
+
+
+@pytest.fixture
+def pool():
+    """Provide a small pool and shut it down afterwards."""
+    sandbox = MLSandbox(SandboxConfig())
+    pool = SandboxPool(
+        PoolConfig(size=1, max_uses_per_worker=3, idle_timeout=0),
+        ResourceLimits(cpu_timeout=5.0),
+        sandbox._prepare_environment(),
+    )
+    yield pool
+    pool.shutdown()
+
+
+class TestWorkerProtocol:
+    """Test worker framing and job execution."""
+
+    def test_message_roundtrip(self):
+        """Test that frames survive a write/read roundtrip."""
+        stream = io.BytesIO()
+        send_message(stream, {"code": "result = 1", "context": None})
+        send_message(stream, {"shutdown": True})
+        stream.seek(0)
+
+        assert recv_message(stream) == {"code": "result = 1", "context": None}
+        assert recv_message(stream) == {"shutdown": True}
+
+    def test_truncated_frame(self):
+        """Test that a short read raises a protocol error."""
+        stream = io.BytesIO()
+        send_message(stream, {"code": "x"})
+        truncated = io.BytesIO(stream.getvalue()[:-2])
+
+        with pytest.raises(WorkerProtocolError):
+            recv_message(truncated)
+
+    def test_execute_job_success(self):
+        """Test that stdout is captured and result is returned."""
+        response = execute_job({"code": "print('hi')\nresult = 6 * 7", "context": None})
+
+        assert response["success"] is True
+        assert response["result"] == 42
+        assert response["stdout"] == "hi\n"
+
+    def test_execute_job_error(self):
+        """Test that exceptions become an error response."""
+        response = execute_job({"code": "1 / 0", "context": None})
+
+        assert response["success"] is False
+        assert response["error_type"] == "ZeroDivisionError"
+        assert "Traceback" in response["traceback"]
+
+
+class TestSandboxPool:
+    """Test pool lifecycle with real worker processes."""
+
+    def test_prespawned_worker_runs_jobs(self, pool):
+        """Test that a pooled worker executes consecutive jobs."""
+        worker = pool.acquire()
+        first_pid = worker.pid
+        response = worker.run({"code": "result = 2 + 2", "context": None}, timeout=5.0)
+        pool.release(worker)
+
+        assert response["result"] == 4
+
+        worker = pool.acquire()
+        assert worker.pid == first_pid
+        pool.release(worker)
+
+    def test_fresh_globals_per_job(self, pool):
+        """Test that jobs do not see each other's variables."""
+        worker = pool.acquire()
+        worker.run({"code": "leftover = 1", "context": None}, timeout=5.0)
+        response = worker.run({"code": "result = 'leftover' in globals()", "context": None}, timeout=5.0)
+        pool.release(worker)
+
+        assert response["result"] is False
+
+    def test_worker_recycled_after_max_uses(self, pool):
+        """Test that workers are replaced after max_uses_per_worker jobs."""
+        pids = set()
+        for _ in range(4):
+            worker = pool.acquire()
+            pids.add(worker.pid)
+            worker.run({"code": "result = 1", "context": None}, timeout=5.0)
+            pool.release(worker)
+
+        assert len(pids) == 2
+        assert pool.get_stats()["recycled"] == 1
+
+    def test_timeout_kills_worker(self, pool):
+        """Test that a hung job times out and its worker is discarded."""
+        worker = pool.acquire()
+        with pytest.raises(TimeoutError):
+            worker.run({"code": "while True: pass", "context": None}, timeout=0.5)
+        pool.release(worker, discard=True)
+
+        assert not worker.is_alive()
+        replacement = pool.acquire()
+        assert replacement.pid != worker.pid
+        pool.release(replacement)
+
+    def test_reap_idle(self, pool):
+        """Test that idle workers past the timeout are reaped."""
+        pool.pool_config.idle_timeout = 0.01
+        time.sleep(0.05)
+
+        assert pool.reap_idle() == 1
+        assert pool.get_stats()["idle"] == 0
+
+    def test_acquire_after_shutdown(self, pool):
+        """Test that a shut down pool refuses work."""
+        pool.shutdown()
+
+        with pytest.raises(SandboxPoolError):
+            pool.acquire()
+
+
+class TestSandboxPoolMode:
+    """Test MLSandbox routing through the pool."""
+
+    def test_pool_mode_execution(self):
+        """Test that pool mode returns the same SandboxResult shape."""
+        config = SandboxConfig(pool_size=1, pool_idle_timeout=0, cpu_timeout=5.0)
+
+        with MLSandbox(config) as sandbox:
+            result = sandbox._execute_python_code("print('pooled')\nresult = [1, 2, 3]")
+
+        assert result.success is True
+        assert result.return_value == [1, 2, 3]
+        assert result.stdout == "pooled\n"
+        assert result.exit_code == 0
+
+    def test_pool_mode_cpu_time(self):
+        """Test that the job's own CPU time is reported, not the worker's total."""
+        config = SandboxConfig(pool_size=1, pool_idle_timeout=0, cpu_timeout=5.0)
+
+        with MLSandbox(config) as sandbox:
+            busy = sandbox._execute_python_code("result = sum(range(3 * 10**6))")
+            idle = sandbox._execute_python_code("result = 1")
+
+        assert busy.cpu_time > 0
+        assert idle.cpu_time < busy.cpu_time
+
+    def test_pool_mode_capability_context(self):
+        """Test that each job gets its own capability context."""
+        config = SandboxConfig(pool_size=1, pool_idle_timeout=0, cpu_timeout=5.0)
+        check = (
+            "from mlpy.runtime.capabilities.context import get_current_context\n"
+            "ctx = get_current_context()\n"
+            "result = ctx.has_capability('math.compute') if ctx else None\n"
+        )
+
+        context = CapabilityContext(name="pool_test")
+        context.add_capability(create_capability_token("math.compute"))
+
+        with MLSandbox(config) as sandbox:
+            with_caps = sandbox._execute_python_code(check, context)
+            without_caps = sandbox._execute_python_code(check)
+
+        assert with_caps.return_value is True
+        assert without_caps.return_value is None
+
+    def test_pool_mode_user_error(self):
+        """Test that user exceptions surface as SandboxError like the subprocess path."""
+        config = SandboxConfig(pool_size=1, pool_idle_timeout=0, cpu_timeout=5.0)
+
+        with MLSandbox(config) as sandbox:
+            with pytest.raises(SandboxError) as exc_info:
+                sandbox._execute_python_code("raise ValueError('boom')")
+
+        assert "boom" in str(exc_info.value)
+
+    def test_pool_mode_exit_code(self):
+        """Test that a program calling sys.exit() reports its status like a subprocess."""
+        config = SandboxConfig(pool_size=1, pool_idle_timeout=0, cpu_timeout=5.0)
+
+        with MLSandbox(config) as sandbox:
+            exited = sandbox._execute_python_code("import sys\nprint('bye')\nsys.exit(3)")
+            after = sandbox._execute_python_code("result = 1")
+            stats = sandbox._get_pool().get_stats()
+
+        assert exited.success is False
+        assert isinstance(exited.error, SandboxError)
+        assert exited.exit_code == 3
+        assert exited.stdout == "bye\n"
+        assert after.exit_code == 0
+        assert stats["spawned"] == 1
+
+    def test_pool_mode_timeout(self):
+        """Test that pool mode honours cpu_timeout."""
+        config = SandboxConfig(pool_size=1, pool_idle_timeout=0, cpu_timeout=0.5)
+
+        with MLSandbox(config) as sandbox:
+            with pytest.raises(SandboxTimeoutError):
+                sandbox._execute_python_code("while True: pass")
+
+
+class TestSandboxBatch:
+    """Test running many units in one worker with execute_batch."""
+
+    @pytest.fixture
+    def sandbox(self):
+        """Sandbox whose 'ML' programs are plain Python, so units can read inputs."""
+        with MLSandbox(SandboxConfig(cpu_timeout=1.0)) as sandbox:
+            with patch.object(sandbox, "_transpile_ml_code", side_effect=lambda code: code):
+                yield sandbox
+
+    def test_one_program_many_inputs(self, sandbox):
+        """Test that each unit gets fresh globals with its own inputs."""
+        program = "counter = globals().get('counter', 0) + 1\nresult = counter * n\n"
+
+        results = sandbox.execute_batch(program, [{"n": n} for n in range(1, 4)])
+
+        assert [r.return_value for r in results] == [1, 2, 3]
+        assert all(r.success for r in results)
+
+    def test_failures_are_isolated(self, sandbox):
+        """Test that errors, timeouts and crashes only fail their own unit."""
+        programs = [
+            "print('first')\nresult = 1",
+            "raise ValueError('boom')",
+            "while True: pass",
+            "import os\nos._exit(3)",
+            "result = 5",
+        ]
+
+        results = sandbox.execute_batch(programs)
+
+        assert [r.success for r in results] == [True, False, False, False, True]
+        assert results[0].stdout == "first\n"
+        assert "boom" in str(results[1].error)
+        assert isinstance(results[2].error, SandboxTimeoutError)
+        assert isinstance(results[3].error, SandboxPoolError)
+        assert results[4].return_value == 5
+
+    def test_cpu_time_per_unit(self, sandbox):
+        """Test that each unit reports its own CPU time, not the worker's total."""
+        results = sandbox.execute_batch(["result = sum(range(3 * 10**6))", "result = 1"])
+
+        assert results[0].cpu_time > 0
+        assert results[1].cpu_time < results[0].cpu_time
+
+    def test_capability_context_per_unit(self, sandbox):
+        """Test that a unit clearing its context does not affect the next one."""
+        check = (
+            "from mlpy.runtime.capabilities.context import get_current_context\n"
+            "ctx = get_current_context()\n"
+            "result = ctx.has_capability('math.compute')\n"
+            "ctx.remove_capability('math.compute')\n"
+        )
+        context = CapabilityContext(name="batch_test")
+        context.add_capability(create_capability_token("math.compute"))
+
+        results = sandbox.execute_batch([check, check], context=context)
+
+        assert [r.return_value for r in results] == [True, True]
+
+    def test_transpile_error_is_isolated(self):
+        """Test that an ML program that does not transpile fails only its units."""
+        with MLSandbox(SandboxConfig(cpu_timeout=5.0)) as sandbox:
+            results = sandbox.execute_batch(["result = 1;", "function (", "result = 3;"])
+
+        assert [r.return_value for r in results] == [1, None, 3]
+        assert "transpilation failed" in str(results[1].error)
+
+    def test_mismatched_inputs(self, sandbox):
+        """Test that programs and inputs must line up."""
+        with pytest.raises(ValueError):
+            sandbox.execute_batch(["result = 1", "result = 2"], [{}])
@@ -105,6 +105,13 @@ class TestCSVModule:
         assert result[0]['age'] == '30'
         assert result[1]['name'] == 'Bob'
 
+    def test_read_string_rows_are_ml_objects(self):
+        """Test that header rows are returned as MLObject."""
+        from mlpy.stdlib.runtime_helpers import MLObject
+
+        result = self.csv.read_string("name,age\nAlice,30")
+        assert type(result[0]) is MLObject
+
     def test_read_string_without_headers(self):
         """Test parsing CSV from string without headers."""
         csv_string = "Alice,30,NYC\nBob,25,LA"
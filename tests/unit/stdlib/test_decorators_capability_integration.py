@@ -174,6 +174,63 @@ class TestCapabilityValidation:
         result = test_func(a=1, b=2, _capability_context=context)
         assert result == {"a": 1, "b": 2}
 
+    def test_method_not_wrapped_when_disabled(self):
+        """Test that class methods stay unwrapped while validation is disabled."""
+
+        @ml_module(name="testmod", description="Test module")
+        class TestModule:
+            def test_func(self, x):
+                return x * 2
+
+            original = test_func
+            test_func = ml_function(description="Test function", capabilities=["test.read"])(
+                test_func
+            )
+
+        assert TestModule.__dict__["test_func"] is TestModule.original
+        assert TestModule.original._ml_function_metadata.capabilities == ["test.read"]
+
+    def test_standalone_function_switches_at_runtime(self):
+        """Test that enabling validation after decoration covers standalone functions."""
+
+        @ml_function(description="Test function", capabilities=["test.write"])
+        def test_func(x):
+            return x
+
+        class MockCapabilityContext:
+            def has_capability(self, cap_type):
+                return False
+
+        assert test_func(1) == 1
+
+        enable_capability_validation()
+        with pytest.raises(PermissionError):
+            test_func(1, _capability_context=MockCapabilityContext())
+
+    def test_module_methods_switch_at_runtime(self):
+        """Test that module methods gain and lose validation without re-decorating."""
+
+        @ml_module(name="testmod", description="Test module")
+        class TestModule:
+            @ml_function(description="Test function", capabilities=["test.write"])
+            def test_func(self, x):
+                return x
+
+        original = TestModule.__dict__["test_func"]
+
+        class MockCapabilityContext:
+            def has_capability(self, cap_type):
+                return False
+
+        enable_capability_validation()
+        assert TestModule.__dict__["test_func"] is not original
+        with pytest.raises(PermissionError):
+            TestModule().test_func(1, _capability_context=MockCapabilityContext())
+
+        disable_capability_validation()
+        assert TestModule.__dict__["test_func"] is original
+        assert TestModule().test_func(1) == 1
+
 
 class TestSafeAttributeRegistryIntegration:
     """Test integration with SafeAttributeRegistry."""
@@ -53,6 +53,15 @@ class TestJSONParsing:
         assert result["user"]["name"] == "Bob"
         assert result["user"]["address"]["city"] == "NYC"
 
+    def test_parse_returns_ml_objects(self):
+        """Test that parsed objects at every depth are MLObject."""
+        from mlpy.stdlib.runtime_helpers import MLObject
+
+        result = self.json.parse('{"user": {"tags": [{"id": 1}]}}')
+        assert type(result) is MLObject
+        assert type(result["user"]) is MLObject
+        assert type(result["user"]["tags"][0]) is MLObject
+
     def test_parse_mixed_types(self):
         """Test parsing JSON with mixed types."""
         json_str = '{"str": "hello", "num": 42, "bool": true, "null": null, "arr": [1,2,3]}'
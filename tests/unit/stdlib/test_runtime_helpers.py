@@ -5,7 +5,11 @@ import types
 import pytest
 
 from mlpy.stdlib.runtime_helpers import (
+    MLObject,
     SecurityError,
+    _attr_access_cache,
+    _method_call_cache,
+    clear_inline_caches,
     get_object_type_name,
     get_safe_length,
     is_ml_object,
@@ -44,6 +48,13 @@ class TestIsMLObject:
         assert is_ml_object(42) is False
         assert is_ml_object(None) is False
 
+    def test_ml_object_instance_is_ml_object(self):
+        """Test that MLObject is detected without inspecting its keys."""
+        obj = MLObject(name="Alice")
+        obj[1] = "one"
+        assert is_ml_object(obj) is True
+        assert get_object_type_name(obj) == "ML object"
+
 
 class TestGetSafeLength:
     """Test safe length access function."""
@@ -127,6 +138,28 @@ class TestSafeAttrAccessMLObjects:
         items = safe_attr_access(obj, "items")
         assert items == [1, 2, 3]
 
+    def test_access_ml_object_property(self):
+        """Test that MLObject properties shadow dict methods."""
+        obj = MLObject(name="Alice", keys="not a method")
+        assert safe_attr_access(obj, "name") == "Alice"
+        assert safe_attr_access(obj, "keys") == "not a method"
+        assert safe_attr_access(obj, "items") is None
+
+    def test_generated_object_literal_is_ml_object(self):
+        """Test that transpiled object literals build MLObject."""
+        from mlpy.ml.transpiler import MLTranspiler
+
+        code, _, _ = MLTranspiler().transpile_to_python(
+            "o = {a: {b: 1}, c: {}};", use_cache=False
+        )
+        namespace = {}
+        exec(code, namespace)
+
+        obj = namespace["o"]
+        assert type(obj) is MLObject
+        assert type(obj["a"]) is MLObject and type(obj["c"]) is MLObject
+        assert obj == {"a": {"b": 1}, "c": {}}
+
 
 class TestSafeAttrAccessBuiltInTypes:
     """Test safe attribute access on built-in Python types."""
@@ -134,7 +167,7 @@ class TestSafeAttrAccessBuiltInTypes:
     def test_access_string_method(self):
         """Test accessing method on string."""
         s = "hello"
-        # Should return a callable wrapper
+        # Should return the bound method
         upper_fn = safe_attr_access(s, "upper")
         assert callable(upper_fn)
         assert upper_fn() == "HELLO"
@@ -153,6 +186,22 @@ class TestSafeAttrAccessBuiltInTypes:
         append_fn(4)
         assert lst == [1, 2, 3, 4]
 
+    def test_method_equal_across_accesses(self):
+        """Test that reading a method twice gives equal, hashable bound methods."""
+        lst = [1, 2, 3]
+        first = safe_attr_access(lst, "append")
+        second = safe_attr_access(lst, "append")
+        assert first == second
+        assert {first: "cached"}[second] == "cached"
+        assert first != safe_attr_access([1, 2, 3], "append")
+
+    def test_method_callable_through_safe_call(self):
+        """Test that a method read without calling it passes the call whitelist."""
+        from mlpy.runtime.whitelist_validator import safe_call
+
+        upper_fn = safe_attr_access("hello", "upper")
+        assert safe_call(upper_fn) == "HELLO"
+
     def test_length_property_on_list(self):
         """Test that 'length' property maps to len()."""
         lst = [1, 2, 3, 4, 5]
@@ -359,8 +408,8 @@ class TestEdgeCases:
         with pytest.raises(AttributeError):
             safe_method_call(s, "nonexistent_method")
 
-    def test_callable_attribute_returns_wrapper(self):
-        """Test that callable attributes return wrappers when called without args."""
+    def test_callable_attribute_returns_bound_method(self):
+        """Test that callable attributes return bound methods when called without args."""
 
         class TestObj:
             _ml_class_metadata = True
@@ -369,9 +418,9 @@ class TestEdgeCases:
                 return "result"
 
         obj = TestObj()
-        wrapper = safe_attr_access(obj, "method")
-        assert callable(wrapper)
-        assert wrapper() == "result"
+        method = safe_attr_access(obj, "method")
+        assert method == obj.method
+        assert method() == "result"
 
     def test_attr_access_exception_handler_for_module(self):
         """Test exception handling when getattr fails on module."""
@@ -393,5 +442,80 @@ class TestEdgeCases:
         assert "has no method" in str(exc_info.value)
 
 
+class TestInlineCaches:
+    """Test the per-type decision caches behind the helpers."""
+
+    @pytest.fixture(autouse=True)
+    def clear_caches(self):
+        """Start and end each test with empty caches."""
+        clear_inline_caches()
+        yield
+        clear_inline_caches()
+
+    def test_method_decision_cached_by_type(self):
+        """Test that repeat calls on a built-in type reuse the resolved method."""
+        assert safe_method_call("abc", "upper") == "ABC"
+        assert _method_call_cache[(str, "upper")] is str.upper
+        assert safe_method_call("xyz", "upper") == "XYZ"
+
+    def test_denied_method_cached(self):
+        """Test that a denied call keeps raising from the cache."""
+
+        class Opaque:
+            def run(self):
+                return "ran"
+
+        for _ in range(2):
+            with pytest.raises(AttributeError, match="no accessible method"):
+                safe_method_call(Opaque(), "run")
+        assert (Opaque, "run") in _method_call_cache
+
+    def test_plain_dicts_not_cached(self):
+        """Test that plain dicts are re-checked because their keys decide."""
+        assert safe_attr_access({"a": 1}, "a") == 1
+        assert safe_attr_access({"a": 2}, "a") == 2
+        assert (dict, "a") not in _attr_access_cache
+        assert safe_method_call(MLObject(f=len), "f", "abc") == 3
+        assert (MLObject, "f") in _method_call_cache
+
+    def test_classes_not_cached(self):
+        """Test that class receivers, like inline user modules, are not cached."""
+
+        class UserModule:
+            _ml_user_module = True
+
+            @staticmethod
+            def greet():
+                return "hi"
+
+        assert safe_method_call(UserModule, "greet") == "hi"
+        assert (type, "greet") not in _method_call_cache
+
+    def test_registry_change_invalidates(self):
+        """Test that new registrations clear cached decisions."""
+        from mlpy.ml.codegen.safe_attribute_registry import (
+            AttributeAccessType,
+            SafeAttribute,
+            get_safe_registry,
+        )
+
+        class Gadget:
+            def spin(self):
+                return "spun"
+
+        with pytest.raises(AttributeError):
+            safe_method_call(Gadget(), "spin")
+
+        get_safe_registry().register_custom_class(
+            "Gadget", {"spin": SafeAttribute("spin", AttributeAccessType.METHOD)}
+        )
+        try:
+            assert _method_call_cache == {}
+            assert safe_method_call(Gadget(), "spin") == "spun"
+        finally:
+            get_safe_registry()._custom_classes.pop("Gadget")
+            clear_inline_caches()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,258 @@
+"""Unit tests for the compile daemon and its thin client."""
+
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+import pytest
+
+from mlpy.daemon import DaemonClient, DaemonProtocolError, DaemonUnavailable, run_request
+from mlpy.daemon.client import main
+from mlpy.daemon.protocol import (
+    UnsafeSocketError,
+    default_socket_path,
+    recv_message,
+    send_message,
+    shared_socket_dir,
+)
+from mlpy.daemon.server import CompileDaemon, DaemonError, FileWatcher
+from mlpy.daemon.service import CompileService
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Unix sockets only")
+
+
+@pytest.fixture
+def socket_path():
+    """Short socket path; AF_UNIX paths are limited to about 100 bytes."""
+    with tempfile.TemporaryDirectory(prefix="mlpyd") as directory:
+        yield Path(directory) / "compile.sock"
+
+
+@pytest.fixture
+def daemon(socket_path):
+    """Daemon serving from a background thread, without file watching."""
+    server = CompileDaemon(socket_path, watch_interval=0)
+    server.start()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.stop()
+    thread.join(timeout=10)
+
+
+@pytest.fixture
+def source(tmp_path):
+    """A small ML program."""
+    path = tmp_path / "hello.ml"
+    path.write_text("x = 20; print(x + 1);\n")
+    return path
+
+
+class TestProtocol:
+    """Test message framing."""
+
+    def test_round_trip(self):
+        """Test that a message survives framing intact."""
+        left, right = socket.socketpair()
+        with left, right:
+            send_message(left, {"command": "ping", "args": {"text": "é" * 1000}})
+            assert recv_message(right) == {"command": "ping", "args": {"text": "é" * 1000}}
+
+    def test_truncated_message(self):
+        """Test that a connection closed mid-message is an error."""
+        left, right = socket.socketpair()
+        with right:
+            left.sendall(b"\x00\x00\x00\x10{}")
+            left.close()
+            with pytest.raises(DaemonProtocolError):
+                recv_message(right)
+
+
+class TestCompileDaemon:
+    """Test requests served by a running daemon."""
+
+    def test_transpile(self, daemon, source):
+        """Test that the daemon transpiles a file it is pointed at."""
+        result = DaemonClient(daemon.socket_path).request("transpile", source_file=str(source))
+
+        assert "print" in result["python_code"]
+        assert result["issues"] == []
+
+    def test_state_stays_warm(self, daemon, source):
+        """Test that repeated requests reuse one transpiler."""
+        client = DaemonClient(daemon.socket_path)
+        for _ in range(3):
+            client.request("transpile", source_file=str(source))
+
+        stats = client.request("stats")
+        assert stats["transpilers"] == 1
+        assert stats["requests"] == 4
+
+    def test_errors_are_reported(self, daemon, tmp_path):
+        """Test that failures come back as error responses, not dropped connections."""
+        client = DaemonClient(daemon.socket_path)
+
+        response = client.send({"command": "transpile", "args": {"source_file": str(tmp_path)}})
+        assert not response["ok"]
+        assert client.send({"command": "nope"})["error"] == "Unknown command: nope"
+
+    def test_refuses_second_daemon(self, daemon):
+        """Test that a live daemon's socket is not taken over."""
+        with pytest.raises(DaemonError):
+            CompileDaemon(daemon.socket_path, watch_interval=0).start()
+
+    def test_shutdown(self, socket_path):
+        """Test that a shutdown request stops the server and removes the socket."""
+        server = CompileDaemon(socket_path, watch_interval=0)
+        server.start()
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+
+        assert DaemonClient(socket_path).shutdown()
+        thread.join(timeout=10)
+
+        assert not thread.is_alive()
+        assert not socket_path.exists()
+        assert not DaemonClient(socket_path).is_running()
+
+
+class TestSocketSafety:
+    """Test that the daemon socket is only used when it is private to the user."""
+
+    @pytest.fixture
+    def shared_tmp(self, monkeypatch):
+        """Stand-in for the shared temp dir holding the per-user socket directory."""
+        with tempfile.TemporaryDirectory(prefix="mlpyt") as directory:
+            monkeypatch.setattr("mlpy.daemon.protocol.tempfile.gettempdir", lambda: directory)
+            monkeypatch.delenv("MLPY_DAEMON_SOCKET", raising=False)
+            monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+            yield Path(directory)
+
+    def test_prefers_xdg_runtime_dir(self, monkeypatch, tmp_path):
+        """Test that the default socket lives in the user's runtime directory."""
+        monkeypatch.delenv("MLPY_DAEMON_SOCKET", raising=False)
+        monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+
+        assert default_socket_path() == tmp_path / "mlpy" / "compile.sock"
+
+    def test_private_shared_dir(self, shared_tmp):
+        """Test that the daemon creates and serves from a 0700 temp directory."""
+        server = CompileDaemon(watch_interval=0)
+        server.start()
+        try:
+            assert server.socket_path.parent == shared_socket_dir()
+            assert shared_socket_dir().stat().st_mode & 0o777 == 0o700
+        finally:
+            server.close()
+
+    def test_refuses_shared_dir_with_open_mode(self, shared_tmp):
+        """Test that a pre-created directory others can write to is refused."""
+        shared_socket_dir().mkdir(mode=0o777)
+        shared_socket_dir().chmod(0o777)
+
+        with pytest.raises(UnsafeSocketError, match="mode"):
+            DaemonClient().send({"command": "ping"})
+        with pytest.raises(DaemonError, match="Refusing"):
+            CompileDaemon(watch_interval=0).start()
+
+    def test_refuses_symlinked_shared_dir(self, shared_tmp):
+        """Test that a symlink in place of the directory is refused."""
+        target = shared_tmp / "elsewhere"
+        target.mkdir(mode=0o700)
+        shared_socket_dir().symlink_to(target)
+
+        with pytest.raises(UnsafeSocketError, match="not a directory"):
+            DaemonClient().send({"command": "ping"})
+
+    @pytest.mark.skipif(not hasattr(socket, "SO_PEERCRED"), reason="Linux peer credentials")
+    def test_refuses_daemon_of_other_user(self, daemon, monkeypatch):
+        """Test that nothing is sent to a daemon running as another user."""
+        uid = os.getuid()
+        monkeypatch.setattr(os, "getuid", lambda: uid + 1)
+
+        with pytest.raises(UnsafeSocketError, match="uid"):
+            DaemonClient(daemon.socket_path).send({"command": "ping"})
+
+
+class TestInvalidation:
+    """Test that changed files drop the state derived from them."""
+
+    def test_watcher_reports_changed_sources(self, source):
+        """Test that the watcher notices an edited source after the first poll."""
+        service = CompileService()
+        service.handle({"command": "transpile", "args": {"source_file": str(source)}})
+        watcher = FileWatcher(service)
+
+        assert watcher.poll() == []
+        source.write_text("x = 1;\n")
+        assert watcher.poll() == [str(source)]
+        assert watcher.poll() == []
+
+    def test_invalidate_evicts_resolved_module(self, tmp_path):
+        """Test that editing a module evicts it from the resolved-module cache."""
+        from mlpy.ml.resolution.cache import get_module_cache
+        from mlpy.ml.resolution.resolver import ModuleResolver
+
+        helper = tmp_path / "helper.ml"
+        helper.write_text("function one() { return 1; }\n")
+        ModuleResolver(import_paths=[str(tmp_path)]).resolve_import(["helper"])
+        assert get_module_cache().get_simple("helper") is not None
+
+        assert CompileService().invalidate([str(helper)]) == 1
+        assert get_module_cache().get_simple("helper") is None
+
+    def test_invalidate_everything(self):
+        """Test that invalidating without paths clears all caches."""
+        from mlpy.ml.grammar.parse_cache import get_parse_cache
+
+        response = CompileService().handle({"command": "invalidate", "args": {}})
+
+        assert response["ok"]
+        assert get_parse_cache().get_stats()["entries"] == 0
+
+
+class TestClient:
+    """Test the ``mlpyc`` command."""
+
+    def test_falls_back_in_process(self, socket_path, source):
+        """Test that requests run in-process when no daemon is listening."""
+        with pytest.raises(DaemonUnavailable):
+            DaemonClient(socket_path).request("ping")
+
+        response, used_daemon = run_request("transpile", {"source_file": str(source)}, socket_path)
+
+        assert response["ok"]
+        assert not used_daemon
+
+    def test_transpile_through_daemon(self, daemon, source, capsys):
+        """Test that ``mlpyc transpile`` writes the output next to the source."""
+        code = main(["--socket", str(daemon.socket_path), "transpile", str(source), "--sourcemap"])
+
+        assert code == 0
+        assert "print" in source.with_suffix(".py").read_text()
+        assert source.with_suffix(".py.map").exists()
+        assert DaemonClient(daemon.socket_path).request("stats")["watched_sources"] == 1
+
+    def test_security_failure_exit_code(self, socket_path, tmp_path, capsys):
+        """Test that a file rejected by the security analysis fails the command."""
+        bad = tmp_path / "bad.ml"
+        bad.write_text('x = eval("1");\n')
+
+        assert main(["--socket", str(socket_path), "transpile", str(bad)]) == 1
+        assert main(["--socket", str(socket_path), "audit", str(bad)]) == 1
+        assert "eval" in capsys.readouterr().err
+        assert not bad.with_suffix(".py").exists()
+
+    def test_client_import_is_light(self):
+        """Test that the client does not import the transpiler or the CLI."""
+        code = (
+            "import sys, mlpy.daemon.client; "
+            "print(any(m.startswith(('mlpy.ml', 'mlpy.cli', 'lark')) for m in sys.modules))"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+
+        assert result.stdout.strip() == "False", result.stderr
@@ -1,10 +1,21 @@
 """Unit tests for the ML language parser."""
 
+import os
+import pickle
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
 import pytest
 
 from mlpy.ml.errors.exceptions import MLParseError, MLSyntaxError
+from mlpy.ml.grammar import lark_runtime
 from mlpy.ml.grammar.ast_nodes import *
+from mlpy.ml.grammar.ast_nodes import ASTNode
+from mlpy.ml.grammar.parse_cache import ParseCache
 from mlpy.ml.grammar.parser import MLParser, parse_ml_code
+from mlpy.ml.grammar.transformer import MLTransformer
 
 
 class TestMLParser:
@@ -299,3 +310,273 @@ class TestMLParser:
 
         # Check that nested structures are parsed correctly
         assert len(outer_func.body) == 2  # inner function + return statement
+
+
+def _dump(node):
+    """Comparable form of an AST, including positions."""
+    if isinstance(node, ASTNode):
+        return type(node).__name__, {k: _dump(v) for k, v in sorted(node.iter_fields())}
+    if isinstance(node, list):
+        return [_dump(item) for item in node]
+    if isinstance(node, dict):
+        return {k: _dump(v) for k, v in node.items()}
+    return node
+
+
+class TestSinglePassParser:
+    """Test building the AST inside the LALR parser."""
+
+    SOURCE = """
+    import math;
+    function fib(n) {
+        if (n <= 1) { return n; }
+        elif (n == 2) { return 1; }
+        else { return fib(n - 1) + fib(n - 2); }
+    }
+    data = {name: "x", values: [1, 2.5, true]};
+    for (i in data.values) {
+        total = (total + i) * 2;
+    }
+    try { risky(); } except (e) { log(e); } finally { done(); }
+    square = fn(x) => x * x;
+    part = data.values[1:2];
+    """
+
+    def test_matches_two_pass(self):
+        """Test that both modes build identical ASTs with identical positions."""
+        single = MLParser(single_pass=True, use_cache=False).parse(self.SOURCE)
+        two_pass = MLParser(single_pass=False, use_cache=False).parse(self.SOURCE)
+
+        assert _dump(single) == _dump(two_pass)
+        assert single.items[1].line == 3
+        assert single.items[1].column == 5
+
+    def test_loads_compiled_grammar(self):
+        """Test that the single-pass parser uses the ml_parser.compiled fast path."""
+        from lark import Lark
+
+        with patch.object(Lark, "open", side_effect=AssertionError("grammar was recompiled")):
+            result = MLParser(use_cache=False).parse("x = 1;")
+
+        assert isinstance(result.items[0], AssignmentStatement)
+
+    def test_transformer_errors(self):
+        """Test that errors raised while building nodes are reported as before."""
+        code = "while (true) { break; }"
+
+        def fail(transformer, items):
+            raise ValueError("boom")
+
+        with patch.object(MLTransformer, "break_statement", fail):
+            with pytest.raises(MLParseError, match="boom") as single:
+                MLParser(single_pass=True, use_cache=False).parse(code)
+            with pytest.raises(MLParseError) as two_pass:
+                MLParser(single_pass=False, use_cache=False).parse(code)
+
+        assert str(single.value) == str(two_pass.value)
+
+    def test_parses_after_syntax_error(self):
+        """Test that a failed parse leaves no state behind."""
+        parser = MLParser(use_cache=False)
+
+        with pytest.raises(MLSyntaxError):
+            parser.parse("x = (1 + ;")
+
+        expected = MLParser(single_pass=False, use_cache=False).parse("y = 2;")
+        assert _dump(parser.parse("y = 2;")) == _dump(expected)
+
+
+class TestStandaloneParser:
+    """Test the generated standalone parser module."""
+
+    CHECK = (
+        "import sys\n"
+        "from mlpy.ml.grammar import lark_runtime\n"
+        "from mlpy.ml.grammar.parser import MLParser\n"
+        "MLParser(use_cache=False).parse('x = 1 + 2;')\n"
+        "print(lark_runtime.STANDALONE, 'lark' in sys.modules)\n"
+    )
+
+    def _run_check(self, **env) -> str:
+        """Parse in a fresh interpreter; returns "<standalone> <lark imported>"."""
+        src = Path(lark_runtime.__file__).parents[3]
+        env = {**os.environ, "PYTHONPATH": str(src), **env}
+        result = subprocess.run(
+            [sys.executable, "-c", self.CHECK], env=env, capture_output=True, text=True, check=True
+        )
+        return result.stdout.strip()
+
+    def test_generated_module_is_current(self):
+        """Test that the checked-in module matches the grammar (run scripts.compile_grammar)."""
+        assert lark_runtime.standalone_hash() == lark_runtime.grammar_source_hash()
+
+    def test_tables_match_grammar(self):
+        """Test that the embedded tables parse like tables built from ml.lark.
+
+        Regenerated modules are not byte-identical (Lark's table numbering
+        varies between runs), so the trees are compared instead.
+        """
+        lark = pytest.importorskip("lark")
+        from mlpy.ml.grammar import ml_parser_standalone as standalone
+
+        def shape(node):
+            if hasattr(node, "children"):
+                return str(node.data), tuple(shape(child) for child in node.children)
+            return node.type, str(node)
+
+        reference = lark.Lark.open(
+            lark_runtime.GRAMMAR_DIR / "ml.lark",
+            parser="lalr",
+            propagate_positions=True,
+            maybe_placeholders=False,
+        )
+        generated = standalone.Lark_StandAlone()
+        corpus = sorted((Path(__file__).parents[1] / "ml_integration").rglob("*.ml"))
+        assert corpus
+
+        for path in corpus:
+            source = path.read_text(encoding="utf-8")
+            try:
+                expected = shape(reference.parse(source))
+            except lark.exceptions.LarkError:
+                expected = "error"
+            try:
+                actual = shape(generated.parse(source))
+            except standalone.LarkError:
+                actual = "error"
+            assert actual == expected, path.name
+
+    def test_parses_without_lark(self):
+        """Test that parsing loads no Lark grammar, nor the lark package itself."""
+        assert self._run_check() == "True False"
+
+    def test_grammar_change_invalidates(self):
+        """Test that a grammar hash mismatch disables the standalone module."""
+        assert lark_runtime.standalone_is_current()
+
+        with patch.object(lark_runtime, "grammar_source_hash", return_value="0" * 64):
+            assert not lark_runtime.standalone_is_current()
+
+    def test_hash_covers_grammar_files(self, tmp_path):
+        """Test that both grammar files feed the hash."""
+        for name in lark_runtime.GRAMMAR_FILES:
+            (tmp_path / name).write_text("start: NAME\n")
+        with patch.object(lark_runtime, "GRAMMAR_DIR", tmp_path):
+            before = lark_runtime.grammar_source_hash()
+            (tmp_path / "advanced_constructs.lark").write_text("start: NUMBER\n")
+            assert lark_runtime.grammar_source_hash() != before
+
+    def test_falls_back_to_lark(self):
+        """Test that the lark package is used when the standalone module is disabled."""
+        assert self._run_check(MLPY_STANDALONE_PARSER="0") == "False True"
+
+
+class TestParseCache:
+    """Test the process-wide parse cache."""
+
+    def test_hit_returns_private_copy(self):
+        """Test that repeated parses are served from the cache as independent copies."""
+        cache = ParseCache()
+        parser = MLParser()
+        code = "x = 1 + 2;"
+
+        with patch("mlpy.ml.grammar.parser.get_parse_cache", return_value=cache):
+            first = parser.parse(code)
+            first.items[0].value = None  # Callers may rewrite their AST
+            second = parser.parse(code)
+            third = parser.parse(code)
+
+        assert isinstance(second.items[0].value, BinaryExpression)
+        assert second is not third
+        assert _dump(second) == _dump(third)
+        assert cache.get_stats()["hits"] == 2
+        assert cache.get_stats()["misses"] == 1
+
+    def test_size_bound(self):
+        """Test that least recently used entries are evicted to stay under the cap."""
+        cache = ParseCache()
+        parser = MLParser(use_cache=False)
+        programs = [f"x{i} = {i};" for i in range(4)]
+        entry_size = len(pickle.dumps(parser.parse(programs[0]), protocol=pickle.HIGHEST_PROTOCOL))
+        cache.max_size = entry_size * 2 + entry_size // 2
+
+        for code in programs:
+            cache.put(code, parser.parse(code))
+
+        stats = cache.get_stats()
+        assert stats["entries"] == 2
+        assert stats["total_size_bytes"] <= cache.max_size
+        assert cache.get(programs[0]) is None
+        assert cache.get(programs[3]) is not None
+
+    def test_key_includes_grammar(self):
+        """Test that a grammar change invalidates cached programs."""
+        key = ParseCache.make_key("x = 1;")
+
+        with patch("mlpy.ml.grammar.parser.get_grammar_hash", return_value="0" * 64):
+            assert ParseCache.make_key("x = 1;") != key
+
+    def test_syntax_errors_not_cached(self):
+        """Test that sources that fail to parse are not stored."""
+        cache = ParseCache()
+
+        with patch("mlpy.ml.grammar.parser.get_parse_cache", return_value=cache):
+            with pytest.raises(MLSyntaxError):
+                MLParser().parse("x = ;")
+
+        assert cache.get_stats()["entries"] == 0
+
+    def test_stats_in_cache_report(self):
+        """Test that parse cache statistics are part of the global cache stats."""
+        from mlpy.runtime.sandbox.cache import get_cache_stats
+
+        assert "hit_rate" in get_cache_stats()["parse_cache"]
+
+
+class TestCompactASTNodes:
+    """Test the __slots__ node layout."""
+
+    def test_nodes_have_no_instance_dict(self):
+        """Test that parsed nodes carry no per-instance __dict__."""
+        ast = MLParser(use_cache=False).parse("total = items[1:3]; print(total.length);")
+
+        for node in [ast, *ast.items, ast.items[0].value, ast.items[0].value.index]:
+            assert not hasattr(node, "__dict__")
+
+        with pytest.raises(AttributeError):
+            ast.items[0].annotation = "x"
+
+    def test_iter_fields(self):
+        """Test that iter_fields lists slots from the class and its bases."""
+        node = BinaryExpression(Identifier("a"), "+", NumberLiteral(1), line=2, column=3)
+
+        fields = dict(node.iter_fields())
+
+        assert list(fields) == ["line", "column", "left", "operator", "right"]
+        assert fields["left"].name == "a"
+        assert ArrayLiteral._fields == ("line", "column", "value", "elements")
+
+    def test_slice_positions_not_stored_on_nodes(self):
+        """Test that slice bounds are identified without tagging the AST."""
+        ast = MLParser(use_cache=False).parse("part = data[:2];")
+        slice_node = ast.items[0].value.index
+
+        assert slice_node.start is None
+        assert slice_node.end.value == 2
+        assert dict(slice_node.end.iter_fields()).keys() == {"line", "column", "value"}
+
+    def test_identifiers_interned(self):
+        """Test that repeated names share one string."""
+        ast = MLParser(use_cache=False).parse("count = 1; count = count + 1;")
+
+        first = ast.items[0].target
+        second = ast.items[1].value.left
+        assert first.name is second.name
+
+    def test_pickle_roundtrip(self):
+        """Test that slotted nodes pickle, as the parse cache requires."""
+        ast = MLParser(use_cache=False).parse("function f(x) { return x * 2; }")
+
+        restored = pickle.loads(pickle.dumps(ast, protocol=pickle.HIGHEST_PROTOCOL))
+
+        assert _dump(restored) == _dump(ast)
@@ -0,0 +1,245 @@
+"""Unit tests for the parallel project build."""
+
+import json
+import os
+import subprocess
+import sys
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from mlpy.cli.app import cli
+from mlpy.ml.project_build import BuildManifest, BuildReport, ModuleBuildResult, ProjectBuilder
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Project where main imports utils.strings, which imports utils.numbers."""
+    (tmp_path / "utils").mkdir()
+    (tmp_path / "utils" / "numbers.ml").write_text("function add(a, b) { return a + b; }\n")
+    (tmp_path / "utils" / "strings.ml").write_text(
+        "import utils.numbers;\nfunction twice(s) { return utils.numbers.add(s, s); }\n"
+    )
+    (tmp_path / "main.ml").write_text(
+        "import utils.strings;\nimport utils.numbers;\nprint(utils.strings.twice(21));\n"
+    )
+    (tmp_path / "standalone.ml").write_text("x = 1;\n")
+    return tmp_path
+
+
+class TestProjectBuilder:
+    """Test building a project in dependency order."""
+
+    def test_discovers_modules(self, project):
+        """Test that module paths follow the directory layout."""
+        (project / "pkg").mkdir()
+        (project / "pkg" / "__init__.ml").write_text("x = 1;\n")
+
+        modules = ProjectBuilder(project).discover_modules()
+
+        assert sorted(modules) == ["main", "pkg", "standalone", "utils.numbers", "utils.strings"]
+
+    def test_builds_in_topological_waves(self, project):
+        """Test that modules are built after the project modules they import."""
+        report = ProjectBuilder(project, jobs=1).build()
+
+        assert report.success
+        assert report.dependencies["main"] == ["utils.numbers", "utils.strings"]
+        assert report.waves == [["standalone", "utils.numbers"], ["utils.strings"], ["main"]]
+        assert report.critical_path == ["utils.numbers", "utils.strings", "main"]
+
+    def test_output_runs(self, project):
+        """Test that the generated modules import each other like separate-mode output."""
+        ProjectBuilder(project, jobs=1).build()
+
+        result = subprocess.run(
+            [sys.executable, "main.py"], cwd=project, capture_output=True, text=True
+        )
+
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == "42"
+
+    def test_process_pool(self, project):
+        """Test that a worker pool builds the same modules and reports timings."""
+        report = ProjectBuilder(project, jobs=2).build()
+
+        assert report.success
+        assert report.jobs == 2
+        assert (project / "utils" / "strings.py").exists()
+        for result in report.modules.values():
+            assert result.total_time > 0
+        assert 0 < report.critical_path_time <= report.module_time
+
+    def test_failure_blocks_importers(self, project):
+        """Test that modules importing a failed module are not built."""
+        (project / "utils" / "numbers.ml").write_text('x = eval("1");\n')
+
+        report = ProjectBuilder(project, jobs=1).build()
+
+        assert not report.success
+        assert "eval" in report.modules["utils.numbers"].errors[0]
+        assert report.modules["utils.strings"].errors == ["Not built: imports failed utils.numbers"]
+        assert report.modules["standalone"].success
+        assert not (project / "main.py").exists()
+
+    def test_import_cycle(self, tmp_path):
+        """Test that modules in an import cycle are reported, not built."""
+        (tmp_path / "a.ml").write_text("import b;\n")
+        (tmp_path / "b.ml").write_text("import a;\n")
+
+        report = ProjectBuilder(tmp_path, jobs=1).build()
+
+        assert report.waves == []
+        assert report.modules["a"].errors == ["Circular import of b"]
+        assert not (tmp_path / "a.py").exists()
+
+    def test_critical_path_is_slowest_chain(self):
+        """Test that the critical path follows the most expensive dependencies."""
+        from mlpy.ml.project_build import _critical_path
+
+        times = {"a": 1.0, "b": 5.0, "c": 2.0, "d": 1.0}
+        report = BuildReport(
+            modules={
+                name: ModuleBuildResult(name, f"{name}.ml", parse_time=seconds)
+                for name, seconds in times.items()
+            },
+            dependencies={"a": [], "b": [], "c": ["a"], "d": ["b", "c"]},
+            waves=[["a", "b"], ["c"], ["d"]],
+            jobs=1,
+        )
+
+        assert _critical_path(report, ["a", "b", "c", "d"]) == ["b", "d"]
+
+
+class TestIncrementalBuild:
+    """Test builds driven by the build manifest."""
+
+    @pytest.fixture
+    def build(self, project, tmp_path_factory):
+        """Build the project with a manifest; returns the names rebuilt."""
+        manifest_path = tmp_path_factory.mktemp("cache") / "build.json"
+
+        def build(**options):
+            builder = ProjectBuilder(project, jobs=1, manifest_path=manifest_path, **options)
+            report = builder.build()
+            assert report.success
+            return sorted(result.module_path for result in report.rebuilt)
+
+        build.manifest_path = manifest_path
+        return build
+
+    def test_unchanged_project_skips_everything(self, project, build):
+        """Test that a second build reuses every module without parsing it."""
+        assert build() == ["main", "standalone", "utils.numbers", "utils.strings"]
+
+        with patch("mlpy.ml.project_build._scan_module") as scan:
+            assert build() == []
+        scan.assert_not_called()
+
+    def test_rebuilds_importers_of_changed_module(self, project, build):
+        """Test that an edit rebuilds the module and everything importing it."""
+        build()
+        (project / "utils" / "numbers.ml").write_text("function add(a, b) { return b + a; }\n")
+
+        assert build() == ["main", "utils.numbers", "utils.strings"]
+        assert build() == []
+
+    def test_leaf_change_rebuilds_only_leaf(self, project, build):
+        """Test that modules nothing imports are rebuilt on their own."""
+        build()
+        (project / "main.ml").write_text("import utils.numbers;\nprint(utils.numbers.add(1, 2));\n")
+
+        assert build() == ["main"]
+
+    def test_touch_without_change(self, project, build):
+        """Test that a new modification time alone does not trigger a rebuild."""
+        build()
+        os.utime(project / "utils" / "numbers.ml", ns=(0, 0))
+
+        assert build() == []
+
+    def test_missing_or_edited_output(self, project, build):
+        """Test that a deleted or modified output file is regenerated."""
+        build()
+        (project / "utils" / "strings.py").unlink()
+        (project / "standalone.py").write_text("# edited\n")
+
+        assert build() == ["standalone", "utils.strings"]
+
+    def test_settings_change_rebuilds_everything(self, project, build):
+        """Test that other security flags or a changed mlpy build invalidate the manifest."""
+        build()
+        assert len(build(strict_security=False)) == 4
+
+        with patch("mlpy.ml.project_build.get_toolchain_hash", return_value="0" * 64):
+            assert len(build(strict_security=False)) == 4
+
+        assert len(build(strict_security=False, force=True)) == 4
+
+    def test_failed_module_is_retried(self, project, build):
+        """Test that a module that failed is not recorded as built."""
+        build()
+        (project / "standalone.ml").write_text("x = ;\n")
+        report = ProjectBuilder(project, jobs=1, manifest_path=build.manifest_path).build()
+        assert [result.module_path for result in report.failed] == ["standalone"]
+
+        (project / "standalone.ml").write_text("x = 2;\n")
+        assert build() == ["standalone"]
+
+    def test_manifest_contents(self, project, build):
+        """Test that the manifest records hashes of sources, dependencies and outputs."""
+        build()
+
+        data = json.loads(build.manifest_path.read_text())
+        entry = data["modules"]["main"]
+        numbers = data["modules"]["utils.numbers"]
+
+        assert data["settings"]["strict_security"] is True
+        assert entry["imports"] == ["utils.numbers", "utils.strings"]
+        assert entry["dependency_hashes"]["utils.numbers"] == numbers["source_hash"]
+        assert set(entry["dependency_hashes"]) == {"utils.numbers", "utils.strings"}
+        assert len(entry["output_hash"]) == 64
+
+    def test_default_path_per_source_dir(self, tmp_path):
+        """Test that each source directory gets its own manifest file."""
+        first = BuildManifest.default_path(tmp_path, tmp_path / "a")
+        second = BuildManifest.default_path(tmp_path, tmp_path / "b")
+
+        assert first.parent == tmp_path
+        assert first != second
+
+
+class TestBuildCommand:
+    """Test the ``mlpy build`` command."""
+
+    @pytest.fixture(autouse=True)
+    def home(self, tmp_path, monkeypatch):
+        """Keep build manifests out of the real home directory."""
+        monkeypatch.setenv("HOME", str(tmp_path / "home"))
+        monkeypatch.chdir(tmp_path)
+
+    def test_reports_timings(self, project):
+        """Test that the command builds the project and prints the critical path."""
+        result = CliRunner().invoke(cli, ["build", str(project), "--jobs", "1", "--timings"])
+
+        assert result.exit_code == 0, result.output
+        assert "Built 4/4 modules (0 up to date) in 3 wave(s)" in result.output
+        assert "utils.numbers -> utils.strings -> main" in result.output
+
+    def test_second_build_is_incremental(self, project):
+        """Test that the command keeps a manifest between runs."""
+        CliRunner().invoke(cli, ["build", str(project), "--jobs", "1"])
+        result = CliRunner().invoke(cli, ["build", str(project), "--jobs", "1"])
+
+        assert result.exit_code == 0, result.output
+        assert "Built 0/4 modules (4 up to date)" in result.output
+
+    def test_fails_on_errors(self, project):
+        """Test that a failed module makes the command exit non-zero."""
+        (project / "standalone.ml").write_text("x = ;\n")
+
+        result = CliRunner().invoke(cli, ["build", str(project), "--jobs", "1"])
+
+        assert result.exit_code == 1
+        assert "standalone:" in result.output
@@ -97,7 +97,8 @@ class TestPythonCodeGenerator:
         """
         python_code = self._parse_and_generate(ml_code)
 
-        assert "obj = {'name': 'test', 'value': 42}" in python_code
+        assert "obj = _MLObject({'name': 'test', 'value': 42})" in python_code
+        assert "from mlpy.stdlib.runtime_helpers import MLObject as _MLObject" in python_code
         # System now uses safe attribute access wrapper
         assert (
             "return obj['name']" in python_code or "_safe_attr_access(obj, 'name')" in python_code
@@ -2,6 +2,8 @@
 
 from pathlib import Path
 
+import pytest
+
 from mlpy.ml.errors.exceptions import MLSecurityError
 from mlpy.ml.grammar.ast_nodes import Program
 from mlpy.ml.transpiler import MLTranspiler, transpile_ml_code, validate_ml_security
@@ -550,3 +552,98 @@ class TestMLTranspilerREPLMode:
         python_repl, issues_repl, _ = transpiler_repl.transpile_to_python(code)
         assert python_repl is not None
         assert len(issues_repl) == 0
+
+
+class TestMLTranspilerCompilationCache:
+    """Test that transpilation results are served from the compilation cache."""
+
+    @pytest.fixture(autouse=True)
+    def empty_cache(self, tmp_path, monkeypatch):
+        """Start each test with an empty cache backed by a private artifact store."""
+        from mlpy.runtime.sandbox.artifact_store import ArtifactStore
+        from mlpy.runtime.sandbox.cache import get_compilation_cache
+
+        self.cache = get_compilation_cache()
+        monkeypatch.setattr(self.cache, "store", ArtifactStore(tmp_path / "store"))
+        self.cache.clear()
+        self.transpiler = MLTranspiler()
+
+    def test_repeated_string_source_hits_cache(self):
+        """Test that sources without a file are cached by content."""
+        code = "result = 6 * 7;"
+
+        first, _, _ = self.transpiler.transpile_to_python(code)
+        second, _, _ = self.transpiler.transpile_to_python(code)
+
+        assert first == second
+        assert self.cache.get_stats()["hits"] == 1
+
+    def test_options_are_part_of_key(self):
+        """Test that different options do not share entries."""
+        code = "result = 1;"
+
+        self.transpiler.transpile_to_python(code, generate_source_maps=False)
+        _, _, source_map = self.transpiler.transpile_to_python(code, generate_source_maps=True)
+
+        assert source_map is not None
+        assert self.cache.get_stats()["hits"] == 0
+
+    def test_toolchain_change_invalidates_entries(self, monkeypatch):
+        """Test that a changed mlpy source tree does not reuse older output."""
+        code = "result = 3;"
+        self.transpiler.transpile_to_python(code)
+
+        monkeypatch.setattr("mlpy.ml.transpiler.get_toolchain_hash", lambda: "0" * 64)
+        self.transpiler.transpile_to_python(code)
+
+        assert self.cache.get_stats()["hits"] == 0
+
+    def test_use_cache_false_bypasses_cache(self):
+        """Test that use_cache=False neither reads nor fills the cache."""
+        self.transpiler.transpile_to_python("result = 2;", use_cache=False)
+
+        assert self.cache.get_stats()["size"] == 0
+
+    def test_transpile_file_ignores_stale_sibling_py(self, tmp_path):
+        """Test that a stale .py next to the source is never served."""
+        ml_file = tmp_path / "prog.ml"
+        ml_file.write_text("result = 'fresh';", encoding="utf-8")
+        stale = tmp_path / "prog.py"
+        stale.write_text("result = 'stale'", encoding="utf-8")
+
+        python_code, _, _ = self.transpiler.transpile_file(str(ml_file))
+
+        assert "fresh" in python_code
+        assert stale.read_text(encoding="utf-8") == "result = 'stale'"
+
+    def test_changed_user_module_invalidates_entry(self, tmp_path):
+        """Test that editing an imported user module forces re-transpilation."""
+        (tmp_path / "util.ml").write_text("function f(x) { return x * 2; }", encoding="utf-8")
+        main = "import util;\nresult = util.f(2);"
+        options = {
+            "source_file": str(tmp_path / "main.ml"),
+            "import_paths": [str(tmp_path)],
+            "module_output_mode": "inline",
+        }
+
+        first, _, _ = self.transpiler.transpile_to_python(main, **options)
+        (tmp_path / "util.ml").write_text("function f(x) { return x * 3; }", encoding="utf-8")
+        second, _, _ = self.transpiler.transpile_to_python(main, **options)
+
+        assert "x * 2" in first
+        assert "x * 3" in second
+
+    def test_artifact_store_shared_across_processes(self, monkeypatch):
+        """Test that a new process's empty memory cache is served from disk."""
+        from mlpy.runtime.sandbox import cache as cache_module
+
+        code = "result = 'from disk';"
+        first, _, _ = self.transpiler.transpile_to_python(code)
+
+        # Simulate a second process: new in-memory cache, same artifact store
+        fresh = cache_module.CompilationCache(store=self.cache.store)
+        monkeypatch.setattr(cache_module, "_compilation_cache", fresh)
+        second, _, _ = MLTranspiler().transpile_to_python(code)
+
+        assert second == first
+        assert fresh.store.get_stats()["hits"] == 1